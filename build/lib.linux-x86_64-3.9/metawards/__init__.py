@@ -0,0 +1,278 @@
+"""
+.. currentmodule:: metawards
+
+Classes
+=======
+
+.. autosummary::
+    :toctree: generated/
+
+    Demographic
+    Demographics
+    Disease
+    Infections
+    InputFiles
+    Interpret
+    Link
+    Links
+    Network
+    Networks
+    Node
+    Nodes
+    OutputFiles
+    Parameters
+    PersonType
+    Population
+    Populations
+    ResultsStore
+    VariableSet
+    VariableSets
+    Ward
+    WardID
+    WardInfo
+    WardInfos
+    Wards
+    Workspace
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    get_version_string
+    print_version_string
+    input
+    run
+    find_mw_exe
+    find_mw_include
+    find_mw_lib
+    get_reticulate_command
+
+"""
+
+import sys as _sys
+import os as _os
+
+if _sys.version_info < (3, 7):
+    print("MetaWards requires Python version 3.7 or above.")
+    print("Your python is version")
+    print(_sys.version)
+    _sys.exit(-1)
+
+__all__ = ["get_version_string", "print_version_string", "input",
+           "Demographic", "Demographics", "Disease", "Infections",
+           "InputFiles", "Interpret", "Link", "Links", "Network",
+           "Networks", "Node", "Nodes", "OutputFiles", "Parameters",
+           "Population", "Populations", "ResultsStore", "VariableSet",
+           "VariableSets",
+           "Ward", "WardID", "WardInfo", "WardInfos", "Wards", "Workspace"]
+
+# make sure that the directory containing this __init__.py is
+# early in the path - this will ensure that this versions modules
+# will be imported rather than globally installed modules. This is
+# needed so that lazily imported modules will come from this directory,
+# rather than any other installed version of metawards
+_install_path = _os.path.dirname(__file__)
+_sys.path.insert(0, _install_path)
+
+# The submodules and classes below are imported lazily, on first
+# access, via the module-level __getattr__ (PEP 562). This means that
+# "import metawards" is fast and does not load any of the compiled
+# extensions, which matters as it is run by every worker process
+# and by every script (e.g. metawards-plot)
+_lazy_modules = ["analysis", "app", "movers", "mixers", "extractors",
+                 "iterators", "utils"]
+
+_lazy_attributes = {
+    "Demographic": "._demographic",
+    "Demographics": "._demographics",
+    "Disease": "._disease",
+    "Infections": "._infections",
+    "InputFiles": "._inputfiles",
+    "Interpret": "._interpret",
+    "Link": "._link",
+    "Links": "._links",
+    "Network": "._network",
+    "Networks": "._networks",
+    "Node": "._node",
+    "Nodes": "._nodes",
+    "OutputFiles": "._outputfiles",
+    "Parameters": "._parameters",
+    "PersonType": "._network",
+    "Population": "._population",
+    "Populations": "._population",
+    "ResultsStore": "._resultsstore",
+    "VariableSet": "._variableset",
+    "VariableSets": "._variableset",
+    "Ward": "._ward",
+    "WardID": "._wardid",
+    "WardInfo": "._wardinfo",
+    "WardInfos": "._wardinfo",
+    "Wards": "._wards",
+    "Workspace": "._workspace",
+    "run": "._run",
+    "find_mw_exe": "._run",
+    "find_mw_include": "._run",
+    "find_mw_lib": "._run",
+    "get_reticulate_command": "._run",
+}
+
+_version_attributes = {"__version__": "version",
+                       "__branch__": "branch",
+                       "__repository__": "repository",
+                       "__revisionid__": "full-revisionid"}
+
+__manual_version__ = "1.4.0"
+
+
+def _load_version():
+    """Load the version information into this module. This is done
+       lazily as it can be slow (e.g. it may need to call git)
+    """
+    from ._version import get_versions
+    v = get_versions()
+
+    version = v['version']
+
+    if version.find("untagged") != -1:
+        version = __manual_version__
+
+    g = globals()
+    g["__version__"] = version
+    g["__branch__"] = v['branch']
+    g["__repository__"] = v['repository']
+    g["__revisionid__"] = v['full-revisionid']
+
+
+def __getattr__(name: str):
+    """Lazily import and return the submodule, class or function
+       called 'name'
+    """
+    if name in _lazy_modules:
+        from importlib import import_module
+        value = import_module(f".{name}", __name__)
+    elif name in _lazy_attributes:
+        from importlib import import_module
+        module = import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+    elif name in _version_attributes:
+        _load_version()
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_modules) |
+                  set(_lazy_attributes) | set(_version_attributes))
+
+
+def _url(url):
+    """Simple function to include URLs on OS's that support them in
+       console output
+    """
+    import sys
+    if sys.platform == "win32":
+        return url
+    else:
+        return f"[{url}]({url})"
+
+
+def get_version_string():
+    """Return a version string for metawards which can be printed
+       into a file or written out to the screen
+    """
+    from ._parameters import get_repository
+    repository, v = get_repository(error_on_missing=False)
+
+    if repository is None:
+        repo_info = f"""
+***WARNING: MetaWardsData cannot be found!
+Please see {_url('https://metawards.org/model_data')}
+for instructions on how to download and install this necessary data.***
+"""
+    else:
+        if v["is_dirty"]:
+            dirty = """
+***WARNING: This data has not been committed to git.
+You may not be able to reproduce this run.***
+"""
+        else:
+            dirty = ""
+
+        repo_info = f"""
+# MetaWardsData information
+* version: {v['version']}
+* repository: {_url(v['repository'])}
+* branch: {v['branch']}
+{dirty}
+"""
+
+    from ._version import get_versions
+    v = get_versions()
+
+    if v['version'].find("untagged") != -1:
+        # the version couldn't be found - this is likely because this
+        # is run as part of github actions or in a disconnected repo.
+        # We need to drop back to '__manual_version__'
+        v['version'] = __manual_version__
+
+    if v["dirty"]:
+        dirty = """
+**WARNING: This version has not been committed to git,
+so you may not be able to recover the original
+source code that was used to generate this run!**
+"""
+    else:
+        dirty = ""
+
+    return f"""
+# MetaWards version {v['version']}
+# {_url('https://metawards.org')}
+
+# Source information
+
+* repository: {_url(v['repository'])}
+* branch: {v['branch']}
+* revision: {v['full-revisionid']}
+* last modified: {v['date']}
+{dirty}
+{repo_info}
+
+# Additional information
+Visit {_url('https://metawards.org')} for more information
+about metawards, its authors and its license
+"""
+
+
+def print_version_string():
+    from metawards.utils import Console
+    Console.panel(get_version_string(), markdown=True,
+                  style="header", width=72, expand=False)
+
+
+_system_input = input
+
+
+def input(prompt: str, default="y"):
+    """Wrapper for 'input' that returns 'default' if it detected
+       that this is being run from within a batch job or other
+       service that doesn't have access to a tty
+    """
+    import sys
+
+    try:
+        if sys.stdin.isatty():
+            return _system_input(prompt)
+        else:
+            print(f"Not connected to a console, so having to use the "
+                  f"default ({default})")
+            return default
+    except Exception as e:
+        print(f"Unable to get the input: {e.__class__} {e}")
+        print(f"Using the default ({default}) instead")
+        return default
@@ -0,0 +1,839 @@
+
+from dataclasses import dataclass as _dataclass
+from typing import List as _List
+from typing import Dict as _Dict
+from datetime import date as _date
+
+__all__ = ["Population", "Populations"]
+
+
+@_dataclass
+class Population:
+    """This class holds information about the progress of the
+       disease through the population
+    """
+    #: The initial population loaded into the model
+    initial: int = 0
+
+    #: The number of members who could be infected (S)
+    susceptibles: int = 0
+
+    #: The number of latent infections (E)
+    latent: int = 0
+
+    #: The total number of infections (I)
+    total: int = 0
+
+    #: The total number of infections in other infected states (X)
+    totals: _Dict[str, int] = None
+
+    #: The total number of individuals in other non-infected states (X)
+    other_totals: _Dict[str, int] = None
+
+    #: The total number who are removed from the outbreak,
+    #: either because they have recovered, or are otherwise
+    #: no longer able to be infected (R)
+    recovereds: int = 0
+
+    #: The number infected in all wards (IW)
+    n_inf_wards: int = 0
+
+    #: The scale_uv parameter that can be used to affect the
+    #: foi calculation. A value of 1.0 means do nothing
+    scale_uv: float = 1.0
+
+    #: The day in the outbreak of this record (e.g. day 0, day 10 etc.)
+    day: int = 0
+
+    #: The date in the outbreak of this record
+    date: _date = None
+
+    #: The populations in each of the multi-demographic subnetworks
+    subpops = None
+
+    @property
+    def population(self) -> int:
+        """The total population in all wards"""
+        pop: int = 0
+
+        for val in [self.susceptibles, self.latent,
+                    self.total, self.recovereds]:
+            if val is not None:
+                pop += val
+
+        if self.totals is not None:
+            for val in self.totals.values():
+                pop += val
+
+        if self.other_totals is not None:
+            for val in self.other_totals.values():
+                pop += val
+
+        return pop
+
+    @property
+    def others(self) -> int:
+        """Return the number who are in the 'other' state, i.e.
+           not classed as susceptible, latent, infected or recovered/removed.
+           This is the sum of states that are set as "is_infected=False"
+           in the disease model, e.g. V (vaccinated)
+        """
+        t: int = 0
+
+        if self.other_totals is not None:
+            for val in self.other_totals.values():
+                t += val
+
+        return t
+
+    @property
+    def infecteds(self) -> int:
+        """The number who are infected across all wards"""
+        return self.population - \
+            int(self.susceptibles or 0) - \
+            int(self.recovereds or 0) - \
+            int(self.others or 0)
+
+    def has_equal_SEIR(self, other):
+        """Return whether or not the SEIR values for this population
+           equal 'other'
+        """
+        return self.susceptibles == other.susceptibles and \
+            self.latent == other.latent and \
+            self.total == other.total and \
+            self.recovereds == other.recovereds and \
+            self.others == other.others and \
+            self.totals == other.totals
+
+    def increment_day(self, ndays: int = 1) -> None:
+        """Advance the day count by 'ndays' (default 1)"""
+        self.day += ndays
+
+        if self.subpops is not None:
+            for pop in self.subpops:
+                pop.day += ndays
+
+        if self.date:
+            from datetime import timedelta
+            self.date += timedelta(days=1)
+
+            if self.subpops is not None:
+                for pop in self.subpops:
+                    pop.date = self.date
+
+    def specialise(self, network):
+        """Specialise this population for the passed Networks"""
+        subpops = []
+
+        from copy import deepcopy
+
+        self.subpops = None
+
+        for i in range(0, len(network.subnets)):
+            subpops.append(deepcopy(self))
+
+        self.subpops = subpops
+
+    def __str__(self):
+        parts = []
+
+        parts.append(f"DAY: {self.day}")
+        parts.append(f"S: {self.susceptibles}")
+
+        if self.latent is not None:
+            parts.append(f"E: {self.latent}")
+
+        if self.total is not None:
+            parts.append(f"I: {self.total}")
+
+        if self.totals is not None:
+            for key, value in self.totals.items():
+                parts.append(f"{key}: {value}")
+
+        if self.other_totals is not None:
+            for key, value in self.other_totals.items():
+                parts.append(f"{key}: {value}")
+
+        if self.recovereds is not None:
+            parts.append(f"R: {self.recovereds}")
+
+        if self.n_inf_wards is not None:
+            parts.append(f"IW: {self.n_inf_wards}")
+
+        parts.append(f"TOTAL POPULATION {self.population}")
+
+        s = "  ".join(parts)
+
+        if self.date:
+            return f"{self.date.isoformat()}: {s}"
+        else:
+            return s
+
+    def assert_sane(self):
+        """Assert that this population is sane, i.e. the totals within
+           this population and with the sub-populations all add up to
+           the correct values
+        """
+        errors = []
+
+        t = 0
+
+        for val in [self.susceptibles, self.infecteds,
+                    self.recovereds, self.others]:
+            if val is not None:
+                t += val
+
+        if t != self.population:
+            errors.append(f"Disagreement in total overall population: "
+                          f"{t} versus {self.population}")
+
+        if self.subpops is not None and len(self.subpops) > 0:
+            S = 0
+            E = 0
+            I = 0
+            O = 0
+            R = 0
+            P = 0
+
+            for subpop in self.subpops:
+                S += int(subpop.susceptibles or 0)
+                E += int(subpop.latent or 0)
+                I += int(subpop.total or 0)
+                O += int(subpop.others or 0)
+                R += int(subpop.recovereds or 0)
+                P += int(subpop.population or 0)
+
+            if S != int(self.susceptibles or 0):
+                errors.append(f"Disagreement in S: {S} "
+                              f"versus {self.susceptibles}")
+
+            if E != int(self.latent or 0):
+                errors.append(f"Disagreement in E: {E} "
+                              f"versus {self.latent}")
+
+            if I != int(self.total or 0):
+                errors.append(f"Disagreement in I: {I} "
+                              f"versus {self.total}")
+
+            if O != int(self.others or 0):
+                errors.append(f"Disagreement in O: {O} "
+                              f"versus {self.others}")
+
+            if R != int(self.recovereds or 0):
+                errors.append(f"Disagreement in R: {R} "
+                              f"versus {self.recovereds}")
+
+            if P != int(self.population or 0):
+                errors.append(f"Disagreement in Population: {P} "
+                              f"versus {self.population}")
+
+        if len(errors) > 0:
+            errors = "\nERROR: ".join(errors)
+            from .utils._console import Console
+            Console.error(errors)
+            raise AssertionError(f"Disagreement in population sums!")
+
+    def headers(self):
+        """Return a list of the headers that should be used to report
+           data from this population. This returns a list of headers,
+           e.g. ["S", "E", "I", "R"]
+        """
+        headers = []
+
+        if self.susceptibles is not None:
+            headers.append("S")
+
+        if self.latent is not None:
+            headers.append(f"E")
+
+        if self.total is not None:
+            headers.append(f"I")
+
+        if self.totals is not None:
+            # use items as need to be same order as items below
+            for key, _ in self.totals.items():
+                headers.append(key)
+
+        if self.other_totals is not None:
+            # use items as need to be same order as items below
+            for key, _ in self.other_totals.items():
+                headers.append(key)
+
+        if self.recovereds is not None:
+            headers.append("R")
+
+        return headers
+
+    def summary(self, demographics=None):
+        """Return a short summary string that is suitable to be printed
+           out during a model run
+
+           Returns
+           -------
+           summary: str
+             The short summary string
+        """
+        parts = []
+
+        parts.append(f"S: {self.susceptibles}")
+
+        if self.latent is not None:
+            parts.append(f"E: {self.latent}")
+
+        if self.total is not None:
+            parts.append(f"I: {self.total}")
+
+        if self.totals is not None:
+            for key, value in self.totals.items():
+                parts.append(f"{key}: {value}")
+
+        if self.other_totals is not None:
+            for key, value in self.other_totals.items():
+                parts.append(f"{key}: {value}")
+
+        if self.recovereds is not None:
+            parts.append(f"R: {self.recovereds}")
+
+        if self.n_inf_wards is not None:
+            parts.append(f"IW: {self.n_inf_wards}")
+
+        parts.append(f"POPULATION: {self.population}")
+
+        summary = "  ".join(parts)
+
+        if self.subpops is None or len(self.subpops) == 0:
+            return summary
+
+        from .utils._console import Table
+
+        table = Table(show_edge=True, show_footer=True)
+
+        table.add_column("", footer="total")
+        table.add_column("S", footer=self.susceptibles)
+        columns = {}
+        count = 0
+        columns[""] = count
+        count += 1
+
+        columns["S"] = count
+        count += 1
+
+        if self.latent is not None:
+            table.add_column("E", footer=self.latent)
+            columns["E"] = count
+            count += 1
+
+        if self.total is not None:
+            table.add_column("I", footer=self.total)
+            columns["I"] = count
+            count += 1
+
+        if self.totals is not None:
+            for key, value in self.totals.items():
+                table.add_column(key, footer=value)
+                columns[key] = count
+                count += 1
+
+        if self.other_totals is not None:
+            for key, value in self.other_totals.items():
+                table.add_column(key, footer=value)
+                columns[key] = count
+                count += 1
+
+        if self.recovereds is not None:
+            table.add_column("R", footer=self.recovereds)
+            columns["R"] = count
+            count += 1
+
+        if self.n_inf_wards is not None:
+            table.add_column("IW", footer=self.n_inf_wards)
+            columns["IW"] = count
+            count += 1
+
+        table.add_column("POPULATION", footer=self.population)
+        columns["POPULATION"] = count
+        count += 1
+
+        for i, subpop in enumerate(self.subpops):
+            row = [None] * count
+            if demographics is not None:
+                name = demographics.get_name(i)
+                row[0] = name
+            else:
+                row[0] = str(i)
+
+            if "S" in columns:
+                row[columns["S"]] = subpop.susceptibles
+
+            if "E" in columns:
+                row[columns["E"]] = subpop.latent
+
+            if "R" in columns:
+                row[columns["R"]] = subpop.recovereds
+
+            if "I" in columns:
+                row[columns["I"]] = subpop.total
+
+            if "IW" in columns:
+                row[columns["IW"]] = subpop.n_inf_wards
+
+            if subpop.totals is not None:
+                for key, value in subpop.totals.items():
+                    row[columns[key]] = value
+
+            if subpop.other_totals is not None:
+                for key, value in subpop.other_totals.items():
+                    row[columns[key]] = value
+
+            row[-1] = subpop.population
+
+            table.add_row(row)
+
+        return summary + "\n" + table.to_string()
+
+
+#: Sentinel used to hold None in an integer column
+_NONE = -2**63
+
+#: Sentinel used to hold a missing value (e.g. a missing key in
+#: 'totals') in an integer column
+_MISSING_INT = -2**63 + 1
+
+
+class _Missing:
+    """Marker for a missing value in a column"""
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        return (_get_missing, ())
+
+
+_MISSING = _Missing()
+
+
+def _get_missing():
+    return _MISSING
+
+
+class _Column:
+    """A growable column of values. Integers (and dates) are held in
+       a compact 64-bit integer array, and floats in a double array.
+       None and missing values in integer columns are held using
+       sentinels. The column switches to a plain list if a value is
+       added that cannot be held in its array
+    """
+    __slots__ = ("_kind", "_values", "_has_sentinels")
+
+    def __init__(self, kind: str, nmissing: int = 0):
+        from array import array
+
+        self._kind = kind
+        self._has_sentinels = nmissing > 0
+
+        if kind == "int" or kind == "date":
+            self._values = array("q", [_MISSING_INT]) * nmissing
+        elif kind == "float":
+            self._values = array("d")
+
+            if nmissing > 0:
+                self._to_list()
+                self._values += [_MISSING] * nmissing
+        else:
+            self._values = [_MISSING] * nmissing
+
+    @staticmethod
+    def kind_of(value) -> str:
+        """Return the kind of column that best holds 'value'"""
+        if type(value) is float:
+            return "float"
+        elif type(value) is _date:
+            return "date"
+        else:
+            return "int"
+
+    def __len__(self):
+        return len(self._values)
+
+    def _to_list(self):
+        """Switch this column to a plain list"""
+        self._values = self.values(missing=_MISSING)
+        self._kind = "object"
+
+    def _encode(self, value):
+        """Return 'value' encoded for the array of this column, or
+           raise a TypeError if that is not possible
+        """
+        if self._kind == "int":
+            if value is None:
+                self._has_sentinels = True
+                return _NONE
+            elif isinstance(value, bool):
+                raise TypeError()
+            elif isinstance(value, int) or \
+                    (hasattr(value, "__index__") and
+                     not isinstance(value, float)):
+                value = int(value)
+
+                if value <= _MISSING_INT or value >= 2**63:
+                    raise TypeError()
+
+                return value
+        elif self._kind == "date":
+            if value is None:
+                self._has_sentinels = True
+                return _NONE
+            elif type(value) is _date:
+                return value.toordinal()
+        elif self._kind == "float":
+            if type(value) is float:
+                return value
+
+        raise TypeError()
+
+    def _decode(self, value, missing):
+        """Return the value of the passed array entry"""
+        if self._kind == "int" or self._kind == "date":
+            if value == _NONE:
+                return None
+            elif value == _MISSING_INT:
+                return missing
+            elif self._kind == "date":
+                return _date.fromordinal(value)
+
+        return value
+
+    def append(self, value):
+        """Append 'value' to this column"""
+        if self._kind != "object":
+            try:
+                self._values.append(self._encode(value))
+                return
+            except (TypeError, OverflowError):
+                self._to_list()
+
+        self._values.append(value)
+
+    def append_missing(self, n: int = 1):
+        """Append 'n' missing values to this column"""
+        if self._kind == "int" or self._kind == "date":
+            from array import array
+            self._values.extend(array("q", [_MISSING_INT]) * n)
+            self._has_sentinels = True
+        else:
+            if self._kind != "object":
+                self._to_list()
+
+            self._values.extend([_MISSING] * n)
+
+    def extend(self, other):
+        """Extend this column with the values in column 'other'"""
+        if self._kind == other._kind and self._kind != "object":
+            self._values.extend(other._values)
+            self._has_sentinels = self._has_sentinels or \
+                other._has_sentinels
+        else:
+            if self._kind != "object":
+                self._to_list()
+
+            self._values.extend(other.values(missing=_MISSING))
+
+    def get(self, i: int, missing=None):
+        """Return the ith value, returning 'missing' if it is missing"""
+        value = self._values[i]
+
+        if self._kind == "object":
+            return missing if value is _MISSING else value
+        else:
+            return self._decode(value, missing)
+
+    def values(self, missing=None) -> _List:
+        """Return all of the values as a list, with missing values
+           replaced by 'missing'
+        """
+        if self._kind == "float":
+            return self._values.tolist()
+        elif self._kind == "object":
+            return [missing if value is _MISSING else value
+                    for value in self._values]
+        elif self._kind == "int" and not self._has_sentinels:
+            return self._values.tolist()
+        else:
+            return [self._decode(value, missing) for value in self._values]
+
+
+#: The fields of Population that are held in columns
+_fields = ["initial", "susceptibles", "latent", "total", "recovereds",
+           "n_inf_wards", "scale_uv", "day", "date"]
+
+#: The fields of Population that are dictionaries of values
+_dict_fields = ["totals", "other_totals"]
+
+
+class Populations:
+    """This class holds the trajectory of Population objects recorded
+       for every step (day) of a model outbreak. The trajectory is
+       held in columns, with one (growable, compact) array for each
+       of the values of Population, e.g. one for 'susceptibles',
+       one for each of the 'totals' etc. Each demographic is held
+       in its own Populations. This means that appending a day does
+       not create any new objects, and that the trajectory is small
+       and quick to pickle. The Population for each day is created
+       when it is indexed.
+    """
+
+    def __init__(self):
+        #: The number of days (Population objects) in the trajectory
+        self._n = 0
+
+        #: The column for each value, keyed by field name, or
+        #: by (dict_field, key) for the values in totals and other_totals
+        self._columns = {}
+
+        #: The Populations for each of the demographics
+        self._subpops = []
+
+    def __str__(self):
+        if len(self) == 0:
+            return "Populations:empty"
+        else:
+            return f"Latest: {self[-1]}"
+
+    def __eq__(self, other):
+        if not isinstance(other, Populations):
+            return False
+        elif len(self) != len(other):
+            return False
+
+        for p0, p1 in zip(self, other):
+            if p0 != p1:
+                return False
+
+        return True
+
+    def _get_population(self, i: int) -> Population:
+        """Create and return the Population for the ith day"""
+        values = {}
+
+        for field in _fields:
+            column = self._columns.get(field, None)
+
+            if column is not None:
+                value = column.get(i, missing=_MISSING)
+
+                if value is not _MISSING:
+                    values[field] = value
+
+        for field in _dict_fields:
+            if self._columns[field].get(i):
+                d = {}
+
+                for key, column in self._columns.items():
+                    if isinstance(key, tuple) and key[0] == field:
+                        value = column.get(i, missing=_MISSING)
+
+                        if value is not _MISSING:
+                            d[key[1]] = value
+
+                values[field] = d
+            else:
+                values[field] = None
+
+        population = Population(**values)
+
+        nsubpops = self._columns["nsubpops"].get(i)
+
+        if nsubpops is not None:
+            population.subpops = [self._subpops[j]._get_population(i)
+                                  for j in range(0, nsubpops)]
+
+        return population
+
+    def __getitem__(self, i: int):
+        """Return the ith Population in the trajectory"""
+        if isinstance(i, slice):
+            return [self._get_population(j)
+                    for j in range(0, self._n)[i]]
+
+        if self._n == 0:
+            raise IndexError("No trajectory data collected")
+
+        i = int(i)
+
+        if i < 0:
+            i += self._n
+
+        if i < 0 or i >= self._n:
+            raise IndexError(f"Index {i} out of range for a trajectory "
+                             f"with {self._n} days")
+
+        return self._get_population(i)
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        for i in range(0, self._n):
+            yield self._get_population(i)
+
+    @property
+    def subpops(self):
+        """The trajectories (Populations) of each of the demographics"""
+        return self._subpops
+
+    def get_column(self, field: str, key: str = None,
+                   missing=None) -> _List:
+        """Return all of the values of 'field' (e.g. "susceptibles")
+           over the trajectory as a list. If 'key' is set, then this
+           returns the values of 'key' in the dictionary 'field'
+           (e.g. field="totals", key="H"). Values that are missing
+           (e.g. the key isn't in the dictionary) are set to 'missing'
+        """
+        if key is not None:
+            field = (field, key)
+
+        column = self._columns.get(field, None)
+
+        if column is None:
+            return [missing] * self._n
+        else:
+            return column.values(missing=missing)
+
+    def _append_value(self, key, value):
+        """Append 'value' to the column 'key', creating it if needed"""
+        column = self._columns.get(key, None)
+
+        if column is None:
+            column = _Column(_Column.kind_of(value), nmissing=self._n)
+            self._columns[key] = column
+
+        column.append(value)
+
+    def strip_demographics(self):
+        """Return this trajectory ready to be returned from a model run.
+           As the trajectory is held in compact columns it is already
+           small and quick to send over a network, so the
+           demographics are kept
+        """
+        return self
+
+    def append(self, population: Population):
+        """Append the next step in the trajectory.
+
+           Parameters
+           ----------
+           population: Population
+             The population to append to this list
+        """
+        if not isinstance(population, Population):
+            raise TypeError("Only Population objects should be recorded!")
+
+        append = self._append_value
+
+        for field in _fields:
+            append(field, getattr(population, field))
+
+        nvalues = len(_fields) + len(_dict_fields) + 1
+
+        for field in _dict_fields:
+            d = getattr(population, field)
+            append(field, 0 if d is None else 1)
+
+            if d is not None:
+                nvalues += len(d)
+
+                for key, value in d.items():
+                    append((field, key), value)
+
+        subpops = population.subpops
+
+        if subpops is None:
+            append("nsubpops", None)
+            subpops = []
+        else:
+            append("nsubpops", len(subpops))
+
+        for j, subpop in enumerate(subpops):
+            if j >= len(self._subpops):
+                self._subpops.append(Populations._empty(self._n))
+
+            self._subpops[j].append(subpop)
+
+        self._n += 1
+
+        if nvalues != len(self._columns):
+            # pad out any columns that were not in this population
+            for column in self._columns.values():
+                if len(column) < self._n:
+                    column.append_missing(self._n - len(column))
+
+        if len(subpops) != len(self._subpops):
+            for subpop in self._subpops:
+                if len(subpop) < self._n:
+                    subpop._append_empty(self._n - len(subpop))
+
+    @staticmethod
+    def _empty(n: int):
+        """Return a Populations with 'n' empty (all missing) days"""
+        p = Populations()
+        p._append_empty(n)
+        return p
+
+    def _append_empty(self, n: int):
+        """Append 'n' empty (all missing) days"""
+        if n <= 0:
+            return
+
+        self._n += n
+
+        for key in _fields + ["nsubpops"]:
+            if key not in self._columns:
+                self._columns[key] = _Column("int")
+
+        for key in _dict_fields:
+            if key not in self._columns:
+                self._columns[key] = _Column("int")
+
+        for column in self._columns.values():
+            column.append_missing(self._n - len(column))
+
+        for subpop in self._subpops:
+            subpop._append_empty(self._n - len(subpop))
+
+    def extend(self, other):
+        """Extend this trajectory with all of the days in 'other'.
+           This is done a column at a time
+
+           Parameters
+           ----------
+           other: Populations
+             The trajectory to add to the end of this one
+        """
+        if not isinstance(other, Populations):
+            for population in other:
+                self.append(population)
+            return
+
+        n = self._n + other._n
+
+        for key, column in other._columns.items():
+            if key not in self._columns:
+                self._columns[key] = _Column(column._kind, nmissing=self._n)
+
+            self._columns[key].extend(column)
+
+        for j, subpop in enumerate(other._subpops):
+            if j >= len(self._subpops):
+                self._subpops.append(Populations._empty(self._n))
+
+            self._subpops[j].extend(subpop)
+
+        self._n = n
+
+        for column in self._columns.values():
+            if len(column) < n:
+                column.append_missing(n - len(column))
+
+        for subpop in self._subpops:
+            if len(subpop) < n:
+                subpop._append_empty(n - len(subpop))
@@ -0,0 +1,23 @@
+
+# This file was generated by 'versioneer.py' (0.18) from
+# revision-control system data, or from the parent directory name of an
+# unpacked source archive. Distribution tarballs contain a pre-generated copy
+# of this file.
+
+import json
+
+version_json = '''
+{
+ "branch": "master",
+ "date": "2026-10-19T11:31:52+0000",
+ "dirty": false,
+ "error": null,
+ "full-revisionid": "3d6134f3595c38fe6de2a65c0ea80dc931c7021a",
+ "repository": "https://github.com/metawards/MetaWards",
+ "version": "0+untagged.50.g3d6134f"
+}
+'''  # END VERSION_JSON
+
+
+def get_versions():
+    return json.loads(version_json)
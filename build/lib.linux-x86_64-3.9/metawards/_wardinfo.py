@@ -0,0 +1,740 @@
+
+from dataclasses import dataclass as _dataclass
+from dataclasses import field as _field
+from typing import List as _List
+from typing import Dict as _Dict
+
+__all__ = ["WardInfo", "WardInfos", "WardInfoColumns"]
+
+
+@_dataclass
+class WardInfo:
+    """This class holds metadata about a ward, e.g. its name(s),
+       any ID code(s), any information about the region or
+       authority it is in etc.
+    """
+    #: Name of the ward
+    name: str = ""
+    #: Any alternative names of the ward
+    alternate_names: _List[str] = _field(default_factory=list)
+
+    #: Official ID code of the ward
+    code: str = ""
+    #: Any alternative ID codes of the ward
+    alternate_codes: _List[str] = _field(default_factory=list)
+
+    #: The name of the local authority it is in
+    authority: str = ""
+
+    #: The ID of the local authority it is in
+    authority_code: str = ""
+
+    #: The name of the region it is in
+    region: str = ""
+
+    #: The ID of the region it is in
+    region_code: str = ""
+
+    def __hash__(self):
+        return f"{self.name} | {self.authority} | {self.region}".__hash__()
+
+    def is_null(self):
+        return self == WardInfo()
+
+    def summary(self):
+        """Return a summary string that identifies this WardInfo"""
+        s = []
+
+        if len(self.name) > 0:
+            s.append(self.name)
+        elif len(self.alternate_names) > 0:
+            s.append(self.alternate_names[0])
+        elif len(self.code) > 0:
+            s.append(self.code)
+        elif len(self.alternate_codes) > 0:
+            s.append(self.alternate_codes[0])
+
+        if len(self.authority) > 0:
+            s.append(self.authority)
+        elif len(self.authority_code) > 0:
+            s.append(self.authority_code)
+
+        if len(self.region) > 0:
+            s.append(self.region)
+        elif len(self.region_code) > 0:
+            s.appened(self.region_code)
+
+        return "/".join(s)
+
+    def to_data(self):
+        """Return a dictionary that contains all of this data, in
+           a format that can be serialised to JSON
+        """
+        data = {}
+
+        if self.name is not None and len(self.name) > 0:
+            data["name"] = str(self.name)
+
+        if self.alternate_names is not None and len(self.alternate_names) > 0:
+            data["alternate_names"] = [str(x) for x in self.alternate_names]
+
+        if self.code is not None and len(self.code) > 0:
+            data["code"] = str(self.code)
+
+        if self.alternate_codes is not None and len(self.alternate_codes) > 0:
+            data["alternate_codes"] = [str(x) for x in self.alternate_codes]
+
+        if self.authority is not None and len(self.authority) > 0:
+            data["authority"] = str(self.authority)
+
+        if self.authority_code is not None and len(self.authority_code) > 0:
+            data["authority_code"] = str(self.authority_code)
+
+        if self.region is not None and len(self.region) > 0:
+            data["region"] = str(self.region)
+
+        if self.region_code is not None and len(self.region_code) > 0:
+            data["region_code"] = str(self.region_code)
+
+        return data
+
+    @staticmethod
+    def from_data(data):
+        """Construct from the passed dictionary, which has, e.g. been
+           deserialised from JSON
+        """
+        if data is None or len(data) == 0:
+            return WardInfo()
+
+        info = WardInfo()
+
+        info.name = str(data.get("name", ""))
+        info.alternate_names = [str(x) for x in
+                                data.get("alternate_names", [])]
+        info.code = str(data.get("code", ""))
+        info.alternate_codes = [str(x) for x in
+                                data.get("alternate_codes", [])]
+        info.authority = str(data.get("authority", ""))
+        info.authority_code = str(data.get("authority_code", ""))
+        info.region = str(data.get("region", ""))
+        info.region_code = str(data.get("region_code", ""))
+
+        return info
+
+
+class WardInfoColumns:
+    """This class holds the WardInfo metadata for a list of wards in
+       columnar form, i.e. one list of strings per field, which is
+       much more compact and quicker to create and to cache than
+       one WardInfo object per ward. It behaves like a (read-only)
+       list of WardInfo objects, which are created lazily when
+       they are first accessed.
+
+       This is created by :func:`~metawards.utils.add_lookup`, and
+       is used automatically by :class:`WardInfos`, so you should
+       not normally need to use this class directly.
+    """
+
+    #: The string fields that are held as columns
+    fields = ["name", "code", "authority", "authority_code",
+              "region", "region_code"]
+
+    def __init__(self, nwards_plus_one: int = 0):
+        """Create columns for 'nwards_plus_one' wards, all of which
+           are missing (None). Index zero is the null ward
+        """
+        n = int(nwards_plus_one)
+
+        #: Whether or not there is a WardInfo for each ward
+        self.present = bytearray(n)
+
+        for field in WardInfoColumns.fields:
+            setattr(self, field, [""] * n)
+
+        #: The (rare) alternate names and codes, keyed by ward index
+        self.alternate_names = {}
+        self.alternate_codes = {}
+
+        self._infos = [None] * n
+
+    def __len__(self):
+        return len(self.present)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(0, len(self))[i]]
+
+        info = self._infos[i]
+
+        if info is None and self.present[i]:
+            info = WardInfo(**{field: getattr(self, field)[i]
+                               for field in WardInfoColumns.fields})
+            info.alternate_names = list(self.alternate_names.get(i, []))
+            info.alternate_codes = list(self.alternate_codes.get(i, []))
+            self._infos[i] = info
+
+        return info
+
+    def __eq__(self, other):
+        if isinstance(other, WardInfoColumns) or isinstance(other, list):
+            return len(self) == len(other) and list(self) == list(other)
+        else:
+            return False
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, info: WardInfo = None) -> None:
+        """Append the passed WardInfo (or a missing ward if this is
+           None) onto the end of the columns
+        """
+        i = len(self)
+
+        self.present.append(0 if info is None else 1)
+        self._infos.append(None)
+
+        for field in WardInfoColumns.fields:
+            getattr(self, field).append(
+                "" if info is None else getattr(info, field))
+
+        if info is not None:
+            if len(info.alternate_names) > 0:
+                self.alternate_names[i] = list(info.alternate_names)
+
+            if len(info.alternate_codes) > 0:
+                self.alternate_codes[i] = list(info.alternate_codes)
+
+    def resize(self, n: int) -> None:
+        """Resize to hold 'n' wards, either removing wards from the
+           end, or adding missing (None) wards
+        """
+        if n < len(self):
+            del self.present[n:]
+            del self._infos[n:]
+
+            for field in WardInfoColumns.fields:
+                del getattr(self, field)[n:]
+
+            for alternates in [self.alternate_names, self.alternate_codes]:
+                for i in [i for i in alternates.keys() if i >= n]:
+                    del alternates[i]
+        else:
+            while len(self) < n:
+                self.append(None)
+
+    def get_search_strings(self, kind: str):
+        """Return the (primary, alternates) lists of strings for each
+           ward that are needed to build the _SearchIndex of type
+           'kind' (ward, authority or region). This reads the columns
+           directly, so doesn't need to create any WardInfo objects
+           (apart from using any that have already been created,
+           in case these have been changed)
+        """
+        strings = []
+
+        if kind == "ward":
+            primary = (self.name, self.code)
+        else:
+            primary = (getattr(self, kind), getattr(self, f"{kind}_code"))
+
+        for i in range(0, len(self)):
+            info = self._infos[i]
+
+            if info is not None:
+                if kind == "ward":
+                    strings.append(
+                        ([x for x in (info.name, info.code)
+                          if x is not None],
+                         [x for x in info.alternate_names +
+                          info.alternate_codes if x is not None]))
+                else:
+                    values = (getattr(info, kind),
+                              getattr(info, f"{kind}_code"))
+                    strings.append(([x for x in values if x is not None],
+                                    []))
+            elif not self.present[i]:
+                strings.append(None)
+            elif kind == "ward":
+                strings.append(([primary[0][i], primary[1][i]],
+                                self.alternate_names.get(i, []) +
+                                self.alternate_codes.get(i, [])))
+            else:
+                strings.append(([primary[0][i], primary[1][i]], []))
+
+        return strings
+
+
+#: Characters that have a special meaning in a regular expression.
+#: Search terms that don't contain any of these can be looked up
+#: in a _SearchIndex rather than by scanning every ward
+_regex_special = set(".^$*+?{}[]\\|()")
+
+
+def _split_search(name: str):
+    """Split the passed search term into (literal, anchor_start,
+       anchor_end) if it is a plain string, optionally anchored using
+       '^' and/or '$'. This returns None if the search term uses
+       any other regular expression features
+    """
+    if not isinstance(name, str):
+        return None
+
+    anchor_start = name.startswith("^")
+
+    if anchor_start:
+        name = name[1:]
+
+    anchor_end = name.endswith("$") and not name.endswith("\\$")
+
+    if anchor_end:
+        name = name[:-1]
+
+    for c in name:
+        if c in _regex_special:
+            return None
+
+    return (name, anchor_start, anchor_end)
+
+
+def _trigrams(value: str):
+    """Return the set of all three-character substrings of 'value'"""
+    return {value[i:i+3] for i in range(0, len(value) - 2)}
+
+
+class _SearchIndex:
+    """Index over the (lower-cased) strings associated with each
+       ward, e.g. the name and code, that is used to find candidate
+       matches for a literal search without scanning every ward.
+       This holds a hash of exact values, a sorted list for
+       prefix matches, and a trigram index for substring matches.
+       Each string is either primary (e.g. name or code) or
+       alternate (e.g. alternate names or codes)
+    """
+
+    def __init__(self, strings):
+        """Construct from 'strings', which is a list of
+           (primary, alternates) lists of strings for each ward,
+           or None if there is no ward at that index
+        """
+        self._exact = {}
+        self._trigrams = {}
+        self._all = ([], [])
+        prefixes = []
+
+        for i, value in enumerate(strings):
+            if value is None:
+                continue
+
+            self._all[1].append(i)
+
+            if len(value[0]) > 0:
+                self._all[0].append(i)
+
+            for is_alternate, values in enumerate(value):
+                for v in values:
+                    v = v.lower()
+                    self._exact.setdefault(v, []).append((i, is_alternate))
+                    prefixes.append((v, i, is_alternate))
+
+                    for t in _trigrams(v):
+                        self._trigrams.setdefault(t, set()).add(i)
+
+        prefixes.sort()
+        self._prefixes = prefixes
+        self._prefix_keys = [x[0] for x in prefixes]
+
+    def exact(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards with a string equal
+           to 'value' (case-insensitive)
+        """
+        return {i for (i, is_alternate) in self._exact.get(value.lower(), [])
+                if include_alternates or not is_alternate}
+
+    def prefix(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards with a string that
+           starts with 'value' (case-insensitive)
+        """
+        from bisect import bisect_left
+
+        value = value.lower()
+        matches = set()
+
+        i = bisect_left(self._prefix_keys, value)
+
+        while i < len(self._prefixes):
+            (v, ward, is_alternate) = self._prefixes[i]
+
+            if not v.startswith(value):
+                break
+
+            if include_alternates or not is_alternate:
+                matches.add(ward)
+
+            i += 1
+
+        return matches
+
+    def substring(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards that may have a string
+           that contains 'value' (case-insensitive). This is a
+           superset of the true matches, which should be checked
+        """
+        trigrams = _trigrams(value.lower())
+
+        if len(trigrams) == 0:
+            # too short to index - every ward is a candidate
+            return set(self._all[int(include_alternates)])
+
+        postings = sorted([self._trigrams.get(t, set()) for t in trigrams],
+                          key=len)
+
+        return set.intersection(*postings)
+
+
+@_dataclass
+class WardInfos:
+    """Simple class that holds a list of WardInfo objects, and provides
+       useful search functions over that list. This prevents me from
+       cluttering up the interface of Network
+    """
+    #: The list of WardInfo objects, one for each ward in order. This
+    #: can also be a WardInfoColumns, which creates these on demand
+    wards: _List[WardInfo] = _field(default_factory=list)
+
+    #: The index used to speed up lookup of wards
+    _index: _Dict[WardInfo, int] = None
+
+    #: The (lazily built) indexes used to speed up searches by ward,
+    #: authority and region name or code
+    _search: _Dict[str, _SearchIndex] = _field(default=None, compare=False,
+                                               repr=False)
+
+    def __len__(self):
+        return len(self.wards)
+
+    def __getitem__(self, index: int) -> WardInfo:
+        return self.wards[index]
+
+    def __setitem__(self, i: int, info: WardInfo) -> None:
+        """Set the ith WardInfo equal to 'info'."""
+        if info is not None:
+            if not isinstance(info, WardInfo):
+                raise TypeError(
+                    f"Setting item at index {i} to not a WardInfo {info} "
+                    f"is not allowed")
+
+        self._search = None
+
+        if isinstance(self.wards, WardInfoColumns):
+            # the columns are read-only, so convert to a list of
+            # WardInfo objects before changing anything
+            self.wards = list(self.wards)
+
+        if i >= len(self.wards):
+            self.wards += [None] * (i - len(self.wards) + 1)
+            self.wards[i] = info
+
+            if info is not None and self._index is not None:
+                self._index[info] = i
+
+            return
+
+        elif i < 0:
+            i = len(self.wards) + i
+
+            if i < 0:
+                raise IndexError(f"Invalid index")
+
+        if self.wards[i] == info:
+            # nothing to do
+            return
+
+        elif self.wards[i] is not None:
+            self._index = None
+            self.wards[i] = info
+            return
+
+        else:
+            self.wards[i] = info
+
+            if self._index is not None:
+                index = self._index.get(info, None)
+
+                if index is None or index > i:
+                    self._index[info] = i
+
+            return
+
+    def reindex(self):
+        """Rebuild the WardInfo index. You must call this function after
+           you have modified the list of WardInfo objects, as otherwise
+           this will fall out of date. Note that this will be automatically
+           called the first time you use the "contains" or "index" functions
+        """
+        self._index = {}
+        self._search = None
+
+        for i, ward in enumerate(self.wards):
+            if ward is not None:
+                if not isinstance(ward, WardInfo):
+                    raise TypeError(
+                        f"Item at index {i} is not a WardInfo! {ward}")
+
+                if ward not in self._index:
+                    self._index[ward] = i
+
+    def __contains__(self, info: WardInfo) -> bool:
+        """Return whether or not this contains the passed WardInfo"""
+        if self._index is None:
+            self.reindex()
+
+        return info in self._index
+
+    def contains(self, info: WardInfo) -> bool:
+        """Return whether or not this contains the passed WardInfo"""
+        return self.__contains__(info)
+
+    def index(self, info: WardInfo) -> int:
+        """Return the index of the passed 'info' object if it is in this
+           list. If not, then a ValueError exception is raised. Note that
+           only the first matching WardInfo will be returned
+        """
+        if self._index is None:
+            self.reindex()
+
+        i = self._index.get(info, None)
+
+        if i is None:
+            raise ValueError(f"Missing ward! {info}")
+        else:
+            return i
+
+    def _get_search_index(self, kind: str) -> _SearchIndex:
+        """Return the search index of type 'kind' (ward, authority or
+           region), building it if needed. This is built once and
+           then reused until the list of WardInfo objects is changed
+        """
+        if self._search is None:
+            self._search = {}
+
+        index = self._search.get(kind, None)
+
+        if index is not None:
+            return index
+
+        if isinstance(self.wards, WardInfoColumns):
+            index = _SearchIndex(self.wards.get_search_strings(kind))
+            self._search[kind] = index
+            return index
+
+        strings = []
+
+        for ward in self.wards:
+            if ward is None:
+                strings.append(None)
+            elif kind == "ward":
+                strings.append(
+                    ([x for x in (ward.name, ward.code) if x is not None],
+                     [x for x in ward.alternate_names + ward.alternate_codes
+                      if x is not None]))
+            else:
+                values = (getattr(ward, kind), getattr(ward, f"{kind}_code"))
+                strings.append(([x for x in values if x is not None], []))
+
+        index = _SearchIndex(strings)
+        self._search[kind] = index
+        return index
+
+    def _find(self, kind: str, name: str, match: bool,
+              include_alternates: bool, is_match):
+        """Internal function that finds the wards for which
+           'is_match(ward, search)' is true, where 'search' is the
+           compiled 'name'. If 'name' is a plain (optionally anchored)
+           string then the search index of type 'kind' is used to
+           find candidate wards, so that only those are checked
+        """
+        import re
+
+        if not isinstance(name, re.Pattern):
+            search = re.compile(name, re.IGNORECASE)
+        else:
+            search = name
+
+        if match:
+            search = search.match
+        else:
+            search = search.search
+
+        literal = _split_search(name)
+
+        if literal is None:
+            candidates = range(0, len(self.wards))
+        else:
+            (value, anchor_start, anchor_end) = literal
+            index = self._get_search_index(kind)
+
+            if (match or anchor_start) and anchor_end:
+                candidates = index.exact(value, include_alternates)
+            elif match or anchor_start:
+                candidates = index.prefix(value, include_alternates)
+            else:
+                candidates = index.substring(value, include_alternates)
+
+            candidates = sorted(candidates)
+
+        matches = []
+
+        for i in candidates:
+            ward = self.wards[i]
+
+            if ward is None:
+                continue
+
+            if is_match(ward, search):
+                matches.append(i)
+
+        return matches
+
+    def _find_ward(self, name: str, match: bool, include_alternates: bool):
+        """Internal function that flexibly finds a ward by name"""
+        def is_match(ward, search):
+            if search(ward.name):
+                return True
+            elif search(ward.code):
+                return True
+            elif include_alternates:
+                for alternate in ward.alternate_names:
+                    if search(alternate):
+                        return True
+
+                for alternate in ward.alternate_codes:
+                    if search(alternate):
+                        return True
+
+            return False
+
+        return self._find("ward", name, match=match,
+                          include_alternates=include_alternates,
+                          is_match=is_match)
+
+    def _find_authority(self, name: str, match: bool):
+        """Internal function that flexibly finds a ward by authority"""
+        def is_match(ward, search):
+            return search(ward.authority) or search(ward.authority_code)
+
+        return self._find("authority", name, match=match,
+                          include_alternates=False, is_match=is_match)
+
+    def _find_region(self, name: str, match: bool):
+        """Internal function that flexibly finds a ward by region"""
+        def is_match(ward, search):
+            return search(ward.region) or search(ward.region_code)
+
+        return self._find("region", name, match=match,
+                          include_alternates=False, is_match=is_match)
+
+    def find_exact(self, name: str, include_alternates: bool = True):
+        """Return the list of indicies of wards whose name or code is
+           exactly equal to 'name' (case-insensitive). This uses a
+           hash lookup, so is much quicker than a full search
+
+           Parameters
+           ----------
+           name: str
+             Name or code of the ward to find
+           include_alternates: bool(True)
+             Whether or not to include alternative names and codes
+        """
+        return sorted(self._get_search_index("ward").exact(
+                      name, include_alternates))
+
+    def _intersect(self, list1, list2):
+        """Return the intersection of two lists"""
+        return [value for value in list1 if value in list2]
+
+    def find(self, name: str = None,
+             authority: str = None, region: str = None,
+             match: bool = False, match_authority_and_region: bool = False,
+             include_alternates: bool = True):
+        """Generic search function that will search using any or all
+           of the terms provided. This returns a list of indicies
+           of wards that match the search
+
+           Parameters
+           ----------
+           name: str or regexp
+             Name or code of the ward to search. You can also include
+             the authority adn region by separating usign "/", e.g.
+             "Clifton/Bristol".
+           authority: str or regexp
+             Name or code of the authority to search
+           region: str or regexp
+             Name or code of the region to search
+           match: bool(False)
+             Use a regular expression match for the ward rather than a
+             search. This forces the match to be at the start of the string
+           match_authority_and_region: bool(False)
+             Use a regular expression match for the authority and region
+             rather than a search. This forces the match to be at the start
+             of the string
+           include_alternates: bool(True)
+             Whether or not to include alternative names and codes when
+             searching for the ward
+        """
+        wards = None
+
+        if name is not None:
+            parts = name.split("/")
+
+            if len(parts) == 1:
+                wards = self._find_ward(name, match=match,
+                                        include_alternates=include_alternates)
+            else:
+                wards = self._find_ward(name=parts[0].strip(), match=match,
+                                        include_alternates=include_alternates)
+                authority = parts[1].strip()
+
+                if len(parts) > 2:
+                    region = "/".join(parts[2:]).strip()
+
+            if len(wards) == 0:
+                return wards
+
+        if authority is not None:
+            authorities = self._find_authority(
+                authority,
+                match=match_authority_and_region)
+
+            if len(authorities) == 0:
+                return authorities
+
+            if wards is None:
+                wards = authorities
+            else:
+                wards = self._intersect(wards, authorities)
+                wards.sort()
+                if len(wards) == 0:
+                    return wards
+
+        if region is not None:
+            regions = self._find_region(region,
+                                        match=match_authority_and_region)
+
+            if len(regions) == 0:
+                return regions
+
+            if wards is None:
+                wards = regions
+            else:
+                wards = self._intersect(wards, regions)
+                wards.sort()
+
+        if wards is None:
+            # we have not searched for anything, so return everything
+            return list(range(1, len(self.wards)))
+        else:
+            return wards
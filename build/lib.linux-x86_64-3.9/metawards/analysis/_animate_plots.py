@@ -0,0 +1,354 @@
+
+from typing import List as _List
+
+__all__ = ["animate_plots", "import_animate_modules"]
+
+
+def import_font_modules():
+    """Imports matplotlib.font_manager"""
+    try:
+        from matplotlib import font_manager
+        return font_manager
+    except ImportError as e:
+        print("Unable to import the matplotlib.font_manager module...")
+        print(f"Error is {e}")
+        return None
+
+
+def import_animate_modules():
+    """Import the python modules needed to animate plots. This
+       imports Python Pillow
+
+       Returns
+       -------
+       (Image, ImageDraw)
+         The PIL.Image and PIL.ImageDraw modules
+    """
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        print("Could not import Python Pillow to create animated plot.")
+        print("Please install using 'pip install Pillow>=6.2.1',")
+        print("or by running 'metawards-install --optional'")
+
+    return (Image, ImageDraw, ImageFont)
+
+
+_legend_fonts = {}
+
+
+def _get_legend_font(size: int = 28):
+    """Return the font used to write the legends on the frames, or
+       None if this is not available. This is cached as finding
+       fonts is slow
+    """
+    if size not in _legend_fonts:
+        font = None
+
+        try:
+            font_manager = import_font_modules()
+
+            if font_manager:
+                (_, _, ImageFont) = import_animate_modules()
+                fontfile = font_manager.findfont("Arial")
+                font = ImageFont.truetype(fontfile, size=size)
+        except Exception:
+            font = None
+
+        _legend_fonts[size] = font
+
+    return _legend_fonts[size]
+
+
+def _load_frame(plot: str, legend: str, size) -> bytes:
+    """Load the image in the file 'plot', resize it to 'size' (if
+       needed), write 'legend' on it, and return the result encoded
+       as a single-frame gif. This is a module-level function so that
+       it can be run in a separate process
+    """
+    import io
+
+    (Image, ImageDraw, _) = import_animate_modules()
+
+    with Image.open(plot) as image:
+        image = image.convert("RGB")
+
+    if size is not None and image.size != tuple(size):
+        image = image.resize(tuple(size))
+
+    if legend:
+        try:
+            font = _get_legend_font()
+
+            if font is not None:
+                draw = ImageDraw.Draw(image)
+                draw.text((0, 0), legend, (0, 0, 0), font=font)
+        except Exception:
+            # couldn't tag it - don't break the animation
+            pass
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="GIF")
+
+    return buffer.getvalue()
+
+
+def _skip_sub_blocks(data: bytes, i: int) -> int:
+    """Return the index just after the gif data sub-blocks that
+       start at data[i]
+    """
+    while data[i] != 0:
+        i += data[i] + 1
+
+    return i + 1
+
+
+def _get_gif_frame(data: bytes, delay: int) -> bytes:
+    """Return the first image of the passed gif (as written by
+       _load_frame) converted into a frame of an animated gif, i.e.
+       a graphic control extension (holding the delay), followed by
+       the image descriptor with its own (local) color table and the
+       image data
+    """
+    import struct
+
+    if data[0:3] != b"GIF":
+        raise ValueError("Cannot read the frame as it is not a gif")
+
+    flags = data[10]
+
+    if flags & 0x80:
+        table = data[13:13 + 3 * (2 << (flags & 0x07))]
+    else:
+        table = b""
+
+    i = 13 + len(table)
+
+    while data[i] == 0x21:
+        # skip the extensions (e.g. comments)
+        i = _skip_sub_blocks(data, i + 2)
+
+    if data[i] != 0x2C:
+        raise ValueError("Cannot find the image in the frame")
+
+    descriptor = data[i:i + 10]
+    image_flags = descriptor[9]
+    i += 10
+
+    if image_flags & 0x80:
+        # this image already has its own color table
+        size = 3 * (2 << (image_flags & 0x07))
+        table = data[i:i + size]
+        i += size
+    elif len(table) > 0:
+        image_flags = (image_flags & 0x40) | 0x80 | (flags & 0x07)
+
+    start = i
+    end = _skip_sub_blocks(data, i + 1)
+
+    delay = int(delay / 10)
+
+    return (b"!\xf9\x04\x00" + struct.pack("<H", delay) + b"\x00\x00" +
+            descriptor[0:9] + bytes([image_flags]) + table +
+            data[start:end])
+
+
+def _write_gif(frames, output: str, delay: int, verbose: bool):
+    """Write the passed iterable of frames (single-frame gifs, as
+       created by _load_frame) to 'output' as an animated gif that
+       loops forever, with 'delay' milliseconds between frames. Each
+       frame is written as soon as it is available, so only one frame
+       needs to be held in memory at a time
+    """
+    with open(output, "wb") as FILE:
+        for i, frame in enumerate(frames):
+            if i == 0:
+                # the size of the animation is the size of the
+                # first frame. There is no global color table as
+                # each frame has its own
+                FILE.write(b"GIF89a" + frame[6:10] + b"\x00\x00\x00")
+                FILE.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+            if verbose:
+                print(f"Writing frame {i+1}")
+
+            FILE.write(_get_gif_frame(frame, delay))
+
+        FILE.write(b";")
+
+
+def _load_frames(plots: _List[str], legends, size, nprocs: int):
+    """Generator that yields the frames for 'plots', in order,
+       loading them in parallel over 'nprocs' processes. Only a
+       small number of frames are loaded ahead of the one being
+       written, so that memory use is bounded
+    """
+    if nprocs is None or nprocs < 2 or len(plots) < 2:
+        for plot in plots:
+            yield _load_frame(plot, legends[plot], size)
+
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=nprocs) as pool:
+        futures = deque()
+
+        for plot in plots:
+            futures.append(pool.submit(_load_frame, plot,
+                                       legends[plot], size))
+
+            if len(futures) >= 2 * nprocs:
+                yield futures.popleft().result()
+
+        while len(futures) > 0:
+            yield futures.popleft().result()
+
+
+def animate_plots(plots: _List[str], output: str,
+                  delay: int = 500,
+                  ordering: str = "fingerprint",
+                  nprocs: int = 1,
+                  verbose=False):
+    """Animate the plots contained in the filenames 'plots', writing
+       the output to 'output'. Creates an animated gif of the plots
+       and writes them to the file 'output'
+
+       Parameters
+       ----------
+       plots: List[str]
+         The list of files containing graphs to plot
+       output: str
+         The name of the file to write the animated gif to
+       delay: int
+         The delay in milliseconds between frames. Default is
+         500 milliseconds (2 frames per second) which is reasonable
+         for animated graphs
+       ordering: str
+         The ordering to use for the frames. This can be
+         'fingerprint', 'filename' or 'custom'
+       nprocs: int
+         The number of processes to use to load (and resize) the
+         frames in parallel. The frames are written to the gif as
+         they are loaded, so only a few are held in memory at once.
+         All frames are resized to the size of the first frame.
+       verbose: bool
+         Whether to print out information to the screen during
+         processing
+    """
+
+    if ordering == "fingerprint":
+        from .._variableset import VariableSet
+
+        if verbose:
+            print("Arranging into fingerprint order...")
+
+        fingerprints = {}
+        filenames = []
+
+        legends = {}
+
+        for plot in plots:
+            try:
+                (values, repeat_idx) = VariableSet.extract_values(plot)
+            except Exception as e:
+                raise ValueError(
+                    f"Could not extract a fingerprint from '{plot}'. "
+                    f"Error was {e.__class__} {e}")
+
+            if len(values) == 0 and repeat_idx is None:
+                # no fingerprint - write these first in filename order
+                filenames.append(plot)
+                legends[plot] = None
+                continue
+
+            if repeat_idx:
+                legends[plot] = f"{values} x {repeat_idx}"
+                values.append(repeat_idx)
+            else:
+                legends[plot] = str(values)
+                values.append(0)
+
+            # now create a sortable string from these values
+            key = " ".join([("%.5f" % x) for x in values])
+            fingerprints[key] = plot
+
+        keys = list(fingerprints.keys())
+        keys.sort()
+
+        plots = []
+        for key in keys:
+            plots.append(fingerprints[key])
+
+        filenames.sort()
+
+        plots = plots + filenames
+
+    elif ordering == "filename":
+        if verbose:
+            print("Arranging into filename order...")
+
+        plots.sort()
+
+        legends = {}
+
+        for plot in plots:
+            legends[plot] = plot
+
+    elif ordering == "custom":
+        if verbose:
+            print("Using the user-supplied order...")
+
+        legends = {}
+
+        for plot in plots:
+            legends[plot] = plot
+
+    else:
+        print(f"Could not recognise ordering scheme {ordering}")
+        raise ValueError(f"Unrecognised ordering scheme {ordering}")
+
+    if output is None:
+        import os
+        common = os.path.commonprefix(plots)
+        if not (common.endswith("_")):
+            common += "_"
+
+        output = f"{common}animate.gif"
+
+    if verbose:
+        print(f"Animating the below frame in this order, with a delay "
+              f"between frames of {delay} ms.")
+
+        for i, plot in enumerate(plots):
+            print(f"{i+1}: {plot}")
+
+        print(f"Output will be written to {output}")
+
+    (Image, _, _) = import_animate_modules()
+
+    with Image.open(plots[0]) as image:
+        size = image.size
+
+    _write_gif(_load_frames(plots, legends, size, nprocs=nprocs),
+               output=output, delay=delay, verbose=verbose)
+
+    # now try to optimize the gif
+    try:
+        from pygifsicle import optimize
+        have_optimize = True
+    except Exception:
+        have_optimize = False
+
+    if have_optimize:
+        if verbose:
+            print("Optimizing the resulting gif...")
+
+        try:
+            optimize(output)
+        except Exception:
+            if verbose:
+                print("Optimisation failed - using unoptimized gif")
+
+    return output
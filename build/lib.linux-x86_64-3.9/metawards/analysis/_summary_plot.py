@@ -0,0 +1,848 @@
+
+__all__ = ["import_graphics_modules",
+           "save_summary_plots",
+           "create_overview_plot",
+           "create_average_plot",
+           "create_demographics_plot"]
+
+
+def import_graphics_modules(verbose=False):
+    """Imports pandas and matplotlib in a safe way, giving a good
+       error message if something goes wrong.
+
+       Parameters
+       ----------
+       verbose: bool
+         Whether or not to print to the screen to signal progress...
+
+       Returns
+       -------
+       (pd, plt)
+          The pandas (pd) and matplotlib.pyplot (plt) modules
+    """
+    try:
+        if verbose:
+            print("Importing graphics modules...")
+        import pandas as pd
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("You must have pandas and matplotlib installed to run "
+              "metawards-plot")
+        print("Install using either `pip install pandas` if you are using")
+        print("pip, or 'conda install pandas' if you are using conda, ")
+        print("or by running 'metawards-install --optional")
+        raise ImportError("Cannot produce the plot as pandas and matplotlib "
+                          "are not installed.")
+
+    return (pd, plt)
+
+
+def create_overview_plot(df, output_dir: str = None,
+                         format: str = "jpg", dpi: int = 150,
+                         align_axes: bool = True, verbose: bool = True):
+    """Create a summary plot of the result.csv data held in the
+       passed pandas dataframe. This returns the figure for you
+       to save if desired (or just call ``plt.show()`` to show
+       it in Jupyter)
+
+       If the dataframe contains multiple fingerprints, then this
+       will return a dictionary of figures, one for each fingerprint,
+       indexed by fingerprint
+
+       Parameters
+       ----------
+       df : Pandas Dataframe
+         The pandas dataframe containing the data from results.csv.bz2
+       output_dir: str
+         The name of the directory in which to draw the graphs. If this
+         is set then the graphs are written to files as they are generated
+         and the filenames of the figures are returned. This is necessary
+         when the number of graphs to draw is high and you don't want
+         to waste too much memory
+       format: str
+         Format to save the figures in if output_dir is supplied
+       dpi: int
+         dpi (dots per inch) resolution to save the figures with if
+         a bitmap format is used and output_dir is supplied
+       align_axes: bool
+         If true (default) then this will ensure that all of the plots
+         for different fingerprints are put on the same axis scale
+       verbose: bool
+         Whether or not to print progress to the screen
+
+       Returns
+       -------
+       fig
+         The matplotlib figure containing the summary plot, or a
+         dictionary of figures if there are multiple fingerprints,
+         or the filename if output_dir was supplied, or a dictionary
+         of multiple filenames indexed by fingerprint
+    """
+    _, plt = import_graphics_modules()
+
+    try:
+        fingerprints = df["fingerprint"].unique()
+        repeat = "repeat"
+    except Exception:
+        # no fingerprints
+        fingerprints = [None]
+        repeat = "demographic"
+
+    try:
+        import PIL        # noqa - disable unused warning
+    except ImportError:
+        if format == "jpg":
+            print(
+                "WARNING: Missing 'pillow' package, defaulting to PNG format.")
+            format = "png"
+
+    figs = {}
+
+    min_date = None
+    max_date = None
+    max_y = {}
+    min_y = {}
+
+    columns = ["E", "I", "IW", "R"]
+
+    nfigs = len(fingerprints)
+
+    if len(fingerprints) > 1 and align_axes:
+        for fingerprint in fingerprints:
+            df2 = df[df["fingerprint"] == fingerprint]
+
+            for column in columns:
+                min_d = df2["day"].min()
+                max_d = df2["day"].max()
+                min_val = df2[column].min()
+                max_val = df2[column].max()
+
+                if min_date is None:
+                    min_date = min_d
+                    max_date = max_d
+                else:
+                    if min_d < min_date:
+                        min_date = min_d
+                    if max_d > max_date:
+                        max_date = max_d
+
+                if column not in min_y:
+                    min_y[column] = min_val
+                    max_y[column] = max_val
+                else:
+                    if min_val < min_y[column]:
+                        min_y[column] = min_val
+                    if max_val > max_y[column]:
+                        max_y[column] = max_val
+
+    if len(fingerprints) > 1 and align_axes:
+        limits = (min_date, max_date, min_y, max_y)
+    else:
+        limits = None
+
+    for fingerprint in fingerprints:
+        if fingerprint is None:
+            df2 = df
+        else:
+            df2 = df[df["fingerprint"] == fingerprint]
+
+        fig = _draw_overview_plot(plt, df2, fingerprint=fingerprint,
+                                  repeat=repeat, columns=columns,
+                                  limits=limits, nfigs=nfigs)
+
+        if output_dir:
+            figs[fingerprint] = _save_figure(plt, fig, output_dir=output_dir,
+                                             name="overview",
+                                             fingerprint=fingerprint,
+                                             nfigs=nfigs, format=format,
+                                             dpi=dpi, verbose=verbose)
+        else:
+            if verbose:
+                print(f"Created the figure for {fingerprint}")
+
+            figs[fingerprint] = fig
+
+    if len(figs) == 0:
+        return None
+    elif len(figs) == 1:
+        return figs[list(figs.keys())[0]]
+    else:
+        return figs
+
+
+def _draw_overview_plot(plt, df, fingerprint, repeat: str, columns,
+                        limits, nfigs: int, x: str = "date"):
+    """Draw and return the overview figure of the passed dataframe,
+       which contains the data for a single fingerprint. 'limits'
+       are the (min_x, max_x, min_y, max_y) used to align the axes,
+       or None if the axes are not aligned
+    """
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
+
+    i = 0
+    j = 0
+
+    for column in columns:
+        ax = df.pivot(index=x, columns=repeat,
+                      values=column).plot.line(ax=axes[i][j])
+        ax.tick_params('x', labelrotation=90)
+        ax.get_legend().remove()
+        ax.set_ylabel("Population")
+
+        if limits is not None:
+            (min_x, max_x, min_y, max_y) = limits
+            ax.set_xlim(min_x, max_x)
+            ax.set_ylim(min_y[column], 1.1*max_y[column])
+
+        if nfigs > 1:
+            from metawards import VariableSet
+            fvals, _rpt = VariableSet.extract_values(fingerprint)
+            ax.set_title(f"{fvals} : {column}")
+        else:
+            ax.set_title(column)
+
+        j += 1
+        if j == 2:
+            j = 0
+            i += 1
+
+    fig.tight_layout(pad=1)
+
+    return fig
+
+
+def _save_figure(plt, fig, output_dir: str, name: str, fingerprint,
+                 nfigs: int, format: str, dpi: int, verbose: bool) -> str:
+    """Save the passed figure into 'output_dir' as name.format (or
+       name_fingerprint.format if there are multiple figures),
+       closing the figure and returning the filename
+    """
+    import os
+
+    if nfigs == 1:
+        filename = os.path.join(output_dir, f"{name}.{format}")
+    else:
+        filename = os.path.join(output_dir,
+                                f"{name}_{fingerprint}.{format}")
+
+    if verbose:
+        print(f"Saving figure {filename}")
+
+    fig.savefig(filename, dpi=dpi)
+    plt.close(fig)
+
+    return filename
+
+
+def create_average_plot(df, output_dir: str = None, format: str = "jpg",
+                        dpi: int = 150, align_axes: bool = True,
+                        verbose: bool = True):
+    """Create an average plot of the result.csv data held in the
+       passed pandas dataframe. This returns the figure for you
+       to save if desired (or just call ``plt.show()`` to show
+       it in Jupyter)
+
+       Note that this won't do anything unless there are multiple
+       repeats of the model run in the output. In that case, it
+       will return None
+
+       If the dataframe contains multiple fingerprints, then this
+       will return a dictionary of figures, one for each fingerprint,
+       indexed by fingerprint
+
+       Parameters
+       ----------
+       df : Pandas Dataframe
+         The pandas dataframe containing the data from results.csv.bz2
+       output_dir: str
+         The name of the directory in which to draw the graphs. If this
+         is set then the graphs are written to files as they are generated
+         and the filenames of the figures are returned. This is necessary
+         when the number of graphs to draw is high and you don't want
+         to waste too much memory
+       format: str
+         Format to save the figures in if output_dir is supplied
+       dpi: int
+         dpi (dots per inch) resolution to save the figures with if
+         a bitmap format is used and output_dir is supplied
+       align_axes: bool
+         If true (default) then this will ensure that all of the plots
+         for different fingerprints are put on the same axis scale
+       verbose: bool
+         Whether or not to print progress to the screen
+
+       Returns
+       -------
+       fig
+         The matplotlib figure containing the average plot, or a
+         dictionary of figures if there are multiple fingerprints,
+         or the filename if output_dir was supplied, or a dictionary
+         of multiple filenames indexed by fingerprint
+    """
+    try:
+        import PIL        # noqa - disable unused warning
+    except ImportError:
+        if format == "jpg":
+            print(
+                "WARNING: Missing 'pillow' package, defaulting to PNG format.")
+            format = "png"
+
+    fingerprints = df["fingerprint"].unique()
+
+    figs = {}
+
+    nfigs = len(fingerprints)
+
+    for fingerprint in fingerprints:
+        df2 = df[df["fingerprint"] == fingerprint]
+
+        nrepeats = len(df2["repeat"].unique())
+
+        if nrepeats > 1:
+            _, plt = import_graphics_modules()
+
+            mean_average = df2.groupby("date").mean(numeric_only=True)
+            stddev = df2.groupby("date").std(numeric_only=True)
+
+            fig = _draw_average_plot(plt, mean_average, stddev)
+
+            if output_dir:
+                figs[fingerprint] = _save_figure(plt, fig,
+                                                 output_dir=output_dir,
+                                                 name="average",
+                                                 fingerprint=fingerprint,
+                                                 nfigs=nfigs, format=format,
+                                                 dpi=dpi, verbose=verbose)
+            else:
+                if verbose:
+                    print(f"Created the figure for {fingerprint}")
+
+                figs[fingerprint] = fig
+
+    if len(figs) == 0:
+        return None
+    elif len(figs) == 1:
+        return figs[list(figs.keys())[0]]
+    else:
+        return figs
+
+
+def _draw_average_plot(plt, mean_average, stddev,
+                       columns=["E", "I", "IW", "R"]):
+    """Draw and return the average figure from the passed per-day
+       mean and standard deviation dataframes
+    """
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
+
+    i = 0
+    j = 0
+
+    for column in columns:
+        ax = mean_average.plot.line(y=column, yerr=stddev[column],
+                                    ax=axes[i][j])
+        ax.tick_params('x', labelrotation=90)
+        ax.get_legend().remove()
+        ax.set_title(column)
+        ax.set_ylabel("Population")
+
+        j += 1
+        if j == 2:
+            j = 0
+            i += 1
+
+    fig.tight_layout(pad=1)
+
+    return fig
+
+
+def get_color(name=None, idx=None):
+    """Return a good color for the passed name or passed index (idx)"""
+    name = str(name).strip().lower()
+
+    if name == "overall":
+        return "black"
+
+    elif name in ["red", "blue", "green", "orange", "yellow", "black",
+                  "white", "gray", "pink"]:
+        return name
+
+    else:
+        names = ["red", "blue", "green", "orange", "pink", "gray"]
+
+        if idx is None or idx < 0 or idx >= len(names):
+            # return a random colour
+            import random
+            rgb = (random.random(), random.random(), random.random())
+            return rgb
+        else:
+            return names[int(idx)]
+
+
+def create_demographics_plot(df, output_dir: str = None,
+                             format: str = "jpg", dpi: int = 150,
+                             verbose: bool = True):
+    """Create a demographics plot of the trajectory.csv data held in the
+       passed pandas dataframe. This returns the figure for you
+       to save if desired (or just call ``plt.show()`` to show
+       it in Jupyter)
+
+       Parameters
+       ----------
+       df : Pandas Dataframe
+         The pandas dataframe containing the data from trajectory.csv.bz2
+       output_dir: str
+         The name of the directory in which to draw the graphs. If this
+         is set then the graphs are written to files as they are generated
+         and the filenames of the figures are returned. This is necessary
+         when the number of graphs to draw is high and you don't want
+         to waste too much memory
+       format: str
+         Format to save the figures in if output_dir is supplied
+       dpi: int
+         dpi (dots per inch) resolution to save the figures with if
+         a bitmap format is used and output_dir is supplied
+       align_axes: bool
+         If true (default) then this will ensure that all of the plots
+         for different fingerprints are put on the same axis scale
+       verbose: bool
+         Whether or not to print progress to the screen
+
+       Returns
+       -------
+       fig
+         The matplotlib figure containing the demographics plot, or
+         the filename if output_dir was supplied
+    """
+    try:
+        import PIL        # noqa - disable unused warning
+    except ImportError:
+        if format == "jpg":
+            print(
+                "WARNING: Missing 'pillow' package, defaulting to PNG format.")
+            format = "png"
+
+    _, plt = import_graphics_modules()
+
+    columns = ["E", "I", "IW", "R"]
+
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
+
+    # see if any of these give colour names
+    colors = []
+
+    demographics = df.pivot(index="date", columns="demographic",
+                            values="day").columns
+
+    for i, demographic in enumerate(demographics):
+        colors.append(get_color(demographic, i))
+
+    i = 0
+    j = 0
+
+    for column in columns:
+        ax = df.pivot(index="date", columns="demographic",
+                      values=column).plot.line(ax=axes[i][j],
+                                               color=colors)
+        ax.tick_params('x', labelrotation=90)
+        ax.set_ylabel("Population")
+        ax.set_title(column)
+
+        j += 1
+        if j == 2:
+            j = 0
+            i += 1
+
+    fig.tight_layout(pad=1)
+
+    if output_dir:
+        import os
+
+        filename = os.path.join(output_dir, f"demographics.{format}")
+
+        if verbose:
+            print(f"Saving figure {filename}")
+
+        fig.savefig(filename, dpi=dpi)
+        plt.close()
+        fig = filename
+
+    return fig
+
+
+def _combine_moments(pd, moments, chunk_moments):
+    """Combine the running per-group (count, mean, M2) moments with
+       those from the next chunk, using the parallel algorithm of
+       Chan et al. This gives the same mean and standard deviation
+       as if all of the data was grouped at once
+    """
+    if moments is None:
+        return chunk_moments
+
+    (n_a, mean_a, m2_a) = moments
+    (n_b, mean_b, m2_b) = chunk_moments
+
+    index = n_a.index.union(n_b.index)
+
+    n_a = n_a.reindex(index, fill_value=0)
+    n_b = n_b.reindex(index, fill_value=0)
+    mean_a = mean_a.reindex(index, fill_value=0.0)
+    mean_b = mean_b.reindex(index, fill_value=0.0)
+    m2_a = m2_a.reindex(index, fill_value=0.0)
+    m2_b = m2_b.reindex(index, fill_value=0.0)
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+
+    return (n, mean, m2)
+
+
+def _stream_results(pd, results: str, x: str, columns, scratch_dir: str,
+                    nbuckets: int, chunksize: int):
+    """Read the passed results file in chunks of 'chunksize' rows,
+       holding at most one chunk in memory. This returns the
+       statistics needed for the plots, i.e.
+
+       fingerprints: the fingerprints in the order they appear
+       nrepeats: the number of repeats of each fingerprint
+       limits: the minimum and maximum of 'day' and each column
+       moments: the (count, mean, M2) of each column for each
+                (fingerprint, x)
+       buckets: the filenames of the files in 'scratch_dir' to which
+                the (fingerprint, repeat, x, columns) data has been
+                written. The data for each fingerprint is all
+                in the same bucket, so the data for each fingerprint
+                can be loaded without loading the whole file.
+    """
+    import os
+    import pickle
+
+    usecols = ["fingerprint", "repeat", "day", x] + columns
+    usecols = list(dict.fromkeys(usecols))
+
+    fingerprints = {}
+    repeats = {}
+    min_vals = {}
+    max_vals = {}
+    moments = None
+
+    buckets = [os.path.join(scratch_dir, f"bucket_{i}.pkl")
+               for i in range(0, nbuckets)]
+    files = [open(bucket, "wb") for bucket in buckets]
+
+    try:
+        for chunk in pd.read_csv(results, usecols=usecols,
+                                 chunksize=chunksize):
+            for fingerprint in chunk["fingerprint"].unique():
+                fingerprints.setdefault(fingerprint, len(fingerprints))
+
+            for fingerprint, values in \
+                    chunk.groupby("fingerprint")["repeat"].unique().items():
+                repeats.setdefault(fingerprint, set()).update(values)
+
+            for column in ["day"] + columns:
+                lo = chunk[column].min()
+                hi = chunk[column].max()
+
+                if column not in min_vals or lo < min_vals[column]:
+                    min_vals[column] = lo
+
+                if column not in max_vals or hi > max_vals[column]:
+                    max_vals[column] = hi
+
+            grouped = chunk.groupby(["fingerprint", x])[columns]
+            n = grouped.count()
+            moments = _combine_moments(
+                pd, moments, (n, grouped.mean(), grouped.var(ddof=0) * n))
+
+            data = chunk[["fingerprint", "repeat", x] + columns]
+
+            if nbuckets == 1:
+                pickle.dump(data, files[0])
+            else:
+                bucket = pd.util.hash_pandas_object(
+                    chunk["fingerprint"], index=False) % nbuckets
+
+                for i, part in data.groupby(bucket.values):
+                    pickle.dump(part, files[i])
+    finally:
+        for f in files:
+            f.close()
+
+    nrepeats = {fingerprint: len(values)
+                for fingerprint, values in repeats.items()}
+
+    return (list(fingerprints.keys()), nrepeats, (min_vals, max_vals),
+            moments, buckets)
+
+
+def _read_bucket(pd, filename: str):
+    """Read and return all of the data written to the passed bucket"""
+    import pickle
+
+    parts = []
+
+    with open(filename, "rb") as f:
+        while True:
+            try:
+                parts.append(pickle.load(f))
+            except EOFError:
+                break
+
+    if len(parts) == 0:
+        return None
+    else:
+        return pd.concat(parts)
+
+
+def _save_overview_plot(df, fingerprint, x: str, limits, nfigs: int,
+                        output_dir: str, format: str, dpi: int,
+                        verbose: bool) -> str:
+    """Draw and save the overview plot for a single fingerprint. This
+       is a module-level function so that it can be run in a separate
+       process
+    """
+    _, plt = import_graphics_modules()
+
+    fig = _draw_overview_plot(plt, df, fingerprint=fingerprint,
+                              repeat="repeat", columns=["E", "I", "IW", "R"],
+                              limits=limits, nfigs=nfigs, x=x)
+
+    return _save_figure(plt, fig, output_dir=output_dir, name="overview",
+                        fingerprint=fingerprint, nfigs=nfigs, format=format,
+                        dpi=dpi, verbose=verbose)
+
+
+def _save_average_plot(mean_average, stddev, fingerprint, nfigs: int,
+                       output_dir: str, format: str, dpi: int,
+                       verbose: bool) -> str:
+    """Draw and save the average plot for a single fingerprint. This
+       is a module-level function so that it can be run in a separate
+       process
+    """
+    _, plt = import_graphics_modules()
+
+    fig = _draw_average_plot(plt, mean_average, stddev)
+
+    return _save_figure(plt, fig, output_dir=output_dir, name="average",
+                        fingerprint=fingerprint, nfigs=nfigs, format=format,
+                        dpi=dpi, verbose=verbose)
+
+
+def _save_streamed_plots(pd, results: str, output_dir: str, format: str,
+                         dpi: int, align_axes: bool, nprocs: int,
+                         chunksize: int, nbuckets: int, verbose: bool):
+    """Create the overview and average plots of the passed results
+       file without loading the whole file into memory. The file is
+       streamed once to calculate the per-day means and standard
+       deviations (for the average plots) and the axis limits, while
+       the data needed for the overview plots is written to
+       'nbuckets' scratch files. Each bucket is then loaded in turn,
+       and the figures for its fingerprints are drawn (in parallel
+       over 'nprocs' processes)
+    """
+    import tempfile
+
+    x = "date" if "date" in pd.read_csv(results, nrows=0).columns \
+        else "day"
+
+    columns = ["E", "I", "IW", "R"]
+
+    with tempfile.TemporaryDirectory(prefix="metawards_plot_") as scratch:
+        if verbose:
+            print(f"Reading data from {results}...")
+
+        (fingerprints, nrepeats, (min_vals, max_vals),
+         moments, buckets) = _stream_results(pd, results, x=x,
+                                             columns=columns,
+                                             scratch_dir=scratch,
+                                             nbuckets=nbuckets,
+                                             chunksize=chunksize)
+
+        nfigs = len(fingerprints)
+
+        if nfigs > 1 and align_axes:
+            limits = (min_vals["day"], max_vals["day"], min_vals, max_vals)
+        else:
+            limits = None
+
+        from collections import deque
+
+        if nprocs is not None and nprocs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=nprocs)
+        else:
+            pool = None
+
+        # the (figures, fingerprint, future) of the figures that are
+        # being drawn. This is limited to a few more than the number
+        # of processes so that the data for all of the figures is
+        # never held in memory at once
+        running = deque()
+        max_running = 2 * nprocs if pool is not None else 0
+
+        def drain(limit: int = 0):
+            while len(running) > limit:
+                (figs, fingerprint, future) = running.popleft()
+                figs[fingerprint] = future.result()
+
+        def submit(figs, fingerprint, func, *args, **kwargs):
+            if pool is None:
+                figs[fingerprint] = func(*args, fingerprint=fingerprint,
+                                         **kwargs)
+            else:
+                drain(max_running - 1)
+                running.append((figs, fingerprint,
+                                pool.submit(func, *args,
+                                            fingerprint=fingerprint,
+                                            **kwargs)))
+
+        try:
+            overviews = {}
+
+            if verbose:
+                print(f"Creating overview plot(s)...")
+
+            for bucket in buckets:
+                df = _read_bucket(pd, bucket)
+
+                if df is None:
+                    continue
+
+                for fingerprint, df2 in df.groupby("fingerprint", sort=False):
+                    submit(overviews, fingerprint, _save_overview_plot, df2,
+                           x=x, limits=limits, nfigs=nfigs,
+                           output_dir=output_dir, format=format, dpi=dpi,
+                           verbose=verbose)
+
+                # finish this bucket before the next is loaded
+                drain()
+                df = None
+
+            if verbose:
+                print(f"Creating average plot(s)...")
+
+            averages = {}
+            (n, mean, m2) = moments
+            stddev = (m2 / (n - 1)) ** 0.5
+
+            for fingerprint in fingerprints:
+                if nrepeats[fingerprint] > 1:
+                    submit(averages, fingerprint, _save_average_plot,
+                           mean.loc[fingerprint], stddev.loc[fingerprint],
+                           nfigs=nfigs, output_dir=output_dir,
+                           format=format, dpi=dpi, verbose=verbose)
+
+            drain()
+
+            filenames = [overviews[f] for f in fingerprints
+                         if f in overviews]
+            filenames += [averages[f] for f in fingerprints
+                          if f in averages]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    return filenames
+
+
+def save_summary_plots(results: str, output_dir: str = None,
+                       format: str = "jpg", dpi: int = 150,
+                       align_axes: bool = True,
+                       nprocs: int = 1,
+                       chunksize: int = 1000000,
+                       nbuckets: int = 16,
+                       verbose=False):
+    """Create summary plots of the data contained in the passed
+       'results.csv.bz2' file that was produced by metawards
+       and save them to disk.
+
+       Parameters
+       ----------
+       results: str
+         The full path to the file containing the results. This
+         **must** have been created by ``metawards``
+       output_dir: str
+         Path to the directory in which you want to place the graphs.
+         This defaults to the same directory that contains 'results'
+       format: str
+         The format to use to save the graphs. This defaults to 'pdf'
+       dpi: int
+         The dots-per-inch to use when saving bitmap graphics (e.g.
+         png, jpg etc)
+       align_axes: bool
+         Whether or not to plot all graphs in a set on the same axes
+       nprocs: int
+         The number of processes to use to draw the graphs for
+         different fingerprints in parallel
+       chunksize: int
+         The number of rows of 'results' to read at a time. The
+         results of multiple model runs are never loaded into memory
+         all at once. Instead the file is streamed in chunks, and
+         the per-day means and standard deviations are calculated
+         as they are read
+       nbuckets: int
+         The number of scratch files (buckets) into which the data
+         for the overview plots is split while it is streamed. Only
+         one bucket is loaded at a time, so the memory needed is
+         roughly the size of 'results' divided by 'nbuckets'
+       verbose: bool
+         Whether or not to print progress to the screen
+
+       Returns
+       -------
+       filenames: List(str)
+         Full file paths of all of the files written by this function
+    """
+    try:
+        import PIL        # noqa - disable unused warning
+    except ImportError:
+        if format == "jpg":
+            print(
+                "WARNING: Missing 'pillow' package, defaulting to PNG format.")
+            format = "png"
+
+    pd, _ = import_graphics_modules(verbose=verbose)
+    import os
+
+    if output_dir is None:
+        output_dir = os.path.dirname(results)
+
+        if output_dir is None or len(output_dir) == 0:
+            output_dir = "."
+
+    if format is None:
+        format = "pdf"
+
+    filenames = []
+
+    # is this an output from multiple runs?
+    header = pd.read_csv(results, nrows=0).columns
+    has_fingerprint = "fingerprint" in header
+
+    # does this have demographic data?
+    has_demographics = "demographic" in header
+
+    if has_fingerprint:
+        filenames += _save_streamed_plots(pd, results, output_dir=output_dir,
+                                          format=format, dpi=dpi,
+                                          align_axes=align_axes,
+                                          nprocs=nprocs, chunksize=chunksize,
+                                          nbuckets=nbuckets, verbose=verbose)
+
+    if has_demographics:
+        # this is the trajectory.csv of a single model run, so is small
+        if verbose:
+            print(f"Reading data from {results}...")
+
+        df = pd.read_csv(results)
+
+        fig = create_demographics_plot(df, output_dir=output_dir,
+                                       format=format, dpi=dpi)
+
+        if fig is not None:
+            filenames.append(fig)
+
+    return filenames
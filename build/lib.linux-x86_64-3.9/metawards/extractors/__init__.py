@@ -0,0 +1,50 @@
+"""
+.. currentmodule:: metawards.extractors
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    build_sampled_extractor
+
+    extract_custom
+    extract_default
+    extract_large
+    extract_none
+    extract_small
+    extract_wards_db
+
+    output_basic
+    output_core
+    output_core_omp
+    output_core_serial
+    output_incidence
+    output_dispersal
+    output_prevalence
+    output_trajectory
+    output_wards_trajectory
+    output_wards_db
+
+    finalise_wards_db
+
+    setup_core
+"""
+
+from ._extract_default import *
+from ._extract_custom import *
+from ._extract_large import *
+from ._extract_none import *
+from ._extract_sampled import *
+from ._extract_small import *
+from ._extract_wards_db import *
+
+from ._output_basic import *
+from ._output_core import *
+from ._output_dispersal import *
+from ._output_incidence import *
+from ._output_prevalence import *
+from ._output_trajectory import *
+from ._output_wards_trajectory import *
+from ._output_wards_db import *
@@ -0,0 +1,19 @@
+
+__all__ = ["extract_large"]
+
+
+def extract_large(**kwargs):
+    """This extractor extracts the default files, plus the
+       "large" files, e.g. S, E, I and R for each ward.
+    """
+
+    from ._output_wards_trajectory import output_wards_trajectory
+    from ._extract_default import extract_default
+
+    return extract_default(**kwargs) + [output_wards_trajectory]
+
+
+extract_large.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                 "new_inf_moments", "incidence",
+                                 "total_inf_ward", "S_in_wards", "E_in_wards",
+                                 "I_in_wards", "R_in_wards", "X_in_wards"]
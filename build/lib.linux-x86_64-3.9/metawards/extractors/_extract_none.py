@@ -0,0 +1,12 @@
+
+__all__ = ["extract_none"]
+
+
+def extract_none(**kwargs):
+    """This extractor extracts nothing - meaning that no output
+       will be written
+    """
+    return []
+
+
+extract_none.workspace_needs = []
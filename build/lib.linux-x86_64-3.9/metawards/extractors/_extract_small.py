@@ -0,0 +1,18 @@
+
+__all__ = ["extract_small"]
+
+
+def extract_small(**kwargs):
+    """This extractor only extracts the 'small' default files,
+       e.g. nothing that involves the incidence or prevalence
+       matrices
+    """
+
+    from ._output_basic import output_basic
+    from ._output_dispersal import output_dispersal
+
+    return [output_basic, output_dispersal]
+
+
+extract_small.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                 "new_inf_moments"]
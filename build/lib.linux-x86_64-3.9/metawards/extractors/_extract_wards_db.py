@@ -0,0 +1,34 @@
+
+__all__ = ["extract_wards_db"]
+
+
+def extract_wards_db(stage: str, **kwargs):
+    """This extractor extracts the default files, plus the
+       S, E, I and R populations of each ward on each day,
+       which are written to the SQLite3 database
+       "wards_trajectory.db" (see
+       :meth:`~metawards.extractors.output_wards_db`). This
+       holds the same data as :meth:`extract_large`, but is
+       indexed by (ward, day), so can be queried directly with
+       SQL. It takes roughly the same time to write, but is
+       larger on disk.
+    """
+    from ._extract_default import extract_default
+
+    funcs = extract_default(stage=stage, **kwargs)
+
+    if stage == "analyse":
+        from ._output_wards_db import output_wards_db
+        funcs.append(output_wards_db)
+    elif stage == "finalise":
+        from ._output_wards_db import finalise_wards_db
+        funcs.append(finalise_wards_db)
+
+    return funcs
+
+
+extract_wards_db.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                    "new_inf_moments", "incidence",
+                                    "total_inf_ward", "S_in_wards",
+                                    "E_in_wards", "I_in_wards", "R_in_wards",
+                                    "X_in_wards"]
@@ -0,0 +1,68 @@
+
+from .._outputfiles import OutputFiles
+
+__all__ = ["output_final_report"]
+
+
+def output_final_report(output_dir: OutputFiles,
+                        results, **kwargs) -> None:
+    """Call in the "finalise" stage to output the final
+       report of the population trajectory to
+       'results.csv'
+    """
+
+    RESULTS = output_dir.open("results.csv")
+
+    from ..utils._console import Console
+
+    Console.panel(f"""
+Writing a summary of all results into the csv file
+**{output_dir.get_filename('results.csv')}**. You can use this to quickly
+look at statistics across all runs using e.g. R or pandas""",
+                  markdown=True, style="alternate")
+
+    varnames = results[0][0].variable_names()
+
+    if varnames is None or len(varnames) == 0:
+        varnames = ""
+    else:
+        varnames = ",".join(varnames) + ","
+
+    has_date = results[0][1][0].date
+
+    if has_date:
+        datestring = "date,"
+    else:
+        datestring = ""
+
+    from ._trajectory_columns import get_extra_stages, \
+        get_trajectory_columns, write_columns
+
+    # get the first Population in the trajectory, as this will give
+    # us the list of extra disease stages to print out
+    extra_stages = get_extra_stages(results[0][-1][0])
+
+    if len(extra_stages) > 0:
+        extra_str = ",".join(extra_stages) + ","
+    else:
+        extra_str = ""
+
+    RESULTS.write(f"fingerprint,repeat,{varnames}"
+                  f"day,{datestring}S,E,I,{extra_str}R,IW,SCALE_UV\n")
+
+    for varset, trajectory in results:
+        varvals = varset.variable_values()
+        if varvals is None or len(varvals) == 0:
+            varvals = ""
+        else:
+            varvals = ",".join(map(str, varvals)) + ","
+
+        start = f"{varset.fingerprint()}," \
+                f"{varset.repeat_index()},{varvals}"
+
+        # write the whole trajectory a column at a time
+        columns = get_trajectory_columns(trajectory, extra_stages,
+                                         include_date=has_date,
+                                         include_scale_uv=True)
+
+        write_columns(RESULTS, columns, prefix=start)
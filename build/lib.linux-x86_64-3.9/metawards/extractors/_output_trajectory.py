@@ -0,0 +1,78 @@
+
+from typing import Union as _Union
+
+from .._network import Network
+from .._networks import Networks
+from .._population import Populations
+from .._outputfiles import OutputFiles
+
+__all__ = ["output_trajectory"]
+
+
+def output_trajectory(network: _Union[Network, Networks],
+                      output_dir: OutputFiles,
+                      trajectory: Populations,
+                      **kwargs) -> None:
+    """Call in the "finalise" stage to output the
+       population trajectory to the 'trajectory.csv' file
+    """
+
+    RESULTS = output_dir.open("trajectory.csv")
+
+    has_date = trajectory[0].date
+
+    if has_date:
+        datestring = "date,"
+    else:
+        datestring = ""
+
+    from ._trajectory_columns import get_extra_stages, \
+        get_trajectory_columns, format_columns
+
+    # get the first Population in the trajectory, as this will give
+    # us the list of extra disease stages to print out
+    extra_stages = get_extra_stages(trajectory[0])
+
+    if len(extra_stages) > 0:
+        extra_str = ",".join(extra_stages) + ","
+    else:
+        extra_str = ""
+
+    RESULTS.write(f"day,{datestring}demographic,S,E,I,{extra_str}R,IW\n")
+
+    groups = [("overall", trajectory)]
+
+    if isinstance(network, Networks):
+        for i, demographic in enumerate(network.demographics):
+            name = demographic.name
+
+            if name is None or len(name) == 0:
+                name = str(i)
+
+            if isinstance(trajectory, Populations):
+                groups.append((name, trajectory.subpops[i]))
+            else:
+                groups.append((name, [pop.subpops[i] for pop in trajectory]))
+
+    if has_date:
+        if isinstance(trajectory, Populations):
+            dates = trajectory.get_column("date")
+        else:
+            dates = [pop.date for pop in trajectory]
+
+        dates = [date.isoformat() for date in dates]
+
+    # format each group a column at a time, then interleave the lines
+    # so that the demographics for each day follow the overall line
+    lines = []
+
+    for name, pops in groups:
+        columns = get_trajectory_columns(pops, extra_stages)
+        columns.insert(1, [name] * len(pops))
+
+        if has_date:
+            columns.insert(1, dates)
+
+        lines.append(format_columns(columns))
+
+    RESULTS.write("".join(["".join(day_lines) for day_lines in zip(*lines)]))
@@ -0,0 +1,103 @@
+from typing import List as _List
+
+from .._population import Population
+
+__all__ = ["get_extra_stages", "get_trajectory_columns", "format_columns",
+           "write_columns"]
+
+
+def get_extra_stages(population: Population) -> _List[str]:
+    """Return the names of the extra (X) disease stages that are
+       recorded in the passed population, in the order in which
+       they should be written
+    """
+    totals = {} if population.totals is None else population.totals
+    other_totals = {} if population.other_totals is None \
+        else population.other_totals
+
+    return list(totals.keys()) + list(other_totals.keys())
+
+
+def get_trajectory_columns(trajectory, extra_stages: _List[str],
+                           include_date: bool = False,
+                           include_scale_uv: bool = False) -> _List[_List]:
+    """Return the passed trajectory (list of Population objects)
+       as a list of columns, i.e. [day, (date), S, E, I, (extra stages),
+       R, IW, (SCALE_UV)]. Values that are None are returned as 0.
+       This is used to write the trajectory a column at a time,
+       rather than a Population at a time
+    """
+    from .._population import Populations
+
+    def _ints(values):
+        return [0 if value is None else value for value in values]
+
+    if isinstance(trajectory, Populations):
+        # the values are already held in columns
+        def _get(field):
+            return trajectory.get_column(field)
+
+        def _get_extra(stage):
+            missing = object()
+            totals = trajectory.get_column("totals", stage, missing=missing)
+            others = trajectory.get_column("other_totals", stage, missing=0)
+            return [o if t is missing else t for t, o in zip(totals, others)]
+    else:
+        if not isinstance(trajectory, list):
+            trajectory = list(trajectory)
+
+        def _get(field):
+            return [getattr(p, field) for p in trajectory]
+
+        if len(extra_stages) > 0:
+            totals = [{} if p.totals is None else p.totals
+                      for p in trajectory]
+            others = [{} if p.other_totals is None else p.other_totals
+                      for p in trajectory]
+
+        def _get_extra(stage):
+            return [t[stage] if stage in t else o.get(stage, 0)
+                    for t, o in zip(totals, others)]
+
+    columns = [_get("day")]
+
+    if include_date:
+        columns.append([d.isoformat() for d in _get("date")])
+
+    columns.append(_ints(_get("susceptibles")))
+    columns.append(_ints(_get("latent")))
+    columns.append(_ints(_get("total")))
+
+    for stage in extra_stages:
+        columns.append(_get_extra(stage))
+
+    columns.append(_ints(_get("recovereds")))
+    columns.append(_ints(_get("n_inf_wards")))
+
+    if include_scale_uv:
+        columns.append(_ints(_get("scale_uv")))
+
+    return columns
+
+
+def format_columns(columns: _List[_List], prefix: str = "") -> _List[str]:
+    """Return the passed columns formatted as a list of comma-separated
+       lines, with each line starting with 'prefix'. The lines are
+       formatted using a single template for the whole table, which
+       is much faster than building each line separately
+    """
+    if len(columns) == 0:
+        return []
+
+    template = prefix.replace("%", "%%") + ",".join(["%s"] * len(columns)) \
+        + "\n"
+
+    return [template % row for row in zip(*columns)]
+
+
+def write_columns(FILE, columns: _List[_List], prefix: str = "") -> None:
+    """Write the passed columns to FILE as comma-separated rows, with
+       each row starting with 'prefix'. All of the rows are written
+       in a single call
+    """
+    FILE.write("".join(format_columns(columns, prefix=prefix)))
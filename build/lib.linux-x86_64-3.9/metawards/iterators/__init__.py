@@ -0,0 +1,56 @@
+"""
+.. currentmodule:: metawards.iterators
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    advance_additional
+    advance_additional_omp
+    advance_fixed
+    advance_fixed_omp
+    advance_foi
+    advance_foi_omp
+    advance_foi_work_to_play
+    advance_foi_work_to_play_omp
+    advance_imports
+    advance_imports_omp
+    advance_infprob
+    advance_infprob_omp
+    advance_play
+    advance_play_omp
+    advance_work_to_play
+    advance_work_to_play_omp
+    advance_recovery
+    advance_recovery_omp
+    build_custom_iterator
+    iterate_custom
+    iterate_default
+    iterate_weekday
+    iterate_weekend
+    iterate_working_week
+    setup_additional_seeds
+    setup_seed_all_wards
+    setup_seed_specified_ward
+    setup_seed_wards
+"""
+
+from ._advance_additional import *
+from ._advance_fixed import *
+from ._advance_foi import *
+from ._advance_imports import *
+from ._advance_infprob import *
+from ._advance_play import *
+from ._advance_recovery import *
+from ._advance_foi_work_to_play import *
+from ._advance_work_to_play import *
+
+from ._iterate_custom import *
+from ._iterate_default import *
+from ._iterate_weekday import *
+from ._iterate_weekend import *
+from ._iterate_working_week import *
+
+from ._setup_imports import *
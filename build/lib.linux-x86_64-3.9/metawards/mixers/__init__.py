@@ -0,0 +1,43 @@
+"""
+.. currentmodule:: metawards.mixers
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    InteractionMatrix
+    SparseInteractionMatrix
+
+    merge_evenly
+    merge_using_matrix
+    merge_matrix_single_population
+    merge_matrix_multi_population
+
+    mix_custom
+    mix_default
+    mix_evenly
+    mix_none
+    mix_evenly_single_population
+    mix_evenly_multi_population
+    mix_none_single_population
+    mix_none_multi_population
+
+"""
+
+from ._interaction_matrix import *
+
+from ._merge_evenly import *
+from ._merge_using_matrix import *
+from ._merge_matrix_single_population import *
+from ._merge_matrix_multi_population import *
+
+from ._mix_custom import *
+from ._mix_default import *
+from ._mix_evenly import *
+from ._mix_none import *
+from ._mix_evenly_multi_population import *
+from ._mix_evenly_single_population import *
+from ._mix_none_multi_population import *
+from ._mix_none_single_population import *
@@ -0,0 +1,34 @@
+"""
+.. currentmodule:: metawards.movers
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    go_isolate
+    go_record
+    go_stage
+    go_to
+    go_ward
+
+    move_custom
+    move_default
+
+    MoveGenerator
+    MoveRecord
+
+"""
+
+from ._go_isolate import *
+from ._go_record import *
+from ._go_stage import *
+from ._go_to import *
+from ._go_ward import *
+
+from ._move_custom import *
+from ._move_default import *
+
+from ._movegenerator import *
+from ._moverecord import *
@@ -0,0 +1,12 @@
+
+__all__ = ["move_default"]
+
+
+def move_default(**kwargs):
+    """This is the default mover. By default, no member of a demographic
+       is moved
+    """
+    return []
+
+
+move_default.workspace_needs = []
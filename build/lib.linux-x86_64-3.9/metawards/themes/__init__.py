@@ -0,0 +1,16 @@
+"""
+.. currentmodule:: metawards.themes
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    Simple
+    SpringFlowers
+
+"""
+
+from ._spring_flowers import *
+from ._simple import *
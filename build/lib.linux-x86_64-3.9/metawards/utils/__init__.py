@@ -0,0 +1,122 @@
+"""
+.. currentmodule:: metawards.utils
+
+Functions
+=========
+
+.. autosummary::
+    :toctree: generated/
+
+    accepts_stage
+    add_lookup
+    add_wards_network_distance
+    aggregate_networks
+    assert_sane_network
+    build_cutoff_mask
+    build_play_matrix
+    build_wards_network
+    call_function_on_network
+    check_for_updates
+    clear_all_infections
+    clear_load_cache
+    Console
+    create_int_array
+    create_double_array
+    create_string_array
+    create_thread_generators
+    delete_ran_binomial
+    fill_in_gaps
+    get_available_num_threads
+    get_cutoff_mask_key
+    get_functions
+    get_initialise_functions
+    get_load_cache
+    get_finalise_functions
+    get_model_loop_functions
+    get_min_max_distances
+    get_network_cache_dir
+    get_number_of_processes
+    get_space_filling_curve_order
+    initialise_infections
+    initialise_play_infections
+    is_openmp_supported
+    load_cached
+    move_population_from_work_to_play
+    move_population_from_play_to_work
+    prepare_worker
+    ran_binomial
+    ran_int
+    ran_uniform
+    read_done_file
+    reorder_network
+    recalculate_work_denominator_day
+    recalculate_play_denominator_day
+    rescale_play_matrix
+    resize_array
+    reset_everything
+    reset_play_matrix
+    reset_play_susceptibles
+    reset_work_matrix
+    run_model
+    run_models
+    run_worker
+    safe_eval_number
+    scale_link_susceptibles
+    scale_node_susceptibles
+    seed_ran_binomial
+    set_load_cache
+    set_network_cache_dir
+    specialise_susceptibles
+    string_to_ints
+    update_metawards
+    zero_workspace
+
+Classes
+=======
+
+.. autosummary::
+    :toctree: generated/
+
+    Profiler
+    NullProfiler
+
+"""
+
+from ._initialise_infections import *
+from ._read_done_file import *
+from ._string_to_ints import *
+from ._profiler import *
+from ._run_model import *
+from ._run_models import *
+from ._worker import *
+from ._import_module import *
+from ._get_functions import *
+from ._safe_eval import *
+from ._console import *
+from ._updates import *
+from ._network_cache import *
+from ._load_cache import *
+
+from ._add_lookup import *
+from ._aggregate import *
+from ._build_wards_network import *
+from ._add_wards_network_distance import *
+from ._check_openmp import *
+from ._get_min_max_distances import *
+from ._cutoff_mask import *
+from ._reorder_network import *
+from ._reset_everything import *
+from ._rescale_matrix import *
+from ._recalculate_denominators import *
+from ._move_population import *
+from ._fill_in_gaps import *
+from ._build_play_matrix import *
+from ._array import *
+from ._ran_binomial import *
+from ._parallel import *
+from ._scale_susceptibles import *
+from ._assert_sane_network import *
+from ._clear_all_infections import *
+from ._network_wards import *
+from ._network_functions import *
+from ._zero_workspace import *
@@ -0,0 +1,102 @@
+from .._network import Network
+
+__all__ = ["add_lookup"]
+
+
+def _read_lookup(lookup_file: str, columns):
+    """Read the lookup file and return the WardInfoColumns that
+       hold its data. This streams through the file, and only
+       extracts the columns that are used
+    """
+    from .._wardinfo import WardInfoColumns
+
+    # (field, column number) for each of the fields that are used
+    fields = [(field, columns.get(column, None)) for (field, column) in
+              [("code", "code"), ("name", "name"),
+               ("authority_code", "authority_code"),
+               ("authority", "authority_name"),
+               ("region_code", "region_code"),
+               ("region", "region_name")]]
+    fields = [(field, column) for (field, column) in fields
+              if column is not None]
+
+    CMWDCD = columns.get("alternate_code", None)
+    CMWDNM = columns.get("alternate_name", None)
+
+    infos = WardInfoColumns(1)   # 1-indexed
+
+    values = [(getattr(infos, field), column) for (field, column) in fields]
+    present = infos.present
+
+    import csv
+
+    with open(lookup_file, "r", newline="") as FILE:
+        # skip the header line
+        FILE.readline()
+
+        for i, parts in enumerate(csv.reader(FILE, quotechar='"',
+                                             delimiter=',',
+                                             skipinitialspace=True),
+                                  start=1):
+            present.append(1)
+
+            for (column, index) in values:
+                column.append(parts[index].strip())
+
+            if CMWDCD is not None:
+                infos.alternate_codes[i] = [parts[CMWDCD].strip()]
+
+            if CMWDNM is not None:
+                infos.alternate_names[i] = [parts[CMWDNM].strip()]
+
+    # fill in the fields that are not in the lookup file
+    n = len(present)
+
+    for field in WardInfoColumns.fields:
+        column = getattr(infos, field)
+        column += [""] * (n - len(column))
+
+    infos._infos = [None] * n
+
+    return infos
+
+
+def add_lookup(network: Network, nthreads: int = 1):
+    """Add in metadata about the network that can be used
+       to look up wards by name of location or region etc.
+
+       This will add the data to the network.ward_info object,
+       as a list ensuring that network.nodes[i] has its
+       info in network.ward_info[i]
+
+       The lookup data are held in columns, from which the
+       WardInfo objects are created on demand. The columns are
+       cached in this process and in the network cache (see
+       :func:`metawards.utils.set_network_cache_dir`), so the
+       lookup file is only parsed again if it changes
+    """
+    lookup_file = network.params.input_files.lookup
+
+    if lookup_file is None:
+        from ._console import Console
+        Console.print("No ward lookup information available.")
+        return
+
+    columns = network.params.input_files.lookup_columns
+
+    from ._load_cache import load_cached
+    ward_infos = load_cached("lookup", lookup_file,
+                             lambda: _read_lookup(lookup_file, columns),
+                             columns=columns)
+
+    if len(ward_infos) != network.nnodes + 1:
+        from ._console import Console
+        Console.warning(
+            f"Number of wards from {lookup_file} "
+            f"({len(ward_infos)}) disagrees with the number "
+            f"of wards in the network ({network.nnodes})")
+
+        ward_infos.resize(network.nnodes + 1)
+
+    from .._wardinfo import WardInfos
+    network.info = WardInfos(wards=ward_infos)
@@ -0,0 +1,3 @@
+
+cdef double * get_double_array_ptr(double_array)
+cdef int * get_int_array_ptr(int_array)
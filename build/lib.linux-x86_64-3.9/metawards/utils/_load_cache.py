@@ -0,0 +1,77 @@
+__all__ = ["load_cached", "get_load_cache", "set_load_cache",
+           "clear_load_cache"]
+
+#: Process-wide cache of the model descriptions (e.g. parsed disease,
+#: parameter and input file json) that have been loaded, keyed by
+#: the path, size and modification time of the file
+_loaded = {}
+
+
+def load_cached(kind: str, filename: str, load, **kwargs):
+    """Return a copy of the data of type 'kind' that is loaded from
+       'filename' by calling 'load()'. The loaded data is cached in
+       this process, and also in the network cache directory if this
+       is enabled (see set_network_cache_dir). The cache is keyed by
+       the path, size and modification time of the file, plus any
+       extra (json-serialisable) keyword arguments that affect
+       how the file is loaded, so is refreshed whenever the
+       file changes. Note that errors are never cached
+    """
+    import os
+    from copy import deepcopy
+    from ._network_cache import _file_signature, network_cache_key, \
+        load_from_network_cache, save_to_network_cache
+
+    filename = os.path.abspath(str(filename))
+
+    key = network_cache_key(kind, file=_file_signature(filename), **kwargs)
+
+    # the data is held in a tuple so that 'None' can be cached
+    data = _loaded.get(key, None)
+
+    if data is None:
+        data = load_from_network_cache(key)
+
+        if data is None:
+            data = (load(),)
+            save_to_network_cache(key, data)
+
+        _loaded[key] = data
+
+    return deepcopy(data[0])
+
+
+def get_load_cache():
+    """Return the state of the process-wide load caches (loaded model
+       descriptions and repository versions). This is passed to
+       worker processes so that they don't need to re-resolve or
+       re-parse anything that has already been loaded
+    """
+    from .._parameters import _repositories
+
+    return {"loaded": dict(_loaded),
+            "repositories": dict(_repositories)}
+
+
+def set_load_cache(state) -> None:
+    """Add the passed state (from get_load_cache) to the process-wide
+       load caches of this process
+    """
+    if state is None:
+        return
+
+    from .._parameters import _repositories
+
+    for key, value in state.get("loaded", {}).items():
+        _loaded.setdefault(key, value)
+
+    for key, value in state.get("repositories", {}).items():
+        _repositories.setdefault(key, value)
+
+
+def clear_load_cache() -> None:
+    """Clear the process-wide load caches"""
+    from .._parameters import _repositories
+
+    _loaded.clear()
+    _repositories.clear()
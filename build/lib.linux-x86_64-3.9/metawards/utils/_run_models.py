@@ -0,0 +1,577 @@
+
+from typing import Union as _Union
+from typing import List as _List
+from typing import Tuple as _Tuple
+
+from .._network import Network
+from .._networks import Networks
+from .._population import Population
+from .._variableset import VariableSets, VariableSet
+from .._outputfiles import OutputFiles
+
+from ._profiler import Profiler
+from ._get_functions import MetaFunction
+
+import os as _os
+
+__all__ = ["get_number_of_processes", "run_models"]
+
+
+def get_number_of_processes(parallel_scheme: str, nprocs: int = None):
+    """This function works out how many processes have been set
+       by the paralellisation system called 'parallel_scheme'
+    """
+    if nprocs is None:
+        if parallel_scheme == "multiprocessing":
+            return 1
+        elif parallel_scheme == "mpi4py":
+            from mpi4py import MPI
+            comm = MPI.COMM_WORLD
+            nprocs = comm.Get_size()
+            return nprocs
+        elif parallel_scheme == "scoop":
+            raise ValueError(
+                f"You must specify the number of processes for "
+                f"scoop to parallelise over")
+        else:
+            raise ValueError(
+                f"You must specify the number of processes to "
+                f"use for parallel scheme '{parallel_scheme}'")
+
+    if parallel_scheme == "mpi4py":
+        from mpi4py import MPI
+        comm = MPI.COMM_WORLD
+        n = comm.Get_size()
+
+        if n < nprocs:
+            return n
+        else:
+            return nprocs
+    elif parallel_scheme == "scoop":
+        return 4
+    elif parallel_scheme == "multiprocessing":
+        return nprocs
+    else:
+        raise ValueError(
+            f"Unrecognised parallelisation scheme {parallel_scheme}")
+
+
+def _generate_jobs(variables: VariableSets, next_seed,
+                   output_dir: OutputFiles):
+    """Generate (index, variable, seed, outdir) for each of the jobs
+       that will run the passed variables. The seeds are drawn
+       in order from 'next_seed'. The output directories are based
+       on the fingerprint, so should be unique for each job
+    """
+    outdirs = set()
+
+    for i, v in enumerate(variables):
+        seed = next_seed()
+
+        f = v.output_dir()
+        d = _os.path.join(output_dir.get_path(), f)
+
+        n = 1
+        base = d
+
+        while d in outdirs:
+            n += 1
+            d = base + "x%03d" % n
+
+        outdirs.add(d)
+
+        yield (i, v, seed, d)
+
+
+def _submit_jobs(jobs, submit, max_queued: int):
+    """Submit the passed jobs using 'submit', which returns a function
+       that waits for and returns the result of the job. Jobs are
+       submitted as earlier jobs complete, so that at most
+       'max_queued' are queued at once. This yields
+       (job, get_result) in the same order as the jobs
+    """
+    from collections import deque
+
+    queue = deque()
+
+    for job in jobs:
+        queue.append((job, submit(job)))
+
+        if len(queue) >= max_queued:
+            yield queue.popleft()
+
+    while len(queue) > 0:
+        yield queue.popleft()
+
+
+def _store_output(results_store, variable: VariableSet, outdir: str,
+                  archive: bytes):
+    """Add the packed output 'archive' of the job that would have
+       been written to 'outdir' to the passed results store
+    """
+    results_store.add(fingerprint=variable.fingerprint(),
+                      repeat=variable.repeat_index(),
+                      name=_os.path.basename(outdir), archive=archive)
+
+
+def _collect_outputs(results, outputs: _List, njobs: int,
+                     results_store=None):
+    """Wait for each of the passed (job, get_result) results to
+       complete, appending (variable, output) to 'outputs'. If
+       'results_store' is set, then the jobs return
+       (output, archive), and the archive is added to the store
+    """
+    from ._console import Console
+
+    for ((i, variable, _, outdir), get_result) in results:
+        with Console.spinner("Computing model run") as spinner:
+            try:
+                output = get_result()
+
+                if results_store is not None:
+                    (output, archive) = output
+                    _store_output(results_store, variable=variable,
+                                  outdir=outdir, archive=archive)
+
+                spinner.success()
+            except Exception as e:
+                spinner.failure()
+                error = f"FAILED: {e.__class__} {e}"
+                Console.error(error)
+                output = None
+
+            if output is not None:
+                Console.panel(
+                    f"Completed job {i+1} of {njobs}\n"
+                    f"{variable}\n"
+                    f"{output[-1]}",
+                    style="alternate")
+
+                outputs.append((variable, output))
+            else:
+                Console.error(f"Job {i+1} of {njobs}\n"
+                              f"{variable}\n"
+                              f"{error}")
+                outputs.append((variable, []))
+
+
+def run_models(network: _Union[Network, Networks],
+               variables: VariableSets,
+               population: Population,
+               nprocs: int, nthreads: int, seed: int,
+               nsteps: int, output_dir: OutputFiles,
+               iterator: MetaFunction = None,
+               extractor: MetaFunction = None,
+               mixer: MetaFunction = None,
+               mover: MetaFunction = None,
+               profiler: Profiler = None,
+               parallel_scheme: str = "multiprocessing",
+               debug_seeds=False,
+               results_store: bool = False,
+               results_shards: int = None) \
+        -> _List[_Tuple[VariableSet, Population]]:
+    """Run all of the models on the passed Network that are described
+       by the passed VariableSets
+
+       Parameters
+       ----------
+       network: Network or Networks
+         The network(s) to model
+       variables: VariableSets
+         The sets of VariableSet that represent all of the model
+         runs to perform
+       population: Population
+         The initial population for all of the model runs. This also
+         contains the starting date and day for the model outbreak
+       nprocs: int
+         The number of model runs to perform in parallel
+       nthreads: int
+         The number of threads to parallelise each model run over
+       seed: int
+         Random number seed which is used to generate random seeds
+         for all model runs
+       nsteps: int
+         The maximum number of steps to perform for each model - this
+         will run until the outbreak is over if this is None
+       output_dir: OutputFiles
+         The OutputFiles that represents the directory in which all
+         output should be placed
+       iterator: str
+         Iterator to load that will be used to iterate the outbreak
+       extractor: str
+         Extractor to load that will be used to extract information
+       mixer: str
+         Mixer to load that will be used to mix demographic data
+       mover: str
+         Mover to load that will be used to move the population between
+         different demographics
+       profiler: Profiler
+         Profiler used to profile the model run
+       parallel_scheme: str
+         Which parallel scheme (multiprocessing, mpi4py or scoop) to use
+         to run multiple model runs in parallel
+       debug_seeds: bool (False)
+         Set this parameter to force all runs to use the same seed
+         (seed) - this is used for debugging and should never be set
+         in production runs
+       results_store: bool (False)
+         Set this parameter to write the output of all of the model
+         runs into a :class:`~metawards.ResultsStore` in 'output_dir',
+         rather than into one sub-directory per model run. This
+         greatly reduces the number of files created by large
+         sweeps. Runs that fail keep their sub-directory, so that
+         the error can be found.
+       results_shards: int
+         The number of shards (container files) in the results store.
+         By default this is one shard per 1000 model runs
+
+       Returns
+       -------
+       results: List[ tuple(VariableSet, Population)]
+         The set of adjustable variables and final population at the
+         end of each run
+    """
+    from ._console import Console
+
+    if len(variables) == 1:
+        # no need to do anything complex - just a single run
+        if not variables[0].is_empty():
+            Console.print(f"* Adjusting {variables[0]}", markdown=True)
+
+        params = network.params.set_variables(variables[0])
+
+        network.update(params, profiler=profiler)
+
+        trajectory = network.run(population=population, seed=seed,
+                                 nsteps=nsteps,
+                                 output_dir=output_dir,
+                                 iterator=iterator,
+                                 extractor=extractor,
+                                 mixer=mixer,
+                                 mover=mover,
+                                 profiler=profiler,
+                                 nthreads=nthreads)
+
+        results = [(variables[0], trajectory)]
+
+        # perform the final summary
+        from ._get_functions import get_summary_functions
+
+        if extractor is None:
+            from ..extractors._extract_default import extract_default
+            extractor = extract_default
+        else:
+            from ..extractors._extract_custom import build_custom_extractor
+            extractor = build_custom_extractor(extractor)
+
+        funcs = get_summary_functions(network=network, results=results,
+                                      output_dir=output_dir,
+                                      extractor=extractor,
+                                      nthreads=nthreads)
+
+        for func in funcs:
+            func(network=network, output_dir=output_dir, results=results)
+
+        return results
+
+    # generate the random number seeds for all of the jobs
+    # (for testing, we will use the same seed so that I can check
+    #  that they are all working)
+    if seed == 0:
+        # this is a special mode that a developer can use to force
+        # all jobs to use the same random number seed (15324) that
+        # is used for comparing outputs. This should NEVER be used
+        # for production code
+        Console.warning("Using special mode to fix all random number "
+                        "seeds to 15324. DO NOT USE IN PRODUCTION!!!")
+
+        def next_seed():
+            return 15324
+
+    elif debug_seeds:
+        Console.warning(f"Using special model to make all jobs use the "
+                        f"Same random number seed {seed}. "
+                        f"DO NOT USE IN PRODUCTION!")
+
+        def next_seed():
+            return seed
+
+    else:
+        from ._ran_binomial import seed_ran_binomial, ran_int
+        rng = seed_ran_binomial(seed)
+
+        # seed the rngs used for the sub-processes using this rng
+        def next_seed():
+            return ran_int(rng, 10000, 99999999)
+
+    # the jobs are generated on demand, so that the VariableSet
+    # objects don't need to all be created (or held in memory) up front
+    jobs = _generate_jobs(variables=variables, next_seed=next_seed,
+                          output_dir=output_dir)
+    njobs = len(variables)
+
+    outputs = []
+
+    Console.print(
+        f"Running **{njobs}** jobs using **{nprocs}** process(es)",
+        markdown=True)
+
+    if results_store:
+        from .._resultsstore import ResultsStore
+
+        if results_shards is None:
+            results_shards = (njobs + 999) // 1000
+
+        results_store = ResultsStore(output_dir.get_path(),
+                                     nshards=results_shards)
+        Console.print(f"All output will be written to {results_store}")
+    else:
+        results_store = None
+
+    if nprocs == 1:
+        # no need to use a pool, as we will repeat this calculation
+        # several times
+        save_network = network.copy()
+
+        Console.rule("Running models in serial")
+
+        for (i, variable, seed, outdir) in jobs:
+            if results_store is None:
+                subdir = output_dir.open_subdir(outdir)
+            else:
+                # write to local scratch, and then pack into the store
+                subdir = OutputFiles(results_store.create_scratch_dir(),
+                                     check_empty=False, prompt=None,
+                                     auto_bzip=output_dir.auto_bzip())
+
+            with subdir:
+                Console.print(
+                    f"Running parameter set {i+1} of {njobs} "
+                    f"using seed {seed}")
+                Console.print(f"All output written to {subdir.get_path()}")
+
+                with Console.redirect_output(subdir.get_path(),
+                                             auto_bzip=output_dir.auto_bzip()):
+                    Console.print(f"Running variable set {i+1}")
+                    Console.print(f"Random seed: {seed}")
+                    Console.print(f"nthreads: {nthreads}")
+
+                    # no need to do anything complex - just a single run
+                    params = network.params.set_variables(variable)
+
+                    Console.rule("Adjustable parameters to scan")
+                    Console.print("\n".join(
+                        [f"* {x}" for x in params.adjustments]),
+                        markdown=True)
+                    Console.rule()
+
+                    network.update(params, profiler=profiler)
+
+                    with Console.spinner("Computing model run") as spinner:
+                        try:
+                            output = network.run(population=population,
+                                                 seed=seed,
+                                                 nsteps=nsteps,
+                                                 output_dir=subdir,
+                                                 iterator=iterator,
+                                                 extractor=extractor,
+                                                 mixer=mixer,
+                                                 mover=mover,
+                                                 profiler=profiler,
+                                                 nthreads=nthreads)
+                            spinner.success()
+                        except Exception as e:
+                            spinner.failure()
+                            Console.print_exception()
+                            error = f"FAILED: {e.__class__} {e}"
+                            output = None
+
+                    if output is not None:
+                        outputs.append((variable, output))
+                    else:
+                        outputs.append((variable, []))
+
+                if output is not None:
+                    Console.panel(f"Completed job {i+1} of {njobs}\n"
+                                  f"{variable}\n"
+                                  f"{output[-1]}",
+                                  style="alternate")
+                else:
+                    Console.error(f"Job {i+1} of {njobs}\n"
+                                  f"{variable}\n"
+                                  f"{error}")
+            # end of OutputDirs context manager
+
+            if results_store is not None:
+                if output is not None:
+                    results_store.add_directory(
+                        fingerprint=variable.fingerprint(),
+                        repeat=variable.repeat_index(),
+                        name=_os.path.basename(outdir),
+                        path=subdir.get_path())
+                else:
+                    # keep the output of failed runs so that the
+                    # error can be found
+                    import shutil
+                    shutil.move(subdir.get_path(), outdir)
+
+            if i != njobs - 1:
+                # still another run to perform, restore the network
+                # to the original state
+                network = save_network.copy()
+        # end of loop over variable sets
+    else:
+        from ._worker import run_worker
+
+        if isinstance(network, Networks):
+            max_nodes = network.overall.nnodes + 1
+            max_links = max(network.overall.nlinks, network.overall.nplay) + 1
+            ward_order = network.overall._original_index
+        else:
+            max_nodes = network.nnodes + 1
+            max_links = max(network.nlinks, network.nplay) + 1
+            ward_order = network._original_index
+
+        try:
+            demographics = network.demographics
+        except Exception:
+            demographics = None
+
+        # give the workers a clean copy of the profiler
+        if profiler is None:
+            worker_profiler = None
+        else:
+            worker_profiler = profiler.__class__()
+
+        # send the workers everything that has already been loaded and
+        # resolved, so that they don't need to do this again. This is
+        # sent once to each worker when the pool is created, rather
+        # than with every job
+        from ._load_cache import get_load_cache, set_load_cache
+        load_cache = get_load_cache()
+        scoop_load_cache = False
+
+        def get_argument(job):
+            """Create the parameters and options to run 'job'"""
+            (i, variable, seed, outdir) = job
+
+            return {
+                "params": network.params.set_variables(variable),
+                "demographics": demographics,
+                "scoop_load_cache": scoop_load_cache,
+                "options": {"seed": seed,
+                            "output_dir": outdir,
+                            "results_store": results_store is not None,
+                            "auto_bzip": output_dir.auto_bzip(),
+                            "log_mode": Console.get_log_mode(),
+                            "population": population,
+                            "nsteps": nsteps,
+                            "iterator": iterator,
+                            "extractor": extractor,
+                            "mixer": mixer,
+                            "mover": mover,
+                            "profiler": worker_profiler,
+                            "nthreads": nthreads,
+                            "max_nodes": max_nodes,
+                            "max_links": max_links,
+                            "ward_order": ward_order}
+            }
+
+        # only keep a few more jobs queued than there are processes,
+        # so that the arguments for all jobs are never held in memory
+        max_queued = 2 * nprocs
+
+        if parallel_scheme == "multiprocessing":
+            # run jobs using a multiprocessing pool
+            Console.rule("Running models in parallel using multiprocessing")
+            from multiprocessing import Pool
+
+            with Pool(processes=nprocs, initializer=set_load_cache,
+                      initargs=(load_cache,)) as pool:
+                def submit(job):
+                    return pool.apply_async(run_worker,
+                                            (get_argument(job),)).get
+
+                _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                                 outputs=outputs, njobs=njobs,
+                                 results_store=results_store)
+
+        elif parallel_scheme == "mpi4py":
+            # run jobs using a mpi4py pool
+            Console.rule("Running models in parallel using MPI")
+            from mpi4py import futures
+            with futures.MPIPoolExecutor(max_workers=nprocs,
+                                         initializer=set_load_cache,
+                                         initargs=(load_cache,)) as pool:
+                def submit(job):
+                    return pool.submit(run_worker, get_argument(job)).result
+
+                _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                                 outputs=outputs, njobs=njobs,
+                                 results_store=results_store)
+
+        elif parallel_scheme == "scoop":
+            # run jobs using a scoop pool
+            Console.rule("Running models in parallel using scoop")
+            from scoop import futures, shared
+
+            # scoop has no pool initializer, so share the cache as
+            # a constant that each worker fetches once
+            shared.setConst(metawards_load_cache=load_cache)
+            scoop_load_cache = True
+
+            def submit(job):
+                argument = get_argument(job)
+
+                try:
+                    return futures.submit(run_worker, argument).result
+                except Exception as e:
+                    Console.error(
+                        f"Error submitting calculation: {e.__class__} {e}\n"
+                        f"Trying to submit again...")
+
+                # try again
+                try:
+                    return futures.submit(run_worker, argument).result
+                except Exception as e:
+                    Console.error(
+                        f"No - another error: {e.__class__} {e}\n"
+                        f"Skipping this job")
+
+                    def failed():
+                        raise RuntimeError(f"Could not submit {job[1]}")
+
+                    return failed
+
+            _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                             outputs=outputs, njobs=njobs,
+                             results_store=results_store)
+        else:
+            raise ValueError(f"Unrecognised parallelisation scheme "
+                             f"{parallel_scheme}.")
+
+    if results_store is not None:
+        results_store.close()
+
+    # perform the final summary
+    from ._get_functions import get_summary_functions
+
+    if extractor is None:
+        from ..extractors._extract_default import extract_default
+        extractor = extract_default
+    else:
+        from ..extractors._extract_custom import build_custom_extractor
+        extractor = build_custom_extractor(extractor)
+
+    funcs = get_summary_functions(network=network, results=outputs,
+                                  output_dir=output_dir, extractor=extractor,
+                                  nthreads=nthreads)
+
+    for func in funcs:
+        try:
+            func(network=network, output_dir=output_dir,
+                 results=outputs, nthreads=nthreads)
+        except Exception as e:
+            Console.error(f"Error calling {func}: {e.__class__} {e}")
+
+    return outputs
@@ -4,7 +4,7 @@ from dataclasses import dataclass as _dataclass
 from typing import Union as _Union
 
 from ._variableset import VariableSet
-from ._network import Network
+from ._network import Network, _get_prepared_key
 from ._disease import Disease
 from ._inputfiles import InputFiles
 
@@ -148,6 +148,27 @@ class Demographic:
            network: Network
              The specialised network
         """
+        subnet = self._copy_network(network)
+
+        # Now we need to adjust the number of susceptibles in each
+        # ward according to work_ratio and play_ratio
+        subnet.scale_susceptibles(work_ratio=self.work_ratio,
+                                  play_ratio=self.play_ratio)
+
+        subnet.reset_everything(nthreads=nthreads, profiler=profiler)
+        subnet.rescale_play_matrix(nthreads=nthreads, profiler=profiler)
+        subnet.move_from_play_to_work(nthreads=nthreads, profiler=profiler)
+        subnet._prepared_key = _get_prepared_key(subnet.params)
+
+        return subnet
+
+    def _copy_network(self, network: Network) -> Network:
+        """Return a copy of the passed network that has the parameters
+           of this demographic, but that still contains the population
+           of the whole network. The population is scaled either
+           by :meth:`~metawards.Demographic.specialise`, or for all
+           demographics at once by :meth:`~metawards.Networks.build`
+        """
         # Start by making a shallow copy of all elements - I really do
         # only want the immediate children of the network to be copied.
         # I will then change what is needed in deep copies - this should
@@ -162,11 +183,6 @@ class Demographic:
         subnet.links = network.links.copy()
         subnet.play = network.play.copy()
 
-        # Now we need to adjust the number of susceptibles in each
-        # ward according to work_ratio and play_ratio
-        subnet.scale_susceptibles(work_ratio=self.work_ratio,
-                                  play_ratio=self.play_ratio)
-
         if self.name in network.params.specialised_demographics():
             subnet.params = network.params[self.name].copy()
         else:
@@ -182,8 +198,7 @@ class Demographic:
 
         subnet.name = self.name
 
-        subnet.reset_everything(nthreads=nthreads, profiler=profiler)
-        subnet.rescale_play_matrix(nthreads=nthreads, profiler=profiler)
-        subnet.move_from_play_to_work(nthreads=nthreads, profiler=profiler)
+        # the copy has not yet been prepared for a model run
+        subnet._prepared_key = None
 
         return subnet
@@ -73,7 +73,8 @@ class Demographics:
 
     #: The interaction matrix between demographics. This should
     #: be a list of lists that shows how demographic 'i' affects
-    #: demographic 'j'
+    #: demographic 'j'. This can also be an InteractionMatrix, or
+    #: a SparseInteractionMatrix if most couplings are zero
     interaction_matrix: _List[_List[int]] = None
 
     #: Map from index to names of demographics - enables lookup by name
@@ -370,6 +371,16 @@ follow the instructions at
             data["adjustments"] = [x.to_data() if x is not None else None
                                    for x in adjustments]
 
+        if self.interaction_matrix is not None:
+            from .mixers._interaction_matrix import SparseInteractionMatrix
+            matrix = self.interaction_matrix
+
+            if isinstance(matrix, SparseInteractionMatrix):
+                data["interaction_matrix"] = matrix.to_data()
+            else:
+                data["interaction_matrix"] = [[float(x) for x in row]
+                                              for row in matrix]
+
         return data
 
     def to_json(self, filename: str = None, indent: int = None,
@@ -478,7 +489,23 @@ follow the instructions at
                 f"the number of demographics ({len(demographics)}), "
                 f"which must equal the number of networks ({len(networks)}).")
 
+        interaction_matrix = data.get("interaction_matrix", None)
+
+        if interaction_matrix is not None:
+            from .mixers._interaction_matrix import SparseInteractionMatrix
+
+            if isinstance(interaction_matrix, dict):
+                interaction_matrix = SparseInteractionMatrix.from_data(
+                                                    interaction_matrix)
+                interaction_matrix.validate(n=len(demographics))
+            else:
+                interaction_matrix = [[float(x) for x in row]
+                                      for row in interaction_matrix]
+                SparseInteractionMatrix.from_matrix(interaction_matrix,
+                                                    n=len(demographics))
+
         demos = Demographics(random_seed=random_seed,
+                             interaction_matrix=interaction_matrix,
                              _authors=data.get("author(s)", None),
                              _contacts=data.get("contact(s)", None),
                              _references=data.get("reference(s)", None))
@@ -536,7 +563,8 @@ follow the instructions at
               max_nodes: int = 16384,
               max_links: int = 4194304,
               nthreads: int = 1,
-              profiler: Profiler = None) -> _Union[Network, Networks]:
+              profiler: Profiler = None,
+              ward_order=None) -> _Union[Network, Networks]:
         """Build the set of networks described by these demographics
            and the passed parameters
 
@@ -552,6 +580,10 @@ follow the instructions at
              Profiler used to profile the specialisation
            nthreads: int
              Number of threads over which to parallelise the work
+           ward_order: str or list[int]
+             The order into which to renumber the wards of the network
+             (see :meth:`Network.reorder_wards`). This is ignored for
+             demographics that use named networks
 
            Returns
            -------
@@ -565,7 +597,8 @@ follow the instructions at
         if len(self) == 0:
             return Network.build(params=params, population=population,
                                  max_nodes=max_nodes, max_links=max_links,
-                                 nthreads=nthreads, profiler=profiler)
+                                 nthreads=nthreads, profiler=profiler,
+                                 ward_order=ward_order)
 
         if len(self) == 1:
             demographic = self[0]
@@ -581,7 +614,8 @@ follow the instructions at
 
             network = Network.build(params=params, population=population,
                                     max_nodes=max_nodes, max_links=max_links,
-                                    nthreads=nthreads, profiler=profiler)
+                                    nthreads=nthreads, profiler=profiler,
+                                    ward_order=ward_order)
 
             if demographic.work_ratio != 1.0 or demographic.play_ratio != 1.0:
                 network.scale_susceptibles(work_ratio=demographic.work_ratio,
@@ -594,12 +628,18 @@ follow the instructions at
             # build a single network that is then specialised
             network = Network.build(params=params, population=population,
                                     max_nodes=max_nodes, max_links=max_links,
-                                    nthreads=nthreads, profiler=profiler)
+                                    nthreads=nthreads, profiler=profiler,
+                                    ward_order=ward_order)
 
             Console.rule("Specialising into demographics")
             return self.specialise(network=network, profiler=profiler,
                                    nthreads=nthreads)
 
+        if ward_order is not None:
+            Console.warning("Ignoring the ward order as the wards cannot "
+                            "be renumbered for demographics that use "
+                            "named networks")
+
         # need to load each network separately, and then merge
         wards = {}
         shared_wards = {}
@@ -726,31 +726,37 @@ class Disease:
             repository_version = v["version"]
             repository_branch = v["branch"]
 
+        from .utils._load_cache import load_cached
+
         if is_local_file:
-            disease = Disease.from_json(filename)
+            disease = load_cached("disease", filename,
+                                  lambda: Disease.from_json(filename))
             disease._filename = filename
             return disease
 
         json_file = os.path.abspath(filename)
 
-        try:
-            with open(json_file, "r") as FILE:
-                import json
-                data = json.load(FILE)
+        def _load():
+            try:
+                with open(json_file, "r") as FILE:
+                    import json
+                    data = json.load(FILE)
 
-        except Exception as e:
-            from .utils._console import Console
-            Console.error(f"""
+            except Exception as e:
+                from .utils._console import Console
+                Console.error(f"""
 Could not find the disease file {json_file}. Either it does not exist of was
 corrupted. Error was {e.__class__} {e}. Please see
 https://metawards.org/model_data for instructions on how to download and
 set the model data.""")
-            raise FileNotFoundError(f"Could not find or read {json_file}: "
-                                    f"{e.__class__} {e}")
+                raise FileNotFoundError(f"Could not find or read {json_file}: "
+                                        f"{e.__class__} {e}")
 
-        data["name"] = disease
+            data["name"] = name
+            return Disease.from_data(data)
 
-        disease = Disease.from_data(data)
+        name = disease
+        disease = load_cached("disease", json_file, _load, name=name)
         disease._filename = json_file,
         disease._repository = repository,
         disease._repository_branch = repository_branch,
@@ -295,34 +295,43 @@ class InputFiles:
             raise IOError(
                 f"Cannot load inputfiles as {json_file} doesn't exist")
 
-        if not _is_description_json(json_file):
-            # this must be wards data...
-            json_file = _expand_path(json_file)
-            return InputFiles(wards_data=json_file,
-                              _filename=json_file)
+        def _load():
+            if not _is_description_json(json_file):
+                # this must be wards data...
+                return None
 
-        try:
-            import json
             try:
-                import bz2
-                with bz2.open(json_file, "rt") as FILE:
-                    files = json.load(FILE)
-            except Exception:
-                files = None
-
-            if files is None:
-                with open(json_file, "r") as FILE:
-                    files = json.load(FILE)
-
-        except Exception as e:
-            from .utils._console import Console
-            Console.error(f"""Could not find the model file {json_file}.
+                import json
+                try:
+                    import bz2
+                    with bz2.open(json_file, "rt") as FILE:
+                        files = json.load(FILE)
+                except Exception:
+                    files = None
+
+                if files is None:
+                    with open(json_file, "r") as FILE:
+                        files = json.load(FILE)
+
+            except Exception as e:
+                from .utils._console import Console
+                Console.error(f"""Could not find the model file {json_file}.
 Either it does not exist or was corrupted.
 Error was {e.__class__} {e}.
 Please see https://metawards.org/model_data for instructions on how
 to download and set the model data.""")
-            raise FileNotFoundError(f"Could not find or read {json_file}: "
-                                    f"{e.__class__} {e}")
+                raise FileNotFoundError(f"Could not find or read {json_file}: "
+                                        f"{e.__class__} {e}")
+
+            return files
+
+        from .utils._load_cache import load_cached
+        files = load_cached("input_files", json_file, _load)
+
+        if files is None:
+            json_file = _expand_path(json_file)
+            return InputFiles(wards_data=json_file,
+                              _filename=json_file)
 
         model = InputFiles(work=files.get("work", None),
                            play=files.get("play", None),
@@ -18,6 +18,19 @@ from ._wardid import WardID
 __all__ = ["Network", "PersonType"]
 
 
+def _get_prepared_key(params: Parameters):
+    """Return the values from 'params' that determine how a network
+       is prepared for a model run by reset_everything,
+       rescale_play_matrix and move_from_play_to_work. A network
+       does not need to be prepared again if these have not changed
+    """
+    if params is None:
+        return None
+
+    return (params.static_play_at_home, params.play_to_work,
+            params.work_to_play)
+
+
 class PersonType(_Enum):
     """The type of individual in the network."""
     #: A WORKER is an individual that makes fixed movements between
@@ -90,6 +103,24 @@ class Network:
     #: network
     _work_index = None
 
+    #: The parameters that determined how this network was last prepared
+    #: for a model run (see :meth:`Network.update`). This is None if the
+    #: network has been changed (e.g. run) since it was last prepared
+    _prepared_key = None
+
+    #: The cached masks of the work and play links that are within
+    #: the current cutoff distance (see :meth:`Network.get_cutoff_mask`),
+    #: together with the key of the cutoffs used to build them
+    _cutoff_mask = None
+
+    #: The original index of each node if the wards have been renumbered
+    #: (see :meth:`Network.reorder_wards`), or None if they have not
+    _original_index = None
+
+    #: The current index of each node, indexed by the original index
+    #: of the node, or None if the wards have not been renumbered
+    _node_index = None
+
     @property
     def population(self) -> int:
         """Return the total population in the network"""
@@ -149,13 +180,18 @@ class Network:
               max_nodes: int = 16384,
               max_links: int = 4194304,
               nthreads: int = 1,
-              profiler=None):
+              profiler=None,
+              ward_order=None):
         """Builds and returns a new Network that is described by the
            passed parameters.
 
            The network is built in allocated memory, so you need to specify
            the maximum possible number of nodes and links. The memory buffers
            will be shrunk back after building.
+
+           If 'ward_order' is set then the wards of the network are
+           renumbered into this order after building (see
+           :meth:`Network.reorder_wards`)
         """
         if profiler is None:
             from .utils import NullProfiler
@@ -174,7 +210,8 @@ class Network:
             from ._wards import Wards
             wards = Wards.from_json(params.input_files.wards_data)
             network = Network.from_wards(wards, params=params,
-                                         profiler=p, nthreads=nthreads)
+                                         profiler=p, nthreads=nthreads,
+                                         ward_order=ward_order)
             network.params.input_files = params.input_files
 
             p.stop()
@@ -242,6 +279,13 @@ class Network:
         network.move_from_play_to_work(nthreads=nthreads, profiler=p)
         p = p.stop()
 
+        network._prepared_key = _get_prepared_key(network.params)
+
+        if ward_order is not None:
+            p = p.start("reorder_wards")
+            network.reorder_wards(ward_order, nthreads=nthreads, profiler=p)
+            p = p.stop()
+
         if not p.is_null():
             p = p.stop()
             Console.print(str(p))
@@ -327,7 +371,8 @@ class Network:
         """Return the index of the node in this network that matches
            'index'. This could be an integer, in which case this
            will directly look up the index of the node in the
-           Nodes, or else it could be a string, in which case
+           Nodes (using the original index of the ward if the wards
+           have been renumbered), or else it could be a string, in which case
            the WardInfo will be used to identify the node and
            look up the index from there.
         """
@@ -337,8 +382,24 @@ class Network:
             pass
 
         if isinstance(index, int):
-            return self.nodes.get_index(index)
+            index = self.nodes.get_index(index)
+
+            if self._node_index is not None:
+                # integer indexes are the original indexes of the wards
+                index = self._node_index[index]
+
+            return index
         else:
+            from ._wardinfo import _split_search
+
+            if index.find("/") == -1 and index == index.strip() and \
+                    _split_search(index) == (index, False, False):
+                # a perfect match on the name is always preferred, so
+                # look this up directly from the hash of names
+                for match in self.info.find_exact(index):
+                    if self.info[match].name == index:
+                        return match
+
             matches = self.info.find(index)
 
             if len(matches) == 0:
@@ -414,7 +475,8 @@ class Network:
     def get_min_max_distances(self, nthreads: int = 1,
                               profiler=None):
         """Calculate and return the minimum and maximum distances
-           between nodes in the network
+           between nodes in the network. These are normally found
+           when the distances are calculated, so are just returned
         """
         try:
             return self._min_max_distances
@@ -427,9 +489,38 @@ class Network:
 
         return self._min_max_distances
 
+    def get_cutoff_mask(self, nthreads: int = 1):
+        """Return the masks of the work and play links that are within
+           the current cutoff distance. Entry 'j' of each mask is 1
+           if the distance of link 'j' is below the per-ward cutoffs
+           of both of its wards and params.dyn_dist_cutoff, and
+           0 otherwise. The masks are cached, and are only rebuilt
+           if the cutoffs have changed since they were last built
+           (e.g. via :meth:`Network.update` or by changing the
+           per-ward cutoffs in nodes.cutoff)
+
+           Returns
+           -------
+           (links_mask, play_mask)
+             The masks for the work (links) and play links
+        """
+        from .utils._cutoff_mask import build_cutoff_mask, \
+            get_cutoff_mask_key
+
+        key = get_cutoff_mask_key(self)
+
+        if self._cutoff_mask is not None and self._cutoff_mask[0] == key:
+            return self._cutoff_mask[1]
+
+        masks = build_cutoff_mask(self, nthreads=nthreads)
+        self._cutoff_mask = (key, masks)
+
+        return masks
+
     def reset_everything(self, nthreads: int = 1,
                          profiler=None):
         """Resets the network ready for a new run of the model"""
+        self._prepared_key = None
         from .utils import reset_everything
         reset_everything(network=self, nthreads=nthreads, profiler=profiler)
 
@@ -440,7 +531,11 @@ class Network:
 
            This is used to update the parameters for the network
            for a new run. The network will be reset
-           and ready for a new run.
+           and ready for a new run. Note that the network is only
+           reset if it has changed (e.g. been run) since it was
+           last prepared, or if any of the parameters that affect
+           the preparation (static_play_at_home, play_to_work or
+           work_to_play) have changed.
 
            Parameters
            ----------
@@ -474,6 +569,15 @@ class Network:
         else:
             self.params = params[self.name]
 
+        if demographics is None and self._prepared_key is not None and \
+                self._prepared_key == _get_prepared_key(self.params):
+            # nothing that affects the population has changed since
+            # this network was last prepared, so it is already ready
+            # (other than possibly needing new cutoff masks)
+            self.get_cutoff_mask(nthreads=nthreads)
+            p.stop()
+            return self
+
         p = p.start("reset_everything")
         self.reset_everything(nthreads=nthreads, profiler=p)
         p = p.stop()
@@ -502,6 +606,14 @@ class Network:
         network.move_from_play_to_work(nthreads=nthreads, profiler=p)
         p = p.stop()
 
+        if network is self:
+            self._prepared_key = _get_prepared_key(self.params)
+
+        # make sure the cutoff masks match the new parameters
+        p = p.start("get_cutoff_mask")
+        network.get_cutoff_mask(nthreads=nthreads)
+        p = p.stop()
+
         p = p.stop()
 
         return network
@@ -509,12 +621,14 @@ class Network:
     def rescale_play_matrix(self, nthreads: int = 1,
                             profiler=None):
         """Rescale the play matrix"""
+        self._prepared_key = None
         from .utils import rescale_play_matrix
         rescale_play_matrix(network=self, nthreads=nthreads, profiler=profiler)
 
     def move_from_play_to_work(self, nthreads: int = 1,
                                profiler=None):
         """Move the population from play to work"""
+        self._prepared_key = None
         from .utils import move_population_from_play_to_work
         move_population_from_play_to_work(network=self, nthreads=nthreads,
                                           profiler=profiler)
@@ -586,6 +700,8 @@ class Network:
             work_ratio = ratio
             play_ratio = ratio
 
+        self._prepared_key = None
+
         if work_ratio is not None:
             self.links.scale_susceptibles(work_ratio)
 
@@ -604,13 +720,88 @@ class Network:
     def from_wards(wards, params: Parameters = None,
                    disease: Disease = None,
                    profiler=None,
-                   nthreads: int = 1):
+                   nthreads: int = 1,
+                   ward_order=None):
         """Construct a Network from the passed Wards object(e.g. after
-           editing, or restoring from JSON
+           editing, or restoring from JSON. If 'ward_order' is set then
+           the wards of the network are renumbered into this order
+           (see :meth:`Network.reorder_wards`)
         """
         from .utils._network_wards import load_from_wards
-        return load_from_wards(wards, params=params, disease=disease,
-                               profiler=profiler, nthreads=nthreads)
+        network = load_from_wards(wards, params=params, disease=disease,
+                                  profiler=profiler, nthreads=nthreads)
+
+        if ward_order is not None:
+            network.reorder_wards(ward_order, nthreads=nthreads,
+                                  profiler=profiler)
+
+        return network
+
+    def reorder_wards(self, order="hilbert", nthreads: int = 1,
+                      profiler=None):
+        """Renumber the wards (nodes) of this network into the passed
+           order, and sort the work and play links by the new numbers
+           of the wards they connect. This improves memory locality
+           (and so speed) of large networks, as wards that are linked
+           together are then close together in memory.
+
+           The renumbering is transparent, in that integer ward
+           indexes passed to :meth:`Network.get_node_index` (e.g. for
+           seeding or WardIDs) are still the original indexes, the
+           ward IDs saved by :meth:`Network.to_wards` are unchanged,
+           and per-ward outputs are written in the original order
+           (see :meth:`Network.in_original_order`).
+
+           Note that random numbers are drawn in a different order
+           in a renumbered network, so results are statistically
+           equivalent but not identical. Also note that a ValueError
+           is raised for a specialised sub-network that has its own
+           work matrix - reorder the network before specialising it.
+
+           Parameters
+           ----------
+           order: str or list[int]
+             Either "hilbert", to order the wards along a Hilbert
+             space-filling curve through their positions, or the
+             list of the current node indexes in their new order
+             (order[0] must be 0)
+           nthreads: int
+             Number of threads over which to parallelise this work
+           profiler: Profiler
+             The profiler used to profile this work
+
+           Returns
+           -------
+           network: Network
+             This network, after it has been renumbered
+        """
+        if isinstance(order, str):
+            if order == "hilbert":
+                from .utils._reorder_network import \
+                    get_space_filling_curve_order
+                order = get_space_filling_curve_order(self)
+            else:
+                raise ValueError(f"Unrecognised ward order '{order}'. "
+                                 f"Supported orders are 'hilbert' or a "
+                                 f"list of node indexes")
+
+        from .utils._reorder_network import reorder_network
+        reorder_network(self, order=order, nthreads=nthreads,
+                        profiler=profiler)
+
+        return self
+
+    def in_original_order(self, values) -> _List:
+        """Return the passed per-ward values (indexed by node index,
+           so values[0] is ignored) as a list in the original order
+           of the wards. This is the same as values[1:] unless the
+           wards have been renumbered (see
+           :meth:`Network.reorder_wards`)
+        """
+        if self._node_index is None:
+            return list(values[1:])
+
+        return [values[i] for i in self._node_index[1:]]
 
     def run(self, population: Population,
             output_dir: OutputFiles,
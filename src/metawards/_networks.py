@@ -3,7 +3,7 @@ from ._outputfiles import OutputFiles
 from ._population import Population
 from ._demographics import Demographics
 from ._parameters import Parameters
-from ._network import Network
+from ._network import Network, _get_prepared_key
 
 from dataclasses import dataclass as _dataclass
 from dataclasses import field as _field
@@ -131,30 +131,27 @@ class Networks:
 
         p = profiler.start("specialise")
 
-        subnets = []
-
-        # specialise the network for each demographic
-        for i in range(0, len(demographics)):
-            p = p.start(f"demographic_{i}")
-            subnets.append(network.specialise(demographic=demographics[i],
-                                              profiler=p,
-                                              nthreads=nthreads))
-            p = p.stop()
+        # copy the network for each demographic - the population is
+        # split between all of the copies below
+        p = p.start("copy_networks")
+        subnets = [demographic._copy_network(network)
+                   for demographic in demographics]
+        p = p.stop()
 
-        p = p.start("distribute_remainders")
-        from .utils._scale_susceptibles import distribute_remainders
-        distribute_remainders(network=network, subnets=subnets,
-                              demographics=demographics,
-                              profiler=p, nthreads=nthreads,
-                              random_seed=demographics.random_seed)
+        p = p.start("specialise_susceptibles")
+        Networks._specialise_susceptibles(network=network, subnets=subnets,
+                                          demographics=demographics,
+                                          nthreads=nthreads, profiler=p)
+        p = p.stop()
 
         # we have changed the population, so need to recalculate the
         # denominators again...
+        p = p.start("reset_subnets")
         for subnet in subnets:
             subnet.reset_everything(nthreads=nthreads, profiler=p)
             subnet.rescale_play_matrix(nthreads=nthreads, profiler=p)
             subnet.move_from_play_to_work(nthreads=nthreads, profiler=p)
-
+            subnet._prepared_key = _get_prepared_key(subnet.params)
         p = p.stop()
 
         total_pop = network.population
@@ -197,6 +194,109 @@ class Networks:
 
         return result
 
+    @staticmethod
+    def _specialise_susceptibles(network: Network, subnets: _List[Network],
+                                 demographics: Demographics,
+                                 nthreads: int = 1, profiler=None):
+        """Split the population of 'network' between the demographic
+           'subnets'. The split is loaded from the network cache
+           (see :func:`metawards.utils.get_network_cache_dir`) if
+           it has been calculated before for the same demographics
+           and input files, else it is calculated and then saved
+           to the cache
+        """
+        from .utils._network_cache import get_network_cache_dir
+
+        key = None
+
+        if get_network_cache_dir() is not None:
+            key = Networks._get_specialise_cache_key(network, demographics)
+
+        if key is not None:
+            from .utils._network_cache import load_from_network_cache
+            data = load_from_network_cache(key)
+
+            if data is not None and \
+                    Networks._load_populations(subnets, data):
+                from .utils._console import Console
+                Console.print("Using cached demographic populations...")
+                return
+
+        from .utils._scale_susceptibles import specialise_susceptibles
+        specialise_susceptibles(network=network, subnets=subnets,
+                                demographics=demographics,
+                                profiler=profiler, nthreads=nthreads,
+                                random_seed=demographics.random_seed)
+
+        if key is not None:
+            from .utils._network_cache import save_to_network_cache
+            save_to_network_cache(
+                key, {"play": [x.nodes.save_play_suscept for x in subnets],
+                      "work": [x.links.weight for x in subnets]})
+
+    @staticmethod
+    def _get_specialise_cache_key(network: Network,
+                                  demographics: Demographics):
+        """Return the network cache key for the split of the population
+           of 'network' between 'demographics', or None if this
+           cannot be cached
+        """
+        try:
+            demographics_data = demographics.to_data()
+        except Exception:
+            # e.g. this uses a Disease or InputFiles that was not
+            # loaded from a file
+            return None
+
+        if network.params is None:
+            input_files = None
+        else:
+            input_files = network.params.input_files
+
+        import hashlib
+        nodes_hash = hashlib.sha256(network.nodes.save_play_suscept)
+        links_hash = hashlib.sha256(network.links.weight)
+
+        from .utils._network_cache import network_cache_key, \
+            input_files_cache_key
+
+        return network_cache_key(
+                    "specialise",
+                    demographics=demographics_data,
+                    input_files=input_files_cache_key(input_files),
+                    nnodes=network.nnodes, nlinks=network.nlinks,
+                    players=nodes_hash.hexdigest(),
+                    workers=links_hash.hexdigest())
+
+    @staticmethod
+    def _load_populations(subnets: _List[Network], data) -> bool:
+        """Copy the cached populations in 'data' into the passed
+           subnets. Returns whether or not this was successful
+        """
+        try:
+            play = data["play"]
+            work = data["work"]
+        except Exception:
+            return False
+
+        if len(play) != len(subnets) or len(work) != len(subnets):
+            return False
+
+        for subnet, p, w in zip(subnets, play, work):
+            if len(p) != len(subnet.nodes.save_play_suscept) or \
+                    len(w) != len(subnet.links.weight):
+                return False
+
+        from copy import deepcopy
+
+        for subnet, p, w in zip(subnets, play, work):
+            subnet.nodes.save_play_suscept = deepcopy(p)
+            subnet.nodes.play_suscept = deepcopy(p)
+            subnet.links.weight = deepcopy(w)
+            subnet.links.suscept = deepcopy(w)
+
+        return True
+
     def copy(self):
         """Return a copy of this Networks. Use this to hold a copy of
            the networks that you can use to reset between runs
@@ -348,7 +448,10 @@ class Networks:
 
            This is used to update the parameters for the network
            for a new run. The network will be reset
-           and ready for a new run.
+           and ready for a new run. Only the demographic sub-networks
+           that have changed since they were last prepared (e.g.
+           because they have been run, or because the parameters
+           that affect their population have changed) are reset.
 
            Parameters
            ----------
@@ -375,7 +478,7 @@ class Networks:
             profiler = NullProfiler()
 
         p = profiler.start("overall.update")
-        self.overall.update(params, profiler=p)
+        self.overall.update(params, nthreads=nthreads, profiler=p)
         p = p.stop()
 
         if demographics is not None:
@@ -409,7 +512,8 @@ class Networks:
                 subnet_params = subnet_params.set_variables(
                     demographic.adjustment)
 
-            self.subnets[i].update(subnet_params, profiler=p)
+            self.subnets[i].update(subnet_params, nthreads=nthreads,
+                                   profiler=p)
             p = p.stop()
 
     def initialise_infections(self, nthreads: int = 1):
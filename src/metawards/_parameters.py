@@ -63,6 +63,29 @@ def generate_repository_version(repository):
                        stderr=subprocess.DEVNULL)
 
 
+def _get_git_state(repository: str):
+    """Return the (commit, is_dirty) state of the git repository
+       in 'repository', or None if this cannot be found
+    """
+    import subprocess
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"],
+                                cwd=repository, capture_output=True,
+                                check=True, text=True).stdout.strip()
+
+        status = subprocess.run(["git", "status", "--porcelain"],
+                                cwd=repository, capture_output=True,
+                                check=True, text=True).stdout.strip()
+    except Exception:
+        return None
+
+    if len(commit) == 0:
+        return None
+
+    return (commit, len(status) > 0)
+
+
 def get_repository_version(repository: str):
     """Read and return the Git version of the passed repository
 
@@ -99,6 +122,33 @@ def get_repository_version(repository: str):
     except Exception:
         pass
 
+    # the version may have been generated by another process and
+    # saved to the network cache - this is keyed by the git commit
+    # and whether or not there are uncommitted changes, so is
+    # regenerated whenever the repository changes
+    from .utils._network_cache import network_cache_key, \
+        load_from_network_cache, save_to_network_cache, \
+        get_network_cache_dir
+
+    if get_network_cache_dir() is None:
+        key = None
+    else:
+        state = _get_git_state(repository)
+
+        if state is None:
+            key = None
+        else:
+            key = network_cache_key("repository_version",
+                                    repository=repository,
+                                    commit=state[0], is_dirty=state[1])
+
+    if key is not None:
+        version = load_from_network_cache(key)
+
+        if version is not None:
+            _repositories[repository] = version
+            return version
+
     # could not get the version, so see if we have permission
     # to run the 'version' program
     try:
@@ -109,7 +159,10 @@ def get_repository_version(repository: str):
             version = json.load(FILE)
             version["filepath"] = repository
             _repositories[repository] = version
-            return version
+
+        # only successfully-generated versions are saved
+        if key is not None:
+            save_to_network_cache(key, version)
     except Exception:
         from .utils._console import Console
         Console.error(f"""
@@ -121,7 +174,8 @@ info.""")
                                      "version": "unknown",
                                      "branch": "unknown",
                                      "is_dirty": True}
-        return _repositories[repository]
+
+    return _repositories[repository]
 
 
 @_dataclass
@@ -330,20 +384,24 @@ class Parameters:
 
         json_file = filename
 
-        try:
-            with open(json_file, "r") as FILE:
-                import json
-                data = json.load(FILE)
+        def _load():
+            try:
+                with open(json_file, "r") as FILE:
+                    import json
+                    return json.load(FILE)
 
-        except Exception as e:
-            from .utils._console import Console
-            Console.error(f"""
+            except Exception as e:
+                from .utils._console import Console
+                Console.error(f"""
 Could not find the parameters file {json_file}. Either it does not exist or
 was corrupted. Error was {e.__class__} {e}. "Please see
 https://metawards.org/model_data for instructions on how to download and
 set the model data.""")
-            raise FileNotFoundError(f"Could not find or read {json_file}: "
-                                    f"{e.__class__} {e}")
+                raise FileNotFoundError(f"Could not find or read {json_file}: "
+                                        f"{e.__class__} {e}")
+
+        from .utils._load_cache import load_cached
+        data = load_cached("parameters", json_file, _load)
 
         par = Parameters(
             length_day=data.get("length_day", 0.7),
@@ -403,6 +461,42 @@ set the model data.""")
 
         return params
 
+    def _copy_for_adjustment(self):
+        """Return a copy of these parameters that can be safely adjusted
+           by a VariableSet. This is much quicker than a deep copy, as
+           only the disease, user parameters, lists and specialised
+           demographic parameters are copied. Everything else (e.g.
+           the input files) is shared with this object
+        """
+        from copy import copy, deepcopy
+        params = copy(self)
+
+        if self.disease_params is not None:
+            disease = copy(self.disease_params)
+
+            for key, value in list(disease.__dict__.items()):
+                if isinstance(value, list):
+                    setattr(disease, key, list(value))
+
+            params.disease_params = disease
+
+        if self.user_params is not None:
+            params.user_params = deepcopy(self.user_params)
+
+        if self.additional_seeds is not None:
+            params.additional_seeds = list(self.additional_seeds)
+
+        if self.adjustments is not None:
+            params.adjustments = list(self.adjustments)
+
+        if self._subparams is not None:
+            params._subparams = {}
+
+            for key, value in self._subparams.items():
+                params._subparams[key] = value._copy_for_adjustment()
+
+        return params
+
     def specialised_demographics(self) -> _List[str]:
         """Return the names of demographics that have specialised
            parameters that are different to those of the overall
@@ -492,8 +586,7 @@ set the model data.""")
            params: Parameters
              A copy of this set of parameters with the variables adjusted
         """
-        from copy import deepcopy
-        params = deepcopy(self)
+        params = self._copy_for_adjustment()
 
         if isinstance(variables, dict):
             variables = VariableSet(variables)
@@ -2,7 +2,6 @@
 from dataclasses import dataclass as _dataclass
 from typing import List as _List
 from typing import Dict as _Dict
-from copy import deepcopy as _deepcopy
 from datetime import date as _date
 
 __all__ = ["Population", "Populations"]
@@ -393,40 +392,329 @@ class Population:
         return summary + "\n" + table.to_string()
 
 
-@_dataclass
+#: Sentinel used to hold None in an integer column
+_NONE = -2**63
+
+#: Sentinel used to hold a missing value (e.g. a missing key in
+#: 'totals') in an integer column
+_MISSING_INT = -2**63 + 1
+
+
+class _Missing:
+    """Marker for a missing value in a column"""
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        return (_get_missing, ())
+
+
+_MISSING = _Missing()
+
+
+def _get_missing():
+    return _MISSING
+
+
+class _Column:
+    """A growable column of values. Integers (and dates) are held in
+       a compact 64-bit integer array, and floats in a double array.
+       None and missing values in integer columns are held using
+       sentinels. The column switches to a plain list if a value is
+       added that cannot be held in its array
+    """
+    __slots__ = ("_kind", "_values", "_has_sentinels")
+
+    def __init__(self, kind: str, nmissing: int = 0):
+        from array import array
+
+        self._kind = kind
+        self._has_sentinels = nmissing > 0
+
+        if kind == "int" or kind == "date":
+            self._values = array("q", [_MISSING_INT]) * nmissing
+        elif kind == "float":
+            self._values = array("d")
+
+            if nmissing > 0:
+                self._to_list()
+                self._values += [_MISSING] * nmissing
+        else:
+            self._values = [_MISSING] * nmissing
+
+    @staticmethod
+    def kind_of(value) -> str:
+        """Return the kind of column that best holds 'value'"""
+        if type(value) is float:
+            return "float"
+        elif type(value) is _date:
+            return "date"
+        else:
+            return "int"
+
+    def __len__(self):
+        return len(self._values)
+
+    def _to_list(self):
+        """Switch this column to a plain list"""
+        self._values = self.values(missing=_MISSING)
+        self._kind = "object"
+
+    def _encode(self, value):
+        """Return 'value' encoded for the array of this column, or
+           raise a TypeError if that is not possible
+        """
+        if self._kind == "int":
+            if value is None:
+                self._has_sentinels = True
+                return _NONE
+            elif isinstance(value, bool):
+                raise TypeError()
+            elif isinstance(value, int) or \
+                    (hasattr(value, "__index__") and
+                     not isinstance(value, float)):
+                value = int(value)
+
+                if value <= _MISSING_INT or value >= 2**63:
+                    raise TypeError()
+
+                return value
+        elif self._kind == "date":
+            if value is None:
+                self._has_sentinels = True
+                return _NONE
+            elif type(value) is _date:
+                return value.toordinal()
+        elif self._kind == "float":
+            if type(value) is float:
+                return value
+
+        raise TypeError()
+
+    def _decode(self, value, missing):
+        """Return the value of the passed array entry"""
+        if self._kind == "int" or self._kind == "date":
+            if value == _NONE:
+                return None
+            elif value == _MISSING_INT:
+                return missing
+            elif self._kind == "date":
+                return _date.fromordinal(value)
+
+        return value
+
+    def append(self, value):
+        """Append 'value' to this column"""
+        if self._kind != "object":
+            try:
+                self._values.append(self._encode(value))
+                return
+            except (TypeError, OverflowError):
+                self._to_list()
+
+        self._values.append(value)
+
+    def append_missing(self, n: int = 1):
+        """Append 'n' missing values to this column"""
+        if self._kind == "int" or self._kind == "date":
+            from array import array
+            self._values.extend(array("q", [_MISSING_INT]) * n)
+            self._has_sentinels = True
+        else:
+            if self._kind != "object":
+                self._to_list()
+
+            self._values.extend([_MISSING] * n)
+
+    def extend(self, other):
+        """Extend this column with the values in column 'other'"""
+        if self._kind == other._kind and self._kind != "object":
+            self._values.extend(other._values)
+            self._has_sentinels = self._has_sentinels or \
+                other._has_sentinels
+        else:
+            if self._kind != "object":
+                self._to_list()
+
+            self._values.extend(other.values(missing=_MISSING))
+
+    def get(self, i: int, missing=None):
+        """Return the ith value, returning 'missing' if it is missing"""
+        value = self._values[i]
+
+        if self._kind == "object":
+            return missing if value is _MISSING else value
+        else:
+            return self._decode(value, missing)
+
+    def values(self, missing=None) -> _List:
+        """Return all of the values as a list, with missing values
+           replaced by 'missing'
+        """
+        if self._kind == "float":
+            return self._values.tolist()
+        elif self._kind == "object":
+            return [missing if value is _MISSING else value
+                    for value in self._values]
+        elif self._kind == "int" and not self._has_sentinels:
+            return self._values.tolist()
+        else:
+            return [self._decode(value, missing) for value in self._values]
+
+
+#: The fields of Population that are held in columns
+_fields = ["initial", "susceptibles", "latent", "total", "recovereds",
+           "n_inf_wards", "scale_uv", "day", "date"]
+
+#: The fields of Population that are dictionaries of values
+_dict_fields = ["totals", "other_totals"]
+
+
 class Populations:
     """This class holds the trajectory of Population objects recorded
-       for every step (day) of a model outbreak
+       for every step (day) of a model outbreak. The trajectory is
+       held in columns, with one (growable, compact) array for each
+       of the values of Population, e.g. one for 'susceptibles',
+       one for each of the 'totals' etc. Each demographic is held
+       in its own Populations. This means that appending a day does
+       not create any new objects, and that the trajectory is small
+       and quick to pickle. The Population for each day is created
+       when it is indexed.
     """
-    #: The trajectory of Population objects
-    _trajectory: _List[Population] = None
+
+    def __init__(self):
+        #: The number of days (Population objects) in the trajectory
+        self._n = 0
+
+        #: The column for each value, keyed by field name, or
+        #: by (dict_field, key) for the values in totals and other_totals
+        self._columns = {}
+
+        #: The Populations for each of the demographics
+        self._subpops = []
 
     def __str__(self):
         if len(self) == 0:
             return "Populations:empty"
         else:
-            return f"Latest: {self._trajectory[-1]}"
+            return f"Latest: {self[-1]}"
+
+    def __eq__(self, other):
+        if not isinstance(other, Populations):
+            return False
+        elif len(self) != len(other):
+            return False
+
+        for p0, p1 in zip(self, other):
+            if p0 != p1:
+                return False
+
+        return True
+
+    def _get_population(self, i: int) -> Population:
+        """Create and return the Population for the ith day"""
+        values = {}
+
+        for field in _fields:
+            column = self._columns.get(field, None)
+
+            if column is not None:
+                value = column.get(i, missing=_MISSING)
+
+                if value is not _MISSING:
+                    values[field] = value
+
+        for field in _dict_fields:
+            if self._columns[field].get(i):
+                d = {}
+
+                for key, column in self._columns.items():
+                    if isinstance(key, tuple) and key[0] == field:
+                        value = column.get(i, missing=_MISSING)
+
+                        if value is not _MISSING:
+                            d[key[1]] = value
+
+                values[field] = d
+            else:
+                values[field] = None
+
+        population = Population(**values)
+
+        nsubpops = self._columns["nsubpops"].get(i)
+
+        if nsubpops is not None:
+            population.subpops = [self._subpops[j]._get_population(i)
+                                  for j in range(0, nsubpops)]
+
+        return population
 
     def __getitem__(self, i: int):
         """Return the ith Population in the trajectory"""
-        if self._trajectory is None:
+        if isinstance(i, slice):
+            return [self._get_population(j)
+                    for j in range(0, self._n)[i]]
+
+        if self._n == 0:
             raise IndexError("No trajectory data collected")
-        else:
-            return self._trajectory[i]
+
+        i = int(i)
+
+        if i < 0:
+            i += self._n
+
+        if i < 0 or i >= self._n:
+            raise IndexError(f"Index {i} out of range for a trajectory "
+                             f"with {self._n} days")
+
+        return self._get_population(i)
 
     def __len__(self):
-        if self._trajectory is None:
-            return 0
+        return self._n
+
+    def __iter__(self):
+        for i in range(0, self._n):
+            yield self._get_population(i)
+
+    @property
+    def subpops(self):
+        """The trajectories (Populations) of each of the demographics"""
+        return self._subpops
+
+    def get_column(self, field: str, key: str = None,
+                   missing=None) -> _List:
+        """Return all of the values of 'field' (e.g. "susceptibles")
+           over the trajectory as a list. If 'key' is set, then this
+           returns the values of 'key' in the dictionary 'field'
+           (e.g. field="totals", key="H"). Values that are missing
+           (e.g. the key isn't in the dictionary) are set to 'missing'
+        """
+        if key is not None:
+            field = (field, key)
+
+        column = self._columns.get(field, None)
+
+        if column is None:
+            return [missing] * self._n
         else:
-            return len(self._trajectory)
+            return column.values(missing=missing)
+
+    def _append_value(self, key, value):
+        """Append 'value' to the column 'key', creating it if needed"""
+        column = self._columns.get(key, None)
+
+        if column is None:
+            column = _Column(_Column.kind_of(value), nmissing=self._n)
+            self._columns[key] = column
+
+        column.append(value)
 
     def strip_demographics(self):
-        """Remove the demographics information from this trajectory. This
-           makes it much smaller and easier to transmit over a network
+        """Return this trajectory ready to be returned from a model run.
+           As the trajectory is held in compact columns it is already
+           small and quick to send over a network, so the
+           demographics are kept
         """
-        for value in self._trajectory:
-            value._subpops = None
-
         return self
 
     def append(self, population: Population):
@@ -440,7 +728,112 @@ class Populations:
         if not isinstance(population, Population):
             raise TypeError("Only Population objects should be recorded!")
 
-        if self._trajectory is None:
-            self._trajectory = []
+        append = self._append_value
+
+        for field in _fields:
+            append(field, getattr(population, field))
+
+        nvalues = len(_fields) + len(_dict_fields) + 1
+
+        for field in _dict_fields:
+            d = getattr(population, field)
+            append(field, 0 if d is None else 1)
+
+            if d is not None:
+                nvalues += len(d)
+
+                for key, value in d.items():
+                    append((field, key), value)
+
+        subpops = population.subpops
+
+        if subpops is None:
+            append("nsubpops", None)
+            subpops = []
+        else:
+            append("nsubpops", len(subpops))
+
+        for j, subpop in enumerate(subpops):
+            if j >= len(self._subpops):
+                self._subpops.append(Populations._empty(self._n))
+
+            self._subpops[j].append(subpop)
+
+        self._n += 1
+
+        if nvalues != len(self._columns):
+            # pad out any columns that were not in this population
+            for column in self._columns.values():
+                if len(column) < self._n:
+                    column.append_missing(self._n - len(column))
+
+        if len(subpops) != len(self._subpops):
+            for subpop in self._subpops:
+                if len(subpop) < self._n:
+                    subpop._append_empty(self._n - len(subpop))
+
+    @staticmethod
+    def _empty(n: int):
+        """Return a Populations with 'n' empty (all missing) days"""
+        p = Populations()
+        p._append_empty(n)
+        return p
+
+    def _append_empty(self, n: int):
+        """Append 'n' empty (all missing) days"""
+        if n <= 0:
+            return
+
+        self._n += n
+
+        for key in _fields + ["nsubpops"]:
+            if key not in self._columns:
+                self._columns[key] = _Column("int")
+
+        for key in _dict_fields:
+            if key not in self._columns:
+                self._columns[key] = _Column("int")
+
+        for column in self._columns.values():
+            column.append_missing(self._n - len(column))
+
+        for subpop in self._subpops:
+            subpop._append_empty(self._n - len(subpop))
+
+    def extend(self, other):
+        """Extend this trajectory with all of the days in 'other'.
+           This is done a column at a time
+
+           Parameters
+           ----------
+           other: Populations
+             The trajectory to add to the end of this one
+        """
+        if not isinstance(other, Populations):
+            for population in other:
+                self.append(population)
+            return
+
+        n = self._n + other._n
+
+        for key, column in other._columns.items():
+            if key not in self._columns:
+                self._columns[key] = _Column(column._kind, nmissing=self._n)
+
+            self._columns[key].extend(column)
+
+        for j, subpop in enumerate(other._subpops):
+            if j >= len(self._subpops):
+                self._subpops.append(Populations._empty(self._n))
+
+            self._subpops[j].extend(subpop)
+
+        self._n = n
+
+        for column in self._columns.values():
+            if len(column) < n:
+                column.append_missing(n - len(column))
 
-        self._trajectory.append(_deepcopy(population))
+        for subpop in self._subpops:
+            if len(subpop) < n:
+                subpop._append_empty(n - len(subpop))
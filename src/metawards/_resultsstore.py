@@ -0,0 +1,409 @@
+from typing import List as _List
+from typing import Tuple as _Tuple
+
+__all__ = ["ResultsStore"]
+
+
+def _pack_directory(path: str) -> bytes:
+    """Pack all of the files in the directory 'path' into an
+       (uncompressed) tar archive, which is returned as bytes.
+       The names in the archive are relative to 'path'
+    """
+    import io
+    import os
+    import tarfile
+
+    buffer = io.BytesIO()
+
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+
+            for filename in sorted(files):
+                filename = os.path.join(root, filename)
+                tar.add(filename, arcname=os.path.relpath(filename, path),
+                        recursive=False)
+
+    return buffer.getvalue()
+
+
+class ResultsStore:
+    """This class holds the output files of all of the model runs
+       of a sweep in a small number of container (tar) files, called
+       shards, rather than in one directory per model run. This
+       greatly reduces the number of files that are created, which
+       is important on shared (e.g. Lustre or GPFS) filesystems,
+       where creating hundreds of thousands of small files puts a
+       large load on the metadata servers.
+
+       The store is placed in a directory (normally the main output
+       directory). This contains the shards (runs_000.tar,
+       runs_001.tar etc.) and an index (runs_index.csv) that gives
+       the fingerprint, repeat, name and shard of each run. All of
+       the files of a run are placed under its name in its shard,
+       so extracting all shards recreates the normal one directory
+       per run layout.
+
+       Only a single process (the main process of the sweep) writes
+       to the store. Workers send their packed output to this
+       process, which appends it to the shard, so no locking is
+       needed, and this works for all parallel schemes.
+
+       Use this class to read the output of a single run, e.g.
+
+       >>> store = ResultsStore("output")
+       >>> for (fingerprint, repeat) in store.runs():
+       ...     print(fingerprint, repeat, store.files(fingerprint, repeat))
+       >>> FILE = store.open(fingerprint, repeat, "trajectory.csv")
+
+       Runs are held under their unique name, so design rows that
+       are duplicated (and so have the same fingerprint and repeat)
+       are all kept. Use :meth:`~metawards.ResultsStore.names` to
+       list these, and pass 'name' to read them, e.g.
+
+       >>> for name in store.names():
+       ...     FILE = store.open(filename="trajectory.csv", name=name)
+
+       Note that files that were bz2-compressed are decompressed
+       automatically when they are opened.
+    """
+
+    _index_filename = "runs_index.csv"
+
+    def __init__(self, path: str, nshards: int = None):
+        """Create a store that is held in the directory 'path'
+
+           Parameters
+           ----------
+           path: str
+             The directory containing the store
+           nshards: int
+             The number of shards over which to spread the runs. This
+             is only needed when writing. All of the repeats of a
+             fingerprint are written to the same shard.
+        """
+        from ._outputfiles import _expand
+        import os
+
+        self._path = os.path.abspath(_expand(path))
+
+        if nshards is None:
+            nshards = 1
+        else:
+            nshards = int(nshards)
+
+        if nshards < 1:
+            raise ValueError(f"The number of shards must be 1 or more, "
+                             f"not {nshards}")
+
+        self._nshards = nshards
+
+        self._index = None
+        self._aliases = {}
+        self._writers = {}
+        self._readers = {}
+        self._index_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return f"ResultsStore('{self._path}', nshards={self._nshards})"
+
+    def get_path(self):
+        """Return the full path to the directory containing the store"""
+        return self._path
+
+    def close(self):
+        """Close all of the shards and the index. This must be called
+           once all runs have been written
+        """
+        for tar in list(self._writers.values()) + \
+                list(self._readers.values()):
+            tar.close()
+
+        if self._index_file is not None:
+            self._index_file.close()
+
+        self._writers = {}
+        self._readers = {}
+        self._index_file = None
+
+    def _get_shard(self, fingerprint: str) -> str:
+        """Return the filename of the shard for 'fingerprint'"""
+        import zlib
+        shard = zlib.crc32(fingerprint.encode("utf-8")) % self._nshards
+        return "runs_%03d.tar" % shard
+
+    def _read_index(self):
+        """Read and return the index, which is a dictionary of
+           name => (fingerprint, repeat, shard). The name of each run
+           is unique (it is the name of the directory that the run
+           would have written to), while duplicated design rows will
+           give multiple runs with the same fingerprint and repeat
+        """
+        if self._index is not None:
+            return self._index
+
+        import csv
+        import os
+
+        self._index = {}
+        self._aliases = {}
+
+        filename = os.path.join(self._path, ResultsStore._index_filename)
+
+        if not os.path.exists(filename):
+            return self._index
+
+        with open(filename, newline="") as FILE:
+            for row in csv.DictReader(FILE):
+                self._add_to_index(name=row["name"],
+                                   fingerprint=row["fingerprint"],
+                                   repeat=int(row["repeat"]),
+                                   shard=row["shard"])
+
+        return self._index
+
+    def _add_to_index(self, name: str, fingerprint: str, repeat: int,
+                      shard: str):
+        """Add the passed run to the index. (fingerprint, repeat) is
+           kept as an alias for the first run with that name
+        """
+        self._index[name] = (fingerprint, repeat, shard)
+        self._aliases.setdefault((fingerprint, repeat), name)
+
+    def add(self, fingerprint: str, repeat: int, name: str, archive: bytes):
+        """Add the output of a run to the store
+
+           Parameters
+           ----------
+           fingerprint: str
+             The fingerprint of the VariableSet used for the run
+           repeat: int
+             The repeat index of the run
+           name: str
+             The name of the run, which would have been the name
+             of its output directory. This must be unique, and
+             is used to find the run if there are several runs
+             with the same fingerprint and repeat
+           archive: bytes
+             The tar archive of the output files of the run, as
+             created by :meth:`~metawards.ResultsStore.pack`
+        """
+        import io
+        import os
+        import tarfile
+
+        index = self._read_index()
+        fingerprint = str(fingerprint)
+        repeat = int(repeat)
+        name = str(name)
+
+        if name in index:
+            raise KeyError(f"The store already contains a run called "
+                           f"{name}")
+
+        shard = self._get_shard(fingerprint)
+
+        if shard not in self._writers:
+            os.makedirs(self._path, exist_ok=True)
+            self._writers[shard] = tarfile.open(
+                os.path.join(self._path, shard), mode="a")
+
+        writer = self._writers[shard]
+
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r") as tar:
+            for member in tar.getmembers():
+                data = tar.extractfile(member)
+                member.name = f"{name}/{member.name}"
+                writer.addfile(member, data)
+
+        writer.fileobj.flush()
+
+        if self._index_file is None:
+            import csv
+            filename = os.path.join(self._path, ResultsStore._index_filename)
+            exists = os.path.exists(filename)
+            self._index_file = open(filename, "a", newline="")
+            self._index_writer = csv.writer(self._index_file)
+
+            if not exists:
+                self._index_writer.writerow(["fingerprint", "repeat",
+                                             "name", "shard"])
+
+        self._index_writer.writerow([fingerprint, repeat, name, shard])
+        self._index_file.flush()
+
+        self._add_to_index(name=name, fingerprint=fingerprint,
+                           repeat=repeat, shard=shard)
+
+    def add_directory(self, fingerprint: str, repeat: int, name: str,
+                      path: str):
+        """Add all of the files in the directory 'path' as the output
+           of a run to the store, removing the directory afterwards.
+           The arguments are as for :meth:`~metawards.ResultsStore.add`
+        """
+        import shutil
+        self.add(fingerprint=fingerprint, repeat=repeat, name=name,
+                 archive=ResultsStore.pack(path))
+        shutil.rmtree(path)
+
+    @staticmethod
+    def pack(path: str) -> bytes:
+        """Pack all of the files in the directory 'path' into a
+           tar archive that can be added to a store via
+           :meth:`~metawards.ResultsStore.add`. This is called by
+           the workers, so that they only need to send a single
+           object back to the main process.
+        """
+        return _pack_directory(path)
+
+    @staticmethod
+    def create_scratch_dir() -> str:
+        """Create and return a new, empty scratch directory in which
+           a run can write its output before it is packed. This is
+           created in the system temporary directory (set via the
+           TMPDIR environment variable), which should be a local
+           disk on each compute node
+        """
+        import tempfile
+        return tempfile.mkdtemp(prefix="metawards_run_")
+
+    def runs(self) -> _List[_Tuple[str, int]]:
+        """Return the (fingerprint, repeat) of all of the runs in the
+           store, in the order in which they were written. Note that
+           this will contain duplicates if the same design row was
+           run multiple times - use
+           :meth:`~metawards.ResultsStore.names` to get the unique
+           names of the runs
+        """
+        return [(f, r) for (f, r, _) in self._read_index().values()]
+
+    def names(self) -> _List[str]:
+        """Return the unique names of all of the runs in the store,
+           in the order in which they were written
+        """
+        return list(self._read_index().keys())
+
+    def get_name(self, fingerprint: str, repeat: int = 1) -> str:
+        """Return the name of the run with the passed fingerprint
+           and repeat. This is the name of the directory of the run
+           in its shard. If several runs have this fingerprint and
+           repeat, then the name of the first run is returned
+        """
+        self._read_index()
+
+        try:
+            return self._aliases[(str(fingerprint), int(repeat))]
+        except KeyError:
+            raise KeyError(f"There is no run with fingerprint "
+                           f"{fingerprint}, repeat {repeat} in {self}")
+
+    def _get_reader(self, fingerprint: str, repeat: int, name: str = None):
+        """Return the (name, open tarfile) for the passed run, which
+           is found by name if this is passed, else by
+           fingerprint and repeat
+        """
+        import os
+        import tarfile
+
+        if name is None:
+            name = self.get_name(fingerprint, repeat)
+
+        try:
+            shard = self._read_index()[name][2]
+        except KeyError:
+            raise KeyError(f"There is no run called {name} in {self}")
+
+        if shard in self._writers:
+            # make sure that everything written is visible
+            self._writers[shard].fileobj.flush()
+            self._readers.pop(shard, None)
+
+        if shard not in self._readers:
+            self._readers[shard] = tarfile.open(
+                os.path.join(self._path, shard), mode="r")
+
+        return (name, self._readers[shard])
+
+    def files(self, fingerprint: str = None, repeat: int = 1,
+              name: str = None) -> _List[str]:
+        """Return the names of all of the output files of the passed
+           run. The run is found by 'name' if this is passed, or
+           else by 'fingerprint' and 'repeat'
+        """
+        (name, tar) = self._get_reader(fingerprint, repeat, name)
+        prefix = f"{name}/"
+
+        return [member.name[len(prefix):] for member in tar.getmembers()
+                if member.isfile() and member.name.startswith(prefix)]
+
+    def read(self, fingerprint: str = None, repeat: int = 1,
+             filename: str = None, name: str = None) -> bytes:
+        """Return the contents of the file 'filename' of the passed run.
+           If this file doesn't exist, but 'filename'.bz2 does, then
+           the decompressed contents of that are returned. The run
+           is found as for :meth:`~metawards.ResultsStore.files`
+        """
+        if filename is None:
+            raise ValueError("You must pass the filename to read")
+
+        (name, tar) = self._get_reader(fingerprint, repeat, name)
+
+        try:
+            member = tar.getmember(f"{name}/{filename}")
+            is_bz2 = False
+        except KeyError:
+            try:
+                member = tar.getmember(f"{name}/{filename}.bz2")
+                is_bz2 = True
+            except KeyError:
+                raise FileNotFoundError(
+                    f"There is no file {filename} for the run {name}")
+
+        data = tar.extractfile(member).read()
+
+        if is_bz2:
+            import bz2
+            data = bz2.decompress(data)
+
+        return data
+
+    def open(self, fingerprint: str = None, repeat: int = 1,
+             filename: str = None, name: str = None):
+        """Return an open, read-only text file for the file 'filename'
+           of the passed run. This can be passed directly to e.g.
+           pandas.read_csv. bz2 files are decompressed as for
+           :meth:`~metawards.ResultsStore.read`
+        """
+        import io
+        return io.StringIO(self.read(fingerprint, repeat, filename,
+                                     name=name).decode("utf-8"))
+
+    def extract(self, fingerprint: str = None, repeat: int = 1,
+                path: str = None, name: str = None) -> str:
+        """Extract all of the output files of the passed run into the
+           directory 'path', returning the full path to the directory
+           containing the files (which is path/name). The run is
+           found as for :meth:`~metawards.ResultsStore.files`
+        """
+        import os
+
+        if path is None:
+            raise ValueError("You must pass the path to extract to")
+
+        (name, tar) = self._get_reader(fingerprint, repeat, name)
+        prefix = f"{name}/"
+
+        members = [member for member in tar.getmembers()
+                   if member.isfile() and member.name.startswith(prefix)]
+
+        path = os.path.abspath(path)
+        tar.extractall(path=path, members=members)
+
+        return os.path.join(path, name)
@@ -4,6 +4,7 @@ from typing import Dict as _Dict
 from typing import Union as _Union
 
 from datetime import date as _date
+from functools import lru_cache as _lru_cache
 
 __all__ = ["VariableSets", "VariableSet"]
 
@@ -181,6 +182,114 @@ _adjustable["bg_foi"] = _set_bg_foi
 _adjustable["UV_max"] = _set_UV_max
 
 
+@_lru_cache(maxsize=4096)
+def _parse_index(name: str):
+    """Parse the name of an adjustable variable into the variable name
+       and index (or None if there is no index). This is cached, as
+       the same names are parsed for every VariableSet in a
+       VariableSets
+    """
+    import re
+
+    m = re.search(r"([\s:\.\w]+)\[\s*([\d+]|\".+\"|'.+')\s*\]", name)
+
+    if m:
+        varname = m.group(1)
+
+        index = m.group(2)
+
+        if index.startswith('"') or index.startswith("'"):
+            index = index[1:-1]
+        else:
+            index = int(index)
+
+        return (varname, index)
+    else:
+        return (name, None)
+
+
+class _AdjustmentPlan:
+    """A compiled plan of the setter functions, demographics and indicies
+       needed to apply the variables of a VariableSet to a Parameters
+       object. This is compiled once for each unique set of variable
+       names, so that each VariableSet in a VariableSets does not need
+       to look these up again
+    """
+
+    def __init__(self, varnames, varidxs):
+        # adjust global (all demographic) variables first, then the
+        # demographic-specific values (except for 'overall', which
+        # must be done last)
+        steps = ([], [], [])
+
+        for i, (varname, varidx) in enumerate(zip(varnames, varidxs)):
+            if isinstance(varname, tuple):
+                demographic, varname = varname
+                order = 2 if demographic == "overall" else 1
+            else:
+                demographic = None
+                order = 0
+
+            if varname.startswith("user.") or varname.startswith("."):
+                setter = _adjustable["user"]
+            elif varname in _adjustable:
+                setter = _adjustable[varname]
+            elif demographic is None:
+                raise KeyError(f"Cannot set unrecognised parameter "
+                               f"{varname}")
+            else:
+                raise KeyError(f"Cannot set unrecognised parameter "
+                               f"{varname} in demographic {demographic}")
+
+            steps[order].append((i, demographic, setter, varname, varidx))
+
+        self._steps = steps[0] + steps[1] + steps[2]
+
+        #: The (sorted) names of the demographics that are specifically
+        #: adjusted by this plan
+        self.demographics = sorted({x[1] for x in self._steps
+                                    if x[1] is not None})
+
+    def apply(self, params, values):
+        """Apply the passed values to 'params' using this plan"""
+        specialised = params.specialised_demographics()
+
+        for (i, demographic, setter, name, index) in self._steps:
+            value = values[i]
+
+            if demographic is None:
+                setter(params=params, name=name, index=index, value=value)
+
+                for s in specialised:
+                    setter(params=params[s], name=name, index=index,
+                           value=value)
+            else:
+                setter(params=params[demographic], name=name, index=index,
+                       value=value)
+
+
+#: Cache of the compiled _AdjustmentPlan objects, keyed by the
+#: variable names and indicies
+_plans = {}
+
+
+def _get_plan(varnames, varidxs) -> _AdjustmentPlan:
+    """Return the (cached) compiled plan for the passed variables"""
+    key = (tuple(varnames), tuple(varidxs))
+
+    plan = _plans.get(key, None)
+
+    if plan is None:
+        plan = _AdjustmentPlan(varnames, varidxs)
+
+        if len(_plans) > 1024:
+            _plans.clear()
+
+        _plans[key] = plan
+
+    return plan
+
+
 def _clean(x):
     """Clean the passed string by stripping off unnecesary characters,
        and turning "True" and "False" into 1 and 0. Also change
@@ -202,6 +311,45 @@ def _clean(x):
         return x
 
 
+def _clean_line(line):
+    """Clean all of the fields in the passed line (a list of strings),
+       flattening any fields that have been split by '_clean'
+    """
+    cleaned = []
+
+    for clean in [_clean(x) for x in line]:
+        if isinstance(clean, list) or isinstance(clean, tuple):
+            for c in clean:
+                if len(c) > 0:
+                    cleaned.append(c)
+        else:
+            cleaned.append(clean)
+
+    return cleaned
+
+
+def _sniff_dialect(line: str, filename: str):
+    """Guess the csv dialect of the file 'filename' (space or comma
+       separated, newline character etc.) from its first line
+    """
+    import csv
+
+    try:
+        return csv.Sniffer().sniff(line, delimiters=[" ", ","])
+    except Exception:
+        words = line.strip().split(" ")
+
+        if len(words) > 1:
+            from .utils._console import Console
+            Console.warning(
+                f"Could not identify what sort of separator to use to "
+                f"read {filename}, so will assume commas. If this is "
+                f"wrong, then could you add commas to separate the "
+                f"fields?")
+
+        return csv.excel  #  default comma-separated file
+
+
 def _interpret(value):
     if not isinstance(value, str):
         return value
@@ -457,8 +605,6 @@ class VariableSet:
         """Internal function to add a new variable called 'name' to
            be varied - it will be set equal to 'value'
         """
-        import re
-
         if self._vals is None:
             self._names = []
             self._vals = []
@@ -482,23 +628,7 @@ class VariableSet:
         # look for 'variable[index]', demographic:variable[index],
         # .variable[index], user.variable[index],
         # variable["key"], variable['key'] and all combinations of above
-        m = re.search(r"([\s:\.\w]+)\[\s*([\d+]|\".+\"|'.+')\s*\]", name)
-
-        if m:
-            varname = m.group(1)
-
-            index = m.group(2)
-
-            if index.startswith('"') or index.startswith("'"):
-                index = index[1:-1]
-            else:
-                index = int(index)
-
-            value = value
-        else:
-            varname = name
-            index = None
-            value = value
+        (varname, index) = _parse_index(name)
 
         if varname.find(":") != -1:
             # this sets the variable in a demographic
@@ -902,98 +1032,8 @@ class VariableSet:
             return
 
         try:
-            # loop over all adjustable variables, and adjust global
-            # (all demographic) variables first
-            specialised = params.specialised_demographics()
-
-            for varname, varidx, value in zip(self._varnames, self._varidxs,
-                                              self._vals):
-                if isinstance(varname, tuple):
-                    continue
-
-                if varname.startswith("user.") or varname.startswith("."):
-                    _adjustable["user"](params=params,
-                                        name=varname,
-                                        index=varidx,
-                                        value=value)
-                    for s in specialised:
-                        _adjustable["user"](params=params[s],
-                                            name=varname,
-                                            index=varidx,
-                                            value=value)
-
-                elif varname in _adjustable:
-                    _adjustable[varname](params=params,
-                                         name=varname,
-                                         index=varidx,
-                                         value=value)
-                    for s in specialised:
-                        _adjustable[varname](params=params[s],
-                                             name=varname,
-                                             index=varidx,
-                                             value=value)
-                else:
-                    raise KeyError(
-                        f"Cannot set unrecognised parameter {varname} "
-                        f"to {value}")
-
-            # now loop over and adjust the demographic-specific values
-            # (except for 'overall', which must be done last)
-            need_overall = False
-
-            for varname, varidx, value in zip(self._varnames, self._varidxs,
-                                              self._vals):
-                if isinstance(varname, tuple):
-                    demographic, varname = varname
-                else:
-                    continue
-
-                if demographic == "overall":
-                    need_overall = True
-                    continue
-
-                if varname.startswith("user.") or varname.startswith("."):
-                    _adjustable["user"](params=params[demographic],
-                                        name=varname,
-                                        index=varidx,
-                                        value=value)
-                elif varname in _adjustable:
-                    _adjustable[varname](params=params[demographic],
-                                         name=varname,
-                                         index=varidx,
-                                         value=value)
-                else:
-                    raise KeyError(
-                        f"Cannot set unrecognised parameter {varname} "
-                        f"to {value} in demographic {demographic}")
-
-            # finally(!) loop over and adjust the overall values
-            if need_overall:
-                for varname, varidx, value in zip(self._varnames,
-                                                  self._varidxs,
-                                                  self._vals):
-                    if isinstance(varname, tuple):
-                        demographic, varname = varname
-                    else:
-                        continue
-
-                    if demographic != "overall":
-                        continue
-
-                    if varname.startswith("user.") or varname.startswith("."):
-                        _adjustable["user"](params=params[demographic],
-                                            name=varname,
-                                            index=varidx,
-                                            value=value)
-                    elif varname in _adjustable:
-                        _adjustable[varname](params=params[demographic],
-                                             name=varname,
-                                             index=varidx,
-                                             value=value)
-                    else:
-                        raise KeyError(
-                            f"Cannot set unrecognised parameter {varname} "
-                            f"to {value} in demographic {demographic}")
+            _get_plan(self._varnames, self._varidxs).apply(params,
+                                                           self._vals)
 
             # save this adjustment to the record in the parameters
             # object
@@ -1208,10 +1248,10 @@ class VariableSets:
             other = VariableSets()
             other.append(v)
 
-        if len(self._vars) != len(other._vars):
+        if len(self) != len(other):
             return False
 
-        for v0, v1 in zip(self._vars, other._vars):
+        for v0, v1 in zip(self, other):
             if v0 != v1:
                 return False
 
@@ -1223,6 +1263,12 @@ class VariableSets:
         else:
             return len(self._vars)
 
+    def __iter__(self):
+        if self._vars is None:
+            return iter([])
+        else:
+            return iter(self._vars)
+
     def __getitem__(self, i: int):
         """Return the VariableSet at the specified index"""
         if self._vars is None:
@@ -1319,7 +1365,8 @@ class VariableSets:
         return repeats
 
     @staticmethod
-    def read(filename: str, line_numbers: _List[int] = None):
+    def read(filename: str, line_numbers: _List[int] = None,
+             lazy: bool = False):
         """Read and return collection of VariableSet objects from the
            specified line number(s) of the specified file
 
@@ -1331,6 +1378,12 @@ class VariableSets:
              The line numbers from the file to read. This is 0-indexed,
              meaning that the first line is line 0. If this is None,
              then all lines are read and used
+           lazy: bool
+             Whether or not to read the VariableSet objects lazily. If
+             this is True then the file is only indexed, and each
+             VariableSet is parsed from the file when it is needed.
+             This is much quicker and uses much less memory for
+             very large design files
 
            Returns
            -------
@@ -1342,6 +1395,14 @@ class VariableSets:
             if line_numbers is not None:
                 line_numbers = [line_numbers]
 
+        if lazy:
+            reader = _VariableSetsReader.open(filename, line_numbers)
+
+            if reader is not None:
+                return _LazyVariableSets(reader)
+
+            # this is not a file that can be read lazily
+
         # parse all lines using the csv module
         import csv
         lines = open(filename, "r").readlines()
@@ -1357,38 +1418,13 @@ class VariableSets:
 
         # first try to guess the dialect of the file (space or comma
         # separated, newline character etc.)
-        try:
-            dialect = csv.Sniffer().sniff(csvlines[0], delimiters=[" ", ","])
-        except Exception:
-            words = csvlines[0].strip().split(" ")
-
-            if len(words) > 1:
-                from .utils._console import Console
-                Console.warning(
-                    f"Could not identify what sort of separator to use to "
-                    f"read {filename}, so will assume commas. If this is "
-                    f"wrong, then could you add commas to separate the "
-                    f"fields?")
-
-            dialect = csv.excel  #  default comma-separated file
+        dialect = _sniff_dialect(csvlines[0], filename)
 
         for line in csv.reader(csvlines, dialect=dialect,
                                quoting=csv.QUOTE_ALL,
                                skipinitialspace=True):
-            cleaned = [_clean(x) for x in line]
-
-            line = []
-
-            if len(cleaned) > 0:
-                for clean in cleaned:
-                    if isinstance(clean, list) or isinstance(clean, tuple):
-                        for c in clean:
-                            if len(c) > 0:
-                                line.append(c)
-                    else:
-                        line.append(clean)
-
-                lines.append(line)
+            if len(line) > 0:
+                lines.append(_clean_line(line))
 
         if len(lines) == 0:
             # there is nothing to read?
@@ -1398,20 +1434,10 @@ class VariableSets:
             # this is a vertical file that should be split on spaces
             lines = []
             for line in csvlines:
-                cleaned = [_clean(x) for x in line.split()]
-
-                line = []
-
-                if len(cleaned) > 0:
-                    for clean in cleaned:
-                        if isinstance(clean, list) or isinstance(clean, tuple):
-                            for c in clean:
-                                if len(c) > 0:
-                                    line.append(c)
-                        else:
-                            line.append(clean)
+                line = line.split()
 
-                    lines.append(line)
+                if len(line) > 0:
+                    lines.append(_clean_line(line))
 
         if len(lines) == 0:
             # there is nothing to read?
@@ -1540,3 +1566,391 @@ class VariableSets:
             variable._output = str(uuid4())
             variable._idx = 1
             variable._nrepeats = 1
+
+
+class _VariableSetsReader:
+    """Reads the VariableSet objects from a horizontal (one VariableSet
+       per line) design file on demand. The file is indexed when it
+       is opened, so that each VariableSet can be parsed when needed
+       rather than all being held in memory
+    """
+
+    def __init__(self):
+        self._filename = None
+        self._dialect = None
+        self._titles = None
+        self._repeats_index = None
+        self._offsets = None
+        self._selected = None
+        self._repeats = None
+
+    @staticmethod
+    def open(filename: str, line_numbers: _List[int] = None):
+        """Open and index the passed file, selecting only the passed
+           (0-indexed) line numbers if these are specified. This
+           returns None if this is not a file that can be read
+           lazily, e.g. because it is a vertical file
+        """
+        from array import array
+
+        offsets = array("q")
+        first = None
+
+        with open(filename, "rb") as FILE:
+            offset = 0
+
+            for line in FILE:
+                stripped = line.strip()
+
+                if len(stripped) > 0 and (not stripped.startswith(b"#")):
+                    if first is None:
+                        first = stripped.decode("utf-8")
+                    else:
+                        offsets.append(offset)
+
+                offset += len(line)
+
+        if first is None:
+            return None
+
+        reader = _VariableSetsReader()
+        reader._filename = filename
+        reader._dialect = _sniff_dialect(first, filename)
+
+        first = reader._parse(first)
+
+        if len(first) == 0 or first[0].find("=") != -1 or \
+                first[0].find(":") != -1 or \
+                (len(first) > 1 and first[1] == "=="):
+            # this is a vertical file
+            return None
+
+        # are there any strings on the first line? If so, then these
+        # are the titles
+        has_titles = False
+        for v in first:
+            try:
+                float(v)
+            except Exception:
+                has_titles = True
+                break
+
+        if has_titles:
+            titles = first
+        else:
+            # default adjustable variables
+            titles = ["beta[2]", "beta[3]", "progress[1]",
+                      "progress[2]", "progress[3]"]
+            offsets.insert(0, 0)
+
+            with open(filename, "rb") as FILE:
+                for line in FILE:
+                    stripped = line.strip()
+
+                    if len(stripped) > 0 and \
+                            (not stripped.startswith(b"#")):
+                        break
+
+                    offsets[0] += len(line)
+
+        if "repeats" in titles:
+            reader._repeats_index = titles.index("repeats")
+            titles.pop(reader._repeats_index)
+
+        reader._titles = titles
+        reader._offsets = offsets
+
+        if line_numbers is not None:
+            selected = [i for i in range(0, len(offsets))
+                        if i in line_numbers]
+
+            if len(selected) != len(line_numbers):
+                raise ValueError(
+                    f"Cannot read parameters from line {line_numbers} "
+                    f"as the number of lines in the file is "
+                    f"{len(offsets)}")
+
+            reader._selected = array("q", selected)
+
+        if reader._repeats_index is not None:
+            reader._repeats = array("i")
+
+            for values in reader._iterate_values():
+                reader._repeats.append(int(_interpret(
+                    values[reader._repeats_index])))
+
+        return reader
+
+    def _parse(self, line: str):
+        """Parse the passed line into a list of cleaned fields"""
+        import csv
+
+        for fields in csv.reader([line], dialect=self._dialect,
+                                 quoting=csv.QUOTE_ALL,
+                                 skipinitialspace=True):
+            return _clean_line(fields)
+
+        return []
+
+    def _to_variable_set(self, values):
+        """Convert the passed list of parsed values into a VariableSet"""
+        values = [_interpret(x) for x in values]
+
+        if self._repeats_index is not None:
+            values.pop(self._repeats_index)
+
+        variable = VariableSet()
+
+        for j, key in enumerate(self._titles):
+            variable[key] = values[j]
+
+        return variable
+
+    def _iterate_values(self):
+        """Iterate over the parsed values of the selected lines, reading
+           the file sequentially
+        """
+        if self._selected is None:
+            selected = range(0, len(self._offsets))
+        else:
+            selected = self._selected
+
+        with open(self._filename, "rb") as FILE:
+            for i in selected:
+                FILE.seek(self._offsets[i])
+                yield self._parse(FILE.readline().strip().decode("utf-8"))
+
+    def __len__(self):
+        if self._selected is None:
+            return len(self._offsets)
+        else:
+            return len(self._selected)
+
+    def __iter__(self):
+        for values in self._iterate_values():
+            yield self._to_variable_set(values)
+
+    def __getitem__(self, i: int):
+        """Return a new VariableSet parsed from the ith selected line"""
+        if i < 0 or i >= len(self):
+            raise IndexError(f"Invalid index {i}")
+
+        if self._selected is not None:
+            i = self._selected[i]
+
+        with open(self._filename, "rb") as FILE:
+            FILE.seek(self._offsets[i])
+            line = FILE.readline().strip().decode("utf-8")
+
+        return self._to_variable_set(self._parse(line))
+
+    def repeats(self):
+        """Return the list of the number of repeats of each selected line,
+           or None if the file doesn't specify these
+        """
+        if self._repeats is None:
+            return None
+        else:
+            return list(self._repeats)
+
+
+class _LazyVariableSets(VariableSets):
+    """A VariableSets whose VariableSet objects are created on demand
+       from a _VariableSetsReader, with any repeats or output directory
+       naming applied as they are created. Each VariableSet is a new
+       object, so changing it does not change this collection. This
+       is returned by VariableSets.read when lazy is True
+    """
+
+    def __init__(self, reader: _VariableSetsReader, layers: _List = None):
+        """Construct from the passed reader (or lazy VariableSets),
+           applying the passed layers of repeats. If 'layers' is None
+           then the repeats specified in the file are used
+        """
+        super().__init__()
+        self._vars = None
+        self._reader = reader
+        self._layers = []
+        self._outdir_scheme = None
+        self._uids = None
+
+        if layers is not None:
+            self._layers = list(layers)
+        else:
+            repeats = reader.repeats()
+
+            if repeats is not None:
+                self._add_layer(repeats)
+
+    def __str__(self):
+        if len(self) > 10:
+            s = [str(self[i]) for i in range(0, 5)]
+            return "{" + ",\n ".join(s) + f",\n ... {len(self) - 5} more\n}}"
+        else:
+            return str(self.materialise())
+
+    def _add_layer(self, nrepeats: _List[int]):
+        """Add a layer of repeats, using the same rules as
+           VariableSets.repeat
+        """
+        if len(nrepeats) == 1 and nrepeats[0] <= 1:
+            return
+
+        if len(nrepeats) == 1:
+            self._layers.append(nrepeats[0])
+        else:
+            self._layers.append(list(nrepeats))
+
+    def _layer_size(self, layer: int):
+        """Return the number of VariableSet objects after 'layer'
+           layers of repeats
+        """
+        if layer == 0:
+            return len(self._reader)
+
+        nrepeats = self._layers[layer - 1]
+
+        if isinstance(nrepeats, list):
+            return sum([max(0, x) for x in nrepeats])
+        else:
+            return nrepeats * self._layer_size(layer - 1)
+
+    def __len__(self):
+        return self._layer_size(len(self._layers))
+
+    def _iterate(self, layer: int):
+        """Iterate over the VariableSet objects after 'layer' layers of
+           repeats
+        """
+        if layer == 0:
+            yield from self._reader
+            return
+
+        nrepeats = self._layers[layer - 1]
+
+        if isinstance(nrepeats, list):
+            for n in range(1, max(nrepeats) + 1):
+                for i, v in enumerate(self._iterate(layer - 1)):
+                    if n <= nrepeats[i]:
+                        v._idx = n
+                        v._nrepeats = nrepeats[i]
+                        yield v
+        else:
+            for n in range(1, nrepeats + 1):
+                for v in self._iterate(layer - 1):
+                    v._idx = n
+                    v._nrepeats = nrepeats
+                    yield v
+
+    def _get(self, layer: int, i: int):
+        """Return the ith VariableSet after 'layer' layers of repeats"""
+        if layer == 0:
+            return self._reader[i]
+
+        nrepeats = self._layers[layer - 1]
+
+        if isinstance(nrepeats, list):
+            from itertools import islice
+            return next(islice(self._iterate(layer), i, None))
+        else:
+            size = self._layer_size(layer - 1)
+            v = self._get(layer - 1, i % size)
+            v._idx = (i // size) + 1
+            v._nrepeats = nrepeats
+            return v
+
+    def _set_outdir(self, i: int, variable: VariableSet):
+        """Apply any output directory naming scheme to the ith
+           VariableSet
+        """
+        if self._outdir_scheme is None:
+            return variable
+        elif self._outdir_scheme == "number":
+            nchars = len(str(len(self) + 1))
+            variable._output = f"%0{nchars}d" % (i + 1)
+        else:
+            uid = self._uids.get(i, None)
+
+            if uid is None:
+                from uuid import uuid4
+                uid = str(uuid4())
+                self._uids[i] = uid
+
+            variable._output = uid
+
+        variable._idx = 1
+        variable._nrepeats = 1
+
+        return variable
+
+    def __iter__(self):
+        for i, v in enumerate(self._iterate(len(self._layers))):
+            yield self._set_outdir(i, v)
+
+    def __getitem__(self, i: int):
+        """Return the VariableSet at the specified index. Note that
+           this is parsed from the file, so is a new object each time
+        """
+        n = len(self)
+
+        if i < 0:
+            i += n
+
+        if i < 0 or i >= n:
+            raise IndexError(f"Invalid index {i}")
+
+        return self._set_outdir(i, self._get(len(self._layers), i))
+
+    def materialise(self) -> VariableSets:
+        """Return a normal (non-lazy) VariableSets that contains all of
+           the VariableSet objects from this collection
+        """
+        variables = VariableSets()
+
+        for v in self:
+            variables.append(v)
+
+        return variables
+
+    def append(self, variables: VariableSet):
+        raise TypeError("You cannot append to a lazily-read VariableSets. "
+                        "Call 'materialise' first.")
+
+    def repeat(self, nrepeats: _Union[_List[int], int]):
+        """Return a copy of this VariableSets in which all of the
+           VariableSet objects are repeated 'nrepeats' times. The
+           repeats are created lazily, as for VariableSets.repeat
+        """
+        if not isinstance(nrepeats, list):
+            nrepeats = [nrepeats]
+
+        if len(nrepeats) == 1 and nrepeats[0] <= 1:
+            return self
+
+        if len(nrepeats) != 1 and len(nrepeats) != len(self):
+            raise ValueError(
+                f"Disagreement of the number of repeats {len(nrepeats)} "
+                f"and the number of variables {len(self)}")
+
+        if self._outdir_scheme is None:
+            repeats = _LazyVariableSets(self._reader, layers=self._layers)
+        else:
+            # the repeats must keep the output directories of this set
+            repeats = _LazyVariableSets(self, layers=[])
+
+        repeats._add_layer(nrepeats)
+
+        return repeats
+
+    def set_outdir_from_number(self):
+        """This function resets the names of all of the output directories
+           for each run so that they are numbered sequentially from one
+        """
+        self._outdir_scheme = "number"
+
+    def set_outdir_from_uid(self):
+        """This function resets the names of all of the output directories
+           for each run so that they all have a globally unique UID
+        """
+        self._outdir_scheme = "uid"
+        self._uids = {}
@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+from array import array as _array
+from typing import List as _List
+from typing import TYPE_CHECKING
+
+from ._wardinfo import WardInfo
+
+if TYPE_CHECKING:
+    from ._ward import Ward
+
+__all__ = ["WardColumns"]
+
+#: Magic bytes at the start of every binary Wards file
+_magic = b"MetaWardsWards\n"
+
+#: The version of the binary Wards file format
+_version = 1
+
+#: The names and typecodes of all of the arrays that are saved
+_array_columns = [("present", "i"), ("auto_assign", "i"),
+                  ("nplayers", "i"), ("player_total", "d"),
+                  ("pos_type", "i"), ("pos_a", "d"), ("pos_b", "d"),
+                  ("scale_uv", "d"), ("cutoff", "d"), ("bg_foi", "d"),
+                  ("work_begin", "i"), ("work_dest", "i"),
+                  ("work_number", "i"),
+                  ("play_begin", "i"), ("play_dest", "i"),
+                  ("play_weight", "d")]
+
+#: The WardInfo fields that are saved as string columns
+_info_columns = ["name", "code", "authority", "authority_code",
+                 "region", "region_code"]
+
+#: Values of pos_type
+_NO_POS = 0
+_XY_POS = 1
+_LATLONG_POS = 2
+
+
+class WardColumns:
+    """This class holds all of the data for a set of Wards in
+       columnar form, i.e. as one array per ward attribute, plus
+       compressed sparse row (CSR) arrays for the worker and player
+       destinations of every ward. The workers for ward 'i' commute
+       to work_dest[work_begin[i]:work_begin[i+1]], with the
+       number of workers in work_number. Similarly for the player
+       weights in play_dest / play_weight (which holds only the
+       explicitly-set weights, with any auto-assigned weight held
+       in player_total).
+
+       This is the backend used by :class:`~metawards.Wards`
+       to quickly build Networks and to save and load Wards
+       in a compact binary format. It is created and used
+       automatically, so you should not normally need to use
+       this class directly.
+    """
+
+    def __init__(self, nwards_plus_one: int = 0):
+        """Create empty columns for 'nwards_plus_one' wards (index
+           zero is the null ward)
+        """
+        self.nwards_plus_one = int(nwards_plus_one)
+
+        n = self.nwards_plus_one
+
+        for name, typecode in _array_columns:
+            if name in ["work_begin", "play_begin"]:
+                setattr(self, name, _array(typecode, [0]) * (n + 1))
+            elif name in ["work_dest", "work_number",
+                          "play_dest", "play_weight"]:
+                setattr(self, name, _array(typecode))
+            else:
+                setattr(self, name, _array(typecode, [0]) * n)
+
+        #: The WardInfo for each ward (None for missing wards)
+        self.info = [None] * n
+
+        #: The custom parameters for the wards. This maps the key
+        #: to an array of values, with NaN for wards that don't set it
+        self.custom = {}
+
+    def __len__(self):
+        return self.nwards_plus_one
+
+    def __eq__(self, other):
+        if not isinstance(other, WardColumns):
+            return False
+
+        if self.nwards_plus_one != other.nwards_plus_one:
+            return False
+
+        for name, _typecode in _array_columns:
+            if getattr(self, name) != getattr(other, name):
+                return False
+
+        if self.info != other.info:
+            return False
+
+        if set(self.custom.keys()) != set(other.custom.keys()):
+            return False
+
+        for key, values in self.custom.items():
+            if values.tobytes() != other.custom[key].tobytes():
+                return False
+
+        return True
+
+    def num_workers(self) -> int:
+        """Return the total number of workers"""
+        return sum(self.work_number)
+
+    def num_players(self) -> int:
+        """Return the total number of players"""
+        return sum(self.nplayers)
+
+    def num_work_links(self) -> int:
+        """Return the total number of work links"""
+        return len(self.work_dest)
+
+    def num_play_links(self) -> int:
+        """Return the total number of (explicit) play links"""
+        return len(self.play_dest)
+
+    @staticmethod
+    def from_wards(wards: _List[Ward]) -> WardColumns:
+        """Create the columns from the passed list of Ward objects,
+           where wards[i] is the Ward with ID 'i' (or None). All of
+           the connections of the wards must have been resolved
+        """
+        import math
+
+        n = len(wards)
+        c = WardColumns(n)
+
+        nan = math.nan
+
+        for i, ward in enumerate(wards):
+            c.work_begin[i] = len(c.work_dest)
+            c.play_begin[i] = len(c.play_dest)
+
+            if ward is None or ward.is_null():
+                continue
+
+            c.present[i] = 1
+            c.auto_assign[i] = 1 if ward._auto_assign_players else 0
+            c.nplayers[i] = ward._num_players
+            c.player_total[i] = ward._player_total
+
+            pos = ward._pos
+
+            if "x" in pos:
+                c.pos_type[i] = _XY_POS
+                c.pos_a[i] = pos["x"]
+                c.pos_b[i] = pos["y"]
+            elif "lat" in pos:
+                c.pos_type[i] = _LATLONG_POS
+                c.pos_a[i] = pos["lat"]
+                c.pos_b[i] = pos["long"]
+
+            c.scale_uv[i] = ward._scale_uv
+            c.cutoff[i] = ward._cutoff
+            c.bg_foi[i] = ward._bg_foi
+
+            for key, value in ward._custom_params.items():
+                values = c.custom.get(key, None)
+
+                if values is None:
+                    values = _array("d", [nan]) * n
+                    c.custom[key] = values
+
+                values[i] = value
+
+            c.info[i] = ward._info
+
+            for key in sorted(ward._workers.keys()):
+                if not isinstance(key, int):
+                    raise KeyError(
+                        f"Cannot create worker list as link to {key} is "
+                        f"unresolved")
+
+                c.work_dest.append(key)
+                c.work_number.append(ward._workers[key])
+
+            for key in sorted(ward._players.keys()):
+                if not isinstance(key, int):
+                    raise KeyError(
+                        f"Cannot create player list as link to {key} is "
+                        f"unresolved")
+
+                c.play_dest.append(key)
+                c.play_weight.append(ward._players[key])
+
+        c.work_begin[n] = len(c.work_dest)
+        c.play_begin[n] = len(c.play_dest)
+
+        return c
+
+    def get_ward(self, i: int) -> Ward:
+        """Return a new Ward object that holds the data for the
+           ward at index 'i', or None if there is no such ward.
+        """
+        import math
+        from copy import deepcopy
+        from ._ward import Ward
+
+        if not self.present[i]:
+            return None
+
+        ward = Ward(id=i, auto_assign_players=self.auto_assign[i])
+
+        if self.info[i] is not None:
+            ward._info = deepcopy(self.info[i])
+
+        ward._num_players = self.nplayers[i]
+        ward._player_total = self.player_total[i]
+
+        pos_type = self.pos_type[i]
+
+        if pos_type == _XY_POS:
+            ward._pos = {"x": self.pos_a[i], "y": self.pos_b[i]}
+        elif pos_type == _LATLONG_POS:
+            ward._pos = {"lat": self.pos_a[i], "long": self.pos_b[i]}
+
+        ward._scale_uv = self.scale_uv[i]
+        ward._cutoff = self.cutoff[i]
+        ward._bg_foi = self.bg_foi[i]
+
+        for key, values in self.custom.items():
+            if not math.isnan(values[i]):
+                ward._custom_params[key] = values[i]
+
+        start = self.work_begin[i]
+        end = self.work_begin[i+1]
+        ward._workers = dict(zip(self.work_dest[start:end],
+                                 self.work_number[start:end]))
+        ward._num_workers = sum(self.work_number[start:end])
+
+        start = self.play_begin[i]
+        end = self.play_begin[i+1]
+        ward._players = dict(zip(self.play_dest[start:end],
+                                 self.play_weight[start:end]))
+
+        return ward
+
+    def to_wards(self) -> _List[Ward]:
+        """Return the list of Ward objects held in these columns,
+           where the ith item is the Ward with ID 'i' (or None)
+        """
+        return [self.get_ward(i) for i in range(0, self.nwards_plus_one)]
+
+    def get_infos(self) -> _List[WardInfo]:
+        """Return the list of WardInfo objects for the wards"""
+        return list(self.info)
+
+    def scale(self, work_ratio: float = 1.0,
+              play_ratio: float = 1.0) -> WardColumns:
+        """Return a copy of these columns where the number of workers
+           and players are scaled by 'work_ratio' and 'play_ratio',
+           using the same rounding as :meth:`Ward.scale`
+        """
+        import math
+        from copy import deepcopy
+
+        def scale_and_round(value, scale):
+            if scale > 0.5:
+                return int(math.floor((value * scale) + 0.5))
+            else:
+                return int(math.floor(value * scale))
+
+        c = deepcopy(self)
+
+        work_ratio = float(work_ratio)
+        play_ratio = float(play_ratio)
+
+        if play_ratio != 1.0:
+            for i in range(0, c.nwards_plus_one):
+                c.nplayers[i] = scale_and_round(c.nplayers[i], play_ratio)
+
+        if work_ratio != 1.0:
+            for i in range(0, len(c.work_number)):
+                c.work_number[i] = scale_and_round(c.work_number[i],
+                                                   work_ratio)
+
+        return c
+
+    def assert_sane(self) -> None:
+        """Make sure that none of the wards refer to any non-existent
+           wards. This raises an AssertionError if they do
+        """
+        nwards = self.nwards_plus_one - 1
+
+        for (kind, begin, dests) in [("work", self.work_begin,
+                                      self.work_dest),
+                                     ("play", self.play_begin,
+                                      self.play_dest)]:
+            if begin[self.nwards_plus_one] != len(dests):
+                raise AssertionError(
+                    f"Corrupted {kind} connections: {len(dests)} versus "
+                    f"{begin[self.nwards_plus_one]}")
+
+            for i in range(0, self.nwards_plus_one):
+                start = begin[i]
+                end = begin[i+1]
+
+                if end < start or (end > start and not self.present[i]):
+                    raise AssertionError(
+                        f"Corrupted {kind} connections for ward {i}")
+
+                for c in dests[start:end]:
+                    if c < 1 or c > nwards:
+                        raise AssertionError(
+                            f"Ward {i} has a {kind} connection to an "
+                            f"invalid ward ID {c}. Range should be "
+                            f"1 <= n <= {nwards}")
+                    elif not self.present[c]:
+                        raise AssertionError(
+                            f"Ward {i} has a {kind} connection to a null "
+                            f"ward ID {c}. This ward is null")
+
+    def to_binary(self, filename: str, auto_bzip: bool = False) -> str:
+        """Save these columns to 'filename' in a compact binary format.
+           This writes the arrays directly, so is much faster to save
+           and load than JSON. The file will be bzip2-compressed
+           if 'auto_bzip' is True (which is smaller, but slower).
+           This returns the absolute path to the written file
+        """
+        import json
+        import sys
+        import struct
+        from pathlib import Path
+
+        filename = str(Path(filename).expanduser().resolve().absolute())
+
+        infos = [x if x is not None else WardInfo() for x in self.info]
+
+        info = {}
+
+        for key in _info_columns:
+            info[key] = [getattr(x, key) for x in infos]
+
+        # the alternates are rare, so only save them if they are set
+        for key in ["alternate_names", "alternate_codes"]:
+            values = {str(i): getattr(x, key) for i, x in enumerate(infos)
+                      if len(getattr(x, key)) > 0}
+
+            if len(values) > 0:
+                info[key] = values
+
+        arrays = [(name, getattr(self, name)) for name, _t in _array_columns]
+        arrays += [(f"custom:{key}", values)
+                   for key, values in self.custom.items()]
+
+        header = {"version": _version,
+                  "byteorder": sys.byteorder,
+                  "nwards_plus_one": self.nwards_plus_one,
+                  "has_info": [1 if x is not None else 0 for x in self.info],
+                  "info": info,
+                  "arrays": [[name, values.typecode, len(values)]
+                             for name, values in arrays]}
+
+        header = json.dumps(header).encode("utf-8")
+
+        if auto_bzip:
+            if not filename.endswith(".bz2"):
+                filename += ".bz2"
+
+            import bz2
+            opener = bz2.open
+        else:
+            opener = open
+
+        try:
+            with opener(filename, "wb") as FILE:
+                FILE.write(_magic)
+                FILE.write(struct.pack("<Q", len(header)))
+                FILE.write(header)
+
+                for _name, values in arrays:
+                    values.tofile(FILE)
+        except Exception:
+            import os
+
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+            raise
+
+        return filename
+
+    @staticmethod
+    def from_binary(filename: str) -> WardColumns:
+        """Load and return the columns that were saved to 'filename'
+           using :meth:`~WardColumns.to_binary`
+        """
+        import json
+        import sys
+        import struct
+
+        with open(filename, "rb") as FILE:
+            start = FILE.read(3)
+
+        if start == b"BZh":
+            import bz2
+            opener = bz2.open
+        else:
+            opener = open
+
+        with opener(filename, "rb") as FILE:
+            if FILE.read(len(_magic)) != _magic:
+                raise IOError(f"{filename} is not a binary Wards file")
+
+            (size,) = struct.unpack("<Q", FILE.read(8))
+            header = json.loads(FILE.read(size).decode("utf-8"))
+
+            if header["version"] > _version:
+                raise IOError(
+                    f"Cannot read {filename} as it was written using a newer "
+                    f"version ({header['version']}) of the binary format")
+
+            swap = header["byteorder"] != sys.byteorder
+
+            c = WardColumns(0)
+            c.nwards_plus_one = int(header["nwards_plus_one"])
+
+            for name, typecode, count in header["arrays"]:
+                values = _array(typecode)
+                data = FILE.read(count * values.itemsize)
+
+                if len(data) != count * values.itemsize:
+                    raise IOError(f"{filename} is truncated or corrupted")
+
+                values.frombytes(data)
+
+                if swap:
+                    values.byteswap()
+
+                if name.startswith("custom:"):
+                    c.custom[name[7:]] = values
+                else:
+                    setattr(c, name, values)
+
+        info = header["info"]
+        alternate_names = info.get("alternate_names", {})
+        alternate_codes = info.get("alternate_codes", {})
+
+        c.info = []
+
+        for i, has_info in enumerate(header["has_info"]):
+            if has_info:
+                w = WardInfo(**{key: info[key][i] for key in _info_columns})
+                w.alternate_names = list(alternate_names.get(str(i), []))
+                w.alternate_codes = list(alternate_codes.get(str(i), []))
+                c.info.append(w)
+            else:
+                c.info.append(None)
+
+        c.assert_sane()
+
+        return c
@@ -4,7 +4,7 @@ from dataclasses import field as _field
 from typing import List as _List
 from typing import Dict as _Dict
 
-__all__ = ["WardInfo", "WardInfos"]
+__all__ = ["WardInfo", "WardInfos", "WardInfoColumns"]
 
 
 @_dataclass
@@ -122,18 +122,297 @@ class WardInfo:
         return info
 
 
+class WardInfoColumns:
+    """This class holds the WardInfo metadata for a list of wards in
+       columnar form, i.e. one list of strings per field, which is
+       much more compact and quicker to create and to cache than
+       one WardInfo object per ward. It behaves like a (read-only)
+       list of WardInfo objects, which are created lazily when
+       they are first accessed.
+
+       This is created by :func:`~metawards.utils.add_lookup`, and
+       is used automatically by :class:`WardInfos`, so you should
+       not normally need to use this class directly.
+    """
+
+    #: The string fields that are held as columns
+    fields = ["name", "code", "authority", "authority_code",
+              "region", "region_code"]
+
+    def __init__(self, nwards_plus_one: int = 0):
+        """Create columns for 'nwards_plus_one' wards, all of which
+           are missing (None). Index zero is the null ward
+        """
+        n = int(nwards_plus_one)
+
+        #: Whether or not there is a WardInfo for each ward
+        self.present = bytearray(n)
+
+        for field in WardInfoColumns.fields:
+            setattr(self, field, [""] * n)
+
+        #: The (rare) alternate names and codes, keyed by ward index
+        self.alternate_names = {}
+        self.alternate_codes = {}
+
+        self._infos = [None] * n
+
+    def __len__(self):
+        return len(self.present)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(0, len(self))[i]]
+
+        info = self._infos[i]
+
+        if info is None and self.present[i]:
+            info = WardInfo(**{field: getattr(self, field)[i]
+                               for field in WardInfoColumns.fields})
+            info.alternate_names = list(self.alternate_names.get(i, []))
+            info.alternate_codes = list(self.alternate_codes.get(i, []))
+            self._infos[i] = info
+
+        return info
+
+    def __eq__(self, other):
+        if isinstance(other, WardInfoColumns) or isinstance(other, list):
+            return len(self) == len(other) and list(self) == list(other)
+        else:
+            return False
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, info: WardInfo = None) -> None:
+        """Append the passed WardInfo (or a missing ward if this is
+           None) onto the end of the columns
+        """
+        i = len(self)
+
+        self.present.append(0 if info is None else 1)
+        self._infos.append(None)
+
+        for field in WardInfoColumns.fields:
+            getattr(self, field).append(
+                "" if info is None else getattr(info, field))
+
+        if info is not None:
+            if len(info.alternate_names) > 0:
+                self.alternate_names[i] = list(info.alternate_names)
+
+            if len(info.alternate_codes) > 0:
+                self.alternate_codes[i] = list(info.alternate_codes)
+
+    def resize(self, n: int) -> None:
+        """Resize to hold 'n' wards, either removing wards from the
+           end, or adding missing (None) wards
+        """
+        if n < len(self):
+            del self.present[n:]
+            del self._infos[n:]
+
+            for field in WardInfoColumns.fields:
+                del getattr(self, field)[n:]
+
+            for alternates in [self.alternate_names, self.alternate_codes]:
+                for i in [i for i in alternates.keys() if i >= n]:
+                    del alternates[i]
+        else:
+            while len(self) < n:
+                self.append(None)
+
+    def get_search_strings(self, kind: str):
+        """Return the (primary, alternates) lists of strings for each
+           ward that are needed to build the _SearchIndex of type
+           'kind' (ward, authority or region). This reads the columns
+           directly, so doesn't need to create any WardInfo objects
+           (apart from using any that have already been created,
+           in case these have been changed)
+        """
+        strings = []
+
+        if kind == "ward":
+            primary = (self.name, self.code)
+        else:
+            primary = (getattr(self, kind), getattr(self, f"{kind}_code"))
+
+        for i in range(0, len(self)):
+            info = self._infos[i]
+
+            if info is not None:
+                if kind == "ward":
+                    strings.append(
+                        ([x for x in (info.name, info.code)
+                          if x is not None],
+                         [x for x in info.alternate_names +
+                          info.alternate_codes if x is not None]))
+                else:
+                    values = (getattr(info, kind),
+                              getattr(info, f"{kind}_code"))
+                    strings.append(([x for x in values if x is not None],
+                                    []))
+            elif not self.present[i]:
+                strings.append(None)
+            elif kind == "ward":
+                strings.append(([primary[0][i], primary[1][i]],
+                                self.alternate_names.get(i, []) +
+                                self.alternate_codes.get(i, [])))
+            else:
+                strings.append(([primary[0][i], primary[1][i]], []))
+
+        return strings
+
+
+#: Characters that have a special meaning in a regular expression.
+#: Search terms that don't contain any of these can be looked up
+#: in a _SearchIndex rather than by scanning every ward
+_regex_special = set(".^$*+?{}[]\\|()")
+
+
+def _split_search(name: str):
+    """Split the passed search term into (literal, anchor_start,
+       anchor_end) if it is a plain string, optionally anchored using
+       '^' and/or '$'. This returns None if the search term uses
+       any other regular expression features
+    """
+    if not isinstance(name, str):
+        return None
+
+    anchor_start = name.startswith("^")
+
+    if anchor_start:
+        name = name[1:]
+
+    anchor_end = name.endswith("$") and not name.endswith("\\$")
+
+    if anchor_end:
+        name = name[:-1]
+
+    for c in name:
+        if c in _regex_special:
+            return None
+
+    return (name, anchor_start, anchor_end)
+
+
+def _trigrams(value: str):
+    """Return the set of all three-character substrings of 'value'"""
+    return {value[i:i+3] for i in range(0, len(value) - 2)}
+
+
+class _SearchIndex:
+    """Index over the (lower-cased) strings associated with each
+       ward, e.g. the name and code, that is used to find candidate
+       matches for a literal search without scanning every ward.
+       This holds a hash of exact values, a sorted list for
+       prefix matches, and a trigram index for substring matches.
+       Each string is either primary (e.g. name or code) or
+       alternate (e.g. alternate names or codes)
+    """
+
+    def __init__(self, strings):
+        """Construct from 'strings', which is a list of
+           (primary, alternates) lists of strings for each ward,
+           or None if there is no ward at that index
+        """
+        self._exact = {}
+        self._trigrams = {}
+        self._all = ([], [])
+        prefixes = []
+
+        for i, value in enumerate(strings):
+            if value is None:
+                continue
+
+            self._all[1].append(i)
+
+            if len(value[0]) > 0:
+                self._all[0].append(i)
+
+            for is_alternate, values in enumerate(value):
+                for v in values:
+                    v = v.lower()
+                    self._exact.setdefault(v, []).append((i, is_alternate))
+                    prefixes.append((v, i, is_alternate))
+
+                    for t in _trigrams(v):
+                        self._trigrams.setdefault(t, set()).add(i)
+
+        prefixes.sort()
+        self._prefixes = prefixes
+        self._prefix_keys = [x[0] for x in prefixes]
+
+    def exact(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards with a string equal
+           to 'value' (case-insensitive)
+        """
+        return {i for (i, is_alternate) in self._exact.get(value.lower(), [])
+                if include_alternates or not is_alternate}
+
+    def prefix(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards with a string that
+           starts with 'value' (case-insensitive)
+        """
+        from bisect import bisect_left
+
+        value = value.lower()
+        matches = set()
+
+        i = bisect_left(self._prefix_keys, value)
+
+        while i < len(self._prefixes):
+            (v, ward, is_alternate) = self._prefixes[i]
+
+            if not v.startswith(value):
+                break
+
+            if include_alternates or not is_alternate:
+                matches.add(ward)
+
+            i += 1
+
+        return matches
+
+    def substring(self, value: str, include_alternates: bool):
+        """Return the set of indexes of wards that may have a string
+           that contains 'value' (case-insensitive). This is a
+           superset of the true matches, which should be checked
+        """
+        trigrams = _trigrams(value.lower())
+
+        if len(trigrams) == 0:
+            # too short to index - every ward is a candidate
+            return set(self._all[int(include_alternates)])
+
+        postings = sorted([self._trigrams.get(t, set()) for t in trigrams],
+                          key=len)
+
+        return set.intersection(*postings)
+
+
 @_dataclass
 class WardInfos:
     """Simple class that holds a list of WardInfo objects, and provides
        useful search functions over that list. This prevents me from
        cluttering up the interface of Network
     """
-    #: The list of WardInfo objects, one for each ward in order
+    #: The list of WardInfo objects, one for each ward in order. This
+    #: can also be a WardInfoColumns, which creates these on demand
     wards: _List[WardInfo] = _field(default_factory=list)
 
     #: The index used to speed up lookup of wards
     _index: _Dict[WardInfo, int] = None
 
+    #: The (lazily built) indexes used to speed up searches by ward,
+    #: authority and region name or code
+    _search: _Dict[str, _SearchIndex] = _field(default=None, compare=False,
+                                               repr=False)
+
     def __len__(self):
         return len(self.wards)
 
@@ -148,6 +427,13 @@ class WardInfos:
                     f"Setting item at index {i} to not a WardInfo {info} "
                     f"is not allowed")
 
+        self._search = None
+
+        if isinstance(self.wards, WardInfoColumns):
+            # the columns are read-only, so convert to a list of
+            # WardInfo objects before changing anything
+            self.wards = list(self.wards)
+
         if i >= len(self.wards):
             self.wards += [None] * (i - len(self.wards) + 1)
             self.wards[i] = info
@@ -190,6 +476,7 @@ class WardInfos:
            called the first time you use the "contains" or "index" functions
         """
         self._index = {}
+        self._search = None
 
         for i, ward in enumerate(self.wards):
             if ward is not None:
@@ -226,8 +513,50 @@ class WardInfos:
         else:
             return i
 
-    def _find_ward(self, name: str, match: bool, include_alternates: bool):
-        """Internal function that flexibly finds a ward by name"""
+    def _get_search_index(self, kind: str) -> _SearchIndex:
+        """Return the search index of type 'kind' (ward, authority or
+           region), building it if needed. This is built once and
+           then reused until the list of WardInfo objects is changed
+        """
+        if self._search is None:
+            self._search = {}
+
+        index = self._search.get(kind, None)
+
+        if index is not None:
+            return index
+
+        if isinstance(self.wards, WardInfoColumns):
+            index = _SearchIndex(self.wards.get_search_strings(kind))
+            self._search[kind] = index
+            return index
+
+        strings = []
+
+        for ward in self.wards:
+            if ward is None:
+                strings.append(None)
+            elif kind == "ward":
+                strings.append(
+                    ([x for x in (ward.name, ward.code) if x is not None],
+                     [x for x in ward.alternate_names + ward.alternate_codes
+                      if x is not None]))
+            else:
+                values = (getattr(ward, kind), getattr(ward, f"{kind}_code"))
+                strings.append(([x for x in values if x is not None], []))
+
+        index = _SearchIndex(strings)
+        self._search[kind] = index
+        return index
+
+    def _find(self, kind: str, name: str, match: bool,
+              include_alternates: bool, is_match):
+        """Internal function that finds the wards for which
+           'is_match(ward, search)' is true, where 'search' is the
+           compiled 'name'. If 'name' is a plain (optionally anchored)
+           string then the search index of type 'kind' is used to
+           find candidate wards, so that only those are checked
+        """
         import re
 
         if not isinstance(name, re.Pattern):
@@ -240,98 +569,88 @@ class WardInfos:
         else:
             search = search.search
 
+        literal = _split_search(name)
+
+        if literal is None:
+            candidates = range(0, len(self.wards))
+        else:
+            (value, anchor_start, anchor_end) = literal
+            index = self._get_search_index(kind)
+
+            if (match or anchor_start) and anchor_end:
+                candidates = index.exact(value, include_alternates)
+            elif match or anchor_start:
+                candidates = index.prefix(value, include_alternates)
+            else:
+                candidates = index.substring(value, include_alternates)
+
+            candidates = sorted(candidates)
+
         matches = []
 
-        for i, ward in enumerate(self.wards):
+        for i in candidates:
+            ward = self.wards[i]
+
             if ward is None:
                 continue
 
-            is_match = False
+            if is_match(ward, search):
+                matches.append(i)
+
+        return matches
 
+    def _find_ward(self, name: str, match: bool, include_alternates: bool):
+        """Internal function that flexibly finds a ward by name"""
+        def is_match(ward, search):
             if search(ward.name):
-                is_match = True
+                return True
             elif search(ward.code):
-                is_match = True
+                return True
             elif include_alternates:
                 for alternate in ward.alternate_names:
                     if search(alternate):
-                        is_match = True
-                        break
+                        return True
 
-                if not is_match:
-                    for alternate in ward.alternate_codes:
-                        if search(alternate):
-                            is_match = True
-                            break
+                for alternate in ward.alternate_codes:
+                    if search(alternate):
+                        return True
 
-            if is_match:
-                matches.append(i)
+            return False
 
-        return matches
+        return self._find("ward", name, match=match,
+                          include_alternates=include_alternates,
+                          is_match=is_match)
 
     def _find_authority(self, name: str, match: bool):
         """Internal function that flexibly finds a ward by authority"""
-        import re
-
-        if not isinstance(name, re.Pattern):
-            search = re.compile(name, re.IGNORECASE)
-        else:
-            search = name
-
-        if match:
-            search = search.match
-        else:
-            search = search.search
-
-        matches = []
-
-        for i, ward in enumerate(self.wards):
-            if ward is None:
-                continue
+        def is_match(ward, search):
+            return search(ward.authority) or search(ward.authority_code)
 
-            is_match = False
-
-            if search(ward.authority):
-                is_match = True
-            elif search(ward.authority_code):
-                is_match = True
-
-            if is_match:
-                matches.append(i)
-
-        return matches
+        return self._find("authority", name, match=match,
+                          include_alternates=False, is_match=is_match)
 
     def _find_region(self, name: str, match: bool):
         """Internal function that flexibly finds a ward by region"""
-        import re
+        def is_match(ward, search):
+            return search(ward.region) or search(ward.region_code)
 
-        if not isinstance(name, re.Pattern):
-            search = re.compile(name, re.IGNORECASE)
-        else:
-            search = name
+        return self._find("region", name, match=match,
+                          include_alternates=False, is_match=is_match)
 
-        if match:
-            search = search.match
-        else:
-            search = search.search
-
-        matches = []
-
-        for i, ward in enumerate(self.wards):
-            if ward is None:
-                continue
+    def find_exact(self, name: str, include_alternates: bool = True):
+        """Return the list of indicies of wards whose name or code is
+           exactly equal to 'name' (case-insensitive). This uses a
+           hash lookup, so is much quicker than a full search
 
-            is_match = False
-
-            if search(ward.region):
-                is_match = True
-            elif search(ward.region_code):
-                is_match = True
-
-            if is_match:
-                matches.append(i)
-
-        return matches
+           Parameters
+           ----------
+           name: str
+             Name or code of the ward to find
+           include_alternates: bool(True)
+             Whether or not to include alternative names and codes
+        """
+        return sorted(self._get_search_index("ward").exact(
+                      name, include_alternates))
 
     def _intersect(self, list1, list2):
         """Return the intersection of two lists"""
@@ -3,21 +3,33 @@ from __future__ import annotations
 from typing import List as _List
 from typing import Union as _Union
 from typing import Tuple as _Tuple
-
-from .utils._profiler import Profiler, NullProfiler
+from typing import TYPE_CHECKING
 
 from ._ward import Ward
 from ._wardinfo import WardInfos, WardInfo
+from ._wardcolumns import WardColumns
+
+if TYPE_CHECKING:
+    from .utils._profiler import Profiler
 
 __all__ = ["Wards"]
 
 
 class Wards:
-    """This class holds an entire network of Ward objects"""
+    """This class holds an entire network of Ward objects.
+
+       Internally the wards can be held either as a list of
+       Ward objects, or in columnar form (as a
+       :class:`~metawards._wardcolumns.WardColumns`), e.g. when
+       loaded from a binary file. The Ward objects are only
+       created from the columns when they are needed, while
+       the columns are used to quickly build Networks.
+    """
 
     def __init__(self, wards: _List[Ward] = None):
         """Construct, optionally from a list of Ward objects"""
-        self._wards = []
+        self._ward_list = []
+        self._columns = None
         self._info = WardInfos()
 
         self._unresolved = []
@@ -41,7 +53,58 @@ class Wards:
 
     def __eq__(self, other):
         return self.__class__ == other.__class__ and \
-            self.__dict__ == other.__dict__
+            self._wards == other._wards and \
+            self._info.wards == other._info.wards and \
+            self._unresolved == other._unresolved
+
+    @property
+    def _wards(self) -> _List[Ward]:
+        """The list of Ward objects, where the ith item is the
+           ward with ID 'i' (or None). These are created from the
+           columns if they have not been created already
+        """
+        if self._ward_list is None:
+            self._ward_list = self._columns.to_wards()
+
+        return self._ward_list
+
+    @_wards.setter
+    def _wards(self, wards: _List[Ward]) -> None:
+        self._ward_list = wards
+        self._columns = None
+
+    def _begin_edit(self) -> None:
+        """Call this before any of the Ward objects are edited. This
+           makes sure that the Ward objects exist, and discards the
+           columns as they will be out of date
+        """
+        if self._ward_list is None:
+            self._ward_list = self._columns.to_wards()
+
+        self._columns = None
+
+    def to_columns(self) -> WardColumns:
+        """Return these wards in columnar form. The columns are
+           cached until the wards are next edited. All connections
+           must be resolved
+        """
+        if self._columns is None:
+            self.assert_sane()
+            self._columns = WardColumns.from_wards(self._ward_list)
+
+        return self._columns
+
+    @staticmethod
+    def from_columns(columns: WardColumns) -> Wards:
+        """Return Wards that are held in the passed columns. The
+           Ward objects are only created when they are needed
+        """
+        wards = Wards()
+        wards._columns = columns
+        wards._ward_list = None
+        wards._info = WardInfos(columns.get_infos())
+
+        return wards
 
     def insert(self, wards: _List[Ward], overwrite: bool = True,
                _need_deep_copy: bool = True) -> None:
@@ -52,6 +115,8 @@ class Wards:
         if not isinstance(wards, list):
             wards = [wards]
 
+        self._begin_edit()
+
         for ward in wards:
             if isinstance(ward, Wards):
                 for w in ward._wards:
@@ -212,10 +277,8 @@ class Wards:
             if id._id is not None:
                 if idx != id._id:
                     return ValueError(f"No ward matching {id}")
-
-            w = self._wards[idx]
         elif isinstance(id, WardInfo):
-            w = self._wards[self._info.index(id)]
+            idx = self._info.index(id)
         elif isinstance(id, str):
             try:
                 return self[int(id)]
@@ -224,11 +287,19 @@ class Wards:
 
             return self[WardInfo(name=id)]
         else:
-            w = self._wards[id]
+            idx = id
+
+        if self._ward_list is None:
+            # create a new Ward from the columns, which is
+            # already a copy so can be edited safely
+            if idx < 0:
+                idx += len(self)
+
+            return self._columns.get_ward(idx)
 
         # must deepcopy this or else it can be changed behind our back
         from copy import deepcopy
-        return deepcopy(w)
+        return deepcopy(self._wards[idx])
 
     def index(self, id: _Union[int, str, WardInfo, Ward]) -> int:
         """Return the index of the ward that matches the passed
@@ -254,12 +325,12 @@ class Wards:
                 raise ValueError(f"No ward matching {id}")
 
             if id < 0:
-                id = len(self._wards) + id
+                id = len(self) + id
 
-            if id < 0 or id >= len(self._wards):
+            if id < 0 or id >= len(self):
                 raise ValueError(f"No ward matching {id}")
 
-            if self._wards[id] is None:
+            if not self._is_present(id):
                 raise ValueError(f"No ward matching {id}")
 
             return id
@@ -284,12 +355,12 @@ class Wards:
             id = int(id)
 
             if id < 0:
-                id = len(self._wards) + id
+                id = len(self) + id
 
-            if id < 0 or id >= len(self._wards):
+            if id < 0 or id >= len(self):
                 return False
             else:
-                return self._wards[id] is not None
+                return self._is_present(id)
 
     def contains(self, id: _Union[int, str, WardInfo]) -> bool:
         """Return whether or not the passed id - which can be an integer
@@ -298,10 +369,23 @@ class Wards:
         return self.__contains__(id)
 
     def __len__(self):
-        return len(self._wards)
+        if self._ward_list is None:
+            return len(self._columns)
+        else:
+            return len(self._ward_list)
+
+    def _is_present(self, i: int) -> bool:
+        """Return whether or not there is a ward at index 'i'"""
+        if self._ward_list is None:
+            return self._columns.present[i] != 0
+        else:
+            return self._ward_list[i] is not None
 
     def num_work_links(self):
         """Return the total number of work links"""
+        if self._ward_list is None:
+            return self._columns.num_work_links()
+
         n = 0
 
         for ward in self._wards:
@@ -312,6 +396,9 @@ class Wards:
 
     def num_play_links(self):
         """Return the total number of play links"""
+        if self._ward_list is None:
+            return self._columns.num_play_links()
+
         n = 0
 
         for ward in self._wards:
@@ -322,6 +409,9 @@ class Wards:
 
     def num_players(self):
         """Return the total number of players in this network"""
+        if self._ward_list is None:
+            return self._columns.num_players()
+
         num = 0
 
         for ward in self._wards:
@@ -332,6 +422,9 @@ class Wards:
 
     def num_workers(self):
         """Return the total number of workers in this network"""
+        if self._ward_list is None:
+            return self._columns.num_workers()
+
         num = 0
 
         for ward in self._wards:
@@ -342,6 +435,10 @@ class Wards:
 
     def population(self):
         """Return the total population in this network"""
+        if self._ward_list is None:
+            return self._columns.num_workers() + \
+                self._columns.num_players()
+
         num = 0
 
         for ward in self._wards:
@@ -368,12 +465,25 @@ class Wards:
            -------
            Wards: A copy of this Wards scaled by the requested amount
         """
+        if self._ward_list is None:
+            # scale the columns directly
+            columns = self._columns.scale(work_ratio=work_ratio,
+                                          play_ratio=play_ratio)
+
+            if _inplace:
+                self._columns = columns
+                return self
+            else:
+                return Wards.from_columns(columns)
+
         if _inplace:
             wards = self
         else:
             from copy import deepcopy
             wards = deepcopy(self)
 
+        wards._begin_edit()
+
         for ward in wards._wards:
             if ward is not None:
                 ward.scale(work_ratio=work_ratio, play_ratio=play_ratio,
@@ -430,6 +540,8 @@ class Wards:
                           f"{other}")
             raise ValueError("Cannot harmonise incompatible Wards")
 
+        self._begin_edit()
+
         for self_ward, other_ward in zip(self._wards, other._wards):
             if self_ward is None:
                 assert other_ward is None
@@ -478,7 +590,11 @@ class Wards:
 
     def assert_sane(self):
         """Make sure that we don't refer to any non-existent wards"""
-        if len(self._wards) == 0:
+        if len(self) == 0:
+            return
+
+        if self._ward_list is None:
+            self._columns.assert_sane()
             return
 
         self._resolve()
@@ -522,6 +638,7 @@ class Wards:
         """
         if len(self) > 0:
             if profiler is None:
+                from .utils._profiler import NullProfiler
                 profiler = NullProfiler()
 
             p = profiler.start("to_data")
@@ -566,6 +683,7 @@ class Wards:
             return Wards()
 
         if profiler is None:
+            from .utils._profiler import NullProfiler
             profiler = NullProfiler()
 
         p = profiler.start("from_data")
@@ -691,3 +809,32 @@ class Wards:
             raise IOError(f"Cannot load Wards from '{s}'")
 
         return Wards.from_data(data)
+
+    def to_binary(self, filename: str, auto_bzip: bool = False) -> str:
+        """Save the wards to 'filename' in a compact binary format.
+           This is much faster to write and read than JSON, so is
+           recommended for large networks.
+
+           Parameters
+           ----------
+           filename: str
+             The name of the file to write
+           auto_bzip: bool
+             Whether or not to bzip2 the written file. This makes the
+             file smaller, but slower to write and read
+
+           Returns
+           -------
+           str
+             The absolute path to the written file
+        """
+        return self.to_columns().to_binary(filename, auto_bzip=auto_bzip)
+
+    @staticmethod
+    def from_binary(filename: str) -> Wards:
+        """Return the Wards loaded from the passed binary file, which
+           was written using :meth:`~Wards.to_binary`. The Ward objects
+           are only created if they are needed, so this is fast
+           even for very large networks
+        """
+        return Wards.from_columns(WardColumns.from_binary(filename))
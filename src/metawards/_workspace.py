@@ -10,11 +10,32 @@ from ._networks import Networks
 __all__ = ["Workspace"]
 
 
+#: The per-ward fields of the workspace. These are only allocated,
+#: and so only calculated by output_core, if they are needed
+_per_ward_fields = ["ward_inf_tot", "total_inf_ward", "total_new_inf_ward",
+                    "incidence", "S_in_wards", "E_in_wards", "I_in_wards",
+                    "R_in_wards", "X_in_wards"]
+
+#: The per-stage fields of the workspace. These are small, and are
+#: needed for the population totals, so are always allocated
+_per_stage_fields = ["inf_tot", "pinf_tot", "n_inf_wards", "new_inf_moments"]
+
+
 @_dataclass
 class Workspace:
     """This class provides a workspace for the running calculation.
        This pre-allocates all of the memory into arrays, which
-       can then be used via cython memory views
+       can then be used via cython memory views.
+
+       Iterators, extractors, mixers and movers can declare the
+       fields that they read by setting a 'workspace_needs'
+       attribute, e.g.
+       ``extract_small.workspace_needs = ["inf_tot", "pinf_tot"]``.
+       If all of them declare their needs, then only the per-ward
+       fields that are needed are allocated (the others are None),
+       and so only these are calculated by
+       :meth:`~metawards.extractors.output_core`. All fields
+       are allocated if any of them don't declare their needs.
     """
     #: Number of disease classes (stages)
     n_inf_classes: int = 0
@@ -59,19 +80,69 @@ class Workspace:
     #: for named disease stages that don't fit into S, E, I or R
     X_in_wards: _Dict[str, _List[int]] = None
 
+    #: The moments of the positions of the new infections, i.e.
+    #: [total_new, sum_x, sum_y, sum_x2, sum_y2], where the
+    #: positions of the wards are weighted by their number of
+    #: new infections. These are used to calculate the dispersal
+    new_inf_moments: _List[float] = None
+
     #: The sub-workspaces used for the subnets of a
     #: multi-demographic Networks (list[Workspace])
     subspaces = None
 
     @staticmethod
-    def build(network: _Union[Network, Networks]):
+    def get_needs(*functions) -> _Union[_List[str], None]:
+        """Return the workspace fields needed by the passed stage
+           functions (e.g. the iterator, extractor, mixer and mover),
+           as declared via their 'workspace_needs' attributes. This
+           returns the union of the declared needs, or None if any
+           function does not declare its needs, meaning that all
+           fields are needed
+        """
+        needs = []
+
+        for function in functions:
+            function_needs = getattr(function, "workspace_needs", None)
+
+            if function_needs is None:
+                return None
+
+            for need in function_needs:
+                if need not in _per_ward_fields and \
+                        need not in _per_stage_fields:
+                    raise ValueError(
+                        f"Unrecognised workspace field '{need}' needed by "
+                        f"{function}. Available fields are "
+                        f"{_per_stage_fields + _per_ward_fields}")
+
+                if need not in needs:
+                    needs.append(need)
+
+        return needs
+
+    @staticmethod
+    def build(network: _Union[Network, Networks],
+              needs: _List[str] = None):
         """Create the workspace needed to run the model for the
-           passed network
+           passed network.
+
+           Parameters
+           ----------
+           network: Network or Networks
+             The network that will be modelled
+           needs: List[str]
+             The names of the fields that are needed, e.g. from
+             :meth:`Workspace.get_needs`. Only the per-ward fields
+             in this list are allocated. All fields are allocated
+             if this is None
         """
         params = network.params
 
         workspace = Workspace()
 
+        if needs is None:
+            needs = _per_ward_fields
+
         if isinstance(network, Network):
             disease = params.disease_params
             n_inf_classes = disease.N_INF_CLASSES()
@@ -81,48 +152,48 @@ class Workspace:
 
             size = workspace.nnodes + 1  # 1-indexed
 
-            from .utils._array import create_int_array
+            from .utils._array import create_int_array, create_double_array
 
             workspace.inf_tot = create_int_array(n_inf_classes, 0)
             workspace.pinf_tot = create_int_array(n_inf_classes, 0)
             workspace.n_inf_wards = create_int_array(n_inf_classes, 0)
 
-            workspace.total_inf_ward = create_int_array(size, 0)
-            workspace.total_new_inf_ward = create_int_array(size, 0)
-            workspace.incidence = create_int_array(size, 0)
-
-            workspace.S_in_wards = create_int_array(size, 0)
+            workspace.new_inf_moments = create_double_array(5, 0.0)
 
-            if "E" in disease.mapping:
-                workspace.E_in_wards = create_int_array(size, 0)
+            for field in ["total_inf_ward", "total_new_inf_ward",
+                          "incidence", "S_in_wards"]:
+                if field in needs:
+                    setattr(workspace, field, create_int_array(size, 0))
 
-            if "I" in disease.mapping:
-                workspace.I_in_wards = create_int_array(size, 0)
+            for mapping in ["E", "I", "R"]:
+                field = f"{mapping}_in_wards"
 
-            if "R" in disease.mapping:
-                workspace.R_in_wards = create_int_array(size, 0)
+                if mapping in disease.mapping and field in needs:
+                    setattr(workspace, field, create_int_array(size, 0))
 
-            for mapping in disease.mapping:
-                if mapping not in ["*", "E", "I", "R"]:
-                    if workspace.X_in_wards is None:
-                        workspace.X_in_wards = {}
+            if "X_in_wards" in needs:
+                for mapping in disease.mapping:
+                    if mapping not in ["*", "E", "I", "R"]:
+                        if workspace.X_in_wards is None:
+                            workspace.X_in_wards = {}
 
-                    if mapping not in workspace.X_in_wards:
-                        workspace.X_in_wards[mapping] = create_int_array(
-                            size, 0)
+                        if mapping not in workspace.X_in_wards:
+                            workspace.X_in_wards[mapping] = \
+                                create_int_array(size, 0)
 
-            workspace.ward_inf_tot = []
+            if "ward_inf_tot" in needs:
+                workspace.ward_inf_tot = []
 
-            for i in range(0, n_inf_classes):
-                workspace.ward_inf_tot.append(create_int_array(size, 0))
+                for i in range(0, n_inf_classes):
+                    workspace.ward_inf_tot.append(create_int_array(size, 0))
 
         elif isinstance(network, Networks):
-            workspace = Workspace.build(network.overall)
+            workspace = Workspace.build(network.overall, needs=needs)
 
             subspaces = []
 
             for subnet in network.subnets:
-                subspaces.append(Workspace.build(subnet))
+                subspaces.append(Workspace.build(subnet, needs=needs))
 
             workspace.subspaces = subspaces
 
@@ -135,58 +135,27 @@ def create_overview_plot(df, output_dir: str = None,
                     if max_val > max_y[column]:
                         max_y[column] = max_val
 
+    if len(fingerprints) > 1 and align_axes:
+        limits = (min_date, max_date, min_y, max_y)
+    else:
+        limits = None
+
     for fingerprint in fingerprints:
         if fingerprint is None:
             df2 = df
         else:
             df2 = df[df["fingerprint"] == fingerprint]
 
-        fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
-
-        i = 0
-        j = 0
-
-        for column in columns:
-            ax = df2.pivot(index="date", columns=repeat,
-                           values=column).plot.line(ax=axes[i][j])
-            ax.tick_params('x', labelrotation=90)
-            ax.get_legend().remove()
-            ax.set_ylabel("Population")
-
-            if len(fingerprints) > 1 and align_axes:
-                ax.set_xlim(min_date, max_date)
-                ax.set_ylim(min_y[column], 1.1*max_y[column])
-
-            if len(fingerprints) > 1:
-                from metawards import VariableSet
-                fvals, _rpt = VariableSet.extract_values(fingerprint)
-                ax.set_title(f"{fvals} : {column}")
-            else:
-                ax.set_title(column)
-
-            j += 1
-            if j == 2:
-                j = 0
-                i += 1
-
-        fig.tight_layout(pad=1)
+        fig = _draw_overview_plot(plt, df2, fingerprint=fingerprint,
+                                  repeat=repeat, columns=columns,
+                                  limits=limits, nfigs=nfigs)
 
         if output_dir:
-            import os
-
-            if nfigs == 1:
-                filename = os.path.join(output_dir, f"overview.{format}")
-            else:
-                filename = os.path.join(output_dir,
-                                        f"overview_{fingerprint}.{format}")
-
-            if verbose:
-                print(f"Saving figure {filename}")
-
-            fig.savefig(filename, dpi=dpi)
-            plt.close()
-            fig = None
-            figs[fingerprint] = filename
+            figs[fingerprint] = _save_figure(plt, fig, output_dir=output_dir,
+                                             name="overview",
+                                             fingerprint=fingerprint,
+                                             nfigs=nfigs, format=format,
+                                             dpi=dpi, verbose=verbose)
         else:
             if verbose:
                 print(f"Created the figure for {fingerprint}")
@@ -201,6 +170,70 @@ def create_overview_plot(df, output_dir: str = None,
         return figs
 
 
+def _draw_overview_plot(plt, df, fingerprint, repeat: str, columns,
+                        limits, nfigs: int, x: str = "date"):
+    """Draw and return the overview figure of the passed dataframe,
+       which contains the data for a single fingerprint. 'limits'
+       are the (min_x, max_x, min_y, max_y) used to align the axes,
+       or None if the axes are not aligned
+    """
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
+
+    i = 0
+    j = 0
+
+    for column in columns:
+        ax = df.pivot(index=x, columns=repeat,
+                      values=column).plot.line(ax=axes[i][j])
+        ax.tick_params('x', labelrotation=90)
+        ax.get_legend().remove()
+        ax.set_ylabel("Population")
+
+        if limits is not None:
+            (min_x, max_x, min_y, max_y) = limits
+            ax.set_xlim(min_x, max_x)
+            ax.set_ylim(min_y[column], 1.1*max_y[column])
+
+        if nfigs > 1:
+            from metawards import VariableSet
+            fvals, _rpt = VariableSet.extract_values(fingerprint)
+            ax.set_title(f"{fvals} : {column}")
+        else:
+            ax.set_title(column)
+
+        j += 1
+        if j == 2:
+            j = 0
+            i += 1
+
+    fig.tight_layout(pad=1)
+
+    return fig
+
+
+def _save_figure(plt, fig, output_dir: str, name: str, fingerprint,
+                 nfigs: int, format: str, dpi: int, verbose: bool) -> str:
+    """Save the passed figure into 'output_dir' as name.format (or
+       name_fingerprint.format if there are multiple figures),
+       closing the figure and returning the filename
+    """
+    import os
+
+    if nfigs == 1:
+        filename = os.path.join(output_dir, f"{name}.{format}")
+    else:
+        filename = os.path.join(output_dir,
+                                f"{name}_{fingerprint}.{format}")
+
+    if verbose:
+        print(f"Saving figure {filename}")
+
+    fig.savefig(filename, dpi=dpi)
+    plt.close(fig)
+
+    return filename
+
+
 def create_average_plot(df, output_dir: str = None, format: str = "jpg",
                         dpi: int = 150, align_axes: bool = True,
                         verbose: bool = True):
@@ -268,45 +301,18 @@ def create_average_plot(df, output_dir: str = None, format: str = "jpg",
         if nrepeats > 1:
             _, plt = import_graphics_modules()
 
-            fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
-
-            mean_average = df2.groupby("date").mean()
-            stddev = df2.groupby("date").std()
-
-            i = 0
-            j = 0
-
-            for column in ["E", "I", "IW", "R"]:
-                ax = mean_average.plot.line(y=column, yerr=stddev[column],
-                                            ax=axes[i][j])
-                ax.tick_params('x', labelrotation=90)
-                ax.get_legend().remove()
-                ax.set_title(column)
-                ax.set_ylabel("Population")
+            mean_average = df2.groupby("date").mean(numeric_only=True)
+            stddev = df2.groupby("date").std(numeric_only=True)
 
-                j += 1
-                if j == 2:
-                    j = 0
-                    i += 1
-
-            fig.tight_layout(pad=1)
+            fig = _draw_average_plot(plt, mean_average, stddev)
 
             if output_dir:
-                import os
-
-                if nfigs == 1:
-                    filename = os.path.join(output_dir, f"average.{format}")
-                else:
-                    filename = os.path.join(output_dir,
-                                            f"average_{fingerprint}.{format}")
-
-                if verbose:
-                    print(f"Saving figure {filename}")
-
-                fig.savefig(filename, dpi=dpi)
-                fig = None
-                plt.close()
-                figs[fingerprint] = filename
+                figs[fingerprint] = _save_figure(plt, fig,
+                                                 output_dir=output_dir,
+                                                 name="average",
+                                                 fingerprint=fingerprint,
+                                                 nfigs=nfigs, format=format,
+                                                 dpi=dpi, verbose=verbose)
             else:
                 if verbose:
                     print(f"Created the figure for {fingerprint}")
@@ -321,6 +327,34 @@ def create_average_plot(df, output_dir: str = None, format: str = "jpg",
         return figs
 
 
+def _draw_average_plot(plt, mean_average, stddev,
+                       columns=["E", "I", "IW", "R"]):
+    """Draw and return the average figure from the passed per-day
+       mean and standard deviation dataframes
+    """
+    fig, axes = plt.subplots(nrows=2, ncols=2, figsize=(10, 10))
+
+    i = 0
+    j = 0
+
+    for column in columns:
+        ax = mean_average.plot.line(y=column, yerr=stddev[column],
+                                    ax=axes[i][j])
+        ax.tick_params('x', labelrotation=90)
+        ax.get_legend().remove()
+        ax.set_title(column)
+        ax.set_ylabel("Population")
+
+        j += 1
+        if j == 2:
+            j = 0
+            i += 1
+
+    fig.tight_layout(pad=1)
+
+    return fig
+
+
 def get_color(name=None, idx=None):
     """Return a good color for the passed name or passed index (idx)"""
     name = str(name).strip().lower()
@@ -435,9 +469,291 @@ def create_demographics_plot(df, output_dir: str = None,
     return fig
 
 
+def _combine_moments(pd, moments, chunk_moments):
+    """Combine the running per-group (count, mean, M2) moments with
+       those from the next chunk, using the parallel algorithm of
+       Chan et al. This gives the same mean and standard deviation
+       as if all of the data was grouped at once
+    """
+    if moments is None:
+        return chunk_moments
+
+    (n_a, mean_a, m2_a) = moments
+    (n_b, mean_b, m2_b) = chunk_moments
+
+    index = n_a.index.union(n_b.index)
+
+    n_a = n_a.reindex(index, fill_value=0)
+    n_b = n_b.reindex(index, fill_value=0)
+    mean_a = mean_a.reindex(index, fill_value=0.0)
+    mean_b = mean_b.reindex(index, fill_value=0.0)
+    m2_a = m2_a.reindex(index, fill_value=0.0)
+    m2_b = m2_b.reindex(index, fill_value=0.0)
+
+    n = n_a + n_b
+    delta = mean_b - mean_a
+
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+
+    return (n, mean, m2)
+
+
+def _stream_results(pd, results: str, x: str, columns, scratch_dir: str,
+                    nbuckets: int, chunksize: int):
+    """Read the passed results file in chunks of 'chunksize' rows,
+       holding at most one chunk in memory. This returns the
+       statistics needed for the plots, i.e.
+
+       fingerprints: the fingerprints in the order they appear
+       nrepeats: the number of repeats of each fingerprint
+       limits: the minimum and maximum of 'day' and each column
+       moments: the (count, mean, M2) of each column for each
+                (fingerprint, x)
+       buckets: the filenames of the files in 'scratch_dir' to which
+                the (fingerprint, repeat, x, columns) data has been
+                written. The data for each fingerprint is all
+                in the same bucket, so the data for each fingerprint
+                can be loaded without loading the whole file.
+    """
+    import os
+    import pickle
+
+    usecols = ["fingerprint", "repeat", "day", x] + columns
+    usecols = list(dict.fromkeys(usecols))
+
+    fingerprints = {}
+    repeats = {}
+    min_vals = {}
+    max_vals = {}
+    moments = None
+
+    buckets = [os.path.join(scratch_dir, f"bucket_{i}.pkl")
+               for i in range(0, nbuckets)]
+    files = [open(bucket, "wb") for bucket in buckets]
+
+    try:
+        for chunk in pd.read_csv(results, usecols=usecols,
+                                 chunksize=chunksize):
+            for fingerprint in chunk["fingerprint"].unique():
+                fingerprints.setdefault(fingerprint, len(fingerprints))
+
+            for fingerprint, values in \
+                    chunk.groupby("fingerprint")["repeat"].unique().items():
+                repeats.setdefault(fingerprint, set()).update(values)
+
+            for column in ["day"] + columns:
+                lo = chunk[column].min()
+                hi = chunk[column].max()
+
+                if column not in min_vals or lo < min_vals[column]:
+                    min_vals[column] = lo
+
+                if column not in max_vals or hi > max_vals[column]:
+                    max_vals[column] = hi
+
+            grouped = chunk.groupby(["fingerprint", x])[columns]
+            n = grouped.count()
+            moments = _combine_moments(
+                pd, moments, (n, grouped.mean(), grouped.var(ddof=0) * n))
+
+            data = chunk[["fingerprint", "repeat", x] + columns]
+
+            if nbuckets == 1:
+                pickle.dump(data, files[0])
+            else:
+                bucket = pd.util.hash_pandas_object(
+                    chunk["fingerprint"], index=False) % nbuckets
+
+                for i, part in data.groupby(bucket.values):
+                    pickle.dump(part, files[i])
+    finally:
+        for f in files:
+            f.close()
+
+    nrepeats = {fingerprint: len(values)
+                for fingerprint, values in repeats.items()}
+
+    return (list(fingerprints.keys()), nrepeats, (min_vals, max_vals),
+            moments, buckets)
+
+
+def _read_bucket(pd, filename: str):
+    """Read and return all of the data written to the passed bucket"""
+    import pickle
+
+    parts = []
+
+    with open(filename, "rb") as f:
+        while True:
+            try:
+                parts.append(pickle.load(f))
+            except EOFError:
+                break
+
+    if len(parts) == 0:
+        return None
+    else:
+        return pd.concat(parts)
+
+
+def _save_overview_plot(df, fingerprint, x: str, limits, nfigs: int,
+                        output_dir: str, format: str, dpi: int,
+                        verbose: bool) -> str:
+    """Draw and save the overview plot for a single fingerprint. This
+       is a module-level function so that it can be run in a separate
+       process
+    """
+    _, plt = import_graphics_modules()
+
+    fig = _draw_overview_plot(plt, df, fingerprint=fingerprint,
+                              repeat="repeat", columns=["E", "I", "IW", "R"],
+                              limits=limits, nfigs=nfigs, x=x)
+
+    return _save_figure(plt, fig, output_dir=output_dir, name="overview",
+                        fingerprint=fingerprint, nfigs=nfigs, format=format,
+                        dpi=dpi, verbose=verbose)
+
+
+def _save_average_plot(mean_average, stddev, fingerprint, nfigs: int,
+                       output_dir: str, format: str, dpi: int,
+                       verbose: bool) -> str:
+    """Draw and save the average plot for a single fingerprint. This
+       is a module-level function so that it can be run in a separate
+       process
+    """
+    _, plt = import_graphics_modules()
+
+    fig = _draw_average_plot(plt, mean_average, stddev)
+
+    return _save_figure(plt, fig, output_dir=output_dir, name="average",
+                        fingerprint=fingerprint, nfigs=nfigs, format=format,
+                        dpi=dpi, verbose=verbose)
+
+
+def _save_streamed_plots(pd, results: str, output_dir: str, format: str,
+                         dpi: int, align_axes: bool, nprocs: int,
+                         chunksize: int, nbuckets: int, verbose: bool):
+    """Create the overview and average plots of the passed results
+       file without loading the whole file into memory. The file is
+       streamed once to calculate the per-day means and standard
+       deviations (for the average plots) and the axis limits, while
+       the data needed for the overview plots is written to
+       'nbuckets' scratch files. Each bucket is then loaded in turn,
+       and the figures for its fingerprints are drawn (in parallel
+       over 'nprocs' processes)
+    """
+    import tempfile
+
+    x = "date" if "date" in pd.read_csv(results, nrows=0).columns \
+        else "day"
+
+    columns = ["E", "I", "IW", "R"]
+
+    with tempfile.TemporaryDirectory(prefix="metawards_plot_") as scratch:
+        if verbose:
+            print(f"Reading data from {results}...")
+
+        (fingerprints, nrepeats, (min_vals, max_vals),
+         moments, buckets) = _stream_results(pd, results, x=x,
+                                             columns=columns,
+                                             scratch_dir=scratch,
+                                             nbuckets=nbuckets,
+                                             chunksize=chunksize)
+
+        nfigs = len(fingerprints)
+
+        if nfigs > 1 and align_axes:
+            limits = (min_vals["day"], max_vals["day"], min_vals, max_vals)
+        else:
+            limits = None
+
+        from collections import deque
+
+        if nprocs is not None and nprocs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=nprocs)
+        else:
+            pool = None
+
+        # the (figures, fingerprint, future) of the figures that are
+        # being drawn. This is limited to a few more than the number
+        # of processes so that the data for all of the figures is
+        # never held in memory at once
+        running = deque()
+        max_running = 2 * nprocs if pool is not None else 0
+
+        def drain(limit: int = 0):
+            while len(running) > limit:
+                (figs, fingerprint, future) = running.popleft()
+                figs[fingerprint] = future.result()
+
+        def submit(figs, fingerprint, func, *args, **kwargs):
+            if pool is None:
+                figs[fingerprint] = func(*args, fingerprint=fingerprint,
+                                         **kwargs)
+            else:
+                drain(max_running - 1)
+                running.append((figs, fingerprint,
+                                pool.submit(func, *args,
+                                            fingerprint=fingerprint,
+                                            **kwargs)))
+
+        try:
+            overviews = {}
+
+            if verbose:
+                print(f"Creating overview plot(s)...")
+
+            for bucket in buckets:
+                df = _read_bucket(pd, bucket)
+
+                if df is None:
+                    continue
+
+                for fingerprint, df2 in df.groupby("fingerprint", sort=False):
+                    submit(overviews, fingerprint, _save_overview_plot, df2,
+                           x=x, limits=limits, nfigs=nfigs,
+                           output_dir=output_dir, format=format, dpi=dpi,
+                           verbose=verbose)
+
+                # finish this bucket before the next is loaded
+                drain()
+                df = None
+
+            if verbose:
+                print(f"Creating average plot(s)...")
+
+            averages = {}
+            (n, mean, m2) = moments
+            stddev = (m2 / (n - 1)) ** 0.5
+
+            for fingerprint in fingerprints:
+                if nrepeats[fingerprint] > 1:
+                    submit(averages, fingerprint, _save_average_plot,
+                           mean.loc[fingerprint], stddev.loc[fingerprint],
+                           nfigs=nfigs, output_dir=output_dir,
+                           format=format, dpi=dpi, verbose=verbose)
+
+            drain()
+
+            filenames = [overviews[f] for f in fingerprints
+                         if f in overviews]
+            filenames += [averages[f] for f in fingerprints
+                          if f in averages]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    return filenames
+
+
 def save_summary_plots(results: str, output_dir: str = None,
                        format: str = "jpg", dpi: int = 150,
                        align_axes: bool = True,
+                       nprocs: int = 1,
+                       chunksize: int = 1000000,
+                       nbuckets: int = 16,
                        verbose=False):
     """Create summary plots of the data contained in the passed
        'results.csv.bz2' file that was produced by metawards
@@ -458,6 +774,20 @@ def save_summary_plots(results: str, output_dir: str = None,
          png, jpg etc)
        align_axes: bool
          Whether or not to plot all graphs in a set on the same axes
+       nprocs: int
+         The number of processes to use to draw the graphs for
+         different fingerprints in parallel
+       chunksize: int
+         The number of rows of 'results' to read at a time. The
+         results of multiple model runs are never loaded into memory
+         all at once. Instead the file is streamed in chunks, and
+         the per-day means and standard deviations are calculated
+         as they are read
+       nbuckets: int
+         The number of scratch files (buckets) into which the data
+         for the overview plots is split while it is streamed. Only
+         one bucket is loaded at a time, so the memory needed is
+         roughly the size of 'results' divided by 'nbuckets'
        verbose: bool
          Whether or not to print progress to the screen
 
@@ -477,11 +807,6 @@ def save_summary_plots(results: str, output_dir: str = None,
     pd, _ = import_graphics_modules(verbose=verbose)
     import os
 
-    if verbose:
-        print(f"Reading data from {results}...")
-
-    df = pd.read_csv(results)
-
     if output_dir is None:
         output_dir = os.path.dirname(results)
 
@@ -494,46 +819,26 @@ def save_summary_plots(results: str, output_dir: str = None,
     filenames = []
 
     # is this an output from multiple runs?
-    try:
-        df["fingerprint"]
-        has_fingerprint = True
-    except Exception:
-        has_fingerprint = False
-        pass
+    header = pd.read_csv(results, nrows=0).columns
+    has_fingerprint = "fingerprint" in header
 
     # does this have demographic data?
-    try:
-        df["demographic"]
-        has_demographics = True
-    except Exception:
-        has_demographics = False
+    has_demographics = "demographic" in header
 
     if has_fingerprint:
-        if verbose:
-            print(f"Creating overview plot(s)...")
-
-        figs = create_overview_plot(df, output_dir=output_dir,
-                                    format=format, dpi=dpi,
-                                    align_axes=align_axes)
-
-        if isinstance(figs, dict):
-            filenames += list(figs.values())
-        elif figs is not None:
-            filenames.append(figs)
+        filenames += _save_streamed_plots(pd, results, output_dir=output_dir,
+                                          format=format, dpi=dpi,
+                                          align_axes=align_axes,
+                                          nprocs=nprocs, chunksize=chunksize,
+                                          nbuckets=nbuckets, verbose=verbose)
 
+    if has_demographics:
+        # this is the trajectory.csv of a single model run, so is small
         if verbose:
-            print(f"Creating average plot(s)...")
+            print(f"Reading data from {results}...")
 
-        figs = create_average_plot(df, output_dir=output_dir,
-                                   format=format, dpi=dpi,
-                                   align_axes=align_axes)
+        df = pd.read_csv(results)
 
-        if isinstance(figs, dict):
-            filenames += list(figs.values())
-        elif figs is not None:
-            filenames.append(figs)
-
-    if has_demographics:
         fig = create_demographics_plot(df, output_dir=output_dir,
                                        format=format, dpi=dpi)
 
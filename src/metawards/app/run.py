@@ -227,6 +227,19 @@ def parse_args():
     parser.add_argument('--no-progress', action="store_true", default=None,
                         help=f"Disable the progress bars that show progress.")
 
+    parser.add_argument('--log-mode', type=str, default=None,
+                        help=f"The mode used to write the output.txt log "
+                             f"of each model run. Use 'rich' (default) "
+                             f"for the same rich output as the console, "
+                             f"or 'plain' for lower-overhead plain text "
+                             f"output, which is quicker and smaller for "
+                             f"large sweeps.")
+
+    parser.add_argument('--log-every', type=int, default=None,
+                        help=f"Only print the per-day summary of each "
+                             f"model run every this number of days "
+                             f"(default 1, i.e. every day).")
+
     parser.add_argument("--debug", action="store_true", default=None,
                         help=f"Enable debugging output. This is useful "
                              f"for MetaWards developers or if you are "
@@ -242,6 +255,22 @@ def parse_args():
                              "fingerprint, 'sequential' for sequential "
                              "numbering, or 'uid' to generate a unique ID.")
 
+    parser.add_argument("--results-store", action="store_true",
+                        default=None,
+                        help="Write the output of all of the model runs "
+                             "into a small number of container files "
+                             "(shards) in the output directory, rather "
+                             "than into one directory per model run. "
+                             "Use this for large sweeps to reduce the "
+                             "number of files written to shared "
+                             "filesystems. Use metawards.ResultsStore "
+                             "to read the output of each run.")
+
+    parser.add_argument("--results-shards", type=int, default=None,
+                        help="The number of container files (shards) "
+                             "to use for '--results-store'. By default "
+                             "this is one shard per 1000 model runs.")
+
     parser.add_argument('--nthreads', type=int, default=None,
                         help="Number of threads over which parallelise an "
                              "individual model run. The total number of "
@@ -303,6 +332,13 @@ def parse_args():
     parser.add_argument('--max-links', type=int, default=None,
                         help="Maximum number of links that can be read")
 
+    parser.add_argument('--ward-order', type=str, default=None,
+                        help="Renumber the wards of the network into this "
+                             "order to improve memory locality. Use "
+                             "'hilbert' to order the wards along a "
+                             "space-filling curve through their positions. "
+                             "Outputs still use the original ward order.")
+
     parser.add_argument('--profile', action="store_true",
                         default=None, help="Enable profiling of the code")
 
@@ -338,6 +374,15 @@ def parse_args():
         from ..utils._console import Console
         Console.set_debugging_enabled(args.debug, level=args.debug_level)
 
+    if args.log_every is not None and args.log_every < 1:
+        parser.error(f"--log-every must be 1 or more, not "
+                     f"{args.log_every}")
+
+    if args.log_mode or args.log_every is not None:
+        from ..utils._console import Console
+        Console.set_log_mode(mode=args.log_mode or "rich",
+                             every=args.log_every or 1)
+
     if args.version:
         from metawards import print_version_string
         print_version_string()
@@ -804,7 +849,8 @@ def cli():
 
         from metawards import VariableSets, VariableSet
         variables = VariableSets.read(filename=args.input,
-                                      line_numbers=linenums)
+                                      line_numbers=linenums,
+                                      lazy=True)
     else:
         from metawards import VariableSets, VariableSet
         # create a VariableSets with one null VariableSet
@@ -1145,7 +1191,8 @@ def cli():
                                      max_nodes=max_nodes,
                                      max_links=max_links,
                                      profiler=profiler,
-                                     nthreads=nthreads)
+                                     nthreads=nthreads,
+                                     ward_order=args.ward_order)
     else:
         Console.rule("Model")
         Console.print(params.input_files, markdown=True)
@@ -1159,7 +1206,8 @@ def cli():
                                 max_nodes=max_nodes,
                                 max_links=max_links,
                                 profiler=profiler,
-                                nthreads=nthreads)
+                                nthreads=nthreads,
+                                ward_order=args.ward_order)
 
     from metawards import OutputFiles
     from metawards.utils import run_models
@@ -1259,7 +1307,9 @@ def cli():
                             mixer=mixer,
                             mover=mover,
                             profiler=profiler,
-                            parallel_scheme=parallel_scheme)
+                            parallel_scheme=parallel_scheme,
+                            results_store=args.results_store,
+                            results_shards=args.results_shards)
 
         if result is None or len(result) == 0:
             Console.print("No output - end of run")
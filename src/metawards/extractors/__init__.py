@@ -7,11 +7,14 @@ Functions
 .. autosummary::
     :toctree: generated/
 
+    build_sampled_extractor
+
     extract_custom
     extract_default
     extract_large
     extract_none
     extract_small
+    extract_wards_db
 
     output_basic
     output_core
@@ -22,6 +25,9 @@ Functions
     output_prevalence
     output_trajectory
     output_wards_trajectory
+    output_wards_db
+
+    finalise_wards_db
 
     setup_core
 """
@@ -30,7 +36,9 @@ from ._extract_default import *
 from ._extract_custom import *
 from ._extract_large import *
 from ._extract_none import *
+from ._extract_sampled import *
 from ._extract_small import *
+from ._extract_wards_db import *
 
 from ._output_basic import *
 from ._output_core import *
@@ -39,3 +47,4 @@ from ._output_incidence import *
 from ._output_prevalence import *
 from ._output_trajectory import *
 from ._output_wards_trajectory import *
+from ._output_wards_db import *
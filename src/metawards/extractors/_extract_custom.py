@@ -158,8 +158,15 @@ def build_custom_extractor(custom_function: _Union[str, MetaFunction],
     Console.print(f"Building a custom extractor for {custom_function}",
                   style="magenta")
 
-    return lambda **kwargs: extract_custom(custom_function=custom_function,
-                                           **kwargs)
+    def extractor(**kwargs):
+        return extract_custom(custom_function=custom_function, **kwargs)
+
+    # the non-"analyse" stages of extract_default don't read the
+    # workspace, so the needs are those of the custom function
+    if hasattr(custom_function, "workspace_needs"):
+        extractor.workspace_needs = custom_function.workspace_needs
+
+    return extractor
 
 
 def extract_custom(custom_function: MetaFunction,
@@ -53,3 +53,10 @@ def extract_default(stage: str, **kwargs) -> _List[MetaFunction]:
     else:
         # we don't do anything at the "foi", "analyse" or "finalise" stages
         return []
+
+
+# the workspace fields read by the functions above
+# (see Workspace.get_needs)
+extract_default.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                   "new_inf_moments", "incidence",
+                                   "total_inf_ward"]
@@ -11,3 +11,9 @@ def extract_large(**kwargs):
     from ._extract_default import extract_default
 
     return extract_default(**kwargs) + [output_wards_trajectory]
+
+
+extract_large.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                 "new_inf_moments", "incidence",
+                                 "total_inf_ward", "S_in_wards", "E_in_wards",
+                                 "I_in_wards", "R_in_wards", "X_in_wards"]
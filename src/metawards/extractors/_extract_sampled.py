@@ -0,0 +1,232 @@
+
+from typing import Union as _Union
+from typing import List as _List
+from typing import Callable as _Callable
+from datetime import date as _date
+
+from .._population import Population
+from ..utils._get_functions import MetaFunction, accepts_stage
+
+__all__ = ["build_sampled_extractor"]
+
+
+def _to_day_or_date(value):
+    """Convert the passed value into either an integer day or a date"""
+    if value is None or isinstance(value, _date):
+        return value
+    elif isinstance(value, str):
+        return _date.fromisoformat(value)
+    else:
+        return int(value)
+
+
+def _compare(population: Population, value) -> int:
+    """Return -1, 0 or 1 depending on whether the day (or date) of
+       the population is before, on or after 'value'
+    """
+    if isinstance(value, _date):
+        if population.date is None:
+            raise ValueError(
+                f"Cannot compare against the date {value} as the model "
+                f"is not being run with a start date")
+
+        current = population.date
+    else:
+        current = population.day
+
+    if current < value:
+        return -1
+    elif current > value:
+        return 1
+    else:
+        return 0
+
+
+class _SampledExtractor:
+    """An extractor that only calls the "analyse" functions of
+       another extractor on selected days. This is a class (rather
+       than a closure) so that it can be pickled and sent to the
+       workers of a multi-process run.
+    """
+
+    def __init__(self, extractor, every, days, start, end, when):
+        self._extractor = extractor
+        self._every = every
+        self._days = days
+        self._start = start
+        self._end = end
+        self._when = when
+
+        needs = getattr(extractor, "workspace_needs", None)
+
+        if needs is not None:
+            self.workspace_needs = needs
+
+    def __repr__(self):
+        return f"SampledExtractor({self._extractor}, every={self._every}, " \
+               f"days={self._days}, start={self._start}, end={self._end}, " \
+               f"when={self._when})"
+
+    def _in_window(self, population: Population) -> bool:
+        """Return whether the day is within the [start, end] window"""
+        if self._start is not None and _compare(population, self._start) < 0:
+            return False
+        elif self._end is not None and _compare(population, self._end) > 0:
+            return False
+        else:
+            return True
+
+    def _is_selected_day(self, population: Population) -> bool:
+        """Return whether the day is selected by 'every' or 'days'"""
+        if self._every is None and self._days is None and self._when is None:
+            return True
+
+        if self._every is not None:
+            if isinstance(self._start, int):
+                start = self._start
+            else:
+                start = 0
+
+            if (population.day - start) % self._every == 0:
+                return True
+
+        if self._days is not None:
+            for day in self._days:
+                if _compare(population, day) == 0:
+                    return True
+
+        return False
+
+    def is_selected(self, population: Population,
+                    check_when: bool = True) -> bool:
+        """Return whether or not the analyse functions should be
+           called for the passed population (day). If 'check_when'
+           is False then the 'when' trigger is not called, and
+           None is returned if the day is only selected if the
+           trigger returns True
+        """
+        if not self._in_window(population):
+            return False
+        elif self._is_selected_day(population):
+            return True
+        elif self._when is None:
+            return False
+        elif check_when:
+            return bool(self._when(population))
+        else:
+            return None
+
+    def __call__(self, stage: str, population: Population, **kwargs):
+        triggered = False
+
+        if stage == "analyse":
+            selected = self.is_selected(population, check_when=False)
+
+            if selected is False:
+                return []
+
+            triggered = selected is None
+
+        kwargs["stage"] = stage
+        kwargs["population"] = population
+
+        if accepts_stage(self._extractor):
+            funcs = self._extractor(**kwargs)
+        else:
+            from ._extract_custom import extract_custom
+            funcs = extract_custom(custom_function=self._extractor, **kwargs)
+
+        if triggered:
+            # the functions for the day are collected before the
+            # infections are calculated, so the trigger is checked
+            # when the functions are called
+            from functools import partial
+            funcs = [partial(_call_when, func, self._when) for func in funcs]
+
+        return funcs
+
+
+def _call_when(func: MetaFunction, when, population: Population, **kwargs):
+    """Call 'func' only if 'when(population)' is True"""
+    if when(population):
+        func(population=population, **kwargs)
+
+
+def build_sampled_extractor(
+        extractor: _Union[str, MetaFunction] = None,
+        every: int = None,
+        days: _List[_Union[int, _date, str]] = None,
+        start: _Union[int, _date, str] = None,
+        end: _Union[int, _date, str] = None,
+        when: _Callable[[Population], bool] = None) -> MetaFunction:
+    """Build and return an extractor that wraps 'extractor', and which
+       only calls its "analyse" functions on selected days. All of
+       the other stages of 'extractor' are called as normal (so, e.g.
+       :meth:`~metawards.extractors.output_core` still accumulates
+       the data every day). Use this to reduce the size of the output
+       from extractors that write large per-ward files, e.g.
+
+       >>> extractor = build_sampled_extractor(extract_large, every=7)
+
+       will only write the ward trajectories every seven days.
+
+       A day is selected if it is within the [start, end] window,
+       and it matches any of 'every', 'days' or 'when'. Every day in
+       the window is selected if none of these are set.
+
+       Parameters
+       ----------
+       extractor: MetaFunction or str
+         The extractor to wrap. This is extract_default if this is
+         None. Strings are the names of extractors in
+         metawards.extractors, or are imported as for
+         :meth:`~metawards.extractors.build_custom_extractor`
+       every: int
+         Select every 'every' days, counted from 'start' if that is
+         a day, else from day 0
+       days: List[int, date or str]
+         Select these days (integers) or dates (date objects or
+         ISO-format date strings)
+       start: int, date or str
+         The first day or date of the window (inclusive)
+       end: int, date or str
+         The last day or date of the window (inclusive)
+       when: Callable[[Population], bool]
+         A trigger that is passed the population, and which selects
+         the day if it returns True, e.g. to only write output while
+         the number of infections is above a threshold. This is
+         checked when the "analyse" functions are called, so sees
+         the population at the end of the day. This must be a
+         module-level function if the model is run using multiple
+         processes
+
+       Returns
+       -------
+       extractor: MetaFunction
+         The wrapped extractor
+    """
+    if extractor is None:
+        from ._extract_default import extract_default
+        extractor = extract_default
+    elif isinstance(extractor, str):
+        import metawards.extractors
+        func = getattr(metawards.extractors, extractor, None)
+
+        if func is None:
+            from ._extract_custom import build_custom_extractor
+            func = build_custom_extractor(extractor)
+
+        extractor = func
+
+    if every is not None:
+        every = int(every)
+
+        if every < 1:
+            raise ValueError(f"'every' must be 1 or more, not {every}")
+
+    if days is not None:
+        days = [_to_day_or_date(day) for day in days]
+
+    return _SampledExtractor(extractor=extractor, every=every, days=days,
+                             start=_to_day_or_date(start),
+                             end=_to_day_or_date(end), when=when)
@@ -12,3 +12,7 @@ def extract_small(**kwargs):
     from ._output_dispersal import output_dispersal
 
     return [output_basic, output_dispersal]
+
+
+extract_small.workspace_needs = ["inf_tot", "pinf_tot", "n_inf_wards",
+                                 "new_inf_moments"]
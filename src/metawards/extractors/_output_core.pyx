@@ -4,8 +4,8 @@
 
 cimport cython
 
+from cython.parallel import parallel, prange
 from libc.stdlib cimport calloc, free
-cimport openmp
 
 from typing import Union as _Union
 
@@ -24,470 +24,374 @@ __all__ = ["setup_core", "output_core", "output_core_omp",
            "output_core_serial"]
 
 
-cdef struct _inf_buffer:
-    int count
-    int *index
-    int *infected
+# Scratch space used to hold the per-thread partial sums of the work
+# infections (and susceptibles) in each ward. This is cached from one
+# day to the next, which is safe as metawards will only run one
+# model run at a time per process. The partial sums are zeroed as
+# they are reduced, so this is always zero between calls
+_partials = None
 
 
-cdef _inf_buffer* _allocate_inf_buffers(int nthreads,
-                                        int buffer_size=4096) nogil:
-    cdef int size = buffer_size
-    cdef int n = nthreads
-
-    cdef _inf_buffer *buffers = <_inf_buffer *> calloc(n, sizeof(_inf_buffer))
-
-    for i in range(0, n):
-        buffers[i].count = 0
-        buffers[i].index = <int *> calloc(size, sizeof(int))
-        buffers[i].infected = <int *> calloc(size, sizeof(int))
-
-    return buffers
-
-
-cdef void _free_inf_buffers(_inf_buffer *buffers, int nthreads) nogil:
-    cdef int n = nthreads
-
-    for i in range(0, n):
-        free(buffers[i].index)
-        free(buffers[i].infected)
-
-    free(buffers)
-
-
-cdef void _reset_inf_buffer(_inf_buffer *buffers, int nthreads) nogil:
-    cdef int n = nthreads
-    cdef int i = 0
-
-    for i in range(0, n):
-        buffers[i].count = 0
-
-
-cdef void _add_from_buffer(_inf_buffer *buffer, int *wards_infected) nogil:
-    cdef int i = 0
-    cdef int count = buffer[0].count
-
-    for i in range(0, count):
-        wards_infected[buffer[0].index[i]] += buffer[0].infected[i]
-
-    buffer[0].count = 0
-
-
-cdef inline void _add_to_buffer(_inf_buffer *buffer, int index, int value,
-                                int *wards_infected,
-                                openmp.omp_lock_t *lock,
-                                int buffer_size=4096) nogil:
-    cdef int count = buffer[0].count
-
-    buffer[0].index[count] = index
-    buffer[0].infected[count] = value
-    buffer[0].count = count + 1
-
-    if buffer[0].count >= buffer_size:
-        openmp.omp_set_lock(lock)
-        _add_from_buffer(buffer, wards_infected)
-        openmp.omp_unset_lock(lock)
-        buffer[0].count = 0
-
-
-# struct to hold all of the variables that will be reduced across threads
-cdef struct _red_variables:
-    int n_inf_wards
-    int total_new
-    int inf_tot
-    int pinf_tot
-    int susceptibles
-
-
-cdef void _reset_reduce_variables(_red_variables * variables,
-                                  int nthreads) nogil:
-    cdef int i = 0
-    cdef int n = nthreads
-
-    for i in range(0, n):
-        variables[i].n_inf_wards = 0
-        variables[i].total_new = 0
-        variables[i].inf_tot = 0
-        variables[i].pinf_tot = 0
-        variables[i].susceptibles = 0
-
-
-cdef _red_variables* _allocate_red_variables(int nthreads) nogil:
-    """Allocate space for thread-local reduction variables for each
-       of the 'nthreads' threads. Note that we need this as
-       cython won't allow reduction in parallel blocks (only loops)
+def _get_partials(size: int):
+    """Return the cached scratch space for the per-thread partial
+       sums, growing it if it is smaller than 'size'
     """
-    cdef int n = nthreads
+    global _partials
 
-    cdef _red_variables *variables = <_red_variables *> calloc(
-                                                n, sizeof(_red_variables))
+    if _partials is None or len(_partials) < size:
+        _partials = create_int_array(size, 0)
 
-
-    _reset_reduce_variables(variables, n)
-
-    return variables
-
-
-cdef void _free_red_variables(_red_variables *variables) nogil:
-    """Free the memory held by the reduction variables"""
-    free(variables)
-
-
-cdef void _reduce_variables(_red_variables *variables, int nthreads) nogil:
-    """Reduce all of the thread-local totals in 'variables' for
-       the 'nthreads' threads into the values in variables[0]
-    """
-    cdef int i = 0
-    cdef int n = nthreads
-
-    if n > 1:
-        for i in range(1, n):
-            variables[0].n_inf_wards += variables[i].n_inf_wards
-            variables[0].total_new += variables[i].total_new
-            variables[0].inf_tot += variables[i].inf_tot
-            variables[0].pinf_tot += variables[i].pinf_tot
-            variables[0].susceptibles += variables[i].susceptibles
-
-
-# Global variables that are used to cache information that is needed
-# from one iteration to the next - this is safe as metawards will
-# only run one model run at a time per process
-cdef int _buffer_nthreads = 0
-cdef _inf_buffer * _total_new_inf_ward_buffers = <_inf_buffer*>0
-cdef _inf_buffer * _total_inf_ward_buffers = <_inf_buffer*>0
-cdef _inf_buffer * _S_buffers = <_inf_buffer*>0
-cdef _inf_buffer * _X_buffers = <_inf_buffer*>0
-cdef _inf_buffer * _ward_inf_tot_buffers = <_inf_buffer*>0
-
-cdef _red_variables * _redvars = <_red_variables*>0
-
-_files = None
+    return _partials
 
 
 def setup_core(nthreads: int = 1, **kwargs):
     """This is the setup function that corresponds with
-       :meth:`~metawards.extractors.output_core`.
+       :meth:`~metawards.extractors.output_core`. This clears
+       the scratch space used to reduce the per-thread partial
+       sums, so that it is reallocated for this model run.
     """
-    global _buffer_nthreads
-
-    if _buffer_nthreads != nthreads:
-        global _total_new_inf_ward_buffers
-        global _total_inf_ward_buffers
-        global _S_buffers, _X_buffers
-        global _ward_inf_tot_buffers
-        global _redvars
-
-        if _buffer_nthreads != 0:
-            _free_red_variables(_redvars)
-            _free_inf_buffers(_total_new_inf_ward_buffers, _buffer_nthreads)
-            _free_inf_buffers(_total_inf_ward_buffers, _buffer_nthreads)
-            _free_inf_buffers(_S_buffers, _buffer_nthreads)
-            _free_inf_buffers(_X_buffers, _buffer_nthreads)
-            _free_inf_buffers(_ward_inf_tot_buffers, _buffer_nthreads)
-
-        _redvars = _allocate_red_variables(nthreads)
-        _total_new_inf_ward_buffers = _allocate_inf_buffers(nthreads)
-        _total_inf_ward_buffers = _allocate_inf_buffers(nthreads)
-        _S_buffers = _allocate_inf_buffers(nthreads)
-        _X_buffers = _allocate_inf_buffers(nthreads)
-        _ward_inf_tot_buffers = _allocate_inf_buffers(nthreads)
-        _buffer_nthreads = nthreads
+    global _partials
+    _partials = None
 
 
-def output_core_omp(network: Network, population: Population,
-                    workspace: Workspace,
-                    infections: Infections,
-                    nthreads: int, **kwargs):
-    """This is the core output function that must be called
-       every iteration as it is responsible for accumulating
-       the core data each day, which is used to report a summary
-       to the main output file. This is the parallel version
-       of this function.
-
-       Parameters
-       ----------
-       network: Network
-         The network over which the outbreak is being modelled
-       population: Population
-         The population experiencing the outbreak
-       workspace: Workspace
-         A workspace that can be used to extract data
-       infections: Infections
-         All of the infections that have been recorded
-       nthreads: int
-         The number of threads to use to help extract the data
-       kwargs
-         Extra argumentst that are ignored by this function
+def _get_target(workspace: Workspace, mapping: str, stage_0: str):
+    """Return the per-ward array in the workspace into which the
+       disease stage with the passed mapping is summarised
+    """
+    if mapping == "*":
+        if stage_0 == "R":
+            mapping = "R"
+        elif stage_0 == "E":
+            mapping = "E"
+        elif stage_0 == "disable":
+            raise AssertionError(
+                f"Have a '*' state, despite this being disabled!")
+        else:
+            raise ValueError(
+                f"Unrecognised '*' directive '{stage_0}'")
+
+    if mapping == "E":
+        return workspace.E_in_wards
+    elif mapping == "I":
+        return workspace.I_in_wards
+    elif mapping == "R":
+        return workspace.R_in_wards
+    elif workspace.X_in_wards is None:
+        return None
+    else:
+        return workspace.X_in_wards.get(mapping, None)
+
+
+def _output_core(network: Network, population: Population,
+                 workspace: Workspace, infections: Infections,
+                 int nthreads):
+    """Accumulate all of the per-ward and per-stage statistics for
+       the day into the workspace, and the totals into the population.
+
+       This is a fused kernel that reads the infections only once.
+       The first pass loops over the links, and scatters the work
+       infections and susceptibles of every stage into per-thread
+       partial sums for the ward they come from. The second pass
+       loops over the wards, reducing the partial sums and adding
+       the play infections, from which it derives every per-ward
+       statistic (ward_inf_tot, total_inf_ward, total_new_inf_ward,
+       incidence, and S, E, I, R and X_in_wards). The per-stage
+       totals and the moments of the positions of the new
+       infections are reduced from per-thread totals.
+
+       Per-ward arrays that are not in the workspace (None) are
+       skipped, so only the statistics that the extractor needs
+       are saved (see :meth:`Workspace.build`). Every value that
+       is calculated is overwritten, so the workspace does not
+       need to be zeroed first.
     """
-    from cython.parallel import parallel, prange
-
     links = network.links
     wards = network.nodes
-    disease = network.params.disease_params
+    params = network.params
+    disease = params.disease_params
 
-    # set up main variables
     play_infections = infections.play
-    infections = infections.work
-    ward_inf_tot = workspace.ward_inf_tot
+    work_infections = infections.work
 
-    cdef int N_INF_CLASSES = len(infections)
-    assert len(infections) == len(play_infections)
+    cdef int N_INF_CLASSES = len(work_infections)
+    assert len(work_infections) == len(play_infections)
     assert N_INF_CLASSES == disease.N_INF_CLASSES()
 
-    global _total_inf_ward_buffers
-    global _total_new_inf_ward_buffers
-    global _S_buffers, _X_buffers
-    global _ward_inf_tot_buffers
-    global _redvars
+    cdef int num_threads = max(1, nthreads)
+    cdef int nlinks_plus_one = network.nlinks + 1
+    cdef int nnodes_plus_one = network.nnodes + 1
+
+    # the partial sums are ward-major, holding the work infections of
+    # each stage followed by the susceptibles, for each ward
+    cdef int nstats = N_INF_CLASSES + 1
+    cdef long long ward_stride = nstats
+    cdef long long thread_stride = nnodes_plus_one * ward_stride
+
+    # the per-thread totals are inf_tot, pinf_tot and n_inf_wards
+    # for each stage, followed by the susceptibles
+    cdef int ntotals = 3 * N_INF_CLASSES + 1
+    cdef int nmoments = 5
+
+    cdef int * partials = get_int_array_ptr(
+                                _get_partials(num_threads * thread_stride))
+
+    cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+    cdef double * links_suscept = get_double_array_ptr(links.suscept)
+    cdef double * play_suscept = get_double_array_ptr(wards.play_suscept)
+    cdef double * wards_x = get_double_array_ptr(wards.x)
+    cdef double * wards_y = get_double_array_ptr(wards.y)
 
-    # get pointers to arrays in workspace to write data
     cdef int * inf_tot = get_int_array_ptr(workspace.inf_tot)
     cdef int * pinf_tot = get_int_array_ptr(workspace.pinf_tot)
+    cdef int * n_inf_wards = get_int_array_ptr(workspace.n_inf_wards)
     cdef int * total_inf_ward = get_int_array_ptr(workspace.total_inf_ward)
     cdef int * total_new_inf_ward = get_int_array_ptr(
                                                 workspace.total_new_inf_ward)
-    cdef int * n_inf_wards = get_int_array_ptr(workspace.n_inf_wards)
     cdef int * incidence = get_int_array_ptr(workspace.incidence)
-
-    cdef int * ward_inf_tot_i
-    cdef int * X_in_wards
     cdef int * S_in_wards = get_int_array_ptr(workspace.S_in_wards)
+    cdef double * new_inf_moments = get_double_array_ptr(
+                                                workspace.new_inf_moments)
 
-    # get pointers to arrays from links and play to read data
-    cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
-
-    cdef double * links_suscept = get_double_array_ptr(links.suscept)
-    cdef double * play_suscept = get_double_array_ptr(wards.play_suscept)
-
-    cdef int nlinks_plus_one = network.nlinks + 1
-    cdef int nnodes_plus_one = network.nnodes + 1
+    # work out where each stage is summarised
+    cdef int I_start = disease.start_symptom
+    cdef int first_inf_stage = -1
 
-    # Now pointers into the infections and play_infections arrays
-    # so that we can read in the new infections
-    cdef int * infections_i
-    cdef int * play_infections_i
+    stage_flags = create_int_array(2 * N_INF_CLASSES, 0)
+    stage_target = create_int_array(N_INF_CLASSES, -1)
+    targets = []
 
-    # Now some loop variables used for accumulation
-    cdef int total_new = 0
-    cdef int susceptibles = 0
+    cdef int * is_inf_stage = get_int_array_ptr(stage_flags)
+    cdef int * is_incidence_stage = is_inf_stage + N_INF_CLASSES
+    cdef int * target_index = get_int_array_ptr(stage_target)
 
     cdef int i = 0
     cdef int j = 0
-    cdef int ifrom = 0
-    cdef int I_start = 0
-
-    cdef int num_threads = nthreads
-    cdef int thread_id = 0
-
-    cdef int n_inf_wards_i = 0
-    cdef int total_new_i = 0
-    cdef int inf_tot_i = 0
-    cdef int pinf_tot_i = 0
-    cdef int susceptibles_i = 0
-
-    cdef int N_INF_CLASSES_MINUS_ONE = N_INF_CLASSES - 1
-
-    cdef int first_inf_stage = -1
+    cdef int k = 0
+    cdef int t = 0
 
-    is_infected_stage = create_int_array(N_INF_CLASSES)
-    cdef int * is_inf_stage = get_int_array_ptr(is_infected_stage)
-
-    for i, is_infected in enumerate(disease.is_infected):
-        if is_infected:
+    for i in range(0, N_INF_CLASSES):
+        if disease.is_infected[i]:
             if first_inf_stage == -1:
                 first_inf_stage = i
-            is_inf_stage[i] = 1
-        else:
-            is_inf_stage[i] = 0
 
-    # Finally some variables used to control parallelisation and
-    # some reduction buffers
-    cdef openmp.omp_lock_t lock
-    openmp.omp_init_lock(&lock)
+            is_inf_stage[i] = 1
 
-    cdef _inf_buffer * total_new_inf_ward_buffer
-    cdef _inf_buffer * total_inf_ward_buffer
-    cdef _inf_buffer * S_buffer
-    cdef _inf_buffer * X_buffer
-    cdef _inf_buffer * ward_inf_tot_buffer
-    cdef _red_variables * redvar
+            if i <= I_start < N_INF_CLASSES:
+                # the incidence is the sum of infections up to I_start
+                is_incidence_stage[i] = 1
 
-    ###
-    ### Finally(!) we can now loop over the links and wards and
-    ### accumulate the number of new infections in each disease class
-    ###
+        target = _get_target(workspace, disease.mapping[i], params.stage_0)
 
-    # reset the workspace so that we can accumulate new data for a new day
-    workspace.zero_all(zero_subspaces=False)
+        if target is not None:
+            for k, existing in enumerate(targets):
+                if existing is target:
+                    target_index[i] = k
+                    break
+            else:
+                target_index[i] = len(targets)
+                targets.append(target)
+
+    cdef int ntargets = len(targets)
+
+    cdef int ** work_i = <int **> calloc(N_INF_CLASSES, sizeof(int*))
+    cdef int ** play_i = <int **> calloc(N_INF_CLASSES, sizeof(int*))
+    cdef int ** ward_inf_tot_i = <int **> calloc(N_INF_CLASSES, sizeof(int*))
+    cdef int ** target_i = <int **> calloc(ntargets + 1, sizeof(int*))
+    cdef int * thread_totals = <int *> calloc(num_threads * ntotals,
+                                              sizeof(int))
+    cdef double * thread_moments = <double *> calloc(num_threads * nmoments,
+                                                     sizeof(double))
+
+    if work_i == NULL or play_i == NULL or ward_inf_tot_i == NULL or \
+            target_i == NULL or thread_totals == NULL or \
+            thread_moments == NULL:
+        free(work_i)
+        free(play_i)
+        free(ward_inf_tot_i)
+        free(target_i)
+        free(thread_totals)
+        free(thread_moments)
+        raise MemoryError("Unable to allocate space for output_core")
 
-    # loop over each of the disease stages
     for i in range(0, N_INF_CLASSES):
-        # zero the number of infected wards, and the total number
-        # of infections for this stage
-        n_inf_wards[i] = 0
-        inf_tot[i] = 0
-        pinf_tot[i] = 0
-
-        # similarly zero the number of infections per ward and
-        # number of new infections per ward
-        n_inf_wards_i = 0
-        total_new_i = 0
-        inf_tot_i = 0
-        pinf_tot_i = 0
-        susceptibles_i = 0
-
-        # similarly zero the number of infections per ward and
-        # number of new infections per ward
-        _reset_reduce_variables(_redvars, num_threads)
-        _reset_inf_buffer(_total_inf_ward_buffers, num_threads)
-        _reset_inf_buffer(_total_new_inf_ward_buffers, num_threads)
-        _reset_inf_buffer(_ward_inf_tot_buffers, num_threads)
-
-        # get pointers to the work and play infections for this disease
-        # stage
-        infections_i = get_int_array_ptr(infections[i])
-        play_infections_i = get_int_array_ptr(play_infections[i])
-        ward_inf_tot_i = get_int_array_ptr(ward_inf_tot[i])
-
-        # now get the "summary" stage into which this stage is mapped
-        mapping = disease.mapping[i]
-
-        I_start = disease.start_symptom
+        work_i[i] = get_int_array_ptr(work_infections[i])
+        play_i[i] = get_int_array_ptr(play_infections[i])
 
-        if mapping == "E":
-            X_in_wards = get_int_array_ptr(workspace.E_in_wards)
-        elif mapping == "I":
-            X_in_wards = get_int_array_ptr(workspace.I_in_wards)
-        elif mapping == "R":
-            X_in_wards = get_int_array_ptr(workspace.R_in_wards)
-        elif mapping == "*":
-            if network.params.stage_0 == "R":
-                X_in_wards = get_int_array_ptr(workspace.R_in_wards)
-            elif network.params.stage_0 == "E":
-                X_in_wards = get_int_array_ptr(workspace.E_in_wards)
-            elif network.params.stage_0 == "disable":
-                raise AssertionError(
-                    f"Have a '*' state, despite this being disabled!")
-            else:
-                raise ValueError(
-                    f"Unrecognised '*' directive '{network.params.stage_0}'")
-        else:
-            X_in_wards = get_int_array_ptr(workspace.X_in_wards[mapping])
+        if workspace.ward_inf_tot is not None:
+            ward_inf_tot_i[i] = get_int_array_ptr(workspace.ward_inf_tot[i])
+
+    for k in range(0, ntargets):
+        target_i[k] = get_int_array_ptr(targets[k])
+
+    cdef int thread_id = 0
+    cdef int * partial
+    cdef int * p
+    cdef int * totals_t
+    cdef double * moments_t
+    cdef int value = 0
+    cdef int work = 0
+    cdef int play = 0
+    cdef int total = 0
+    cdef int new = 0
+    cdef int inc = 0
+    cdef double x = 0.0
+    cdef double y = 0.0
 
+    cdef int susceptibles = 0
+
+    try:
         with nogil, parallel(num_threads=num_threads):
-            # get the space for this thread to accumulate data.
-            # All of this data will be reduced in critical sections
             thread_id = cython.parallel.threadid()
-            total_inf_ward_buffer = &(_total_inf_ward_buffers[thread_id])
-            total_new_inf_ward_buffer = \
-                                &(_total_new_inf_ward_buffers[thread_id])
-            S_buffer = &(_S_buffers[thread_id])
-            X_buffer = &(_X_buffers[thread_id])
-            ward_inf_tot_buffer = &(_ward_inf_tot_buffers[thread_id])
-            redvar = &(_redvars[thread_id])
-
-            # loop over all links and accumulate infections associated
-            # with this link
+            partial = partials + thread_id * thread_stride
+
+            # scatter the work infections and susceptibles of each
+            # link into this thread's partial sums for its home ward
             for j in prange(1, nlinks_plus_one, schedule="static"):
-                ifrom = links_ifrom[j]
+                p = partial + links_ifrom[j] * ward_stride
 
-                if i == 0:
-                    # susceptibles += links[j].suscept
-                    redvar[0].susceptibles += <int>(links_suscept[j])
-                    _add_to_buffer(S_buffer, ifrom, <int>(links_suscept[j]),
-                                   &(S_in_wards[0]), &lock)
+                for i in range(0, N_INF_CLASSES):
+                    p[i] = p[i] + work_i[i][j]
 
-                if infections_i[j] != 0:
-                    if i == first_inf_stage:
-                        # total_new_inf_ward[ifrom] += infections[i][j]
-                        _add_to_buffer(total_new_inf_ward_buffer,
-                                       ifrom, infections_i[j],
-                                       &(total_new_inf_ward[0]), &lock)
+                p[N_INF_CLASSES] = p[N_INF_CLASSES] + \
+                                                <int>(links_suscept[j])
 
-                    # inf_tot[i] += infections[i][j]
-                    redvar[0].inf_tot += infections_i[j]
+        with nogil, parallel(num_threads=num_threads):
+            thread_id = cython.parallel.threadid()
+            totals_t = thread_totals + thread_id * ntotals
+            moments_t = thread_moments + thread_id * nmoments
 
-                    if is_inf_stage[i]:
-                        _add_to_buffer(total_inf_ward_buffer,
-                                       ifrom, infections_i[j],
-                                       &(total_inf_ward[0]), &lock)
-
-                    _add_to_buffer(ward_inf_tot_buffer,
-                                   ifrom, infections_i[j],
-                                   &(ward_inf_tot_i[0]), &lock)
-
-                    _add_to_buffer(X_buffer, ifrom, infections_i[j],
-                                   &(X_in_wards[0]), &lock)
-
-            # end of loop over links
-
-            # cannot reduce in parallel, so manual reduction
-            openmp.omp_set_lock(&lock)
-            _add_from_buffer(total_new_inf_ward_buffer,
-                             &(total_new_inf_ward[0]))
-            _add_from_buffer(total_inf_ward_buffer,
-                             &(total_inf_ward[0]))
-            _add_from_buffer(S_buffer, &(S_in_wards[0]))
-            _add_from_buffer(X_buffer, &(X_in_wards[0]))
-            _add_from_buffer(ward_inf_tot_buffer, &(ward_inf_tot_i[0]))
-            openmp.omp_unset_lock(&lock)
-
-            # loop over all wards (nodes) and accumulate infections
-            # from each ward
+            # reduce the partial sums for each ward, and derive all
+            # of the per-ward statistics. Each ward is only written
+            # by one thread, so this needs no locks
             for j in prange(1, nnodes_plus_one, schedule="static"):
-                if i == 0:
-                    # susceptibles += wards[j].suscept
-                    redvar[0].susceptibles += <int>(play_suscept[j])
-                    S_in_wards[j] += <int>(play_suscept[j])
+                for k in range(0, ntargets):
+                    target_i[k][j] = 0
 
-                if i == first_inf_stage:
-                    if play_infections_i[j] > 0:
-                        # total_new_inf_ward[j] += play_infections[i][j]
-                        total_new_inf_ward[j] += play_infections_i[j]
+                total = 0
+                new = 0
+                inc = 0
 
-                    if total_new_inf_ward[j] != 0:
-                        # total_new += total_new_info_ward[j]
-                        redvar[0].total_new += total_new_inf_ward[j]
+                for i in range(0, N_INF_CLASSES):
+                    work = 0
 
-                if play_infections_i[j] > 0:
-                    # pinf_tot[i] += play_infections[i][j]
-                    redvar[0].pinf_tot += play_infections_i[j]
+                    for t in range(0, num_threads):
+                        p = partials + t * thread_stride + \
+                                j * ward_stride + i
+                        work = work + p[0]
+                        p[0] = 0
 
-                    if is_inf_stage[i]:
-                        # total_inf_ward[j] += play_infections[i][j]
-                        total_inf_ward[j] += play_infections_i[j]
+                    play = play_i[i][j]
+
+                    if play < 0:
+                        play = 0
 
-                    ward_inf_tot_i[j] += play_infections_i[j]
-                    X_in_wards[j] += play_infections_i[j]
+                    value = work + play
 
-                if ward_inf_tot_i[j] > 0:
-                    # n_inf_wards[i] += 1
-                    redvar[0].n_inf_wards += 1
-            # end of loop over nodes
-        # end of parallel
+                    if ward_inf_tot_i[i] != NULL:
+                        ward_inf_tot_i[i][j] = value
 
-        with nogil:
-            if i == I_start:
-                # save the sum of infections up to i <= 2. This
-                # is the incidence
-                for j in range(1, nnodes_plus_one):
-                    incidence[j] = total_inf_ward[j]
+                    totals_t[i] = totals_t[i] + work
+                    totals_t[N_INF_CLASSES + i] = \
+                                    totals_t[N_INF_CLASSES + i] + play
 
-        # can now reduce across all threads (don't need to lock as each
-        # thread maintained its own running total)
-        _reduce_variables(_redvars, num_threads)
+                    if value > 0:
+                        totals_t[2 * N_INF_CLASSES + i] = \
+                                    totals_t[2 * N_INF_CLASSES + i] + 1
 
-        inf_tot[i] = _redvars[0].inf_tot
-        pinf_tot[i] = _redvars[0].pinf_tot
-        n_inf_wards[i] = _redvars[0].n_inf_wards
+                    if is_inf_stage[i]:
+                        total = total + value
+
+                        if is_incidence_stage[i]:
+                            inc = inc + value
 
-        # total_new += total_new[i]
-        total_new += _redvars[0].total_new
-        # susceptibles += susceptibles[i]
-        susceptibles += _redvars[0].susceptibles
+                    if i == first_inf_stage:
+                        new = value
+
+                    k = target_index[i]
+
+                    if k != -1:
+                        target_i[k][j] = target_i[k][j] + value
+
+                value = <int>(play_suscept[j])
+
+                for t in range(0, num_threads):
+                    p = partials + t * thread_stride + \
+                            j * ward_stride + N_INF_CLASSES
+                    value = value + p[0]
+                    p[0] = 0
+
+                if S_in_wards != NULL:
+                    S_in_wards[j] = value
+
+                totals_t[3 * N_INF_CLASSES] = \
+                                    totals_t[3 * N_INF_CLASSES] + value
+
+                if total_inf_ward != NULL:
+                    total_inf_ward[j] = total
+
+                if total_new_inf_ward != NULL:
+                    total_new_inf_ward[j] = new
+
+                if incidence != NULL:
+                    incidence[j] = inc
+
+                if new > 0:
+                    x = wards_x[j]
+                    y = wards_y[j]
+                    moments_t[0] = moments_t[0] + new
+                    moments_t[1] = moments_t[1] + new * x
+                    moments_t[2] = moments_t[2] + new * y
+                    moments_t[3] = moments_t[3] + new * x * x
+                    moments_t[4] = moments_t[4] + new * y * y
+
+        # reduce the per-thread totals
+        for i in range(0, N_INF_CLASSES):
+            inf_tot[i] = 0
+            pinf_tot[i] = 0
+            n_inf_wards[i] = 0
+
+            for t in range(0, num_threads):
+                totals_t = thread_totals + t * ntotals
+                inf_tot[i] += totals_t[i]
+                pinf_tot[i] += totals_t[N_INF_CLASSES + i]
+                n_inf_wards[i] += totals_t[2 * N_INF_CLASSES + i]
+
+        for t in range(0, num_threads):
+            susceptibles += thread_totals[t * ntotals + 3 * N_INF_CLASSES]
+
+        if new_inf_moments != NULL:
+            for k in range(0, nmoments):
+                new_inf_moments[k] = 0.0
+
+                for t in range(0, num_threads):
+                    new_inf_moments[k] += thread_moments[t * nmoments + k]
+    finally:
+        free(work_i)
+        free(play_i)
+        free(ward_inf_tot_i)
+        free(target_i)
+        free(thread_totals)
+        free(thread_moments)
+
+    return _summarise(network=network, population=population,
+                      workspace=workspace, susceptibles=susceptibles)
+
+
+def _summarise(network: Network, population: Population,
+               workspace: Workspace, int susceptibles):
+    """Sum the per-stage totals in the workspace into the totals
+       for each mapped stage, check that these agree with the
+       per-ward totals, and save them into the population
+    """
+    disease = network.params.disease_params
 
-        _reset_reduce_variables(_redvars, num_threads)
-    # end of loop over i
+    cdef int * inf_tot = get_int_array_ptr(workspace.inf_tot)
+    cdef int * pinf_tot = get_int_array_ptr(workspace.pinf_tot)
+    cdef int * n_inf_wards = get_int_array_ptr(workspace.n_inf_wards)
+
+    cdef int nnodes_plus_one = network.nnodes + 1
+    cdef int i = 0
+    cdef int j = 0
 
     latent = 0
     total = 0
@@ -535,24 +439,29 @@ def output_core_omp(network: Network, population: Population,
     cdef int I = 0
     cdef int R = 0
 
+    cdef int * S_in_wards = get_int_array_ptr(workspace.S_in_wards)
     cdef int * E_in_wards = get_int_array_ptr(workspace.E_in_wards)
     cdef int * I_in_wards = get_int_array_ptr(workspace.I_in_wards)
     cdef int * R_in_wards = get_int_array_ptr(workspace.R_in_wards)
 
-    for j in range(1, nnodes_plus_one):
-        if S_in_wards:
-            S += S_in_wards[j]
+    with nogil:
+        for j in range(1, nnodes_plus_one):
+            if S_in_wards:
+                S += S_in_wards[j]
 
-        if E_in_wards:
-            E += E_in_wards[j]
+            if E_in_wards:
+                E += E_in_wards[j]
 
-        if I_in_wards:
-            I += I_in_wards[j]
+            if I_in_wards:
+                I += I_in_wards[j]
 
-        if R_in_wards:
-            R += R_in_wards[j]
+            if R_in_wards:
+                R += R_in_wards[j]
 
-    if S != susceptibles or E != latent or I != total or R != recovereds:
+    if (S_in_wards != NULL and S != susceptibles) or \
+            (E_in_wards != NULL and E != latent) or \
+            (I_in_wards != NULL and I != total) or \
+            (R_in_wards != NULL and R != recovereds):
         error = \
             f"Disagreement in accumulated totals - indicates a program bug! " \
             f"{S} vs {susceptibles}, {E} vs {latent}, {I} vs {total}, " \
@@ -584,7 +493,7 @@ def output_core_omp(network: Network, population: Population,
         population.other_totals = other_totals
 
         # save the number of wards that have at least one new
-        # infection (index 0 is new infections)
+        # infection (index 0 is new infections)
         population.n_inf_wards = n_inf_wards[0]
 
     if totals is None:
@@ -593,14 +502,14 @@ def output_core_omp(network: Network, population: Population,
         return total + latent + sum(totals.values())
 
 
-def output_core_serial(network: Network, population: Population,
-                       workspace: Workspace,
-                       infections: Infections,
-                       **kwargs):
+def output_core_omp(network: Network, population: Population,
+                    workspace: Workspace,
+                    infections: Infections,
+                    nthreads: int, **kwargs):
     """This is the core output function that must be called
        every iteration as it is responsible for accumulating
        the core data each day, which is used to report a summary
-       to the main output file. This is the serial version
+       to the main output file. This is the parallel version
        of this function.
 
        Parameters
@@ -618,309 +527,37 @@ def output_core_serial(network: Network, population: Population,
        kwargs
          Extra argumentst that are ignored by this function
     """
-    links = network.links
-    wards = network.nodes
-    disease = network.params.disease_params
-
-    # set up main variables
-    play_infections = infections.play
-    infections = infections.work
-    ward_inf_tot = workspace.ward_inf_tot
-
-    cdef int N_INF_CLASSES = len(infections)
-    assert len(infections) == len(play_infections)
-    assert N_INF_CLASSES == disease.N_INF_CLASSES()
-
-    # get pointers to arrays in workspace to write data
-    cdef int * inf_tot = get_int_array_ptr(workspace.inf_tot)
-    cdef int * pinf_tot = get_int_array_ptr(workspace.pinf_tot)
-    cdef int * total_inf_ward = get_int_array_ptr(workspace.total_inf_ward)
-    cdef int * total_new_inf_ward = get_int_array_ptr(
-                                                workspace.total_new_inf_ward)
-    cdef int * n_inf_wards = get_int_array_ptr(workspace.n_inf_wards)
-    cdef int * incidence = get_int_array_ptr(workspace.incidence)
-
-    cdef int * ward_inf_tot_i
-    cdef int * X_in_wards
-    cdef int * S_in_wards = get_int_array_ptr(workspace.S_in_wards)
-
-    # get pointers to arrays from links and play to read data
-    cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
-
-    cdef double * links_suscept = get_double_array_ptr(links.suscept)
-    cdef double * play_suscept = get_double_array_ptr(wards.play_suscept)
-
-    cdef int nlinks_plus_one = network.nlinks + 1
-    cdef int nnodes_plus_one = network.nnodes + 1
-
-    # Now pointers into the infections and play_infections arrays
-    # so that we can read in the new infections
-    cdef int * infections_i
-    cdef int * play_infections_i
-
-    # Now some loop variables used for accumulation
-    cdef int total_new = 0
-    cdef int susceptibles = 0
-
-    cdef int i = 0
-    cdef int j = 0
-    cdef int ifrom = 0
-    cdef int I_start = 0
-
-    cdef int n_inf_wards_i = 0
-    cdef int total_new_i = 0
-    cdef int inf_tot_i = 0
-    cdef int pinf_tot_i = 0
-    cdef int susceptibles_i = 0
-
-    cdef int N_INF_CLASSES_MINUS_ONE = N_INF_CLASSES - 1
-
-    cdef int first_inf_stage = -1
-
-    is_infected_stage = create_int_array(N_INF_CLASSES)
-    cdef int * is_inf_stage = get_int_array_ptr(is_infected_stage)
-
-    for i, is_infected in enumerate(disease.is_infected):
-        if is_infected:
-            if first_inf_stage == -1:
-                first_inf_stage = i
-            is_inf_stage[i] = 1
-        else:
-            is_inf_stage[i] = 0
-
-    ###
-    ### Finally(!) we can now loop over the links and wards and
-    ### accumulate the number of new infections in each disease class
-    ###
-
-    # reset the workspace so that we can accumulate new data for a new day
-    # (make sure not to zero the subspace networks else we lose all our
-    #  hard work!)
-    workspace.zero_all(zero_subspaces=False)
-
-    # loop over each of the disease stages
-    for i in range(0, N_INF_CLASSES):
-        # zero the number of infected wards, and the total number
-        # of infections for this stage
-        n_inf_wards[i] = 0
-        inf_tot[i] = 0
-        pinf_tot[i] = 0
-
-        # similarly zero the number of infections per ward and
-        # number of new infections per ward
-        n_inf_wards_i = 0
-        total_new_i = 0
-        inf_tot_i = 0
-        pinf_tot_i = 0
-        susceptibles_i = 0
-
-        # get pointers to the work and play infections for this disease
-        # stage
-        infections_i = get_int_array_ptr(infections[i])
-        play_infections_i = get_int_array_ptr(play_infections[i])
-        ward_inf_tot_i = get_int_array_ptr(ward_inf_tot[i])
-
-        # now get the "summary" stage into which this stage is mapped
-        mapping = disease.mapping[i]
-
-        I_start = disease.start_symptom
-
-        if mapping == "E":
-            X_in_wards = get_int_array_ptr(workspace.E_in_wards)
-        elif mapping == "I":
-            X_in_wards = get_int_array_ptr(workspace.I_in_wards)
-        elif mapping == "R":
-            X_in_wards = get_int_array_ptr(workspace.R_in_wards)
-        elif mapping == "*":
-            if network.params.stage_0 == "R":
-                X_in_wards = get_int_array_ptr(workspace.R_in_wards)
-            elif network.params.stage_0 == "E":
-                X_in_wards = get_int_array_ptr(workspace.E_in_wards)
-            elif network.params.stage_0 == "disable":
-                raise AssertionError(
-                    f"Have a '*' state, despite this being disabled!")
-            else:
-                raise ValueError(
-                    f"Unrecognised '*' directive '{network.params.stage_0}'")
-        else:
-            X_in_wards = get_int_array_ptr(workspace.X_in_wards[mapping])
-
-        with nogil:
-            # loop over all links and accumulate infections associated
-            # with this link
-            for j in range(1, nlinks_plus_one):
-                ifrom = links_ifrom[j]
-
-                if i == 0:
-                    susceptibles_i += <int>(links_suscept[j])
-                    S_in_wards[ifrom] += <int>(links_suscept[j])
-
-                if infections_i[j] != 0:
-                    if i == first_inf_stage:
-                        total_new_inf_ward[ifrom] += infections_i[j]
-
-                    inf_tot_i += infections_i[j]
-
-                    if is_inf_stage[i]:
-                        total_inf_ward[ifrom] += infections_i[j]
-
-                    ward_inf_tot_i[ifrom] += infections_i[j]
-                    X_in_wards[ifrom] += infections_i[j]
-
-            # end of loop over links
-
-            # loop over all wards (nodes) and accumulate infections
-            # from each ward
-            for j in range(1, nnodes_plus_one):
-                if i == 0:
-                    susceptibles_i += <int>(play_suscept[j])
-
-                    S_in_wards[j] += <int>(play_suscept[j])
-
-                if i == first_inf_stage:
-                    if play_infections_i[j] > 0:
-                        total_new_inf_ward[j] += play_infections_i[j]
-
-                    if total_new_inf_ward[j] != 0:
-                        total_new_i += total_new_inf_ward[j]
-
-                if play_infections_i[j] > 0:
-                    pinf_tot_i += play_infections_i[j]
-
-                    if is_inf_stage[i]:
-                        total_inf_ward[j] += play_infections_i[j]
-
-                    ward_inf_tot_i[j] += play_infections_i[j]
-                    X_in_wards[j] += play_infections_i[j]
-
-                if ward_inf_tot_i[j] > 0:
-                    # n_inf_wards[i] += 1
-                    n_inf_wards_i += 1
-            # end of loop over nodes
-
-            if i == I_start:
-                # save the sum of infections up to i <= I_start. This
-                # is the incidence
-                for j in range(1, nnodes_plus_one):
-                    incidence[j] = total_inf_ward[j]
-
-        # end of nogil
-
-        # can now reduce across all threads (don't need to lock as each
-        # thread maintained its own running total)
-        inf_tot[i] = inf_tot_i
-        pinf_tot[i] = pinf_tot_i
-        n_inf_wards[i] = n_inf_wards_i
-
-        # total_new += total_new[i]
-        total_new += total_new_i
-        # susceptibles += susceptibles[i]
-        susceptibles += susceptibles_i
-    # end of loop over i
-
-    latent = 0
-    total = 0
-    recovereds = 0
-    totals = None
-    other_totals = None
-
-    for i, mapping in enumerate(disease.mapping):
-        if mapping == "E":
-            latent += inf_tot[i] + pinf_tot[i]
-        elif mapping == "I":
-            total += inf_tot[i] + pinf_tot[i]
-        elif mapping == "R":
-            recovereds += inf_tot[i] + pinf_tot[i]
-        elif mapping == "*":
-            if network.params.stage_0 == "R":
-                recovereds += inf_tot[i] + pinf_tot[i]
-            elif network.params.stage_0 == "E":
-                latent += inf_tot[i] + pinf_tot[i]
-            elif network.params.stage_0 == "disable":
-                raise AssertionError(
-                    f"Have a '*' state, despite this being disabled!")
-            else:
-                raise ValueError(
-                    f"Unrecognised '*' directive '{network.params.stage_0}'")
-        elif disease.is_infected[i]:
-            if totals is None:
-                totals = {}
-
-            if mapping not in totals:
-                totals[mapping] = 0
-
-            totals[mapping] += inf_tot[i] + pinf_tot[i]
-        else:
-            if other_totals is None:
-                other_totals = {}
-
-            if mapping not in other_totals:
-                other_totals[mapping] = 0
-
-            other_totals[mapping] += inf_tot[i] + pinf_tot[i]
-
-    cdef int S = 0
-    cdef int E = 0
-    cdef int I = 0
-    cdef int O = 0
-    cdef int R = 0
-
-    cdef int * E_in_wards = get_int_array_ptr(workspace.E_in_wards)
-    cdef int * I_in_wards = get_int_array_ptr(workspace.I_in_wards)
-    cdef int * R_in_wards = get_int_array_ptr(workspace.R_in_wards)
-
-    for j in range(1, nnodes_plus_one):
-        if S_in_wards:
-            S += S_in_wards[j]
-
-        if E_in_wards:
-            E += E_in_wards[j]
-
-        if I_in_wards:
-            I += I_in_wards[j]
-
-        if R_in_wards:
-            R += R_in_wards[j]
-
-    if S != susceptibles or E != latent or I != total or R != recovereds:
-        error = \
-            f"Disagreement in accumulated totals - indicates a program bug! " \
-            f"{S} vs {susceptibles}, {E} vs {latent}, {I} vs {total}, " \
-            f"{R} vs {recovereds}"
-
-        from ..utils._console import Console
-        Console.error(error)
-        raise AssertionError(error)
-
-    if population is not None:
-        population.susceptibles = susceptibles
-
-        if "I" in disease.mapping:
-            population.total = total
-        else:
-            population.total = None
-
-        if "R" in disease.mapping:
-            population.recovereds = recovereds
-        else:
-            population.recovereds = None
-
-        if "E" in disease.mapping:
-            population.latent = latent
-        else:
-            population.latent = None
+    return _output_core(network=network, population=population,
+                        workspace=workspace, infections=infections,
+                        nthreads=nthreads)
 
-        population.totals = totals
-        population.other_totals = other_totals
 
-        # save the number of wards that have at least one new
-        # infection (index 0 is new infections)
-        population.n_inf_wards = n_inf_wards[0]
+def output_core_serial(network: Network, population: Population,
+                       workspace: Workspace,
+                       infections: Infections,
+                       **kwargs):
+    """This is the core output function that must be called
+       every iteration as it is responsible for accumulating
+       the core data each day, which is used to report a summary
+       to the main output file. This is the serial version
+       of this function.
 
-    if totals is None:
-        return total + latent
-    else:
-        return total + latent + sum(totals.values())
+       Parameters
+       ----------
+       network: Network
+         The network over which the outbreak is being modelled
+       population: Population
+         The population experiencing the outbreak
+       workspace: Workspace
+         A workspace that can be used to extract data
+       infections: Infections
+         All of the infections that have been recorded
+       kwargs
+         Extra argumentst that are ignored by this function
+    """
+    return _output_core(network=network, population=population,
+                        workspace=workspace, infections=infections,
+                        nthreads=1)
 
 
 def _safe_run(func, **kwargs):
@@ -969,8 +606,8 @@ def output_core(network: _Union[Network, Networks],
          Extra argumentst that are ignored by this function
     """
 
-    # serial version is much faster than parallel - only worth
-    # parallelising when more than 4 cores
+    # the cost of reducing the per-thread partial sums grows with the
+    # number of threads - only worth parallelising when more than 4 cores
     if nthreads <= 4:
         output_func = output_core_serial
     else:
@@ -985,7 +622,8 @@ def output_core(network: _Union[Network, Networks],
                   workspace=workspace, infections=infections,
                   profiler=profiler, **kwargs)
 
-        Console.print_population(population)
+        if Console.is_logged_day(population.day):
+            Console.print_population(population)
 
     elif isinstance(network, Networks):
         if profiler is None:
@@ -1025,8 +663,9 @@ def output_core(network: _Union[Network, Networks],
                   **kwargs)
         p = p.stop()
 
-        Console.print_population(population=population,
-                                 demographics=network.demographics)
+        if Console.is_logged_day(population.day):
+            Console.print_population(population=population,
+                                     demographics=network.demographics)
 
         # double-check that the sums all add up correctly
         population.assert_sane()
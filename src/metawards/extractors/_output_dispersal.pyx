@@ -40,15 +40,6 @@ def output_dispersal_serial(network: Network, population: Population,
 
     wards = network.nodes
 
-    # get data from the python objects
-    cdef int * total_new_inf_ward = get_int_array_ptr(
-                                        workspace.total_new_inf_ward)
-
-    cdef double * wards_x = get_double_array_ptr(wards.x)
-    cdef double * wards_y = get_double_array_ptr(wards.y)
-
-    cdef int nnodes_plus_one = network.nnodes + 1
-
     # variables to accumulate data
     cdef double x = 0.0
     cdef double y = 0.0
@@ -61,25 +52,46 @@ def output_dispersal_serial(network: Network, population: Population,
     cdef int total_new = 0
     cdef int newinf = 0
 
-    # now loop over all wards and accumulate the x/y position weighted
-    # by new infections
-    cdef int i = 0;
+    cdef int * total_new_inf_ward
+    cdef double * wards_x
+    cdef double * wards_y
+
+    cdef int nnodes_plus_one = network.nnodes + 1
+    cdef int i = 0
+
+    moments = workspace.new_inf_moments
+
+    if moments is not None:
+        # output_core has already accumulated the moments of the
+        # positions of the new infections
+        total_new = <int>(moments[0])
+        sum_x = moments[1]
+        sum_y = moments[2]
+        sum_x2 = moments[3]
+        sum_y2 = moments[4]
+    else:
+        # get data from the python objects
+        total_new_inf_ward = get_int_array_ptr(workspace.total_new_inf_ward)
+        wards_x = get_double_array_ptr(wards.x)
+        wards_y = get_double_array_ptr(wards.y)
 
-    with nogil:
-        for i in range(1, nnodes_plus_one):
-            newinf = total_new_inf_ward[i]
+        # now loop over all wards and accumulate the x/y position
+        # weighted by new infections
+        with nogil:
+            for i in range(1, nnodes_plus_one):
+                newinf = total_new_inf_ward[i]
 
-            if newinf > 0:
-                x = wards_x[i]
-                y = wards_y[i]
+                if newinf > 0:
+                    x = wards_x[i]
+                    y = wards_y[i]
 
-                sum_x += newinf * x
-                sum_y += newinf * y
+                    sum_x += newinf * x
+                    sum_y += newinf * y
 
-                sum_x2 += newinf * x * x
-                sum_y2 += newinf * y * y
+                    sum_x2 += newinf * x * x
+                    sum_y2 += newinf * y * y
 
-                total_new += newinf
+                    total_new += newinf
 
     # get the file handles - this will open the files if
     # they have not already been created
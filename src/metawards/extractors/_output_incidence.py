@@ -40,7 +40,8 @@ def output_incidence_serial(network: Network,
 
     pfile.write(str(population.day) + " ")
 
-    pfile.write(" ".join([str(x) for x in workspace.incidence[1:]])
+    values = network.in_original_order(workspace.incidence)
+    pfile.write(" ".join([str(x) for x in values])
                 + "\n")
 
 
@@ -41,7 +41,8 @@ def output_prevalence_serial(network: Network,
 
     pfile.write(str(population.day) + " ")
 
-    pfile.write(" ".join([str(x) for x in workspace.total_inf_ward[1:]])
+    values = network.in_original_order(workspace.total_inf_ward)
+    pfile.write(" ".join([str(x) for x in values])
                 + "\n")
 
 
@@ -26,14 +26,12 @@ def output_trajectory(network: _Union[Network, Networks],
     else:
         datestring = ""
 
+    from ._trajectory_columns import get_extra_stages, \
+        get_trajectory_columns, format_columns
+
     # get the first Population in the trajectory, as this will give
     # us the list of extra disease stages to print out
-    t0 = trajectory[0]
-
-    totals = {} if t0.totals is None else t0.totals
-    other_totals = {} if t0.other_totals is None else t0.other_totals
-
-    extra_stages = list(totals.keys()) + list(other_totals.keys())
+    extra_stages = get_extra_stages(trajectory[0])
 
     if len(extra_stages) > 0:
         extra_str = ",".join(extra_stages) + ","
@@ -42,67 +40,39 @@ def output_trajectory(network: _Union[Network, Networks],
 
     RESULTS.write(f"day,{datestring}demographic,S,E,I,{extra_str}R,IW\n")
 
-    for i, pop in enumerate(trajectory):
-        if pop.date:
-            d = pop.date.isoformat() + ","
-        else:
-            d = ""
+    groups = [("overall", trajectory)]
 
-        totals = {} if pop.totals is None else pop.totals
-        other_totals = {} if pop.other_totals is None else pop.other_totals
+    if isinstance(network, Networks):
+        for i, demographic in enumerate(network.demographics):
+            name = demographic.name
 
-        if len(extra_stages) > 0:
-            extra_vals = []
+            if name is None or len(name) == 0:
+                name = str(i)
 
-            for stage in extra_stages:
-                if stage in totals:
-                    extra_vals.append(str(totals[stage]))
-                elif stage in other_totals:
-                    extra_vals.append(str(other_totals[stage]))
-                else:
-                    extra_vals.append("0")
+            if isinstance(trajectory, Populations):
+                groups.append((name, trajectory.subpops[i]))
+            else:
+                groups.append((name, [pop.subpops[i] for pop in trajectory]))
 
-            extra_str = ",".join(extra_vals) + ","
+    if has_date:
+        if isinstance(trajectory, Populations):
+            dates = trajectory.get_column("date")
         else:
-            extra_str = ""
-
-        def _int(val):
-            return val if val is not None else 0
-
-        RESULTS.write(f"{pop.day},{d}overall,{_int(pop.susceptibles)},"
-                      f"{_int(pop.latent)},{_int(pop.total)},{extra_str}"
-                      f"{_int(pop.recovereds)},{_int(pop.n_inf_wards)}\n")
-
-        if isinstance(network, Networks):
-            for i, demographic in enumerate(network.demographics):
-                subpop = pop.subpops[i]
-                name = demographic.name
-
-                if name is None or len(name) == 0:
-                    name = str(i)
-
-                totals = {} if subpop.totals is None else subpop.totals
-                other_totals = {} if subpop.other_totals is None \
-                    else subpop.other_totals
-
-                if len(extra_stages) > 0:
-                    extra_vals = []
-
-                    for stage in extra_stages:
-                        if stage in totals:
-                            extra_vals.append(str(totals[stage]))
-                        elif stage in other_totals:
-                            extra_vals.append(str(other_totals[stage]))
-                        else:
-                            extra_vals.append("0")
-
-                    extra_str = ",".join(extra_vals) + ","
-                else:
-                    extra_str = ""
-
-                RESULTS.write(f"{subpop.day},{d}{name},"
-                              f"{_int(subpop.susceptibles)},"
-                              f"{_int(subpop.latent)},"
-                              f"{_int(subpop.total)},{extra_str}"
-                              f"{_int(subpop.recovereds)},"
-                              f"{_int(subpop.n_inf_wards)}\n")
+            dates = [pop.date for pop in trajectory]
+
+        dates = [date.isoformat() for date in dates]
+
+    # format each group a column at a time, then interleave the lines
+    # so that the demographics for each day follow the overall line
+    lines = []
+
+    for name, pops in groups:
+        columns = get_trajectory_columns(pops, extra_stages)
+        columns.insert(1, [name] * len(pops))
+
+        if has_date:
+            columns.insert(1, dates)
+
+        lines.append(format_columns(columns))
+
+    RESULTS.write("".join(["".join(day_lines) for day_lines in zip(*lines)]))
@@ -0,0 +1,198 @@
+from .._network import Network
+from .._population import Population
+from .._outputfiles import OutputFiles
+from .._workspace import Workspace
+
+from ..utils._get_functions import call_function_on_network
+
+__all__ = ["output_wards_db", "output_wards_db_serial",
+           "finalise_wards_db", "finalise_wards_db_serial"]
+
+
+#: The name of the database file, in the output directory
+_db_filename = "wards_trajectory.db"
+
+
+def _initialise_db(conn):
+    """Set up the connection for fast bulk loading. WAL journaling
+       means that each day's transaction is appended without
+       rewriting the database, and synchronous=NORMAL skips the
+       fsync on every commit (the database is still consistent
+       if the process dies)
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+
+def _quote(name: str) -> str:
+    """Return the passed name quoted as an SQL identifier"""
+    name = name.replace('"', '""')
+    return f'"{name}"'
+
+
+def _get_table(network: Network) -> str:
+    """Return the name of the table for the passed network"""
+    if network.name is None:
+        return "wards_trajectory"
+    else:
+        name = "".join([c if c.isalnum() else "_" for c in network.name])
+        return f"wards_trajectory_{name}"
+
+
+def _get_columns(workspace: Workspace):
+    """Return the (name, values) of the per-ward columns to write"""
+    columns = []
+
+    for name in ["S", "E", "I", "R"]:
+        values = getattr(workspace, f"{name}_in_wards")
+
+        if values is not None:
+            columns.append((name, values))
+
+    if workspace.X_in_wards is not None:
+        for key, values in workspace.X_in_wards.items():
+            columns.append((key, values))
+
+    return columns
+
+
+def output_wards_db_serial(network: Network,
+                           population: Population,
+                           output_dir: OutputFiles,
+                           workspace: Workspace,
+                           **kwargs):
+    """This will write the S, E, I, R (and other stage) populations
+       of every ward for today into the SQLite3 database
+       "wards_trajectory.db". This holds the same data as
+       the "wards_trajectory_X.dat" files written by
+       :meth:`~metawards.extractors.output_wards_trajectory`,
+       as a table with one row per ward per day, i.e.
+       (day, ward, S, E, I, R, ...), where 'ward' is the
+       index of the ward in the original order of the network.
+
+       The rows for each day are inserted in bulk in a single
+       transaction. The (ward, day) index is only created at
+       the end of the model run by
+       :meth:`~metawards.extractors.finalise_wards_db`, as
+       this is much faster than updating it on every insert.
+
+       Parameters
+       ----------
+       network: Network
+         The network being modelled
+       population: Population
+         Model population - used to get the day
+       output_dir: OutputFiles
+         Where to place the database
+       workspace: Workspace
+         Workspace containing the raw data
+       **kwargs:
+         Other arguments not needed by this function
+    """
+    columns = _get_columns(workspace)
+
+    if len(columns) == 0:
+        return
+
+    conn = output_dir.open_db(_db_filename, initialise=_initialise_db)
+
+    table = _quote(_get_table(network))
+    names = [_quote(name) for name, _ in columns]
+
+    values = [network.in_original_order(v) for _, v in columns]
+    day = population.day
+
+    from itertools import repeat
+
+    rows = zip(repeat(day), range(1, len(values[0]) + 1), *values)
+
+    with conn:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                     f"(day INTEGER, ward INTEGER, " +
+                     ", ".join([f"{name} INTEGER" for name in names]) + ")")
+
+        conn.executemany(f"INSERT INTO {table} (day, ward, "
+                         f"{', '.join(names)}) VALUES "
+                         f"({', '.join(['?'] * (len(names) + 2))})", rows)
+
+
+def output_wards_db(nthreads: int = 1, **kwargs):
+    """This will write the S, E, I, R (and other stage) populations
+       of every ward for today into the SQLite3 database
+       "wards_trajectory.db". This is an indexed, queryable
+       alternative to
+       :meth:`~metawards.extractors.output_wards_trajectory`.
+       It takes roughly the same time to write, but the database
+       is larger than the equivalent text files.
+
+       Parameters
+       ----------
+       population: Population
+         Model population - used to get the day
+       output_dir: OutputFiles
+         Where to place the database
+       workspace: Workspace
+         Workspace containing the raw data
+       **kwargs:
+         Other arguments not needed by this function
+    """
+    call_function_on_network(nthreads=1,
+                             func=output_wards_db_serial,
+                             call_on_overall=True,
+                             **kwargs)
+
+
+def finalise_wards_db_serial(network: Network,
+                             output_dir: OutputFiles,
+                             **kwargs):
+    """Create the (ward, day) index on the table written by
+       :meth:`~metawards.extractors.output_wards_db_serial`
+       for the passed network. This is done once at the end
+       of the model run, after all of the rows have been loaded.
+       This also switches the database back from WAL journaling,
+       so that it can be read from read-only locations.
+    """
+    import os
+
+    if not os.path.exists(os.path.join(output_dir.get_path(),
+                                       _db_filename)):
+        # nothing was written
+        return
+
+    conn = output_dir.open_db(_db_filename, initialise=_initialise_db)
+
+    table = _get_table(network)
+
+    exists = conn.execute("SELECT name FROM sqlite_master WHERE "
+                          "type='table' AND name=?", (table,)).fetchone()
+
+    if exists is None:
+        return
+
+    with conn:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS "
+                     f"{_quote(table + '_ward_day')} "
+                     f"ON {_quote(table)} (ward, day)")
+
+    conn.execute("PRAGMA journal_mode=DELETE")
+
+
+def finalise_wards_db(nthreads: int = 1, **kwargs):
+    """Create the indexes on the tables written by
+       :meth:`~metawards.extractors.output_wards_db`. This should
+       be called at the "finalise" stage of the model run.
+
+       Parameters
+       ----------
+       network: Network or Networks
+         The network being modelled
+       output_dir: OutputFiles
+         Where the database is placed
+       **kwargs:
+         Other arguments not needed by this function
+    """
+    call_function_on_network(nthreads=1,
+                             func=finalise_wards_db_serial,
+                             call_on_overall=True,
+                             **kwargs)
@@ -43,25 +43,29 @@ def output_wards_trajectory_serial(network: Network,
     if workspace.S_in_wards is not None:
         S_file = output_dir.open(f"wards_trajectory{name}_S.dat")
         S_file.write(day)
-        S_file.write(" ".join([str(x) for x in workspace.S_in_wards[1:]]))
+        values = network.in_original_order(workspace.S_in_wards)
+        S_file.write(" ".join([str(x) for x in values]))
         S_file.write("\n")
 
     if workspace.E_in_wards is not None:
         E_file = output_dir.open(f"wards_trajectory{name}_E.dat")
         E_file.write(day)
-        E_file.write(" ".join([str(x) for x in workspace.E_in_wards[1:]]))
+        values = network.in_original_order(workspace.E_in_wards)
+        E_file.write(" ".join([str(x) for x in values]))
         E_file.write("\n")
 
     if workspace.I_in_wards is not None:
         I_file = output_dir.open(f"wards_trajectory{name}_I.dat")
         I_file.write(day)
-        I_file.write(" ".join([str(x) for x in workspace.I_in_wards[1:]]))
+        values = network.in_original_order(workspace.I_in_wards)
+        I_file.write(" ".join([str(x) for x in values]))
         I_file.write("\n")
 
     if workspace.R_in_wards is not None:
         R_file = output_dir.open(f"wards_trajectory{name}_R.dat")
         R_file.write(day)
-        R_file.write(" ".join([str(x) for x in workspace.R_in_wards[1:]]))
+        values = network.in_original_order(workspace.R_in_wards)
+        R_file.write(" ".join([str(x) for x in values]))
         R_file.write("\n")
 
     if workspace.X_in_wards is not None:
@@ -69,7 +73,8 @@ def output_wards_trajectory_serial(network: Network,
             X_file = output_dir.open(
                 f"wards_trajectory{name}_{key.replace(' ','-')}.dat")
             X_file.write(day)
-            X_file.write(" ".join([str(x) for x in value[1:]]))
+            values = network.in_original_order(value)
+            X_file.write(" ".join([str(x) for x in values]))
             X_file.write("\n")
 
 
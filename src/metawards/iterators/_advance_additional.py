@@ -334,7 +334,9 @@ def advance_additional(network: _Union[Network, Networks],
                 seed_work_infections = infections.work
 
             try:
-                ward = seed_network.get_node_index(ward)
+                # the seed was already converted to a node index when
+                # it was loaded, so only check that it is valid
+                ward = seed_network.nodes.get_index(ward)
 
                 num_to_seed = min(num, seed_wards.play_suscept[ward])
 
@@ -52,7 +52,6 @@ def advance_fixed_omp(network: Network, infections, rngs,
     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
     cdef int * links_ito = get_int_array_ptr(links.ito)
 
-    cdef double * links_distance = get_double_array_ptr(links.distance)
     cdef double * links_suscept = get_double_array_ptr(links.suscept)
 
     cdef double * wards_day_foi = get_double_array_ptr(wards.day_foi)
@@ -60,10 +59,10 @@ def advance_fixed_omp(network: Network, infections, rngs,
     cdef double * wards_night_inf_prob = get_double_array_ptr(
                                                         wards.night_inf_prob)
 
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
-
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask(nthreads=nthreads)
+    cdef int * links_within_cutoff = get_int_array_ptr(links_mask)
 
     # Pointer to the infections array - only need [0] as this loop
     # is creating new infections
@@ -83,7 +82,6 @@ def advance_fixed_omp(network: Network, infections, rngs,
     cdef int nlinks_plus_one = network.nlinks + 1
 
     cdef double inf_prob = 0.0
-    cdef double distance = 0.0
 
     ## Finally(!) we can now declare the actual loop.
     ## This loops in parallel over all links between
@@ -101,12 +99,8 @@ def advance_fixed_omp(network: Network, infections, rngs,
 
             ifrom = links_ifrom[j]
             ito = links_ito[j]
-            distance = links_distance[j]
-
-            local_cutoff = min(cutoff, wards_cutoff[ifrom])
-            local_cutoff = min(local_cutoff, wards_cutoff[ito])
 
-            if distance < local_cutoff:
+            if links_within_cutoff[j]:
                 # distance is below cutoff (reasonable distance)
                 # infect in work ward
                 if wards_day_foi[ito] > 0:
@@ -179,7 +173,6 @@ def advance_fixed_serial(network: Network, infections, rngs,
     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
     cdef int * links_ito = get_int_array_ptr(links.ito)
 
-    cdef double * links_distance = get_double_array_ptr(links.distance)
     cdef double * links_suscept = get_double_array_ptr(links.suscept)
 
     cdef double * wards_day_foi = get_double_array_ptr(wards.day_foi)
@@ -187,10 +180,10 @@ def advance_fixed_serial(network: Network, infections, rngs,
     cdef double * wards_night_inf_prob = get_double_array_ptr(
                                                         wards.night_inf_prob)
 
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
-
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    cdef int * links_within_cutoff = get_int_array_ptr(links_mask)
 
     # Pointer to the infections array - only need [0] as this loop
     # is creating new infections
@@ -207,7 +200,6 @@ def advance_fixed_serial(network: Network, infections, rngs,
     cdef int nlinks_plus_one = network.nlinks + 1
 
     cdef double inf_prob = 0.0
-    cdef double distance = 0.0
 
     ## Finally(!) we can now declare the actual loop.
     ## This loops in parallel over all links between
@@ -222,12 +214,8 @@ def advance_fixed_serial(network: Network, infections, rngs,
 
             ifrom = links_ifrom[j]
             ito = links_ito[j]
-            distance = links_distance[j]
-
-            local_cutoff = min(cutoff, wards_cutoff[ifrom])
-            local_cutoff = min(local_cutoff, wards_cutoff[ito])
 
-            if distance < local_cutoff:
+            if links_within_cutoff[j]:
                 # distance is below cutoff (reasonable distance)
                 # infect in work ward
                 if wards_day_foi[ito] > 0:
@@ -176,7 +176,6 @@ def advance_foi_omp(network: Network, population: Population,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_scale_uv = get_double_array_ptr(wards.scale_uv)
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
     cdef double * wards_bg_foi = get_double_array_ptr(wards.bg_foi)
 
     cdef double * links_weight = get_double_array_ptr(links.weight)
@@ -191,11 +190,12 @@ def advance_foi_omp(network: Network, population: Population,
     cdef int * wards_begin_p = get_int_array_ptr(wards.begin_p)
     cdef int * wards_end_p = get_int_array_ptr(wards.end_p)
 
-    cdef double * links_distance = get_double_array_ptr(links.distance)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask(nthreads=nthreads)
+    cdef int * links_within_cutoff = get_int_array_ptr(links_mask)
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # get the random number generator
     cdef uintptr_t [::1] rngs_view = rngs
@@ -279,12 +279,7 @@ def advance_foi_omp(network: Network, population: Population,
                         ifrom = links_ifrom[j]
                         ito = links_ito[j]
 
-                        local_cutoff = min(wards_cutoff[ifrom],
-                                           wards_cutoff[ito])
-
-                        local_cutoff = min(cutoff, local_cutoff)
-
-                        if links_distance[j] < local_cutoff:
+                        if links_within_cutoff[j]:
                             # number staying - this is G_ij
                             staying = _ran_binomial(rng,
                                                     too_ill_to_move,
@@ -369,10 +364,7 @@ def advance_foi_omp(network: Network, population: Population,
                             # distributing people across play wards
                             ifrom = play_ifrom[k]
                             ito = play_ito[k]
-                            local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                            local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                            if play_distance[k] < local_cutoff:
+                            if play_within_cutoff[k]:
                                 weight = play_weight[k]
 
                                 prob_scaled = weight / (1.0 - cumulative_prob)
@@ -478,7 +470,6 @@ def advance_foi_serial(network: Network, population: Population,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_scale_uv = get_double_array_ptr(wards.scale_uv)
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
     cdef double * wards_bg_foi = get_double_array_ptr(wards.bg_foi)
 
     cdef double * links_weight = get_double_array_ptr(links.weight)
@@ -493,11 +484,12 @@ def advance_foi_serial(network: Network, population: Population,
     cdef int * wards_begin_p = get_int_array_ptr(wards.begin_p)
     cdef int * wards_end_p = get_int_array_ptr(wards.end_p)
 
-    cdef double * links_distance = get_double_array_ptr(links.distance)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    cdef int * links_within_cutoff = get_int_array_ptr(links_mask)
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # get the random number generator
     cdef binomial_rng* rng = _get_binomial_ptr(rngs[0])
@@ -563,12 +555,7 @@ def advance_foi_serial(network: Network, population: Population,
                         ifrom = links_ifrom[j]
                         ito = links_ito[j]
 
-                        local_cutoff = min(wards_cutoff[ifrom],
-                                           wards_cutoff[ito])
-
-                        local_cutoff = min(local_cutoff, cutoff)
-
-                        if links_distance[j] < local_cutoff:
+                        if links_within_cutoff[j]:
                             # number staying - this is G_ij
                             staying = _ran_binomial(rng,
                                                     too_ill_to_move,
@@ -633,11 +620,8 @@ def advance_foi_serial(network: Network, population: Population,
                         while (moving > 0) and (k < end_p):
                             ifrom = play_ifrom[k]
                             ito = play_ito[k]
-                            local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                            local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
                             # distributing people across play wards
-                            if play_distance[k] < local_cutoff:
+                            if play_within_cutoff[k]:
                                 weight = play_weight[k]
 
                                 prob_scaled = weight / (1.0 - cumulative_prob)
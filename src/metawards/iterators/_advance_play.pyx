@@ -62,19 +62,18 @@ def advance_play_omp(network: Network, infections: Infections, rngs,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_play_suscept = get_double_array_ptr(wards.play_suscept)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
 
     cdef double * wards_day_inf_prob = get_double_array_ptr(
                                                     wards.day_inf_prob)
     cdef double * wards_night_inf_prob = get_double_array_ptr(
                                                     wards.night_inf_prob)
 
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
-
     cdef double dyn_play_at_home = params.dyn_play_at_home
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask(nthreads=nthreads)
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # Pointer to the play_infections array - only need [0] as this loop
     # is creating new infections
@@ -130,10 +129,7 @@ def advance_play_omp(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
@@ -220,9 +216,6 @@ def advance_play_serial(network: Network, infections: Infections, rngs,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_play_suscept = get_double_array_ptr(wards.play_suscept)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
-
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
 
     cdef double * wards_day_inf_prob = get_double_array_ptr(
                                                     wards.day_inf_prob)
@@ -231,8 +224,10 @@ def advance_play_serial(network: Network, infections: Infections, rngs,
 
     cdef double dyn_play_at_home = params.dyn_play_at_home
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # Pointer to the play_infections array - only need [0] as this loop
     # is creating new infections
@@ -280,10 +275,7 @@ def advance_play_serial(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
@@ -63,7 +63,6 @@ def advance_work_to_play_omp(network: Network, infections: Infections, rngs,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_play_suscept = get_double_array_ptr(wards.play_suscept)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
     
     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
     cdef double * links_suscept = get_double_array_ptr(links.suscept)
@@ -73,12 +72,12 @@ def advance_work_to_play_omp(network: Network, infections: Infections, rngs,
     cdef double * wards_night_inf_prob = get_double_array_ptr(
                                                     wards.night_inf_prob)
 
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
-
     cdef double dyn_play_at_home = params.dyn_play_at_home
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask(nthreads=nthreads)
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # Pointers to the play_infections and infections arrays -  
     # only need [0] as this loop is creating new infections
@@ -141,10 +140,7 @@ def advance_work_to_play_omp(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
@@ -202,10 +198,7 @@ def advance_work_to_play_omp(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
@@ -293,13 +286,10 @@ def advance_work_to_play_serial(network: Network, infections: Infections, rngs,
     cdef double * wards_night_foi = get_double_array_ptr(wards.night_foi)
 
     cdef double * wards_play_suscept = get_double_array_ptr(wards.play_suscept)
-    cdef double * play_distance = get_double_array_ptr(play.distance)
     
     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
     cdef double * links_suscept = get_double_array_ptr(links.suscept)
 
-    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
-
     cdef double * wards_day_inf_prob = get_double_array_ptr(
                                                     wards.day_inf_prob)
     cdef double * wards_night_inf_prob = get_double_array_ptr(
@@ -307,8 +297,10 @@ def advance_work_to_play_serial(network: Network, infections: Infections, rngs,
 
     cdef double dyn_play_at_home = params.dyn_play_at_home
 
-    cdef double cutoff = params.dyn_dist_cutoff
-    cdef double local_cutoff = cutoff
+    # which links are within the cutoff distance - this is cached
+    # by the network and only rebuilt when the cutoffs change
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    cdef int * play_within_cutoff = get_int_array_ptr(play_mask)
 
     # Pointers to the play_infections and infections arrays -  
     # only need [0] as this loop is creating new infections
@@ -363,10 +355,7 @@ def advance_work_to_play_serial(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
@@ -424,10 +413,7 @@ def advance_work_to_play_serial(network: Network, infections: Infections, rngs,
                 ifrom = play_ifrom[k]
                 ito = play_ito[k]
 
-                local_cutoff = min(cutoff, wards_cutoff[ifrom])
-                local_cutoff = min(local_cutoff, wards_cutoff[ito])
-
-                if play_distance[k] < local_cutoff:
+                if play_within_cutoff[k]:
                     if wards_day_foi[ito] > 0.0:
                         weight = play_weight[k]
                         prob_scaled = weight / (1.0-cumulative_prob)
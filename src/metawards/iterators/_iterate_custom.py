@@ -156,8 +156,15 @@ def build_custom_iterator(custom_function: _Union[str, MetaFunction],
     Console.print(f"Building a custom iterator for {custom_function}",
                   style="magenta")
 
-    return lambda **kwargs: iterate_custom(custom_function=custom_function,
-                                           **kwargs)
+    def iterator(**kwargs):
+        return iterate_custom(custom_function=custom_function, **kwargs)
+
+    # the default functions used for the other stages don't read
+    # the workspace, so the needs are those of the custom function
+    if hasattr(custom_function, "workspace_needs"):
+        iterator.workspace_needs = custom_function.workspace_needs
+
+    return iterator
 
 
 def iterate_custom(custom_function: MetaFunction, stage: str,
@@ -42,3 +42,6 @@ def iterate_default(stage: str, **kwargs) -> _List[MetaFunction]:
     else:
         # we don't do anything at the "analyse" or "finalise" stages
         return []
+
+
+iterate_default.workspace_needs = []
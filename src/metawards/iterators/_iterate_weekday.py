@@ -25,3 +25,6 @@ def iterate_weekday(**kwargs):
     from ._advance_play import advance_play
 
     return [advance_infprob, advance_fixed, advance_play]
+
+
+iterate_weekday.workspace_needs = []
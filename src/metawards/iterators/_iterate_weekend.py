@@ -33,3 +33,6 @@ def iterate_weekend(stage, **kwargs):
     else:
         from ._iterate_default import iterate_default
         return iterate_default(stage=stage, **kwargs)
+
+
+iterate_weekend.workspace_needs = []
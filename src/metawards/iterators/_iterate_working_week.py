@@ -44,3 +44,6 @@ def iterate_working_week(stage: str, population: Population, **kwargs):
         return iterate_weekend(**kwargs)
     else:
         return iterate_default(**kwargs)
+
+
+iterate_working_week.workspace_needs = []
@@ -8,6 +8,7 @@ Functions
     :toctree: generated/
 
     InteractionMatrix
+    SparseInteractionMatrix
 
     merge_evenly
     merge_using_matrix
@@ -1,7 +1,11 @@
 
 from typing import List as _List
 
-__all__ = ["InteractionMatrix"]
+__all__ = ["InteractionMatrix", "SparseInteractionMatrix"]
+
+#: The last dense matrix converted by
+#: SparseInteractionMatrix.from_cached_matrix, as (values, n, sparse)
+_sparse_cache = None
 
 
 class InteractionMatrix:
@@ -59,6 +63,8 @@ class InteractionMatrix:
             raise ValueError(f"Incorrect row size {len(row)} for a "
                              f"{len(self)} by {len(self)} interaction matrix")
 
+        self._matrix[i] = [float(x) for x in row]
+
     @staticmethod
     def ones(n: int, value: float = 1.0):
         """Return a n x n matrix where each element equals 'value'"""
@@ -91,6 +97,12 @@ class InteractionMatrix:
         return InteractionMatrix.diagonal(n=n, value=value,
                                           off_diagonal=off_diagonal)
 
+    def to_sparse(self):
+        """Return a :class:`SparseInteractionMatrix` copy of this
+           matrix that holds only the non-zero couplings
+        """
+        return SparseInteractionMatrix.from_matrix(self)
+
     def __str__(self):
         lines = []
 
@@ -136,3 +148,368 @@ class InteractionMatrix:
             if i != n:
                 self[i][n] = 0.0
                 self[n][i] = 0.0
+
+
+class _SparseRow:
+    """A view of a single row of a SparseInteractionMatrix. This
+       lets the sparse matrix be read and written using
+       matrix[i][j] in the same way as a dense matrix
+    """
+
+    def __init__(self, matrix, i: int):
+        self._m = matrix
+        self._i = i
+
+    def __len__(self):
+        return len(self._m)
+
+    def __iter__(self):
+        for j in range(0, len(self._m)):
+            yield self[j]
+
+    def __getitem__(self, j: int):
+        return self._m.get(self._i, j)
+
+    def __setitem__(self, j: int, value: float):
+        self._m.set(self._i, j, value)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class SparseInteractionMatrix:
+    """This is a sparse interaction matrix, which holds only the
+       non-zero couplings between demographics in compressed
+       sparse row (CSR) format. This is much more efficient than
+       a dense :class:`InteractionMatrix` when modelling many
+       demographics that each interact with only a few others,
+       as the mixers only loop over the non-zero couplings.
+
+       The matrix can be read and written using matrix[i][j],
+       just like a dense matrix. The CSR data is held in
+       'indptr', 'indices' and 'values', where the non-zero
+       values for row 'i' are values[indptr[i]:indptr[i+1]],
+       and their column numbers are indices[indptr[i]:indptr[i+1]]
+    """
+
+    def __init__(self, n: int):
+        """Construct an empty (all zero) n x n sparse interaction
+           matrix
+        """
+        n = int(n)
+
+        if n <= 0:
+            raise ValueError(
+                "You cannot create a zero-sized interaction matrix")
+
+        self._n = n
+        self.indptr = [0] * (n + 1)
+        self.indices = []
+        self.values = []
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i: int):
+        """Return a view of the ith row of the matrix"""
+        if i < 0:
+            i += self._n
+
+        if i < 0 or i >= self._n:
+            raise IndexError(f"Invalid row {i} for a {self._n} by "
+                             f"{self._n} interaction matrix")
+
+        return _SparseRow(self, i)
+
+    def __setitem__(self, i: int, row: _List[float]):
+        """Set the ith row of the matrix equal to 'row'"""
+        if len(row) != len(self):
+            raise ValueError(f"Incorrect row size {len(row)} for a "
+                             f"{len(self)} by {len(self)} interaction matrix")
+
+        for j, value in enumerate(row):
+            self.set(i, j, value)
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+
+        for i in range(0, len(self)):
+            if len(other[i]) != len(self):
+                return False
+
+            for j in range(0, len(self)):
+                if self.get(i, j) != other[i][j]:
+                    return False
+
+        return True
+
+    def _find(self, i: int, j: int):
+        """Return the position of (i,j) in the CSR arrays, and
+           whether or not it is present
+        """
+        import bisect
+        start = self.indptr[i]
+        end = self.indptr[i + 1]
+        pos = bisect.bisect_left(self.indices, j, start, end)
+        return (pos, pos < end and self.indices[pos] == j)
+
+    def _check_index(self, i: int, j: int):
+        i = int(i)
+        j = int(j)
+
+        if i < 0:
+            i += self._n
+
+        if j < 0:
+            j += self._n
+
+        if i < 0 or i >= self._n or j < 0 or j >= self._n:
+            raise IndexError(f"Invalid index [{i}][{j}] for a {self._n} by "
+                             f"{self._n} interaction matrix")
+
+        return (i, j)
+
+    def get(self, i: int, j: int) -> float:
+        """Return the value of element [i][j]"""
+        (i, j) = self._check_index(i, j)
+        (pos, found) = self._find(i, j)
+
+        if found:
+            return self.values[pos]
+        else:
+            return 0.0
+
+    def set(self, i: int, j: int, value: float) -> None:
+        """Set the value of element [i][j]. Setting a value to zero
+           removes it from the matrix
+        """
+        (i, j) = self._check_index(i, j)
+        value = float(value)
+        (pos, found) = self._find(i, j)
+
+        if found:
+            if value == 0.0:
+                del self.indices[pos]
+                del self.values[pos]
+
+                for k in range(i + 1, self._n + 1):
+                    self.indptr[k] -= 1
+            else:
+                self.values[pos] = value
+
+        elif value != 0.0:
+            self.indices.insert(pos, j)
+            self.values.insert(pos, value)
+
+            for k in range(i + 1, self._n + 1):
+                self.indptr[k] += 1
+
+    def nnz(self) -> int:
+        """Return the number of non-zero couplings in the matrix"""
+        return len(self.values)
+
+    def row(self, i: int):
+        """Return the column numbers and values of the non-zero
+           couplings in the ith row
+        """
+        start = self.indptr[i]
+        end = self.indptr[i + 1]
+        return (self.indices[start:end], self.values[start:end])
+
+    def validate(self, n: int = None) -> None:
+        """Validate that this is a consistent CSR matrix, optionally
+           also checking that it is sized 'n x n'. This raises a
+           ValueError if there are any problems
+        """
+        import math
+
+        size = self._n
+
+        if n is not None and size != n:
+            raise ValueError(
+                f"The interaction matrix must be right-sized for the number "
+                f"of demographics, e.g. it must be {n}x{n}, not "
+                f"{size}x{size}")
+
+        if len(self.indptr) != size + 1 or self.indptr[0] != 0:
+            raise ValueError(
+                f"The interaction matrix indptr must have {size+1} "
+                f"values, starting from zero")
+
+        if len(self.indices) != len(self.values) or \
+                self.indptr[-1] != len(self.values):
+            raise ValueError(
+                f"The interaction matrix has inconsistent numbers of "
+                f"indices ({len(self.indices)}), values "
+                f"({len(self.values)}) and indptr[-1] ({self.indptr[-1]})")
+
+        for i in range(0, size):
+            start = self.indptr[i]
+            end = self.indptr[i + 1]
+
+            if end < start:
+                raise ValueError(
+                    f"The interaction matrix indptr must be increasing, but "
+                    f"indptr[{i+1}] ({end}) < indptr[{i}] ({start})")
+
+            last = -1
+
+            for k in range(start, end):
+                j = self.indices[k]
+
+                if j <= last or j >= size:
+                    raise ValueError(
+                        f"The column numbers in row {i} of the interaction "
+                        f"matrix must be unique, sorted and less than "
+                        f"{size}: {self.indices[start:end]}")
+
+                last = j
+
+                if not math.isfinite(self.values[k]):
+                    raise ValueError(
+                        f"Invalid value {self.values[k]} at [{i}][{j}] "
+                        f"in the interaction matrix")
+
+    @staticmethod
+    def from_matrix(matrix, n: int = None):
+        """Return a SparseInteractionMatrix that holds the non-zero
+           values of 'matrix', which can be a list of lists, an
+           :class:`InteractionMatrix` or a SparseInteractionMatrix
+           (which is returned unchanged). If 'n' is passed then this
+           also validates that the matrix is 'n x n'
+        """
+        if isinstance(matrix, SparseInteractionMatrix):
+            matrix.validate(n)
+            return matrix
+
+        size = len(matrix)
+
+        if n is not None and size != n:
+            raise ValueError(
+                f"The interaction matrix must be right-sized for the number "
+                f"of demographics, e.g. it must be {n}x{n}")
+
+        m = SparseInteractionMatrix(n=size)
+
+        for i, row in enumerate(matrix):
+            if len(row) != size:
+                raise ValueError(
+                    f"The interaction matrix must be square, e.g. "
+                    f"{size}x{size}.")
+
+            for j, value in enumerate(row):
+                value = float(value)
+
+                if value != 0.0:
+                    m.indices.append(j)
+                    m.values.append(value)
+
+            m.indptr[i + 1] = len(m.values)
+
+        m.validate()
+
+        return m
+
+    @staticmethod
+    def from_cached_matrix(matrix, n: int = None):
+        """Return a SparseInteractionMatrix for 'matrix', as for
+           :meth:`~SparseInteractionMatrix.from_matrix`, except that
+           the conversion of a dense matrix is cached against a
+           snapshot of its values. This lets the mixers, which are
+           called every day, convert an unchanged dense matrix only
+           once, while still seeing any in-place changes. The
+           returned matrix is shared, so must not be changed
+        """
+        if isinstance(matrix, SparseInteractionMatrix):
+            matrix.validate(n)
+            return matrix
+
+        global _sparse_cache
+
+        # comparing the values is much cheaper than the conversion,
+        # and than the merge that uses the matrix
+        values = tuple(tuple(row) for row in matrix)
+
+        if _sparse_cache is not None:
+            (cached_values, cached_n, sparse) = _sparse_cache
+
+            if cached_n == n and cached_values == values:
+                return sparse
+
+        sparse = SparseInteractionMatrix.from_matrix(matrix, n=n)
+        _sparse_cache = (values, n, sparse)
+
+        return sparse
+
+    @staticmethod
+    def diagonal(n: int, value: float = 1.0):
+        """Return a sparse n x n matrix where each diagonal element
+           equals 'value'
+        """
+        m = SparseInteractionMatrix(n=n)
+
+        if float(value) != 0.0:
+            m.indptr = list(range(0, m._n + 1))
+            m.indices = list(range(0, m._n))
+            m.values = [float(value)] * m._n
+
+        return m
+
+    def to_dense(self) -> InteractionMatrix:
+        """Return this matrix converted to a dense
+           :class:`InteractionMatrix`
+        """
+        m = InteractionMatrix(n=self._n)
+
+        for i in range(0, self._n):
+            (indices, values) = self.row(i)
+
+            for j, value in zip(indices, values):
+                m[i][j] = value
+
+        return m
+
+    def detach(self, n: int):
+        """Detach the 'nth' demographic from interacting with
+           any other demographics. This sets the ith row and ith
+           column equal to zero (while not changing m[n][n])
+        """
+        for i in range(len(self)):
+            if i != n:
+                self.set(i, n, 0.0)
+                self.set(n, i, 0.0)
+
+    def to_data(self):
+        """Return a data dictionary for this matrix that can be
+           serialised to json
+        """
+        return {"format": "csr",
+                "size": self._n,
+                "indptr": list(self.indptr),
+                "indices": list(self.indices),
+                "values": list(self.values)}
+
+    @staticmethod
+    def from_data(data):
+        """Construct and return a SparseInteractionMatrix from the
+           passed (json-deserialised) data dictionary
+        """
+        fmt = data.get("format", "csr")
+
+        if fmt != "csr":
+            raise ValueError(f"Unsupported interaction matrix format {fmt}")
+
+        m = SparseInteractionMatrix(n=data["size"])
+        m.indptr = [int(x) for x in data["indptr"]]
+        m.indices = [int(x) for x in data["indices"]]
+        m.values = [float(x) for x in data["values"]]
+        m.validate()
+
+        return m
+
+    def __str__(self):
+        return f"SparseInteractionMatrix(size={self._n}, nnz={self.nnz()})"
+
+    def __repr__(self):
+        return self.__str__()
@@ -11,6 +11,8 @@ from ..utils._profiler import Profiler
 from ..utils._get_array_ptr cimport get_double_array_ptr
 from ..utils._array import create_double_array
 
+from ._interaction_matrix import SparseInteractionMatrix
+
 __all__ = ["merge_matrix_multi_population"]
 
 
@@ -44,18 +46,11 @@ def merge_matrix_multi_population(network: Networks, nthreads: int,
         # nothing to merge
         return
 
-    # the matrix should be sized for the number of subnets
-    if len(matrix) != nsubnets:
-        raise ValueError(
-            f"The interaction matrix must be right-sized for the number "
-            f"of demographics, e.g. it must be {nsubnets}x{nsubnets}")
-
-    # it must also be square
-    for row in matrix:
-        if len(row) != nsubnets:
-            raise ValueError(
-                f"The interaction matrix must be square, e.g. "
-                f"{nsubnets}x{nsubnets}.")
+    # the matrix must be square and sized for the number of subnets.
+    # Converting to sparse form validates this, and means that we
+    # only need to merge the non-zero couplings. The conversion of
+    # a dense matrix is cached, so is only repeated if it changes
+    matrix = SparseInteractionMatrix.from_cached_matrix(matrix, n=nsubnets)
 
     cdef int nnodes_plus_one = network.overall.nnodes + 1
 
@@ -128,7 +123,9 @@ def merge_matrix_multi_population(network: Networks, nthreads: int,
         wards_denominator_pd_i = get_double_array_ptr(
                                         my_wards.denominator_pd)
 
-        for j in range(0, nsubnets):
+        (indices, values) = matrix.row(i)
+
+        for j, scl in zip(indices, values):
             sub_wards = subnets[j].nodes
             sub_day_foi = get_double_array_ptr(sub_wards.day_foi)
             sub_night_foi = get_double_array_ptr(sub_wards.night_foi)
@@ -144,8 +141,6 @@ def merge_matrix_multi_population(network: Networks, nthreads: int,
             wards_denominator_pd_j = get_double_array_ptr(
                                             sub_wards.denominator_pd)
 
-            scl = matrix[i][j]
-
             with nogil, parallel(num_threads=num_threads):
                 for k in prange(1, nnodes_plus_one, schedule="static"):
                     # calculate the number of individuals in the ith
@@ -11,6 +11,8 @@ from ..utils._profiler import Profiler
 from ..utils._get_array_ptr cimport get_double_array_ptr
 from ..utils._array import create_double_array
 
+from ._interaction_matrix import SparseInteractionMatrix
+
 __all__ = ["merge_using_matrix"]
 
 
@@ -49,18 +51,11 @@ def merge_using_matrix(network: Networks, nthreads: int,
         # nothing to merge
         return
 
-    # the matrix should be sized for the number of subnets
-    if len(matrix) != nsubnets:
-        raise ValueError(
-            f"The interaction matrix must be right-sized for the number "
-            f"of demographics, e.g. it must be {nsubnets}x{nsubnets}")
-
-    # it must also be square
-    for row in matrix:
-        if len(row) != nsubnets:
-            raise ValueError(
-                f"The interaction matrix must be square, e.g. "
-                f"{nsubnets}x{nsubnets}.")
+    # the matrix must be square and sized for the number of subnets.
+    # Converting to sparse form validates this, and means that we
+    # only need to merge the non-zero couplings. The conversion of
+    # a dense matrix is cached, so is only repeated if it changes
+    matrix = SparseInteractionMatrix.from_cached_matrix(matrix, n=nsubnets)
 
     # if all values are 1.0 then it is quicker to call merge_evenly
 
@@ -105,13 +100,13 @@ def merge_using_matrix(network: Networks, nthreads: int,
         day_foi = get_double_array_ptr(day_fois[i])
         night_foi = get_double_array_ptr(night_fois[i])
 
-        for j in range(0, nsubnets):
+        (indices, values) = matrix.row(i)
+
+        for j, scl in zip(indices, values):
             sub_wards = subnets[j].nodes
             sub_day_foi = get_double_array_ptr(sub_wards.day_foi)
             sub_night_foi = get_double_array_ptr(sub_wards.night_foi)
 
-            scl = matrix[i][j]
-
             with nogil, parallel(num_threads=num_threads):
                 for k in prange(1, nnodes_plus_one, schedule="static"):
                     day_foi[k] = day_foi[k] + \
@@ -157,8 +157,15 @@ def build_custom_mixer(custom_function: _Union[str, MetaFunction],
     Console.print(f"Building a custom mixer for {custom_function}",
                   style="magenta")
 
-    return lambda **kwargs: mix_custom(custom_function=custom_function,
-                                       **kwargs)
+    def mixer(**kwargs):
+        return mix_custom(custom_function=custom_function, **kwargs)
+
+    # the default functions used for the other stages don't read
+    # the workspace, so the needs are those of the custom function
+    if hasattr(custom_function, "workspace_needs"):
+        mixer.workspace_needs = custom_function.workspace_needs
+
+    return mixer
 
 
 def mix_custom(custom_function: MetaFunction,
@@ -8,3 +8,6 @@ def mix_default(**kwargs):
     """
     from ._mix_none import mix_none
     return mix_none()
+
+
+mix_default.workspace_needs = []
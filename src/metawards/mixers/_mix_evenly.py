@@ -17,3 +17,6 @@ def mix_evenly(stage: str, network, **kwargs):
     else:
         from ._mix_default import mix_default
         return mix_default(stage=stage, network=network, **kwargs)
+
+
+mix_evenly.workspace_needs = []
@@ -24,3 +24,6 @@ def mix_evenly_single_population(stage: str, network, **kwargs):
     else:
         from ._mix_default import mix_default
         return mix_default(stage=stage, network=network, **kwargs)
+
+
+mix_evenly_single_population.workspace_needs = []
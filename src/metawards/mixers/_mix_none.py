@@ -8,3 +8,6 @@ def mix_none(**kwargs):
        each disease outbreak will be completely separate.
     """
     return []
+
+
+mix_none.workspace_needs = []
@@ -15,14 +15,17 @@ def mix_none_multi_population(stage: str, network, **kwargs):
     if isinstance(network, Network):
         return []
     elif stage == "foi":
-        from ._interaction_matrix import InteractionMatrix
+        from ._interaction_matrix import SparseInteractionMatrix
         from ._merge_matrix_multi_population \
             import merge_matrix_multi_population
 
-        matrix = InteractionMatrix.diagonal(network.num_demographics())
+        matrix = SparseInteractionMatrix.diagonal(network.num_demographics())
         network.demographics.interaction_matrix = matrix
 
         return [merge_matrix_multi_population]
     else:
         from ._mix_default import mix_default
         return mix_default(stage=stage, network=network, **kwargs)
+
+
+mix_none_multi_population.workspace_needs = []
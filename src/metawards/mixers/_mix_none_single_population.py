@@ -14,14 +14,17 @@ def mix_none_single_population(stage: str, network, **kwargs):
     if isinstance(network, Network):
         return []
     elif stage == "foi":
-        from ._interaction_matrix import InteractionMatrix
+        from ._interaction_matrix import SparseInteractionMatrix
         from ._merge_matrix_single_population \
             import merge_matrix_single_population
 
-        matrix = InteractionMatrix.diagonal(network.num_demographics())
+        matrix = SparseInteractionMatrix.diagonal(network.num_demographics())
         network.demographics.interaction_matrix = matrix
 
         return [merge_matrix_single_population]
     else:
         from ._mix_default import mix_default
         return mix_default(stage=stage, network=network, **kwargs)
+
+
+mix_none_single_population.workspace_needs = []
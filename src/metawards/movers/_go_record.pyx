@@ -1,11 +1,18 @@
+#cython: linetrace=False
+# MUST ALWAYS DISABLE AS WAY TOO SLOW FOR ITERATE
 
 from typing import Union as _Union
 from typing import List as _List
 
+cimport cython
+from cython.parallel import parallel, prange
+from libc.stdlib cimport malloc, free
+
 from .._network import Network, PersonType
 from .._networks import Networks
 from .._infections import Infections
 
+from ..utils._array import create_int_array
 from ..utils._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
 
 from ._moverecord import MoveRecord
@@ -13,10 +20,65 @@ from ._moverecord import MoveRecord
 __all__ = ["go_record"]
 
 
+cdef inline int _apply_move(int ifrom, int ito, int number,
+                            int * from_infections,
+                            double * from_suscept,
+                            double * from_weight,
+                            int * to_infections,
+                            double * to_suscept,
+                            double * to_weight) nogil:
+    """Move up to 'number' individuals from index 'ifrom' of the
+       from arrays to index 'ito' of the to arrays, returning the
+       number who actually moved. The infections arrays are used
+       for infected stages, while the suscept arrays are used for
+       susceptibles (the unused arrays are NULL)
+    """
+    cdef int nmove = number
+
+    if from_infections != NULL:
+        if from_infections[ifrom] < nmove:
+            nmove = from_infections[ifrom]
+    elif <int>from_suscept[ifrom] < nmove:
+        nmove = <int>from_suscept[ifrom]
+
+    if nmove <= 0:
+        return 0
+
+    if to_infections != NULL:
+        to_infections[ito] = to_infections[ito] + nmove
+    else:
+        to_suscept[ito] = to_suscept[ito] + nmove
+
+    to_weight[ito] = to_weight[ito] + nmove
+
+    if from_infections != NULL:
+        from_infections[ifrom] = from_infections[ifrom] - nmove
+    else:
+        from_suscept[ifrom] = from_suscept[ifrom] - nmove
+
+    from_weight[ifrom] = from_weight[ifrom] - nmove
+
+    return nmove
+
+
+def _find_root(parents, key):
+    """Find the root of 'key' in the union-find forest 'parents'"""
+    root = parents.setdefault(key, key)
+
+    while root != parents[root]:
+        root = parents[root]
+
+    while key != root:
+        (key, parents[key]) = (parents[key], root)
+
+    return root
+
+
 def go_record(moves: MoveRecord,
               network: _Union[Network, Networks],
               infections: Infections,
               record: MoveRecord = None,
+              nthreads: int = 1,
               **kwargs) -> None:
     """This go function will perform all (or as many possible) moves
        from the passed 'moves' MoveRecord. This will move specific
@@ -26,6 +88,14 @@ def go_record(moves: MoveRecord,
        If you want a record of all moves, then pass in 'record',
        which will be updated.
 
+       The moves are grouped by their from and to demographic, stage
+       and type, so that the arrays for each group are looked up
+       only once, and are then replayed in compiled code. Groups
+       that touch completely separate arrays are independent, and
+       are replayed in parallel if nthreads is greater than one.
+       Moves that affect the same arrays are always replayed in
+       the order they appear in 'moves'.
+
        Parameters
        ----------
        moves: MoveRecord
@@ -36,6 +106,8 @@ def go_record(moves: MoveRecord,
          Current record of infections
        record: MoveRecord
          An optional record to which to record the moves that are performed
+       nthreads: int
+         Number of threads over which to parallelise the replay
     """
     if isinstance(network, Network):
         subnets = [network]
@@ -44,194 +116,275 @@ def go_record(moves: MoveRecord,
         subnets = network.subnets
         subinfs = infections.subinfs
 
-    cdef int from_demo = 0
-    cdef int to_demo = 0
+    cdef int nsubnets = len(subnets)
+    cdef int nnodes_plus_one = subnets[0].nnodes + 1
+    cdef int nlinks_plus_one = subnets[0].nlinks + 1
 
-    cdef int from_stage = 0
-    cdef int to_stage = 0
+    cdef int c = 0
+    cdef int j = 0
+    cdef int k = 0
+    cdef int g = 0
+    cdef int num_threads = nthreads
 
-    cdef int from_ward = 0
-    cdef int to_ward = 0
+    worker = PersonType.WORKER.value
+    player = PersonType.PLAYER.value
 
-    cdef int number = 0
+    nstages = [x.params.disease_params.N_INF_CLASSES() for x in subnets]
 
-    cdef int nnodes_plus_one = subnets[0].nnodes + 1
-    cdef int nlinks_plus_one = subnets[0].nlinks + 1
+    # First pass - validate every move and assign it to a group.
+    # Each group is identified by its from/to demographic, stage and type
+    groups = {}
+    group_keys = []
+    move_groups = []
+    move_wards = []
+    move_numbers = []
 
-    cdef int * to_work_infections
-    cdef int * from_work_infections
+    for move in moves:
+        (from_demo, from_stage, from_type, from_ward,
+         to_demo, to_stage, to_type, to_ward, number) = move
 
-    cdef int * to_play_infections
-    cdef int * from_play_infections
+        if number <= 0:
+            continue
 
-    cdef double * from_links_weight
-    cdef double * to_links_weight
+        if from_demo < 0 or from_demo >= nsubnets:
+            raise ValueError(f"Invalid from demographic: {from_demo}")
+        elif to_demo < 0 or to_demo >= nsubnets:
+            raise ValueError(f"Invaild to demographic: {to_demo}")
 
-    cdef double * from_links_suscept
-    cdef double * to_links_suscept
+        if from_stage < -1 or from_stage >= nstages[from_demo]:
+            raise ValueError(f"Invalid from stage: {from_stage}")
+        elif to_stage < -1 or to_stage >= nstages[to_demo]:
+            raise ValueError(f"Invalid to stage: {to_stage}")
 
-    cdef double * from_play_suscept
-    cdef double * to_play_suscept
+        if from_demo == to_demo and from_stage == to_stage and \
+          from_type == to_type and from_ward == to_ward:
+            # nothing to do
+            continue
 
-    cdef double * from_save_play_suscept
-    cdef double * to_save_play_suscept
+        for (typ, ward) in ((from_type, from_ward), (to_type, to_ward)):
+            if typ == worker:
+                if ward < 1 or ward >= nlinks_plus_one:
+                    raise ValueError(f"Invalid ward link: {ward}")
+            elif typ == player:
+                if ward < 1 or ward >= nnodes_plus_one:
+                    raise ValueError(f"Invalid ward: {ward}")
+            else:
+                raise NotImplementedError(
+                        f"Unknown PersonType: {PersonType(typ)}")
 
-    cdef int record_moves = 1
+        key = (from_demo, from_stage, from_type, to_demo, to_stage, to_type)
 
-    if record is None:
-        record_moves = 0
+        igroup = groups.get(key, None)
 
-    affected_subnets = {}
+        if igroup is None:
+            igroup = len(group_keys)
+            groups[key] = igroup
+            group_keys.append(key)
 
-    worker = PersonType.WORKER
-    player = PersonType.PLAYER
+        move_groups.append(igroup)
+        move_wards.append((from_ward, to_ward))
+        move_numbers.append(number)
 
-    cdef int ifrom = 0
-    cdef int ito = 0
+    cdef int nmoves = len(move_groups)
+    cdef int ngroups = len(group_keys)
 
-    cdef int nmove = 0
+    if nmoves == 0:
+        return
+
+    # Second pass - find the groups that share arrays, as these must
+    # be replayed together, in order. Each group touches the
+    # infections/susceptibles array for its from and to demographic,
+    # stage and type, plus the link weight / play population array
+    # for its from and to demographic and type
+    parents = {}
 
-    for move in moves:
-        (from_demo, from_stage, from_type, from_ward,
-         to_demo, to_stage, to_type, to_ward, number) = move
+    for key in group_keys:
+        (from_demo, from_stage, from_type, to_demo, to_stage, to_type) = key
 
-        if number <= 0:
-            continue
+        root = _find_root(parents, ("weight", from_demo, from_type))
 
-        if from_demo < 0 or from_demo >= len(subnets):
-            raise ValueError(f"Invalid from demographic: {from_demo}")
-        elif to_demo < 0 or to_demo >= len(subnets):
-            raise ValueError(f"Invaild to demographic: {to_demo}")
+        for array_key in (("weight", to_demo, to_type),
+                          ("stage", from_demo, from_stage, from_type),
+                          ("stage", to_demo, to_stage, to_type)):
+            other = _find_root(parents, array_key)
 
-        from_net = subnets[from_demo]
-        from_infs = subinfs[from_demo]
-        to_net = subnets[to_demo]
-        to_infs = subinfs[to_demo]
+            if other != root:
+                parents[other] = root
 
-        if from_stage < -1 or \
-          from_stage >= from_net.params.disease_params.N_INF_CLASSES():
-            raise ValueError(f"Invalid from stage: {from_stage}")
-        elif to_stage < -1 or \
-          to_stage >= to_net.params.disease_params.N_INF_CLASSES():
-            raise ValueError(f"Invalid to stage: {from_stage}")
+    components = {}
+    group_components = []
 
-        from_links_weight = get_double_array_ptr(from_net.links.weight)
-        to_links_weight = get_double_array_ptr(to_net.links.weight)
+    for key in group_keys:
+        (from_demo, from_stage, from_type, to_demo, to_stage, to_type) = key
+        root = _find_root(parents, ("weight", from_demo, from_type))
+        group_components.append(components.setdefault(root, len(components)))
 
-        from_save_play_suscept = get_double_array_ptr(
-                                        from_net.nodes.save_play_suscept)
-        to_save_play_suscept = get_double_array_ptr(
-                                        to_net.nodes.save_play_suscept)
+    cdef int ncomponents = len(components)
 
-        if from_stage >= 0:
-            from_work_infections = get_int_array_ptr(
-                                            from_infs.work[from_stage])
-            from_play_infections = get_int_array_ptr(
-                                            from_infs.play[from_stage])
-        else:
-            from_links_suscept = get_double_array_ptr(
-                                            from_net.links.suscept)
-            from_play_suscept = get_double_array_ptr(
-                                            from_net.nodes.play_suscept)
-
-        if to_stage >= 0:
-            to_work_infections = get_int_array_ptr(
-                                            to_infs.work[to_stage])
-            to_play_infections = get_int_array_ptr(
-                                            to_infs.play[to_stage])
-        else:
-            to_links_suscept = get_double_array_ptr(
-                                            to_net.links.suscept)
-            to_play_suscept = get_double_array_ptr(
-                                            to_net.nodes.play_suscept)
+    # Assemble the moves for each component, in their original order
+    component_moves = [[] for _ in range(ncomponents)]
 
-        if from_demo == to_demo and from_stage == to_stage and \
-          from_type == to_type and from_ward == to_ward:
-            # nothing to do
-            continue
+    for i, igroup in enumerate(move_groups):
+        component_moves[group_components[igroup]].append(i)
 
-        ifrom = from_ward
-        ito = to_ward
+    component_start_array = create_int_array(ncomponents + 1, 0)
+    component_order_array = create_int_array(nmoves, 0)
 
-        from_type = PersonType(from_type)
-        to_type = PersonType(to_type)
+    i = 0
+    for c, c_moves in enumerate(component_moves):
+        component_start_array[c] = i
 
-        if from_type == worker:
-            if from_stage >= 0:
-                nmove = min(number, from_work_infections[ifrom])
-            else:
-                nmove = min(number, <int>from_links_suscept[ifrom])
-        elif from_type == player:
-            if from_stage >= 0:
-                nmove = min(number, from_play_infections[ifrom])
+        for m in c_moves:
+            component_order_array[i] = m
+            i += 1
+
+    component_start_array[ncomponents] = i
+
+    move_group_array = create_int_array(nmoves, 0)
+    move_from_array = create_int_array(nmoves, 0)
+    move_to_array = create_int_array(nmoves, 0)
+    move_number_array = create_int_array(nmoves, 0)
+    move_nmove_array = create_int_array(nmoves, 0)
+
+    for i in range(0, nmoves):
+        move_group_array[i] = move_groups[i]
+        (move_from_array[i], move_to_array[i]) = move_wards[i]
+        move_number_array[i] = move_numbers[i]
+
+    cdef int * component_start = get_int_array_ptr(component_start_array)
+    cdef int * component_order = get_int_array_ptr(component_order_array)
+    cdef int * move_group = get_int_array_ptr(move_group_array)
+    cdef int * move_from = get_int_array_ptr(move_from_array)
+    cdef int * move_to = get_int_array_ptr(move_to_array)
+    cdef int * move_number = get_int_array_ptr(move_number_array)
+    cdef int * move_nmove = get_int_array_ptr(move_nmove_array)
+
+    # Look up the arrays for each group once
+    cdef int ** group_from_infections = <int **>malloc(ngroups * sizeof(int*))
+    cdef double ** group_from_suscept = <double **>malloc(
+                                                ngroups * sizeof(double*))
+    cdef double ** group_from_weight = <double **>malloc(
+                                                ngroups * sizeof(double*))
+    cdef int ** group_to_infections = <int **>malloc(ngroups * sizeof(int*))
+    cdef double ** group_to_suscept = <double **>malloc(
+                                                ngroups * sizeof(double*))
+    cdef double ** group_to_weight = <double **>malloc(
+                                                ngroups * sizeof(double*))
+
+    if num_threads > ncomponents:
+        num_threads = ncomponents
+
+    if num_threads < 1:
+        num_threads = 1
+
+    try:
+        if group_from_infections == NULL or group_from_suscept == NULL or \
+                group_from_weight == NULL or group_to_infections == NULL or \
+                group_to_suscept == NULL or group_to_weight == NULL:
+            raise MemoryError("Unable to allocate memory for the moves")
+
+        for g, key in enumerate(group_keys):
+            (from_demo, from_stage, from_type,
+             to_demo, to_stage, to_type) = key
+
+            from_net = subnets[from_demo]
+            from_infs = subinfs[from_demo]
+            to_net = subnets[to_demo]
+            to_infs = subinfs[to_demo]
+
+            group_from_infections[g] = NULL
+            group_from_suscept[g] = NULL
+            group_to_infections[g] = NULL
+            group_to_suscept[g] = NULL
+
+            if from_type == worker:
+                group_from_weight[g] = get_double_array_ptr(
+                                                from_net.links.weight)
+
+                if from_stage >= 0:
+                    group_from_infections[g] = get_int_array_ptr(
+                                                from_infs.work[from_stage])
+                else:
+                    group_from_suscept[g] = get_double_array_ptr(
+                                                from_net.links.suscept)
             else:
-                nmove = min(number, <int>from_play_suscept[ifrom])
-        else:
-            raise NotImplementedError(
-                    f"Unknown PersonType: {from_type}")
+                group_from_weight[g] = get_double_array_ptr(
+                                        from_net.nodes.save_play_suscept)
+
+                if from_stage >= 0:
+                    group_from_infections[g] = get_int_array_ptr(
+                                                from_infs.play[from_stage])
+                else:
+                    group_from_suscept[g] = get_double_array_ptr(
+                                                from_net.nodes.play_suscept)
 
-        if nmove > 0:
             if to_type == worker:
+                group_to_weight[g] = get_double_array_ptr(
+                                                to_net.links.weight)
+
                 if to_stage >= 0:
-                    to_work_infections[ito] = \
-                            to_work_infections[ito] + nmove
+                    group_to_infections[g] = get_int_array_ptr(
+                                                to_infs.work[to_stage])
                 else:
-                    to_links_suscept[ito] = \
-                            to_links_suscept[ito] + nmove
+                    group_to_suscept[g] = get_double_array_ptr(
+                                                to_net.links.suscept)
+            else:
+                group_to_weight[g] = get_double_array_ptr(
+                                        to_net.nodes.save_play_suscept)
 
-                to_links_weight[ito] = to_links_weight[ito] + nmove
-            elif to_type == player:
                 if to_stage >= 0:
-                    to_play_infections[ito] = \
-                            to_play_infections[ito] + nmove
+                    group_to_infections[g] = get_int_array_ptr(
+                                                to_infs.play[to_stage])
                 else:
-                    to_play_suscept[ito] = \
-                            to_play_suscept[ito] + nmove
+                    group_to_suscept[g] = get_double_array_ptr(
+                                                to_net.nodes.play_suscept)
+
+        # Replay the moves - each component is independent, so can
+        # be replayed in parallel
+        with nogil, parallel(num_threads=num_threads):
+            for c in prange(0, ncomponents, schedule="dynamic"):
+                for j in range(component_start[c], component_start[c+1]):
+                    k = component_order[j]
+                    g = move_group[k]
+
+                    move_nmove[k] = _apply_move(move_from[k], move_to[k],
+                                                move_number[k],
+                                                group_from_infections[g],
+                                                group_from_suscept[g],
+                                                group_from_weight[g],
+                                                group_to_infections[g],
+                                                group_to_suscept[g],
+                                                group_to_weight[g])
+    finally:
+        free(group_from_infections)
+        free(group_from_suscept)
+        free(group_from_weight)
+        free(group_to_infections)
+        free(group_to_suscept)
+        free(group_to_weight)
 
-                to_save_play_suscept[ito] = \
-                            to_save_play_suscept[ito] + nmove
-            else:
-                raise NotImplementedError(
-                        f"Unknown PersonType: {to_type}")
+    affected_subnets = {}
 
-            if from_type == worker:
-                if from_stage >= 0:
-                    from_work_infections[ifrom] = \
-                            from_work_infections[ifrom] - nmove
-                else:
-                    from_links_suscept[ifrom] = \
-                            from_links_suscept[ifrom] - nmove
+    for i in range(0, nmoves):
+        if move_nmove[i] <= 0:
+            continue
 
-                from_links_weight[ifrom] = \
-                            from_links_weight[ifrom] - nmove
-            else:
-                if from_stage >= 0:
-                    from_play_infections[ifrom] = \
-                            from_play_infections[ifrom] - nmove
-                else:
-                    from_play_suscept[ifrom] = \
-                            from_play_suscept[ifrom] - nmove
-
-                from_save_play_suscept[ifrom] = \
-                            from_save_play_suscept[ifrom] - nmove
-
-            affected_subnets[from_demo] = 1
-            affected_subnets[to_demo] = 1
-
-            if record_moves:
-                record.add(from_demographic=from_demo,
-                           to_demographic=to_demo,
-                           from_stage=from_stage,
-                           to_stage=to_stage,
-                           from_type=from_type,
-                           to_type=to_type,
-                           from_ward=ifrom,
-                           to_ward=ito,
-                           number=nmove
-                          )
-            # end if record moves
-        # end if nmove > 0
-    # end of loop over stages
+        (from_demo, from_stage, from_type,
+         to_demo, to_stage, to_type) = group_keys[move_groups[i]]
+
+        affected_subnets[from_demo] = 1
+        affected_subnets[to_demo] = 1
+
+        if record is not None:
+            record.add(from_demographic=from_demo,
+                       to_demographic=to_demo,
+                       from_stage=from_stage,
+                       to_stage=to_stage,
+                       from_type=PersonType(from_type),
+                       to_type=PersonType(to_type),
+                       from_ward=move_from[i],
+                       to_ward=move_to[i],
+                       number=move_nmove[i])
 
     # we need to recalculate the denominators for the subnets that
     # were changed by this move
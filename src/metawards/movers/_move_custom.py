@@ -157,8 +157,15 @@ def build_custom_mover(custom_function: _Union[str, MetaFunction],
     Console.print(f"Building a custom mover for {custom_function}",
                   style="magenta")
 
-    return lambda **kwargs: move_custom(custom_function=custom_function,
-                                        **kwargs)
+    def mover(**kwargs):
+        return move_custom(custom_function=custom_function, **kwargs)
+
+    # the default functions used for the other stages don't read
+    # the workspace, so the needs are those of the custom function
+    if hasattr(custom_function, "workspace_needs"):
+        mover.workspace_needs = custom_function.workspace_needs
+
+    return mover
 
 
 def move_custom(custom_function: MetaFunction,
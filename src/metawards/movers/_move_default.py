@@ -7,3 +7,6 @@ def move_default(**kwargs):
        is moved
     """
     return []
+
+
+move_default.workspace_needs = []
@@ -49,6 +49,90 @@ def _parse_ward(x):
         return None
 
 
+#: Cache of compiled moves, shared between all MoveGenerators so
+#: that generators that are re-created every day (e.g. inside a
+#: custom mover) also benefit. This maps the generator settings plus
+#: the fingerprint of the network to a weak reference to the network
+#: and the compiled moves
+_move_cache = {}
+
+#: The maximum number of entries in the move cache
+_max_move_cache_size = 256
+
+
+def _key_of(values):
+    """Return a hashable key for the passed list of parsed values"""
+    if values is None:
+        return None
+
+    key = []
+
+    for value in values:
+        if isinstance(value, WardID):
+            key.append((value._home, value._commute,
+                        getattr(value, "_all_commute", False)))
+        else:
+            key.append((value.__class__.__name__, value))
+
+    return tuple(key)
+
+
+def _get_disease_fingerprint(disease):
+    """Return a fingerprint for the disease that changes whenever
+       the disease, or the names of its stages, are changed
+    """
+    if disease is None:
+        return None
+
+    return (id(disease), tuple(disease.stage))
+
+
+def _get_network_fingerprint(network: _Union[Network, Networks]):
+    """Return a fingerprint for the network that changes whenever
+       anything used to look up demographics, disease stages or
+       wards is changed
+    """
+    if isinstance(network, Networks):
+        overall = network.overall
+        names = network.demographics._names
+
+        return (id(network), id(overall.nodes), id(overall.links),
+                id(overall.info), overall.nnodes, overall.nlinks,
+                tuple(sorted(names.items())),
+                tuple(_get_disease_fingerprint(x.params.disease_params)
+                      for x in network.subnets))
+    else:
+        params = network.params
+        disease = params.disease_params if params is not None else None
+
+        return (id(network), id(network.nodes), id(network.links),
+                id(network.info), network.nnodes, network.nlinks,
+                network.name, _get_disease_fingerprint(disease))
+
+
+def _get_cached_moves(key, network):
+    """Return the cached moves for 'key', or None if there are none
+       or they were compiled for a different network
+    """
+    entry = _move_cache.get(key, None)
+
+    if entry is None or entry[0]() is not network:
+        return None
+
+    return entry[1]
+
+
+def _set_cached_moves(key, network, moves):
+    """Cache the compiled moves for 'key'"""
+    import weakref
+
+    while len(_move_cache) >= _max_move_cache_size:
+        # remove the oldest entry
+        del _move_cache[next(iter(_move_cache))]
+
+    _move_cache[key] = (weakref.ref(network), moves)
+
+
 class MoveGenerator:
     def __init__(self,
                  from_demographic: _strs_or_ints = None,
@@ -127,6 +211,11 @@ class MoveGenerator:
             #  a large number that is greater than any ward population
             self._number = 1000000000
 
+        self._stage_key = (_key_of(self._from_demo), _key_of(self._to_demo),
+                           _key_of(self._from_stage), _key_of(self._to_stage))
+
+        self._ward_key = (_key_of(self._from_ward), _key_of(self._to_ward))
+
     def fraction(self):
         """Return the fraction of individuals in each ward or
            ward-link who should be moved"""
@@ -148,6 +237,26 @@ class MoveGenerator:
              [from_demographic, from_stage, to_demographic, to_stage],
              ...
            ]
+
+           The moves are compiled once and cached against a fingerprint
+           of the network, so that repeated calls (e.g. from a mover
+           that is called every day) do not have to resolve the
+           demographic and stage names again. The cache is invalidated
+           if the network, its demographics or its disease(s) change.
+        """
+        key = ("stages", self._stage_key, _get_network_fingerprint(network))
+
+        moves = _get_cached_moves(key, network)
+
+        if moves is None:
+            moves = self._generate(network)
+            _set_cached_moves(key, network, moves)
+
+        return [list(x) for x in moves]
+
+    def _generate(self, network: _Union[Network, Networks]):
+        """Compile and return the moves for 'network' - this is called
+           by :meth:`~MoveGenerator.generate` if there are no cached moves
         """
         if isinstance(network, Network):
             # make sure that we are only working with a single demographic
@@ -255,7 +364,9 @@ class MoveGenerator:
 
     def generate_wards(self, network):
         """Return a list of ward to ward moves for workers and players.
-           This returns None if all individuals should be moved
+           This returns None if all individuals should be moved.
+           Like :meth:`~MoveGenerator.generate`, the ward moves are
+           cached against a fingerprint of the network
         """
         if self.should_move_all():
             return None
@@ -263,6 +374,22 @@ class MoveGenerator:
         if isinstance(network, Networks):
             network = network.overall
 
+        key = ("wards", self._ward_key, _get_network_fingerprint(network))
+
+        wards = _get_cached_moves(key, network)
+
+        if wards is None:
+            wards = self._generate_wards(network)
+            _set_cached_moves(key, network, wards)
+
+        return [list(x) for x in wards]
+
+    def _generate_wards(self, network: Network):
+        """Compile and return the ward moves for 'network' - this
+           is called by :meth:`~MoveGenerator.generate_wards` if
+           there are no cached ward moves
+        """
+
         from_wards = self._from_ward
         to_wards = self._to_ward
 
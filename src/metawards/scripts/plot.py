@@ -53,6 +53,16 @@ def parse_args():
                         help="Resolution to use when creating bitmap "
                              "outputs, e.g. jpg, png etc.")
 
+    parser.add_argument("--nprocs", type=int, default=1,
+                        help="The number of processes to use to draw "
+                             "the graphs, or load the frames of an "
+                             "animation, in parallel")
+
+    parser.add_argument("--chunksize", type=int, default=1000000,
+                        help="The number of lines of the input file to "
+                             "read at a time. Reduce this to reduce the "
+                             "amount of memory used")
+
     parser.add_argument("--delay", type=int, default=500,
                         help="The delay in milliseconds between animation "
                              "frames if an animation is being produced")
@@ -95,6 +105,8 @@ def cli():
                                            format=args.format,
                                            dpi=args.dpi,
                                            align_axes=align_axes,
+                                           nprocs=args.nprocs,
+                                           chunksize=args.chunksize,
                                            verbose=True)
 
             print(f"Written graphs to {', '.join(filenames)}")
@@ -106,6 +118,7 @@ def cli():
                                  output=args.output,
                                  delay=args.delay,
                                  ordering=args.ordering,
+                                 nprocs=args.nprocs,
                                  verbose=True)
 
         print(f"Written animation to {filename}")
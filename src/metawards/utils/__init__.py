@@ -12,11 +12,13 @@ Functions
     add_wards_network_distance
     aggregate_networks
     assert_sane_network
+    build_cutoff_mask
     build_play_matrix
     build_wards_network
     call_function_on_network
     check_for_updates
     clear_all_infections
+    clear_load_cache
     Console
     create_int_array
     create_double_array
@@ -25,15 +27,20 @@ Functions
     delete_ran_binomial
     fill_in_gaps
     get_available_num_threads
+    get_cutoff_mask_key
     get_functions
     get_initialise_functions
+    get_load_cache
     get_finalise_functions
     get_model_loop_functions
     get_min_max_distances
+    get_network_cache_dir
     get_number_of_processes
+    get_space_filling_curve_order
     initialise_infections
     initialise_play_infections
     is_openmp_supported
+    load_cached
     move_population_from_work_to_play
     move_population_from_play_to_work
     prepare_worker
@@ -41,6 +48,7 @@ Functions
     ran_int
     ran_uniform
     read_done_file
+    reorder_network
     recalculate_work_denominator_day
     recalculate_play_denominator_day
     rescale_play_matrix
@@ -56,6 +64,9 @@ Functions
     scale_link_susceptibles
     scale_node_susceptibles
     seed_ran_binomial
+    set_load_cache
+    set_network_cache_dir
+    specialise_susceptibles
     string_to_ints
     update_metawards
     zero_workspace
@@ -83,6 +94,8 @@ from ._get_functions import *
 from ._safe_eval import *
 from ._console import *
 from ._updates import *
+from ._network_cache import *
+from ._load_cache import *
 
 from ._add_lookup import *
 from ._aggregate import *
@@ -90,6 +103,8 @@ from ._build_wards_network import *
 from ._add_wards_network_distance import *
 from ._check_openmp import *
 from ._get_min_max_distances import *
+from ._cutoff_mask import *
+from ._reorder_network import *
 from ._reset_everything import *
 from ._rescale_matrix import *
 from ._recalculate_denominators import *
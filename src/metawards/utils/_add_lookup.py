@@ -1,79 +1,93 @@
-
 from .._network import Network
 
 __all__ = ["add_lookup"]
 
 
-def add_lookup(network: Network, nthreads: int = 1):
-    """Add in metadata about the network that can be used
-       to look up wards by name of location or region etc.
-
-       This will add the data to the network.ward_info object,
-       as a list ensuring that network.nodes[i] has its
-       info in network.ward_info[i]
+def _read_lookup(lookup_file: str, columns):
+    """Read the lookup file and return the WardInfoColumns that
+       hold its data. This streams through the file, and only
+       extracts the columns that are used
     """
-    lookup_file = network.params.input_files.lookup
+    from .._wardinfo import WardInfoColumns
+
+    # (field, column number) for each of the fields that are used
+    fields = [(field, columns.get(column, None)) for (field, column) in
+              [("code", "code"), ("name", "name"),
+               ("authority_code", "authority_code"),
+               ("authority", "authority_name"),
+               ("region_code", "region_code"),
+               ("region", "region_name")]]
+    fields = [(field, column) for (field, column) in fields
+              if column is not None]
 
-    if lookup_file is None:
-        from ._console import Console
-        Console.print("No ward lookup information available.")
-        return
+    CMWDCD = columns.get("alternate_code", None)
+    CMWDNM = columns.get("alternate_name", None)
 
-    lines = open(lookup_file, "r").readlines()
+    infos = WardInfoColumns(1)   # 1-indexed
 
-    if lines[0].find(",") != -1:
-        sep = ","
-    else:
-        sep = " "
+    values = [(getattr(infos, field), column) for (field, column) in fields]
+    present = infos.present
 
-    columns = network.params.input_files.lookup_columns
+    import csv
 
-    WDCD = columns.get("code", None)
-    WDNM = columns.get("name", None)
-    CMWDCD = columns.get("alternate_code", None)
-    CMWDNM = columns.get("alternate_name", None)
-    LADCD = columns.get("authority_code", None)
-    LADNM = columns.get("authority_name", None)
-    REGCD = columns.get("region_code", None)
-    REGNM = columns.get("region_name", None)
+    with open(lookup_file, "r", newline="") as FILE:
+        # skip the header line
+        FILE.readline()
 
-    from .._wardinfo import WardInfo, WardInfos
+        for i, parts in enumerate(csv.reader(FILE, quotechar='"',
+                                             delimiter=',',
+                                             skipinitialspace=True),
+                                  start=1):
+            present.append(1)
 
-    ward_infos = []
-    ward_infos.append(None)   # 1-indexed
+            for (column, index) in values:
+                column.append(parts[index].strip())
 
-    import csv
+            if CMWDCD is not None:
+                infos.alternate_codes[i] = [parts[CMWDCD].strip()]
 
-    for parts in csv.reader(lines[1:], quotechar='"', delimiter=',',
-                            quoting=csv.QUOTE_ALL, skipinitialspace=True):
+            if CMWDNM is not None:
+                infos.alternate_names[i] = [parts[CMWDNM].strip()]
 
-        info = WardInfo()
+    # fill in the fields that are not in the lookup file
+    n = len(present)
 
-        if WDCD is not None:
-            info.code = parts[WDCD].strip()
+    for field in WardInfoColumns.fields:
+        column = getattr(infos, field)
+        column += [""] * (n - len(column))
 
-        if WDNM is not None:
-            info.name = parts[WDNM].strip()
+    infos._infos = [None] * n
 
-        if CMWDCD is not None:
-            info.alternate_codes.append(parts[CMWDCD].strip())
+    return infos
 
-        if CMWDNM is not None:
-            info.alternate_names.append(parts[CMWDNM].strip())
 
-        if LADCD is not None:
-            info.authority_code = parts[LADCD].strip()
+def add_lookup(network: Network, nthreads: int = 1):
+    """Add in metadata about the network that can be used
+       to look up wards by name of location or region etc.
 
-        if LADNM is not None:
-            info.authority = parts[LADNM].strip()
+       This will add the data to the network.ward_info object,
+       as a list ensuring that network.nodes[i] has its
+       info in network.ward_info[i]
 
-        if REGCD is not None:
-            info.region_code = parts[REGCD].strip()
+       The lookup data are held in columns, from which the
+       WardInfo objects are created on demand. The columns are
+       cached in this process and in the network cache (see
+       :func:`metawards.utils.set_network_cache_dir`), so the
+       lookup file is only parsed again if it changes
+    """
+    lookup_file = network.params.input_files.lookup
+
+    if lookup_file is None:
+        from ._console import Console
+        Console.print("No ward lookup information available.")
+        return
 
-        if REGNM is not None:
-            info.region = parts[REGNM].strip()
+    columns = network.params.input_files.lookup_columns
 
-        ward_infos.append(info)
+    from ._load_cache import load_cached
+    ward_infos = load_cached("lookup", lookup_file,
+                             lambda: _read_lookup(lookup_file, columns),
+                             columns=columns)
 
     if len(ward_infos) != network.nnodes + 1:
         from ._console import Console
@@ -82,10 +96,7 @@ def add_lookup(network: Network, nthreads: int = 1):
             f"({len(ward_infos)}) disagrees with the number "
             f"of wards in the network ({network.nnodes})")
 
-        if len(ward_infos) > network.nnodes+1:
-            ward_infos = ward_infos[0:network.nnodes+1]
-        else:
-            while len(ward_infos) <= network.nnodes:
-                ward_infos.append(None)
+        ward_infos.resize(network.nnodes + 1)
 
+    from .._wardinfo import WardInfos
     network.info = WardInfos(wards=ward_infos)
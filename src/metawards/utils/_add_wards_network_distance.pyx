@@ -25,30 +25,32 @@ cdef inline double deg_to_rad(double x) nogil:
     return x * M_PI / 180
 
 
-cdef double distance_lat_long(double lon1, double lat1,
-                              double lon2, double lat2) nogil:
-    """Calculate the distance in kilometers between two lat/lon points on the
-       Earth's surface
+cdef inline double _haversine(double * sin_half_lon, double * cos_half_lon,
+                              double * sin_half_lat, double * cos_half_lat,
+                              double * cos_lat, int i, int j) nogil:
+    """Calculate the distance in kilometers between the lat/lon points
+       of wards i and j on the Earth's surface, using the haversine
+       formula with the precomputed sin and cos of half of each
+       ward's latitude and longitude (so no sin or cos are needed)
     """
-    cdef double radius = 6378.16  # Earth's radius in km
-    cdef double dlon = deg_to_rad(lon2 - lon1)
-    cdef double dlat = deg_to_rad(lat2 - lat1)
-
-    # Calculate using the haversin formula
-    cdef double sin_dlat_over_2 = sin(dlat / 2.0)
-    cdef double sin_dlon_over_2 = sin(dlon / 2.0)
+    # sin((b - a) / 2) = sin(b/2) cos(a/2) - cos(b/2) sin(a/2)
+    cdef double sin_dlat_over_2 = sin_half_lat[j] * cos_half_lat[i] - \
+                                  cos_half_lat[j] * sin_half_lat[i]
+    cdef double sin_dlon_over_2 = sin_half_lon[j] * cos_half_lon[i] - \
+                                  cos_half_lon[j] * sin_half_lon[i]
 
     cdef double a = (sin_dlat_over_2 * sin_dlat_over_2) + \
-                    (cos(deg_to_rad(lat1)) * cos(deg_to_rad(lat2)) *
+                    (cos_lat[i] * cos_lat[j] *
                      sin_dlon_over_2 * sin_dlon_over_2)
 
+    cdef double radius = 6378.16  # Earth's radius in km
     cdef double angle = 2.0 * atan2(sqrt(a), sqrt(1 - a))
 
     return angle * radius
 
 
-cdef double distance_x_y(double x1, double y1,
-                         double x2, double y2) nogil:
+cdef inline double distance_x_y(double x1, double y1,
+                                double x2, double y2) nogil:
     """Calculate the distance between two x/y points on
        a plane, in the units of the points (hopefully they
        are in kilometers too...)
@@ -62,7 +64,7 @@ cdef double distance_x_y(double x1, double y1,
     return sqrt(dx + dy)
 
 
-def zero_distances(network, Network, nthreads: int = 1):
+def zero_distances(network: Network, nthreads: int = 1):
     """Zero the link and play link distances"""
     links = network.links
     play = network.play
@@ -83,19 +85,82 @@ def zero_distances(network, Network, nthreads: int = 1):
         for i in prange(1, nplay_plus_one, schedule="static"):
             play_distance[i] = 0.0
 
+    network._min_max_distances = (0.0, 0.0)
+
+
+def _get_distances_cache_key(network: Network):
+    """Return the network cache key for the link distances of the
+       passed network. This depends only on the coordinates of
+       the wards and on which wards are connected by each link
+    """
+    import hashlib
+    from ._network_cache import network_cache_key
+
+    def _hash(values, n):
+        return hashlib.sha256(memoryview(values)[0:n]).hexdigest()
+
+    nnodes = network.nnodes + 1
+    nlinks = network.nlinks + 1
+    nplay = network.nplay + 1
+
+    wards = network.nodes
+    links = network.links
+    play = network.play
+
+    return network_cache_key(
+                "distances",
+                coordinates=wards.coordinates,
+                x=_hash(wards.x, nnodes), y=_hash(wards.y, nnodes),
+                links_ifrom=_hash(links.ifrom, nlinks),
+                links_ito=_hash(links.ito, nlinks),
+                play_ifrom=_hash(play.ifrom, nplay),
+                play_ito=_hash(play.ito, nplay))
+
+
+def _load_cached_distances(network: Network, data) -> bool:
+    """Copy the cached distances in 'data' into the passed network.
+       Returns whether or not this was successful
+    """
+    try:
+        (links_distance, play_distance, min_max) = data
+
+        if len(links_distance) != network.nlinks + 1 or \
+                len(play_distance) != network.nplay + 1:
+            return False
+
+        network.links.distance[0:network.nlinks + 1] = links_distance
+        network.play.distance[0:network.nplay + 1] = play_distance
+        network._min_max_distances = tuple(min_max)
+        return True
+    except Exception:
+        return False
+
 
 def calc_network_distance(network: Network, nthreads: int = 1):
     """Recalculate and save all of the distances for the
-       work and play links between wards
+       work and play links between wards. The work and play
+       distances are calculated in a single parallel pass,
+       which also finds the minimum and maximum work link
+       distances (see :meth:`Network.get_min_max_distances`).
+       The distances are loaded from the network cache
+       (see :func:`metawards.utils.get_network_cache_dir`)
+       if they have been calculated before for the same wards
+       and links, else they are calculated and then saved to
+       the cache
     """
+    # the cutoff masks depend on the distances, so must be rebuilt
+    network._cutoff_mask = None
+
     wards = network.nodes
     links = network.links
     play = network.play
 
+    cdef int is_lat_long = 0
+
     if network.nodes.coordinates == "x/y":
-        calc_distance = distance_x_y
+        is_lat_long = 0
     elif network.nodes.coordinates == "lat/long":
-        calc_distance = distance_lat_long
+        is_lat_long = 1
     elif network.nodes.coordinates is None:
         zero_distances(network, nthreads)
         return
@@ -103,39 +168,93 @@ def calc_network_distance(network: Network, nthreads: int = 1):
         raise ValueError(f"Unrecognised coordinate system "
                          f"{network.nodes.coordinates}")
 
+    from ._console import Console
+    from ._array import create_double_array, create_int_array
+    from ._network_cache import get_network_cache_dir
+
+    key = None
+
+    if get_network_cache_dir() is not None:
+        key = _get_distances_cache_key(network)
+
+        from ._network_cache import load_from_network_cache
+        data = load_from_network_cache(key)
+
+        if data is not None and _load_cached_distances(network, data):
+            Console.print("Using cached distances...")
+            return
+
     cdef double * wards_x = get_double_array_ptr(wards.x)
     cdef double * wards_y = get_double_array_ptr(wards.y)
 
-    # make sure that all nodes have valid distances
+    cdef int nnodes_plus_one = network.nnodes + 1
+
+    # precompute everything that depends only on a single ward, so
+    # that the haversine formula for each link needs no sin or cos.
+    # For lat/long, x is the longitude and y is the latitude
+    has_position = create_int_array(nnodes_plus_one, 0)
+    sin_half_x = create_double_array(nnodes_plus_one, 0.0)
+    cos_half_x = create_double_array(nnodes_plus_one, 0.0)
+    sin_half_y = create_double_array(nnodes_plus_one, 0.0)
+    cos_half_y = create_double_array(nnodes_plus_one, 0.0)
+    cos_y = create_double_array(nnodes_plus_one, 0.0)
+
+    cdef int * wards_has_pos = get_int_array_ptr(has_position)
+    cdef double * wards_sin_half_x = get_double_array_ptr(sin_half_x)
+    cdef double * wards_cos_half_x = get_double_array_ptr(cos_half_x)
+    cdef double * wards_sin_half_y = get_double_array_ptr(sin_half_y)
+    cdef double * wards_cos_half_y = get_double_array_ptr(cos_half_y)
+    cdef double * wards_cos_y = get_double_array_ptr(cos_y)
+
     cdef int i = 0
     cdef int nmissing = 0
+    cdef int num_threads = nthreads
+    cdef double x = 0.0
+    cdef double y = 0.0
 
-    from ._console import Console
+    with nogil, parallel(num_threads=num_threads):
+        for i in prange(1, nnodes_plus_one, schedule="static"):
+            x = wards_x[i]
+            y = wards_y[i]
 
-    for i in range(1, network.nnodes+1):
-        x = wards.x[i]
-        y = wards.y[i]
+            if x == 0 and y == 0:
+                wards_has_pos[i] = 0
+                nmissing += 1
+            else:
+                wards_has_pos[i] = 1
+
+                if is_lat_long:
+                    x = deg_to_rad(x) / 2.0
+                    y = deg_to_rad(y) / 2.0
+                    wards_sin_half_x[i] = sin(x)
+                    wards_cos_half_x[i] = cos(x)
+                    wards_sin_half_y[i] = sin(y)
+                    wards_cos_half_y[i] = cos(y)
+                    wards_cos_y[i] = cos(2.0 * y)
+
+    # make sure that all nodes have valid distances
+    if nmissing > 0:
+        nprinted = 0
+
+        for i in range(1, nnodes_plus_one):
+            if not wards_has_pos[i]:
+                nprinted += 1
+
+                if nprinted == 20:
+                    Console.print(
+                        "Not printing any more missing positions as there "
+                        "are too many. You should fix the positions file")
+                    break
 
-        if (x == 0) and (y == 0):
-            nmissing += 1
-            if nmissing == 20:
-                Console.print(
-                      "Not printing any more missing positions as there "
-                      "are too many. You should fix the positions file")
-            elif nmissing < 20:
                 Console.print(
                     f"WARNING: Position of ward {i} does not appear to have "
-                    f"been set - position is ({x} {y}).")
+                    f"been set - position is ({wards.x[i]} {wards.y[i]}).")
 
-    if nmissing > 0:
         Console.print(f"In total the number of wards with missing positions "
                       f"is {nmissing}")
 
     Console.print("Calculating distances...")
 
-    cdef double total_distance = 0
-    cdef double distance, distance2
-
     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
     cdef int * links_ito = get_int_array_ptr(links.ito)
 
@@ -145,84 +264,131 @@ def calc_network_distance(network: Network, nthreads: int = 1):
     cdef double * links_distance = get_double_array_ptr(links.distance)
     cdef double * play_distance = get_double_array_ptr(play.distance)
 
-    cdef double x1 = 0.0
-    cdef double x2 = 0.0
-    cdef double y1 = 0.0
-    cdef double y2 = 0.0
-
     cdef int nlinks_plus_one = network.nlinks + 1
     cdef int nplay_plus_one = network.nplay + 1
 
+    # per-thread minimum and maximum (non-zero) work link distances
+    min_distances = create_double_array(num_threads, -1.0)
+    max_distances = create_double_array(num_threads, -1.0)
+
+    cdef double * thread_min = get_double_array_ptr(min_distances)
+    cdef double * thread_max = get_double_array_ptr(max_distances)
+
+    cdef double total_distance = 0.0
+    cdef double total_play_distance = 0.0
+    cdef double distance = 0.0
     cdef double too_large = 10000
 
     cdef int ifrom = 0
     cdef int ito = 0
-
-    cdef int num_threads = nthreads
+    cdef int thread_id = 0
+    cdef int nlarge = 0
+    cdef int nlarge_play = 0
 
     with nogil, parallel(num_threads=num_threads):
+        thread_id = cython.parallel.threadid()
+
         for i in prange(1, nlinks_plus_one, schedule="static"):
             ifrom = links_ifrom[i]
             ito = links_ito[i]
 
-            x1 = wards_x[ifrom]
-            y1 = wards_y[ifrom]
-
-            x2 = wards_x[ito]
-            y2 = wards_y[ito]
-
-            if (x1 == 0 and y1 == 0) or (x2 == 0 and y2 == 0):
-                links_distance[i] = 0.0
-            else:
-                # skipping null points
-                distance = calc_distance(x1, y1, x2, y2)
+            if wards_has_pos[ifrom] and wards_has_pos[ito]:
+                if is_lat_long:
+                    distance = _haversine(
+                                    wards_sin_half_x, wards_cos_half_x,
+                                    wards_sin_half_y, wards_cos_half_y,
+                                    wards_cos_y, ifrom, ito)
+                else:
+                    distance = distance_x_y(wards_x[ifrom], wards_y[ifrom],
+                                            wards_x[ito], wards_y[ito])
 
                 links_distance[i] = distance
                 total_distance += distance
 
+                if distance != 0:
+                    if thread_min[thread_id] < 0 or \
+                            distance < thread_min[thread_id]:
+                        thread_min[thread_id] = distance
+
+                    if distance > thread_max[thread_id]:
+                        thread_max[thread_id] = distance
+
                 if distance > too_large:
-                    with gil:
-                        Console.print(
-                              f"Large distance between wards {ifrom} "
-                              f"and {ito}: {distance} km? {x1},{y1}  "
-                              f"{x2},{y2}")
+                    nlarge += 1
+            else:
+                # skipping null points
+                links_distance[i] = 0.0
 
-    Console.print(f"Total links distance equals {total_distance}")
+        for i in prange(1, nplay_plus_one, schedule="static"):
+            ifrom = play_ifrom[i]
+            ito = play_ito[i]
+
+            if wards_has_pos[ifrom] and wards_has_pos[ito]:
+                if is_lat_long:
+                    distance = _haversine(
+                                    wards_sin_half_x, wards_cos_half_x,
+                                    wards_sin_half_y, wards_cos_half_y,
+                                    wards_cos_y, ifrom, ito)
+                else:
+                    distance = distance_x_y(wards_x[ifrom], wards_y[ifrom],
+                                            wards_x[ito], wards_y[ito])
 
-    cdef double total_play_distance = 0.0
+                play_distance[i] = distance
+                total_play_distance += distance
 
-    if network.nplay > 0:
-        with nogil, parallel(num_threads=1):
-            for i in prange(1, nplay_plus_one, schedule="static"):
-                ifrom = play_ifrom[i]
-                ito = play_ito[i]
+                if distance > too_large:
+                    nlarge_play += 1
+            else:
+                # skipping null points
+                play_distance[i] = 0.0
 
-                x1 = wards_x[ifrom]
-                y1 = wards_y[ifrom]
+    if nlarge > 0 or nlarge_play > 0:
+        _print_large_distances(links, network.nlinks, wards, too_large,
+                               "")
+        _print_large_distances(play, network.nplay, wards, too_large,
+                               "play ")
 
-                x2 = wards_x[ito]
-                y2 = wards_y[ito]
+    cdef double mindist = -1.0
+    cdef double maxdist = -1.0
 
-                if (x1 == 0 and y1 == 0) or (x2 == 0 and y2 == 0):
-                    play_distance[i] = 0.0
-                else:
-                    # skipping null points
-                    distance = calc_distance(x1, y1, x2, y2)
+    for i in range(0, num_threads):
+        if thread_min[i] >= 0 and (mindist < 0 or thread_min[i] < mindist):
+            mindist = thread_min[i]
 
-                    play_distance[i] = distance
-                    total_play_distance += distance
+        if thread_max[i] > maxdist:
+            maxdist = thread_max[i]
 
-                    if distance > too_large:
-                        with gil:
-                            Console.print(
-                                  f"Large distance between play wards {ifrom} "
-                                  f"and {ito}: {distance} km? {x1},{y1}  "
-                                  f"{x2},{y2}")
+    network._min_max_distances = (max(mindist, 0.0), max(maxdist, 0.0))
 
+    Console.print(f"Total links distance equals {total_distance}")
     Console.print(f"Total play distance equals {total_play_distance}")
     Console.print(
             f"Total distance equals {total_distance+total_play_distance}")
 
+    if key is not None:
+        from ._network_cache import save_to_network_cache
+        save_to_network_cache(
+            key, (links.distance[0:nlinks_plus_one],
+                  play.distance[0:nplay_plus_one],
+                  network._min_max_distances))
+
+
+def _print_large_distances(links, int nlinks, wards, double too_large,
+                           kind: str):
+    """Print out all of the links that are suspiciously long"""
+    from ._console import Console
+
+    for i in range(1, nlinks + 1):
+        distance = links.distance[i]
+
+        if distance > too_large:
+            ifrom = links.ifrom[i]
+            ito = links.ito[i]
+            Console.print(
+                f"Large distance between {kind}wards {ifrom} "
+                f"and {ito}: {distance} km? {wards.x[ifrom]},"
+                f"{wards.y[ifrom]}  {wards.x[ito]},{wards.y[ito]}")
+
 
 def add_wards_network_distance(network: Network, nthreads: int = 1):
     """Reads the location data in network.parameters.input_files.position
@@ -17,6 +17,80 @@ _console = None
 # Global console theme
 _theme = None
 
+# The mode used to log output that is redirected to a file
+# (see Console.set_log_mode)
+_log_mode = "rich"
+
+# The number of days between printing the per-day summaries
+_log_every = 1
+
+
+class _PlainConsole:
+    """A minimal, low-overhead replacement for a rich Console that
+       writes pre-formatted plain-text lines to a file. This is used
+       for output that is redirected to a file when the log mode is
+       'plain', as rendering everything through rich is a measurable
+       fraction of the time of a short model run
+    """
+
+    def __init__(self, file, width: int = 100):
+        self.file = file
+        self.width = width
+        self._use_spinner = False
+        self._use_progress = False
+        self._debugging_enabled = False
+        self._debugging_level = None
+        self._renderer = None
+
+    def _render(self, obj, markup: bool = None) -> str:
+        """Return the plain-text version of 'obj'"""
+        if isinstance(obj, str):
+            if markup is not False and "[" in obj:
+                from rich.text import Text as _Text
+                try:
+                    return _Text.from_markup(obj).plain
+                except Exception:
+                    pass
+
+            return obj
+
+        from rich.rule import Rule as _Rule
+
+        if isinstance(obj, _Rule):
+            if obj.title:
+                return f"---- {self._render(obj.title)} ----"
+            else:
+                return "-" * 20
+
+        # anything else (tables, panels etc.) is rare, so render it
+        # using a colourless rich console
+        if self._renderer is None:
+            import io
+            from rich.console import Console as _Console
+            self._renderer = _Console(file=io.StringIO(), width=self.width,
+                                      color_system=None, emoji=False)
+
+        with self._renderer.capture() as capture:
+            self._renderer.print(obj)
+
+        return capture.get().rstrip("\n")
+
+    def print(self, *objects, style=None, markup: bool = None, **kwargs):
+        self.file.write(" ".join([self._render(x, markup=markup)
+                                  for x in objects]) + "\n")
+
+    def log(self, *objects, **kwargs):
+        time = _datetime.now().strftime("%H:%M:%S")
+        self.file.write(f"[{time}] " +
+                        " ".join([self._render(x) for x in objects]) + "\n")
+
+    def print_exception(self):
+        import traceback
+        self.file.write(traceback.format_exc())
+
+    def export_text(self, *args, **kwargs):
+        return ""
+
 
 class _NullProgress:
     """Null progress to use if user disables progress"""
@@ -229,10 +303,59 @@ class Console:
 
         return _console
 
+    @staticmethod
+    def set_log_mode(mode: str = "rich", every: int = 1):
+        """Set the mode used to log output that is redirected to a
+           file (e.g. the output.txt of each model run). This is
+           either 'rich', which renders everything through rich,
+           or 'plain', which writes pre-formatted plain-text lines
+           with much lower overhead. The interactive console always
+           uses rich.
+
+           Also set 'every', which is the number of days between
+           printing the per-day summaries of a model run, e.g.
+           every=7 prints the summary every week
+        """
+        global _log_mode, _log_every
+
+        mode = str(mode).lower().strip()
+
+        if mode not in ["rich", "plain"]:
+            raise ValueError(f"Unrecognised log mode '{mode}'. This "
+                             f"should be 'rich' or 'plain'")
+
+        every = int(every)
+
+        if every < 1:
+            raise ValueError(f"The number of days between logging "
+                             f"({every}) must be 1 or more")
+
+        _log_mode = mode
+        _log_every = every
+
+    @staticmethod
+    def get_log_mode():
+        """Return the current log mode, as a dictionary that can be
+           passed to :meth:`Console.set_log_mode`
+        """
+        return {"mode": _log_mode, "every": _log_every}
+
+    @staticmethod
+    def is_logged_day(day: int) -> bool:
+        """Return whether or not the per-day summaries of a model run
+           should be printed for the passed day (see
+           :meth:`Console.set_log_mode`). This is checked by the
+           extractors before they call :meth:`Console.print_population`
+        """
+        return _log_every == 1 or day % _log_every == 0
+
     @staticmethod
     @_contextmanager
     def redirect_output(outdir: str, auto_bzip: bool = True):
-        """Redirect all output and error to the directory 'outdir'"""
+        """Redirect all output and error to the directory 'outdir'.
+           This uses plain-text output if the log mode is 'plain'
+           (see :meth:`Console.set_log_mode`)
+        """
         import os as os
         import sys as sys
         import bz2
@@ -252,8 +375,13 @@ class Console:
         if console is None:
             raise AssertionError("The global console should never be None")
 
-        new_out = _Console(file=OUTFILE, record=False, log_time=True,
-                           log_path=True, emoji=Console.supports_emojis())
+        if _log_mode == "plain":
+            new_out = _PlainConsole(file=OUTFILE)
+        else:
+            new_out = _Console(file=OUTFILE, record=False, log_time=True,
+                               log_path=True,
+                               emoji=Console.supports_emojis())
+
         new_out._use_spinner = False
         new_out._use_progress = False
         new_out._debugging_enabled = console._debugging_enabled
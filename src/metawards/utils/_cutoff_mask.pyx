@@ -0,0 +1,103 @@
+#!/bin/env/python3
+#cython: linetrace=False
+# MUST ALWAYS DISABLE AS WAY TOO SLOW FOR ITERATE
+
+cimport cython
+from cython.parallel import parallel, prange
+
+from .._network import Network
+
+from ._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
+
+__all__ = ["build_cutoff_mask", "get_cutoff_mask_key"]
+
+
+def get_cutoff_mask_key(network: Network):
+    """Return the key that identifies the cutoffs used to build the
+       cutoff mask of the passed network. The mask only needs to be
+       rebuilt if this key changes. This is much cheaper to compute
+       than the mask, as it only depends on the per-ward cutoffs
+       and the global dyn_dist_cutoff parameter
+    """
+    from zlib import crc32
+
+    params = network.params
+    wards = network.nodes
+
+    if params is None:
+        cutoff = None
+    else:
+        cutoff = params.dyn_dist_cutoff
+
+    return (cutoff, network.nnodes, network.nlinks, network.nplay,
+            id(network.links.distance), id(network.play.distance),
+            crc32(memoryview(wards.cutoff).cast("B")))
+
+
+def _build_mask(links, int nlinks, wards, double cutoff,
+                int num_threads):
+    """Return the mask of the first 'nlinks' links in 'links' whose
+       distance is below the cutoff of both of their wards and
+       the global cutoff
+    """
+    from ._array import create_int_array
+
+    mask = create_int_array(nlinks + 1, 0)
+
+    if nlinks == 0:
+        return mask
+
+    cdef int * links_mask = get_int_array_ptr(mask)
+    cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+    cdef int * links_ito = get_int_array_ptr(links.ito)
+    cdef double * links_distance = get_double_array_ptr(links.distance)
+    cdef double * wards_cutoff = get_double_array_ptr(wards.cutoff)
+
+    cdef double local_cutoff = cutoff
+    cdef int nlinks_plus_one = nlinks + 1
+    cdef int j = 0
+
+    with nogil, parallel(num_threads=num_threads):
+        for j in prange(1, nlinks_plus_one, schedule="static"):
+            local_cutoff = min(cutoff, wards_cutoff[links_ifrom[j]])
+            local_cutoff = min(local_cutoff, wards_cutoff[links_ito[j]])
+
+            if links_distance[j] < local_cutoff:
+                links_mask[j] = 1
+            else:
+                links_mask[j] = 0
+
+    return mask
+
+
+def build_cutoff_mask(network: Network, nthreads: int = 1):
+    """Build and return the masks of the work and play links of
+       the passed network that are within the current cutoff
+       distance, i.e. whose distance is below both the
+       per-ward cutoff of the wards they connect and the
+       global params.dyn_dist_cutoff. Entry 'j' of a mask
+       is 1 if link 'j' is within the cutoff, and 0 otherwise.
+
+       You should normally use :meth:`Network.get_cutoff_mask`,
+       which caches the masks and only rebuilds them when the
+       cutoffs change.
+
+       Returns
+       -------
+       (links_mask, play_mask)
+         The masks for the work (links) and play links
+    """
+    params = network.params
+
+    if params is None:
+        from .._parameters import Parameters
+        cutoff = Parameters.dyn_dist_cutoff
+    else:
+        cutoff = params.dyn_dist_cutoff
+
+    links_mask = _build_mask(network.links, network.nlinks,
+                             network.nodes, cutoff, nthreads)
+    play_mask = _build_mask(network.play, network.nplay,
+                            network.nodes, cutoff, nthreads)
+
+    return (links_mask, play_mask)
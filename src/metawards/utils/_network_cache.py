@@ -0,0 +1,168 @@
+from typing import Union as _Union
+
+__all__ = ["get_network_cache_dir", "set_network_cache_dir",
+           "input_files_cache_key", "network_cache_key",
+           "load_from_network_cache", "save_to_network_cache"]
+
+#: The directory used to cache expensive network build data. If this
+#: is None then the METAWARDS_CACHE environment variable is used.
+#: Caching is disabled if neither is set
+_cache_dir = None
+
+#: Bump this whenever the format of any cached data changes, so that
+#: old cache files are ignored
+_cache_version = 1
+
+
+def get_network_cache_dir() -> _Union[str, None]:
+    """Return the directory that is used to cache expensive-to-compute
+       network data (e.g. the population of specialised demographic
+       sub-networks). This is set either via
+       :func:`set_network_cache_dir` or via the METAWARDS_CACHE
+       environment variable. This returns None if caching is disabled
+    """
+    if _cache_dir is not None:
+        return _cache_dir
+
+    import os
+    cache_dir = os.getenv("METAWARDS_CACHE")
+
+    if cache_dir is None or len(cache_dir.strip()) == 0:
+        return None
+    else:
+        return cache_dir
+
+
+def set_network_cache_dir(cache_dir: str = None) -> None:
+    """Set the directory used to cache expensive-to-compute network
+       data. Set this to None to fall back to the METAWARDS_CACHE
+       environment variable. Note that worker processes inherit
+       the environment, so setting METAWARDS_CACHE is the easiest
+       way to share a cache across all workers in a sweep
+    """
+    global _cache_dir
+
+    if cache_dir is None:
+        _cache_dir = None
+    else:
+        from pathlib import Path
+        _cache_dir = str(Path(cache_dir).expanduser().absolute())
+
+
+def _file_signature(filename: str):
+    """Return a signature for the passed file that changes whenever
+       the file is changed
+    """
+    import os
+
+    if filename is None:
+        return None
+
+    try:
+        s = os.stat(filename)
+        return [str(filename), int(s.st_size), int(s.st_mtime_ns)]
+    except Exception:
+        return [str(filename), None, None]
+
+
+def input_files_cache_key(input_files) -> _Union[dict, None]:
+    """Return a json-serialisable description of the passed InputFiles
+       that can be used as part of a cache key. This includes the
+       size and modification time of every file, so that the key
+       changes whenever any of the files are edited
+    """
+    if input_files is None:
+        return None
+
+    if input_files.is_single:
+        return {"is_single": True}
+
+    if input_files.is_wards_data:
+        return {"wards_data": _file_signature(input_files.wards_data)}
+
+    members = ["work", "play", "identifier", "identifier2", "weekend",
+               "work_size", "play_size", "position", "lookup", "seed",
+               "nodes_to_track", "uv"]
+
+    data = {"_filename": _file_signature(input_files._filename),
+            "coordinates": input_files.coordinates,
+            "lookup_columns": input_files.lookup_columns}
+
+    for member in members:
+        data[member] = _file_signature(getattr(input_files, member))
+
+    return data
+
+
+def network_cache_key(kind: str, **kwargs) -> str:
+    """Return the cache key for data of type 'kind' that is uniquely
+       identified by the passed (json-serialisable) keyword arguments
+    """
+    import json
+    import hashlib
+
+    data = json.dumps({"kind": str(kind), "version": _cache_version,
+                       "data": kwargs}, sort_keys=True, default=str)
+
+    return f"{kind}_{hashlib.sha256(data.encode('utf-8')).hexdigest()}"
+
+
+def load_from_network_cache(key: str):
+    """Return the data cached under 'key', or None if caching is
+       disabled or there is no (readable) data for this key
+    """
+    cache_dir = get_network_cache_dir()
+
+    if cache_dir is None:
+        return None
+
+    import os
+    filename = os.path.join(cache_dir, f"{key}.pkl")
+
+    if not os.path.exists(filename):
+        return None
+
+    import pickle
+
+    try:
+        with open(filename, "rb") as FILE:
+            return pickle.load(FILE)
+    except Exception as e:
+        from ._console import Console
+        Console.warning(f"Ignoring unreadable network cache file "
+                        f"{filename}: {e.__class__} {e}")
+        return None
+
+
+def save_to_network_cache(key: str, data: any) -> None:
+    """Save 'data' to the network cache under 'key'. This does
+       nothing if caching is disabled. The data is written to a
+       temporary file that is atomically moved into place, so that
+       concurrent workers never read partially-written data
+    """
+    cache_dir = get_network_cache_dir()
+
+    if cache_dir is None:
+        return
+
+    import os
+    import pickle
+    import tempfile
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        (fd, tmpfile) = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as FILE:
+                pickle.dump(data, FILE, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmpfile, os.path.join(cache_dir, f"{key}.pkl"))
+        except Exception:
+            os.unlink(tmpfile)
+            raise
+    except Exception as e:
+        from ._console import Console
+        Console.warning(f"Unable to write to the network cache in "
+                        f"{cache_dir}: {e.__class__} {e}")
@@ -0,0 +1,14209 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "extra_compile_args": [
+            "-O3",
+            "-fopenmp"
+        ],
+        "extra_link_args": [
+            "-fopenmp"
+        ],
+        "include_dirs": [
+            "src/metawards"
+        ],
+        "libraries": [
+            "metawards_random"
+        ],
+        "name": "metawards.utils._network_wards",
+        "sources": [
+            "src/metawards/utils/_network_wards.pyx"
+        ]
+    },
+    "module_name": "metawards.utils._network_wards"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__metawards__utils___network_wards
+#define __PYX_HAVE_API__metawards__utils___network_wards
+/* Early includes */
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "src/metawards/utils/_network_wards.pyx",
+};
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+
+/*--- Type declarations ---*/
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod0.proto */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto */
+#define __Pyx_unpack_tuple2(tuple, value1, value2, is_tuple, has_known_size, decref_tuple)\
+    (likely(is_tuple || PyTuple_Check(tuple)) ?\
+        (likely(has_known_size || PyTuple_GET_SIZE(tuple) == 2) ?\
+            __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple) :\
+            (__Pyx_UnpackTupleError(tuple, 2), -1)) :\
+        __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple))
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* AssertionsEnabled.proto */
+#define __Pyx_init_assertions_enabled()
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define __pyx_assertions_enabled() (1)
+#elif PY_VERSION_HEX < 0x03080000  ||  CYTHON_COMPILING_IN_PYPY  ||  defined(Py_LIMITED_API)
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030900A6
+  static int __pyx_assertions_enabled_flag;
+  #define __pyx_assertions_enabled() (__pyx_assertions_enabled_flag)
+  #undef __Pyx_init_assertions_enabled
+  static void __Pyx_init_assertions_enabled(void) {
+    __pyx_assertions_enabled_flag = ! _PyInterpreterState_GetConfig(__Pyx_PyThreadState_Current->interp)->optimization_level;
+  }
+#else
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif PY_MAJOR_VERSION < 3
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_str(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_str(s) :\
+        PyObject_Format(s, f))
+#else
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* PyObjectLookupSpecial.proto */
+#if CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_LookupSpecial(PyObject* obj, PyObject* attr_name) {
+    PyObject *res;
+    PyTypeObject *tp = Py_TYPE(obj);
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(PyInstance_Check(obj)))
+        return __Pyx_PyObject_GetAttrStr(obj, attr_name);
+#endif
+    res = _PyType_Lookup(tp, attr_name);
+    if (likely(res)) {
+        descrgetfunc f = Py_TYPE(res)->tp_descr_get;
+        if (!f) {
+            Py_INCREF(res);
+        } else {
+            res = f(res, obj, (PyObject *)tp);
+        }
+    } else {
+        PyErr_SetObject(PyExc_AttributeError, attr_name);
+    }
+    return res;
+}
+#else
+#define __Pyx_PyObject_LookupSpecial(o,n) __Pyx_PyObject_GetAttrStr(o,n)
+#endif
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
+
+/* append.proto */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BuildPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* SetItemInt.proto */
+#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
+                                               int is_list, int wraparound, int boundscheck);
+
+/* py_abs.proto */
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject *__Pyx_PyLong_AbsNeg(PyObject *num);
+#define __Pyx_PyNumber_Absolute(x)\
+    ((likely(PyLong_CheckExact(x))) ?\
+         (likely(Py_SIZE(x) >= 0) ? (Py_INCREF(x), (x)) : __Pyx_PyLong_AbsNeg(x)) :\
+         PyNumber_Absolute(x))
+#else
+#define __Pyx_PyNumber_Absolute(x)  PyNumber_Absolute(x)
+#endif
+
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* None.proto */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'metawards.utils._get_array_ptr' */
+static double *(*__pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr)(PyObject *); /*proto*/
+static int *(*__pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr)(PyObject *); /*proto*/
+
+/* Module declarations from 'metawards.utils._network_wards' */
+#define __Pyx_MODULE_NAME "metawards.utils._network_wards"
+extern int __pyx_module_is_main_metawards__utils___network_wards;
+int __pyx_module_is_main_metawards__utils___network_wards = 0;
+
+/* Implementation of 'metawards.utils._network_wards' */
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_AssertionError;
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_p[] = "p";
+static const char __pyx_k_w[] = "w";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_y[] = "y";
+static const char __pyx_k__3[] = "[/]";
+static const char __pyx_k__8[] = "=>";
+static const char __pyx_k__9[] = " ";
+static const char __pyx_k_id[] = "id";
+static const char __pyx_k_km[] = "km";
+static const char __pyx_k_vs[] = " vs ";
+static const char __pyx_k__10[] = " => ";
+static const char __pyx_k__12[] = "\n";
+static const char __pyx_k_all[] = "__all__";
+static const char __pyx_k_ito[] = "ito";
+static const char __pyx_k_key[] = "key";
+static const char __pyx_k_lat[] = "lat";
+static const char __pyx_k_x_y[] = "x/y";
+static const char __pyx_k_Ward[] = "Ward";
+static const char __pyx_k_copy[] = "copy";
+static const char __pyx_k_diff[] = "diff";
+static const char __pyx_k_exit[] = "__exit__";
+static const char __pyx_k_info[] = "info";
+static const char __pyx_k_load[] = "load";
+static const char __pyx_k_long[] = "long";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_play[] = "play";
+static const char __pyx_k_stop[] = "stop";
+static const char __pyx_k_task[] = "task";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_ward[] = "ward ";
+static const char __pyx_k_Links[] = "Links";
+static const char __pyx_k_Nodes[] = "Nodes";
+static const char __pyx_k_Wards[] = "Wards";
+static const char __pyx_k_array[] = "array";
+static const char __pyx_k_end_p[] = "end_p";
+static const char __pyx_k_enter[] = "__enter__";
+static const char __pyx_k_error[] = "error";
+static const char __pyx_k_ifrom[] = "ifrom";
+static const char __pyx_k_ilink[] = "ilink";
+static const char __pyx_k_items[] = "items";
+static const char __pyx_k_label[] = "label";
+static const char __pyx_k_links[] = "links";
+static const char __pyx_k_nodes[] = "nodes";
+static const char __pyx_k_nplay[] = "nplay";
+static const char __pyx_k_pos_a[] = "pos_a";
+static const char __pyx_k_pos_b[] = "pos_b";
+static const char __pyx_k_print[] = "print";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_start[] = "start";
+static const char __pyx_k_total[] = "total";
+static const char __pyx_k_units[] = "units";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_wards[] = "wards";
+static const char __pyx_k_Ward_2[] = "Ward ";
+static const char __pyx_k_append[] = "append";
+static const char __pyx_k_bg_foi[] = "bg_foi";
+static const char __pyx_k_custom[] = "custom";
+static const char __pyx_k_cutoff[] = "cutoff";
+static const char __pyx_k_end_to[] = "end_to";
+static const char __pyx_k_errors[] = "errors";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_insert[] = "insert";
+static const char __pyx_k_markup[] = "markup";
+static const char __pyx_k_nlinks[] = "nlinks";
+static const char __pyx_k_nnodes[] = "nnodes";
+static const char __pyx_k_number[] = "number";
+static const char __pyx_k_params[] = "params";
+static const char __pyx_k_self_p[] = "self_p";
+static const char __pyx_k_self_w[] = "self_w";
+static const char __pyx_k_silent[] = "silent";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_values[] = "values";
+static const char __pyx_k_versus[] = " versus ";
+static const char __pyx_k_ward_2[] = "_ward";
+static const char __pyx_k_ward_3[] = "ward";
+static const char __pyx_k_weight[] = "weight";
+static const char __pyx_k_Console[] = "Console";
+static const char __pyx_k_Disease[] = "Disease";
+static const char __pyx_k_Network[] = "Network";
+static const char __pyx_k_Players[] = ", Players: ";
+static const char __pyx_k_Workers[] = ", Workers: ";
+static const char __pyx_k_begin_p[] = "begin_p";
+static const char __pyx_k_columns[] = "columns";
+static const char __pyx_k_console[] = "_console";
+static const char __pyx_k_disease[] = "disease";
+static const char __pyx_k_have_xy[] = "have_xy";
+static const char __pyx_k_links_2[] = "_links";
+static const char __pyx_k_maxdist[] = "maxdist";
+static const char __pyx_k_mindist[] = "_mindist";
+static const char __pyx_k_network[] = "network";
+static const char __pyx_k_nodes_2[] = "_nodes";
+static const char __pyx_k_nodes_x[] = "nodes_x";
+static const char __pyx_k_nodes_y[] = "nodes_y";
+static const char __pyx_k_present[] = "present";
+static const char __pyx_k_suscept[] = "suscept";
+static const char __pyx_k_wards_2[] = "_wards";
+static const char __pyx_k_Profiler[] = "Profiler";
+static const char __pyx_k_add_task[] = "add_task";
+static const char __pyx_k_begin_to[] = "begin_to";
+static const char __pyx_k_deepcopy[] = "deepcopy";
+static const char __pyx_k_has_self[] = "has_self";
+static const char __pyx_k_lat_long[] = "lat/long";
+static const char __pyx_k_nplayers[] = "nplayers";
+static const char __pyx_k_nthreads[] = "nthreads";
+static const char __pyx_k_play_ito[] = "play_ito";
+static const char __pyx_k_pos_type[] = "pos_type";
+static const char __pyx_k_profiler[] = "profiler";
+static const char __pyx_k_progress[] = "progress";
+static const char __pyx_k_scale_uv[] = "scale_uv";
+static const char __pyx_k_set_info[] = "set_info";
+static const char __pyx_k_wardinfo[] = "_wardinfo";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_WardInfos[] = "WardInfos";
+static const char __pyx_k_completed[] = "completed";
+static const char __pyx_k_disease_2[] = "_disease";
+static const char __pyx_k_get_infos[] = "get_infos";
+static const char __pyx_k_have_info[] = "have_info";
+static const char __pyx_k_links_ito[] = "links_ito";
+static const char __pyx_k_max_links[] = "max_links";
+static const char __pyx_k_max_nodes[] = "max_nodes";
+static const char __pyx_k_need_self[] = "need_self";
+static const char __pyx_k_network_2[] = "_network";
+static const char __pyx_k_play_dest[] = "play_dest";
+static const char __pyx_k_work_dest[] = "work_dest";
+static const char __pyx_k_xy_coords[] = "xy_coords";
+static const char __pyx_k_InputFiles[] = "InputFiles";
+static const char __pyx_k_Parameters[] = "Parameters";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_get_custom[] = "get_custom";
+static const char __pyx_k_inputfiles[] = "_inputfiles";
+static const char __pyx_k_node_index[] = "_node_index";
+static const char __pyx_k_or_players[] = ") or players (";
+static const char __pyx_k_parameters[] = "_parameters";
+static const char __pyx_k_play_begin[] = "play_begin";
+static const char __pyx_k_play_ifrom[] = "play_ifrom";
+static const char __pyx_k_population[] = "population";
+static const char __pyx_k_profiler_2[] = "_profiler";
+static const char __pyx_k_set_bg_foi[] = "set_bg_foi";
+static const char __pyx_k_set_custom[] = "set_custom";
+static const char __pyx_k_set_cutoff[] = "set_cutoff";
+static const char __pyx_k_to_columns[] = "to_columns";
+static const char __pyx_k_work_begin[] = "work_begin";
+static const char __pyx_k_Assert_sane[] = "Assert sane";
+static const char __pyx_k_add_workers[] = "add_workers";
+static const char __pyx_k_assert_sane[] = "assert_sane";
+static const char __pyx_k_auto_assign[] = "auto_assign";
+static const char __pyx_k_coordinates[] = "coordinates";
+static const char __pyx_k_destination[] = "destination";
+static const char __pyx_k_get_players[] = "get_players";
+static const char __pyx_k_have_coords[] = "have_coords";
+static const char __pyx_k_input_files[] = "input_files";
+static const char __pyx_k_links_ifrom[] = "links_ifrom";
+static const char __pyx_k_nodes_end_p[] = "nodes_end_p";
+static const char __pyx_k_nodes_label[] = "nodes_label";
+static const char __pyx_k_num_players[] = "num_players";
+static const char __pyx_k_num_workers[] = "num_workers";
+static const char __pyx_k_play_weight[] = "play_weight";
+static const char __pyx_k_self_weight[] = "self_weight";
+static const char __pyx_k_set_disease[] = "set_disease";
+static const char __pyx_k_to_original[] = "to_original";
+static const char __pyx_k_update_freq[] = "update_freq";
+static const char __pyx_k_ward_bg_foi[] = "ward_bg_foi";
+static const char __pyx_k_ward_custom[] = "ward_custom";
+static const char __pyx_k_ward_cutoff[] = "ward_cutoff";
+static const char __pyx_k_work_number[] = "work_number";
+static const char __pyx_k_Create_Wards[] = "Create Wards";
+static const char __pyx_k_Invalid_link[] = "Invalid link? ";
+static const char __pyx_k_NullProfiler[] = "NullProfiler";
+static const char __pyx_k_force_update[] = "force_update";
+static const char __pyx_k_have_latlong[] = "have_latlong";
+static const char __pyx_k_links_weight[] = "links_weight";
+static const char __pyx_k_nodes_bg_foi[] = "nodes_bg_foi";
+static const char __pyx_k_nodes_custom[] = "nodes_custom";
+static const char __pyx_k_nodes_cutoff[] = "nodes_cutoff";
+static const char __pyx_k_nodes_end_to[] = "nodes_end_to";
+static const char __pyx_k_nodes_self_p[] = "nodes_self_p";
+static const char __pyx_k_nodes_self_w[] = "nodes_self_w";
+static const char __pyx_k_play_suscept[] = "play_suscept";
+static const char __pyx_k_play_weights[] = "play_weights";
+static const char __pyx_k_player_total[] = "player_total";
+static const char __pyx_k_set_position[] = "set_position";
+static const char __pyx_k_set_scale_uv[] = "set_scale_uv";
+static const char __pyx_k_Convert_wards[] = "Convert wards";
+static const char __pyx_k_convert_nodes[] = "convert nodes";
+static const char __pyx_k_custom_params[] = "_custom_params";
+static const char __pyx_k_links_suscept[] = "links_suscept";
+static const char __pyx_k_nodes_begin_p[] = "nodes_begin_p";
+static const char __pyx_k_save_to_wards[] = "save_to_wards";
+static const char __pyx_k_ward_scale_uv[] = "ward_scale_uv";
+static const char __pyx_k_AssertionError[] = "AssertionError";
+static const char __pyx_k_need_deep_copy[] = "_need_deep_copy";
+static const char __pyx_k_nodes_begin_to[] = "nodes_begin_to";
+static const char __pyx_k_nodes_scale_uv[] = "nodes_scale_uv";
+static const char __pyx_k_original_index[] = "_original_index";
+static const char __pyx_k_dyn_dist_cutoff[] = "dyn_dist_cutoff";
+static const char __pyx_k_load_from_wards[] = "load_from_wards";
+static const char __pyx_k_nnodes_plus_one[] = "nnodes_plus_one";
+static const char __pyx_k_play_population[] = "play_population";
+static const char __pyx_k_set_num_players[] = "set_num_players";
+static const char __pyx_k_work_population[] = "work_population";
+static const char __pyx_k_Extracting_wards[] = "Extracting wards";
+static const char __pyx_k_original_index_2[] = "original_index";
+static const char __pyx_k_reset_everything[] = "reset_everything";
+static const char __pyx_k_Invalid_play_link[] = "Invalid play link? ";
+static const char __pyx_k_add_player_weight[] = "add_player_weight";
+static const char __pyx_k_save_play_suscept[] = "save_play_suscept";
+static const char __pyx_k_Convert_play_links[] = "Convert play links";
+static const char __pyx_k_Convert_work_links[] = "Convert work links";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_convert_play_links[] = "convert play links";
+static const char __pyx_k_convert_work_links[] = "convert work links";
+static const char __pyx_k_nodes_play_suscept[] = "nodes_play_suscept";
+static const char __pyx_k_auto_assign_players[] = "auto_assign_players";
+static const char __pyx_k_rescale_play_matrix[] = "rescale_play_matrix";
+static const char __pyx_k_weight_disagreement[] = " weight disagreement? ";
+static const char __pyx_k_Extracting_play_links[] = "Extracting play links";
+static const char __pyx_k_Extracting_work_links[] = "Extracting work links";
+static const char __pyx_k_calc_network_distance[] = "calc_network_distance";
+static const char __pyx_k_get_min_max_distances[] = "get_min_max_distances";
+static const char __pyx_k_move_from_play_to_work[] = "move_from_play_to_work";
+static const char __pyx_k_nodes_save_play_suscept[] = "nodes_save_play_suscept";
+static const char __pyx_k_add_wards_network_distance[] = "_add_wards_network_distance";
+static const char __pyx_k_Lots_of_errors_Exiting_early[] = "Lots of errors! Exiting early!";
+static const char __pyx_k_Disagreement_in_player_weights[] = "Disagreement in player weights";
+static const char __pyx_k_bold_Network_loaded_Population[] = "[bold]Network loaded. Population: ";
+static const char __pyx_k_metawards_utils__network_wards[] = "metawards.utils._network_wards";
+static const char __pyx_k_which_means_that_there_is_a_dat[] = ") which means that there is a data corruption somewhere...";
+static const char __pyx_k_Cannot_mix_wards_with_X_Y_and_la[] = "Cannot mix wards with X/Y and lat/long coordinates";
+static const char __pyx_k_Disagreement_in_population_sizes[] = "Disagreement in population sizes";
+static const char __pyx_k_Disagreement_in_size_of_the_popu[] = "Disagreement in size of the population";
+static const char __pyx_k_Disagreement_in_the_number_of_pl[] = "Disagreement in the number of players: ";
+static const char __pyx_k_Disagreement_in_the_number_of_wo[] = "Disagreement in the number of workers: ";
+static const char __pyx_k_Program_bug_Disagreement_between[] = "Program bug: Disagreement between the number of workers (";
+static const char __pyx_k_The_parameters_must_be_Parameter[] = "The parameters must be Parameters!";
+static const char __pyx_k_src_metawards_utils__network_war[] = "src/metawards/utils/_network_wards.pyx";
+static PyObject *__pyx_kp_u_Assert_sane;
+static PyObject *__pyx_n_s_AssertionError;
+static PyObject *__pyx_kp_u_Cannot_mix_wards_with_X_Y_and_la;
+static PyObject *__pyx_n_s_Console;
+static PyObject *__pyx_kp_u_Convert_play_links;
+static PyObject *__pyx_kp_u_Convert_wards;
+static PyObject *__pyx_kp_u_Convert_work_links;
+static PyObject *__pyx_kp_u_Create_Wards;
+static PyObject *__pyx_kp_u_Disagreement_in_player_weights;
+static PyObject *__pyx_kp_u_Disagreement_in_population_sizes;
+static PyObject *__pyx_kp_u_Disagreement_in_size_of_the_popu;
+static PyObject *__pyx_kp_u_Disagreement_in_the_number_of_pl;
+static PyObject *__pyx_kp_u_Disagreement_in_the_number_of_wo;
+static PyObject *__pyx_n_s_Disease;
+static PyObject *__pyx_kp_u_Extracting_play_links;
+static PyObject *__pyx_kp_u_Extracting_wards;
+static PyObject *__pyx_kp_u_Extracting_work_links;
+static PyObject *__pyx_n_s_InputFiles;
+static PyObject *__pyx_kp_u_Invalid_link;
+static PyObject *__pyx_kp_u_Invalid_play_link;
+static PyObject *__pyx_n_s_Links;
+static PyObject *__pyx_kp_u_Lots_of_errors_Exiting_early;
+static PyObject *__pyx_n_s_Network;
+static PyObject *__pyx_n_s_Nodes;
+static PyObject *__pyx_n_s_NullProfiler;
+static PyObject *__pyx_n_s_Parameters;
+static PyObject *__pyx_kp_u_Players;
+static PyObject *__pyx_n_s_Profiler;
+static PyObject *__pyx_kp_u_Program_bug_Disagreement_between;
+static PyObject *__pyx_kp_u_The_parameters_must_be_Parameter;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_Ward;
+static PyObject *__pyx_n_s_WardInfos;
+static PyObject *__pyx_kp_u_Ward_2;
+static PyObject *__pyx_n_s_Wards;
+static PyObject *__pyx_kp_u_Workers;
+static PyObject *__pyx_kp_u__10;
+static PyObject *__pyx_kp_u__12;
+static PyObject *__pyx_kp_u__3;
+static PyObject *__pyx_kp_u__8;
+static PyObject *__pyx_kp_u__9;
+static PyObject *__pyx_n_s_add_player_weight;
+static PyObject *__pyx_n_s_add_task;
+static PyObject *__pyx_n_s_add_wards_network_distance;
+static PyObject *__pyx_n_s_add_workers;
+static PyObject *__pyx_n_s_all;
+static PyObject *__pyx_n_s_append;
+static PyObject *__pyx_n_s_array;
+static PyObject *__pyx_n_s_assert_sane;
+static PyObject *__pyx_n_s_auto_assign;
+static PyObject *__pyx_n_s_auto_assign_players;
+static PyObject *__pyx_n_s_begin_p;
+static PyObject *__pyx_n_s_begin_to;
+static PyObject *__pyx_n_s_bg_foi;
+static PyObject *__pyx_kp_u_bold_Network_loaded_Population;
+static PyObject *__pyx_n_s_calc_network_distance;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_columns;
+static PyObject *__pyx_n_s_completed;
+static PyObject *__pyx_n_s_console;
+static PyObject *__pyx_kp_u_convert_nodes;
+static PyObject *__pyx_kp_u_convert_play_links;
+static PyObject *__pyx_kp_u_convert_work_links;
+static PyObject *__pyx_n_s_coordinates;
+static PyObject *__pyx_n_s_copy;
+static PyObject *__pyx_n_s_custom;
+static PyObject *__pyx_n_s_custom_params;
+static PyObject *__pyx_n_s_cutoff;
+static PyObject *__pyx_n_s_deepcopy;
+static PyObject *__pyx_n_s_destination;
+static PyObject *__pyx_n_s_diff;
+static PyObject *__pyx_n_s_disease;
+static PyObject *__pyx_n_s_disease_2;
+static PyObject *__pyx_n_s_dyn_dist_cutoff;
+static PyObject *__pyx_n_s_end_p;
+static PyObject *__pyx_n_s_end_to;
+static PyObject *__pyx_n_s_enter;
+static PyObject *__pyx_n_s_error;
+static PyObject *__pyx_n_s_errors;
+static PyObject *__pyx_n_s_exit;
+static PyObject *__pyx_n_s_force_update;
+static PyObject *__pyx_n_s_get_custom;
+static PyObject *__pyx_n_s_get_infos;
+static PyObject *__pyx_n_s_get_min_max_distances;
+static PyObject *__pyx_n_s_get_players;
+static PyObject *__pyx_n_s_has_self;
+static PyObject *__pyx_n_s_have_coords;
+static PyObject *__pyx_n_s_have_info;
+static PyObject *__pyx_n_s_have_latlong;
+static PyObject *__pyx_n_s_have_xy;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_u_i;
+static PyObject *__pyx_n_s_id;
+static PyObject *__pyx_n_s_ifrom;
+static PyObject *__pyx_n_s_ilink;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_info;
+static PyObject *__pyx_n_s_input_files;
+static PyObject *__pyx_n_s_inputfiles;
+static PyObject *__pyx_n_s_insert;
+static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_n_s_ito;
+static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_key;
+static PyObject *__pyx_n_u_km;
+static PyObject *__pyx_n_s_label;
+static PyObject *__pyx_n_s_lat;
+static PyObject *__pyx_kp_u_lat_long;
+static PyObject *__pyx_n_s_links;
+static PyObject *__pyx_n_s_links_2;
+static PyObject *__pyx_n_s_links_ifrom;
+static PyObject *__pyx_n_s_links_ito;
+static PyObject *__pyx_n_s_links_suscept;
+static PyObject *__pyx_n_s_links_weight;
+static PyObject *__pyx_n_s_load;
+static PyObject *__pyx_n_s_load_from_wards;
+static PyObject *__pyx_n_u_load_from_wards;
+static PyObject *__pyx_n_s_long;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_markup;
+static PyObject *__pyx_n_s_max_links;
+static PyObject *__pyx_n_s_max_nodes;
+static PyObject *__pyx_n_s_maxdist;
+static PyObject *__pyx_n_s_metawards_utils__network_wards;
+static PyObject *__pyx_n_s_mindist;
+static PyObject *__pyx_n_s_move_from_play_to_work;
+static PyObject *__pyx_n_u_move_from_play_to_work;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_need_deep_copy;
+static PyObject *__pyx_n_s_need_self;
+static PyObject *__pyx_n_s_network;
+static PyObject *__pyx_n_s_network_2;
+static PyObject *__pyx_n_s_nlinks;
+static PyObject *__pyx_n_s_nnodes;
+static PyObject *__pyx_n_s_nnodes_plus_one;
+static PyObject *__pyx_n_s_node_index;
+static PyObject *__pyx_n_s_nodes;
+static PyObject *__pyx_n_s_nodes_2;
+static PyObject *__pyx_n_s_nodes_begin_p;
+static PyObject *__pyx_n_s_nodes_begin_to;
+static PyObject *__pyx_n_s_nodes_bg_foi;
+static PyObject *__pyx_n_s_nodes_custom;
+static PyObject *__pyx_n_s_nodes_cutoff;
+static PyObject *__pyx_n_s_nodes_end_p;
+static PyObject *__pyx_n_s_nodes_end_to;
+static PyObject *__pyx_n_s_nodes_label;
+static PyObject *__pyx_n_s_nodes_play_suscept;
+static PyObject *__pyx_n_s_nodes_save_play_suscept;
+static PyObject *__pyx_n_s_nodes_scale_uv;
+static PyObject *__pyx_n_s_nodes_self_p;
+static PyObject *__pyx_n_s_nodes_self_w;
+static PyObject *__pyx_n_s_nodes_x;
+static PyObject *__pyx_n_s_nodes_y;
+static PyObject *__pyx_n_s_nplay;
+static PyObject *__pyx_n_s_nplayers;
+static PyObject *__pyx_n_s_nthreads;
+static PyObject *__pyx_n_s_num_players;
+static PyObject *__pyx_n_s_num_workers;
+static PyObject *__pyx_n_s_number;
+static PyObject *__pyx_kp_u_or_players;
+static PyObject *__pyx_n_s_original_index;
+static PyObject *__pyx_n_s_original_index_2;
+static PyObject *__pyx_n_s_p;
+static PyObject *__pyx_n_s_parameters;
+static PyObject *__pyx_n_s_params;
+static PyObject *__pyx_n_s_play;
+static PyObject *__pyx_n_s_play_begin;
+static PyObject *__pyx_n_s_play_dest;
+static PyObject *__pyx_n_s_play_ifrom;
+static PyObject *__pyx_n_s_play_ito;
+static PyObject *__pyx_n_s_play_population;
+static PyObject *__pyx_n_s_play_suscept;
+static PyObject *__pyx_n_s_play_weight;
+static PyObject *__pyx_n_s_play_weights;
+static PyObject *__pyx_n_s_player_total;
+static PyObject *__pyx_n_s_population;
+static PyObject *__pyx_n_s_pos_a;
+static PyObject *__pyx_n_s_pos_b;
+static PyObject *__pyx_n_s_pos_type;
+static PyObject *__pyx_n_s_present;
+static PyObject *__pyx_n_s_print;
+static PyObject *__pyx_n_s_profiler;
+static PyObject *__pyx_n_s_profiler_2;
+static PyObject *__pyx_n_s_progress;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_rescale_play_matrix;
+static PyObject *__pyx_n_u_rescale_play_matrix;
+static PyObject *__pyx_n_s_reset_everything;
+static PyObject *__pyx_n_u_reset_everything;
+static PyObject *__pyx_n_s_save_play_suscept;
+static PyObject *__pyx_n_s_save_to_wards;
+static PyObject *__pyx_n_u_save_to_wards;
+static PyObject *__pyx_n_s_scale_uv;
+static PyObject *__pyx_n_s_self_p;
+static PyObject *__pyx_n_s_self_w;
+static PyObject *__pyx_n_s_self_weight;
+static PyObject *__pyx_n_s_set_bg_foi;
+static PyObject *__pyx_n_s_set_custom;
+static PyObject *__pyx_n_s_set_cutoff;
+static PyObject *__pyx_n_s_set_disease;
+static PyObject *__pyx_n_s_set_info;
+static PyObject *__pyx_n_s_set_num_players;
+static PyObject *__pyx_n_s_set_position;
+static PyObject *__pyx_n_s_set_scale_uv;
+static PyObject *__pyx_n_s_silent;
+static PyObject *__pyx_kp_s_src_metawards_utils__network_war;
+static PyObject *__pyx_n_s_start;
+static PyObject *__pyx_n_s_stop;
+static PyObject *__pyx_n_s_suscept;
+static PyObject *__pyx_n_s_task;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_to_columns;
+static PyObject *__pyx_n_u_to_columns;
+static PyObject *__pyx_n_s_to_original;
+static PyObject *__pyx_n_s_total;
+static PyObject *__pyx_n_s_units;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_n_s_update_freq;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_values;
+static PyObject *__pyx_kp_u_versus;
+static PyObject *__pyx_kp_u_vs;
+static PyObject *__pyx_n_s_w;
+static PyObject *__pyx_kp_u_ward;
+static PyObject *__pyx_n_s_ward_2;
+static PyObject *__pyx_n_s_ward_3;
+static PyObject *__pyx_n_s_ward_bg_foi;
+static PyObject *__pyx_n_s_ward_custom;
+static PyObject *__pyx_n_s_ward_cutoff;
+static PyObject *__pyx_n_s_ward_scale_uv;
+static PyObject *__pyx_n_s_wardinfo;
+static PyObject *__pyx_n_s_wards;
+static PyObject *__pyx_n_s_wards_2;
+static PyObject *__pyx_n_s_weight;
+static PyObject *__pyx_kp_u_weight_disagreement;
+static PyObject *__pyx_kp_u_which_means_that_there_is_a_dat;
+static PyObject *__pyx_n_s_work_begin;
+static PyObject *__pyx_n_s_work_dest;
+static PyObject *__pyx_n_s_work_number;
+static PyObject *__pyx_n_s_work_population;
+static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_kp_u_x_y;
+static PyObject *__pyx_n_s_xy_coords;
+static PyObject *__pyx_n_s_y;
+static PyObject *__pyx_pf_9metawards_5utils_14_network_wards_load_from_wards(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_wards, PyObject *__pyx_v_params, PyObject *__pyx_v_disease, PyObject *__pyx_v_profiler, PyObject *__pyx_v_nthreads); /* proto */
+static PyObject *__pyx_pf_9metawards_5utils_14_network_wards_2save_to_wards(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_network, PyObject *__pyx_v_profiler, CYTHON_UNUSED PyObject *__pyx_v_nthreads); /* proto */
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_float_1_0;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_slice__14;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__16;
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_codeobj__17;
+static PyObject *__pyx_codeobj__19;
+/* Late includes */
+
+/* "metawards/utils/_network_wards.pyx":19
+ * 
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,             # <<<<<<<<<<<<<<
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9metawards_5utils_14_network_wards_1load_from_wards(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9metawards_5utils_14_network_wards_load_from_wards[] = "load_from_wards(wards: Wards, params: Parameters = None, disease: Disease = None, profiler: Profiler = None, nthreads: int = 1) -> Network\nBuild and return a Network from the passed set of Wards";
+static PyMethodDef __pyx_mdef_9metawards_5utils_14_network_wards_1load_from_wards = {"load_from_wards", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9metawards_5utils_14_network_wards_1load_from_wards, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9metawards_5utils_14_network_wards_load_from_wards};
+static PyObject *__pyx_pw_9metawards_5utils_14_network_wards_1load_from_wards(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_wards = 0;
+  PyObject *__pyx_v_params = 0;
+  PyObject *__pyx_v_disease = 0;
+  PyObject *__pyx_v_profiler = 0;
+  PyObject *__pyx_v_nthreads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("load_from_wards (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_wards,&__pyx_n_s_params,&__pyx_n_s_disease,&__pyx_n_s_profiler,&__pyx_n_s_nthreads,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    values[1] = ((PyObject *)Py_None);
+
+    /* "metawards/utils/_network_wards.pyx":20
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,
+ *                     disease: Disease = None,             # <<<<<<<<<<<<<<
+ *                     profiler: Profiler = None,
+ *                     nthreads: int = 1) -> Network:
+ */
+    values[2] = ((PyObject *)Py_None);
+
+    /* "metawards/utils/_network_wards.pyx":21
+ * def load_from_wards(wards: Wards, params: Parameters = None,
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,             # <<<<<<<<<<<<<<
+ *                     nthreads: int = 1) -> Network:
+ *     """Build and return a Network from the passed set of Wards"""
+ */
+    values[3] = ((PyObject *)Py_None);
+    values[4] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_wards)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_params);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_disease);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_profiler);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nthreads);
+          if (value) { values[4] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "load_from_wards") < 0)) __PYX_ERR(0, 19, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_wards = values[0];
+    __pyx_v_params = values[1];
+    __pyx_v_disease = values[2];
+    __pyx_v_profiler = values[3];
+    __pyx_v_nthreads = values[4];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("load_from_wards", 0, 1, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 19, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("metawards.utils._network_wards.load_from_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9metawards_5utils_14_network_wards_load_from_wards(__pyx_self, __pyx_v_wards, __pyx_v_params, __pyx_v_disease, __pyx_v_profiler, __pyx_v_nthreads);
+
+  /* "metawards/utils/_network_wards.pyx":19
+ * 
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,             # <<<<<<<<<<<<<<
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9metawards_5utils_14_network_wards_load_from_wards(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_wards, PyObject *__pyx_v_params, PyObject *__pyx_v_disease, PyObject *__pyx_v_profiler, PyObject *__pyx_v_nthreads) {
+  PyObject *__pyx_v_NullProfiler = NULL;
+  PyObject *__pyx_v_deepcopy = NULL;
+  PyObject *__pyx_v_InputFiles = NULL;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_nnodes_plus_one;
+  PyObject *__pyx_v_p = NULL;
+  PyObject *__pyx_v_columns = NULL;
+  PyObject *__pyx_v_nodes = NULL;
+  int __pyx_v_nlinks;
+  int __pyx_v_nplay;
+  int *__pyx_v_present;
+  int *__pyx_v_auto_assign;
+  int *__pyx_v_nplayers;
+  double *__pyx_v_player_total;
+  int *__pyx_v_pos_type;
+  double *__pyx_v_pos_a;
+  double *__pyx_v_pos_b;
+  double *__pyx_v_ward_scale_uv;
+  double *__pyx_v_ward_cutoff;
+  double *__pyx_v_ward_bg_foi;
+  int *__pyx_v_work_begin;
+  int *__pyx_v_work_dest;
+  int *__pyx_v_work_number;
+  int *__pyx_v_play_begin;
+  int *__pyx_v_play_dest;
+  double *__pyx_v_play_weights;
+  int *__pyx_v_nodes_label;
+  int *__pyx_v_nodes_begin_to;
+  int *__pyx_v_nodes_end_to;
+  int *__pyx_v_nodes_self_w;
+  double *__pyx_v_nodes_play_suscept;
+  double *__pyx_v_nodes_save_play_suscept;
+  double *__pyx_v_nodes_scale_uv;
+  double *__pyx_v_nodes_cutoff;
+  double *__pyx_v_nodes_bg_foi;
+  double *__pyx_v_nodes_custom;
+  double *__pyx_v_ward_custom;
+  int *__pyx_v_nodes_begin_p;
+  int *__pyx_v_nodes_end_p;
+  int *__pyx_v_nodes_self_p;
+  double *__pyx_v_nodes_x;
+  double *__pyx_v_nodes_y;
+  int __pyx_v_have_xy;
+  int __pyx_v_have_latlong;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_v_values = NULL;
+  PyObject *__pyx_v_info = NULL;
+  PyObject *__pyx_v_links = NULL;
+  int __pyx_v_ilink;
+  int *__pyx_v_links_ito;
+  int *__pyx_v_links_ifrom;
+  double *__pyx_v_links_suscept;
+  double *__pyx_v_links_weight;
+  int __pyx_v_has_self;
+  PyObject *__pyx_v_play = NULL;
+  int *__pyx_v_play_ifrom;
+  int *__pyx_v_play_ito;
+  double *__pyx_v_play_suscept;
+  double *__pyx_v_play_weight;
+  int __pyx_v_need_self;
+  PyObject *__pyx_v_network = NULL;
+  PyObject *__pyx_v_WardInfos = NULL;
+  PyObject *__pyx_v_calc_network_distance = NULL;
+  CYTHON_UNUSED PyObject *__pyx_v__mindist = NULL;
+  PyObject *__pyx_v_maxdist = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  PyObject *(*__pyx_t_15)(PyObject *);
+  Py_UCS4 __pyx_t_16;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("load_from_wards", 0);
+  __Pyx_INCREF(__pyx_v_params);
+  __Pyx_INCREF(__pyx_v_disease);
+  __Pyx_INCREF(__pyx_v_profiler);
+
+  /* "metawards/utils/_network_wards.pyx":24
+ *                     nthreads: int = 1) -> Network:
+ *     """Build and return a Network from the passed set of Wards"""
+ *     if profiler is None:             # <<<<<<<<<<<<<<
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()
+ */
+  __pyx_t_1 = (__pyx_v_profiler == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":25
+ *     """Build and return a Network from the passed set of Wards"""
+ *     if profiler is None:
+ *         from ._profiler import NullProfiler             # <<<<<<<<<<<<<<
+ *         profiler = NullProfiler()
+ * 
+ */
+    __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_n_s_NullProfiler);
+    __Pyx_GIVEREF(__pyx_n_s_NullProfiler);
+    PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_NullProfiler);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_profiler_2, __pyx_t_3, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_NullProfiler); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_NullProfiler = __pyx_t_3;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":26
+ *     if profiler is None:
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()             # <<<<<<<<<<<<<<
+ * 
+ *     if params is None:
+ */
+    __Pyx_INCREF(__pyx_v_NullProfiler);
+    __pyx_t_3 = __pyx_v_NullProfiler; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 26, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_profiler, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":24
+ *                     nthreads: int = 1) -> Network:
+ *     """Build and return a Network from the passed set of Wards"""
+ *     if profiler is None:             # <<<<<<<<<<<<<<
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":28
+ *         profiler = NullProfiler()
+ * 
+ *     if params is None:             # <<<<<<<<<<<<<<
+ *         params = Parameters.load()
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_params == Py_None);
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "metawards/utils/_network_wards.pyx":29
+ * 
+ *     if params is None:
+ *         params = Parameters.load()             # <<<<<<<<<<<<<<
+ * 
+ *         if disease is None:
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Parameters); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_load); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_params, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":31
+ *         params = Parameters.load()
+ * 
+ *         if disease is None:             # <<<<<<<<<<<<<<
+ *             disease = Disease.load()
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_disease == Py_None);
+    __pyx_t_2 = (__pyx_t_1 != 0);
+    if (__pyx_t_2) {
+
+      /* "metawards/utils/_network_wards.pyx":32
+ * 
+ *         if disease is None:
+ *             disease = Disease.load()             # <<<<<<<<<<<<<<
+ * 
+ *         params.set_disease(disease, silent=True)
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_Disease); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_load); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 32, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF_SET(__pyx_v_disease, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "metawards/utils/_network_wards.pyx":31
+ *         params = Parameters.load()
+ * 
+ *         if disease is None:             # <<<<<<<<<<<<<<
+ *             disease = Disease.load()
+ * 
+ */
+    }
+
+    /* "metawards/utils/_network_wards.pyx":34
+ *             disease = Disease.load()
+ * 
+ *         params.set_disease(disease, silent=True)             # <<<<<<<<<<<<<<
+ *     else:
+ *         if not isinstance(params, Parameters):
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_params, __pyx_n_s_set_disease); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v_disease);
+    __Pyx_GIVEREF(__pyx_v_disease);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_disease);
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_silent, Py_True) < 0) __PYX_ERR(0, 34, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 34, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":28
+ *         profiler = NullProfiler()
+ * 
+ *     if params is None:             # <<<<<<<<<<<<<<
+ *         params = Parameters.load()
+ * 
+ */
+    goto __pyx_L4;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":36
+ *         params.set_disease(disease, silent=True)
+ *     else:
+ *         if not isinstance(params, Parameters):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"The parameters must be Parameters!")
+ * 
+ */
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_Parameters); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_2 = PyObject_IsInstance(__pyx_v_params, __pyx_t_6); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 36, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_1 = ((!(__pyx_t_2 != 0)) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "metawards/utils/_network_wards.pyx":37
+ *     else:
+ *         if not isinstance(params, Parameters):
+ *             raise TypeError(f"The parameters must be Parameters!")             # <<<<<<<<<<<<<<
+ * 
+ *         from copy import deepcopy
+ */
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 37, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 37, __pyx_L1_error)
+
+      /* "metawards/utils/_network_wards.pyx":36
+ *         params.set_disease(disease, silent=True)
+ *     else:
+ *         if not isinstance(params, Parameters):             # <<<<<<<<<<<<<<
+ *             raise TypeError(f"The parameters must be Parameters!")
+ * 
+ */
+    }
+
+    /* "metawards/utils/_network_wards.pyx":39
+ *             raise TypeError(f"The parameters must be Parameters!")
+ * 
+ *         from copy import deepcopy             # <<<<<<<<<<<<<<
+ *         params = deepcopy(params)
+ * 
+ */
+    __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_n_s_deepcopy);
+    __Pyx_GIVEREF(__pyx_n_s_deepcopy);
+    PyList_SET_ITEM(__pyx_t_6, 0, __pyx_n_s_deepcopy);
+    __pyx_t_5 = __Pyx_Import(__pyx_n_s_copy, __pyx_t_6, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_ImportFrom(__pyx_t_5, __pyx_n_s_deepcopy); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_6);
+    __pyx_v_deepcopy = __pyx_t_6;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":40
+ * 
+ *         from copy import deepcopy
+ *         params = deepcopy(params)             # <<<<<<<<<<<<<<
+ * 
+ *         if disease is not None:
+ */
+    __Pyx_INCREF(__pyx_v_deepcopy);
+    __pyx_t_6 = __pyx_v_deepcopy; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_3, __pyx_v_params) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_params);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_params, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":42
+ *         params = deepcopy(params)
+ * 
+ *         if disease is not None:             # <<<<<<<<<<<<<<
+ *             params.set_disease(disease, silent=True)
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_disease != Py_None);
+    __pyx_t_2 = (__pyx_t_1 != 0);
+    if (__pyx_t_2) {
+
+      /* "metawards/utils/_network_wards.pyx":43
+ * 
+ *         if disease is not None:
+ *             params.set_disease(disease, silent=True)             # <<<<<<<<<<<<<<
+ * 
+ *     from .._inputfiles import InputFiles
+ */
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_params, __pyx_n_s_set_disease); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_v_disease);
+      __Pyx_GIVEREF(__pyx_v_disease);
+      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_disease);
+      __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_silent, Py_True) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "metawards/utils/_network_wards.pyx":42
+ *         params = deepcopy(params)
+ * 
+ *         if disease is not None:             # <<<<<<<<<<<<<<
+ *             params.set_disease(disease, silent=True)
+ * 
+ */
+    }
+  }
+  __pyx_L4:;
+
+  /* "metawards/utils/_network_wards.pyx":45
+ *             params.set_disease(disease, silent=True)
+ * 
+ *     from .._inputfiles import InputFiles             # <<<<<<<<<<<<<<
+ *     params.input_files = InputFiles()
+ * 
+ */
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_n_s_InputFiles);
+  __Pyx_GIVEREF(__pyx_n_s_InputFiles);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_InputFiles);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_inputfiles, __pyx_t_4, 2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_InputFiles); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_v_InputFiles = __pyx_t_4;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":46
+ * 
+ *     from .._inputfiles import InputFiles
+ *     params.input_files = InputFiles()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i = 0
+ */
+  __Pyx_INCREF(__pyx_v_InputFiles);
+  __pyx_t_4 = __pyx_v_InputFiles; __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_params, __pyx_n_s_input_files, __pyx_t_3) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":48
+ *     params.input_files = InputFiles()
+ * 
+ *     cdef int i = 0             # <<<<<<<<<<<<<<
+ *     cdef int j = 0
+ *     cdef int nnodes_plus_one = len(wards)
+ */
+  __pyx_v_i = 0;
+
+  /* "metawards/utils/_network_wards.pyx":49
+ * 
+ *     cdef int i = 0
+ *     cdef int j = 0             # <<<<<<<<<<<<<<
+ *     cdef int nnodes_plus_one = len(wards)
+ * 
+ */
+  __pyx_v_j = 0;
+
+  /* "metawards/utils/_network_wards.pyx":50
+ *     cdef int i = 0
+ *     cdef int j = 0
+ *     cdef int nnodes_plus_one = len(wards)             # <<<<<<<<<<<<<<
+ * 
+ *     if nnodes_plus_one == 0:
+ */
+  __pyx_t_7 = PyObject_Length(__pyx_v_wards); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 50, __pyx_L1_error)
+  __pyx_v_nnodes_plus_one = __pyx_t_7;
+
+  /* "metawards/utils/_network_wards.pyx":52
+ *     cdef int nnodes_plus_one = len(wards)
+ * 
+ *     if nnodes_plus_one == 0:             # <<<<<<<<<<<<<<
+ *         return Network()
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_nnodes_plus_one == 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":53
+ * 
+ *     if nnodes_plus_one == 0:
+ *         return Network()             # <<<<<<<<<<<<<<
+ * 
+ *     p = profiler.start("load_from_wards")
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Network); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 53, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "metawards/utils/_network_wards.pyx":52
+ *     cdef int nnodes_plus_one = len(wards)
+ * 
+ *     if nnodes_plus_one == 0:             # <<<<<<<<<<<<<<
+ *         return Network()
+ * 
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":55
+ *         return Network()
+ * 
+ *     p = profiler.start("load_from_wards")             # <<<<<<<<<<<<<<
+ * 
+ *     # The network is built directly from the columnar form of the
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_profiler, __pyx_n_s_start); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_n_u_load_from_wards) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_n_u_load_from_wards);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_p = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":59
+ *     # The network is built directly from the columnar form of the
+ *     # wards, which is much quicker than going via the Ward objects
+ *     p = p.start("to_columns")             # <<<<<<<<<<<<<<
+ *     columns = wards.to_columns()
+ *     p = p.stop()
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 59, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_n_u_to_columns) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_n_u_to_columns);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 59, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":60
+ *     # wards, which is much quicker than going via the Ward objects
+ *     p = p.start("to_columns")
+ *     columns = wards.to_columns()             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_to_columns); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_columns = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":61
+ *     p = p.start("to_columns")
+ *     columns = wards.to_columns()
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     nodes = Nodes(nnodes_plus_one)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":63
+ *     p = p.stop()
+ * 
+ *     nodes = Nodes(nnodes_plus_one)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nlinks = columns.work_begin[nnodes_plus_one]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Nodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nnodes_plus_one); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_nodes = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":65
+ *     nodes = Nodes(nnodes_plus_one)
+ * 
+ *     cdef int nlinks = columns.work_begin[nnodes_plus_one]             # <<<<<<<<<<<<<<
+ *     cdef int nplay = 0
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_work_begin); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_nnodes_plus_one, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_4); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_nlinks = __pyx_t_8;
+
+  /* "metawards/utils/_network_wards.pyx":66
+ * 
+ *     cdef int nlinks = columns.work_begin[nnodes_plus_one]
+ *     cdef int nplay = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * present = get_int_array_ptr(columns.present)
+ */
+  __pyx_v_nplay = 0;
+
+  /* "metawards/utils/_network_wards.pyx":68
+ *     cdef int nplay = 0
+ * 
+ *     cdef int * present = get_int_array_ptr(columns.present)             # <<<<<<<<<<<<<<
+ *     cdef int * auto_assign = get_int_array_ptr(columns.auto_assign)
+ *     cdef int * nplayers = get_int_array_ptr(columns.nplayers)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_present); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 68, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_present = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":69
+ * 
+ *     cdef int * present = get_int_array_ptr(columns.present)
+ *     cdef int * auto_assign = get_int_array_ptr(columns.auto_assign)             # <<<<<<<<<<<<<<
+ *     cdef int * nplayers = get_int_array_ptr(columns.nplayers)
+ *     cdef double * player_total = get_double_array_ptr(columns.player_total)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_auto_assign); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 69, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_auto_assign = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":70
+ *     cdef int * present = get_int_array_ptr(columns.present)
+ *     cdef int * auto_assign = get_int_array_ptr(columns.auto_assign)
+ *     cdef int * nplayers = get_int_array_ptr(columns.nplayers)             # <<<<<<<<<<<<<<
+ *     cdef double * player_total = get_double_array_ptr(columns.player_total)
+ *     cdef int * pos_type = get_int_array_ptr(columns.pos_type)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_nplayers); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nplayers = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":71
+ *     cdef int * auto_assign = get_int_array_ptr(columns.auto_assign)
+ *     cdef int * nplayers = get_int_array_ptr(columns.nplayers)
+ *     cdef double * player_total = get_double_array_ptr(columns.player_total)             # <<<<<<<<<<<<<<
+ *     cdef int * pos_type = get_int_array_ptr(columns.pos_type)
+ *     cdef double * pos_a = get_double_array_ptr(columns.pos_a)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_player_total); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_player_total = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":72
+ *     cdef int * nplayers = get_int_array_ptr(columns.nplayers)
+ *     cdef double * player_total = get_double_array_ptr(columns.player_total)
+ *     cdef int * pos_type = get_int_array_ptr(columns.pos_type)             # <<<<<<<<<<<<<<
+ *     cdef double * pos_a = get_double_array_ptr(columns.pos_a)
+ *     cdef double * pos_b = get_double_array_ptr(columns.pos_b)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_pos_type); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_pos_type = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":73
+ *     cdef double * player_total = get_double_array_ptr(columns.player_total)
+ *     cdef int * pos_type = get_int_array_ptr(columns.pos_type)
+ *     cdef double * pos_a = get_double_array_ptr(columns.pos_a)             # <<<<<<<<<<<<<<
+ *     cdef double * pos_b = get_double_array_ptr(columns.pos_b)
+ *     cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_pos_a); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_pos_a = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":74
+ *     cdef int * pos_type = get_int_array_ptr(columns.pos_type)
+ *     cdef double * pos_a = get_double_array_ptr(columns.pos_a)
+ *     cdef double * pos_b = get_double_array_ptr(columns.pos_b)             # <<<<<<<<<<<<<<
+ *     cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)
+ *     cdef double * ward_cutoff = get_double_array_ptr(columns.cutoff)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_pos_b); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_pos_b = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":75
+ *     cdef double * pos_a = get_double_array_ptr(columns.pos_a)
+ *     cdef double * pos_b = get_double_array_ptr(columns.pos_b)
+ *     cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)             # <<<<<<<<<<<<<<
+ *     cdef double * ward_cutoff = get_double_array_ptr(columns.cutoff)
+ *     cdef double * ward_bg_foi = get_double_array_ptr(columns.bg_foi)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_scale_uv); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_ward_scale_uv = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":76
+ *     cdef double * pos_b = get_double_array_ptr(columns.pos_b)
+ *     cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)
+ *     cdef double * ward_cutoff = get_double_array_ptr(columns.cutoff)             # <<<<<<<<<<<<<<
+ *     cdef double * ward_bg_foi = get_double_array_ptr(columns.bg_foi)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_cutoff); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_ward_cutoff = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":77
+ *     cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)
+ *     cdef double * ward_cutoff = get_double_array_ptr(columns.cutoff)
+ *     cdef double * ward_bg_foi = get_double_array_ptr(columns.bg_foi)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * work_begin = get_int_array_ptr(columns.work_begin)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_bg_foi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_ward_bg_foi = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":79
+ *     cdef double * ward_bg_foi = get_double_array_ptr(columns.bg_foi)
+ * 
+ *     cdef int * work_begin = get_int_array_ptr(columns.work_begin)             # <<<<<<<<<<<<<<
+ *     cdef int * work_dest = NULL
+ *     cdef int * work_number = NULL
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_work_begin); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_work_begin = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":80
+ * 
+ *     cdef int * work_begin = get_int_array_ptr(columns.work_begin)
+ *     cdef int * work_dest = NULL             # <<<<<<<<<<<<<<
+ *     cdef int * work_number = NULL
+ * 
+ */
+  __pyx_v_work_dest = NULL;
+
+  /* "metawards/utils/_network_wards.pyx":81
+ *     cdef int * work_begin = get_int_array_ptr(columns.work_begin)
+ *     cdef int * work_dest = NULL
+ *     cdef int * work_number = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * play_begin = get_int_array_ptr(columns.play_begin)
+ */
+  __pyx_v_work_number = NULL;
+
+  /* "metawards/utils/_network_wards.pyx":83
+ *     cdef int * work_number = NULL
+ * 
+ *     cdef int * play_begin = get_int_array_ptr(columns.play_begin)             # <<<<<<<<<<<<<<
+ *     cdef int * play_dest = NULL
+ *     cdef double * play_weights = NULL
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_play_begin); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_play_begin = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":84
+ * 
+ *     cdef int * play_begin = get_int_array_ptr(columns.play_begin)
+ *     cdef int * play_dest = NULL             # <<<<<<<<<<<<<<
+ *     cdef double * play_weights = NULL
+ * 
+ */
+  __pyx_v_play_dest = NULL;
+
+  /* "metawards/utils/_network_wards.pyx":85
+ *     cdef int * play_begin = get_int_array_ptr(columns.play_begin)
+ *     cdef int * play_dest = NULL
+ *     cdef double * play_weights = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     if nlinks > 0:
+ */
+  __pyx_v_play_weights = NULL;
+
+  /* "metawards/utils/_network_wards.pyx":87
+ *     cdef double * play_weights = NULL
+ * 
+ *     if nlinks > 0:             # <<<<<<<<<<<<<<
+ *         work_dest = get_int_array_ptr(columns.work_dest)
+ *         work_number = get_int_array_ptr(columns.work_number)
+ */
+  __pyx_t_2 = ((__pyx_v_nlinks > 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":88
+ * 
+ *     if nlinks > 0:
+ *         work_dest = get_int_array_ptr(columns.work_dest)             # <<<<<<<<<<<<<<
+ *         work_number = get_int_array_ptr(columns.work_number)
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_work_dest); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_work_dest = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":89
+ *     if nlinks > 0:
+ *         work_dest = get_int_array_ptr(columns.work_dest)
+ *         work_number = get_int_array_ptr(columns.work_number)             # <<<<<<<<<<<<<<
+ * 
+ *     if play_begin[nnodes_plus_one] > 0:
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_work_number); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_work_number = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":87
+ *     cdef double * play_weights = NULL
+ * 
+ *     if nlinks > 0:             # <<<<<<<<<<<<<<
+ *         work_dest = get_int_array_ptr(columns.work_dest)
+ *         work_number = get_int_array_ptr(columns.work_number)
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":91
+ *         work_number = get_int_array_ptr(columns.work_number)
+ * 
+ *     if play_begin[nnodes_plus_one] > 0:             # <<<<<<<<<<<<<<
+ *         play_dest = get_int_array_ptr(columns.play_dest)
+ *         play_weights = get_double_array_ptr(columns.play_weight)
+ */
+  __pyx_t_2 = (((__pyx_v_play_begin[__pyx_v_nnodes_plus_one]) > 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":92
+ * 
+ *     if play_begin[nnodes_plus_one] > 0:
+ *         play_dest = get_int_array_ptr(columns.play_dest)             # <<<<<<<<<<<<<<
+ *         play_weights = get_double_array_ptr(columns.play_weight)
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_play_dest); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_play_dest = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":93
+ *     if play_begin[nnodes_plus_one] > 0:
+ *         play_dest = get_int_array_ptr(columns.play_dest)
+ *         play_weights = get_double_array_ptr(columns.play_weight)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_play_weight); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_play_weights = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":91
+ *         work_number = get_int_array_ptr(columns.work_number)
+ * 
+ *     if play_begin[nnodes_plus_one] > 0:             # <<<<<<<<<<<<<<
+ *         play_dest = get_int_array_ptr(columns.play_dest)
+ *         play_weights = get_double_array_ptr(columns.play_weight)
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":95
+ *         play_weights = get_double_array_ptr(columns.play_weight)
+ * 
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * nodes_begin_to = get_int_array_ptr(nodes.begin_to)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_label); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_label = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":97
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)
+ * 
+ *     cdef int * nodes_begin_to = get_int_array_ptr(nodes.begin_to)             # <<<<<<<<<<<<<<
+ *     cdef int * nodes_end_to = get_int_array_ptr(nodes.end_to)
+ *     cdef int * nodes_self_w = get_int_array_ptr(nodes.self_w)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_begin_to); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_begin_to = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":98
+ * 
+ *     cdef int * nodes_begin_to = get_int_array_ptr(nodes.begin_to)
+ *     cdef int * nodes_end_to = get_int_array_ptr(nodes.end_to)             # <<<<<<<<<<<<<<
+ *     cdef int * nodes_self_w = get_int_array_ptr(nodes.self_w)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_end_to); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_end_to = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":99
+ *     cdef int * nodes_begin_to = get_int_array_ptr(nodes.begin_to)
+ *     cdef int * nodes_end_to = get_int_array_ptr(nodes.end_to)
+ *     cdef int * nodes_self_w = get_int_array_ptr(nodes.self_w)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_play_suscept = get_double_array_ptr(nodes.play_suscept)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_self_w); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_self_w = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":101
+ *     cdef int * nodes_self_w = get_int_array_ptr(nodes.self_w)
+ * 
+ *     cdef double * nodes_play_suscept = get_double_array_ptr(nodes.play_suscept)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(
+ *                                                 nodes.save_play_suscept)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_play_suscept); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_play_suscept = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":103
+ *     cdef double * nodes_play_suscept = get_double_array_ptr(nodes.play_suscept)
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(
+ *                                                 nodes.save_play_suscept)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_save_play_suscept); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "metawards/utils/_network_wards.pyx":102
+ * 
+ *     cdef double * nodes_play_suscept = get_double_array_ptr(nodes.play_suscept)
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(             # <<<<<<<<<<<<<<
+ *                                                 nodes.save_play_suscept)
+ * 
+ */
+  __pyx_v_nodes_save_play_suscept = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":105
+ *                                                 nodes.save_play_suscept)
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_scale_uv); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_scale_uv = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":106
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_cutoff); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_cutoff = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":107
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_custom
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_bg_foi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_bg_foi = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":112
+ *     cdef double * ward_custom
+ * 
+ *     cdef int * nodes_begin_p = get_int_array_ptr(nodes.begin_p)             # <<<<<<<<<<<<<<
+ *     cdef int * nodes_end_p = get_int_array_ptr(nodes.end_p)
+ *     cdef int * nodes_self_p = get_int_array_ptr(nodes.self_p)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_begin_p); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 112, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_begin_p = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":113
+ * 
+ *     cdef int * nodes_begin_p = get_int_array_ptr(nodes.begin_p)
+ *     cdef int * nodes_end_p = get_int_array_ptr(nodes.end_p)             # <<<<<<<<<<<<<<
+ *     cdef int * nodes_self_p = get_int_array_ptr(nodes.self_p)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_end_p); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_end_p = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":114
+ *     cdef int * nodes_begin_p = get_int_array_ptr(nodes.begin_p)
+ *     cdef int * nodes_end_p = get_int_array_ptr(nodes.end_p)
+ *     cdef int * nodes_self_p = get_int_array_ptr(nodes.self_p)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_self_p); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_self_p = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":116
+ *     cdef int * nodes_self_p = get_int_array_ptr(nodes.self_p)
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_x = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":117
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int have_xy = 0
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_y); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_y = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":119
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)
+ * 
+ *     cdef int have_xy = 0             # <<<<<<<<<<<<<<
+ *     cdef int have_latlong = 0
+ * 
+ */
+  __pyx_v_have_xy = 0;
+
+  /* "metawards/utils/_network_wards.pyx":120
+ * 
+ *     cdef int have_xy = 0
+ *     cdef int have_latlong = 0             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("convert nodes")
+ */
+  __pyx_v_have_latlong = 0;
+
+  /* "metawards/utils/_network_wards.pyx":122
+ *     cdef int have_latlong = 0
+ * 
+ *     p = p.start("convert nodes")             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_kp_u_convert_nodes) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_convert_nodes);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":124
+ *     p = p.start("convert nodes")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "metawards/utils/_network_wards.pyx":125
+ * 
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             if present[i] == 0:
+ *                 continue
+ */
+        __pyx_t_8 = __pyx_v_nnodes_plus_one;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 1; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "metawards/utils/_network_wards.pyx":126
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_2 = (((__pyx_v_present[__pyx_v_i]) == 0) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":127
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             if pos_type[i] == 1:
+ */
+            goto __pyx_L14_continue;
+
+            /* "metawards/utils/_network_wards.pyx":126
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":129
+ *                 continue
+ * 
+ *             if pos_type[i] == 1:             # <<<<<<<<<<<<<<
+ *                 have_xy = 1
+ *                 nodes_x[i] = pos_a[i]
+ */
+          __pyx_t_2 = (((__pyx_v_pos_type[__pyx_v_i]) == 1) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":130
+ * 
+ *             if pos_type[i] == 1:
+ *                 have_xy = 1             # <<<<<<<<<<<<<<
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]
+ */
+            __pyx_v_have_xy = 1;
+
+            /* "metawards/utils/_network_wards.pyx":131
+ *             if pos_type[i] == 1:
+ *                 have_xy = 1
+ *                 nodes_x[i] = pos_a[i]             # <<<<<<<<<<<<<<
+ *                 nodes_y[i] = pos_b[i]
+ *             elif pos_type[i] == 2:
+ */
+            (__pyx_v_nodes_x[__pyx_v_i]) = (__pyx_v_pos_a[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":132
+ *                 have_xy = 1
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]             # <<<<<<<<<<<<<<
+ *             elif pos_type[i] == 2:
+ *                 have_latlong = 1
+ */
+            (__pyx_v_nodes_y[__pyx_v_i]) = (__pyx_v_pos_b[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":129
+ *                 continue
+ * 
+ *             if pos_type[i] == 1:             # <<<<<<<<<<<<<<
+ *                 have_xy = 1
+ *                 nodes_x[i] = pos_a[i]
+ */
+            goto __pyx_L17;
+          }
+
+          /* "metawards/utils/_network_wards.pyx":133
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]
+ *             elif pos_type[i] == 2:             # <<<<<<<<<<<<<<
+ *                 have_latlong = 1
+ *                 nodes_x[i] = pos_a[i]
+ */
+          __pyx_t_2 = (((__pyx_v_pos_type[__pyx_v_i]) == 2) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":134
+ *                 nodes_y[i] = pos_b[i]
+ *             elif pos_type[i] == 2:
+ *                 have_latlong = 1             # <<<<<<<<<<<<<<
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]
+ */
+            __pyx_v_have_latlong = 1;
+
+            /* "metawards/utils/_network_wards.pyx":135
+ *             elif pos_type[i] == 2:
+ *                 have_latlong = 1
+ *                 nodes_x[i] = pos_a[i]             # <<<<<<<<<<<<<<
+ *                 nodes_y[i] = pos_b[i]
+ * 
+ */
+            (__pyx_v_nodes_x[__pyx_v_i]) = (__pyx_v_pos_a[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":136
+ *                 have_latlong = 1
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_label[i] = i
+ */
+            (__pyx_v_nodes_y[__pyx_v_i]) = (__pyx_v_pos_b[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":133
+ *                 nodes_x[i] = pos_a[i]
+ *                 nodes_y[i] = pos_b[i]
+ *             elif pos_type[i] == 2:             # <<<<<<<<<<<<<<
+ *                 have_latlong = 1
+ *                 nodes_x[i] = pos_a[i]
+ */
+          }
+          __pyx_L17:;
+
+          /* "metawards/utils/_network_wards.pyx":138
+ *                 nodes_y[i] = pos_b[i]
+ * 
+ *             nodes_label[i] = i             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_play_suscept[i] = <double>(nplayers[i])
+ */
+          (__pyx_v_nodes_label[__pyx_v_i]) = __pyx_v_i;
+
+          /* "metawards/utils/_network_wards.pyx":140
+ *             nodes_label[i] = i
+ * 
+ *             nodes_play_suscept[i] = <double>(nplayers[i])             # <<<<<<<<<<<<<<
+ *             nodes_save_play_suscept[i] = nodes_play_suscept[i]
+ * 
+ */
+          (__pyx_v_nodes_play_suscept[__pyx_v_i]) = ((double)(__pyx_v_nplayers[__pyx_v_i]));
+
+          /* "metawards/utils/_network_wards.pyx":141
+ * 
+ *             nodes_play_suscept[i] = <double>(nplayers[i])
+ *             nodes_save_play_suscept[i] = nodes_play_suscept[i]             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_scale_uv[i] = ward_scale_uv[i]
+ */
+          (__pyx_v_nodes_save_play_suscept[__pyx_v_i]) = (__pyx_v_nodes_play_suscept[__pyx_v_i]);
+
+          /* "metawards/utils/_network_wards.pyx":143
+ *             nodes_save_play_suscept[i] = nodes_play_suscept[i]
+ * 
+ *             nodes_scale_uv[i] = ward_scale_uv[i]             # <<<<<<<<<<<<<<
+ *             nodes_cutoff[i] = ward_cutoff[i]
+ *             nodes_bg_foi[i] = ward_bg_foi[i]
+ */
+          (__pyx_v_nodes_scale_uv[__pyx_v_i]) = (__pyx_v_ward_scale_uv[__pyx_v_i]);
+
+          /* "metawards/utils/_network_wards.pyx":144
+ * 
+ *             nodes_scale_uv[i] = ward_scale_uv[i]
+ *             nodes_cutoff[i] = ward_cutoff[i]             # <<<<<<<<<<<<<<
+ *             nodes_bg_foi[i] = ward_bg_foi[i]
+ * 
+ */
+          (__pyx_v_nodes_cutoff[__pyx_v_i]) = (__pyx_v_ward_cutoff[__pyx_v_i]);
+
+          /* "metawards/utils/_network_wards.pyx":145
+ *             nodes_scale_uv[i] = ward_scale_uv[i]
+ *             nodes_cutoff[i] = ward_cutoff[i]
+ *             nodes_bg_foi[i] = ward_bg_foi[i]             # <<<<<<<<<<<<<<
+ * 
+ *     if have_xy and have_latlong:
+ */
+          (__pyx_v_nodes_bg_foi[__pyx_v_i]) = (__pyx_v_ward_bg_foi[__pyx_v_i]);
+          __pyx_L14_continue:;
+        }
+      }
+
+      /* "metawards/utils/_network_wards.pyx":124
+ *     p = p.start("convert nodes")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L13;
+        }
+        __pyx_L13:;
+      }
+  }
+
+  /* "metawards/utils/_network_wards.pyx":147
+ *             nodes_bg_foi[i] = ward_bg_foi[i]
+ * 
+ *     if have_xy and have_latlong:             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ */
+  __pyx_t_1 = (__pyx_v_have_xy != 0);
+  if (__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L19_bool_binop_done;
+  }
+  __pyx_t_1 = (__pyx_v_have_latlong != 0);
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L19_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "metawards/utils/_network_wards.pyx":148
+ * 
+ *     if have_xy and have_latlong:
+ *         raise ValueError(             # <<<<<<<<<<<<<<
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ *     elif have_xy:
+ */
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 148, __pyx_L1_error)
+
+    /* "metawards/utils/_network_wards.pyx":147
+ *             nodes_bg_foi[i] = ward_bg_foi[i]
+ * 
+ *     if have_xy and have_latlong:             # <<<<<<<<<<<<<<
+ *         raise ValueError(
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":150
+ *         raise ValueError(
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ *     elif have_xy:             # <<<<<<<<<<<<<<
+ *         nodes.coordinates = "x/y"
+ *     elif have_latlong:
+ */
+  __pyx_t_2 = (__pyx_v_have_xy != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":151
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ *     elif have_xy:
+ *         nodes.coordinates = "x/y"             # <<<<<<<<<<<<<<
+ *     elif have_latlong:
+ *         nodes.coordinates = "lat/long"
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_nodes, __pyx_n_s_coordinates, __pyx_kp_u_x_y) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
+
+    /* "metawards/utils/_network_wards.pyx":150
+ *         raise ValueError(
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ *     elif have_xy:             # <<<<<<<<<<<<<<
+ *         nodes.coordinates = "x/y"
+ *     elif have_latlong:
+ */
+    goto __pyx_L18;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":152
+ *     elif have_xy:
+ *         nodes.coordinates = "x/y"
+ *     elif have_latlong:             # <<<<<<<<<<<<<<
+ *         nodes.coordinates = "lat/long"
+ *     else:
+ */
+  __pyx_t_2 = (__pyx_v_have_latlong != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":153
+ *         nodes.coordinates = "x/y"
+ *     elif have_latlong:
+ *         nodes.coordinates = "lat/long"             # <<<<<<<<<<<<<<
+ *     else:
+ *         nodes.coordinates = None
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_nodes, __pyx_n_s_coordinates, __pyx_kp_u_lat_long) < 0) __PYX_ERR(0, 153, __pyx_L1_error)
+
+    /* "metawards/utils/_network_wards.pyx":152
+ *     elif have_xy:
+ *         nodes.coordinates = "x/y"
+ *     elif have_latlong:             # <<<<<<<<<<<<<<
+ *         nodes.coordinates = "lat/long"
+ *     else:
+ */
+    goto __pyx_L18;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":155
+ *         nodes.coordinates = "lat/long"
+ *     else:
+ *         nodes.coordinates = None             # <<<<<<<<<<<<<<
+ * 
+ *     for key, values in columns.custom.items():
+ */
+  /*else*/ {
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_nodes, __pyx_n_s_coordinates, Py_None) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
+  }
+  __pyx_L18:;
+
+  /* "metawards/utils/_network_wards.pyx":157
+ *         nodes.coordinates = None
+ * 
+ *     for key, values in columns.custom.items():             # <<<<<<<<<<<<<<
+ *         nodes_custom = get_double_array_ptr(nodes.get_custom(key))
+ *         ward_custom = get_double_array_ptr(values)
+ */
+  __pyx_t_7 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_custom); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(0, 157, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_dict_iterator(__pyx_t_3, 0, __pyx_n_s_items, (&__pyx_t_11), (&__pyx_t_8)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_XDECREF(__pyx_t_4);
+  __pyx_t_4 = __pyx_t_6;
+  __pyx_t_6 = 0;
+  while (1) {
+    __pyx_t_9 = __Pyx_dict_iter_next(__pyx_t_4, __pyx_t_11, &__pyx_t_7, &__pyx_t_6, &__pyx_t_3, NULL, __pyx_t_8);
+    if (unlikely(__pyx_t_9 == 0)) break;
+    if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(0, 157, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_values, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":158
+ * 
+ *     for key, values in columns.custom.items():
+ *         nodes_custom = get_double_array_ptr(nodes.get_custom(key))             # <<<<<<<<<<<<<<
+ *         ward_custom = get_double_array_ptr(values)
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_get_custom); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_5, __pyx_v_key) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_key);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_v_nodes_custom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":159
+ *     for key, values in columns.custom.items():
+ *         nodes_custom = get_double_array_ptr(nodes.get_custom(key))
+ *         ward_custom = get_double_array_ptr(values)             # <<<<<<<<<<<<<<
+ * 
+ *         with nogil:
+ */
+    __pyx_v_ward_custom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_v_values);
+
+    /* "metawards/utils/_network_wards.pyx":161
+ *         ward_custom = get_double_array_ptr(values)
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(1, nnodes_plus_one):
+ *                 # unset values are NaN, and NaN != NaN
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "metawards/utils/_network_wards.pyx":162
+ * 
+ *         with nogil:
+ *             for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *                 # unset values are NaN, and NaN != NaN
+ *                 if present[i] and ward_custom[i] == ward_custom[i]:
+ */
+          __pyx_t_9 = __pyx_v_nnodes_plus_one;
+          __pyx_t_10 = __pyx_t_9;
+          for (__pyx_t_12 = 1; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+            __pyx_v_i = __pyx_t_12;
+
+            /* "metawards/utils/_network_wards.pyx":164
+ *             for i in range(1, nnodes_plus_one):
+ *                 # unset values are NaN, and NaN != NaN
+ *                 if present[i] and ward_custom[i] == ward_custom[i]:             # <<<<<<<<<<<<<<
+ *                     nodes_custom[i] = ward_custom[i]
+ * 
+ */
+            __pyx_t_1 = ((__pyx_v_present[__pyx_v_i]) != 0);
+            if (__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L31_bool_binop_done;
+            }
+            __pyx_t_1 = (((__pyx_v_ward_custom[__pyx_v_i]) == (__pyx_v_ward_custom[__pyx_v_i])) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L31_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":165
+ *                 # unset values are NaN, and NaN != NaN
+ *                 if present[i] and ward_custom[i] == ward_custom[i]:
+ *                     nodes_custom[i] = ward_custom[i]             # <<<<<<<<<<<<<<
+ * 
+ *     from copy import deepcopy
+ */
+              (__pyx_v_nodes_custom[__pyx_v_i]) = (__pyx_v_ward_custom[__pyx_v_i]);
+
+              /* "metawards/utils/_network_wards.pyx":164
+ *             for i in range(1, nnodes_plus_one):
+ *                 # unset values are NaN, and NaN != NaN
+ *                 if present[i] and ward_custom[i] == ward_custom[i]:             # <<<<<<<<<<<<<<
+ *                     nodes_custom[i] = ward_custom[i]
+ * 
+ */
+            }
+          }
+        }
+
+        /* "metawards/utils/_network_wards.pyx":161
+ *         ward_custom = get_double_array_ptr(values)
+ * 
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(1, nnodes_plus_one):
+ *                 # unset values are NaN, and NaN != NaN
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L27;
+          }
+          __pyx_L27:;
+        }
+    }
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":167
+ *                     nodes_custom[i] = ward_custom[i]
+ * 
+ *     from copy import deepcopy             # <<<<<<<<<<<<<<
+ *     info = deepcopy(columns.get_infos())
+ * 
+ */
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_n_s_deepcopy);
+  __Pyx_GIVEREF(__pyx_n_s_deepcopy);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_deepcopy);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_copy, __pyx_t_4, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_deepcopy); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_t_4);
+  __Pyx_XDECREF_SET(__pyx_v_deepcopy, __pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":168
+ * 
+ *     from copy import deepcopy
+ *     info = deepcopy(columns.get_infos())             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_columns, __pyx_n_s_get_infos); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_INCREF(__pyx_v_deepcopy);
+  __pyx_t_6 = __pyx_v_deepcopy; __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_info = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":170
+ *     info = deepcopy(columns.get_infos())
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("convert work links")
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":172
+ *     p = p.stop()
+ * 
+ *     p = p.start("convert work links")             # <<<<<<<<<<<<<<
+ * 
+ *     links = Links(nlinks+1)
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_kp_u_convert_work_links) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_kp_u_convert_work_links);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":174
+ *     p = p.start("convert work links")
+ * 
+ *     links = Links(nlinks+1)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int ilink = 0
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_Links); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_nlinks + 1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_links = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":176
+ *     links = Links(nlinks+1)
+ * 
+ *     cdef int ilink = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)
+ */
+  __pyx_v_ilink = 0;
+
+  /* "metawards/utils/_network_wards.pyx":178
+ *     cdef int ilink = 0
+ * 
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)             # <<<<<<<<<<<<<<
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+ *     cdef double * links_suscept = get_double_array_ptr(links.suscept)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_ito); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_links_ito = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":179
+ * 
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)             # <<<<<<<<<<<<<<
+ *     cdef double * links_suscept = get_double_array_ptr(links.suscept)
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_ifrom); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_links_ifrom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":180
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+ *     cdef double * links_suscept = get_double_array_ptr(links.suscept)             # <<<<<<<<<<<<<<
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_suscept); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_links_suscept = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":181
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+ *     cdef double * links_suscept = get_double_array_ptr(links.suscept)
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_weight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_links_weight = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":183
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if work_begin[i+1] == work_begin[i]:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "metawards/utils/_network_wards.pyx":184
+ * 
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             if work_begin[i+1] == work_begin[i]:
+ *                 continue
+ */
+        __pyx_t_8 = __pyx_v_nnodes_plus_one;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 1; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "metawards/utils/_network_wards.pyx":185
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if work_begin[i+1] == work_begin[i]:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_2 = (((__pyx_v_work_begin[(__pyx_v_i + 1)]) == (__pyx_v_work_begin[__pyx_v_i])) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":186
+ *         for i in range(1, nnodes_plus_one):
+ *             if work_begin[i+1] == work_begin[i]:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_begin_to[i] = work_begin[i] + 1
+ */
+            goto __pyx_L36_continue;
+
+            /* "metawards/utils/_network_wards.pyx":185
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if work_begin[i+1] == work_begin[i]:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":188
+ *                 continue
+ * 
+ *             nodes_begin_to[i] = work_begin[i] + 1             # <<<<<<<<<<<<<<
+ *             nodes_end_to[i] = work_begin[i+1] + 1
+ * 
+ */
+          (__pyx_v_nodes_begin_to[__pyx_v_i]) = ((__pyx_v_work_begin[__pyx_v_i]) + 1);
+
+          /* "metawards/utils/_network_wards.pyx":189
+ * 
+ *             nodes_begin_to[i] = work_begin[i] + 1
+ *             nodes_end_to[i] = work_begin[i+1] + 1             # <<<<<<<<<<<<<<
+ * 
+ *             for j in range(work_begin[i], work_begin[i+1]):
+ */
+          (__pyx_v_nodes_end_to[__pyx_v_i]) = ((__pyx_v_work_begin[(__pyx_v_i + 1)]) + 1);
+
+          /* "metawards/utils/_network_wards.pyx":191
+ *             nodes_end_to[i] = work_begin[i+1] + 1
+ * 
+ *             for j in range(work_begin[i], work_begin[i+1]):             # <<<<<<<<<<<<<<
+ *                 ilink = j + 1
+ *                 links_ifrom[ilink] = i
+ */
+          __pyx_t_12 = (__pyx_v_work_begin[(__pyx_v_i + 1)]);
+          __pyx_t_13 = __pyx_t_12;
+          for (__pyx_t_14 = (__pyx_v_work_begin[__pyx_v_i]); __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+            __pyx_v_j = __pyx_t_14;
+
+            /* "metawards/utils/_network_wards.pyx":192
+ * 
+ *             for j in range(work_begin[i], work_begin[i+1]):
+ *                 ilink = j + 1             # <<<<<<<<<<<<<<
+ *                 links_ifrom[ilink] = i
+ *                 links_ito[ilink] = work_dest[j]
+ */
+            __pyx_v_ilink = (__pyx_v_j + 1);
+
+            /* "metawards/utils/_network_wards.pyx":193
+ *             for j in range(work_begin[i], work_begin[i+1]):
+ *                 ilink = j + 1
+ *                 links_ifrom[ilink] = i             # <<<<<<<<<<<<<<
+ *                 links_ito[ilink] = work_dest[j]
+ *                 links_weight[ilink] = <double>(work_number[j])
+ */
+            (__pyx_v_links_ifrom[__pyx_v_ilink]) = __pyx_v_i;
+
+            /* "metawards/utils/_network_wards.pyx":194
+ *                 ilink = j + 1
+ *                 links_ifrom[ilink] = i
+ *                 links_ito[ilink] = work_dest[j]             # <<<<<<<<<<<<<<
+ *                 links_weight[ilink] = <double>(work_number[j])
+ *                 links_suscept[ilink] = links_weight[ilink]
+ */
+            (__pyx_v_links_ito[__pyx_v_ilink]) = (__pyx_v_work_dest[__pyx_v_j]);
+
+            /* "metawards/utils/_network_wards.pyx":195
+ *                 links_ifrom[ilink] = i
+ *                 links_ito[ilink] = work_dest[j]
+ *                 links_weight[ilink] = <double>(work_number[j])             # <<<<<<<<<<<<<<
+ *                 links_suscept[ilink] = links_weight[ilink]
+ * 
+ */
+            (__pyx_v_links_weight[__pyx_v_ilink]) = ((double)(__pyx_v_work_number[__pyx_v_j]));
+
+            /* "metawards/utils/_network_wards.pyx":196
+ *                 links_ito[ilink] = work_dest[j]
+ *                 links_weight[ilink] = <double>(work_number[j])
+ *                 links_suscept[ilink] = links_weight[ilink]             # <<<<<<<<<<<<<<
+ * 
+ *                 if i == work_dest[j]:
+ */
+            (__pyx_v_links_suscept[__pyx_v_ilink]) = (__pyx_v_links_weight[__pyx_v_ilink]);
+
+            /* "metawards/utils/_network_wards.pyx":198
+ *                 links_suscept[ilink] = links_weight[ilink]
+ * 
+ *                 if i == work_dest[j]:             # <<<<<<<<<<<<<<
+ *                     # this is the self-link
+ *                     nodes_self_w[i] = ilink
+ */
+            __pyx_t_2 = ((__pyx_v_i == (__pyx_v_work_dest[__pyx_v_j])) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":200
+ *                 if i == work_dest[j]:
+ *                     # this is the self-link
+ *                     nodes_self_w[i] = ilink             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+              (__pyx_v_nodes_self_w[__pyx_v_i]) = __pyx_v_ilink;
+
+              /* "metawards/utils/_network_wards.pyx":198
+ *                 links_suscept[ilink] = links_weight[ilink]
+ * 
+ *                 if i == work_dest[j]:             # <<<<<<<<<<<<<<
+ *                     # this is the self-link
+ *                     nodes_self_w[i] = ilink
+ */
+            }
+          }
+          __pyx_L36_continue:;
+        }
+      }
+
+      /* "metawards/utils/_network_wards.pyx":183
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if work_begin[i+1] == work_begin[i]:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L35;
+        }
+        __pyx_L35:;
+      }
+  }
+
+  /* "metawards/utils/_network_wards.pyx":202
+ *                     nodes_self_w[i] = ilink
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("convert play links")
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":204
+ *     p = p.stop()
+ * 
+ *     p = p.start("convert play links")             # <<<<<<<<<<<<<<
+ * 
+ *     # wards that auto-assign players will also have a self-link
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_kp_u_convert_play_links) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_kp_u_convert_play_links);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":208
+ *     # wards that auto-assign players will also have a self-link
+ *     # holding the unassigned weight, if they don't have one already
+ *     cdef int has_self = 0             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_v_has_self = 0;
+
+  /* "metawards/utils/_network_wards.pyx":210
+ *     cdef int has_self = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "metawards/utils/_network_wards.pyx":211
+ * 
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             if present[i] == 0:
+ *                 continue
+ */
+        __pyx_t_8 = __pyx_v_nnodes_plus_one;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 1; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "metawards/utils/_network_wards.pyx":212
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_2 = (((__pyx_v_present[__pyx_v_i]) == 0) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":213
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             nplay = nplay + play_begin[i+1] - play_begin[i]
+ */
+            goto __pyx_L45_continue;
+
+            /* "metawards/utils/_network_wards.pyx":212
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":215
+ *                 continue
+ * 
+ *             nplay = nplay + play_begin[i+1] - play_begin[i]             # <<<<<<<<<<<<<<
+ * 
+ *             if auto_assign[i]:
+ */
+          __pyx_v_nplay = ((__pyx_v_nplay + (__pyx_v_play_begin[(__pyx_v_i + 1)])) - (__pyx_v_play_begin[__pyx_v_i]));
+
+          /* "metawards/utils/_network_wards.pyx":217
+ *             nplay = nplay + play_begin[i+1] - play_begin[i]
+ * 
+ *             if auto_assign[i]:             # <<<<<<<<<<<<<<
+ *                 has_self = 0
+ * 
+ */
+          __pyx_t_2 = ((__pyx_v_auto_assign[__pyx_v_i]) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":218
+ * 
+ *             if auto_assign[i]:
+ *                 has_self = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 for j in range(play_begin[i], play_begin[i+1]):
+ */
+            __pyx_v_has_self = 0;
+
+            /* "metawards/utils/_network_wards.pyx":220
+ *                 has_self = 0
+ * 
+ *                 for j in range(play_begin[i], play_begin[i+1]):             # <<<<<<<<<<<<<<
+ *                     if play_dest[j] == i:
+ *                         has_self = 1
+ */
+            __pyx_t_12 = (__pyx_v_play_begin[(__pyx_v_i + 1)]);
+            __pyx_t_13 = __pyx_t_12;
+            for (__pyx_t_14 = (__pyx_v_play_begin[__pyx_v_i]); __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+              __pyx_v_j = __pyx_t_14;
+
+              /* "metawards/utils/_network_wards.pyx":221
+ * 
+ *                 for j in range(play_begin[i], play_begin[i+1]):
+ *                     if play_dest[j] == i:             # <<<<<<<<<<<<<<
+ *                         has_self = 1
+ *                         break
+ */
+              __pyx_t_2 = (((__pyx_v_play_dest[__pyx_v_j]) == __pyx_v_i) != 0);
+              if (__pyx_t_2) {
+
+                /* "metawards/utils/_network_wards.pyx":222
+ *                 for j in range(play_begin[i], play_begin[i+1]):
+ *                     if play_dest[j] == i:
+ *                         has_self = 1             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+                __pyx_v_has_self = 1;
+
+                /* "metawards/utils/_network_wards.pyx":223
+ *                     if play_dest[j] == i:
+ *                         has_self = 1
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                 if not has_self:
+ */
+                goto __pyx_L50_break;
+
+                /* "metawards/utils/_network_wards.pyx":221
+ * 
+ *                 for j in range(play_begin[i], play_begin[i+1]):
+ *                     if play_dest[j] == i:             # <<<<<<<<<<<<<<
+ *                         has_self = 1
+ *                         break
+ */
+              }
+            }
+            __pyx_L50_break:;
+
+            /* "metawards/utils/_network_wards.pyx":225
+ *                         break
+ * 
+ *                 if not has_self:             # <<<<<<<<<<<<<<
+ *                     nplay = nplay + 1
+ * 
+ */
+            __pyx_t_2 = ((!(__pyx_v_has_self != 0)) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":226
+ * 
+ *                 if not has_self:
+ *                     nplay = nplay + 1             # <<<<<<<<<<<<<<
+ * 
+ *     play = Links(nplay+1)
+ */
+              __pyx_v_nplay = (__pyx_v_nplay + 1);
+
+              /* "metawards/utils/_network_wards.pyx":225
+ *                         break
+ * 
+ *                 if not has_self:             # <<<<<<<<<<<<<<
+ *                     nplay = nplay + 1
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":217
+ *             nplay = nplay + play_begin[i+1] - play_begin[i]
+ * 
+ *             if auto_assign[i]:             # <<<<<<<<<<<<<<
+ *                 has_self = 0
+ * 
+ */
+          }
+          __pyx_L45_continue:;
+        }
+      }
+
+      /* "metawards/utils/_network_wards.pyx":210
+ *     cdef int has_self = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L44;
+        }
+        __pyx_L44:;
+      }
+  }
+
+  /* "metawards/utils/_network_wards.pyx":228
+ *                     nplay = nplay + 1
+ * 
+ *     play = Links(nplay+1)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_Links); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_nplay + 1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_play = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":230
+ *     play = Links(nplay+1)
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)             # <<<<<<<<<<<<<<
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)
+ *     cdef double * play_suscept = get_double_array_ptr(play.suscept)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_ifrom); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_play_ifrom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":231
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)             # <<<<<<<<<<<<<<
+ *     cdef double * play_suscept = get_double_array_ptr(play.suscept)
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_ito); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_play_ito = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":232
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)
+ *     cdef double * play_suscept = get_double_array_ptr(play.suscept)             # <<<<<<<<<<<<<<
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_suscept); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 232, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_play_suscept = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":233
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)
+ *     cdef double * play_suscept = get_double_array_ptr(play.suscept)
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int need_self = 0
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_weight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_play_weight = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":235
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ * 
+ *     cdef int need_self = 0             # <<<<<<<<<<<<<<
+ * 
+ *     ilink = 0
+ */
+  __pyx_v_need_self = 0;
+
+  /* "metawards/utils/_network_wards.pyx":237
+ *     cdef int need_self = 0
+ * 
+ *     ilink = 0             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_v_ilink = 0;
+
+  /* "metawards/utils/_network_wards.pyx":239
+ *     ilink = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "metawards/utils/_network_wards.pyx":240
+ * 
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             if present[i] == 0:
+ *                 continue
+ */
+        __pyx_t_8 = __pyx_v_nnodes_plus_one;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 1; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "metawards/utils/_network_wards.pyx":241
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_2 = (((__pyx_v_present[__pyx_v_i]) == 0) != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":242
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             need_self = auto_assign[i]
+ */
+            goto __pyx_L56_continue;
+
+            /* "metawards/utils/_network_wards.pyx":241
+ *     with nogil:
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":244
+ *                 continue
+ * 
+ *             need_self = auto_assign[i]             # <<<<<<<<<<<<<<
+ * 
+ *             if play_begin[i+1] == play_begin[i] and not need_self:
+ */
+          __pyx_v_need_self = (__pyx_v_auto_assign[__pyx_v_i]);
+
+          /* "metawards/utils/_network_wards.pyx":246
+ *             need_self = auto_assign[i]
+ * 
+ *             if play_begin[i+1] == play_begin[i] and not need_self:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_1 = (((__pyx_v_play_begin[(__pyx_v_i + 1)]) == (__pyx_v_play_begin[__pyx_v_i])) != 0);
+          if (__pyx_t_1) {
+          } else {
+            __pyx_t_2 = __pyx_t_1;
+            goto __pyx_L60_bool_binop_done;
+          }
+          __pyx_t_1 = ((!(__pyx_v_need_self != 0)) != 0);
+          __pyx_t_2 = __pyx_t_1;
+          __pyx_L60_bool_binop_done:;
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":247
+ * 
+ *             if play_begin[i+1] == play_begin[i] and not need_self:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_begin_p[i] = ilink + 1
+ */
+            goto __pyx_L56_continue;
+
+            /* "metawards/utils/_network_wards.pyx":246
+ *             need_self = auto_assign[i]
+ * 
+ *             if play_begin[i+1] == play_begin[i] and not need_self:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":249
+ *                 continue
+ * 
+ *             nodes_begin_p[i] = ilink + 1             # <<<<<<<<<<<<<<
+ * 
+ *             for j in range(play_begin[i], play_begin[i+1]):
+ */
+          (__pyx_v_nodes_begin_p[__pyx_v_i]) = (__pyx_v_ilink + 1);
+
+          /* "metawards/utils/_network_wards.pyx":251
+ *             nodes_begin_p[i] = ilink + 1
+ * 
+ *             for j in range(play_begin[i], play_begin[i+1]):             # <<<<<<<<<<<<<<
+ *                 if need_self and play_dest[j] >= i:
+ *                     if play_dest[j] > i:
+ */
+          __pyx_t_12 = (__pyx_v_play_begin[(__pyx_v_i + 1)]);
+          __pyx_t_13 = __pyx_t_12;
+          for (__pyx_t_14 = (__pyx_v_play_begin[__pyx_v_i]); __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+            __pyx_v_j = __pyx_t_14;
+
+            /* "metawards/utils/_network_wards.pyx":252
+ * 
+ *             for j in range(play_begin[i], play_begin[i+1]):
+ *                 if need_self and play_dest[j] >= i:             # <<<<<<<<<<<<<<
+ *                     if play_dest[j] > i:
+ *                         # insert the auto-assigned self-link
+ */
+            __pyx_t_1 = (__pyx_v_need_self != 0);
+            if (__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L65_bool_binop_done;
+            }
+            __pyx_t_1 = (((__pyx_v_play_dest[__pyx_v_j]) >= __pyx_v_i) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L65_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":253
+ *             for j in range(play_begin[i], play_begin[i+1]):
+ *                 if need_self and play_dest[j] >= i:
+ *                     if play_dest[j] > i:             # <<<<<<<<<<<<<<
+ *                         # insert the auto-assigned self-link
+ *                         ilink = ilink + 1
+ */
+              __pyx_t_2 = (((__pyx_v_play_dest[__pyx_v_j]) > __pyx_v_i) != 0);
+              if (__pyx_t_2) {
+
+                /* "metawards/utils/_network_wards.pyx":255
+ *                     if play_dest[j] > i:
+ *                         # insert the auto-assigned self-link
+ *                         ilink = ilink + 1             # <<<<<<<<<<<<<<
+ *                         play_ifrom[ilink] = i
+ *                         play_ito[ilink] = i
+ */
+                __pyx_v_ilink = (__pyx_v_ilink + 1);
+
+                /* "metawards/utils/_network_wards.pyx":256
+ *                         # insert the auto-assigned self-link
+ *                         ilink = ilink + 1
+ *                         play_ifrom[ilink] = i             # <<<<<<<<<<<<<<
+ *                         play_ito[ilink] = i
+ *                         play_weight[ilink] = player_total[i]
+ */
+                (__pyx_v_play_ifrom[__pyx_v_ilink]) = __pyx_v_i;
+
+                /* "metawards/utils/_network_wards.pyx":257
+ *                         ilink = ilink + 1
+ *                         play_ifrom[ilink] = i
+ *                         play_ito[ilink] = i             # <<<<<<<<<<<<<<
+ *                         play_weight[ilink] = player_total[i]
+ *                         play_suscept[ilink] = play_weight[ilink]
+ */
+                (__pyx_v_play_ito[__pyx_v_ilink]) = __pyx_v_i;
+
+                /* "metawards/utils/_network_wards.pyx":258
+ *                         play_ifrom[ilink] = i
+ *                         play_ito[ilink] = i
+ *                         play_weight[ilink] = player_total[i]             # <<<<<<<<<<<<<<
+ *                         play_suscept[ilink] = play_weight[ilink]
+ *                         nodes_self_p[i] = ilink
+ */
+                (__pyx_v_play_weight[__pyx_v_ilink]) = (__pyx_v_player_total[__pyx_v_i]);
+
+                /* "metawards/utils/_network_wards.pyx":259
+ *                         play_ito[ilink] = i
+ *                         play_weight[ilink] = player_total[i]
+ *                         play_suscept[ilink] = play_weight[ilink]             # <<<<<<<<<<<<<<
+ *                         nodes_self_p[i] = ilink
+ * 
+ */
+                (__pyx_v_play_suscept[__pyx_v_ilink]) = (__pyx_v_play_weight[__pyx_v_ilink]);
+
+                /* "metawards/utils/_network_wards.pyx":260
+ *                         play_weight[ilink] = player_total[i]
+ *                         play_suscept[ilink] = play_weight[ilink]
+ *                         nodes_self_p[i] = ilink             # <<<<<<<<<<<<<<
+ * 
+ *                 ilink = ilink + 1
+ */
+                (__pyx_v_nodes_self_p[__pyx_v_i]) = __pyx_v_ilink;
+
+                /* "metawards/utils/_network_wards.pyx":253
+ *             for j in range(play_begin[i], play_begin[i+1]):
+ *                 if need_self and play_dest[j] >= i:
+ *                     if play_dest[j] > i:             # <<<<<<<<<<<<<<
+ *                         # insert the auto-assigned self-link
+ *                         ilink = ilink + 1
+ */
+              }
+
+              /* "metawards/utils/_network_wards.pyx":252
+ * 
+ *             for j in range(play_begin[i], play_begin[i+1]):
+ *                 if need_self and play_dest[j] >= i:             # <<<<<<<<<<<<<<
+ *                     if play_dest[j] > i:
+ *                         # insert the auto-assigned self-link
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":262
+ *                         nodes_self_p[i] = ilink
+ * 
+ *                 ilink = ilink + 1             # <<<<<<<<<<<<<<
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = play_dest[j]
+ */
+            __pyx_v_ilink = (__pyx_v_ilink + 1);
+
+            /* "metawards/utils/_network_wards.pyx":263
+ * 
+ *                 ilink = ilink + 1
+ *                 play_ifrom[ilink] = i             # <<<<<<<<<<<<<<
+ *                 play_ito[ilink] = play_dest[j]
+ *                 play_weight[ilink] = play_weights[j]
+ */
+            (__pyx_v_play_ifrom[__pyx_v_ilink]) = __pyx_v_i;
+
+            /* "metawards/utils/_network_wards.pyx":264
+ *                 ilink = ilink + 1
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = play_dest[j]             # <<<<<<<<<<<<<<
+ *                 play_weight[ilink] = play_weights[j]
+ * 
+ */
+            (__pyx_v_play_ito[__pyx_v_ilink]) = (__pyx_v_play_dest[__pyx_v_j]);
+
+            /* "metawards/utils/_network_wards.pyx":265
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = play_dest[j]
+ *                 play_weight[ilink] = play_weights[j]             # <<<<<<<<<<<<<<
+ * 
+ *                 if need_self and play_dest[j] == i:
+ */
+            (__pyx_v_play_weight[__pyx_v_ilink]) = (__pyx_v_play_weights[__pyx_v_j]);
+
+            /* "metawards/utils/_network_wards.pyx":267
+ *                 play_weight[ilink] = play_weights[j]
+ * 
+ *                 if need_self and play_dest[j] == i:             # <<<<<<<<<<<<<<
+ *                     play_weight[ilink] = play_weight[ilink] + \
+ *                                          player_total[i]
+ */
+            __pyx_t_1 = (__pyx_v_need_self != 0);
+            if (__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L69_bool_binop_done;
+            }
+            __pyx_t_1 = (((__pyx_v_play_dest[__pyx_v_j]) == __pyx_v_i) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L69_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":268
+ * 
+ *                 if need_self and play_dest[j] == i:
+ *                     play_weight[ilink] = play_weight[ilink] + \             # <<<<<<<<<<<<<<
+ *                                          player_total[i]
+ * 
+ */
+              (__pyx_v_play_weight[__pyx_v_ilink]) = ((__pyx_v_play_weight[__pyx_v_ilink]) + (__pyx_v_player_total[__pyx_v_i]));
+
+              /* "metawards/utils/_network_wards.pyx":267
+ *                 play_weight[ilink] = play_weights[j]
+ * 
+ *                 if need_self and play_dest[j] == i:             # <<<<<<<<<<<<<<
+ *                     play_weight[ilink] = play_weight[ilink] + \
+ *                                          player_total[i]
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":271
+ *                                          player_total[i]
+ * 
+ *                 if play_dest[j] >= i:             # <<<<<<<<<<<<<<
+ *                     need_self = 0
+ * 
+ */
+            __pyx_t_2 = (((__pyx_v_play_dest[__pyx_v_j]) >= __pyx_v_i) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":272
+ * 
+ *                 if play_dest[j] >= i:
+ *                     need_self = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 play_suscept[ilink] = play_weight[ilink]
+ */
+              __pyx_v_need_self = 0;
+
+              /* "metawards/utils/_network_wards.pyx":271
+ *                                          player_total[i]
+ * 
+ *                 if play_dest[j] >= i:             # <<<<<<<<<<<<<<
+ *                     need_self = 0
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":274
+ *                     need_self = 0
+ * 
+ *                 play_suscept[ilink] = play_weight[ilink]             # <<<<<<<<<<<<<<
+ * 
+ *                 if i == play_dest[j]:
+ */
+            (__pyx_v_play_suscept[__pyx_v_ilink]) = (__pyx_v_play_weight[__pyx_v_ilink]);
+
+            /* "metawards/utils/_network_wards.pyx":276
+ *                 play_suscept[ilink] = play_weight[ilink]
+ * 
+ *                 if i == play_dest[j]:             # <<<<<<<<<<<<<<
+ *                     # this is the self-link
+ *                     nodes_self_p[i] = ilink
+ */
+            __pyx_t_2 = ((__pyx_v_i == (__pyx_v_play_dest[__pyx_v_j])) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":278
+ *                 if i == play_dest[j]:
+ *                     # this is the self-link
+ *                     nodes_self_p[i] = ilink             # <<<<<<<<<<<<<<
+ * 
+ *             if need_self:
+ */
+              (__pyx_v_nodes_self_p[__pyx_v_i]) = __pyx_v_ilink;
+
+              /* "metawards/utils/_network_wards.pyx":276
+ *                 play_suscept[ilink] = play_weight[ilink]
+ * 
+ *                 if i == play_dest[j]:             # <<<<<<<<<<<<<<
+ *                     # this is the self-link
+ *                     nodes_self_p[i] = ilink
+ */
+            }
+          }
+
+          /* "metawards/utils/_network_wards.pyx":280
+ *                     nodes_self_p[i] = ilink
+ * 
+ *             if need_self:             # <<<<<<<<<<<<<<
+ *                 # the self-link comes after all of the other links
+ *                 ilink = ilink + 1
+ */
+          __pyx_t_2 = (__pyx_v_need_self != 0);
+          if (__pyx_t_2) {
+
+            /* "metawards/utils/_network_wards.pyx":282
+ *             if need_self:
+ *                 # the self-link comes after all of the other links
+ *                 ilink = ilink + 1             # <<<<<<<<<<<<<<
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = i
+ */
+            __pyx_v_ilink = (__pyx_v_ilink + 1);
+
+            /* "metawards/utils/_network_wards.pyx":283
+ *                 # the self-link comes after all of the other links
+ *                 ilink = ilink + 1
+ *                 play_ifrom[ilink] = i             # <<<<<<<<<<<<<<
+ *                 play_ito[ilink] = i
+ *                 play_weight[ilink] = player_total[i]
+ */
+            (__pyx_v_play_ifrom[__pyx_v_ilink]) = __pyx_v_i;
+
+            /* "metawards/utils/_network_wards.pyx":284
+ *                 ilink = ilink + 1
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = i             # <<<<<<<<<<<<<<
+ *                 play_weight[ilink] = player_total[i]
+ *                 play_suscept[ilink] = play_weight[ilink]
+ */
+            (__pyx_v_play_ito[__pyx_v_ilink]) = __pyx_v_i;
+
+            /* "metawards/utils/_network_wards.pyx":285
+ *                 play_ifrom[ilink] = i
+ *                 play_ito[ilink] = i
+ *                 play_weight[ilink] = player_total[i]             # <<<<<<<<<<<<<<
+ *                 play_suscept[ilink] = play_weight[ilink]
+ *                 nodes_self_p[i] = ilink
+ */
+            (__pyx_v_play_weight[__pyx_v_ilink]) = (__pyx_v_player_total[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":286
+ *                 play_ito[ilink] = i
+ *                 play_weight[ilink] = player_total[i]
+ *                 play_suscept[ilink] = play_weight[ilink]             # <<<<<<<<<<<<<<
+ *                 nodes_self_p[i] = ilink
+ * 
+ */
+            (__pyx_v_play_suscept[__pyx_v_ilink]) = (__pyx_v_play_weight[__pyx_v_ilink]);
+
+            /* "metawards/utils/_network_wards.pyx":287
+ *                 play_weight[ilink] = player_total[i]
+ *                 play_suscept[ilink] = play_weight[ilink]
+ *                 nodes_self_p[i] = ilink             # <<<<<<<<<<<<<<
+ * 
+ *             nodes_end_p[i] = ilink + 1
+ */
+            (__pyx_v_nodes_self_p[__pyx_v_i]) = __pyx_v_ilink;
+
+            /* "metawards/utils/_network_wards.pyx":280
+ *                     nodes_self_p[i] = ilink
+ * 
+ *             if need_self:             # <<<<<<<<<<<<<<
+ *                 # the self-link comes after all of the other links
+ *                 ilink = ilink + 1
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":289
+ *                 nodes_self_p[i] = ilink
+ * 
+ *             nodes_end_p[i] = ilink + 1             # <<<<<<<<<<<<<<
+ * 
+ *     assert nplay == ilink
+ */
+          (__pyx_v_nodes_end_p[__pyx_v_i]) = (__pyx_v_ilink + 1);
+          __pyx_L56_continue:;
+        }
+      }
+
+      /* "metawards/utils/_network_wards.pyx":239
+ *     ilink = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(1, nnodes_plus_one):
+ *             if present[i] == 0:
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L55;
+        }
+        __pyx_L55:;
+      }
+  }
+
+  /* "metawards/utils/_network_wards.pyx":291
+ *             nodes_end_p[i] = ilink + 1
+ * 
+ *     assert nplay == ilink             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((__pyx_v_nplay == __pyx_v_ilink) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 291, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "metawards/utils/_network_wards.pyx":293
+ *     assert nplay == ilink
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     network = Network()
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":295
+ *     p = p.stop()
+ * 
+ *     network = Network()             # <<<<<<<<<<<<<<
+ *     network.params = params
+ *     network.nodes = nodes
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_Network); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_network = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":296
+ * 
+ *     network = Network()
+ *     network.params = params             # <<<<<<<<<<<<<<
+ *     network.nodes = nodes
+ *     network.nnodes = nnodes_plus_one - 1
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_params, __pyx_v_params) < 0) __PYX_ERR(0, 296, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":297
+ *     network = Network()
+ *     network.params = params
+ *     network.nodes = nodes             # <<<<<<<<<<<<<<
+ *     network.nnodes = nnodes_plus_one - 1
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_nodes, __pyx_v_nodes) < 0) __PYX_ERR(0, 297, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":298
+ *     network.params = params
+ *     network.nodes = nodes
+ *     network.nnodes = nnodes_plus_one - 1             # <<<<<<<<<<<<<<
+ * 
+ *     if network.nnodes >= network.max_nodes:
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_long((__pyx_v_nnodes_plus_one - 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_nnodes, __pyx_t_3) < 0) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":300
+ *     network.nnodes = nnodes_plus_one - 1
+ * 
+ *     if network.nnodes >= network.max_nodes:             # <<<<<<<<<<<<<<
+ *         network.max_nodes = network.nnodes + 1
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nnodes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_max_nodes); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_t_6, Py_GE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":301
+ * 
+ *     if network.nnodes >= network.max_nodes:
+ *         network.max_nodes = network.nnodes + 1             # <<<<<<<<<<<<<<
+ * 
+ *     network.links = links
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nnodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_t_4, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_max_nodes, __pyx_t_6) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":300
+ *     network.nnodes = nnodes_plus_one - 1
+ * 
+ *     if network.nnodes >= network.max_nodes:             # <<<<<<<<<<<<<<
+ *         network.max_nodes = network.nnodes + 1
+ * 
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":303
+ *         network.max_nodes = network.nnodes + 1
+ * 
+ *     network.links = links             # <<<<<<<<<<<<<<
+ *     network.nlinks = nlinks
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_links, __pyx_v_links) < 0) __PYX_ERR(0, 303, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":304
+ * 
+ *     network.links = links
+ *     network.nlinks = nlinks             # <<<<<<<<<<<<<<
+ * 
+ *     if network.nlinks >= network.max_links:
+ */
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nlinks); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_nlinks, __pyx_t_6) < 0) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":306
+ *     network.nlinks = nlinks
+ * 
+ *     if network.nlinks >= network.max_links:             # <<<<<<<<<<<<<<
+ *         network.max_links = network.nlinks + 1
+ * 
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nlinks); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_max_links); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_6, __pyx_t_4, Py_GE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":307
+ * 
+ *     if network.nlinks >= network.max_links:
+ *         network.max_links = network.nlinks + 1             # <<<<<<<<<<<<<<
+ * 
+ *     network.play = play
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nlinks); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_t_3, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_max_links, __pyx_t_4) < 0) __PYX_ERR(0, 307, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":306
+ *     network.nlinks = nlinks
+ * 
+ *     if network.nlinks >= network.max_links:             # <<<<<<<<<<<<<<
+ *         network.max_links = network.nlinks + 1
+ * 
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":309
+ *         network.max_links = network.nlinks + 1
+ * 
+ *     network.play = play             # <<<<<<<<<<<<<<
+ *     network.nplay = nplay
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_play, __pyx_v_play) < 0) __PYX_ERR(0, 309, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":310
+ * 
+ *     network.play = play
+ *     network.nplay = nplay             # <<<<<<<<<<<<<<
+ * 
+ *     if network.nplay >= network.max_links:
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nplay); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_nplay, __pyx_t_4) < 0) __PYX_ERR(0, 310, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":312
+ *     network.nplay = nplay
+ * 
+ *     if network.nplay >= network.max_links:             # <<<<<<<<<<<<<<
+ *         network.max_links = network.nplay + 1
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nplay); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_max_links); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = PyObject_RichCompare(__pyx_t_4, __pyx_t_3, Py_GE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":313
+ * 
+ *     if network.nplay >= network.max_links:
+ *         network.max_links = network.nplay + 1             # <<<<<<<<<<<<<<
+ * 
+ *     from .._wardinfo import WardInfos
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nplay); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_t_6, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_max_links, __pyx_t_3) < 0) __PYX_ERR(0, 313, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":312
+ *     network.nplay = nplay
+ * 
+ *     if network.nplay >= network.max_links:             # <<<<<<<<<<<<<<
+ *         network.max_links = network.nplay + 1
+ * 
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":315
+ *         network.max_links = network.nplay + 1
+ * 
+ *     from .._wardinfo import WardInfos             # <<<<<<<<<<<<<<
+ *     network.info = WardInfos(info)
+ * 
+ */
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_n_s_WardInfos);
+  __Pyx_GIVEREF(__pyx_n_s_WardInfos);
+  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_WardInfos);
+  __pyx_t_6 = __Pyx_Import(__pyx_n_s_wardinfo, __pyx_t_3, 2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_6, __pyx_n_s_WardInfos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_v_WardInfos = __pyx_t_3;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":316
+ * 
+ *     from .._wardinfo import WardInfos
+ *     network.info = WardInfos(info)             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("move_from_play_to_work")
+ */
+  __Pyx_INCREF(__pyx_v_WardInfos);
+  __pyx_t_3 = __pyx_v_WardInfos; __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_6 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_info) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_info);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_network, __pyx_n_s_info, __pyx_t_6) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":318
+ *     network.info = WardInfos(info)
+ * 
+ *     p = p.start("move_from_play_to_work")             # <<<<<<<<<<<<<<
+ *     network.move_from_play_to_work(nthreads=nthreads, profiler=p)
+ *     p = p.stop()
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_6 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_n_u_move_from_play_to_work) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_move_from_play_to_work);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":319
+ * 
+ *     p = p.start("move_from_play_to_work")
+ *     network.move_from_play_to_work(nthreads=nthreads, profiler=p)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_move_from_play_to_work); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_nthreads, __pyx_v_nthreads) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_profiler, __pyx_v_p) < 0) __PYX_ERR(0, 319, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":320
+ *     p = p.start("move_from_play_to_work")
+ *     network.move_from_play_to_work(nthreads=nthreads, profiler=p)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     from ._add_wards_network_distance import calc_network_distance
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 320, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":322
+ *     p = p.stop()
+ * 
+ *     from ._add_wards_network_distance import calc_network_distance             # <<<<<<<<<<<<<<
+ *     calc_network_distance(network=network, nthreads=nthreads)
+ * 
+ */
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_n_s_calc_network_distance);
+  __Pyx_GIVEREF(__pyx_n_s_calc_network_distance);
+  PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_calc_network_distance);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_add_wards_network_distance, __pyx_t_4, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_calc_network_distance); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 322, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_v_calc_network_distance = __pyx_t_4;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":323
+ * 
+ *     from ._add_wards_network_distance import calc_network_distance
+ *     calc_network_distance(network=network, nthreads=nthreads)             # <<<<<<<<<<<<<<
+ * 
+ *     (_mindist, maxdist) = network.get_min_max_distances(profiler=p,
+ */
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_network, __pyx_v_network) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_nthreads, __pyx_v_nthreads) < 0) __PYX_ERR(0, 323, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_v_calc_network_distance, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":325
+ *     calc_network_distance(network=network, nthreads=nthreads)
+ * 
+ *     (_mindist, maxdist) = network.get_min_max_distances(profiler=p,             # <<<<<<<<<<<<<<
+ *                                                         nthreads=nthreads)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_get_min_max_distances); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_profiler, __pyx_v_p) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":326
+ * 
+ *     (_mindist, maxdist) = network.get_min_max_distances(profiler=p,
+ *                                                         nthreads=nthreads)             # <<<<<<<<<<<<<<
+ * 
+ *     network.params.dyn_dist_cutoff = maxdist + 1
+ */
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_nthreads, __pyx_v_nthreads) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":325
+ *     calc_network_distance(network=network, nthreads=nthreads)
+ * 
+ *     (_mindist, maxdist) = network.get_min_max_distances(profiler=p,             # <<<<<<<<<<<<<<
+ *                                                         nthreads=nthreads)
+ * 
+ */
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
+    PyObject* sequence = __pyx_t_6;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 325, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
+    } else {
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
+    }
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_4);
+    #else
+    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_5 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_15 = Py_TYPE(__pyx_t_5)->tp_iternext;
+    index = 0; __pyx_t_3 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_3)) goto __pyx_L77_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    index = 1; __pyx_t_4 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_4)) goto __pyx_L77_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_5), 2) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
+    __pyx_t_15 = NULL;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L78_unpacking_done;
+    __pyx_L77_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_15 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 325, __pyx_L1_error)
+    __pyx_L78_unpacking_done:;
+  }
+  __pyx_v__mindist = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_maxdist = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":328
+ *                                                         nthreads=nthreads)
+ * 
+ *     network.params.dyn_dist_cutoff = maxdist + 1             # <<<<<<<<<<<<<<
+ * 
+ *     # By default, we initialise the network ready for a run,
+ */
+  __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_maxdist, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 328, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_params); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 328, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_t_4, __pyx_n_s_dyn_dist_cutoff, __pyx_t_6) < 0) __PYX_ERR(0, 328, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":333
+ *     # namely make sure everything is reset and the population
+ *     # is at work
+ *     p = p.start("reset_everything")             # <<<<<<<<<<<<<<
+ *     network.reset_everything(nthreads=nthreads, profiler=p)
+ *     p = p.stop()
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_3, __pyx_n_u_reset_everything) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_reset_everything);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":334
+ *     # is at work
+ *     p = p.start("reset_everything")
+ *     network.reset_everything(nthreads=nthreads, profiler=p)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_reset_everything); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_nthreads, __pyx_v_nthreads) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_profiler, __pyx_v_p) < 0) __PYX_ERR(0, 334, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_empty_tuple, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":335
+ *     p = p.start("reset_everything")
+ *     network.reset_everything(nthreads=nthreads, profiler=p)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("rescale_play_matrix")
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":337
+ *     p = p.stop()
+ * 
+ *     p = p.start("rescale_play_matrix")             # <<<<<<<<<<<<<<
+ *     network.rescale_play_matrix(nthreads=nthreads, profiler=p)
+ *     p = p.stop()
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_n_u_rescale_play_matrix) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_n_u_rescale_play_matrix);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":338
+ * 
+ *     p = p.start("rescale_play_matrix")
+ *     network.rescale_play_matrix(nthreads=nthreads, profiler=p)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_rescale_play_matrix); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_nthreads, __pyx_v_nthreads) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_profiler, __pyx_v_p) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":339
+ *     p = p.start("rescale_play_matrix")
+ *     network.rescale_play_matrix(nthreads=nthreads, profiler=p)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":341
+ *     p = p.stop()
+ * 
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "             # <<<<<<<<<<<<<<
+ *                   f"Workers: {network.work_population}, Players: "
+ *                   f"{network.play_population}[/]", markup=True)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Console); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_print); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_11 = 0;
+  __pyx_t_16 = 127;
+  __Pyx_INCREF(__pyx_kp_u_bold_Network_loaded_Population);
+  __pyx_t_11 += 34;
+  __Pyx_GIVEREF(__pyx_kp_u_bold_Network_loaded_Population);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_kp_u_bold_Network_loaded_Population);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_population); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_3, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_16;
+  __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __Pyx_INCREF(__pyx_kp_u_Workers);
+  __pyx_t_11 += 11;
+  __Pyx_GIVEREF(__pyx_kp_u_Workers);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_kp_u_Workers);
+
+  /* "metawards/utils/_network_wards.pyx":342
+ * 
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "
+ *                   f"Workers: {network.work_population}, Players: "             # <<<<<<<<<<<<<<
+ *                   f"{network.play_population}[/]", markup=True)
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_work_population); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_FormatSimple(__pyx_t_5, __pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) : __pyx_t_16;
+  __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_3);
+  __pyx_t_3 = 0;
+  __Pyx_INCREF(__pyx_kp_u_Players);
+  __pyx_t_11 += 11;
+  __Pyx_GIVEREF(__pyx_kp_u_Players);
+  PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_kp_u_Players);
+
+  /* "metawards/utils/_network_wards.pyx":343
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "
+ *                   f"Workers: {network.work_population}, Players: "
+ *                   f"{network.play_population}[/]", markup=True)             # <<<<<<<<<<<<<<
+ * 
+ *     if network.work_population != wards.num_workers() or \
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play_population); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_3, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_16;
+  __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 5, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __Pyx_INCREF(__pyx_kp_u__3);
+  __pyx_t_11 += 3;
+  __Pyx_GIVEREF(__pyx_kp_u__3);
+  PyTuple_SET_ITEM(__pyx_t_4, 6, __pyx_kp_u__3);
+
+  /* "metawards/utils/_network_wards.pyx":341
+ *     p = p.stop()
+ * 
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "             # <<<<<<<<<<<<<<
+ *                   f"Workers: {network.work_population}, Players: "
+ *                   f"{network.play_population}[/]", markup=True)
+ */
+  __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_4, 7, __pyx_t_11, __pyx_t_16); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":343
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "
+ *                   f"Workers: {network.work_population}, Players: "
+ *                   f"{network.play_population}[/]", markup=True)             # <<<<<<<<<<<<<<
+ * 
+ *     if network.work_population != wards.num_workers() or \
+ */
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_markup, Py_True) < 0) __PYX_ERR(0, 343, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":341
+ *     p = p.stop()
+ * 
+ *     Console.print(f"[bold]Network loaded. Population: {network.population}, "             # <<<<<<<<<<<<<<
+ *                   f"Workers: {network.work_population}, Players: "
+ *                   f"{network.play_population}[/]", markup=True)
+ */
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":345
+ *                   f"{network.play_population}[/]", markup=True)
+ * 
+ *     if network.work_population != wards.num_workers() or \             # <<<<<<<<<<<<<<
+ *        network.play_population != wards.num_players():
+ *         Console.error(
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_work_population); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_workers); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 345, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (!__pyx_t_1) {
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+    goto __pyx_L80_bool_binop_done;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":346
+ * 
+ *     if network.work_population != wards.num_workers() or \
+ *        network.play_population != wards.num_players():             # <<<<<<<<<<<<<<
+ *         Console.error(
+ *             f"Program bug: Disagreement between the number of "
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play_population); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_players); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_4, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_2 = __pyx_t_1;
+  __pyx_L80_bool_binop_done:;
+
+  /* "metawards/utils/_network_wards.pyx":345
+ *                   f"{network.play_population}[/]", markup=True)
+ * 
+ *     if network.work_population != wards.num_workers() or \             # <<<<<<<<<<<<<<
+ *        network.play_population != wards.num_players():
+ *         Console.error(
+ */
+  if (unlikely(__pyx_t_2)) {
+
+    /* "metawards/utils/_network_wards.pyx":347
+ *     if network.work_population != wards.num_workers() or \
+ *        network.play_population != wards.num_players():
+ *         Console.error(             # <<<<<<<<<<<<<<
+ *             f"Program bug: Disagreement between the number of "
+ *             f"workers ({network.work_population} vs {wards.num_workers()}) "
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_Console); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_error); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":348
+ *        network.play_population != wards.num_players():
+ *         Console.error(
+ *             f"Program bug: Disagreement between the number of "             # <<<<<<<<<<<<<<
+ *             f"workers ({network.work_population} vs {wards.num_workers()}) "
+ *             f"or players ({network.play_population} vs {wards.num_players()}) "
+ */
+    __pyx_t_5 = PyTuple_New(9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_11 = 0;
+    __pyx_t_16 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Program_bug_Disagreement_between);
+    __pyx_t_11 += 57;
+    __Pyx_GIVEREF(__pyx_kp_u_Program_bug_Disagreement_between);
+    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_kp_u_Program_bug_Disagreement_between);
+
+    /* "metawards/utils/_network_wards.pyx":349
+ *         Console.error(
+ *             f"Program bug: Disagreement between the number of "
+ *             f"workers ({network.work_population} vs {wards.num_workers()}) "             # <<<<<<<<<<<<<<
+ *             f"or players ({network.play_population} vs {wards.num_players()}) "
+ *             f"which means that there is a data corruption somewhere...")
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_work_population); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_17 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_empty_unicode); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_17) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_17) : __pyx_t_16;
+    __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_17);
+    __Pyx_GIVEREF(__pyx_t_17);
+    PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_17);
+    __pyx_t_17 = 0;
+    __Pyx_INCREF(__pyx_kp_u_vs);
+    __pyx_t_11 += 4;
+    __Pyx_GIVEREF(__pyx_kp_u_vs);
+    PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_kp_u_vs);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_workers); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_18 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_18)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_18);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_17 = (__pyx_t_18) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_18) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+    if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_t_17, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 349, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_16;
+    __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_INCREF(__pyx_kp_u_or_players);
+    __pyx_t_11 += 14;
+    __Pyx_GIVEREF(__pyx_kp_u_or_players);
+    PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_kp_u_or_players);
+
+    /* "metawards/utils/_network_wards.pyx":350
+ *             f"Program bug: Disagreement between the number of "
+ *             f"workers ({network.work_population} vs {wards.num_workers()}) "
+ *             f"or players ({network.play_population} vs {wards.num_players()}) "             # <<<<<<<<<<<<<<
+ *             f"which means that there is a data corruption somewhere...")
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play_population); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_17 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_empty_unicode); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_17) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_17) : __pyx_t_16;
+    __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_17);
+    __Pyx_GIVEREF(__pyx_t_17);
+    PyTuple_SET_ITEM(__pyx_t_5, 5, __pyx_t_17);
+    __pyx_t_17 = 0;
+    __Pyx_INCREF(__pyx_kp_u_vs);
+    __pyx_t_11 += 4;
+    __Pyx_GIVEREF(__pyx_kp_u_vs);
+    PyTuple_SET_ITEM(__pyx_t_5, 6, __pyx_kp_u_vs);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_players); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_18 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_18)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_18);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_17 = (__pyx_t_18) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_18) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+    if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_t_17, __pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_16 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) > __pyx_t_16) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_6) : __pyx_t_16;
+    __pyx_t_11 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_5, 7, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_INCREF(__pyx_kp_u_which_means_that_there_is_a_dat);
+    __pyx_t_11 += 58;
+    __Pyx_GIVEREF(__pyx_kp_u_which_means_that_there_is_a_dat);
+    PyTuple_SET_ITEM(__pyx_t_5, 8, __pyx_kp_u_which_means_that_there_is_a_dat);
+
+    /* "metawards/utils/_network_wards.pyx":348
+ *        network.play_population != wards.num_players():
+ *         Console.error(
+ *             f"Program bug: Disagreement between the number of "             # <<<<<<<<<<<<<<
+ *             f"workers ({network.work_population} vs {wards.num_workers()}) "
+ *             f"or players ({network.play_population} vs {wards.num_players()}) "
+ */
+    __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_5, 9, __pyx_t_11, __pyx_t_16); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":353
+ *             f"which means that there is a data corruption somewhere...")
+ * 
+ *         raise AssertionError("Disagreement in population sizes")             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 353, __pyx_L1_error)
+
+    /* "metawards/utils/_network_wards.pyx":345
+ *                   f"{network.play_population}[/]", markup=True)
+ * 
+ *     if network.work_population != wards.num_workers() or \             # <<<<<<<<<<<<<<
+ *        network.play_population != wards.num_players():
+ *         Console.error(
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":355
+ *         raise AssertionError("Disagreement in population sizes")
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     return network
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":357
+ *     p = p.stop()
+ * 
+ *     return network             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_network);
+  __pyx_r = __pyx_v_network;
+  goto __pyx_L0;
+
+  /* "metawards/utils/_network_wards.pyx":19
+ * 
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,             # <<<<<<<<<<<<<<
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_AddTraceback("metawards.utils._network_wards.load_from_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_NullProfiler);
+  __Pyx_XDECREF(__pyx_v_deepcopy);
+  __Pyx_XDECREF(__pyx_v_InputFiles);
+  __Pyx_XDECREF(__pyx_v_p);
+  __Pyx_XDECREF(__pyx_v_columns);
+  __Pyx_XDECREF(__pyx_v_nodes);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_values);
+  __Pyx_XDECREF(__pyx_v_info);
+  __Pyx_XDECREF(__pyx_v_links);
+  __Pyx_XDECREF(__pyx_v_play);
+  __Pyx_XDECREF(__pyx_v_network);
+  __Pyx_XDECREF(__pyx_v_WardInfos);
+  __Pyx_XDECREF(__pyx_v_calc_network_distance);
+  __Pyx_XDECREF(__pyx_v__mindist);
+  __Pyx_XDECREF(__pyx_v_maxdist);
+  __Pyx_XDECREF(__pyx_v_params);
+  __Pyx_XDECREF(__pyx_v_disease);
+  __Pyx_XDECREF(__pyx_v_profiler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "metawards/utils/_network_wards.pyx":360
+ * 
+ * 
+ * def save_to_wards(network: Network, profiler: Profiler = None,             # <<<<<<<<<<<<<<
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9metawards_5utils_14_network_wards_3save_to_wards(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_9metawards_5utils_14_network_wards_2save_to_wards[] = "save_to_wards(network: Network, profiler: Profiler = None, nthreads: int = 1) -> Wards\nBuild a return a set of Wards constructed from the passed Network";
+static PyMethodDef __pyx_mdef_9metawards_5utils_14_network_wards_3save_to_wards = {"save_to_wards", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9metawards_5utils_14_network_wards_3save_to_wards, METH_VARARGS|METH_KEYWORDS, __pyx_doc_9metawards_5utils_14_network_wards_2save_to_wards};
+static PyObject *__pyx_pw_9metawards_5utils_14_network_wards_3save_to_wards(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_network = 0;
+  PyObject *__pyx_v_profiler = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_nthreads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("save_to_wards (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_network,&__pyx_n_s_profiler,&__pyx_n_s_nthreads,0};
+    PyObject* values[3] = {0,0,0};
+    values[1] = ((PyObject *)Py_None);
+    values[2] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_network)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_profiler);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nthreads);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "save_to_wards") < 0)) __PYX_ERR(0, 360, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_network = values[0];
+    __pyx_v_profiler = values[1];
+    __pyx_v_nthreads = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("save_to_wards", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 360, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("metawards.utils._network_wards.save_to_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9metawards_5utils_14_network_wards_2save_to_wards(__pyx_self, __pyx_v_network, __pyx_v_profiler, __pyx_v_nthreads);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9metawards_5utils_14_network_wards_2save_to_wards(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_network, PyObject *__pyx_v_profiler, CYTHON_UNUSED PyObject *__pyx_v_nthreads) {
+  PyObject *__pyx_v_NullProfiler = NULL;
+  PyObject *__pyx_v_p = NULL;
+  PyObject *__pyx_v_nodes = NULL;
+  PyObject *__pyx_v_links = NULL;
+  PyObject *__pyx_v_play = NULL;
+  PyObject *__pyx_v_info = NULL;
+  int *__pyx_v_nodes_label;
+  double *__pyx_v_nodes_save_play_suscept;
+  double *__pyx_v_nodes_x;
+  double *__pyx_v_nodes_y;
+  double *__pyx_v_nodes_scale_uv;
+  double *__pyx_v_nodes_cutoff;
+  double *__pyx_v_nodes_bg_foi;
+  double *__pyx_v_nodes_custom;
+  int *__pyx_v_links_ifrom;
+  int *__pyx_v_links_ito;
+  double *__pyx_v_links_weight;
+  int *__pyx_v_play_ifrom;
+  int *__pyx_v_play_ito;
+  double *__pyx_v_play_weight;
+  int __pyx_v_nnodes;
+  int __pyx_v_nnodes_plus_one;
+  int __pyx_v_nlinks;
+  int __pyx_v_nplay;
+  PyObject *__pyx_v_original_index = NULL;
+  int *__pyx_v_to_original;
+  int __pyx_v_have_info;
+  int __pyx_v_have_coords;
+  int __pyx_v_xy_coords;
+  PyObject *__pyx_v_wards = NULL;
+  PyObject *__pyx_v_self_weight = NULL;
+  int __pyx_v_i;
+  int __pyx_v_update_freq;
+  int __pyx_v_ifrom;
+  int __pyx_v_ito;
+  double __pyx_v_weight;
+  double __pyx_v_diff;
+  PyObject *__pyx_v_progress = NULL;
+  PyObject *__pyx_v_task = NULL;
+  PyObject *__pyx_v_ward = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_v_value = NULL;
+  PyObject *__pyx_v_errors = NULL;
+  PyObject *__pyx_v_w = NULL;
+  int __pyx_7genexpr__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  PyObject *__pyx_t_19 = NULL;
+  int __pyx_t_20;
+  PyObject *__pyx_t_21 = NULL;
+  Py_UCS4 __pyx_t_22;
+  double __pyx_t_23;
+  PyObject *(*__pyx_t_24)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("save_to_wards", 0);
+  __Pyx_INCREF(__pyx_v_profiler);
+
+  /* "metawards/utils/_network_wards.pyx":363
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ *     if profiler is None:             # <<<<<<<<<<<<<<
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()
+ */
+  __pyx_t_1 = (__pyx_v_profiler == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":364
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ *     if profiler is None:
+ *         from ._profiler import NullProfiler             # <<<<<<<<<<<<<<
+ *         profiler = NullProfiler()
+ * 
+ */
+    __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_n_s_NullProfiler);
+    __Pyx_GIVEREF(__pyx_n_s_NullProfiler);
+    PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_NullProfiler);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_profiler_2, __pyx_t_3, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_NullProfiler); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_NullProfiler = __pyx_t_3;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":365
+ *     if profiler is None:
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()             # <<<<<<<<<<<<<<
+ * 
+ *     p = profiler.start("save_to_wards")
+ */
+    __Pyx_INCREF(__pyx_v_NullProfiler);
+    __pyx_t_3 = __pyx_v_NullProfiler; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 365, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_profiler, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":363
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ *     if profiler is None:             # <<<<<<<<<<<<<<
+ *         from ._profiler import NullProfiler
+ *         profiler = NullProfiler()
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":367
+ *         profiler = NullProfiler()
+ * 
+ *     p = profiler.start("save_to_wards")             # <<<<<<<<<<<<<<
+ * 
+ *     nodes = network.nodes
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_profiler, __pyx_n_s_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_n_u_save_to_wards) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_u_save_to_wards);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_p = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":369
+ *     p = profiler.start("save_to_wards")
+ * 
+ *     nodes = network.nodes             # <<<<<<<<<<<<<<
+ *     links = network.links
+ *     play = network.play
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":370
+ * 
+ *     nodes = network.nodes
+ *     links = network.links             # <<<<<<<<<<<<<<
+ *     play = network.play
+ *     info = network.info
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_links); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_links = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":371
+ *     nodes = network.nodes
+ *     links = network.links
+ *     play = network.play             # <<<<<<<<<<<<<<
+ *     info = network.info
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_play = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":372
+ *     links = network.links
+ *     play = network.play
+ *     info = network.info             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_info); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 372, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_info = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":374
+ *     info = network.info
+ * 
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(
+ *                                                     nodes.save_play_suscept)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_label); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_label = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":376
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(
+ *                                                     nodes.save_play_suscept)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_save_play_suscept); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "metawards/utils/_network_wards.pyx":375
+ * 
+ *     cdef int * nodes_label = get_int_array_ptr(nodes.label)
+ *     cdef double * nodes_save_play_suscept = get_double_array_ptr(             # <<<<<<<<<<<<<<
+ *                                                     nodes.save_play_suscept)
+ * 
+ */
+  __pyx_v_nodes_save_play_suscept = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":378
+ *                                                     nodes.save_play_suscept)
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_x = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":379
+ * 
+ *     cdef double * nodes_x = get_double_array_ptr(nodes.x)
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_y); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_y = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":381
+ *     cdef double * nodes_y = get_double_array_ptr(nodes.y)
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_scale_uv); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 381, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_scale_uv = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":382
+ * 
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)
+ *     cdef double * nodes_custom
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_cutoff); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_cutoff = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":383
+ *     cdef double * nodes_scale_uv = get_double_array_ptr(nodes.scale_uv)
+ *     cdef double * nodes_cutoff = get_double_array_ptr(nodes.cutoff)
+ *     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)             # <<<<<<<<<<<<<<
+ *     cdef double * nodes_custom
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_bg_foi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 383, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_nodes_bg_foi = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":386
+ *     cdef double * nodes_custom
+ * 
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)             # <<<<<<<<<<<<<<
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_ifrom); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 386, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_links_ifrom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":387
+ * 
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)             # <<<<<<<<<<<<<<
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_ito); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_links_ito = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":388
+ *     cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+ *     cdef int * links_ito = get_int_array_ptr(links.ito)
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_links, __pyx_n_s_weight); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_links_weight = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":390
+ *     cdef double * links_weight = get_double_array_ptr(links.weight)
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)             # <<<<<<<<<<<<<<
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_ifrom); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 390, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_play_ifrom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":391
+ * 
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)             # <<<<<<<<<<<<<<
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_ito); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_play_ito = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":392
+ *     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
+ *     cdef int * play_ito = get_int_array_ptr(play.ito)
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nnodes = network.nnodes
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_play, __pyx_n_s_weight); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_play_weight = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":394
+ *     cdef double * play_weight = get_double_array_ptr(play.weight)
+ * 
+ *     cdef int nnodes = network.nnodes             # <<<<<<<<<<<<<<
+ *     cdef int nnodes_plus_one = nnodes + 1
+ *     cdef int nlinks = len(links)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_nnodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_4); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_nnodes = __pyx_t_6;
+
+  /* "metawards/utils/_network_wards.pyx":395
+ * 
+ *     cdef int nnodes = network.nnodes
+ *     cdef int nnodes_plus_one = nnodes + 1             # <<<<<<<<<<<<<<
+ *     cdef int nlinks = len(links)
+ *     cdef int nplay = len(play)
+ */
+  __pyx_v_nnodes_plus_one = (__pyx_v_nnodes + 1);
+
+  /* "metawards/utils/_network_wards.pyx":396
+ *     cdef int nnodes = network.nnodes
+ *     cdef int nnodes_plus_one = nnodes + 1
+ *     cdef int nlinks = len(links)             # <<<<<<<<<<<<<<
+ *     cdef int nplay = len(play)
+ * 
+ */
+  __pyx_t_7 = PyObject_Length(__pyx_v_links); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 396, __pyx_L1_error)
+  __pyx_v_nlinks = __pyx_t_7;
+
+  /* "metawards/utils/_network_wards.pyx":397
+ *     cdef int nnodes_plus_one = nnodes + 1
+ *     cdef int nlinks = len(links)
+ *     cdef int nplay = len(play)             # <<<<<<<<<<<<<<
+ * 
+ *     # the original index of each node, in case the wards have been
+ */
+  __pyx_t_7 = PyObject_Length(__pyx_v_play); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 397, __pyx_L1_error)
+  __pyx_v_nplay = __pyx_t_7;
+
+  /* "metawards/utils/_network_wards.pyx":401
+ *     # the original index of each node, in case the wards have been
+ *     # renumbered (see Network.reorder_wards)
+ *     if network._original_index is None:             # <<<<<<<<<<<<<<
+ *         original_index = array("i", range(0, nnodes_plus_one))
+ *     else:
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_original_index); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = (__pyx_t_4 == Py_None);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "metawards/utils/_network_wards.pyx":402
+ *     # renumbered (see Network.reorder_wards)
+ *     if network._original_index is None:
+ *         original_index = array("i", range(0, nnodes_plus_one))             # <<<<<<<<<<<<<<
+ *     else:
+ *         original_index = network._original_index
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 402, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nnodes_plus_one); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 402, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 402, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_int_0);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 402, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = NULL;
+    __pyx_t_6 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_n_u_i, __pyx_t_5};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 402, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_n_u_i, __pyx_t_5};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 402, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_9 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 402, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      if (__pyx_t_8) {
+        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+      }
+      __Pyx_INCREF(__pyx_n_u_i);
+      __Pyx_GIVEREF(__pyx_n_u_i);
+      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_6, __pyx_n_u_i);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_6, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_9, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 402, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_original_index = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":401
+ *     # the original index of each node, in case the wards have been
+ *     # renumbered (see Network.reorder_wards)
+ *     if network._original_index is None:             # <<<<<<<<<<<<<<
+ *         original_index = array("i", range(0, nnodes_plus_one))
+ *     else:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":404
+ *         original_index = array("i", range(0, nnodes_plus_one))
+ *     else:
+ *         original_index = network._original_index             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int * to_original = get_int_array_ptr(original_index)
+ */
+  /*else*/ {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_original_index); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 404, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_v_original_index = __pyx_t_4;
+    __pyx_t_4 = 0;
+  }
+  __pyx_L4:;
+
+  /* "metawards/utils/_network_wards.pyx":406
+ *         original_index = network._original_index
+ * 
+ *     cdef int * to_original = get_int_array_ptr(original_index)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int have_info = 1 if (len(info) > 1) else 0
+ */
+  __pyx_v_to_original = __pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr(__pyx_v_original_index);
+
+  /* "metawards/utils/_network_wards.pyx":408
+ *     cdef int * to_original = get_int_array_ptr(original_index)
+ * 
+ *     cdef int have_info = 1 if (len(info) > 1) else 0             # <<<<<<<<<<<<<<
+ *     cdef int have_coords = 0 if nodes.coordinates is None else 1
+ *     cdef int xy_coords = 1 if nodes.coordinates == "x/y" else 0
+ */
+  __pyx_t_7 = PyObject_Length(__pyx_v_info); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 408, __pyx_L1_error)
+  if (((__pyx_t_7 > 1) != 0)) {
+    __pyx_t_6 = 1;
+  } else {
+    __pyx_t_6 = 0;
+  }
+  __pyx_v_have_info = __pyx_t_6;
+
+  /* "metawards/utils/_network_wards.pyx":409
+ * 
+ *     cdef int have_info = 1 if (len(info) > 1) else 0
+ *     cdef int have_coords = 0 if nodes.coordinates is None else 1             # <<<<<<<<<<<<<<
+ *     cdef int xy_coords = 1 if nodes.coordinates == "x/y" else 0
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_coordinates); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = (__pyx_t_4 == Py_None);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_6 = 0;
+  } else {
+    __pyx_t_6 = 1;
+  }
+  __pyx_v_have_coords = __pyx_t_6;
+
+  /* "metawards/utils/_network_wards.pyx":410
+ *     cdef int have_info = 1 if (len(info) > 1) else 0
+ *     cdef int have_coords = 0 if nodes.coordinates is None else 1
+ *     cdef int xy_coords = 1 if nodes.coordinates == "x/y" else 0             # <<<<<<<<<<<<<<
+ * 
+ *     wards = [None]
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_coordinates); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_t_4, __pyx_kp_u_x_y, Py_EQ)); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_1) {
+    __pyx_t_6 = 1;
+  } else {
+    __pyx_t_6 = 0;
+  }
+  __pyx_v_xy_coords = __pyx_t_6;
+
+  /* "metawards/utils/_network_wards.pyx":412
+ *     cdef int xy_coords = 1 if nodes.coordinates == "x/y" else 0
+ * 
+ *     wards = [None]             # <<<<<<<<<<<<<<
+ * 
+ *     self_weight = [None] * nnodes_plus_one
+ */
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  PyList_SET_ITEM(__pyx_t_4, 0, Py_None);
+  __pyx_v_wards = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":414
+ *     wards = [None]
+ * 
+ *     self_weight = [None] * nnodes_plus_one             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i = 0
+ */
+  __pyx_t_4 = PyList_New(1 * ((__pyx_v_nnodes_plus_one<0) ? 0:__pyx_v_nnodes_plus_one)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  { Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < __pyx_v_nnodes_plus_one; __pyx_temp++) {
+      __Pyx_INCREF(Py_None);
+      __Pyx_GIVEREF(Py_None);
+      PyList_SET_ITEM(__pyx_t_4, __pyx_temp, Py_None);
+    }
+  }
+  __pyx_v_self_weight = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":416
+ *     self_weight = [None] * nnodes_plus_one
+ * 
+ *     cdef int i = 0             # <<<<<<<<<<<<<<
+ *     cdef int update_freq = 250
+ *     cdef int ifrom, ito
+ */
+  __pyx_v_i = 0;
+
+  /* "metawards/utils/_network_wards.pyx":417
+ * 
+ *     cdef int i = 0
+ *     cdef int update_freq = 250             # <<<<<<<<<<<<<<
+ *     cdef int ifrom, ito
+ *     cdef double weight
+ */
+  __pyx_v_update_freq = 0xFA;
+
+  /* "metawards/utils/_network_wards.pyx":422
+ *     cdef double diff
+ * 
+ *     p = p.start("Convert wards")             # <<<<<<<<<<<<<<
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_9)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_9);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_9, __pyx_kp_u_Convert_wards) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_Convert_wards);
+  __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 422, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":423
+ * 
+ *     p = p.start("Convert wards")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)
+ * 
+ */
+  /*with:*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Console); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_progress); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_10 = __Pyx_PyObject_LookupSpecial(__pyx_t_4, __pyx_n_s_exit); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_t_4, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 423, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_9 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 423, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __pyx_t_9;
+    __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+        __Pyx_XGOTREF(__pyx_t_11);
+        __Pyx_XGOTREF(__pyx_t_12);
+        __Pyx_XGOTREF(__pyx_t_13);
+        /*try:*/ {
+          __pyx_v_progress = __pyx_t_3;
+          __pyx_t_3 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":424
+ *     p = p.start("Convert wards")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(1, nnodes_plus_one):
+ */
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_add_task); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 424, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 424, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_nnodes_plus_one); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 424, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_total, __pyx_t_9) < 0) __PYX_ERR(0, 424, __pyx_L9_error)
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__5, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 424, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __pyx_v_task = __pyx_t_9;
+          __pyx_t_9 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":426
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)
+ * 
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             ward = Ward(id=nodes_label[i], auto_assign_players=False)
+ * 
+ */
+          __pyx_t_6 = __pyx_v_nnodes_plus_one;
+          __pyx_t_14 = __pyx_t_6;
+          for (__pyx_t_15 = 1; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_i = __pyx_t_15;
+
+            /* "metawards/utils/_network_wards.pyx":427
+ * 
+ *         for i in range(1, nnodes_plus_one):
+ *             ward = Ward(id=nodes_label[i], auto_assign_players=False)             # <<<<<<<<<<<<<<
+ * 
+ *             if have_info:
+ */
+            __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_Ward); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 427, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 427, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_nodes_label[__pyx_v_i])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 427, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_id, __pyx_t_3) < 0) __PYX_ERR(0, 427, __pyx_L9_error)
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_auto_assign_players, Py_False) < 0) __PYX_ERR(0, 427, __pyx_L9_error)
+            __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 427, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_XDECREF_SET(__pyx_v_ward, __pyx_t_3);
+            __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":429
+ *             ward = Ward(id=nodes_label[i], auto_assign_players=False)
+ * 
+ *             if have_info:             # <<<<<<<<<<<<<<
+ *                 ward.set_info(info[i])
+ * 
+ */
+            __pyx_t_1 = (__pyx_v_have_info != 0);
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":430
+ * 
+ *             if have_info:
+ *                 ward.set_info(info[i])             # <<<<<<<<<<<<<<
+ * 
+ *             if have_coords:
+ */
+              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_info); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 430, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_info, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 430, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_5 = NULL;
+              if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+                __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+                if (likely(__pyx_t_5)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                  __Pyx_INCREF(__pyx_t_5);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_4, function);
+                }
+              }
+              __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+              __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 430, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":429
+ *             ward = Ward(id=nodes_label[i], auto_assign_players=False)
+ * 
+ *             if have_info:             # <<<<<<<<<<<<<<
+ *                 ward.set_info(info[i])
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":432
+ *                 ward.set_info(info[i])
+ * 
+ *             if have_coords:             # <<<<<<<<<<<<<<
+ *                 if xy_coords:
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")
+ */
+            __pyx_t_1 = (__pyx_v_have_coords != 0);
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":433
+ * 
+ *             if have_coords:
+ *                 if xy_coords:             # <<<<<<<<<<<<<<
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")
+ *                 else:
+ */
+              __pyx_t_1 = (__pyx_v_xy_coords != 0);
+              if (__pyx_t_1) {
+
+                /* "metawards/utils/_network_wards.pyx":434
+ *             if have_coords:
+ *                 if xy_coords:
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     ward.set_position(lat=nodes_x[i], long=nodes_y[i])
+ */
+                __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_x[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_x, __pyx_t_9) < 0) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_y[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_y, __pyx_t_9) < 0) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_units, __pyx_n_u_km) < 0) __PYX_ERR(0, 434, __pyx_L9_error)
+                __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 434, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+                /* "metawards/utils/_network_wards.pyx":433
+ * 
+ *             if have_coords:
+ *                 if xy_coords:             # <<<<<<<<<<<<<<
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")
+ *                 else:
+ */
+                goto __pyx_L19;
+              }
+
+              /* "metawards/utils/_network_wards.pyx":436
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")
+ *                 else:
+ *                     ward.set_position(lat=nodes_x[i], long=nodes_y[i])             # <<<<<<<<<<<<<<
+ * 
+ *             ward.set_num_players(nodes_save_play_suscept[i])
+ */
+              /*else*/ {
+                __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_position); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __pyx_t_3 = PyFloat_FromDouble((__pyx_v_nodes_x[__pyx_v_i])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_lat, __pyx_t_3) < 0) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+                __pyx_t_3 = PyFloat_FromDouble((__pyx_v_nodes_y[__pyx_v_i])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_long, __pyx_t_3) < 0) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+                __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_empty_tuple, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 436, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              }
+              __pyx_L19:;
+
+              /* "metawards/utils/_network_wards.pyx":432
+ *                 ward.set_info(info[i])
+ * 
+ *             if have_coords:             # <<<<<<<<<<<<<<
+ *                 if xy_coords:
+ *                     ward.set_position(x=nodes_x[i], y=nodes_y[i], units="km")
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":438
+ *                     ward.set_position(lat=nodes_x[i], long=nodes_y[i])
+ * 
+ *             ward.set_num_players(nodes_save_play_suscept[i])             # <<<<<<<<<<<<<<
+ * 
+ *             ward.set_scale_uv(nodes_scale_uv[i])
+ */
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_num_players); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 438, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_save_play_suscept[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 438, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_5 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+              if (likely(__pyx_t_5)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                __Pyx_INCREF(__pyx_t_5);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_4, function);
+              }
+            }
+            __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 438, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":440
+ *             ward.set_num_players(nodes_save_play_suscept[i])
+ * 
+ *             ward.set_scale_uv(nodes_scale_uv[i])             # <<<<<<<<<<<<<<
+ *             ward.set_cutoff(nodes_cutoff[i])
+ *             ward.set_bg_foi(nodes_bg_foi[i])
+ */
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_scale_uv); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 440, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_scale_uv[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 440, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_5 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+              if (likely(__pyx_t_5)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                __Pyx_INCREF(__pyx_t_5);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_4, function);
+              }
+            }
+            __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 440, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":441
+ * 
+ *             ward.set_scale_uv(nodes_scale_uv[i])
+ *             ward.set_cutoff(nodes_cutoff[i])             # <<<<<<<<<<<<<<
+ *             ward.set_bg_foi(nodes_bg_foi[i])
+ * 
+ */
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_cutoff); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 441, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_cutoff[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 441, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_5 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+              if (likely(__pyx_t_5)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                __Pyx_INCREF(__pyx_t_5);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_4, function);
+              }
+            }
+            __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 441, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":442
+ *             ward.set_scale_uv(nodes_scale_uv[i])
+ *             ward.set_cutoff(nodes_cutoff[i])
+ *             ward.set_bg_foi(nodes_bg_foi[i])             # <<<<<<<<<<<<<<
+ * 
+ *             for key, value in nodes._custom_params.items():
+ */
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_bg_foi); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 442, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_9 = PyFloat_FromDouble((__pyx_v_nodes_bg_foi[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 442, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_5 = NULL;
+            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+              if (likely(__pyx_t_5)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                __Pyx_INCREF(__pyx_t_5);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_4, function);
+              }
+            }
+            __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 442, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":444
+ *             ward.set_bg_foi(nodes_bg_foi[i])
+ * 
+ *             for key, value in nodes._custom_params.items():             # <<<<<<<<<<<<<<
+ *                 nodes_custom = get_double_array_ptr(value)
+ *                 ward.set_custom(key, nodes_custom[i])
+ */
+            __pyx_t_7 = 0;
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_nodes, __pyx_n_s_custom_params); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 444, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            if (unlikely(__pyx_t_4 == Py_None)) {
+              PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+              __PYX_ERR(0, 444, __pyx_L9_error)
+            }
+            __pyx_t_9 = __Pyx_dict_iterator(__pyx_t_4, 0, __pyx_n_s_items, (&__pyx_t_16), (&__pyx_t_17)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 444, __pyx_L9_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_XDECREF(__pyx_t_3);
+            __pyx_t_3 = __pyx_t_9;
+            __pyx_t_9 = 0;
+            while (1) {
+              __pyx_t_18 = __Pyx_dict_iter_next(__pyx_t_3, __pyx_t_16, &__pyx_t_7, &__pyx_t_9, &__pyx_t_4, NULL, __pyx_t_17);
+              if (unlikely(__pyx_t_18 == 0)) break;
+              if (unlikely(__pyx_t_18 == -1)) __PYX_ERR(0, 444, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_9);
+              __pyx_t_9 = 0;
+              __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_4);
+              __pyx_t_4 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":445
+ * 
+ *             for key, value in nodes._custom_params.items():
+ *                 nodes_custom = get_double_array_ptr(value)             # <<<<<<<<<<<<<<
+ *                 ward.set_custom(key, nodes_custom[i])
+ * 
+ */
+              __pyx_v_nodes_custom = __pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr(__pyx_v_value);
+
+              /* "metawards/utils/_network_wards.pyx":446
+ *             for key, value in nodes._custom_params.items():
+ *                 nodes_custom = get_double_array_ptr(value)
+ *                 ward.set_custom(key, nodes_custom[i])             # <<<<<<<<<<<<<<
+ * 
+ *             wards.append(ward)
+ */
+              __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_ward, __pyx_n_s_set_custom); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 446, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_5 = PyFloat_FromDouble((__pyx_v_nodes_custom[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 446, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __pyx_t_8 = NULL;
+              __pyx_t_18 = 0;
+              if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+                __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
+                if (likely(__pyx_t_8)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+                  __Pyx_INCREF(__pyx_t_8);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_9, function);
+                  __pyx_t_18 = 1;
+                }
+              }
+              #if CYTHON_FAST_PYCALL
+              if (PyFunction_Check(__pyx_t_9)) {
+                PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_key, __pyx_t_5};
+                __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-__pyx_t_18, 2+__pyx_t_18); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 446, __pyx_L9_error)
+                __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __Pyx_GOTREF(__pyx_t_4);
+                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+              } else
+              #endif
+              #if CYTHON_FAST_PYCCALL
+              if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
+                PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_key, __pyx_t_5};
+                __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-__pyx_t_18, 2+__pyx_t_18); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 446, __pyx_L9_error)
+                __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __Pyx_GOTREF(__pyx_t_4);
+                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+              } else
+              #endif
+              {
+                __pyx_t_19 = PyTuple_New(2+__pyx_t_18); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 446, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_19);
+                if (__pyx_t_8) {
+                  __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_8); __pyx_t_8 = NULL;
+                }
+                __Pyx_INCREF(__pyx_v_key);
+                __Pyx_GIVEREF(__pyx_v_key);
+                PyTuple_SET_ITEM(__pyx_t_19, 0+__pyx_t_18, __pyx_v_key);
+                __Pyx_GIVEREF(__pyx_t_5);
+                PyTuple_SET_ITEM(__pyx_t_19, 1+__pyx_t_18, __pyx_t_5);
+                __pyx_t_5 = 0;
+                __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_19, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 446, __pyx_L9_error)
+                __Pyx_GOTREF(__pyx_t_4);
+                __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              }
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            }
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":448
+ *                 ward.set_custom(key, nodes_custom[i])
+ * 
+ *             wards.append(ward)             # <<<<<<<<<<<<<<
+ * 
+ *             if i % update_freq == 0:
+ */
+            __pyx_t_20 = __Pyx_PyObject_Append(__pyx_v_wards, __pyx_v_ward); if (unlikely(__pyx_t_20 == ((int)-1))) __PYX_ERR(0, 448, __pyx_L9_error)
+
+            /* "metawards/utils/_network_wards.pyx":450
+ *             wards.append(ward)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i)
+ * 
+ */
+            __pyx_t_1 = (((__pyx_v_i % __pyx_v_update_freq) == 0) != 0);
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":451
+ * 
+ *             if i % update_freq == 0:
+ *                 progress.update(task, completed=i)             # <<<<<<<<<<<<<<
+ * 
+ *         progress.update(task, completed=nnodes_plus_one, force_update=True)
+ */
+              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_INCREF(__pyx_v_task);
+              __Pyx_GIVEREF(__pyx_v_task);
+              PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_task);
+              __pyx_t_9 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_19 = __Pyx_PyInt_From_int(__pyx_v_i); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_completed, __pyx_t_19) < 0) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __pyx_t_19 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_9); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 451, __pyx_L9_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":450
+ *             wards.append(ward)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i)
+ * 
+ */
+            }
+          }
+
+          /* "metawards/utils/_network_wards.pyx":453
+ *                 progress.update(task, completed=i)
+ * 
+ *         progress.update(task, completed=nnodes_plus_one, force_update=True)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+          __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __Pyx_INCREF(__pyx_v_task);
+          __Pyx_GIVEREF(__pyx_v_task);
+          PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_task);
+          __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_nnodes_plus_one); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_completed, __pyx_t_3) < 0) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_force_update, Py_True) < 0) __PYX_ERR(0, 453, __pyx_L9_error)
+          __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_19, __pyx_t_9, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 453, __pyx_L9_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":423
+ * 
+ *     p = p.start("Convert wards")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)
+ * 
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        goto __pyx_L14_try_end;
+        __pyx_L9_error:;
+        __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("metawards.utils._network_wards.save_to_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_9) < 0) __PYX_ERR(0, 423, __pyx_L11_except_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_19 = PyTuple_Pack(3, __pyx_t_3, __pyx_t_4, __pyx_t_9); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 423, __pyx_L11_except_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_19, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+          if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 423, __pyx_L11_except_error)
+          __Pyx_GOTREF(__pyx_t_21);
+          __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_21);
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (__pyx_t_1 < 0) __PYX_ERR(0, 423, __pyx_L11_except_error)
+          __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+          if (__pyx_t_2) {
+            __Pyx_GIVEREF(__pyx_t_3);
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_XGIVEREF(__pyx_t_9);
+            __Pyx_ErrRestoreWithState(__pyx_t_3, __pyx_t_4, __pyx_t_9);
+            __pyx_t_3 = 0; __pyx_t_4 = 0; __pyx_t_9 = 0; 
+            __PYX_ERR(0, 423, __pyx_L11_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+          goto __pyx_L10_exception_handled;
+        }
+        __pyx_L11_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+        goto __pyx_L1_error;
+        __pyx_L10_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+        __pyx_L14_try_end:;
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_10) {
+          __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_tuple__6, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 423, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        }
+        goto __pyx_L8;
+      }
+      __pyx_L8:;
+    }
+    goto __pyx_L26;
+    __pyx_L5_error:;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    goto __pyx_L1_error;
+    __pyx_L26:;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":454
+ * 
+ *         progress.update(task, completed=nnodes_plus_one, force_update=True)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("Convert work links")
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_9 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_9);
+  __pyx_t_9 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":456
+ *     p = p.stop()
+ * 
+ *     p = p.start("Convert work links")             # <<<<<<<<<<<<<<
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting work links", total=nlinks)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_9 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_3, __pyx_kp_u_Convert_work_links) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_u_Convert_work_links);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_9);
+  __pyx_t_9 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":457
+ * 
+ *     p = p.start("Convert work links")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting work links", total=nlinks)
+ * 
+ */
+  /*with:*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Console); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_progress); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 457, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_9 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 457, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_10 = __Pyx_PyObject_LookupSpecial(__pyx_t_9, __pyx_n_s_exit); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 457, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_t_9, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L27_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_19 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_19)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_19);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_19) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_19) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 457, __pyx_L27_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __pyx_t_3;
+    __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_13, &__pyx_t_12, &__pyx_t_11);
+        __Pyx_XGOTREF(__pyx_t_13);
+        __Pyx_XGOTREF(__pyx_t_12);
+        __Pyx_XGOTREF(__pyx_t_11);
+        /*try:*/ {
+          __Pyx_XDECREF_SET(__pyx_v_progress, __pyx_t_4);
+          __pyx_t_4 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":458
+ *     p = p.start("Convert work links")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting work links", total=nlinks)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(0, nlinks):
+ */
+          __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_add_task); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 458, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_9 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 458, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_nlinks); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_total, __pyx_t_3) < 0) __PYX_ERR(0, 458, __pyx_L31_error)
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__7, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_task, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":460
+ *         task = progress.add_task("Extracting work links", total=nlinks)
+ * 
+ *         for i in range(0, nlinks):             # <<<<<<<<<<<<<<
+ *             ifrom = links_ifrom[i]
+ *             ito = links_ito[i]
+ */
+          __pyx_t_6 = __pyx_v_nlinks;
+          __pyx_t_14 = __pyx_t_6;
+          for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_i = __pyx_t_15;
+
+            /* "metawards/utils/_network_wards.pyx":461
+ * 
+ *         for i in range(0, nlinks):
+ *             ifrom = links_ifrom[i]             # <<<<<<<<<<<<<<
+ *             ito = links_ito[i]
+ *             weight = links_weight[i]
+ */
+            __pyx_v_ifrom = (__pyx_v_links_ifrom[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":462
+ *         for i in range(0, nlinks):
+ *             ifrom = links_ifrom[i]
+ *             ito = links_ito[i]             # <<<<<<<<<<<<<<
+ *             weight = links_weight[i]
+ * 
+ */
+            __pyx_v_ito = (__pyx_v_links_ito[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":463
+ *             ifrom = links_ifrom[i]
+ *             ito = links_ito[i]
+ *             weight = links_weight[i]             # <<<<<<<<<<<<<<
+ * 
+ *             if ifrom == -1 or ito == -1:
+ */
+            __pyx_v_weight = (__pyx_v_links_weight[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":465
+ *             weight = links_weight[i]
+ * 
+ *             if ifrom == -1 or ito == -1:             # <<<<<<<<<<<<<<
+ *                 # null link
+ *                 continue
+ */
+            __pyx_t_1 = ((__pyx_v_ifrom == -1L) != 0);
+            if (!__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L40_bool_binop_done;
+            }
+            __pyx_t_1 = ((__pyx_v_ito == -1L) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L40_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":467
+ *             if ifrom == -1 or ito == -1:
+ *                 # null link
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:
+ */
+              goto __pyx_L37_continue;
+
+              /* "metawards/utils/_network_wards.pyx":465
+ *             weight = links_weight[i]
+ * 
+ *             if ifrom == -1 or ito == -1:             # <<<<<<<<<<<<<<
+ *                 # null link
+ *                 continue
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":469
+ *                 continue
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:             # <<<<<<<<<<<<<<
+ *                 Console.error(f"Invalid link? {ifrom}=>{ito}")
+ * 
+ */
+            __pyx_t_1 = ((__pyx_v_ito <= 0) != 0);
+            if (!__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L43_bool_binop_done;
+            }
+            __pyx_t_1 = ((__pyx_v_ito > __pyx_v_nnodes) != 0);
+            if (!__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L43_bool_binop_done;
+            }
+            __pyx_t_1 = ((__pyx_v_ifrom <= 0) != 0);
+            if (!__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L43_bool_binop_done;
+            }
+            __pyx_t_1 = ((__pyx_v_ifrom > __pyx_v_nnodes) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L43_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":470
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:
+ *                 Console.error(f"Invalid link? {ifrom}=>{ito}")             # <<<<<<<<<<<<<<
+ * 
+ *             if ifrom == ito and ifrom == 38:
+ */
+              __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_Console); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_error); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __pyx_t_9 = PyTuple_New(4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_16 = 0;
+              __pyx_t_22 = 127;
+              __Pyx_INCREF(__pyx_kp_u_Invalid_link);
+              __pyx_t_16 += 14;
+              __Pyx_GIVEREF(__pyx_kp_u_Invalid_link);
+              PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_kp_u_Invalid_link);
+              __pyx_t_19 = __Pyx_PyUnicode_From_int(__pyx_v_ifrom, 0, ' ', 'd'); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_19);
+              __Pyx_GIVEREF(__pyx_t_19);
+              PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_19);
+              __pyx_t_19 = 0;
+              __Pyx_INCREF(__pyx_kp_u__8);
+              __pyx_t_16 += 2;
+              __Pyx_GIVEREF(__pyx_kp_u__8);
+              PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_kp_u__8);
+              __pyx_t_19 = __Pyx_PyUnicode_From_int(__pyx_v_ito, 0, ' ', 'd'); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_19);
+              __Pyx_GIVEREF(__pyx_t_19);
+              PyTuple_SET_ITEM(__pyx_t_9, 3, __pyx_t_19);
+              __pyx_t_19 = 0;
+              __pyx_t_19 = __Pyx_PyUnicode_Join(__pyx_t_9, 4, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __pyx_t_9 = NULL;
+              if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+                __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_4);
+                if (likely(__pyx_t_9)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+                  __Pyx_INCREF(__pyx_t_9);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_4, function);
+                }
+              }
+              __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_9, __pyx_t_19) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_19);
+              __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 470, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":469
+ *                 continue
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:             # <<<<<<<<<<<<<<
+ *                 Console.error(f"Invalid link? {ifrom}=>{ito}")
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":472
+ *                 Console.error(f"Invalid link? {ifrom}=>{ito}")
+ * 
+ *             if ifrom == ito and ifrom == 38:             # <<<<<<<<<<<<<<
+ *                 Console.print(f"ward {ifrom} {ito} => {weight}")
+ * 
+ */
+            __pyx_t_1 = ((__pyx_v_ifrom == __pyx_v_ito) != 0);
+            if (__pyx_t_1) {
+            } else {
+              __pyx_t_2 = __pyx_t_1;
+              goto __pyx_L48_bool_binop_done;
+            }
+            __pyx_t_1 = ((__pyx_v_ifrom == 38) != 0);
+            __pyx_t_2 = __pyx_t_1;
+            __pyx_L48_bool_binop_done:;
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":473
+ * 
+ *             if ifrom == ito and ifrom == 38:
+ *                 Console.print(f"ward {ifrom} {ito} => {weight}")             # <<<<<<<<<<<<<<
+ * 
+ *             wards[ifrom].add_workers(destination=to_original[ito],
+ */
+              __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_Console); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_print); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __pyx_t_4 = PyTuple_New(6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_16 = 0;
+              __pyx_t_22 = 127;
+              __Pyx_INCREF(__pyx_kp_u_ward);
+              __pyx_t_16 += 5;
+              __Pyx_GIVEREF(__pyx_kp_u_ward);
+              PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_kp_u_ward);
+              __pyx_t_9 = __Pyx_PyUnicode_From_int(__pyx_v_ifrom, 0, ' ', 'd'); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_9);
+              __Pyx_GIVEREF(__pyx_t_9);
+              PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_9);
+              __pyx_t_9 = 0;
+              __Pyx_INCREF(__pyx_kp_u__9);
+              __pyx_t_16 += 1;
+              __Pyx_GIVEREF(__pyx_kp_u__9);
+              PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_kp_u__9);
+              __pyx_t_9 = __Pyx_PyUnicode_From_int(__pyx_v_ito, 0, ' ', 'd'); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_9);
+              __Pyx_GIVEREF(__pyx_t_9);
+              PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_9);
+              __pyx_t_9 = 0;
+              __Pyx_INCREF(__pyx_kp_u__10);
+              __pyx_t_16 += 4;
+              __Pyx_GIVEREF(__pyx_kp_u__10);
+              PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_kp_u__10);
+              __pyx_t_9 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_9, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+              __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_22;
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+              __Pyx_GIVEREF(__pyx_t_5);
+              PyTuple_SET_ITEM(__pyx_t_4, 5, __pyx_t_5);
+              __pyx_t_5 = 0;
+              __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_4, 6, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __pyx_t_4 = NULL;
+              if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_19))) {
+                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_19);
+                if (likely(__pyx_t_4)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+                  __Pyx_INCREF(__pyx_t_4);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_19, function);
+                }
+              }
+              __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_19, __pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_t_5);
+              __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+              if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 473, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":472
+ *                 Console.error(f"Invalid link? {ifrom}=>{ito}")
+ * 
+ *             if ifrom == ito and ifrom == 38:             # <<<<<<<<<<<<<<
+ *                 Console.print(f"ward {ifrom} {ito} => {weight}")
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":475
+ *                 Console.print(f"ward {ifrom} {ito} => {weight}")
+ * 
+ *             wards[ifrom].add_workers(destination=to_original[ito],             # <<<<<<<<<<<<<<
+ *                                      number=weight)
+ * 
+ */
+            __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_wards, __pyx_v_ifrom, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_add_workers); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_to_original[__pyx_v_ito])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_destination, __pyx_t_5) < 0) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":476
+ * 
+ *             wards[ifrom].add_workers(destination=to_original[ito],
+ *                                      number=weight)             # <<<<<<<<<<<<<<
+ * 
+ *             if i % update_freq == 0:
+ */
+            __pyx_t_5 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 476, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_number, __pyx_t_5) < 0) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":475
+ *                 Console.print(f"ward {ifrom} {ito} => {weight}")
+ * 
+ *             wards[ifrom].add_workers(destination=to_original[ito],             # <<<<<<<<<<<<<<
+ *                                      number=weight)
+ * 
+ */
+            __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_19, __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L31_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":478
+ *                                      number=weight)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i+1)
+ * 
+ */
+            __pyx_t_2 = (((__pyx_v_i % __pyx_v_update_freq) == 0) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":479
+ * 
+ *             if i % update_freq == 0:
+ *                 progress.update(task, completed=i+1)             # <<<<<<<<<<<<<<
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)
+ */
+              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_INCREF(__pyx_v_task);
+              __Pyx_GIVEREF(__pyx_v_task);
+              PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_task);
+              __pyx_t_19 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              if (PyDict_SetItem(__pyx_t_19, __pyx_n_s_completed, __pyx_t_4) < 0) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, __pyx_t_19); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 479, __pyx_L31_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":478
+ *                                      number=weight)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i+1)
+ * 
+ */
+            }
+            __pyx_L37_continue:;
+          }
+
+          /* "metawards/utils/_network_wards.pyx":481
+ *                 progress.update(task, completed=i+1)
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+          __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_19 = PyTuple_New(1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __Pyx_INCREF(__pyx_v_task);
+          __Pyx_GIVEREF(__pyx_v_task);
+          PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_v_task);
+          __pyx_t_3 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nlinks); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_completed, __pyx_t_5) < 0) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_force_update, Py_True) < 0) __PYX_ERR(0, 481, __pyx_L31_error)
+          __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_19, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 481, __pyx_L31_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":457
+ * 
+ *     p = p.start("Convert work links")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting work links", total=nlinks)
+ * 
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        goto __pyx_L36_try_end;
+        __pyx_L31_error:;
+        __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("metawards.utils._network_wards.save_to_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_3, &__pyx_t_19) < 0) __PYX_ERR(0, 457, __pyx_L33_except_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_t_4 = PyTuple_Pack(3, __pyx_t_5, __pyx_t_3, __pyx_t_19); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 457, __pyx_L33_except_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_4, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 457, __pyx_L33_except_error)
+          __Pyx_GOTREF(__pyx_t_21);
+          __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_21);
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (__pyx_t_2 < 0) __PYX_ERR(0, 457, __pyx_L33_except_error)
+          __pyx_t_1 = ((!(__pyx_t_2 != 0)) != 0);
+          if (__pyx_t_1) {
+            __Pyx_GIVEREF(__pyx_t_5);
+            __Pyx_GIVEREF(__pyx_t_3);
+            __Pyx_XGIVEREF(__pyx_t_19);
+            __Pyx_ErrRestoreWithState(__pyx_t_5, __pyx_t_3, __pyx_t_19);
+            __pyx_t_5 = 0; __pyx_t_3 = 0; __pyx_t_19 = 0; 
+            __PYX_ERR(0, 457, __pyx_L33_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+          goto __pyx_L32_exception_handled;
+        }
+        __pyx_L33_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_12, __pyx_t_11);
+        goto __pyx_L1_error;
+        __pyx_L32_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_12, __pyx_t_11);
+        __pyx_L36_try_end:;
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_10) {
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_tuple__6, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 457, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        }
+        goto __pyx_L30;
+      }
+      __pyx_L30:;
+    }
+    goto __pyx_L54;
+    __pyx_L27_error:;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    goto __pyx_L1_error;
+    __pyx_L54:;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":482
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("Convert play links")
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 482, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_19 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 482, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_19);
+  __pyx_t_19 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":484
+ *     p = p.stop()
+ * 
+ *     p = p.start("Convert play links")             # <<<<<<<<<<<<<<
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting play links", total=nplay)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 484, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_19 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_kp_u_Convert_play_links) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_Convert_play_links);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 484, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_19);
+  __pyx_t_19 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":485
+ * 
+ *     p = p.start("Convert play links")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting play links", total=nplay)
+ * 
+ */
+  /*with:*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Console); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 485, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_progress); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 485, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_19 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 485, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_10 = __Pyx_PyObject_LookupSpecial(__pyx_t_19, __pyx_n_s_exit); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 485, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_t_19, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 485, __pyx_L55_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 485, __pyx_L55_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    /*try:*/ {
+      {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __Pyx_ExceptionSave(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+        __Pyx_XGOTREF(__pyx_t_11);
+        __Pyx_XGOTREF(__pyx_t_12);
+        __Pyx_XGOTREF(__pyx_t_13);
+        /*try:*/ {
+          __Pyx_XDECREF_SET(__pyx_v_progress, __pyx_t_3);
+          __pyx_t_3 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":486
+ *     p = p.start("Convert play links")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting play links", total=nplay)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(0, nplay):
+ */
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_add_task); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 486, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_19 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 486, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nplay); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 486, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          if (PyDict_SetItem(__pyx_t_19, __pyx_n_s_total, __pyx_t_5) < 0) __PYX_ERR(0, 486, __pyx_L59_error)
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__11, __pyx_t_19); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 486, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_task, __pyx_t_5);
+          __pyx_t_5 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":488
+ *         task = progress.add_task("Extracting play links", total=nplay)
+ * 
+ *         for i in range(0, nplay):             # <<<<<<<<<<<<<<
+ *             ifrom = play_ifrom[i]
+ *             ito = play_ito[i]
+ */
+          __pyx_t_6 = __pyx_v_nplay;
+          __pyx_t_14 = __pyx_t_6;
+          for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_i = __pyx_t_15;
+
+            /* "metawards/utils/_network_wards.pyx":489
+ * 
+ *         for i in range(0, nplay):
+ *             ifrom = play_ifrom[i]             # <<<<<<<<<<<<<<
+ *             ito = play_ito[i]
+ *             weight = play_weight[i]
+ */
+            __pyx_v_ifrom = (__pyx_v_play_ifrom[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":490
+ *         for i in range(0, nplay):
+ *             ifrom = play_ifrom[i]
+ *             ito = play_ito[i]             # <<<<<<<<<<<<<<
+ *             weight = play_weight[i]
+ * 
+ */
+            __pyx_v_ito = (__pyx_v_play_ito[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":491
+ *             ifrom = play_ifrom[i]
+ *             ito = play_ito[i]
+ *             weight = play_weight[i]             # <<<<<<<<<<<<<<
+ * 
+ *             if ifrom == -1 or ito == -1:
+ */
+            __pyx_v_weight = (__pyx_v_play_weight[__pyx_v_i]);
+
+            /* "metawards/utils/_network_wards.pyx":493
+ *             weight = play_weight[i]
+ * 
+ *             if ifrom == -1 or ito == -1:             # <<<<<<<<<<<<<<
+ *                 # null link
+ *                 continue
+ */
+            __pyx_t_2 = ((__pyx_v_ifrom == -1L) != 0);
+            if (!__pyx_t_2) {
+            } else {
+              __pyx_t_1 = __pyx_t_2;
+              goto __pyx_L68_bool_binop_done;
+            }
+            __pyx_t_2 = ((__pyx_v_ito == -1L) != 0);
+            __pyx_t_1 = __pyx_t_2;
+            __pyx_L68_bool_binop_done:;
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":495
+ *             if ifrom == -1 or ito == -1:
+ *                 # null link
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:
+ */
+              goto __pyx_L65_continue;
+
+              /* "metawards/utils/_network_wards.pyx":493
+ *             weight = play_weight[i]
+ * 
+ *             if ifrom == -1 or ito == -1:             # <<<<<<<<<<<<<<
+ *                 # null link
+ *                 continue
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":497
+ *                 continue
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:             # <<<<<<<<<<<<<<
+ *                 Console.error(f"Invalid play link? {ifrom}=>{ito}")
+ * 
+ */
+            __pyx_t_2 = ((__pyx_v_ito <= 0) != 0);
+            if (!__pyx_t_2) {
+            } else {
+              __pyx_t_1 = __pyx_t_2;
+              goto __pyx_L71_bool_binop_done;
+            }
+            __pyx_t_2 = ((__pyx_v_ito > __pyx_v_nnodes) != 0);
+            if (!__pyx_t_2) {
+            } else {
+              __pyx_t_1 = __pyx_t_2;
+              goto __pyx_L71_bool_binop_done;
+            }
+            __pyx_t_2 = ((__pyx_v_ifrom <= 0) != 0);
+            if (!__pyx_t_2) {
+            } else {
+              __pyx_t_1 = __pyx_t_2;
+              goto __pyx_L71_bool_binop_done;
+            }
+            __pyx_t_2 = ((__pyx_v_ifrom > __pyx_v_nnodes) != 0);
+            __pyx_t_1 = __pyx_t_2;
+            __pyx_L71_bool_binop_done:;
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":498
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:
+ *                 Console.error(f"Invalid play link? {ifrom}=>{ito}")             # <<<<<<<<<<<<<<
+ * 
+ *             if ifrom == ito:
+ */
+              __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_n_s_Console); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_19, __pyx_n_s_error); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __pyx_t_19 = PyTuple_New(4); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_16 = 0;
+              __pyx_t_22 = 127;
+              __Pyx_INCREF(__pyx_kp_u_Invalid_play_link);
+              __pyx_t_16 += 19;
+              __Pyx_GIVEREF(__pyx_kp_u_Invalid_play_link);
+              PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_kp_u_Invalid_play_link);
+              __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_ifrom, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+              __Pyx_GIVEREF(__pyx_t_4);
+              PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_4);
+              __pyx_t_4 = 0;
+              __Pyx_INCREF(__pyx_kp_u__8);
+              __pyx_t_16 += 2;
+              __Pyx_GIVEREF(__pyx_kp_u__8);
+              PyTuple_SET_ITEM(__pyx_t_19, 2, __pyx_kp_u__8);
+              __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_ito, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+              __Pyx_GIVEREF(__pyx_t_4);
+              PyTuple_SET_ITEM(__pyx_t_19, 3, __pyx_t_4);
+              __pyx_t_4 = 0;
+              __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_19, 4, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __pyx_t_19 = NULL;
+              if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+                __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_3);
+                if (likely(__pyx_t_19)) {
+                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+                  __Pyx_INCREF(__pyx_t_19);
+                  __Pyx_INCREF(function);
+                  __Pyx_DECREF_SET(__pyx_t_3, function);
+                }
+              }
+              __pyx_t_5 = (__pyx_t_19) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_19, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+              __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 498, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":497
+ *                 continue
+ * 
+ *             if ito <= 0 or ito > nnodes or ifrom <=0 or ifrom > nnodes:             # <<<<<<<<<<<<<<
+ *                 Console.error(f"Invalid play link? {ifrom}=>{ito}")
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":500
+ *                 Console.error(f"Invalid play link? {ifrom}=>{ito}")
+ * 
+ *             if ifrom == ito:             # <<<<<<<<<<<<<<
+ *                 self_weight[ifrom] = weight
+ * 
+ */
+            __pyx_t_1 = ((__pyx_v_ifrom == __pyx_v_ito) != 0);
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":501
+ * 
+ *             if ifrom == ito:
+ *                 self_weight[ifrom] = weight             # <<<<<<<<<<<<<<
+ * 
+ *             wards[ifrom].add_player_weight(destination=to_original[ito],
+ */
+              __pyx_t_5 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 501, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              if (unlikely(__Pyx_SetItemInt(__pyx_v_self_weight, __pyx_v_ifrom, __pyx_t_5, int, 1, __Pyx_PyInt_From_int, 1, 0, 0) < 0)) __PYX_ERR(0, 501, __pyx_L59_error)
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":500
+ *                 Console.error(f"Invalid play link? {ifrom}=>{ito}")
+ * 
+ *             if ifrom == ito:             # <<<<<<<<<<<<<<
+ *                 self_weight[ifrom] = weight
+ * 
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":503
+ *                 self_weight[ifrom] = weight
+ * 
+ *             wards[ifrom].add_player_weight(destination=to_original[ito],             # <<<<<<<<<<<<<<
+ *                                            weight=weight)
+ * 
+ */
+            __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_wards, __pyx_v_ifrom, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_add_player_weight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __pyx_t_5 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_to_original[__pyx_v_ito])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_destination, __pyx_t_4) < 0) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":504
+ * 
+ *             wards[ifrom].add_player_weight(destination=to_original[ito],
+ *                                            weight=weight)             # <<<<<<<<<<<<<<
+ * 
+ *             if i % update_freq == 0:
+ */
+            __pyx_t_4 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 504, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_weight, __pyx_t_4) < 0) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":503
+ *                 self_weight[ifrom] = weight
+ * 
+ *             wards[ifrom].add_player_weight(destination=to_original[ito],             # <<<<<<<<<<<<<<
+ *                                            weight=weight)
+ * 
+ */
+            __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 503, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":506
+ *                                            weight=weight)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i+1)
+ * 
+ */
+            __pyx_t_1 = (((__pyx_v_i % __pyx_v_update_freq) == 0) != 0);
+            if (__pyx_t_1) {
+
+              /* "metawards/utils/_network_wards.pyx":507
+ * 
+ *             if i % update_freq == 0:
+ *                 progress.update(task, completed=i+1)             # <<<<<<<<<<<<<<
+ * 
+ *         errors = []
+ */
+              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_4);
+              __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __Pyx_INCREF(__pyx_v_task);
+              __Pyx_GIVEREF(__pyx_v_task);
+              PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_task);
+              __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __pyx_t_19 = __Pyx_PyInt_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_completed, __pyx_t_19) < 0) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __pyx_t_19 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 507, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":506
+ *                                            weight=weight)
+ * 
+ *             if i % update_freq == 0:             # <<<<<<<<<<<<<<
+ *                 progress.update(task, completed=i+1)
+ * 
+ */
+            }
+            __pyx_L65_continue:;
+          }
+
+          /* "metawards/utils/_network_wards.pyx":509
+ *                 progress.update(task, completed=i+1)
+ * 
+ *         errors = []             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(1, nnodes_plus_one):
+ */
+          __pyx_t_19 = PyList_New(0); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 509, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_v_errors = ((PyObject*)__pyx_t_19);
+          __pyx_t_19 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":511
+ *         errors = []
+ * 
+ *         for i in range(1, nnodes_plus_one):             # <<<<<<<<<<<<<<
+ *             weight = wards[i].get_players(destination=to_original[i])
+ * 
+ */
+          __pyx_t_6 = __pyx_v_nnodes_plus_one;
+          __pyx_t_14 = __pyx_t_6;
+          for (__pyx_t_15 = 1; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+            __pyx_v_i = __pyx_t_15;
+
+            /* "metawards/utils/_network_wards.pyx":512
+ * 
+ *         for i in range(1, nnodes_plus_one):
+ *             weight = wards[i].get_players(destination=to_original[i])             # <<<<<<<<<<<<<<
+ * 
+ *             if self_weight[i] is None:
+ */
+            __pyx_t_19 = __Pyx_GetItemInt(__pyx_v_wards, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_19, __pyx_n_s_get_players); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            __pyx_t_19 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __pyx_t_5 = __Pyx_PyInt_From_int((__pyx_v_to_original[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            if (PyDict_SetItem(__pyx_t_19, __pyx_n_s_destination, __pyx_t_5) < 0) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_empty_tuple, __pyx_t_19); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            __pyx_t_23 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_23 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 512, __pyx_L59_error)
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __pyx_v_weight = __pyx_t_23;
+
+            /* "metawards/utils/_network_wards.pyx":514
+ *             weight = wards[i].get_players(destination=to_original[i])
+ * 
+ *             if self_weight[i] is None:             # <<<<<<<<<<<<<<
+ *                 # the weight should either be zero or one
+ *                 if weight > 0.5:
+ */
+            __pyx_t_1 = (PyList_GET_ITEM(__pyx_v_self_weight, __pyx_v_i) == Py_None);
+            __pyx_t_2 = (__pyx_t_1 != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":516
+ *             if self_weight[i] is None:
+ *                 # the weight should either be zero or one
+ *                 if weight > 0.5:             # <<<<<<<<<<<<<<
+ *                     self_weight[i] = 1.0
+ *                 else:
+ */
+              __pyx_t_2 = ((__pyx_v_weight > 0.5) != 0);
+              if (__pyx_t_2) {
+
+                /* "metawards/utils/_network_wards.pyx":517
+ *                 # the weight should either be zero or one
+ *                 if weight > 0.5:
+ *                     self_weight[i] = 1.0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     self_weight[i] = 0.0
+ */
+                if (unlikely(__Pyx_SetItemInt(__pyx_v_self_weight, __pyx_v_i, __pyx_float_1_0, int, 1, __Pyx_PyInt_From_int, 1, 0, 0) < 0)) __PYX_ERR(0, 517, __pyx_L59_error)
+
+                /* "metawards/utils/_network_wards.pyx":516
+ *             if self_weight[i] is None:
+ *                 # the weight should either be zero or one
+ *                 if weight > 0.5:             # <<<<<<<<<<<<<<
+ *                     self_weight[i] = 1.0
+ *                 else:
+ */
+                goto __pyx_L80;
+              }
+
+              /* "metawards/utils/_network_wards.pyx":519
+ *                     self_weight[i] = 1.0
+ *                 else:
+ *                     self_weight[i] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *             diff = abs(self_weight[i] - weight)
+ */
+              /*else*/ {
+                if (unlikely(__Pyx_SetItemInt(__pyx_v_self_weight, __pyx_v_i, __pyx_float_0_0, int, 1, __Pyx_PyInt_From_int, 1, 0, 0) < 0)) __PYX_ERR(0, 519, __pyx_L59_error)
+              }
+              __pyx_L80:;
+
+              /* "metawards/utils/_network_wards.pyx":514
+ *             weight = wards[i].get_players(destination=to_original[i])
+ * 
+ *             if self_weight[i] is None:             # <<<<<<<<<<<<<<
+ *                 # the weight should either be zero or one
+ *                 if weight > 0.5:
+ */
+            }
+
+            /* "metawards/utils/_network_wards.pyx":521
+ *                     self_weight[i] = 0.0
+ * 
+ *             diff = abs(self_weight[i] - weight)             # <<<<<<<<<<<<<<
+ * 
+ *             if diff > 1e-6:
+ */
+            __pyx_t_5 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 521, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __pyx_t_19 = PyNumber_Subtract(PyList_GET_ITEM(__pyx_v_self_weight, __pyx_v_i), __pyx_t_5); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 521, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __pyx_t_5 = __Pyx_PyNumber_Absolute(__pyx_t_19); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 521, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            __pyx_t_23 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_23 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 521, __pyx_L59_error)
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __pyx_v_diff = __pyx_t_23;
+
+            /* "metawards/utils/_network_wards.pyx":523
+ *             diff = abs(self_weight[i] - weight)
+ * 
+ *             if diff > 1e-6:             # <<<<<<<<<<<<<<
+ *                 errors.append(
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "
+ */
+            __pyx_t_2 = ((__pyx_v_diff > 1e-6) != 0);
+            if (__pyx_t_2) {
+
+              /* "metawards/utils/_network_wards.pyx":525
+ *             if diff > 1e-6:
+ *                 errors.append(
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "             # <<<<<<<<<<<<<<
+ *                     f"versus {weight}")
+ * 
+ */
+              __pyx_t_5 = PyTuple_New(6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 525, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_5);
+              __pyx_t_16 = 0;
+              __pyx_t_22 = 127;
+              __Pyx_INCREF(__pyx_kp_u_Ward_2);
+              __pyx_t_16 += 5;
+              __Pyx_GIVEREF(__pyx_kp_u_Ward_2);
+              PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_kp_u_Ward_2);
+              __pyx_t_19 = __Pyx_PyUnicode_From_int(__pyx_v_i, 0, ' ', 'd'); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 525, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_19);
+              __Pyx_GIVEREF(__pyx_t_19);
+              PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_19);
+              __pyx_t_19 = 0;
+              __Pyx_INCREF(__pyx_kp_u_weight_disagreement);
+              __pyx_t_16 += 22;
+              __Pyx_GIVEREF(__pyx_kp_u_weight_disagreement);
+              PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_kp_u_weight_disagreement);
+              __pyx_t_19 = __Pyx_PyObject_FormatSimple(PyList_GET_ITEM(__pyx_v_self_weight, __pyx_v_i), __pyx_empty_unicode); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 525, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_19) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_19) : __pyx_t_22;
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_19);
+              __Pyx_GIVEREF(__pyx_t_19);
+              PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_19);
+              __pyx_t_19 = 0;
+              __Pyx_INCREF(__pyx_kp_u_versus);
+              __pyx_t_16 += 8;
+              __Pyx_GIVEREF(__pyx_kp_u_versus);
+              PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_kp_u_versus);
+
+              /* "metawards/utils/_network_wards.pyx":526
+ *                 errors.append(
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "
+ *                     f"versus {weight}")             # <<<<<<<<<<<<<<
+ * 
+ *                 if len(errors) > 10:
+ */
+              __pyx_t_19 = PyFloat_FromDouble(__pyx_v_weight); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 526, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_19);
+              __pyx_t_3 = __Pyx_PyObject_FormatSimple(__pyx_t_19, __pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 526, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+              __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) : __pyx_t_22;
+              __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3);
+              __Pyx_GIVEREF(__pyx_t_3);
+              PyTuple_SET_ITEM(__pyx_t_5, 5, __pyx_t_3);
+              __pyx_t_3 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":525
+ *             if diff > 1e-6:
+ *                 errors.append(
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "             # <<<<<<<<<<<<<<
+ *                     f"versus {weight}")
+ * 
+ */
+              __pyx_t_3 = __Pyx_PyUnicode_Join(__pyx_t_5, 6, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 525, __pyx_L59_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":524
+ * 
+ *             if diff > 1e-6:
+ *                 errors.append(             # <<<<<<<<<<<<<<
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "
+ *                     f"versus {weight}")
+ */
+              __pyx_t_20 = __Pyx_PyList_Append(__pyx_v_errors, __pyx_t_3); if (unlikely(__pyx_t_20 == ((int)-1))) __PYX_ERR(0, 524, __pyx_L59_error)
+              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+              /* "metawards/utils/_network_wards.pyx":528
+ *                     f"versus {weight}")
+ * 
+ *                 if len(errors) > 10:             # <<<<<<<<<<<<<<
+ *                     Console.error("Lots of errors! Exiting early!")
+ *                     break
+ */
+              __pyx_t_16 = PyList_GET_SIZE(__pyx_v_errors); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 528, __pyx_L59_error)
+              __pyx_t_2 = ((__pyx_t_16 > 10) != 0);
+              if (__pyx_t_2) {
+
+                /* "metawards/utils/_network_wards.pyx":529
+ * 
+ *                 if len(errors) > 10:
+ *                     Console.error("Lots of errors! Exiting early!")             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+ */
+                __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_Console); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 529, __pyx_L59_error)
+                __Pyx_GOTREF(__pyx_t_5);
+                __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_error); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 529, __pyx_L59_error)
+                __Pyx_GOTREF(__pyx_t_19);
+                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+                __pyx_t_5 = NULL;
+                if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_19))) {
+                  __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_19);
+                  if (likely(__pyx_t_5)) {
+                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+                    __Pyx_INCREF(__pyx_t_5);
+                    __Pyx_INCREF(function);
+                    __Pyx_DECREF_SET(__pyx_t_19, function);
+                  }
+                }
+                __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_19, __pyx_t_5, __pyx_kp_u_Lots_of_errors_Exiting_early) : __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_kp_u_Lots_of_errors_Exiting_early);
+                __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+                if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 529, __pyx_L59_error)
+                __Pyx_GOTREF(__pyx_t_3);
+                __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+                /* "metawards/utils/_network_wards.pyx":530
+ *                 if len(errors) > 10:
+ *                     Console.error("Lots of errors! Exiting early!")
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *         if len(errors) > 0:
+ */
+                goto __pyx_L78_break;
+
+                /* "metawards/utils/_network_wards.pyx":528
+ *                     f"versus {weight}")
+ * 
+ *                 if len(errors) > 10:             # <<<<<<<<<<<<<<
+ *                     Console.error("Lots of errors! Exiting early!")
+ *                     break
+ */
+              }
+
+              /* "metawards/utils/_network_wards.pyx":523
+ *             diff = abs(self_weight[i] - weight)
+ * 
+ *             if diff > 1e-6:             # <<<<<<<<<<<<<<
+ *                 errors.append(
+ *                     f"Ward {i} weight disagreement? {self_weight[i]} "
+ */
+            }
+          }
+          __pyx_L78_break:;
+
+          /* "metawards/utils/_network_wards.pyx":532
+ *                     break
+ * 
+ *         if len(errors) > 0:             # <<<<<<<<<<<<<<
+ *             Console.error("\n".join(errors))
+ *             raise AssertionError("Disagreement in player weights")
+ */
+          __pyx_t_16 = PyList_GET_SIZE(__pyx_v_errors); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 532, __pyx_L59_error)
+          __pyx_t_2 = ((__pyx_t_16 > 0) != 0);
+          if (unlikely(__pyx_t_2)) {
+
+            /* "metawards/utils/_network_wards.pyx":533
+ * 
+ *         if len(errors) > 0:
+ *             Console.error("\n".join(errors))             # <<<<<<<<<<<<<<
+ *             raise AssertionError("Disagreement in player weights")
+ * 
+ */
+            __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_n_s_Console); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 533, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_19, __pyx_n_s_error); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 533, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            __pyx_t_19 = PyUnicode_Join(__pyx_kp_u__12, __pyx_v_errors); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 533, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_19);
+            __pyx_t_4 = NULL;
+            if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+              __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+              if (likely(__pyx_t_4)) {
+                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+                __Pyx_INCREF(__pyx_t_4);
+                __Pyx_INCREF(function);
+                __Pyx_DECREF_SET(__pyx_t_5, function);
+              }
+            }
+            __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_19) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_19);
+            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 533, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "metawards/utils/_network_wards.pyx":534
+ *         if len(errors) > 0:
+ *             Console.error("\n".join(errors))
+ *             raise AssertionError("Disagreement in player weights")             # <<<<<<<<<<<<<<
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)
+ */
+            __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 534, __pyx_L59_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __PYX_ERR(0, 534, __pyx_L59_error)
+
+            /* "metawards/utils/_network_wards.pyx":532
+ *                     break
+ * 
+ *         if len(errors) > 0:             # <<<<<<<<<<<<<<
+ *             Console.error("\n".join(errors))
+ *             raise AssertionError("Disagreement in player weights")
+ */
+          }
+
+          /* "metawards/utils/_network_wards.pyx":536
+ *             raise AssertionError("Disagreement in player weights")
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)             # <<<<<<<<<<<<<<
+ *     p = p.stop()
+ * 
+ */
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_progress, __pyx_n_s_update); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __Pyx_INCREF(__pyx_v_task);
+          __Pyx_GIVEREF(__pyx_v_task);
+          PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_task);
+          __pyx_t_19 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_19);
+          __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_nlinks); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          if (PyDict_SetItem(__pyx_t_19, __pyx_n_s_completed, __pyx_t_4) < 0) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (PyDict_SetItem(__pyx_t_19, __pyx_n_s_force_update, Py_True) < 0) __PYX_ERR(0, 536, __pyx_L59_error)
+          __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, __pyx_t_19); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L59_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+          /* "metawards/utils/_network_wards.pyx":485
+ * 
+ *     p = p.start("Convert play links")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting play links", total=nplay)
+ * 
+ */
+        }
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+        goto __pyx_L64_try_end;
+        __pyx_L59_error:;
+        __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        /*except:*/ {
+          __Pyx_AddTraceback("metawards.utils._network_wards.save_to_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+          if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_19, &__pyx_t_5) < 0) __PYX_ERR(0, 485, __pyx_L61_except_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_GOTREF(__pyx_t_19);
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_3 = PyTuple_Pack(3, __pyx_t_4, __pyx_t_19, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 485, __pyx_L61_except_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_t_3, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 485, __pyx_L61_except_error)
+          __Pyx_GOTREF(__pyx_t_21);
+          __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_21);
+          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
+          if (__pyx_t_2 < 0) __PYX_ERR(0, 485, __pyx_L61_except_error)
+          __pyx_t_1 = ((!(__pyx_t_2 != 0)) != 0);
+          if (__pyx_t_1) {
+            __Pyx_GIVEREF(__pyx_t_4);
+            __Pyx_GIVEREF(__pyx_t_19);
+            __Pyx_XGIVEREF(__pyx_t_5);
+            __Pyx_ErrRestoreWithState(__pyx_t_4, __pyx_t_19, __pyx_t_5);
+            __pyx_t_4 = 0; __pyx_t_19 = 0; __pyx_t_5 = 0; 
+            __PYX_ERR(0, 485, __pyx_L61_except_error)
+          }
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          goto __pyx_L60_exception_handled;
+        }
+        __pyx_L61_except_error:;
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+        goto __pyx_L1_error;
+        __pyx_L60_exception_handled:;
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_ExceptionReset(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+        __pyx_L64_try_end:;
+      }
+    }
+    /*finally:*/ {
+      /*normal exit:*/{
+        if (__pyx_t_10) {
+          __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_tuple__6, NULL);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 485, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        }
+        goto __pyx_L58;
+      }
+      __pyx_L58:;
+    }
+    goto __pyx_L87;
+    __pyx_L55_error:;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    goto __pyx_L1_error;
+    __pyx_L87:;
+  }
+
+  /* "metawards/utils/_network_wards.pyx":537
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     if network._node_index is not None:
+ */
+  __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_19))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_19);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_19, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":539
+ *     p = p.stop()
+ * 
+ *     if network._node_index is not None:             # <<<<<<<<<<<<<<
+ *         # return the wards in their original order
+ *         wards = [None] + [wards[i] for i in network._node_index[1:]]
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_node_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = (__pyx_t_5 != Py_None);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":541
+ *     if network._node_index is not None:
+ *         # return the wards in their original order
+ *         wards = [None] + [wards[i] for i in network._node_index[1:]]             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("Create Wards")
+ */
+    __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 541, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyList_SET_ITEM(__pyx_t_5, 0, Py_None);
+    { /* enter inner scope */
+      __pyx_t_19 = PyList_New(0); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 541, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_19);
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_node_index); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = __Pyx_PyObject_GetSlice(__pyx_t_4, 1, 0, NULL, NULL, &__pyx_slice__14, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+        __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4); __pyx_t_16 = 0;
+        __pyx_t_24 = NULL;
+      } else {
+        __pyx_t_16 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_24 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_24)) __PYX_ERR(0, 541, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_24)) {
+          if (likely(PyList_CheckExact(__pyx_t_4))) {
+            if (__pyx_t_16 >= PyList_GET_SIZE(__pyx_t_4)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_16); __Pyx_INCREF(__pyx_t_3); __pyx_t_16++; if (unlikely(0 < 0)) __PYX_ERR(0, 541, __pyx_L1_error)
+            #else
+            __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_16); __pyx_t_16++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            #endif
+          } else {
+            if (__pyx_t_16 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_16); __Pyx_INCREF(__pyx_t_3); __pyx_t_16++; if (unlikely(0 < 0)) __PYX_ERR(0, 541, __pyx_L1_error)
+            #else
+            __pyx_t_3 = PySequence_ITEM(__pyx_t_4, __pyx_t_16); __pyx_t_16++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            #endif
+          }
+        } else {
+          __pyx_t_3 = __pyx_t_24(__pyx_t_4);
+          if (unlikely(!__pyx_t_3)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 541, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_3);
+        }
+        __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 541, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_7genexpr__pyx_v_i = __pyx_t_6;
+        __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_wards, __pyx_7genexpr__pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_19, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 541, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } /* exit inner scope */
+    __pyx_t_4 = PyNumber_Add(__pyx_t_5, __pyx_t_19); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    __Pyx_DECREF_SET(__pyx_v_wards, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":539
+ *     p = p.stop()
+ * 
+ *     if network._node_index is not None:             # <<<<<<<<<<<<<<
+ *         # return the wards in their original order
+ *         wards = [None] + [wards[i] for i in network._node_index[1:]]
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":543
+ *         wards = [None] + [wards[i] for i in network._node_index[1:]]
+ * 
+ *     p = p.start("Create Wards")             # <<<<<<<<<<<<<<
+ *     w = Wards()
+ *     w.insert(wards, _need_deep_copy = False)
+ */
+  __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_19))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_19);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_19, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_19, __pyx_t_5, __pyx_kp_u_Create_Wards) : __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_kp_u_Create_Wards);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":544
+ * 
+ *     p = p.start("Create Wards")
+ *     w = Wards()             # <<<<<<<<<<<<<<
+ *     w.insert(wards, _need_deep_copy = False)
+ *     wards = w
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_n_s_Wards); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_19))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_19);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_19, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __pyx_v_w = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":545
+ *     p = p.start("Create Wards")
+ *     w = Wards()
+ *     w.insert(wards, _need_deep_copy = False)             # <<<<<<<<<<<<<<
+ *     wards = w
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_w, __pyx_n_s_insert); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_19 = PyTuple_New(1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_INCREF(__pyx_v_wards);
+  __Pyx_GIVEREF(__pyx_v_wards);
+  PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_v_wards);
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_need_deep_copy, Py_False) < 0) __PYX_ERR(0, 545, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_19, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":546
+ *     w = Wards()
+ *     w.insert(wards, _need_deep_copy = False)
+ *     wards = w             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  __Pyx_INCREF(__pyx_v_w);
+  __Pyx_DECREF_SET(__pyx_v_wards, __pyx_v_w);
+
+  /* "metawards/utils/_network_wards.pyx":548
+ *     wards = w
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("Assert sane")
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 548, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_19)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_19);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_19) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_19) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 548, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":550
+ *     p = p.stop()
+ * 
+ *     p = p.start("Assert sane")             # <<<<<<<<<<<<<<
+ *     wards.assert_sane()
+ * 
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_start); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_19)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_19);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_19) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_19, __pyx_kp_u_Assert_sane) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_kp_u_Assert_sane);
+  __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 550, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":551
+ * 
+ *     p = p.start("Assert sane")
+ *     wards.assert_sane()             # <<<<<<<<<<<<<<
+ * 
+ *     if wards.num_workers() != network.work_population:
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_assert_sane); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 551, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_19)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_19);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_19) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_19) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 551, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":553
+ *     wards.assert_sane()
+ * 
+ *     if wards.num_workers() != network.work_population:             # <<<<<<<<<<<<<<
+ *         errors.append(
+ *             f"Disagreement in the number of workers: "
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_workers); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 553, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_19 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_19)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_19);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_19) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_19) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 553, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_work_population); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 553, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_19 = PyObject_RichCompare(__pyx_t_3, __pyx_t_5, Py_NE); __Pyx_XGOTREF(__pyx_t_19); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 553, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_19); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 553, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":554
+ * 
+ *     if wards.num_workers() != network.work_population:
+ *         errors.append(             # <<<<<<<<<<<<<<
+ *             f"Disagreement in the number of workers: "
+ *             f"{network.work_population} versus "
+ */
+    if (unlikely(!__pyx_v_errors)) { __Pyx_RaiseUnboundLocalError("errors"); __PYX_ERR(0, 554, __pyx_L1_error) }
+
+    /* "metawards/utils/_network_wards.pyx":555
+ *     if wards.num_workers() != network.work_population:
+ *         errors.append(
+ *             f"Disagreement in the number of workers: "             # <<<<<<<<<<<<<<
+ *             f"{network.work_population} versus "
+ *             f"{wards.num_workers()}")
+ */
+    __pyx_t_19 = PyTuple_New(4); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 555, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __pyx_t_16 = 0;
+    __pyx_t_22 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Disagreement_in_the_number_of_wo);
+    __pyx_t_16 += 39;
+    __Pyx_GIVEREF(__pyx_kp_u_Disagreement_in_the_number_of_wo);
+    PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_kp_u_Disagreement_in_the_number_of_wo);
+
+    /* "metawards/utils/_network_wards.pyx":556
+ *         errors.append(
+ *             f"Disagreement in the number of workers: "
+ *             f"{network.work_population} versus "             # <<<<<<<<<<<<<<
+ *             f"{wards.num_workers()}")
+ * 
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_work_population); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __Pyx_PyObject_FormatSimple(__pyx_t_5, __pyx_empty_unicode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_3) : __pyx_t_22;
+    __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __Pyx_INCREF(__pyx_kp_u_versus);
+    __pyx_t_16 += 8;
+    __Pyx_GIVEREF(__pyx_kp_u_versus);
+    PyTuple_SET_ITEM(__pyx_t_19, 2, __pyx_kp_u_versus);
+
+    /* "metawards/utils/_network_wards.pyx":557
+ *             f"Disagreement in the number of workers: "
+ *             f"{network.work_population} versus "
+ *             f"{wards.num_workers()}")             # <<<<<<<<<<<<<<
+ * 
+ *     if wards.num_players() != network.play_population:
+ */
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_workers); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_3, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_22;
+    __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_19, 3, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":555
+ *     if wards.num_workers() != network.work_population:
+ *         errors.append(
+ *             f"Disagreement in the number of workers: "             # <<<<<<<<<<<<<<
+ *             f"{network.work_population} versus "
+ *             f"{wards.num_workers()}")
+ */
+    __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_19, 4, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 555, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":554
+ * 
+ *     if wards.num_workers() != network.work_population:
+ *         errors.append(             # <<<<<<<<<<<<<<
+ *             f"Disagreement in the number of workers: "
+ *             f"{network.work_population} versus "
+ */
+    __pyx_t_20 = __Pyx_PyList_Append(__pyx_v_errors, __pyx_t_5); if (unlikely(__pyx_t_20 == ((int)-1))) __PYX_ERR(0, 554, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":553
+ *     wards.assert_sane()
+ * 
+ *     if wards.num_workers() != network.work_population:             # <<<<<<<<<<<<<<
+ *         errors.append(
+ *             f"Disagreement in the number of workers: "
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":559
+ *             f"{wards.num_workers()}")
+ * 
+ *     if wards.num_players() != network.play_population:             # <<<<<<<<<<<<<<
+ *         errors.append(
+ *             f"Disagreement in the number of players: "
+ */
+  __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_players); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_19))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_19);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_19, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play_population); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_5, __pyx_t_19, Py_NE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+
+    /* "metawards/utils/_network_wards.pyx":560
+ * 
+ *     if wards.num_players() != network.play_population:
+ *         errors.append(             # <<<<<<<<<<<<<<
+ *             f"Disagreement in the number of players: "
+ *             f"{network.play_population} versus "
+ */
+    if (unlikely(!__pyx_v_errors)) { __Pyx_RaiseUnboundLocalError("errors"); __PYX_ERR(0, 560, __pyx_L1_error) }
+
+    /* "metawards/utils/_network_wards.pyx":561
+ *     if wards.num_players() != network.play_population:
+ *         errors.append(
+ *             f"Disagreement in the number of players: "             # <<<<<<<<<<<<<<
+ *             f"{network.play_population} versus "
+ *             f"{wards.num_players()}")
+ */
+    __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 561, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_16 = 0;
+    __pyx_t_22 = 127;
+    __Pyx_INCREF(__pyx_kp_u_Disagreement_in_the_number_of_pl);
+    __pyx_t_16 += 39;
+    __Pyx_GIVEREF(__pyx_kp_u_Disagreement_in_the_number_of_pl);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_kp_u_Disagreement_in_the_number_of_pl);
+
+    /* "metawards/utils/_network_wards.pyx":562
+ *         errors.append(
+ *             f"Disagreement in the number of players: "
+ *             f"{network.play_population} versus "             # <<<<<<<<<<<<<<
+ *             f"{wards.num_players()}")
+ * 
+ */
+    __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_network, __pyx_n_s_play_population); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 562, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_19, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 562, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_22;
+    __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_INCREF(__pyx_kp_u_versus);
+    __pyx_t_16 += 8;
+    __Pyx_GIVEREF(__pyx_kp_u_versus);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_kp_u_versus);
+
+    /* "metawards/utils/_network_wards.pyx":563
+ *             f"Disagreement in the number of players: "
+ *             f"{network.play_population} versus "
+ *             f"{wards.num_players()}")             # <<<<<<<<<<<<<<
+ * 
+ *     if len(errors) > 0:
+ */
+    __pyx_t_19 = __Pyx_PyObject_GetAttrStr(__pyx_v_wards, __pyx_n_s_num_players); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 563, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_19))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_19);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_19);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_19, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_19, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_19);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 563, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    __pyx_t_19 = __Pyx_PyObject_FormatSimple(__pyx_t_5, __pyx_empty_unicode); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 563, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_22 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_19) > __pyx_t_22) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_19) : __pyx_t_22;
+    __pyx_t_16 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_19);
+    __Pyx_GIVEREF(__pyx_t_19);
+    PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_19);
+    __pyx_t_19 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":561
+ *     if wards.num_players() != network.play_population:
+ *         errors.append(
+ *             f"Disagreement in the number of players: "             # <<<<<<<<<<<<<<
+ *             f"{network.play_population} versus "
+ *             f"{wards.num_players()}")
+ */
+    __pyx_t_19 = __Pyx_PyUnicode_Join(__pyx_t_3, 4, __pyx_t_16, __pyx_t_22); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 561, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":560
+ * 
+ *     if wards.num_players() != network.play_population:
+ *         errors.append(             # <<<<<<<<<<<<<<
+ *             f"Disagreement in the number of players: "
+ *             f"{network.play_population} versus "
+ */
+    __pyx_t_20 = __Pyx_PyList_Append(__pyx_v_errors, __pyx_t_19); if (unlikely(__pyx_t_20 == ((int)-1))) __PYX_ERR(0, 560, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":559
+ *             f"{wards.num_workers()}")
+ * 
+ *     if wards.num_players() != network.play_population:             # <<<<<<<<<<<<<<
+ *         errors.append(
+ *             f"Disagreement in the number of players: "
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":565
+ *             f"{wards.num_players()}")
+ * 
+ *     if len(errors) > 0:             # <<<<<<<<<<<<<<
+ *         Console.error("\n".join(errors))
+ *         raise AssertionError("Disagreement in size of the population")
+ */
+  if (unlikely(!__pyx_v_errors)) { __Pyx_RaiseUnboundLocalError("errors"); __PYX_ERR(0, 565, __pyx_L1_error) }
+  __pyx_t_16 = PyList_GET_SIZE(__pyx_v_errors); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 565, __pyx_L1_error)
+  __pyx_t_2 = ((__pyx_t_16 > 0) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "metawards/utils/_network_wards.pyx":566
+ * 
+ *     if len(errors) > 0:
+ *         Console.error("\n".join(errors))             # <<<<<<<<<<<<<<
+ *         raise AssertionError("Disagreement in size of the population")
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_Console); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 566, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_error); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 566, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_v_errors)) { __Pyx_RaiseUnboundLocalError("errors"); __PYX_ERR(0, 566, __pyx_L1_error) }
+    __pyx_t_3 = PyUnicode_Join(__pyx_kp_u__12, __pyx_v_errors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 566, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_19 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 566, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+    /* "metawards/utils/_network_wards.pyx":567
+ *     if len(errors) > 0:
+ *         Console.error("\n".join(errors))
+ *         raise AssertionError("Disagreement in size of the population")             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+    __pyx_t_19 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 567, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_19);
+    __Pyx_Raise(__pyx_t_19, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    __PYX_ERR(0, 567, __pyx_L1_error)
+
+    /* "metawards/utils/_network_wards.pyx":565
+ *             f"{wards.num_players()}")
+ * 
+ *     if len(errors) > 0:             # <<<<<<<<<<<<<<
+ *         Console.error("\n".join(errors))
+ *         raise AssertionError("Disagreement in size of the population")
+ */
+  }
+
+  /* "metawards/utils/_network_wards.pyx":569
+ *         raise AssertionError("Disagreement in size of the population")
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_19 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 569, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_19);
+  __pyx_t_19 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":571
+ *     p = p.stop()
+ * 
+ *     p = p.stop()             # <<<<<<<<<<<<<<
+ * 
+ *     return wards
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_p, __pyx_n_s_stop); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_19 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF_SET(__pyx_v_p, __pyx_t_19);
+  __pyx_t_19 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":573
+ *     p = p.stop()
+ * 
+ *     return wards             # <<<<<<<<<<<<<<
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_wards);
+  __pyx_r = __pyx_v_wards;
+  goto __pyx_L0;
+
+  /* "metawards/utils/_network_wards.pyx":360
+ * 
+ * 
+ * def save_to_wards(network: Network, profiler: Profiler = None,             # <<<<<<<<<<<<<<
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_AddTraceback("metawards.utils._network_wards.save_to_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_NullProfiler);
+  __Pyx_XDECREF(__pyx_v_p);
+  __Pyx_XDECREF(__pyx_v_nodes);
+  __Pyx_XDECREF(__pyx_v_links);
+  __Pyx_XDECREF(__pyx_v_play);
+  __Pyx_XDECREF(__pyx_v_info);
+  __Pyx_XDECREF(__pyx_v_original_index);
+  __Pyx_XDECREF(__pyx_v_wards);
+  __Pyx_XDECREF(__pyx_v_self_weight);
+  __Pyx_XDECREF(__pyx_v_progress);
+  __Pyx_XDECREF(__pyx_v_task);
+  __Pyx_XDECREF(__pyx_v_ward);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_errors);
+  __Pyx_XDECREF(__pyx_v_w);
+  __Pyx_XDECREF(__pyx_v_profiler);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__network_wards(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__network_wards},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_network_wards",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_Assert_sane, __pyx_k_Assert_sane, sizeof(__pyx_k_Assert_sane), 0, 1, 0, 0},
+  {&__pyx_n_s_AssertionError, __pyx_k_AssertionError, sizeof(__pyx_k_AssertionError), 0, 0, 1, 1},
+  {&__pyx_kp_u_Cannot_mix_wards_with_X_Y_and_la, __pyx_k_Cannot_mix_wards_with_X_Y_and_la, sizeof(__pyx_k_Cannot_mix_wards_with_X_Y_and_la), 0, 1, 0, 0},
+  {&__pyx_n_s_Console, __pyx_k_Console, sizeof(__pyx_k_Console), 0, 0, 1, 1},
+  {&__pyx_kp_u_Convert_play_links, __pyx_k_Convert_play_links, sizeof(__pyx_k_Convert_play_links), 0, 1, 0, 0},
+  {&__pyx_kp_u_Convert_wards, __pyx_k_Convert_wards, sizeof(__pyx_k_Convert_wards), 0, 1, 0, 0},
+  {&__pyx_kp_u_Convert_work_links, __pyx_k_Convert_work_links, sizeof(__pyx_k_Convert_work_links), 0, 1, 0, 0},
+  {&__pyx_kp_u_Create_Wards, __pyx_k_Create_Wards, sizeof(__pyx_k_Create_Wards), 0, 1, 0, 0},
+  {&__pyx_kp_u_Disagreement_in_player_weights, __pyx_k_Disagreement_in_player_weights, sizeof(__pyx_k_Disagreement_in_player_weights), 0, 1, 0, 0},
+  {&__pyx_kp_u_Disagreement_in_population_sizes, __pyx_k_Disagreement_in_population_sizes, sizeof(__pyx_k_Disagreement_in_population_sizes), 0, 1, 0, 0},
+  {&__pyx_kp_u_Disagreement_in_size_of_the_popu, __pyx_k_Disagreement_in_size_of_the_popu, sizeof(__pyx_k_Disagreement_in_size_of_the_popu), 0, 1, 0, 0},
+  {&__pyx_kp_u_Disagreement_in_the_number_of_pl, __pyx_k_Disagreement_in_the_number_of_pl, sizeof(__pyx_k_Disagreement_in_the_number_of_pl), 0, 1, 0, 0},
+  {&__pyx_kp_u_Disagreement_in_the_number_of_wo, __pyx_k_Disagreement_in_the_number_of_wo, sizeof(__pyx_k_Disagreement_in_the_number_of_wo), 0, 1, 0, 0},
+  {&__pyx_n_s_Disease, __pyx_k_Disease, sizeof(__pyx_k_Disease), 0, 0, 1, 1},
+  {&__pyx_kp_u_Extracting_play_links, __pyx_k_Extracting_play_links, sizeof(__pyx_k_Extracting_play_links), 0, 1, 0, 0},
+  {&__pyx_kp_u_Extracting_wards, __pyx_k_Extracting_wards, sizeof(__pyx_k_Extracting_wards), 0, 1, 0, 0},
+  {&__pyx_kp_u_Extracting_work_links, __pyx_k_Extracting_work_links, sizeof(__pyx_k_Extracting_work_links), 0, 1, 0, 0},
+  {&__pyx_n_s_InputFiles, __pyx_k_InputFiles, sizeof(__pyx_k_InputFiles), 0, 0, 1, 1},
+  {&__pyx_kp_u_Invalid_link, __pyx_k_Invalid_link, sizeof(__pyx_k_Invalid_link), 0, 1, 0, 0},
+  {&__pyx_kp_u_Invalid_play_link, __pyx_k_Invalid_play_link, sizeof(__pyx_k_Invalid_play_link), 0, 1, 0, 0},
+  {&__pyx_n_s_Links, __pyx_k_Links, sizeof(__pyx_k_Links), 0, 0, 1, 1},
+  {&__pyx_kp_u_Lots_of_errors_Exiting_early, __pyx_k_Lots_of_errors_Exiting_early, sizeof(__pyx_k_Lots_of_errors_Exiting_early), 0, 1, 0, 0},
+  {&__pyx_n_s_Network, __pyx_k_Network, sizeof(__pyx_k_Network), 0, 0, 1, 1},
+  {&__pyx_n_s_Nodes, __pyx_k_Nodes, sizeof(__pyx_k_Nodes), 0, 0, 1, 1},
+  {&__pyx_n_s_NullProfiler, __pyx_k_NullProfiler, sizeof(__pyx_k_NullProfiler), 0, 0, 1, 1},
+  {&__pyx_n_s_Parameters, __pyx_k_Parameters, sizeof(__pyx_k_Parameters), 0, 0, 1, 1},
+  {&__pyx_kp_u_Players, __pyx_k_Players, sizeof(__pyx_k_Players), 0, 1, 0, 0},
+  {&__pyx_n_s_Profiler, __pyx_k_Profiler, sizeof(__pyx_k_Profiler), 0, 0, 1, 1},
+  {&__pyx_kp_u_Program_bug_Disagreement_between, __pyx_k_Program_bug_Disagreement_between, sizeof(__pyx_k_Program_bug_Disagreement_between), 0, 1, 0, 0},
+  {&__pyx_kp_u_The_parameters_must_be_Parameter, __pyx_k_The_parameters_must_be_Parameter, sizeof(__pyx_k_The_parameters_must_be_Parameter), 0, 1, 0, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_Ward, __pyx_k_Ward, sizeof(__pyx_k_Ward), 0, 0, 1, 1},
+  {&__pyx_n_s_WardInfos, __pyx_k_WardInfos, sizeof(__pyx_k_WardInfos), 0, 0, 1, 1},
+  {&__pyx_kp_u_Ward_2, __pyx_k_Ward_2, sizeof(__pyx_k_Ward_2), 0, 1, 0, 0},
+  {&__pyx_n_s_Wards, __pyx_k_Wards, sizeof(__pyx_k_Wards), 0, 0, 1, 1},
+  {&__pyx_kp_u_Workers, __pyx_k_Workers, sizeof(__pyx_k_Workers), 0, 1, 0, 0},
+  {&__pyx_kp_u__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 1, 0, 0},
+  {&__pyx_kp_u__12, __pyx_k__12, sizeof(__pyx_k__12), 0, 1, 0, 0},
+  {&__pyx_kp_u__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 1, 0, 0},
+  {&__pyx_kp_u__8, __pyx_k__8, sizeof(__pyx_k__8), 0, 1, 0, 0},
+  {&__pyx_kp_u__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0, 0},
+  {&__pyx_n_s_add_player_weight, __pyx_k_add_player_weight, sizeof(__pyx_k_add_player_weight), 0, 0, 1, 1},
+  {&__pyx_n_s_add_task, __pyx_k_add_task, sizeof(__pyx_k_add_task), 0, 0, 1, 1},
+  {&__pyx_n_s_add_wards_network_distance, __pyx_k_add_wards_network_distance, sizeof(__pyx_k_add_wards_network_distance), 0, 0, 1, 1},
+  {&__pyx_n_s_add_workers, __pyx_k_add_workers, sizeof(__pyx_k_add_workers), 0, 0, 1, 1},
+  {&__pyx_n_s_all, __pyx_k_all, sizeof(__pyx_k_all), 0, 0, 1, 1},
+  {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
+  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
+  {&__pyx_n_s_assert_sane, __pyx_k_assert_sane, sizeof(__pyx_k_assert_sane), 0, 0, 1, 1},
+  {&__pyx_n_s_auto_assign, __pyx_k_auto_assign, sizeof(__pyx_k_auto_assign), 0, 0, 1, 1},
+  {&__pyx_n_s_auto_assign_players, __pyx_k_auto_assign_players, sizeof(__pyx_k_auto_assign_players), 0, 0, 1, 1},
+  {&__pyx_n_s_begin_p, __pyx_k_begin_p, sizeof(__pyx_k_begin_p), 0, 0, 1, 1},
+  {&__pyx_n_s_begin_to, __pyx_k_begin_to, sizeof(__pyx_k_begin_to), 0, 0, 1, 1},
+  {&__pyx_n_s_bg_foi, __pyx_k_bg_foi, sizeof(__pyx_k_bg_foi), 0, 0, 1, 1},
+  {&__pyx_kp_u_bold_Network_loaded_Population, __pyx_k_bold_Network_loaded_Population, sizeof(__pyx_k_bold_Network_loaded_Population), 0, 1, 0, 0},
+  {&__pyx_n_s_calc_network_distance, __pyx_k_calc_network_distance, sizeof(__pyx_k_calc_network_distance), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_columns, __pyx_k_columns, sizeof(__pyx_k_columns), 0, 0, 1, 1},
+  {&__pyx_n_s_completed, __pyx_k_completed, sizeof(__pyx_k_completed), 0, 0, 1, 1},
+  {&__pyx_n_s_console, __pyx_k_console, sizeof(__pyx_k_console), 0, 0, 1, 1},
+  {&__pyx_kp_u_convert_nodes, __pyx_k_convert_nodes, sizeof(__pyx_k_convert_nodes), 0, 1, 0, 0},
+  {&__pyx_kp_u_convert_play_links, __pyx_k_convert_play_links, sizeof(__pyx_k_convert_play_links), 0, 1, 0, 0},
+  {&__pyx_kp_u_convert_work_links, __pyx_k_convert_work_links, sizeof(__pyx_k_convert_work_links), 0, 1, 0, 0},
+  {&__pyx_n_s_coordinates, __pyx_k_coordinates, sizeof(__pyx_k_coordinates), 0, 0, 1, 1},
+  {&__pyx_n_s_copy, __pyx_k_copy, sizeof(__pyx_k_copy), 0, 0, 1, 1},
+  {&__pyx_n_s_custom, __pyx_k_custom, sizeof(__pyx_k_custom), 0, 0, 1, 1},
+  {&__pyx_n_s_custom_params, __pyx_k_custom_params, sizeof(__pyx_k_custom_params), 0, 0, 1, 1},
+  {&__pyx_n_s_cutoff, __pyx_k_cutoff, sizeof(__pyx_k_cutoff), 0, 0, 1, 1},
+  {&__pyx_n_s_deepcopy, __pyx_k_deepcopy, sizeof(__pyx_k_deepcopy), 0, 0, 1, 1},
+  {&__pyx_n_s_destination, __pyx_k_destination, sizeof(__pyx_k_destination), 0, 0, 1, 1},
+  {&__pyx_n_s_diff, __pyx_k_diff, sizeof(__pyx_k_diff), 0, 0, 1, 1},
+  {&__pyx_n_s_disease, __pyx_k_disease, sizeof(__pyx_k_disease), 0, 0, 1, 1},
+  {&__pyx_n_s_disease_2, __pyx_k_disease_2, sizeof(__pyx_k_disease_2), 0, 0, 1, 1},
+  {&__pyx_n_s_dyn_dist_cutoff, __pyx_k_dyn_dist_cutoff, sizeof(__pyx_k_dyn_dist_cutoff), 0, 0, 1, 1},
+  {&__pyx_n_s_end_p, __pyx_k_end_p, sizeof(__pyx_k_end_p), 0, 0, 1, 1},
+  {&__pyx_n_s_end_to, __pyx_k_end_to, sizeof(__pyx_k_end_to), 0, 0, 1, 1},
+  {&__pyx_n_s_enter, __pyx_k_enter, sizeof(__pyx_k_enter), 0, 0, 1, 1},
+  {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
+  {&__pyx_n_s_errors, __pyx_k_errors, sizeof(__pyx_k_errors), 0, 0, 1, 1},
+  {&__pyx_n_s_exit, __pyx_k_exit, sizeof(__pyx_k_exit), 0, 0, 1, 1},
+  {&__pyx_n_s_force_update, __pyx_k_force_update, sizeof(__pyx_k_force_update), 0, 0, 1, 1},
+  {&__pyx_n_s_get_custom, __pyx_k_get_custom, sizeof(__pyx_k_get_custom), 0, 0, 1, 1},
+  {&__pyx_n_s_get_infos, __pyx_k_get_infos, sizeof(__pyx_k_get_infos), 0, 0, 1, 1},
+  {&__pyx_n_s_get_min_max_distances, __pyx_k_get_min_max_distances, sizeof(__pyx_k_get_min_max_distances), 0, 0, 1, 1},
+  {&__pyx_n_s_get_players, __pyx_k_get_players, sizeof(__pyx_k_get_players), 0, 0, 1, 1},
+  {&__pyx_n_s_has_self, __pyx_k_has_self, sizeof(__pyx_k_has_self), 0, 0, 1, 1},
+  {&__pyx_n_s_have_coords, __pyx_k_have_coords, sizeof(__pyx_k_have_coords), 0, 0, 1, 1},
+  {&__pyx_n_s_have_info, __pyx_k_have_info, sizeof(__pyx_k_have_info), 0, 0, 1, 1},
+  {&__pyx_n_s_have_latlong, __pyx_k_have_latlong, sizeof(__pyx_k_have_latlong), 0, 0, 1, 1},
+  {&__pyx_n_s_have_xy, __pyx_k_have_xy, sizeof(__pyx_k_have_xy), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_u_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 1, 0, 1},
+  {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
+  {&__pyx_n_s_ifrom, __pyx_k_ifrom, sizeof(__pyx_k_ifrom), 0, 0, 1, 1},
+  {&__pyx_n_s_ilink, __pyx_k_ilink, sizeof(__pyx_k_ilink), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_info, __pyx_k_info, sizeof(__pyx_k_info), 0, 0, 1, 1},
+  {&__pyx_n_s_input_files, __pyx_k_input_files, sizeof(__pyx_k_input_files), 0, 0, 1, 1},
+  {&__pyx_n_s_inputfiles, __pyx_k_inputfiles, sizeof(__pyx_k_inputfiles), 0, 0, 1, 1},
+  {&__pyx_n_s_insert, __pyx_k_insert, sizeof(__pyx_k_insert), 0, 0, 1, 1},
+  {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_n_s_ito, __pyx_k_ito, sizeof(__pyx_k_ito), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_key, __pyx_k_key, sizeof(__pyx_k_key), 0, 0, 1, 1},
+  {&__pyx_n_u_km, __pyx_k_km, sizeof(__pyx_k_km), 0, 1, 0, 1},
+  {&__pyx_n_s_label, __pyx_k_label, sizeof(__pyx_k_label), 0, 0, 1, 1},
+  {&__pyx_n_s_lat, __pyx_k_lat, sizeof(__pyx_k_lat), 0, 0, 1, 1},
+  {&__pyx_kp_u_lat_long, __pyx_k_lat_long, sizeof(__pyx_k_lat_long), 0, 1, 0, 0},
+  {&__pyx_n_s_links, __pyx_k_links, sizeof(__pyx_k_links), 0, 0, 1, 1},
+  {&__pyx_n_s_links_2, __pyx_k_links_2, sizeof(__pyx_k_links_2), 0, 0, 1, 1},
+  {&__pyx_n_s_links_ifrom, __pyx_k_links_ifrom, sizeof(__pyx_k_links_ifrom), 0, 0, 1, 1},
+  {&__pyx_n_s_links_ito, __pyx_k_links_ito, sizeof(__pyx_k_links_ito), 0, 0, 1, 1},
+  {&__pyx_n_s_links_suscept, __pyx_k_links_suscept, sizeof(__pyx_k_links_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_links_weight, __pyx_k_links_weight, sizeof(__pyx_k_links_weight), 0, 0, 1, 1},
+  {&__pyx_n_s_load, __pyx_k_load, sizeof(__pyx_k_load), 0, 0, 1, 1},
+  {&__pyx_n_s_load_from_wards, __pyx_k_load_from_wards, sizeof(__pyx_k_load_from_wards), 0, 0, 1, 1},
+  {&__pyx_n_u_load_from_wards, __pyx_k_load_from_wards, sizeof(__pyx_k_load_from_wards), 0, 1, 0, 1},
+  {&__pyx_n_s_long, __pyx_k_long, sizeof(__pyx_k_long), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_markup, __pyx_k_markup, sizeof(__pyx_k_markup), 0, 0, 1, 1},
+  {&__pyx_n_s_max_links, __pyx_k_max_links, sizeof(__pyx_k_max_links), 0, 0, 1, 1},
+  {&__pyx_n_s_max_nodes, __pyx_k_max_nodes, sizeof(__pyx_k_max_nodes), 0, 0, 1, 1},
+  {&__pyx_n_s_maxdist, __pyx_k_maxdist, sizeof(__pyx_k_maxdist), 0, 0, 1, 1},
+  {&__pyx_n_s_metawards_utils__network_wards, __pyx_k_metawards_utils__network_wards, sizeof(__pyx_k_metawards_utils__network_wards), 0, 0, 1, 1},
+  {&__pyx_n_s_mindist, __pyx_k_mindist, sizeof(__pyx_k_mindist), 0, 0, 1, 1},
+  {&__pyx_n_s_move_from_play_to_work, __pyx_k_move_from_play_to_work, sizeof(__pyx_k_move_from_play_to_work), 0, 0, 1, 1},
+  {&__pyx_n_u_move_from_play_to_work, __pyx_k_move_from_play_to_work, sizeof(__pyx_k_move_from_play_to_work), 0, 1, 0, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_need_deep_copy, __pyx_k_need_deep_copy, sizeof(__pyx_k_need_deep_copy), 0, 0, 1, 1},
+  {&__pyx_n_s_need_self, __pyx_k_need_self, sizeof(__pyx_k_need_self), 0, 0, 1, 1},
+  {&__pyx_n_s_network, __pyx_k_network, sizeof(__pyx_k_network), 0, 0, 1, 1},
+  {&__pyx_n_s_network_2, __pyx_k_network_2, sizeof(__pyx_k_network_2), 0, 0, 1, 1},
+  {&__pyx_n_s_nlinks, __pyx_k_nlinks, sizeof(__pyx_k_nlinks), 0, 0, 1, 1},
+  {&__pyx_n_s_nnodes, __pyx_k_nnodes, sizeof(__pyx_k_nnodes), 0, 0, 1, 1},
+  {&__pyx_n_s_nnodes_plus_one, __pyx_k_nnodes_plus_one, sizeof(__pyx_k_nnodes_plus_one), 0, 0, 1, 1},
+  {&__pyx_n_s_node_index, __pyx_k_node_index, sizeof(__pyx_k_node_index), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes, __pyx_k_nodes, sizeof(__pyx_k_nodes), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_2, __pyx_k_nodes_2, sizeof(__pyx_k_nodes_2), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_begin_p, __pyx_k_nodes_begin_p, sizeof(__pyx_k_nodes_begin_p), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_begin_to, __pyx_k_nodes_begin_to, sizeof(__pyx_k_nodes_begin_to), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_bg_foi, __pyx_k_nodes_bg_foi, sizeof(__pyx_k_nodes_bg_foi), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_custom, __pyx_k_nodes_custom, sizeof(__pyx_k_nodes_custom), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_cutoff, __pyx_k_nodes_cutoff, sizeof(__pyx_k_nodes_cutoff), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_end_p, __pyx_k_nodes_end_p, sizeof(__pyx_k_nodes_end_p), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_end_to, __pyx_k_nodes_end_to, sizeof(__pyx_k_nodes_end_to), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_label, __pyx_k_nodes_label, sizeof(__pyx_k_nodes_label), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_play_suscept, __pyx_k_nodes_play_suscept, sizeof(__pyx_k_nodes_play_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_save_play_suscept, __pyx_k_nodes_save_play_suscept, sizeof(__pyx_k_nodes_save_play_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_scale_uv, __pyx_k_nodes_scale_uv, sizeof(__pyx_k_nodes_scale_uv), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_self_p, __pyx_k_nodes_self_p, sizeof(__pyx_k_nodes_self_p), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_self_w, __pyx_k_nodes_self_w, sizeof(__pyx_k_nodes_self_w), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_x, __pyx_k_nodes_x, sizeof(__pyx_k_nodes_x), 0, 0, 1, 1},
+  {&__pyx_n_s_nodes_y, __pyx_k_nodes_y, sizeof(__pyx_k_nodes_y), 0, 0, 1, 1},
+  {&__pyx_n_s_nplay, __pyx_k_nplay, sizeof(__pyx_k_nplay), 0, 0, 1, 1},
+  {&__pyx_n_s_nplayers, __pyx_k_nplayers, sizeof(__pyx_k_nplayers), 0, 0, 1, 1},
+  {&__pyx_n_s_nthreads, __pyx_k_nthreads, sizeof(__pyx_k_nthreads), 0, 0, 1, 1},
+  {&__pyx_n_s_num_players, __pyx_k_num_players, sizeof(__pyx_k_num_players), 0, 0, 1, 1},
+  {&__pyx_n_s_num_workers, __pyx_k_num_workers, sizeof(__pyx_k_num_workers), 0, 0, 1, 1},
+  {&__pyx_n_s_number, __pyx_k_number, sizeof(__pyx_k_number), 0, 0, 1, 1},
+  {&__pyx_kp_u_or_players, __pyx_k_or_players, sizeof(__pyx_k_or_players), 0, 1, 0, 0},
+  {&__pyx_n_s_original_index, __pyx_k_original_index, sizeof(__pyx_k_original_index), 0, 0, 1, 1},
+  {&__pyx_n_s_original_index_2, __pyx_k_original_index_2, sizeof(__pyx_k_original_index_2), 0, 0, 1, 1},
+  {&__pyx_n_s_p, __pyx_k_p, sizeof(__pyx_k_p), 0, 0, 1, 1},
+  {&__pyx_n_s_parameters, __pyx_k_parameters, sizeof(__pyx_k_parameters), 0, 0, 1, 1},
+  {&__pyx_n_s_params, __pyx_k_params, sizeof(__pyx_k_params), 0, 0, 1, 1},
+  {&__pyx_n_s_play, __pyx_k_play, sizeof(__pyx_k_play), 0, 0, 1, 1},
+  {&__pyx_n_s_play_begin, __pyx_k_play_begin, sizeof(__pyx_k_play_begin), 0, 0, 1, 1},
+  {&__pyx_n_s_play_dest, __pyx_k_play_dest, sizeof(__pyx_k_play_dest), 0, 0, 1, 1},
+  {&__pyx_n_s_play_ifrom, __pyx_k_play_ifrom, sizeof(__pyx_k_play_ifrom), 0, 0, 1, 1},
+  {&__pyx_n_s_play_ito, __pyx_k_play_ito, sizeof(__pyx_k_play_ito), 0, 0, 1, 1},
+  {&__pyx_n_s_play_population, __pyx_k_play_population, sizeof(__pyx_k_play_population), 0, 0, 1, 1},
+  {&__pyx_n_s_play_suscept, __pyx_k_play_suscept, sizeof(__pyx_k_play_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_play_weight, __pyx_k_play_weight, sizeof(__pyx_k_play_weight), 0, 0, 1, 1},
+  {&__pyx_n_s_play_weights, __pyx_k_play_weights, sizeof(__pyx_k_play_weights), 0, 0, 1, 1},
+  {&__pyx_n_s_player_total, __pyx_k_player_total, sizeof(__pyx_k_player_total), 0, 0, 1, 1},
+  {&__pyx_n_s_population, __pyx_k_population, sizeof(__pyx_k_population), 0, 0, 1, 1},
+  {&__pyx_n_s_pos_a, __pyx_k_pos_a, sizeof(__pyx_k_pos_a), 0, 0, 1, 1},
+  {&__pyx_n_s_pos_b, __pyx_k_pos_b, sizeof(__pyx_k_pos_b), 0, 0, 1, 1},
+  {&__pyx_n_s_pos_type, __pyx_k_pos_type, sizeof(__pyx_k_pos_type), 0, 0, 1, 1},
+  {&__pyx_n_s_present, __pyx_k_present, sizeof(__pyx_k_present), 0, 0, 1, 1},
+  {&__pyx_n_s_print, __pyx_k_print, sizeof(__pyx_k_print), 0, 0, 1, 1},
+  {&__pyx_n_s_profiler, __pyx_k_profiler, sizeof(__pyx_k_profiler), 0, 0, 1, 1},
+  {&__pyx_n_s_profiler_2, __pyx_k_profiler_2, sizeof(__pyx_k_profiler_2), 0, 0, 1, 1},
+  {&__pyx_n_s_progress, __pyx_k_progress, sizeof(__pyx_k_progress), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_rescale_play_matrix, __pyx_k_rescale_play_matrix, sizeof(__pyx_k_rescale_play_matrix), 0, 0, 1, 1},
+  {&__pyx_n_u_rescale_play_matrix, __pyx_k_rescale_play_matrix, sizeof(__pyx_k_rescale_play_matrix), 0, 1, 0, 1},
+  {&__pyx_n_s_reset_everything, __pyx_k_reset_everything, sizeof(__pyx_k_reset_everything), 0, 0, 1, 1},
+  {&__pyx_n_u_reset_everything, __pyx_k_reset_everything, sizeof(__pyx_k_reset_everything), 0, 1, 0, 1},
+  {&__pyx_n_s_save_play_suscept, __pyx_k_save_play_suscept, sizeof(__pyx_k_save_play_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_save_to_wards, __pyx_k_save_to_wards, sizeof(__pyx_k_save_to_wards), 0, 0, 1, 1},
+  {&__pyx_n_u_save_to_wards, __pyx_k_save_to_wards, sizeof(__pyx_k_save_to_wards), 0, 1, 0, 1},
+  {&__pyx_n_s_scale_uv, __pyx_k_scale_uv, sizeof(__pyx_k_scale_uv), 0, 0, 1, 1},
+  {&__pyx_n_s_self_p, __pyx_k_self_p, sizeof(__pyx_k_self_p), 0, 0, 1, 1},
+  {&__pyx_n_s_self_w, __pyx_k_self_w, sizeof(__pyx_k_self_w), 0, 0, 1, 1},
+  {&__pyx_n_s_self_weight, __pyx_k_self_weight, sizeof(__pyx_k_self_weight), 0, 0, 1, 1},
+  {&__pyx_n_s_set_bg_foi, __pyx_k_set_bg_foi, sizeof(__pyx_k_set_bg_foi), 0, 0, 1, 1},
+  {&__pyx_n_s_set_custom, __pyx_k_set_custom, sizeof(__pyx_k_set_custom), 0, 0, 1, 1},
+  {&__pyx_n_s_set_cutoff, __pyx_k_set_cutoff, sizeof(__pyx_k_set_cutoff), 0, 0, 1, 1},
+  {&__pyx_n_s_set_disease, __pyx_k_set_disease, sizeof(__pyx_k_set_disease), 0, 0, 1, 1},
+  {&__pyx_n_s_set_info, __pyx_k_set_info, sizeof(__pyx_k_set_info), 0, 0, 1, 1},
+  {&__pyx_n_s_set_num_players, __pyx_k_set_num_players, sizeof(__pyx_k_set_num_players), 0, 0, 1, 1},
+  {&__pyx_n_s_set_position, __pyx_k_set_position, sizeof(__pyx_k_set_position), 0, 0, 1, 1},
+  {&__pyx_n_s_set_scale_uv, __pyx_k_set_scale_uv, sizeof(__pyx_k_set_scale_uv), 0, 0, 1, 1},
+  {&__pyx_n_s_silent, __pyx_k_silent, sizeof(__pyx_k_silent), 0, 0, 1, 1},
+  {&__pyx_kp_s_src_metawards_utils__network_war, __pyx_k_src_metawards_utils__network_war, sizeof(__pyx_k_src_metawards_utils__network_war), 0, 0, 1, 0},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
+  {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
+  {&__pyx_n_s_suscept, __pyx_k_suscept, sizeof(__pyx_k_suscept), 0, 0, 1, 1},
+  {&__pyx_n_s_task, __pyx_k_task, sizeof(__pyx_k_task), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_to_columns, __pyx_k_to_columns, sizeof(__pyx_k_to_columns), 0, 0, 1, 1},
+  {&__pyx_n_u_to_columns, __pyx_k_to_columns, sizeof(__pyx_k_to_columns), 0, 1, 0, 1},
+  {&__pyx_n_s_to_original, __pyx_k_to_original, sizeof(__pyx_k_to_original), 0, 0, 1, 1},
+  {&__pyx_n_s_total, __pyx_k_total, sizeof(__pyx_k_total), 0, 0, 1, 1},
+  {&__pyx_n_s_units, __pyx_k_units, sizeof(__pyx_k_units), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_n_s_update_freq, __pyx_k_update_freq, sizeof(__pyx_k_update_freq), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_values, __pyx_k_values, sizeof(__pyx_k_values), 0, 0, 1, 1},
+  {&__pyx_kp_u_versus, __pyx_k_versus, sizeof(__pyx_k_versus), 0, 1, 0, 0},
+  {&__pyx_kp_u_vs, __pyx_k_vs, sizeof(__pyx_k_vs), 0, 1, 0, 0},
+  {&__pyx_n_s_w, __pyx_k_w, sizeof(__pyx_k_w), 0, 0, 1, 1},
+  {&__pyx_kp_u_ward, __pyx_k_ward, sizeof(__pyx_k_ward), 0, 1, 0, 0},
+  {&__pyx_n_s_ward_2, __pyx_k_ward_2, sizeof(__pyx_k_ward_2), 0, 0, 1, 1},
+  {&__pyx_n_s_ward_3, __pyx_k_ward_3, sizeof(__pyx_k_ward_3), 0, 0, 1, 1},
+  {&__pyx_n_s_ward_bg_foi, __pyx_k_ward_bg_foi, sizeof(__pyx_k_ward_bg_foi), 0, 0, 1, 1},
+  {&__pyx_n_s_ward_custom, __pyx_k_ward_custom, sizeof(__pyx_k_ward_custom), 0, 0, 1, 1},
+  {&__pyx_n_s_ward_cutoff, __pyx_k_ward_cutoff, sizeof(__pyx_k_ward_cutoff), 0, 0, 1, 1},
+  {&__pyx_n_s_ward_scale_uv, __pyx_k_ward_scale_uv, sizeof(__pyx_k_ward_scale_uv), 0, 0, 1, 1},
+  {&__pyx_n_s_wardinfo, __pyx_k_wardinfo, sizeof(__pyx_k_wardinfo), 0, 0, 1, 1},
+  {&__pyx_n_s_wards, __pyx_k_wards, sizeof(__pyx_k_wards), 0, 0, 1, 1},
+  {&__pyx_n_s_wards_2, __pyx_k_wards_2, sizeof(__pyx_k_wards_2), 0, 0, 1, 1},
+  {&__pyx_n_s_weight, __pyx_k_weight, sizeof(__pyx_k_weight), 0, 0, 1, 1},
+  {&__pyx_kp_u_weight_disagreement, __pyx_k_weight_disagreement, sizeof(__pyx_k_weight_disagreement), 0, 1, 0, 0},
+  {&__pyx_kp_u_which_means_that_there_is_a_dat, __pyx_k_which_means_that_there_is_a_dat, sizeof(__pyx_k_which_means_that_there_is_a_dat), 0, 1, 0, 0},
+  {&__pyx_n_s_work_begin, __pyx_k_work_begin, sizeof(__pyx_k_work_begin), 0, 0, 1, 1},
+  {&__pyx_n_s_work_dest, __pyx_k_work_dest, sizeof(__pyx_k_work_dest), 0, 0, 1, 1},
+  {&__pyx_n_s_work_number, __pyx_k_work_number, sizeof(__pyx_k_work_number), 0, 0, 1, 1},
+  {&__pyx_n_s_work_population, __pyx_k_work_population, sizeof(__pyx_k_work_population), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_kp_u_x_y, __pyx_k_x_y, sizeof(__pyx_k_x_y), 0, 1, 0, 0},
+  {&__pyx_n_s_xy_coords, __pyx_k_xy_coords, sizeof(__pyx_k_xy_coords), 0, 0, 1, 1},
+  {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_n_s_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(0, 353, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "metawards/utils/_network_wards.pyx":37
+ *     else:
+ *         if not isinstance(params, Parameters):
+ *             raise TypeError(f"The parameters must be Parameters!")             # <<<<<<<<<<<<<<
+ * 
+ *         from copy import deepcopy
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_The_parameters_must_be_Parameter); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "metawards/utils/_network_wards.pyx":148
+ * 
+ *     if have_xy and have_latlong:
+ *         raise ValueError(             # <<<<<<<<<<<<<<
+ *             "Cannot mix wards with X/Y and lat/long coordinates")
+ *     elif have_xy:
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Cannot_mix_wards_with_X_Y_and_la); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "metawards/utils/_network_wards.pyx":353
+ *             f"which means that there is a data corruption somewhere...")
+ * 
+ *         raise AssertionError("Disagreement in population sizes")             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Disagreement_in_population_sizes); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "metawards/utils/_network_wards.pyx":424
+ *     p = p.start("Convert wards")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(1, nnodes_plus_one):
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Extracting_wards); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "metawards/utils/_network_wards.pyx":423
+ * 
+ *     p = p.start("Convert wards")
+ *     with Console.progress() as progress:             # <<<<<<<<<<<<<<
+ *         task = progress.add_task("Extracting wards", total=nnodes_plus_one)
+ * 
+ */
+  __pyx_tuple__6 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "metawards/utils/_network_wards.pyx":458
+ *     p = p.start("Convert work links")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting work links", total=nlinks)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(0, nlinks):
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Extracting_work_links); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "metawards/utils/_network_wards.pyx":486
+ *     p = p.start("Convert play links")
+ *     with Console.progress() as progress:
+ *         task = progress.add_task("Extracting play links", total=nplay)             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(0, nplay):
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_Extracting_play_links); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 486, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "metawards/utils/_network_wards.pyx":534
+ *         if len(errors) > 0:
+ *             Console.error("\n".join(errors))
+ *             raise AssertionError("Disagreement in player weights")             # <<<<<<<<<<<<<<
+ * 
+ *         progress.update(task, completed=nlinks, force_update=True)
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_Disagreement_in_player_weights); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "metawards/utils/_network_wards.pyx":541
+ *     if network._node_index is not None:
+ *         # return the wards in their original order
+ *         wards = [None] + [wards[i] for i in network._node_index[1:]]             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.start("Create Wards")
+ */
+  __pyx_slice__14 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__14)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__14);
+  __Pyx_GIVEREF(__pyx_slice__14);
+
+  /* "metawards/utils/_network_wards.pyx":567
+ *     if len(errors) > 0:
+ *         Console.error("\n".join(errors))
+ *         raise AssertionError("Disagreement in size of the population")             # <<<<<<<<<<<<<<
+ * 
+ *     p = p.stop()
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_u_Disagreement_in_size_of_the_popu); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 567, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "metawards/utils/_network_wards.pyx":19
+ * 
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,             # <<<<<<<<<<<<<<
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,
+ */
+  __pyx_tuple__16 = PyTuple_Pack(71, __pyx_n_s_wards, __pyx_n_s_params, __pyx_n_s_disease, __pyx_n_s_profiler, __pyx_n_s_nthreads, __pyx_n_s_NullProfiler, __pyx_n_s_deepcopy, __pyx_n_s_InputFiles, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_nnodes_plus_one, __pyx_n_s_p, __pyx_n_s_columns, __pyx_n_s_nodes, __pyx_n_s_nlinks, __pyx_n_s_nplay, __pyx_n_s_present, __pyx_n_s_auto_assign, __pyx_n_s_nplayers, __pyx_n_s_player_total, __pyx_n_s_pos_type, __pyx_n_s_pos_a, __pyx_n_s_pos_b, __pyx_n_s_ward_scale_uv, __pyx_n_s_ward_cutoff, __pyx_n_s_ward_bg_foi, __pyx_n_s_work_begin, __pyx_n_s_work_dest, __pyx_n_s_work_number, __pyx_n_s_play_begin, __pyx_n_s_play_dest, __pyx_n_s_play_weights, __pyx_n_s_nodes_label, __pyx_n_s_nodes_begin_to, __pyx_n_s_nodes_end_to, __pyx_n_s_nodes_self_w, __pyx_n_s_nodes_play_suscept, __pyx_n_s_nodes_save_play_suscept, __pyx_n_s_nodes_scale_uv, __pyx_n_s_nodes_cutoff, __pyx_n_s_nodes_bg_foi, __pyx_n_s_nodes_custom, __pyx_n_s_ward_custom, __pyx_n_s_nodes_begin_p, __pyx_n_s_nodes_end_p, __pyx_n_s_nodes_self_p, __pyx_n_s_nodes_x, __pyx_n_s_nodes_y, __pyx_n_s_have_xy, __pyx_n_s_have_latlong, __pyx_n_s_key, __pyx_n_s_values, __pyx_n_s_info, __pyx_n_s_links, __pyx_n_s_ilink, __pyx_n_s_links_ito, __pyx_n_s_links_ifrom, __pyx_n_s_links_suscept, __pyx_n_s_links_weight, __pyx_n_s_has_self, __pyx_n_s_play, __pyx_n_s_play_ifrom, __pyx_n_s_play_ito, __pyx_n_s_play_suscept, __pyx_n_s_play_weight, __pyx_n_s_need_self, __pyx_n_s_network, __pyx_n_s_WardInfos, __pyx_n_s_calc_network_distance, __pyx_n_s_mindist, __pyx_n_s_maxdist); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(5, 0, 71, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_metawards_utils__network_war, __pyx_n_s_load_from_wards, 19, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 19, __pyx_L1_error)
+
+  /* "metawards/utils/_network_wards.pyx":360
+ * 
+ * 
+ * def save_to_wards(network: Network, profiler: Profiler = None,             # <<<<<<<<<<<<<<
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ */
+  __pyx_tuple__18 = PyTuple_Pack(48, __pyx_n_s_network, __pyx_n_s_profiler, __pyx_n_s_nthreads, __pyx_n_s_NullProfiler, __pyx_n_s_p, __pyx_n_s_nodes, __pyx_n_s_links, __pyx_n_s_play, __pyx_n_s_info, __pyx_n_s_nodes_label, __pyx_n_s_nodes_save_play_suscept, __pyx_n_s_nodes_x, __pyx_n_s_nodes_y, __pyx_n_s_nodes_scale_uv, __pyx_n_s_nodes_cutoff, __pyx_n_s_nodes_bg_foi, __pyx_n_s_nodes_custom, __pyx_n_s_links_ifrom, __pyx_n_s_links_ito, __pyx_n_s_links_weight, __pyx_n_s_play_ifrom, __pyx_n_s_play_ito, __pyx_n_s_play_weight, __pyx_n_s_nnodes, __pyx_n_s_nnodes_plus_one, __pyx_n_s_nlinks, __pyx_n_s_nplay, __pyx_n_s_original_index_2, __pyx_n_s_to_original, __pyx_n_s_have_info, __pyx_n_s_have_coords, __pyx_n_s_xy_coords, __pyx_n_s_wards, __pyx_n_s_self_weight, __pyx_n_s_i, __pyx_n_s_update_freq, __pyx_n_s_ifrom, __pyx_n_s_ito, __pyx_n_s_weight, __pyx_n_s_diff, __pyx_n_s_progress, __pyx_n_s_task, __pyx_n_s_ward_3, __pyx_n_s_key, __pyx_n_s_value, __pyx_n_s_errors, __pyx_n_s_w, __pyx_n_s_i); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 48, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_metawards_utils__network_war, __pyx_n_s_save_to_wards, 360, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  /* AssertionsEnabled.init */
+  __Pyx_init_assertions_enabled();
+
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 2, __pyx_L1_error)
+
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_float_1_0 = PyFloat_FromDouble(1.0); if (unlikely(!__pyx_float_1_0)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("metawards.utils._get_array_ptr"); if (!__pyx_t_1) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "get_double_array_ptr", (void (**)(void))&__pyx_f_9metawards_5utils_14_get_array_ptr_get_double_array_ptr, "double *(PyObject *)") < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "get_int_array_ptr", (void (**)(void))&__pyx_f_9metawards_5utils_14_get_array_ptr_get_int_array_ptr, "int *(PyObject *)") < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_network_wards(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_network_wards(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__network_wards(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__network_wards(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__network_wards(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_network_wards' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__network_wards(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 2, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_network_wards", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 2, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 2, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 2, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_metawards__utils___network_wards) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 2, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "metawards.utils._network_wards")) {
+      if (unlikely(PyDict_SetItemString(modules, "metawards.utils._network_wards", __pyx_m) < 0)) __PYX_ERR(0, 2, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 2, __pyx_L1_error)
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  #endif
+
+  /* "metawards/utils/_network_wards.pyx":2
+ * 
+ * from array import array             # <<<<<<<<<<<<<<
+ * 
+ * from .._network import Network
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_array);
+  __Pyx_GIVEREF(__pyx_n_s_array);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_array);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_array, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_array, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":4
+ * from array import array
+ * 
+ * from .._network import Network             # <<<<<<<<<<<<<<
+ * from .._parameters import Parameters
+ * from .._disease import Disease
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Network);
+  __Pyx_GIVEREF(__pyx_n_s_Network);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Network);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_network_2, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Network); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Network, __pyx_t_2) < 0) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":5
+ * 
+ * from .._network import Network
+ * from .._parameters import Parameters             # <<<<<<<<<<<<<<
+ * from .._disease import Disease
+ * from .._wards import Wards
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Parameters);
+  __Pyx_GIVEREF(__pyx_n_s_Parameters);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Parameters);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_parameters, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Parameters); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Parameters, __pyx_t_1) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":6
+ * from .._network import Network
+ * from .._parameters import Parameters
+ * from .._disease import Disease             # <<<<<<<<<<<<<<
+ * from .._wards import Wards
+ * from .._ward import Ward
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Disease);
+  __Pyx_GIVEREF(__pyx_n_s_Disease);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Disease);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_disease_2, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Disease); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Disease, __pyx_t_2) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":7
+ * from .._parameters import Parameters
+ * from .._disease import Disease
+ * from .._wards import Wards             # <<<<<<<<<<<<<<
+ * from .._ward import Ward
+ * from .._nodes import Nodes
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Wards);
+  __Pyx_GIVEREF(__pyx_n_s_Wards);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Wards);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_wards_2, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Wards); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Wards, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":8
+ * from .._disease import Disease
+ * from .._wards import Wards
+ * from .._ward import Ward             # <<<<<<<<<<<<<<
+ * from .._nodes import Nodes
+ * from .._links import Links
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Ward);
+  __Pyx_GIVEREF(__pyx_n_s_Ward);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Ward);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_ward_2, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Ward); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Ward, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":9
+ * from .._wards import Wards
+ * from .._ward import Ward
+ * from .._nodes import Nodes             # <<<<<<<<<<<<<<
+ * from .._links import Links
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Nodes);
+  __Pyx_GIVEREF(__pyx_n_s_Nodes);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Nodes);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_nodes_2, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Nodes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Nodes, __pyx_t_1) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":10
+ * from .._ward import Ward
+ * from .._nodes import Nodes
+ * from .._links import Links             # <<<<<<<<<<<<<<
+ * 
+ * from ._console import Console
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Links);
+  __Pyx_GIVEREF(__pyx_n_s_Links);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Links);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_links_2, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Links); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Links, __pyx_t_2) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":12
+ * from .._links import Links
+ * 
+ * from ._console import Console             # <<<<<<<<<<<<<<
+ * from ._profiler import Profiler
+ * from ._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Console);
+  __Pyx_GIVEREF(__pyx_n_s_Console);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Console);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_console, __pyx_t_1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Console); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Console, __pyx_t_1) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":13
+ * 
+ * from ._console import Console
+ * from ._profiler import Profiler             # <<<<<<<<<<<<<<
+ * from ._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Profiler);
+  __Pyx_GIVEREF(__pyx_n_s_Profiler);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Profiler);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_profiler_2, __pyx_t_2, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Profiler); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Profiler, __pyx_t_2) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":16
+ * from ._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
+ * 
+ * __all__ = ["load_from_wards", "save_to_wards"]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_u_load_from_wards);
+  __Pyx_GIVEREF(__pyx_n_u_load_from_wards);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_u_load_from_wards);
+  __Pyx_INCREF(__pyx_n_u_save_to_wards);
+  __Pyx_GIVEREF(__pyx_n_u_save_to_wards);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_u_save_to_wards);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_all, __pyx_t_1) < 0) __PYX_ERR(0, 16, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":19
+ * 
+ * 
+ * def load_from_wards(wards: Wards, params: Parameters = None,             # <<<<<<<<<<<<<<
+ *                     disease: Disease = None,
+ *                     profiler: Profiler = None,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9metawards_5utils_14_network_wards_1load_from_wards, NULL, __pyx_n_s_metawards_utils__network_wards); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_load_from_wards, __pyx_t_1) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":360
+ * 
+ * 
+ * def save_to_wards(network: Network, profiler: Profiler = None,             # <<<<<<<<<<<<<<
+ *                   nthreads: int = 1) -> Wards:
+ *     """Build a return a set of Wards constructed from the passed Network"""
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9metawards_5utils_14_network_wards_3save_to_wards, NULL, __pyx_n_s_metawards_utils__network_wards); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_save_to_wards, __pyx_t_1) < 0) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "metawards/utils/_network_wards.pyx":2
+ * 
+ * from array import array             # <<<<<<<<<<<<<<
+ * 
+ * from .._network import Network
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init metawards.utils._network_wards", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init metawards.utils._network_wards");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod0 */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+/* UnpackTuple2 */
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_COMPILING_IN_PYPY
+    value1 = PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
+    }
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_COMPILING_IN_PYPY
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
+}
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = Py_TYPE(iter)->tp_iternext;
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+}
+
+/* dict_iter */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
+#elif PY_MAJOR_VERSION >= 3
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
+#endif
+    }
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
+#endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
+}
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (source_is_dict) {
+        PyObject *key, *value;
+        if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+            PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+            return -1;
+        }
+        if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+            return 0;
+        }
+        if (pitem) {
+            PyObject* tuple = PyTuple_New(2);
+            if (unlikely(!tuple)) {
+                return -1;
+            }
+            Py_INCREF(key);
+            Py_INCREF(value);
+            PyTuple_SET_ITEM(tuple, 0, key);
+            PyTuple_SET_ITEM(tuple, 1, value);
+            *pitem = tuple;
+        } else {
+            if (pkey) {
+                Py_INCREF(key);
+                *pkey = key;
+            }
+            if (pvalue) {
+                Py_INCREF(value);
+                *pvalue = value;
+            }
+        }
+        return 1;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyTuple_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        if (unlikely(pos >= PyList_GET_SIZE(iter_obj))) return 0;
+        *ppos = pos + 1;
+        next_item = PyList_GET_ITEM(iter_obj, pos);
+        Py_INCREF(next_item);
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
+        }
+    }
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
+    }
+    return 1;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+}
+
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
+}
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* CIntToDigits */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+#if CYTHON_PEP393_ENABLED
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+#else
+    Py_UNICODE *udata;
+    uval = PyUnicode_FromUnicode(NULL, ulength);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_AS_UNICODE(uval);
+#endif
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
+    }
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
+    }
+#else
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp;
+                    PyObject *repeat = PyInt_FromSsize_t(uoffset - prepend_sign);
+                    if (unlikely(!repeat)) goto done_or_error;
+                    tmp = PyNumber_Multiply(padding, repeat);
+                    Py_DECREF(repeat);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyNumber_Add(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyNumber_Add(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
+    }
+#endif
+    return uval;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* SetItemInt */
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
+                                               CYTHON_NCP_UNUSED int wraparound, CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o)))) {
+            PyObject* old = PyList_GET_ITEM(o, n);
+            Py_INCREF(v);
+            PyList_SET_ITEM(o, n, v);
+            Py_DECREF(old);
+            return 1;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_ass_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return -1;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_ass_item(o, i, v);
+        }
+    }
+#else
+#if CYTHON_COMPILING_IN_PYPY
+    if (is_list || (PySequence_Check(o) && !PyDict_Check(o)))
+#else
+    if (is_list || PySequence_Check(o))
+#endif
+    {
+        return PySequence_SetItem(o, i, v);
+    }
+#endif
+    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
+}
+
+/* py_abs */
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject *__Pyx_PyLong_AbsNeg(PyObject *n) {
+    if (likely(Py_SIZE(n) == -1)) {
+        return PyLong_FromLong(((PyLongObject*)n)->ob_digit[0]);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON
+    {
+        PyObject *copy = _PyLong_Copy((PyLongObject*)n);
+        if (likely(copy)) {
+            __Pyx_SET_SIZE(copy, -Py_SIZE(copy));
+        }
+        return copy;
+    }
+#else
+    return PyNumber_Negative(n);
+#endif
+}
+#endif
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
+bad:
+    return NULL;
+}
+
+/* None */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionImport */
+#ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, funcname);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C function %.200s",
+                PyModule_GetName(module), funcname);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    tmp.p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, desc);
+        goto bad;
+    }
+    tmp.p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    *f = tmp.fp;
+    if (!(*f))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
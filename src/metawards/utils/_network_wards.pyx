@@ -1,4 +1,6 @@
 
+from array import array
+
 from .._network import Network
 from .._parameters import Parameters
 from .._disease import Disease
@@ -44,7 +46,7 @@ def load_from_wards(wards: Wards, params: Parameters = None,
     params.input_files = InputFiles()
 
     cdef int i = 0
-    cdef int node_id = 0
+    cdef int j = 0
     cdef int nnodes_plus_one = len(wards)
 
     if nnodes_plus_one == 0:
@@ -52,14 +54,44 @@ def load_from_wards(wards: Wards, params: Parameters = None,
 
     p = profiler.start("load_from_wards")
 
+    # The network is built directly from the columnar form of the
+    # wards, which is much quicker than going via the Ward objects
+    p = p.start("to_columns")
+    columns = wards.to_columns()
+    p = p.stop()
+
     nodes = Nodes(nnodes_plus_one)
-    info = [None] * nnodes_plus_one
-    worker_lists = [None] * nnodes_plus_one
-    player_lists = [None] * nnodes_plus_one
 
-    cdef int nlinks = 0
+    cdef int nlinks = columns.work_begin[nnodes_plus_one]
     cdef int nplay = 0
 
+    cdef int * present = get_int_array_ptr(columns.present)
+    cdef int * auto_assign = get_int_array_ptr(columns.auto_assign)
+    cdef int * nplayers = get_int_array_ptr(columns.nplayers)
+    cdef double * player_total = get_double_array_ptr(columns.player_total)
+    cdef int * pos_type = get_int_array_ptr(columns.pos_type)
+    cdef double * pos_a = get_double_array_ptr(columns.pos_a)
+    cdef double * pos_b = get_double_array_ptr(columns.pos_b)
+    cdef double * ward_scale_uv = get_double_array_ptr(columns.scale_uv)
+    cdef double * ward_cutoff = get_double_array_ptr(columns.cutoff)
+    cdef double * ward_bg_foi = get_double_array_ptr(columns.bg_foi)
+
+    cdef int * work_begin = get_int_array_ptr(columns.work_begin)
+    cdef int * work_dest = NULL
+    cdef int * work_number = NULL
+
+    cdef int * play_begin = get_int_array_ptr(columns.play_begin)
+    cdef int * play_dest = NULL
+    cdef double * play_weights = NULL
+
+    if nlinks > 0:
+        work_dest = get_int_array_ptr(columns.work_dest)
+        work_number = get_int_array_ptr(columns.work_number)
+
+    if play_begin[nnodes_plus_one] > 0:
+        play_dest = get_int_array_ptr(columns.play_dest)
+        play_weights = get_double_array_ptr(columns.play_weight)
+
     cdef int * nodes_label = get_int_array_ptr(nodes.label)
 
     cdef int * nodes_begin_to = get_int_array_ptr(nodes.begin_to)
@@ -75,6 +107,7 @@ def load_from_wards(wards: Wards, params: Parameters = None,
     cdef double * nodes_bg_foi = get_double_array_ptr(nodes.bg_foi)
 
     cdef double * nodes_custom
+    cdef double * ward_custom
 
     cdef int * nodes_begin_p = get_int_array_ptr(nodes.begin_p)
     cdef int * nodes_end_p = get_int_array_ptr(nodes.end_p)
@@ -83,74 +116,56 @@ def load_from_wards(wards: Wards, params: Parameters = None,
     cdef double * nodes_x = get_double_array_ptr(nodes.x)
     cdef double * nodes_y = get_double_array_ptr(nodes.y)
 
-    coords_type = None
+    cdef int have_xy = 0
+    cdef int have_latlong = 0
 
     p = p.start("convert nodes")
-    with Console.progress() as progress:
-        task = progress.add_task("Constructing nodes", total=nnodes_plus_one)
 
-        for i, ward in enumerate(wards._wards):
-            if ward is None or ward.is_null():
+    with nogil:
+        for i in range(1, nnodes_plus_one):
+            if present[i] == 0:
                 continue
 
-            node_id = ward.id()
-
-            if node_id <= 0 or node_id >= nnodes_plus_one:
-                raise ValueError(f"Invalid ward.id() = {node_id}")
-
-            pos = ward.position()
-
-            if "x" in pos:
-                if coords_type is None:
-                    coords_type = "x/y"
-                elif coords_type != "x/y":
-                    raise ValueError(
-                        "Cannot mix wards with X/Y and lat/long coordinates")
-
-                nodes_x[node_id] = pos.get("x", 0.0)
-                nodes_y[node_id] = pos.get("y", 0.0)
-
-            elif "lat" in pos:
-                if coords_type is None:
-                    coords_type = "lat/long"
-                elif coords_type != "lat/long":
-                    raise ValueError(
-                        "Cannot mix wards with X/Y and lat/long coordinates")
-
-                nodes_x[node_id] = pos.get("lat", 0.0)
-                nodes_y[node_id] = pos.get("long", 0.0)
-
-            nodes_label[node_id] = ward.id()
-
-            nodes_play_suscept[node_id] = <double>(ward.num_players())
-            nodes_save_play_suscept[node_id] = nodes_play_suscept[node_id]
-
-            nodes_scale_uv[node_id] = ward.scale_uv()
-            nodes_cutoff[node_id] = ward.cutoff()
-            nodes_bg_foi[node_id] = ward.bg_foi()
-
-            for key, value in ward._custom_params.items():
-                nodes_custom = get_double_array_ptr(nodes.get_custom(key))
-                nodes_custom[node_id] = value
-
-            info[node_id] = ward.info()
-
-            l = ward.get_worker_lists()
-            nlinks += len(l[0])
-
-            worker_lists[node_id] = l
-
-            l = ward.get_player_lists()
-            nplay += len(l[0])
-
-            player_lists[node_id] = l
+            if pos_type[i] == 1:
+                have_xy = 1
+                nodes_x[i] = pos_a[i]
+                nodes_y[i] = pos_b[i]
+            elif pos_type[i] == 2:
+                have_latlong = 1
+                nodes_x[i] = pos_a[i]
+                nodes_y[i] = pos_b[i]
+
+            nodes_label[i] = i
+
+            nodes_play_suscept[i] = <double>(nplayers[i])
+            nodes_save_play_suscept[i] = nodes_play_suscept[i]
+
+            nodes_scale_uv[i] = ward_scale_uv[i]
+            nodes_cutoff[i] = ward_cutoff[i]
+            nodes_bg_foi[i] = ward_bg_foi[i]
+
+    if have_xy and have_latlong:
+        raise ValueError(
+            "Cannot mix wards with X/Y and lat/long coordinates")
+    elif have_xy:
+        nodes.coordinates = "x/y"
+    elif have_latlong:
+        nodes.coordinates = "lat/long"
+    else:
+        nodes.coordinates = None
 
-            if i % 250 == 0:
-                progress.update(task, completed=i)
+    for key, values in columns.custom.items():
+        nodes_custom = get_double_array_ptr(nodes.get_custom(key))
+        ward_custom = get_double_array_ptr(values)
 
-        progress.update(task, completed=nnodes_plus_one, force_update=True)
+        with nogil:
+            for i in range(1, nnodes_plus_one):
+                # unset values are NaN, and NaN != NaN
+                if present[i] and ward_custom[i] == ward_custom[i]:
+                    nodes_custom[i] = ward_custom[i]
 
-    nodes.coordinates = coords_type
+    from copy import deepcopy
+    info = deepcopy(columns.get_infos())
 
     p = p.stop()
 
@@ -165,84 +180,113 @@ def load_from_wards(wards: Wards, params: Parameters = None,
     cdef double * links_suscept = get_double_array_ptr(links.suscept)
     cdef double * links_weight = get_double_array_ptr(links.weight)
 
-    cdef int * dest
-    cdef int * pop
-
-    with Console.progress() as progress:
-        task = progress.add_task("Constructing work links",
-                                 total=nnodes_plus_one)
-
-        for i, worker_list in enumerate(worker_lists):
-            if worker_list is None or len(worker_list[0]) == 0:
+    with nogil:
+        for i in range(1, nnodes_plus_one):
+            if work_begin[i+1] == work_begin[i]:
                 continue
 
-            nodes_begin_to[i] = ilink + 1
-            nodes_end_to[i] = nodes_begin_to[i] + len(worker_list[0])
-
-            dest = get_int_array_ptr(worker_list[0])
-            pop = get_int_array_ptr(worker_list[1])
+            nodes_begin_to[i] = work_begin[i] + 1
+            nodes_end_to[i] = work_begin[i+1] + 1
 
-            for j in range(0, len(worker_list[0])):
-                ilink += 1
+            for j in range(work_begin[i], work_begin[i+1]):
+                ilink = j + 1
                 links_ifrom[ilink] = i
-                links_ito[ilink] = dest[j]
-                links_weight[ilink] = <double>(pop[j])
+                links_ito[ilink] = work_dest[j]
+                links_weight[ilink] = <double>(work_number[j])
                 links_suscept[ilink] = links_weight[ilink]
 
-                if i == dest[j]:
+                if i == work_dest[j]:
                     # this is the self-link
                     nodes_self_w[i] = ilink
 
-            if i % 250 == 0:
-                progress.update(task, completed=i)
+    p = p.stop()
 
-        progress.update(task, completed=nnodes_plus_one, force_update=True)
+    p = p.start("convert play links")
 
-    assert nlinks == ilink
+    # wards that auto-assign players will also have a self-link
+    # holding the unassigned weight, if they don't have one already
+    cdef int has_self = 0
 
-    p = p.stop()
+    with nogil:
+        for i in range(1, nnodes_plus_one):
+            if present[i] == 0:
+                continue
 
-    p = p.start("convert play links")
+            nplay = nplay + play_begin[i+1] - play_begin[i]
+
+            if auto_assign[i]:
+                has_self = 0
+
+                for j in range(play_begin[i], play_begin[i+1]):
+                    if play_dest[j] == i:
+                        has_self = 1
+                        break
+
+                if not has_self:
+                    nplay = nplay + 1
 
     play = Links(nplay+1)
 
-    cdef double * weight
     cdef int * play_ifrom = get_int_array_ptr(play.ifrom)
     cdef int * play_ito = get_int_array_ptr(play.ito)
     cdef double * play_suscept = get_double_array_ptr(play.suscept)
     cdef double * play_weight = get_double_array_ptr(play.weight)
 
+    cdef int need_self = 0
+
     ilink = 0
 
-    with Console.progress() as progress:
-        task = progress.add_task("Constructing play links",
-                                 total=nnodes_plus_one)
+    with nogil:
+        for i in range(1, nnodes_plus_one):
+            if present[i] == 0:
+                continue
+
+            need_self = auto_assign[i]
 
-        for i, player_list in enumerate(player_lists):
-            if player_list is None or len(player_list[0]) == 0:
+            if play_begin[i+1] == play_begin[i] and not need_self:
                 continue
 
             nodes_begin_p[i] = ilink + 1
-            nodes_end_p[i] = nodes_begin_p[i] + len(player_list[0])
 
-            dest = get_int_array_ptr(player_list[0])
-            weight = get_double_array_ptr(player_list[1])
-
-            for j in range(0, len(player_list[0])):
-                ilink += 1
+            for j in range(play_begin[i], play_begin[i+1]):
+                if need_self and play_dest[j] >= i:
+                    if play_dest[j] > i:
+                        # insert the auto-assigned self-link
+                        ilink = ilink + 1
+                        play_ifrom[ilink] = i
+                        play_ito[ilink] = i
+                        play_weight[ilink] = player_total[i]
+                        play_suscept[ilink] = play_weight[ilink]
+                        nodes_self_p[i] = ilink
+
+                ilink = ilink + 1
                 play_ifrom[ilink] = i
-                play_ito[ilink] = dest[j]
-                play_weight[ilink] = weight[j]
+                play_ito[ilink] = play_dest[j]
+                play_weight[ilink] = play_weights[j]
+
+                if need_self and play_dest[j] == i:
+                    play_weight[ilink] = play_weight[ilink] + \
+                                         player_total[i]
+
+                if play_dest[j] >= i:
+                    need_self = 0
+
                 play_suscept[ilink] = play_weight[ilink]
 
-                if i == dest[j]:
+                if i == play_dest[j]:
                     # this is the self-link
                     nodes_self_p[i] = ilink
 
-            if i % 250 == 0:
-                progress.update(task, completed=i)
+            if need_self:
+                # the self-link comes after all of the other links
+                ilink = ilink + 1
+                play_ifrom[ilink] = i
+                play_ito[ilink] = i
+                play_weight[ilink] = player_total[i]
+                play_suscept[ilink] = play_weight[ilink]
+                nodes_self_p[i] = ilink
 
-        progress.update(task, completed=nnodes_plus_one, force_update=True)
+            nodes_end_p[i] = ilink + 1
 
     assert nplay == ilink
 
@@ -352,6 +396,15 @@ def save_to_wards(network: Network, profiler: Profiler = None,
     cdef int nlinks = len(links)
     cdef int nplay = len(play)
 
+    # the original index of each node, in case the wards have been
+    # renumbered (see Network.reorder_wards)
+    if network._original_index is None:
+        original_index = array("i", range(0, nnodes_plus_one))
+    else:
+        original_index = network._original_index
+
+    cdef int * to_original = get_int_array_ptr(original_index)
+
     cdef int have_info = 1 if (len(info) > 1) else 0
     cdef int have_coords = 0 if nodes.coordinates is None else 1
     cdef int xy_coords = 1 if nodes.coordinates == "x/y" else 0
@@ -419,7 +472,8 @@ def save_to_wards(network: Network, profiler: Profiler = None,
             if ifrom == ito and ifrom == 38:
                 Console.print(f"ward {ifrom} {ito} => {weight}")
 
-            wards[ifrom].add_workers(destination=ito, number=weight)
+            wards[ifrom].add_workers(destination=to_original[ito],
+                                     number=weight)
 
             if i % update_freq == 0:
                 progress.update(task, completed=i+1)
@@ -446,7 +500,8 @@ def save_to_wards(network: Network, profiler: Profiler = None,
             if ifrom == ito:
                 self_weight[ifrom] = weight
 
-            wards[ifrom].add_player_weight(destination=ito, weight=weight)
+            wards[ifrom].add_player_weight(destination=to_original[ito],
+                                           weight=weight)
 
             if i % update_freq == 0:
                 progress.update(task, completed=i+1)
@@ -454,7 +509,7 @@ def save_to_wards(network: Network, profiler: Profiler = None,
         errors = []
 
         for i in range(1, nnodes_plus_one):
-            weight = wards[i].get_players(destination=i)
+            weight = wards[i].get_players(destination=to_original[i])
 
             if self_weight[i] is None:
                 # the weight should either be zero or one
@@ -481,6 +536,10 @@ def save_to_wards(network: Network, profiler: Profiler = None,
         progress.update(task, completed=nlinks, force_update=True)
     p = p.stop()
 
+    if network._node_index is not None:
+        # return the wards in their original order
+        wards = [None] + [wards[i] for i in network._node_index[1:]]
+
     p = p.start("Create Wards")
     w = Wards()
     w.insert(wards, _need_deep_copy = False)
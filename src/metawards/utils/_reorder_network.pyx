@@ -0,0 +1,380 @@
+#!/bin/env/python3
+#cython: linetrace=False
+# MUST ALWAYS DISABLE AS WAY TOO SLOW FOR ITERATE
+
+cimport cython
+from libc.stdlib cimport malloc, free, qsort
+
+from array import array
+
+from .._network import Network
+
+from ._profiler import Profiler
+from ._get_array_ptr cimport get_int_array_ptr, get_double_array_ptr
+
+__all__ = ["get_space_filling_curve_order", "reorder_network"]
+
+
+cdef struct sort_key:
+    long long key
+    int index
+
+
+cdef int _compare_sort_keys(const void *a, const void *b) nogil:
+    """Compare two sort keys, using the index to break ties so that
+       the sort is stable
+    """
+    cdef sort_key *x = <sort_key*>a
+    cdef sort_key *y = <sort_key*>b
+
+    if x.key < y.key:
+        return -1
+    elif x.key > y.key:
+        return 1
+    elif x.index < y.index:
+        return -1
+    elif x.index > y.index:
+        return 1
+    else:
+        return 0
+
+
+cdef long long _hilbert_index(long long n, long long x, long long y) nogil:
+    """Return the distance along the Hilbert curve that fills the
+       n by n grid (n is a power of 2) of the point (x, y)
+    """
+    cdef long long d = 0
+    cdef long long s = n // 2
+    cdef long long rx = 0
+    cdef long long ry = 0
+    cdef long long t = 0
+
+    while s > 0:
+        rx = 1 if (x & s) > 0 else 0
+        ry = 1 if (y & s) > 0 else 0
+        d += s * s * ((3 * rx) ^ ry)
+
+        # rotate the quadrant so that the curve is continuous
+        if ry == 0:
+            if rx == 1:
+                x = n - 1 - x
+                y = n - 1 - y
+
+            t = x
+            x = y
+            y = t
+
+        s = s // 2
+
+    return d
+
+
+cdef _sorted_indexes(sort_key *keys, int n):
+    """Sort the passed keys and return the sorted indexes as an
+       int array, with a 0 prepended (for the null index)
+    """
+    order = array("i", [0]) * (n + 1)
+
+    if n == 0:
+        return order
+
+    cdef int * o = get_int_array_ptr(order)
+    cdef int i = 0
+
+    with nogil:
+        qsort(keys, n, sizeof(sort_key), _compare_sort_keys)
+
+        for i in range(0, n):
+            o[i+1] = keys[i].index
+
+    return order
+
+
+def get_space_filling_curve_order(network: Network):
+    """Return the order of the wards of the passed network along a
+       Hilbert space-filling curve through their (x, y) or
+       (lat, long) positions. Wards that are close in space are
+       close along the curve, so numbering wards in this order
+       keeps the wards that are linked together close in memory.
+
+       Wards without a position are placed at the end, in their
+       existing order.
+
+       Returns
+       -------
+       order: array
+         The order of the nodes, i.e. order[i] is the current index
+         of the node that should become node i. order[0] is always 0
+    """
+    cdef int nnodes = network.nnodes
+    cdef int i = 0
+
+    cdef double * nodes_x = get_double_array_ptr(network.nodes.x)
+    cdef double * nodes_y = get_double_array_ptr(network.nodes.y)
+
+    # the curve fills a 65536 x 65536 grid over the bounding box
+    cdef long long n = 65536
+    cdef long long unplaced = n * n
+
+    cdef double minx = 0.0
+    cdef double maxx = 0.0
+    cdef double miny = 0.0
+    cdef double maxy = 0.0
+    cdef double x = 0.0
+    cdef double y = 0.0
+    cdef int have_pos = 0
+
+    if network.nodes.coordinates is None:
+        # no positions, so keep the existing order
+        return array("i", range(0, nnodes + 1))
+
+    for i in range(1, nnodes + 1):
+        x = nodes_x[i]
+        y = nodes_y[i]
+
+        if x == 0 and y == 0:
+            continue
+        elif not have_pos:
+            minx = maxx = x
+            miny = maxy = y
+            have_pos = 1
+        else:
+            minx = min(minx, x)
+            maxx = max(maxx, x)
+            miny = min(miny, y)
+            maxy = max(maxy, y)
+
+    cdef double scale = max(maxx - minx, maxy - miny)
+
+    if scale > 0:
+        scale = (n - 1) / scale
+
+    cdef sort_key *keys = <sort_key*>malloc((nnodes + 1) * sizeof(sort_key))
+
+    if keys == NULL:
+        raise MemoryError("Unable to allocate memory to sort the wards")
+
+    try:
+        with nogil:
+            for i in range(1, nnodes + 1):
+                x = nodes_x[i]
+                y = nodes_y[i]
+
+                keys[i-1].index = i
+
+                if x == 0 and y == 0:
+                    keys[i-1].key = unplaced
+                else:
+                    keys[i-1].key = _hilbert_index(
+                                        n, <long long>((x - minx) * scale),
+                                        <long long>((y - miny) * scale))
+
+        return _sorted_indexes(keys, nnodes)
+    finally:
+        free(keys)
+
+
+def _permute_array(values, order, int n):
+    """Return a copy of the passed array where the first n+1 values
+       are permuted so that new[i] is values[order[i]]. A copy is
+       returned as arrays may be shared with copies of the network
+    """
+    if values is None or len(values) < n + 1:
+        return values
+
+    new = array(values.typecode, values)
+
+    cdef int * o = get_int_array_ptr(order)
+    cdef int * iold
+    cdef int * inew
+    cdef double * dold
+    cdef double * dnew
+    cdef int i = 0
+
+    if n == 0:
+        return new
+    elif values.typecode == "i":
+        iold = get_int_array_ptr(values)
+        inew = get_int_array_ptr(new)
+
+        with nogil:
+            for i in range(1, n + 1):
+                inew[i] = iold[o[i]]
+
+    elif values.typecode == "d":
+        dold = get_double_array_ptr(values)
+        dnew = get_double_array_ptr(new)
+
+        with nogil:
+            for i in range(1, n + 1):
+                dnew[i] = dold[o[i]]
+    else:
+        for i in range(1, n + 1):
+            new[i] = values[order[i]]
+
+    return new
+
+
+def _reorder_links(links, int nlinks, new_index, int nnodes, nodes,
+                   begin: str, end: str, self_link: str):
+    """Renumber the ifrom and ito wards of the passed links using
+       new_index, and then sort the links by (ifrom, ito). This
+       sets new begin, end and self_link indexes of the nodes
+    """
+    if nlinks == 0:
+        return
+
+    # renumber copies, as ifrom and ito are shared with copies
+    links.ifrom = array("i", links.ifrom)
+    links.ito = array("i", links.ito)
+
+    cdef int * links_ifrom = get_int_array_ptr(links.ifrom)
+    cdef int * links_ito = get_int_array_ptr(links.ito)
+    cdef int * idx = get_int_array_ptr(new_index)
+
+    cdef long long stride = nnodes + 1
+    cdef int i = 0
+    cdef int j = 0
+
+    cdef sort_key *keys = <sort_key*>malloc(nlinks * sizeof(sort_key))
+
+    if keys == NULL:
+        raise MemoryError("Unable to allocate memory to sort the links")
+
+    try:
+        with nogil:
+            for j in range(1, nlinks + 1):
+                links_ifrom[j] = idx[links_ifrom[j]]
+                links_ito[j] = idx[links_ito[j]]
+                keys[j-1].index = j
+                keys[j-1].key = links_ifrom[j] * stride + links_ito[j]
+
+        order = _sorted_indexes(keys, nlinks)
+    finally:
+        free(keys)
+
+    for key, value in list(links.__dict__.items()):
+        if isinstance(value, array):
+            setattr(links, key, _permute_array(value, order, nlinks))
+
+    links_ifrom = get_int_array_ptr(links.ifrom)
+    links_ito = get_int_array_ptr(links.ito)
+
+    begin_values = array("i", getattr(nodes, begin))
+    end_values = array("i", getattr(nodes, end))
+    self_values = array("i", getattr(nodes, self_link))
+
+    cdef int * nodes_begin = get_int_array_ptr(begin_values)
+    cdef int * nodes_end = get_int_array_ptr(end_values)
+    cdef int * nodes_self = get_int_array_ptr(self_values)
+
+    with nogil:
+        for i in range(1, nnodes + 1):
+            nodes_begin[i] = -1
+            nodes_end[i] = -1
+            nodes_self[i] = -1
+
+        for j in range(1, nlinks + 1):
+            i = links_ifrom[j]
+
+            if nodes_begin[i] == -1:
+                nodes_begin[i] = j
+
+            nodes_end[i] = j + 1
+
+            if links_ito[j] == i:
+                nodes_self[i] = j
+
+    setattr(nodes, begin, begin_values)
+    setattr(nodes, end, end_values)
+    setattr(nodes, self_link, self_values)
+
+
+def reorder_network(network: Network, order, nthreads: int = 1,
+                    profiler: Profiler = None):
+    """Renumber the wards of the passed network in place, so that
+       node i becomes the node that is currently at index order[i].
+       All per-ward data (including the ward info) are permuted,
+       and the work and play links are renumbered and sorted by
+       (ifrom, ito) so that links from, and to, nearby wards are
+       close in memory.
+
+       The original index of each ward is recorded, so that the
+       network can map between original and renumbered indexes
+       (see :meth:`Network.get_node_index` and
+       :meth:`Network.in_original_order`). Also, nodes.label
+       continues to hold the ID of each ward.
+    """
+    if profiler is None:
+        from ._profiler import NullProfiler
+        profiler = NullProfiler()
+
+    cdef int nnodes = network.nnodes
+    cdef int i = 0
+
+    order = array("i", order)
+
+    if len(order) != nnodes + 1 or order[0] != 0 or \
+            sorted(order) != list(range(0, nnodes + 1)):
+        raise ValueError(
+            f"The order must be a permutation of the node indexes "
+            f"0 to {nnodes}, with order[0] == 0")
+
+    if network._work_index is not None:
+        raise ValueError(
+            "Cannot reorder a sub-network that has a different work "
+            "matrix to the overall network. Reorder the network before "
+            "specialising it.")
+
+    p = profiler.start("reorder_network")
+
+    # the new index of each of the current nodes
+    new_index = array("i", [0]) * (nnodes + 1)
+
+    for i in range(0, nnodes + 1):
+        new_index[order[i]] = i
+
+    nodes = network.nodes
+
+    skip = ["begin_to", "end_to", "self_w", "begin_p", "end_p", "self_p"]
+
+    for key, value in list(nodes.__dict__.items()):
+        if key not in skip and isinstance(value, array):
+            setattr(nodes, key, _permute_array(value, order, nnodes))
+
+    nodes._custom_params = {key: _permute_array(value, order, nnodes)
+                            for key, value in nodes._custom_params.items()}
+
+    _reorder_links(network.links, network.nlinks, new_index, nnodes,
+                   nodes, "begin_to", "end_to", "self_w")
+    _reorder_links(network.play, network.nplay, new_index, nnodes,
+                   nodes, "begin_p", "end_p", "self_p")
+
+    if network.info is not None and len(network.info) > 0:
+        from .._wardinfo import WardInfos
+        wards = list(network.info.wards)
+        wards += [None] * (nnodes + 1 - len(wards))
+        network.info = WardInfos([wards[order[i]]
+                                  for i in range(0, nnodes + 1)])
+
+    if network.to_seed is not None:
+        network.to_seed = [new_index[x] if 0 <= x <= nnodes else x
+                           for x in network.to_seed]
+
+    # compose with any previous reordering
+    if network._original_index is None:
+        original_index = order
+    else:
+        original_index = array("i", [network._original_index[order[i]]
+                                     for i in range(0, nnodes + 1)])
+
+    node_index = array("i", [0]) * (nnodes + 1)
+
+    for i in range(0, nnodes + 1):
+        node_index[original_index[i]] = i
+
+    network._original_index = original_index
+    network._node_index = node_index
+    network._cutoff_mask = None
+
+    p.stop()
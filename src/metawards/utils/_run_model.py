@@ -118,6 +118,16 @@ def run_model(network: _Union[Network, Networks],
     if params is None:
         return population
 
+    # the run will change the network, so it must be fully prepared
+    # again before it is next used (see Network.update)
+    if isinstance(network, Networks):
+        network.overall._prepared_key = None
+
+        for subnet in network.subnets:
+            subnet._prepared_key = None
+    else:
+        network._prepared_key = None
+
     from copy import deepcopy
     population = deepcopy(population)
 
@@ -129,8 +139,11 @@ def run_model(network: _Union[Network, Networks],
     p = p.stop()
 
     # create a workspace that is used as part of the "analyse" stage to
-    # provide a scratch-pad while extracting data from the model
-    workspace = Workspace.build(network=network)
+    # provide a scratch-pad while extracting data from the model. Only
+    # the fields needed by the iterator, extractor, mixer and mover
+    # are allocated and calculated
+    needs = Workspace.get_needs(iterator, extractor, mixer, mover)
+    workspace = Workspace.build(network=network, needs=needs)
 
     # get and call all of the functions that need to be called to
     # initialise the model run
@@ -178,7 +191,10 @@ def run_model(network: _Union[Network, Networks],
 
         p2 = p2.start(f"timing for day {population.day}")
 
-        Console.rule(f"Day {population.day}", style="iteration")
+        is_logged_day = Console.is_logged_day(population.day)
+
+        if is_logged_day:
+            Console.rule(f"Day {population.day}", style="iteration")
 
         start_population = population.population
 
@@ -224,7 +240,8 @@ def run_model(network: _Union[Network, Networks],
 
         infecteds = population.infecteds
 
-        Console.print(f"Number of infections: {infecteds}")
+        if is_logged_day:
+            Console.print(f"Number of infections: {infecteds}")
 
         iteration_count += 1
 
@@ -56,6 +56,105 @@ def get_number_of_processes(parallel_scheme: str, nprocs: int = None):
             f"Unrecognised parallelisation scheme {parallel_scheme}")
 
 
+def _generate_jobs(variables: VariableSets, next_seed,
+                   output_dir: OutputFiles):
+    """Generate (index, variable, seed, outdir) for each of the jobs
+       that will run the passed variables. The seeds are drawn
+       in order from 'next_seed'. The output directories are based
+       on the fingerprint, so should be unique for each job
+    """
+    outdirs = set()
+
+    for i, v in enumerate(variables):
+        seed = next_seed()
+
+        f = v.output_dir()
+        d = _os.path.join(output_dir.get_path(), f)
+
+        n = 1
+        base = d
+
+        while d in outdirs:
+            n += 1
+            d = base + "x%03d" % n
+
+        outdirs.add(d)
+
+        yield (i, v, seed, d)
+
+
+def _submit_jobs(jobs, submit, max_queued: int):
+    """Submit the passed jobs using 'submit', which returns a function
+       that waits for and returns the result of the job. Jobs are
+       submitted as earlier jobs complete, so that at most
+       'max_queued' are queued at once. This yields
+       (job, get_result) in the same order as the jobs
+    """
+    from collections import deque
+
+    queue = deque()
+
+    for job in jobs:
+        queue.append((job, submit(job)))
+
+        if len(queue) >= max_queued:
+            yield queue.popleft()
+
+    while len(queue) > 0:
+        yield queue.popleft()
+
+
+def _store_output(results_store, variable: VariableSet, outdir: str,
+                  archive: bytes):
+    """Add the packed output 'archive' of the job that would have
+       been written to 'outdir' to the passed results store
+    """
+    results_store.add(fingerprint=variable.fingerprint(),
+                      repeat=variable.repeat_index(),
+                      name=_os.path.basename(outdir), archive=archive)
+
+
+def _collect_outputs(results, outputs: _List, njobs: int,
+                     results_store=None):
+    """Wait for each of the passed (job, get_result) results to
+       complete, appending (variable, output) to 'outputs'. If
+       'results_store' is set, then the jobs return
+       (output, archive), and the archive is added to the store
+    """
+    from ._console import Console
+
+    for ((i, variable, _, outdir), get_result) in results:
+        with Console.spinner("Computing model run") as spinner:
+            try:
+                output = get_result()
+
+                if results_store is not None:
+                    (output, archive) = output
+                    _store_output(results_store, variable=variable,
+                                  outdir=outdir, archive=archive)
+
+                spinner.success()
+            except Exception as e:
+                spinner.failure()
+                error = f"FAILED: {e.__class__} {e}"
+                Console.error(error)
+                output = None
+
+            if output is not None:
+                Console.panel(
+                    f"Completed job {i+1} of {njobs}\n"
+                    f"{variable}\n"
+                    f"{output[-1]}",
+                    style="alternate")
+
+                outputs.append((variable, output))
+            else:
+                Console.error(f"Job {i+1} of {njobs}\n"
+                              f"{variable}\n"
+                              f"{error}")
+                outputs.append((variable, []))
+
+
 def run_models(network: _Union[Network, Networks],
                variables: VariableSets,
                population: Population,
@@ -67,7 +166,9 @@ def run_models(network: _Union[Network, Networks],
                mover: MetaFunction = None,
                profiler: Profiler = None,
                parallel_scheme: str = "multiprocessing",
-               debug_seeds=False) \
+               debug_seeds=False,
+               results_store: bool = False,
+               results_shards: int = None) \
         -> _List[_Tuple[VariableSet, Population]]:
     """Run all of the models on the passed Network that are described
        by the passed VariableSets
@@ -113,6 +214,16 @@ def run_models(network: _Union[Network, Networks],
          Set this parameter to force all runs to use the same seed
          (seed) - this is used for debugging and should never be set
          in production runs
+       results_store: bool (False)
+         Set this parameter to write the output of all of the model
+         runs into a :class:`~metawards.ResultsStore` in 'output_dir',
+         rather than into one sub-directory per model run. This
+         greatly reduces the number of files created by large
+         sweeps. Runs that fail keep their sub-directory, so that
+         the error can be found.
+       results_shards: int
+         The number of shards (container files) in the results store.
+         By default this is one shard per 1000 model runs
 
        Returns
        -------
@@ -166,8 +277,6 @@ def run_models(network: _Union[Network, Networks],
     # generate the random number seeds for all of the jobs
     # (for testing, we will use the same seed so that I can check
     #  that they are all working)
-    seeds = []
-
     if seed == 0:
         # this is a special mode that a developer can use to force
         # all jobs to use the same random number seed (15324) that
@@ -176,48 +285,49 @@ def run_models(network: _Union[Network, Networks],
         Console.warning("Using special mode to fix all random number "
                         "seeds to 15324. DO NOT USE IN PRODUCTION!!!")
 
-        for i in range(0, len(variables)):
-            seeds.append(15324)
+        def next_seed():
+            return 15324
 
     elif debug_seeds:
         Console.warning(f"Using special model to make all jobs use the "
                         f"Same random number seed {seed}. "
                         f"DO NOT USE IN PRODUCTION!")
 
-        for i in range(0, len(variables)):
-            seeds.append(seed)
+        def next_seed():
+            return seed
 
     else:
         from ._ran_binomial import seed_ran_binomial, ran_int
         rng = seed_ran_binomial(seed)
 
         # seed the rngs used for the sub-processes using this rng
-        for i in range(0, len(variables)):
-            seeds.append(ran_int(rng, 10000, 99999999))
-
-    # set the output directories for all of the jobs - this is based
-    # on the fingerprint, so should be unique for each job
-    outdirs = []
-
-    for v in variables:
-        f = v.output_dir()
-        d = _os.path.join(output_dir.get_path(), f)
-
-        i = 1
-        base = d
-
-        while d in outdirs:
-            i += 1
-            d = base + "x%03d" % i
+        def next_seed():
+            return ran_int(rng, 10000, 99999999)
 
-        outdirs.append(d)
+    # the jobs are generated on demand, so that the VariableSet
+    # objects don't need to all be created (or held in memory) up front
+    jobs = _generate_jobs(variables=variables, next_seed=next_seed,
+                          output_dir=output_dir)
+    njobs = len(variables)
 
     outputs = []
 
     Console.print(
-        f"Running **{len(variables)}** jobs using **{nprocs}** process(es)",
+        f"Running **{njobs}** jobs using **{nprocs}** process(es)",
         markdown=True)
 
+    if results_store:
+        from .._resultsstore import ResultsStore
+
+        if results_shards is None:
+            results_shards = (njobs + 999) // 1000
+
+        results_store = ResultsStore(output_dir.get_path(),
+                                     nshards=results_shards)
+        Console.print(f"All output will be written to {results_store}")
+    else:
+        results_store = None
+
     if nprocs == 1:
         # no need to use a pool, as we will repeat this calculation
         # several times
@@ -225,13 +335,18 @@ def run_models(network: _Union[Network, Networks],
 
         Console.rule("Running models in serial")
 
-        for i, variable in enumerate(variables):
-            seed = seeds[i]
-            outdir = outdirs[i]
+        for (i, variable, seed, outdir) in jobs:
+            if results_store is None:
+                subdir = output_dir.open_subdir(outdir)
+            else:
+                # write to local scratch, and then pack into the store
+                subdir = OutputFiles(results_store.create_scratch_dir(),
+                                     check_empty=False, prompt=None,
+                                     auto_bzip=output_dir.auto_bzip())
 
-            with output_dir.open_subdir(outdir) as subdir:
+            with subdir:
                 Console.print(
-                    f"Running parameter set {i+1} of {len(variables)} "
+                    f"Running parameter set {i+1} of {njobs} "
                     f"using seed {seed}")
                 Console.print(f"All output written to {subdir.get_path()}")
 
@@ -277,17 +392,30 @@ def run_models(network: _Union[Network, Networks],
                         outputs.append((variable, []))
 
                 if output is not None:
-                    Console.panel(f"Completed job {i+1} of {len(variables)}\n"
+                    Console.panel(f"Completed job {i+1} of {njobs}\n"
                                   f"{variable}\n"
                                   f"{output[-1]}",
                                   style="alternate")
                 else:
-                    Console.error(f"Job {i+1} of {len(variables)}\n"
+                    Console.error(f"Job {i+1} of {njobs}\n"
                                   f"{variable}\n"
                                   f"{error}")
             # end of OutputDirs context manager
 
-            if i != len(variables) - 1:
+            if results_store is not None:
+                if output is not None:
+                    results_store.add_directory(
+                        fingerprint=variable.fingerprint(),
+                        repeat=variable.repeat_index(),
+                        name=_os.path.basename(outdir),
+                        path=subdir.get_path())
+                else:
+                    # keep the output of failed runs so that the
+                    # error can be found
+                    import shutil
+                    shutil.move(subdir.get_path(), outdir)
+
+            if i != njobs - 1:
                 # still another run to perform, restore the network
                 # to the original state
                 network = save_network.copy()
@@ -295,15 +423,14 @@ def run_models(network: _Union[Network, Networks],
     else:
         from ._worker import run_worker
 
-        # create all of the parameters and options to run
-        arguments = []
-
         if isinstance(network, Networks):
             max_nodes = network.overall.nnodes + 1
             max_links = max(network.overall.nlinks, network.overall.nplay) + 1
+            ward_order = network.overall._original_index
         else:
             max_nodes = network.nnodes + 1
             max_links = max(network.nlinks, network.nplay) + 1
+            ward_order = network._original_index
 
         try:
             demographics = network.demographics
@@ -316,16 +443,27 @@ def run_models(network: _Union[Network, Networks],
         else:
             worker_profiler = profiler.__class__()
 
-        for i, variable in enumerate(variables):
-            seed = seeds[i]
-            outdir = outdirs[i]
+        # send the workers everything that has already been loaded and
+        # resolved, so that they don't need to do this again. This is
+        # sent once to each worker when the pool is created, rather
+        # than with every job
+        from ._load_cache import get_load_cache, set_load_cache
+        load_cache = get_load_cache()
+        scoop_load_cache = False
+
+        def get_argument(job):
+            """Create the parameters and options to run 'job'"""
+            (i, variable, seed, outdir) = job
 
-            arguments.append({
+            return {
                 "params": network.params.set_variables(variable),
                 "demographics": demographics,
+                "scoop_load_cache": scoop_load_cache,
                 "options": {"seed": seed,
                             "output_dir": outdir,
+                            "results_store": results_store is not None,
                             "auto_bzip": output_dir.auto_bzip(),
+                            "log_mode": Console.get_log_mode(),
                             "population": population,
                             "nsteps": nsteps,
                             "iterator": iterator,
@@ -335,131 +473,86 @@ def run_models(network: _Union[Network, Networks],
                             "profiler": worker_profiler,
                             "nthreads": nthreads,
                             "max_nodes": max_nodes,
-                            "max_links": max_links}
-            })
+                            "max_links": max_links,
+                            "ward_order": ward_order}
+            }
+
+        # only keep a few more jobs queued than there are processes,
+        # so that the arguments for all jobs are never held in memory
+        max_queued = 2 * nprocs
 
         if parallel_scheme == "multiprocessing":
             # run jobs using a multiprocessing pool
             Console.rule("Running models in parallel using multiprocessing")
             from multiprocessing import Pool
 
-            results = []
-
-            with Pool(processes=nprocs) as pool:
-                for argument in arguments:
-                    results.append(pool.apply_async(run_worker, (argument,)))
-
-                for i, result in enumerate(results):
-                    with Console.spinner(
-                            "Computing model run") as spinner:
-                        try:
-                            result.wait()
-                            output = result.get()
-                            spinner.success()
-                        except Exception as e:
-                            spinner.failure()
-                            error = f"FAILED: {e.__class__} {e}"
-                            Console.error(error)
-                            output = None
-
-                        if output is not None:
-                            Console.panel(
-                                f"Completed job {i+1} of {len(variables)}\n"
-                                f"{variables[i]}\n"
-                                f"{output[-1]}",
-                                style="alternate")
+            with Pool(processes=nprocs, initializer=set_load_cache,
+                      initargs=(load_cache,)) as pool:
+                def submit(job):
+                    return pool.apply_async(run_worker,
+                                            (get_argument(job),)).get
 
-                            outputs.append((variables[i], output))
-                        else:
-                            Console.error(f"Job {i+1} of {len(variables)}\n"
-                                          f"{variable}\n"
-                                          f"{error}")
-                            outputs.append((variables[i], []))
+                _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                                 outputs=outputs, njobs=njobs,
+                                 results_store=results_store)
 
         elif parallel_scheme == "mpi4py":
             # run jobs using a mpi4py pool
             Console.rule("Running models in parallel using MPI")
             from mpi4py import futures
-            with futures.MPIPoolExecutor(max_workers=nprocs) as pool:
-                results = pool.map(run_worker, arguments)
-
-                for i in range(0, len(variables)):
-                    with Console.spinner("Computing model run") as spinner:
-                        try:
-                            output = next(results)
-                            spinner.success()
-                        except Exception as e:
-                            spinner.failure()
-                            error = f"FAILED: {e.__class__} {e}"
-                            Console.error(error)
-                            output = None
+            with futures.MPIPoolExecutor(max_workers=nprocs,
+                                         initializer=set_load_cache,
+                                         initargs=(load_cache,)) as pool:
+                def submit(job):
+                    return pool.submit(run_worker, get_argument(job)).result
 
-                        if output is not None:
-                            Console.panel(
-                                f"Completed job {i+1} of {len(variables)}\n"
-                                f"{variables[i]}\n"
-                                f"{output[-1]}",
-                                style="alternate")
-
-                            outputs.append((variables[i], output))
-                        else:
-                            Console.error(f"Job {i+1} of {len(variables)}\n"
-                                          f"{variable}\n"
-                                          f"{error}")
-                            outputs.append((variables[i], []))
+                _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                                 outputs=outputs, njobs=njobs,
+                                 results_store=results_store)
 
         elif parallel_scheme == "scoop":
             # run jobs using a scoop pool
             Console.rule("Running models in parallel using scoop")
-            from scoop import futures
+            from scoop import futures, shared
+
+            # scoop has no pool initializer, so share the cache as
+            # a constant that each worker fetches once
+            shared.setConst(metawards_load_cache=load_cache)
+            scoop_load_cache = True
 
-            results = []
+            def submit(job):
+                argument = get_argument(job)
 
-            for argument in arguments:
                 try:
-                    results.append(futures.submit(run_worker, argument))
+                    return futures.submit(run_worker, argument).result
                 except Exception as e:
                     Console.error(
                         f"Error submitting calculation: {e.__class__} {e}\n"
                         f"Trying to submit again...")
 
-                    # try again
-                    try:
-                        results.append(futures.submit(run_worker, argument))
-                    except Exception as e:
-                        Console.error(
-                            f"No - another error: {e.__class__} {e}\n"
-                            f"Skipping this job")
-                        results.append(None)
-
-            for i in range(0, len(results)):
-                with Console.spinner("Computing model run") as spinner:
-                    try:
-                        output = results[i].result()
-                        spinner.success()
-                    except Exception as e:
-                        spinner.failure()
-                        error = f"FAILED: {e.__class__} {e}"
-                        Console.error(error)
-                        output = None
+                # try again
+                try:
+                    return futures.submit(run_worker, argument).result
+                except Exception as e:
+                    Console.error(
+                        f"No - another error: {e.__class__} {e}\n"
+                        f"Skipping this job")
 
-                    if output is not None:
-                        Console.panel(
-                            f"Completed job {i+1} of {len(variables)}\n"
-                            f"{variables[i]}\n"
-                            f"{output[-1]}",
-                            style="alternate")
+                    def failed():
+                        raise RuntimeError(f"Could not submit {job[1]}")
 
-                        outputs.append((variables[i], output))
-                    else:
-                        Console.error(f"Job {i+1} of {len(variables)}\n"
-                                      f"{variable}\n"
-                                      f"{error}")
-                        outputs.append((variables[i], []))
+                    return failed
+
+            _collect_outputs(_submit_jobs(jobs, submit, max_queued),
+                             outputs=outputs, njobs=njobs,
+                             results_store=results_store)
         else:
             raise ValueError(f"Unrecognised parallelisation scheme "
                              f"{parallel_scheme}.")
 
+    if results_store is not None:
+        results_store.close()
+
     # perform the final summary
     from ._get_functions import get_summary_functions
 
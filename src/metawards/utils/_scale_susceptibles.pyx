@@ -2,10 +2,14 @@
 #cython: linetrace=False
 # MUST ALWAYS DISABLE AS WAY TOO SLOW FOR ITERATE
 
+cimport cython
+from cython.parallel import parallel, prange
+
 from typing import List as _List
 
 from libc.math cimport floor
-from libc.stdint cimport uintptr_t
+from libc.stdint cimport uintptr_t, uint64_t
+from libc.stdlib cimport malloc, free
 
 from .._nodes import Nodes
 from .._links import Links
@@ -16,11 +20,8 @@ from ._profiler import Profiler
 from ._get_array_ptr cimport get_double_array_ptr, get_int_array_ptr
 from ._array import create_double_array, create_int_array
 
-from ._ran_binomial cimport _ran_binomial, _ran_integer, \
-                            _get_binomial_ptr, binomial_rng
-
 __all__ = ["scale_node_susceptibles", "scale_link_susceptibles",
-           "distribute_remainders"]
+           "distribute_remainders", "specialise_susceptibles"]
 
 
 cdef inline double scale_and_round(double value, double scale) nogil:
@@ -203,134 +204,274 @@ def scale_link_susceptibles(links: Links, ratio: any):
                 links_suscept[i] = val
 
 
-cdef double redistribute(double target, double *values,
-                         int nvalues, binomial_rng *rng,
-                         int *allow_extras) nogil:
-    """This will add or subtract numbers from 'values' until their sum
-       equals 'target'
+cdef inline uint64_t _mix_bits(uint64_t x) nogil:
+    """Return a well-mixed 64-bit value from 'x' (splitmix64 finaliser)"""
+    x = (x ^ (x >> 30)) * <uint64_t>0xBF58476D1CE4E5B9ULL
+    x = (x ^ (x >> 27)) * <uint64_t>0x94D049BB133111EBULL
+    return x ^ (x >> 31)
+
+
+cdef inline int _random_index(uint64_t seed, uint64_t index,
+                              uint64_t draw, int n) nogil:
+    """Return a random integer in [0, n) for the 'draw'th draw made
+       for item 'index'. This is a counter-based generator, so the
+       value depends only on (seed, index, draw) and not on the
+       order in which items are processed. This keeps the split of
+       the population reproducible regardless of the number of threads
+    """
+    cdef uint64_t x = _mix_bits(
+                        seed + <uint64_t>0x9E3779B97F4A7C15ULL * (index + 1))
+    x = _mix_bits(x + <uint64_t>0x9E3779B97F4A7C15ULL * (draw + 1))
+    return <int>(x % <uint64_t>n)
+
+
+cdef double _split_remainder(double target, double *values,
+                             int nvalues, int *allow,
+                             uint64_t seed, uint64_t index) nogil:
+    """Add or subtract individuals from 'values' until their sum
+       equals 'target'. Each individual is assigned to (or taken from)
+       a random allowed demographic, i.e. the remainder is split between
+       the allowed demographics as a uniform multinomial draw. This
+       returns any difference that could not be resolved
     """
     cdef double diff = target
-
     cdef int i = 0
+    cdef int k = 0
+    cdef int nallowed = 0
+    cdef uint64_t draw = 0
 
     for i in range(0, nvalues):
         diff = diff - values[i]
 
-    if diff > 0:
-        while diff > 0:
-            i = _ran_integer(rng, 0, nvalues-1)
-            if allow_extras[i]:
-                values[i] += 1
-                diff -= 1
-    elif diff < 0:
-        while diff < 0:
-            i = _ran_integer(rng, 0, nvalues-1)
-            if allow_extras[i]:
-                values[i] -= 1
-                diff += 1
+        if allow[i]:
+            nallowed = nallowed + 1
 
-    return diff
+    if nallowed == 0:
+        return diff
 
+    while diff > 0:
+        k = _random_index(seed, index, draw, nallowed)
+        draw = draw + 1
 
-def distribute_remainders(network: Network,
-                          subnets: _List[Network],
-                          demographics: Demographics,
-                          random_seed: int = None,
-                          nthreads: int = 1,
-                          profiler: Profiler=None) -> None:
-    """Distribute the remainder of the population in each ward and link from
-       'network' who are not represented in any of the demographic
-       sub-networks in subnets. This uses a completely random algorithm
-       that adds to random demographics one by one until all of the
-       population is assigned
+        for i in range(0, nvalues):
+            if allow[i]:
+                if k == 0:
+                    values[i] += 1
+                    break
 
-       Parameters
-       ----------
-       network: Network
-         The overall network
-       subnets: List[Network]
-         The demographic sub-networks
-       random_seed: int
-         Random seed to use to seed the random number generator that
-         decides where to allocate rounded individuals
+                k = k - 1
+
+        diff -= 1
+
+    while diff < 0:
+        # can only remove individuals from demographics that have some
+        nallowed = 0
+        for i in range(0, nvalues):
+            if allow[i] and values[i] >= 1:
+                nallowed = nallowed + 1
+
+        if nallowed == 0:
+            break
+
+        k = _random_index(seed, index, draw, nallowed)
+        draw = draw + 1
+
+        for i in range(0, nvalues):
+            if allow[i] and values[i] >= 1:
+                if k == 0:
+                    values[i] -= 1
+                    break
+
+                k = k - 1
+
+        diff += 1
+
+    return diff
+
+
+cdef double _split_items(double *totals, double **values, double **copies,
+                      double *ratios, int *allow, int nsubnets,
+                      int nitems_plus_one, uint64_t seed,
+                      int use_ratios, double *scratch,
+                      int num_threads) nogil:
+    """Split the population in each item (ward or link) in 'totals'
+       between the 'nsubnets' demographic arrays in 'values' (with
+       the result also copied into 'copies'). If 'use_ratios' is true
+       then each demographic first receives its (rounded) ratio of the
+       total, else the existing values are used. Any remainder is then
+       distributed randomly. This is a single parallel pass over
+       all items that returns the total remainder that could not
+       be distributed (this should be zero)
     """
+    cdef int i = 0
+    cdef int j = 0
+    cdef int thread_id = 0
+    cdef double residual = 0.0
+    cdef double total = 0.0
+    cdef double s = 0.0
+    cdef double *v
+
+    with parallel(num_threads=num_threads):
+        thread_id = cython.parallel.threadid()
+        v = scratch + (thread_id * nsubnets)
+
+        for i in prange(1, nitems_plus_one, schedule="static"):
+            total = totals[i]
+            s = 0.0
+
+            for j in range(0, nsubnets):
+                if use_ratios:
+                    v[j] = scale_and_round(total, ratios[j])
+                else:
+                    v[j] = values[j][i]
 
-    from cython.parallel import parallel, prange
+                s = s + v[j]
 
+            if s != total:
+                residual += _split_remainder(total, v, nsubnets, allow,
+                                             seed, i)
+
+            for j in range(0, nsubnets):
+                values[j][i] = v[j]
+                copies[j][i] = v[j]
+
+    return residual
+
+
+def _split_populations(network: Network, subnets: _List[Network],
+                       demographics: Demographics, random_seed: int,
+                       use_ratios: bool, nthreads: int,
+                       profiler: Profiler):
+    """Internal function used by both distribute_remainders and
+       specialise_susceptibles to split the ward and link populations
+       of 'network' between the demographic 'subnets'
+    """
     if profiler is None:
         from ._profiler import NullProfiler
         profiler = NullProfiler()
 
+    if random_seed is None:
+        random_seed = 4751828
+
+    from ._console import Console
+    Console.print(
+        f"Seeding generator used for demographics with seed {random_seed}")
+
     nodes = network.nodes
     links = network.links
 
     cdef int i = 0
+    cdef int nsubnets = len(subnets)
     cdef int nnodes_plus_one = network.nnodes + 1
     cdef int nlinks_plus_one = network.nlinks + 1
-
-    cdef int nsubnets = len(subnets)
-
-    cdef int n = 0
-    cdef int sub_n = 0
-    cdef int diff = 0
-
     cdef int num_threads = nthreads
+    cdef int scale = 1 if use_ratios else 0
+    cdef uint64_t seed = <uint64_t>(<long long>random_seed)
+
+    if nsubnets == 0:
+        return
 
-    cdef double * nodes_play_suscept = get_double_array_ptr(
-                                                nodes.play_suscept)
     cdef double * nodes_save_play_suscept = get_double_array_ptr(
                                                 nodes.save_play_suscept)
-
-    cdef double * sub_nodes_play_suscept
-    cdef double * sub_nodes_save_play_suscept
-
     cdef double * links_weight = get_double_array_ptr(links.weight)
-    cdef double * links_suscept = get_double_array_ptr(links.suscept)
 
-    cdef double * sub_links_weight
-    cdef double * sub_links_suscept
+    cdef double ** play_values = <double**>malloc(nsubnets *
+                                                  sizeof(double*))
+    cdef double ** play_copies = <double**>malloc(nsubnets *
+                                                  sizeof(double*))
+    cdef double ** work_values = <double**>malloc(nsubnets *
+                                                  sizeof(double*))
+    cdef double ** work_copies = <double**>malloc(nsubnets *
+                                                  sizeof(double*))
+    cdef double * scratch = <double*>malloc(num_threads * nsubnets *
+                                            sizeof(double))
+
+    play_ratios = create_double_array(nsubnets, 0.0)
+    work_ratios = create_double_array(nsubnets, 0.0)
+    allow_players = create_int_array(nsubnets, 0)
+    allow_workers = create_int_array(nsubnets, 0)
+
+    cdef double * play_ratios_ptr = get_double_array_ptr(play_ratios)
+    cdef double * work_ratios_ptr = get_double_array_ptr(work_ratios)
+    cdef int * allow_players_ptr = get_int_array_ptr(allow_players)
+    cdef int * allow_workers_ptr = get_int_array_ptr(allow_workers)
 
-    diff_nodes = create_double_array(nnodes_plus_one)
-    diff_links = create_double_array(nlinks_plus_one)
+    for i in range(0, nsubnets):
+        subnet = subnets[i]
+        demographic = demographics[i]
 
-    cdef double * diff_nodes_array = get_double_array_ptr(diff_nodes)
-    cdef double * diff_links_array = get_double_array_ptr(diff_links)
+        play_values[i] = get_double_array_ptr(subnet.nodes.save_play_suscept)
+        play_copies[i] = get_double_array_ptr(subnet.nodes.play_suscept)
+        work_values[i] = get_double_array_ptr(subnet.links.weight)
+        work_copies[i] = get_double_array_ptr(subnet.links.suscept)
 
-    cdef double target = 0.0
-    values = create_double_array(nsubnets)
-    cdef double * values_array = get_double_array_ptr(values)
+        if use_ratios:
+            play_ratios[i] = demographic.play_ratio
+            work_ratios[i] = demographic.work_ratio
 
-    # calculate the number of remainders in each ward and link
-    p = profiler.start("initialise")
-    with nogil, parallel(num_threads=num_threads):
-        for i in prange(1, nnodes_plus_one, schedule="static"):
-            diff_nodes_array[i] = nodes_save_play_suscept[i]
+        allow_players[i] = int(demographic.play_ratio != 0)
+        allow_workers[i] = int(demographic.work_ratio != 0)
 
-        for i in prange(1, nlinks_plus_one, schedule="static"):
-            diff_links_array[i] = links_weight[i]
-    p = p.stop()
+    cdef double nodes_diff = 0.0
+    cdef double links_diff = 0.0
 
-    p = p.start("calc_differences")
-    for subnet in subnets:
-        sub_nodes_save_play_suscept = get_double_array_ptr(
-                                        subnet.nodes.save_play_suscept)
-        sub_links_weight = get_double_array_ptr(subnet.links.weight)
+    try:
+        p = profiler.start("distribute_nodes")
+        with nogil:
+            nodes_diff = _split_items(nodes_save_play_suscept,
+                                      play_values, play_copies,
+                                      play_ratios_ptr, allow_players_ptr,
+                                      nsubnets, nnodes_plus_one,
+                                      seed, scale, scratch, num_threads)
+        p = p.stop()
+
+        p = p.start("distribute_links")
+        with nogil:
+            links_diff = _split_items(links_weight,
+                                      work_values, work_copies,
+                                      work_ratios_ptr, allow_workers_ptr,
+                                      nsubnets, nlinks_plus_one,
+                                      seed ^ <uint64_t>0x5851F42D4C957F2DULL,
+                                      scale, scratch, num_threads)
+        p = p.stop()
+    finally:
+        free(play_values)
+        free(play_copies)
+        free(work_values)
+        free(work_copies)
+        free(scratch)
+
+    Console.print(f"Number of differences is {int(nodes_diff)} + "
+                  f"{int(links_diff)}")
 
-        with nogil, parallel(num_threads=num_threads):
-            for i in prange(1, nnodes_plus_one, schedule="static"):
-                diff_nodes_array[i] = diff_nodes_array[i] - \
-                                      sub_nodes_save_play_suscept[i]
 
-            for i in prange(1, nlinks_plus_one, schedule="static"):
-                diff_links_array[i] = diff_links_array[i] - \
-                                      sub_links_weight[i]
-    p = p.stop()
+def distribute_remainders(network: Network,
+                          subnets: _List[Network],
+                          demographics: Demographics,
+                          random_seed: int = None,
+                          nthreads: int = 1,
+                          profiler: Profiler=None) -> None:
+    """Distribute the remainder of the population in each ward and link from
+       'network' who are not represented in any of the demographic
+       sub-networks in subnets. This uses a completely random algorithm
+       that adds to random demographics one by one until all of the
+       population is assigned
 
+       Parameters
+       ----------
+       network: Network
+         The overall network
+       subnets: List[Network]
+         The demographic sub-networks
+       random_seed: int
+         Random seed to use to seed the random number generator that
+         decides where to allocate rounded individuals
+    """
     # go through and take action on all of the differences. These differences
     # are rounding issues, e.g. dividing 5 people evenly between 2
     # demographics is not possible - we will assign 2 people to each
     # demographic, and would have 1 remainder. To solve this we could
-    # either
+    # either
 
     # 1. assign the person to the first demographic, or
     # 2. assign the person to the largest demographic, or
@@ -346,90 +487,81 @@ def distribute_remainders(network: Network,
     # and so shouldn't affect their relative sizes.
 
     # HOWEVER, when we run multiple runs, we need the initial assignment
-    # of population to demographics to be the same, otherwise this can
+    # of population to demographics to be the same, otherwise this can
     # be a major confounding factor. What we need is for every time
     # MetaWards is run, that the same decision is taken about how to
-    # round, and thus the same distribution of population amongst
+    # round, and thus the same distribution of population amongst
     # demographics is each ward is made. The only way to achieve this
     # is to use a semi-random algorithm, i.e. we use random number
     # generator with a fixed random number seed to make the decisions.
 
+    # The generator is counter-based (keyed on the seed and the index
+    # of the ward or link), so every ward and link can be processed
+    # independently and in parallel, while still giving the same
+    # decisions regardless of the number of threads.
+
     # While I don't like this, in most production use there will be
-    # real data on the demographic splits, and so real, rather than
+    # real data on the demographic splits, and so real, rather than
     # rounded values will be used and this algorithm will not be needed.
+    _split_populations(network=network, subnets=subnets,
+                       demographics=demographics, random_seed=random_seed,
+                       use_ratios=False, nthreads=nthreads,
+                       profiler=profiler)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+def specialise_susceptibles(network: Network,
+                            subnets: _List[Network],
+                            demographics: Demographics,
+                            random_seed: int = None,
+                            nthreads: int = 1,
+                            profiler: Profiler = None) -> None:
+    """Scale the susceptible populations of each of the (unscaled copies
+       of 'network' in) 'subnets' by the work and play ratios of the
+       corresponding demographic, and distribute any rounding remainders
+       (see :func:`distribute_remainders`). This is performed for all
+       demographics in a single parallel pass over the wards and links.
+       Demographics that use per-ward (list or dict) ratios are
+       scaled individually before the remainders are distributed.
 
-    from ._ran_binomial import seed_ran_binomial
-    if random_seed is None:
-        random_seed = 4751828
-
-    from ._console import Console
-
-    Console.print(
-        f"Seeding generator used for demographics with seed {random_seed}")
-    bin_rng = seed_ran_binomial(random_seed)
-
-    cdef binomial_rng* rng = _get_binomial_ptr(bin_rng)
-
-    allow_workers = create_int_array(len(demographics))
-    allow_players = create_int_array(len(demographics))
-
-    cdef int * allow_workers_ptr = get_int_array_ptr(allow_workers)
-    cdef int * allow_players_ptr = get_int_array_ptr(allow_players)
-
-    for i, demographic in enumerate(demographics):
-        allow_workers[i] = int(demographic.work_ratio != 0)
-        allow_players[i] = int(demographic.play_ratio != 0)
-
-    p = p.start("distribute_nodes")
-    for i in range(1, nnodes_plus_one):
-        if diff_nodes_array[i] != 0.0:
-            target = nodes_save_play_suscept[i]
-
-            for j in range(0, nsubnets):
-                sub_nodes_save_play_suscept = get_double_array_ptr(
-                                    subnets[j].nodes.save_play_suscept)
-
-                values_array[j] = sub_nodes_save_play_suscept[i]
-
-            diff_nodes_array[i] = redistribute(target, values_array,
-                                                nsubnets, rng,
-                                                allow_players_ptr)
-
-            for j in range(0, nsubnets):
-                sub_nodes_save_play_suscept = get_double_array_ptr(
-                                    subnets[j].nodes.save_play_suscept)
-                sub_nodes_play_suscept = get_double_array_ptr(
-                                    subnets[j].nodes.play_suscept)
-
-                sub_nodes_save_play_suscept[i] = values_array[j]
-                sub_nodes_play_suscept[i] = values_array[j]
-    p = p.stop()
-
-    p = p.start("distribute_links")
-    for i in range(1, nlinks_plus_one):
-        if diff_links_array[i] != 0.0:
-            target = links_weight[i]
-
-            for j in range(0, nsubnets):
-                sub_links_weight = get_double_array_ptr(
-                                            subnets[j].links.weight)
-
-                values_array[j] = sub_links_weight[i]
-
-            diff_links_array[i] = redistribute(target, values_array,
-                                                nsubnets, rng,
-                                                allow_workers_ptr)
-
-            for j in range(0, nsubnets):
-                sub_links_weight = get_double_array_ptr(
-                                            subnets[j].links.weight)
-                sub_links_suscept = get_double_array_ptr(
-                                            subnets[j].links.suscept)
-
-                sub_links_weight[i] = values_array[j]
-                sub_links_suscept[i] = values_array[j]
-    p = p.stop()
-
-    Console.print(
-        f"Number of differences is {int(sum(diff_nodes))} + "
-        f"{int(sum(diff_links))}")
+       Parameters
+       ----------
+       network: Network
+         The overall network
+       subnets: List[Network]
+         Copies of the overall network, one per demographic, whose
+         populations will be replaced by the specialised populations
+       demographics: Demographics
+         The demographics whose ratios are used to split the population
+       random_seed: int
+         Random seed used to decide where to allocate rounded individuals
+       nthreads: int
+         The number of threads over which to parallelise the split
+       profiler: Profiler
+         The profiler used to profile the split
+    """
+    if len(subnets) != len(demographics):
+        raise ValueError(
+            f"The number of sub-networks ({len(subnets)}) must equal "
+            f"the number of demographics ({len(demographics)})")
+
+    use_ratios = True
+
+    for demographic in demographics:
+        if not (_is_number(demographic.work_ratio) and
+                _is_number(demographic.play_ratio)):
+            use_ratios = False
+            break
+
+    if not use_ratios:
+        for subnet, demographic in zip(subnets, demographics):
+            subnet.scale_susceptibles(work_ratio=demographic.work_ratio,
+                                      play_ratio=demographic.play_ratio)
+
+    _split_populations(network=network, subnets=subnets,
+                       demographics=demographics, random_seed=random_seed,
+                       use_ratios=use_ratios, nthreads=nthreads,
+                       profiler=profiler)
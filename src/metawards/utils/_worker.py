@@ -70,10 +70,12 @@ def prepare_worker(params: Parameters, demographics: Demographics,
 
     max_nodes = options["max_nodes"]
     max_links = options["max_links"]
+    ward_order = options.get("ward_order", None)
     nthreads = options["nthreads"]
 
     del options["max_nodes"]
     del options["max_links"]
+    options.pop("ward_order", None)
 
     profiler = options["profiler"]
 
@@ -91,14 +93,16 @@ def prepare_worker(params: Parameters, demographics: Demographics,
                                          max_nodes=max_nodes,
                                          max_links=max_links,
                                          nthreads=nthreads,
-                                         profiler=profiler)
+                                         profiler=profiler,
+                                         ward_order=ward_order)
         else:
             network = Network.build(params=params,
                                     population=options.get("population", None),
                                     profiler=profiler,
                                     nthreads=nthreads,
                                     max_nodes=max_nodes,
-                                    max_links=max_links)
+                                    max_links=max_links,
+                                    ward_order=ward_order)
 
         global_network = network
 
@@ -117,11 +121,34 @@ def prepare_worker(params: Parameters, demographics: Demographics,
     return network
 
 
+_have_scoop_load_cache = False
+
+
+def _set_scoop_load_cache():
+    """Load the cache that the main process has shared as a scoop
+       constant. This is only done once per worker process
+    """
+    global _have_scoop_load_cache
+
+    if _have_scoop_load_cache:
+        return
+
+    from scoop import shared
+    from ._load_cache import set_load_cache
+
+    set_load_cache(shared.getConst("metawards_load_cache"))
+    _have_scoop_load_cache = True
+
+
 def run_worker(arguments):
     """Ask the worker to run a model using the passed variables and
        options. This will write to options['output_dir'] and will
        also return the population object that contains the final
-       population data.
+       population data. If options['results_store'] is True, then
+       the output is written to a local scratch directory instead,
+       and (output, archive) is returned, where 'archive' is the
+       packed output that should be added to the
+       :class:`~metawards.ResultsStore`
 
        WARNING - the iterator and extractor arguments rely on the
        workers starting in the same directory as the main process,
@@ -132,34 +159,73 @@ def run_worker(arguments):
     demographics = arguments["demographics"]
     options = arguments["options"]
 
+    # use anything that has already been loaded by the main process.
+    # This is normally sent once to each worker when the pool is
+    # created, but is shared as a scoop constant when using scoop
+    from ._load_cache import set_load_cache
+    set_load_cache(arguments.get("load_cache", None))
+
+    if arguments.get("scoop_load_cache", False):
+        _set_scoop_load_cache()
+
     # next, run the job, writing to output
     outdir = options["output_dir"]
     auto_bzip = options["auto_bzip"]
     del options["auto_bzip"]
 
+    # if the output is being collected into a results store, then
+    # write to a local scratch directory, and send the packed output
+    # back to the main process (which writes it to the store)
+    results_store = options.pop("results_store", False)
+
+    if results_store:
+        from .._resultsstore import ResultsStore
+        job_outdir = outdir
+        outdir = ResultsStore.create_scratch_dir()
+
     from ._console import Console
 
-    with OutputFiles(outdir, check_empty=False, force_empty=False,
-                     prompt=None, auto_bzip=auto_bzip) as output_dir:
-        with Console.redirect_output(outdir=outdir, auto_bzip=auto_bzip):
-            try:
-                # first, build and prepare the Network(s). This is built once
-                # from the parameters and demographics by loading files from
-                # the filesystem, as sending this over the physical network
-                # would be too expensive. Subsequent calls to this function
-                # after the Network(s) has been built will call
-                # network.update(params, demographics)
-                network = prepare_worker(params=params,
-                                         demographics=demographics,
-                                         options=options)
-
-                # if the user wanted to remove this directory then they would
-                # have done so in the main process - no need to check again
-                options["output_dir"] = output_dir
-
-                output = network.run(**options)
-
-                return output
-            except Exception:
-                Console.print_exception()
-                raise
+    log_mode = options.pop("log_mode", None)
+
+    if log_mode is not None:
+        Console.set_log_mode(**log_mode)
+
+    try:
+        with OutputFiles(outdir, check_empty=False, force_empty=False,
+                         prompt=None, auto_bzip=auto_bzip) as output_dir:
+            with Console.redirect_output(outdir=outdir, auto_bzip=auto_bzip):
+                try:
+                    # first, build and prepare the Network(s). This is built
+                    # once from the parameters and demographics by loading
+                    # files from the filesystem, as sending this over the
+                    # physical network would be too expensive. Subsequent
+                    # calls to this function after the Network(s) has been
+                    # built will call network.update(params, demographics)
+                    network = prepare_worker(params=params,
+                                             demographics=demographics,
+                                             options=options)
+
+                    # if the user wanted to remove this directory then they
+                    # would have done so in the main process - no need to
+                    # check again
+                    options["output_dir"] = output_dir
+
+                    output = network.run(**options)
+                except Exception:
+                    Console.print_exception()
+                    raise
+    except Exception:
+        if results_store:
+            # keep the output of failed runs so that the error can be found
+            import shutil
+            shutil.move(outdir, job_outdir)
+
+        raise
+
+    if results_store:
+        import shutil
+        archive = ResultsStore.pack(outdir)
+        shutil.rmtree(outdir)
+        return (output, archive)
+    else:
+        return output
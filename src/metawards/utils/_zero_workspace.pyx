@@ -4,7 +4,8 @@
 
 cimport cython
 
-from ..utils._get_array_ptr cimport get_int_array_ptr
+from ..utils._get_array_ptr cimport get_int_array_ptr, \
+                                   get_double_array_ptr
 
 __all__ = ["zero_workspace"]
 
@@ -28,6 +29,8 @@ def zero_workspace(workspace):
     cdef int * E_in_wards = get_int_array_ptr(workspace.E_in_wards)
     cdef int * I_in_wards = get_int_array_ptr(workspace.I_in_wards)
     cdef int * R_in_wards = get_int_array_ptr(workspace.R_in_wards)
+    cdef double * new_inf_moments = get_double_array_ptr(
+                                        workspace.new_inf_moments)
 
     cdef int i = 0
     cdef int j = 0
@@ -38,17 +41,27 @@ def zero_workspace(workspace):
             pinf_tot[i] = 0
             n_inf_wards[i] = 0
 
-        ward_inf_tot_i = get_int_array_ptr(workspace.ward_inf_tot[i])
+        if workspace.ward_inf_tot is not None:
+            ward_inf_tot_i = get_int_array_ptr(workspace.ward_inf_tot[i])
 
-        with nogil:
-            for j in range(0, NNODES_PLUS_ONE):
-                ward_inf_tot_i[j] = 0
+            with nogil:
+                for j in range(0, NNODES_PLUS_ONE):
+                    ward_inf_tot_i[j] = 0
+
+    if new_inf_moments:
+        for i in range(0, 5):
+            new_inf_moments[i] = 0.0
 
     with nogil:
         for j in range(0, NNODES_PLUS_ONE):
-            total_inf_ward[j] = 0
-            total_new_inf_ward[j] = 0
-            incidence[j] = 0
+            if total_inf_ward:
+                total_inf_ward[j] = 0
+
+            if total_new_inf_ward:
+                total_new_inf_ward[j] = 0
+
+            if incidence:
+                incidence[j] = 0
 
             if S_in_wards:
                 S_in_wards[j] = 0
@@ -73,3 +73,57 @@ def shared_network():
     network = Network.build(params, profiler=None)
 
     return network
+
+
+def _build_test_network(nwards: int = 10, nplayers: int = 500,
+                        positions: bool = True, cutoffs=None,
+                        extra_stages=None, seeds: str = "1 20 1"):
+    """Build a small network of 'nwards' wards, with workers and
+       players linking the wards, and a simple "lurgy" disease
+       (E, I, any 'extra_stages', then R). 'cutoffs' is an optional
+       dictionary of per-ward cutoffs, indexed by ward ID
+    """
+    from metawards import Network, Ward, Wards, Parameters, Disease
+
+    wards = [Ward(id=i, name=f"ward_{i}") for i in range(1, nwards + 1)]
+
+    for i, ward in enumerate(wards):
+        if positions:
+            ward.set_position(x=10.0 * (i + 1), y=5.0 * (i % 3), units="km")
+
+        ward.set_num_players(nplayers + 11 * i)
+
+        for j in range(1, 11):
+            if ((i + 1) * j) % 4 == 1:
+                ward.add_workers(20 + i + j,
+                                 destination=((j - 1) % nwards) + 1)
+
+        ward.add_player_weight(0.5, destination=i + 1)
+        ward.add_player_weight(0.5, destination=((i + 1) % nwards) + 1)
+
+        if cutoffs is not None and (i + 1) in cutoffs:
+            ward.set_cutoff(cutoffs[i + 1])
+
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5, is_infected=True)
+    disease.add(name="I", beta=0.8, progress=0.25, is_infected=True,
+                is_start_symptom=True)
+
+    for stage in (extra_stages or []):
+        disease.add(name=stage, beta=0.1, progress=0.2, is_infected=True)
+
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+    params.add_seeds(seeds)
+
+    return Network.from_wards(Wards(wards), params=params)
+
+
+@pytest.fixture
+def build_test_network():
+    """Return the function used to build the small wards-based test
+       networks (see _build_test_network for the arguments)
+    """
+    return _build_test_network
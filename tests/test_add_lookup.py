@@ -0,0 +1,133 @@
+from metawards import Network, Ward, Wards, Parameters, InputFiles, \
+    WardInfo
+from metawards.utils import add_lookup, clear_load_cache, \
+    set_network_cache_dir
+
+import os
+
+_header = "WD11CD,WD11NM,WD11NMW,CMWD11CD,CMWD11NM,CMWD11NMW,IND," \
+          "LAD11CD,LAD11NM,LAD11NMW,FID\n"
+
+_rows = [["E05000001", "Aldgate", "", "E36000001", "Aldgate and Tower", "",
+          "1", "E09000001", "City of London", "", "1"],
+         ["E05001980", "Clifton", "", "E36000533", "Clifton", "",
+          "0", "E06000023", "Bristol, City of", "", "2"],
+         ["E05001981", "Clifton East", "", "E36000534", "Clifton East", "",
+          "0", "E06000023", "Bristol, City of", "", "3"],
+         ["E05002000", "Cotham", "", "E36000535", "Cotham", "",
+          "0", "E06000023", "Bristol, City of", "", "4"]]
+
+_columns = {"code": 0, "name": 1, "alternate_code": 3,
+            "alternate_name": 4, "authority_code": 7,
+            "authority_name": 8, "region_code": 10}
+
+
+def _write_lookup(filename, rows):
+    with open(filename, "w") as FILE:
+        FILE.write(_header)
+
+        for row in rows:
+            FILE.write(",".join([f'"{x}"' if "," in x else x
+                                 for x in row]) + "\n")
+
+
+def _build_network(nwards, lookup):
+    wards = Wards()
+
+    for i in range(1, nwards + 1):
+        ward = Ward(id=i, name=f"ward_{i}")
+        ward.set_num_players(10)
+        wards.add(ward)
+
+    network = Network.from_wards(wards, params=Parameters())
+    network.params.input_files = InputFiles(lookup=lookup,
+                                            lookup_columns=_columns)
+    return network
+
+
+def _expected(row):
+    return WardInfo(code=row[0], name=row[1], alternate_codes=[row[3]],
+                    alternate_names=[row[4]], authority_code=row[7],
+                    authority=row[8], region_code=row[10])
+
+
+def test_add_lookup(tmpdir):
+    clear_load_cache()
+
+    filename = os.path.join(tmpdir, "lookup.csv")
+    _write_lookup(filename, _rows)
+
+    network = _build_network(len(_rows), filename)
+    add_lookup(network)
+
+    info = network.info
+    assert len(info) == len(_rows) + 1
+
+    # the search indexes are built from the columns, so WardInfo
+    # objects are only created for candidate matches
+    assert info.find_exact("aldgate and tower") == [1]
+    assert info.wards._infos == [None] * (len(_rows) + 1)
+    assert info.find("E36000535") == [4]
+    assert info.wards._infos[0:4] == [None] * 4
+
+    assert info.find(name="Clifton", authority="Bristol") == [2, 3]
+    assert info.find(r"^clifton$", authority="bristol") == [2]
+
+    assert info[0] is None
+
+    for i, row in enumerate(_rows):
+        assert info[i + 1] == _expected(row)
+        assert info.index(_expected(row)) == i + 1
+
+    assert network.get_node_index("Cotham") == 4
+
+    # changes to the infos are seen by searches
+    info[4].name = "Redland"
+    info._search = None
+    assert info.find("Redland") == [4]
+    assert info.find("Cotham", include_alternates=False) == []
+
+    # and the infos can still be changed
+    info[5] = WardInfo(name="Hotwells")
+    assert info.find("Hotwells") == [5]
+    assert isinstance(info.wards, list)
+
+    # a different number of wards is padded or truncated
+    network = _build_network(len(_rows) + 2, filename)
+    add_lookup(network)
+    assert len(network.info) == len(_rows) + 3
+    assert network.info[len(_rows) + 1] is None
+
+    network = _build_network(2, filename)
+    add_lookup(network)
+    assert len(network.info) == 3
+    assert network.info[2] == _expected(_rows[1])
+    assert network.info.find("Cotham") == []
+
+    # the lookup data is cached (including on disk), but is re-read
+    # if the file is changed
+    cache_dir = os.path.join(tmpdir, "cache")
+    set_network_cache_dir(cache_dir)
+
+    try:
+        clear_load_cache()
+        network = _build_network(len(_rows), filename)
+        add_lookup(network)
+        assert len(os.listdir(cache_dir)) == 1
+
+        clear_load_cache()
+        network = _build_network(len(_rows), filename)
+        add_lookup(network)
+        assert network.info[2] == _expected(_rows[1])
+
+        rows = [list(row) for row in _rows]
+        rows[1][1] = "Clifton Down"
+        _write_lookup(filename, rows)
+        os.utime(filename, ns=(0, 0))
+
+        network = _build_network(len(_rows), filename)
+        add_lookup(network)
+        assert network.info[2] == _expected(rows[1])
+    finally:
+        set_network_cache_dir(None)
+        clear_load_cache()
@@ -0,0 +1,50 @@
+import os
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _write_plots(path, nplots=5):
+    from PIL import Image
+
+    plots = []
+
+    for i in range(0, nplots):
+        # the last frame has a different size, so must be resized
+        size = (64, 48) if i < nplots - 1 else (128, 96)
+        color = (40 * i, 255 - 40 * i, 100)
+
+        filename = os.path.join(path, f"plot_{i}.png")
+        Image.new("RGB", size, color).save(filename)
+        plots.append(filename)
+
+    return plots
+
+
+@pytest.mark.parametrize("nprocs", [1, 2])
+def test_animate_plots(tmpdir, nprocs):
+    pytest.importorskip("PIL")
+    from PIL import Image, ImageSequence
+
+    from metawards.analysis import animate_plots
+
+    plots = _write_plots(str(tmpdir))
+    output = os.path.join(tmpdir, f"animate_{nprocs}.gif")
+
+    filename = animate_plots(plots=list(reversed(plots)), output=output,
+                             delay=200, ordering="filename", nprocs=nprocs)
+
+    assert filename == output
+
+    with Image.open(output) as gif:
+        assert gif.size == (64, 48)
+        assert gif.n_frames == len(plots)
+        assert gif.info["loop"] == 0
+
+        for i, frame in enumerate(ImageSequence.Iterator(gif)):
+            assert frame.info["duration"] == 200
+
+            expect = (40 * i, 255 - 40 * i, 100)
+            pixel = frame.convert("RGB").getpixel((32, 40))
+
+            assert all([abs(x - y) <= 4 for x, y in zip(pixel, expect)])
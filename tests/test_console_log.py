@@ -0,0 +1,106 @@
+from metawards import OutputFiles, Population
+from metawards.utils import Console
+
+import os
+import time
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _run(build_test_network, outdir, nsteps=20):
+    network = build_test_network(nplayers=1000, seeds="1 10 1")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None,
+                     auto_bzip=False) as output_dir:
+        with Console.redirect_output(outdir, auto_bzip=False):
+            Console.print("[bold]Starting the run[/]", markup=True)
+            network.run(population=Population(), output_dir=output_dir,
+                        nsteps=nsteps)
+
+    with open(os.path.join(outdir, "output.txt")) as FILE:
+        return FILE.read()
+
+
+def test_console_log(build_test_network, tmpdir):
+    outdir = os.path.join(tmpdir, "output")
+
+    try:
+        Console.set_log_mode("plain")
+        assert Console.get_log_mode() == {"mode": "plain", "every": 1}
+
+        output = _run(build_test_network, outdir)
+
+        assert "Starting the run\n" in output
+        assert "[bold]" not in output
+
+        for day in range(0, 21):
+            assert f"---- Day {day} ----\n" in output
+
+        assert output.count("Number of infections:") == 20
+
+        # only print the per-day summaries once a week
+        Console.set_log_mode("plain", every=7)
+
+        output = _run(build_test_network, outdir)
+
+        for day in range(0, 21):
+            assert (f"---- Day {day} ----\n" in output) == (day % 7 == 0)
+
+        assert output.count("Number of infections:") == 2
+        assert "Ending on day 20" in output
+
+        # the limit only applies to the model run, not direct calls
+        with Console.redirect_output(outdir, auto_bzip=False):
+            Console.print_population(Population(day=3, latent=42))
+
+        with open(os.path.join(outdir, "output.txt")) as FILE:
+            assert "E: 42 " in FILE.read()
+
+        with pytest.raises(ValueError):
+            Console.set_log_mode("fancy")
+
+        with pytest.raises(ValueError):
+            Console.set_log_mode("plain", every=0)
+    finally:
+        Console.set_log_mode()
+
+
+@pytest.mark.parametrize("every", ["0", "-1"])
+def test_console_log_every_cli(every):
+    import subprocess
+    import sys
+
+    # run in a subprocess as parse_args can only be called once, making
+    # sure that it imports the same (locally built) metawards as this test
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+    # the command line rejects invalid values rather than using 1
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from metawards.app.run import parse_args; "
+         f"sys.argv = ['metawards', '--log-every', '{every}']; "
+         "parse_args()"],
+        capture_output=True, text=True, env=env)
+
+    assert result.returncode != 0
+    assert f"--log-every must be 1 or more, not {every}" in result.stderr
+
+
+@pytest.mark.slow
+def test_console_log_benchmark(build_test_network, tmpdir):
+    outdir = os.path.join(tmpdir, "output")
+
+    try:
+        for mode in ["rich", "plain"]:
+            Console.set_log_mode(mode)
+
+            start = time.time()
+            output = _run(build_test_network, outdir, nsteps=200)
+            runtime = time.time() - start
+
+            print(f"{mode}: run time {runtime:.3f} s, "
+                  f"output.txt size {len(output)} bytes")
+    finally:
+        Console.set_log_mode()
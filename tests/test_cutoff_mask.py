@@ -0,0 +1,83 @@
+from metawards import OutputFiles, Population
+
+import os
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _expected_mask(network, links, nlinks):
+    cutoff = network.params.dyn_dist_cutoff
+    cutoffs = network.nodes.cutoff
+
+    return [0] + [int(links.distance[j] < min(cutoff,
+                                              cutoffs[links.ifrom[j]],
+                                              cutoffs[links.ito[j]]))
+                  for j in range(1, nlinks + 1)]
+
+
+def _assert_mask_correct(network):
+    (links_mask, play_mask) = network.get_cutoff_mask()
+
+    assert list(links_mask) == _expected_mask(network, network.links,
+                                              network.nlinks)
+    assert list(play_mask) == _expected_mask(network, network.play,
+                                             network.nplay)
+
+
+def test_cutoff_mask(build_test_network):
+    network = build_test_network(nplayers=150, cutoffs={3: 8.0},
+                                 seeds="1 5 1")
+
+    _assert_mask_correct(network)
+
+    # some, but not all, links must be outside of the cutoff
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    assert 0 < sum(links_mask) < network.nlinks
+    assert 0 < sum(play_mask) < network.nplay
+
+    # the masks are cached while the cutoffs don't change
+    assert network.get_cutoff_mask(nthreads=2)[0] is links_mask
+
+    # changing a per-ward cutoff rebuilds the masks
+    network.nodes.cutoff[5] = 0.0
+    assert network.get_cutoff_mask()[0] is not links_mask
+    _assert_mask_correct(network)
+
+    # as does changing the global cutoff via update
+    (links_mask, play_mask) = network.get_cutoff_mask()
+    params = network.params.copy()
+    params.dyn_dist_cutoff = 15.0
+    network.update(params)
+
+    assert network.get_cutoff_mask()[0] is not links_mask
+    assert sum(network.get_cutoff_mask()[0]) < sum(links_mask)
+    _assert_mask_correct(network)
+
+
+@pytest.mark.parametrize("nthreads", [1, 2])
+def test_cutoff_mask_run(build_test_network, nthreads):
+    # block all movements into or out of the seeded ward, so that
+    # the infection cannot spread to any other ward
+    network = build_test_network(nplayers=150, cutoffs={1: 0.0},
+                                 seeds="1 5 1")
+
+    outdir = os.path.join(script_dir, "test_cutoff_mask_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None) as output_dir:
+        network.run(population=Population(), output_dir=output_dir,
+                    nthreads=nthreads)
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    nodes = network.nodes
+    links = network.links
+
+    assert nodes.play_suscept[1] < nodes.save_play_suscept[1]
+
+    for i in range(2, network.nnodes + 1):
+        assert nodes.play_suscept[i] == nodes.save_play_suscept[i]
+
+    for j in range(1, network.nlinks + 1):
+        if links.ifrom[j] != 1:
+            assert links.suscept[j] == links.weight[j]
@@ -0,0 +1,102 @@
+from metawards import OutputFiles, Population
+from metawards.extractors import build_sampled_extractor, extract_large, \
+    extract_small
+
+import os
+import pickle
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _over_ten_infected(population):
+    return population.infecteds > 10
+
+
+def _run(network, extractor, nsteps=30):
+    outdir = os.path.join(script_dir, "test_extract_sampled_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None,
+                     auto_bzip=False) as output_dir:
+        trajectory = network.run(population=Population(),
+                                 output_dir=output_dir,
+                                 extractor=extractor, nsteps=nsteps)
+
+    days = {}
+
+    for filename in ["wards_trajectory_S.dat", "MeanXY.dat"]:
+        path = os.path.join(outdir, filename)
+
+        if os.path.exists(path):
+            with open(path) as FILE:
+                days[filename] = [int(line.split()[0]) for line in FILE]
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    return (trajectory, days)
+
+
+def test_extract_sampled(build_test_network):
+    (trajectory, days) = _run(build_test_network(),
+                              build_sampled_extractor(extract_large,
+                                                      every=7))
+
+    # output_core still runs every day, so the trajectory is complete
+    assert [p.day for p in trajectory] == list(range(0, 31))
+    assert days["wards_trajectory_S.dat"] == [7, 14, 21, 28]
+
+    (_, days) = _run(build_test_network(),
+                     build_sampled_extractor("extract_large", start=5,
+                                             end=20, every=5,
+                                             days=[2, 8]))
+    assert days["wards_trajectory_S.dat"] == [5, 8, 10, 15, 20]
+
+    # extractors that only have an "analyse" stage can also be wrapped
+    (trajectory, days) = _run(build_test_network(),
+                              build_sampled_extractor(
+                                  extract_small, when=_over_ten_infected))
+
+    expect = [p.day for p in trajectory[1:] if p.infecteds > 10]
+    assert len(expect) > 0
+    assert days["MeanXY.dat"] == expect
+    assert "wards_trajectory_S.dat" not in days
+
+
+def test_extract_sampled_options():
+    extractor = build_sampled_extractor(extract_small, every=3,
+                                        when=_over_ten_infected)
+
+    # the needs of the wrapped extractor are passed through
+    assert extractor.workspace_needs == extract_small.workspace_needs
+
+    # must be able to send this to worker processes
+    copy = pickle.loads(pickle.dumps(extractor))
+    assert copy.is_selected(Population(day=6))
+    assert not copy.is_selected(Population(day=7))
+
+    extractor = build_sampled_extractor(days=["2020-03-10"])
+
+    with pytest.raises(ValueError):
+        # no date, so cannot compare
+        extractor.is_selected(Population(day=5))
+
+    from datetime import date
+    assert extractor.is_selected(Population(day=5, date=date(2020, 3, 10)))
+    assert not extractor.is_selected(Population(day=5,
+                                                date=date(2020, 3, 11)))
+
+    # the trigger is checked later, when the functions are called
+    extractor = build_sampled_extractor(every=3, start=2, end=20,
+                                        when=_over_ten_infected)
+    assert extractor.is_selected(Population(day=5), check_when=False)
+    assert extractor.is_selected(Population(day=6),
+                                 check_when=False) is None
+    assert extractor.is_selected(Population(day=1),
+                                 check_when=False) is False
+
+    # days that are not selected have no analyse functions
+    assert extractor(stage="analyse", population=Population(day=1)) == []
+    assert extractor(stage="analyse", population=Population(day=21)) == []
+
+    with pytest.raises(ValueError):
+        build_sampled_extractor(every=0)
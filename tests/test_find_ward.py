@@ -0,0 +1,90 @@
+from metawards import WardInfo, WardInfos
+
+import re
+import pytest
+
+
+def _build_infos():
+    infos = WardInfos()
+    infos[0] = None
+
+    for i in range(1, 201):
+        region = ["North", "South", "East", "West"][i % 4]
+
+        infos[i] = WardInfo(name=f"Ward {i} {region}",
+                            code=f"E05{i:06d}",
+                            alternate_names=[f"Alt {i}"],
+                            alternate_codes=[f"E36{i:06d}"],
+                            authority=f"Authority {i % 7}",
+                            authority_code=f"E06{i % 7:06d}",
+                            region=f"{region} Region",
+                            region_code=f"E12{i % 4:06d}")
+
+    infos[201] = WardInfo(name="Clifton", code="E05001980")
+    infos[202] = WardInfo(name="Clifton Down", code="E05001981")
+    infos[203] = None
+    infos[204] = WardInfo(name="St. Mary's", code="E05001982")
+
+    return infos
+
+
+def _scan(infos, name, match, include_alternates):
+    """Brute-force regular expression search over every ward"""
+    search = re.compile(name, re.IGNORECASE)
+    search = search.match if match else search.search
+
+    matches = []
+
+    for i, ward in enumerate(infos.wards):
+        if ward is None:
+            continue
+
+        strings = [ward.name, ward.code]
+
+        if include_alternates:
+            strings += ward.alternate_names + ward.alternate_codes
+
+        if any(search(x) for x in strings):
+            matches.append(i)
+
+    return matches
+
+
+@pytest.mark.parametrize("name", ["ward 1", "WARD 12 ", "clifton",
+                                  "^clifton$", "^Clifton", "down$",
+                                  "E05000017", "e36", "alt 19", "st. m",
+                                  "ra", "1", "", "Ward [0-9]+ East$",
+                                  "missing"])
+@pytest.mark.parametrize("match", [False, True])
+@pytest.mark.parametrize("include_alternates", [False, True])
+def test_find_ward(name, match, include_alternates):
+    infos = _build_infos()
+
+    assert infos._find_ward(name, match=match,
+                            include_alternates=include_alternates) == \
+        _scan(infos, name, match=match,
+              include_alternates=include_alternates)
+
+
+def test_find_ward_index():
+    infos = _build_infos()
+
+    assert infos.find_exact("clifton") == [201]
+    assert infos.find_exact("e36000010") == [10]
+    assert infos.find_exact("e36000010", include_alternates=False) == []
+    assert infos.find_exact("Clift") == []
+
+    assert infos.find("Clifton/Authority 0") == []
+    assert infos.find(authority="authority 3", region="^north") == \
+        [i for i in range(1, 201) if i % 7 == 3 and i % 4 == 0]
+
+    # the index is only rebuilt when the wards change
+    index = infos._get_search_index("ward")
+    assert infos._get_search_index("ward") is index
+    assert infos.find("clifton down") == [202]
+
+    infos[202] = WardInfo(name="Redland", code="E05001981")
+    assert infos._search is None
+    assert infos.find("clifton down") == []
+    assert infos.find("redland") == [202]
+    assert infos.find_exact("redland") == [202]
@@ -88,5 +88,80 @@ def test_go_record():
     assert trajectory[-1].recovereds <= 100
 
 
+def _replay(nthreads):
+    from metawards import Infections
+
+    wards = [Ward(id=i, name=f"ward_{i}") for i in range(1, 5)]
+
+    for i, ward in enumerate(wards):
+        ward.set_num_players(100)
+        ward.add_workers(50, destination=((i + 1) % 4) + 1)
+
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5)
+    disease.add(name="I", beta=0.8, progress=0.25)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+
+    from metawards import Wards
+    network = Network.from_wards(Wards(wards), params=params)
+    infections = Infections.build(network)
+
+    for i in range(1, 5):
+        infections.play[1][i] = 10 * i
+        infections.work[0][i] = 5 * i
+
+    player = PersonType.PLAYER
+    worker = PersonType.WORKER
+
+    moves = MoveRecord()
+
+    for i in range(1, 5):
+        j = (i % 4) + 1
+        # more than are available, so must be clamped
+        moves.add(from_stage=1, to_stage=2, from_type=player,
+                  to_type=player, from_ward=i, to_ward=j, number=25)
+        # chained moves that depend on the order they are replayed
+        moves.add(from_stage=2, to_stage=-1, from_type=player,
+                  to_type=player, from_ward=j, to_ward=i, number=7)
+        # independent moves between workers
+        moves.add(from_stage=0, to_stage=0, from_type=worker,
+                  to_type=worker, from_ward=i, to_ward=j, number=3)
+        moves.add(from_stage=-1, to_stage=-1, from_type=worker,
+                  to_type=worker, from_ward=j, to_ward=i, number=2)
+
+    record = MoveRecord()
+    go_record(moves=moves, network=network, infections=infections,
+              record=record, nthreads=nthreads)
+
+    state = [list(x) for x in infections.play] + \
+            [list(x) for x in infections.work] + \
+            [list(network.nodes.play_suscept),
+             list(network.nodes.save_play_suscept),
+             list(network.links.suscept),
+             list(network.links.weight)]
+
+    return (state, [list(x) for x in record])
+
+
+def test_go_record_replay():
+    (state, record) = _replay(nthreads=1)
+
+    # the clamped moves moved only those that were available
+    assert record[0] == [0, 1, 2, 1, 0, 2, 2, 2, 10]
+
+    # the moves are replayed in order, so the chained move sees the
+    # individuals moved by the first move
+    assert record[1] == [0, 2, 2, 2, 0, -1, 2, 1, 7]
+
+    # the moves only move individuals between wards
+    assert sum(state[-3]) == 400
+    assert sum(state[-1]) == 200
+
+    assert _replay(nthreads=4) == (state, record)
+
+
 if __name__ == "__main__":
     test_go_record()
@@ -0,0 +1,110 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import metawards
+
+_import_dir = os.path.dirname(os.path.dirname(metawards.__file__))
+
+_list_modules = """
+import sys
+import time
+start = time.perf_counter()
+import metawards
+{extra}
+elapsed = time.perf_counter() - start
+compiled = [name for name, module in sys.modules.items()
+            if name.startswith("metawards") and
+            not getattr(module, "__file__", "").endswith(".py") and
+            getattr(module, "__file__", None) is not None]
+print(elapsed)
+print(",".join(sorted(compiled)))
+print(",".join(sorted(name for name in sys.modules
+                      if name.startswith("metawards"))))
+"""
+
+
+def _run_import(extra: str = ""):
+    """Import metawards in a fresh python process, returning the
+       time taken, the names of the compiled metawards modules that
+       were loaded, and the names of all loaded metawards modules
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([_import_dir,
+                                         env.get("PYTHONPATH", "")])
+
+    output = subprocess.check_output(
+        [sys.executable, "-c", _list_modules.format(extra=extra)],
+        env=env, cwd=_import_dir).decode("utf-8").strip().split("\n")
+
+    elapsed = float(output[-3])
+    compiled = [x for x in output[-2].split(",") if len(x) > 0]
+    loaded = [x for x in output[-1].split(",") if len(x) > 0]
+
+    return (elapsed, compiled, loaded)
+
+
+def test_lazy_import():
+    (elapsed, compiled, loaded) = _run_import()
+
+    print(f"import metawards took {1000.0*elapsed:.1f} ms")
+
+    # importing metawards must not load any compiled extension
+    assert compiled == []
+    assert loaded == ["metawards"]
+
+    # using a class loads only what that class needs
+    (elapsed, compiled, loaded) = _run_import("metawards.WardID")
+    assert compiled == []
+    assert "metawards._wardid" in loaded
+    assert "metawards.utils" not in loaded
+
+    # accessing a submodule loads it (and its compiled extensions)
+    (elapsed, compiled, loaded) = _run_import("metawards.utils.Console")
+    assert "metawards.utils" in loaded
+
+
+@pytest.mark.parametrize("name", metawards._lazy_modules +
+                         list(metawards._lazy_attributes.keys()))
+def test_lazy_import_order(name):
+    # every attribute must be importable first, without relying
+    # on other modules having already been imported
+    _run_import(f"metawards.{name}")
+
+
+def test_lazy_attributes():
+    assert metawards.Network.__name__ == "Network"
+    assert metawards.PersonType.__name__ == "PersonType"
+    assert metawards.run.__name__ == "run"
+    assert metawards.mixers.__name__ == "metawards.mixers"
+    assert isinstance(metawards.__version__, str)
+
+    for name in metawards.__all__:
+        assert name in dir(metawards)
+        assert getattr(metawards, name) is not None
+
+    with pytest.raises(AttributeError):
+        metawards.does_not_exist
+
+    from metawards import Wards, WardInfo
+    assert Wards is metawards.Wards
+    assert WardInfo is metawards.WardInfo
+
+
+@pytest.mark.slow
+def test_import_benchmark():
+    """Benchmark the time to import metawards, compared to the time
+       to import all of the classes and submodules
+    """
+    lazy = min(_run_import()[0] for _ in range(5))
+    eager = min(_run_import("; ".join(f"metawards.{x}" for x in
+                                      metawards._lazy_modules +
+                                      list(metawards._lazy_attributes)))[0]
+                for _ in range(5))
+
+    print(f"lazy import: {1000.0*lazy:.1f} ms, "
+          f"eager import: {1000.0*eager:.1f} ms")
+
+    assert lazy < eager
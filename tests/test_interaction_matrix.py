@@ -100,3 +100,120 @@ def test_matrix():
                 assert m3[i][j] == 0.0
             else:
                 assert m3[i][j] == 0.5
+
+
+def test_sparse_matrix():
+    from metawards.mixers import SparseInteractionMatrix
+
+    dense = InteractionMatrix.diagonal(n=5, value=1.0)
+    dense[0][3] = 0.5
+    dense[4][1] = 0.25
+
+    m = SparseInteractionMatrix.from_matrix(dense)
+
+    assert m.nnz() == 7
+    assert m == dense
+    assert m.to_dense() == dense
+    assert dense.to_sparse() == m
+    assert m.row(0) == ([0, 3], [1.0, 0.5])
+    assert m.row(4) == ([1, 4], [0.25, 1.0])
+
+    # setting to zero removes the coupling
+    m[0][3] = 0.0
+    assert m.nnz() == 6
+    assert m[0][3] == 0.0
+
+    m[2][0] = 2.0
+    m[2][4] = 3.0
+    assert m.row(2) == ([0, 2, 4], [2.0, 1.0, 3.0])
+    m.validate(n=5)
+
+    m.detach(2)
+    assert m.row(2) == ([2], [1.0])
+
+    assert SparseInteractionMatrix.diagonal(n=4) == \
+        InteractionMatrix.identity(n=4)
+
+    m2 = SparseInteractionMatrix.from_data(m.to_data())
+    assert m2 == m
+
+    with pytest.raises(ValueError):
+        m.validate(n=4)
+
+    with pytest.raises(ValueError):
+        SparseInteractionMatrix.from_matrix([[1.0, 0.0], [0.0]])
+
+    with pytest.raises(ValueError):
+        SparseInteractionMatrix.from_data({"size": 2, "indptr": [0, 1, 2],
+                                           "indices": [1, 2],
+                                           "values": [1.0, 1.0]})
+
+    with pytest.raises(IndexError):
+        m[0][5] = 1.0
+
+
+def test_sparse_matrix_cache():
+    from metawards.mixers import SparseInteractionMatrix
+
+    dense = [[1.0, 0.5], [0.0, 1.0]]
+
+    m = SparseInteractionMatrix.from_cached_matrix(dense, n=2)
+    assert m == dense
+
+    # an unchanged matrix is only converted once
+    assert SparseInteractionMatrix.from_cached_matrix(dense, n=2) is m
+
+    # as is an equal matrix, e.g. one rebuilt each day by a mixer
+    dense2 = [[1.0, 0.5], [0.0, 1.0]]
+    assert SparseInteractionMatrix.from_cached_matrix(dense2, n=2) is m
+
+    # in-place changes are seen
+    dense2[1][0] = 0.25
+    m2 = SparseInteractionMatrix.from_cached_matrix(dense2, n=2)
+    assert m2 == [[1.0, 0.5], [0.25, 1.0]]
+
+    matrix = InteractionMatrix.ones(n=2)
+    assert SparseInteractionMatrix.from_cached_matrix(matrix, n=2) == \
+        [[1.0, 1.0], [1.0, 1.0]]
+
+    matrix.detach(1)
+    assert SparseInteractionMatrix.from_cached_matrix(matrix, n=2) == \
+        [[1.0, 0.0], [0.0, 1.0]]
+
+    # the cached conversion is still validated against the size
+    with pytest.raises(ValueError):
+        SparseInteractionMatrix.from_cached_matrix(matrix, n=3)
+
+    # sparse matrices are returned unchanged
+    assert SparseInteractionMatrix.from_cached_matrix(m, n=2) is m
+
+
+def test_demographics_interaction_matrix_json():
+    from metawards import Demographics, Demographic
+    from metawards.mixers import SparseInteractionMatrix
+
+    demographics = Demographics()
+
+    for name in ["red", "green", "blue"]:
+        demographics.add(Demographic(name=name))
+
+    demographics.interaction_matrix = [[1.0, 0.5, 0.0],
+                                       [0.5, 1.0, 0.0],
+                                       [0.0, 0.0, 1.0]]
+
+    d = Demographics.from_json(demographics.to_json())
+    assert d.interaction_matrix == demographics.interaction_matrix
+
+    sparse = SparseInteractionMatrix.from_matrix(
+                                demographics.interaction_matrix)
+    demographics.interaction_matrix = sparse
+
+    d = Demographics.from_json(demographics.to_json())
+    assert isinstance(d.interaction_matrix, SparseInteractionMatrix)
+    assert d.interaction_matrix == sparse
+
+    data = demographics.to_data()
+    data["interaction_matrix"] = [[1.0, 0.0], [0.0, 1.0]]
+
+    with pytest.raises(ValueError):
+        Demographics.from_data(data)
@@ -0,0 +1,209 @@
+from metawards import Disease, Parameters, InputFiles
+from metawards.utils import load_cached, clear_load_cache, \
+    get_load_cache, set_load_cache, set_network_cache_dir
+
+import os
+import json
+import shutil
+
+script_dir = os.path.dirname(__file__)
+ncov_json = os.path.join(script_dir, "data", "ncov.json")
+
+
+def _counted(load):
+    """Return a wrapper that counts the number of times 'load'
+       is called
+    """
+    def wrapper():
+        wrapper.count += 1
+        return load()
+
+    wrapper.count = 0
+    return wrapper
+
+
+def test_load_cache(tmpdir):
+    clear_load_cache()
+
+    filename = os.path.join(tmpdir, "disease.json")
+    shutil.copy(ncov_json, filename)
+
+    load = _counted(lambda: Disease.from_json(filename))
+
+    d1 = load_cached("disease", filename, load)
+    d2 = load_cached("disease", filename, load)
+
+    assert load.count == 1
+    assert d1 == d2
+    assert d1 is not d2
+
+    # the copies are independent
+    d1.beta[0] = 0.123
+    assert load_cached("disease", filename, load).beta[0] != 0.123
+
+    # changing the file reloads the data
+    data = json.load(open(filename))
+    data["beta"][0] = 0.5
+    data["author(s)"] = "someone else"
+
+    with open(filename, "w") as FILE:
+        json.dump(data, FILE)
+
+    assert load_cached("disease", filename, load).beta[0] == 0.5
+    assert load.count == 2
+
+    # the state can be passed to, e.g., worker processes
+    state = get_load_cache()
+    clear_load_cache()
+    set_load_cache(state)
+    assert load_cached("disease", filename, load).beta[0] == 0.5
+    assert load.count == 2
+
+    # the data can also be cached on disk
+    cache_dir = os.path.join(tmpdir, "cache")
+    set_network_cache_dir(cache_dir)
+
+    try:
+        clear_load_cache()
+        load_cached("disease", filename, load)
+        assert load.count == 3
+        assert len(os.listdir(cache_dir)) == 1
+
+        clear_load_cache()
+        assert load_cached("disease", filename, load).beta[0] == 0.5
+        assert load.count == 3
+    finally:
+        set_network_cache_dir(None)
+        clear_load_cache()
+
+
+def _get_loaded_keys(_):
+    return sorted(get_load_cache()["loaded"].keys())
+
+
+def test_load_cache_pool_initializer(tmpdir):
+    from multiprocessing import Pool
+
+    clear_load_cache()
+
+    filename = os.path.join(tmpdir, "disease.json")
+    shutil.copy(ncov_json, filename)
+    load_cached("disease", filename, lambda: Disease.from_json(filename))
+
+    state = get_load_cache()
+    clear_load_cache()
+
+    # this is how run_models sends the cache once to each worker
+    with Pool(processes=2, initializer=set_load_cache,
+              initargs=(state,)) as pool:
+        keys = pool.map(_get_loaded_keys, range(0, 4))
+
+    assert keys == [sorted(state["loaded"].keys())] * 4
+    assert len(keys[0]) == 1
+
+
+def test_load_cache_model(tmpdir):
+    clear_load_cache()
+
+    disease = Disease.load(ncov_json)
+    assert Disease.load(ncov_json) == disease
+    assert disease._filename == ncov_json
+
+    filename = os.path.join(tmpdir, "params.json")
+
+    with open(filename, "w") as FILE:
+        json.dump({"name": "test", "length_day": 0.5}, FILE)
+
+    params = Parameters.load(filename=filename)
+    assert params.length_day == 0.5
+    assert Parameters.load(filename=filename) == params
+
+    with open(os.path.join(tmpdir, "work.dat"), "w") as FILE:
+        FILE.write("1 1 2 5\n")
+
+    filename = os.path.join(tmpdir, "description.json")
+
+    with open(filename, "w") as FILE:
+        json.dump({"name": "test", "work": "work.dat"}, FILE)
+
+    files = InputFiles.load(filename)
+    assert files.work == os.path.join(tmpdir, "work.dat")
+    assert InputFiles.load(filename) == files
+
+    filename = os.path.join(tmpdir, "wards.json")
+
+    with open(filename, "w") as FILE:
+        json.dump([], FILE)
+
+    assert InputFiles.load(filename).is_wards_data
+    assert InputFiles.load(filename).is_wards_data
+
+    clear_load_cache()
+
+
+def _git(repository, *args):
+    import subprocess
+    subprocess.run(["git", "-c", "user.name=test", "-c",
+                    "user.email=test@test", *args], cwd=repository,
+                   check=True, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL)
+
+
+def test_repository_version_cache(tmpdir):
+    from metawards import _parameters
+
+    repository = os.path.join(tmpdir, "repository")
+    os.makedirs(repository)
+
+    with open(os.path.join(repository, "data.txt"), "w") as FILE:
+        FILE.write("1\n")
+
+    with open(os.path.join(repository, ".gitignore"), "w") as FILE:
+        FILE.write("version\nversion.txt\n")
+
+    _git(repository, "init", "-q")
+    _git(repository, "add", "data.txt", ".gitignore")
+    _git(repository, "commit", "-q", "-m", "first")
+
+    def get_version():
+        _parameters._repositories.pop(repository, None)
+        return _parameters.get_repository_version(repository)
+
+    cache_dir = os.path.join(tmpdir, "cache")
+    set_network_cache_dir(cache_dir)
+
+    try:
+        # there is no ./version script, so this fails, and the
+        # failure must not be cached
+        assert get_version()["version"] == "unknown"
+        assert not os.path.exists(cache_dir) or \
+            len(os.listdir(cache_dir)) == 0
+
+        script = os.path.join(repository, "version")
+
+        with open(script, "w") as FILE:
+            FILE.write("#!/bin/sh\n"
+                       "echo \"{\\\"version\\\": \\\"$(cat data.txt)\\\"}\" "
+                       "> version.txt\n")
+
+        os.chmod(script, 0o755)
+
+        assert get_version()["version"] == "1"
+        assert len(os.listdir(cache_dir)) == 1
+
+        # the cached version is used if version.txt cannot be found
+        os.unlink(os.path.join(repository, "version.txt"))
+        os.unlink(script)
+        assert get_version()["version"] == "1"
+
+        # a new commit on the same branch must not use the cached version
+        with open(os.path.join(repository, "data.txt"), "w") as FILE:
+            FILE.write("2\n")
+
+        assert get_version()["version"] == "unknown"
+
+        _git(repository, "commit", "-q", "-a", "-m", "second")
+        assert get_version()["version"] == "unknown"
+    finally:
+        set_network_cache_dir(None)
+        _parameters._repositories.pop(repository, None)
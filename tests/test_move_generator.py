@@ -321,5 +321,47 @@ def test_move_generator():
         assert move == records[i]
 
 
+def test_move_generator_cache():
+    from metawards import Disease
+    from metawards.movers import _movegenerator
+
+    def _disease(stages):
+        disease = Disease(name="lurgy")
+        for stage in stages:
+            disease.add(name=stage, beta=0.5, progress=0.5)
+        disease.add(name="R")
+        return disease
+
+    params = Parameters()
+    params.set_disease(_disease(["E", "I"]))
+
+    network = Network.single(params, Population(initial=1000))
+
+    m = MoveGenerator(from_stage="I", to_stage="R")
+    assert m.generate(network) == [[0, 1, 0, 2]]
+
+    nentries = len(_movegenerator._move_cache)
+
+    # a new generator with the same settings should reuse the cached moves
+    m = MoveGenerator(from_stage="I", to_stage="R")
+    moves = m.generate(network)
+    assert moves == [[0, 1, 0, 2]]
+    assert len(_movegenerator._move_cache) == nentries
+
+    # changing the returned moves must not change the cache
+    moves[0][1] = 0
+    assert m.generate(network) == [[0, 1, 0, 2]]
+
+    # changing the disease must invalidate the cache
+    network.params.disease_params = _disease(["E", "X", "I"])
+    assert m.generate(network) == [[0, 2, 0, 3]]
+
+    # as must changing the stage names in place
+    network.params.disease_params.stage[1] = "I"
+    network.params.disease_params.stage[2] = "X"
+    assert m.generate(network) == [[0, 1, 0, 3]]
+
+
 if __name__ == "__main__":
     test_move_generator()
+    test_move_generator_cache()
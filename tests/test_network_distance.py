@@ -0,0 +1,123 @@
+from metawards import Network, Ward, Wards, Parameters
+from metawards.utils import set_network_cache_dir
+from metawards.utils._add_wards_network_distance import \
+    calc_network_distance, _get_distances_cache_key
+from metawards.utils._network_cache import save_to_network_cache
+
+import os
+import math
+import random
+import pytest
+
+
+def _build_network(coordinates: str):
+    rng = random.Random(19)
+
+    wards = []
+
+    for i in range(1, 51):
+        ward = Ward(id=i, name=f"ward_{i}")
+
+        if i == 7:
+            # leave one ward without a position
+            pass
+        elif coordinates == "lat/long":
+            ward.set_position(lat=rng.uniform(50.0, 58.0),
+                              long=rng.uniform(-5.0, 1.5))
+        else:
+            ward.set_position(x=rng.uniform(0.0, 500.0),
+                              y=rng.uniform(0.0, 500.0), units="km")
+
+        ward.set_num_players(100)
+
+        for j in rng.sample(range(1, 51), 5):
+            ward.add_workers(10, destination=j)
+            ward.add_player_weight(0.2, destination=j)
+
+        wards.append(ward)
+
+    return Network.from_wards(Wards(wards), params=Parameters())
+
+
+def _expected_distance(network, ifrom, ito):
+    x1 = network.nodes.x[ifrom]
+    y1 = network.nodes.y[ifrom]
+    x2 = network.nodes.x[ito]
+    y2 = network.nodes.y[ito]
+
+    if (x1 == 0 and y1 == 0) or (x2 == 0 and y2 == 0):
+        return 0.0
+    elif network.nodes.coordinates == "x/y":
+        return math.sqrt((x1 - x2)**2 + (y1 - y2)**2)
+
+    dlon = math.radians(x2 - x1)
+    dlat = math.radians(y2 - y1)
+
+    a = math.sin(dlat / 2)**2 + math.cos(math.radians(y1)) * \
+        math.cos(math.radians(y2)) * math.sin(dlon / 2)**2
+
+    return 2.0 * math.atan2(math.sqrt(a), math.sqrt(1 - a)) * 6378.16
+
+
+def _assert_distances_correct(network):
+    for (links, nlinks) in [(network.links, network.nlinks),
+                            (network.play, network.nplay)]:
+        for j in range(1, nlinks + 1):
+            expect = _expected_distance(network, links.ifrom[j],
+                                        links.ito[j])
+            assert links.distance[j] == pytest.approx(expect, abs=1e-9)
+
+    distances = [x for x in network.links.distance[1:network.nlinks + 1]
+                 if x != 0]
+
+    assert network.get_min_max_distances() == \
+        pytest.approx((min(distances), max(distances)))
+
+
+@pytest.mark.parametrize("coordinates", ["lat/long", "x/y"])
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_network_distance(coordinates, nthreads):
+    network = _build_network(coordinates)
+    assert network.nodes.coordinates == coordinates
+
+    for links in [network.links, network.play]:
+        for j in range(1, len(links.distance)):
+            links.distance[j] = 0.0
+
+    del network._min_max_distances
+
+    calc_network_distance(network, nthreads=nthreads)
+    _assert_distances_correct(network)
+
+
+def test_network_distance_cache(tmpdir):
+    cache_dir = os.path.join(tmpdir, "cache")
+    set_network_cache_dir(cache_dir)
+
+    try:
+        network = _build_network("lat/long")
+        _assert_distances_correct(network)
+
+        key = _get_distances_cache_key(network)
+        assert os.path.exists(os.path.join(cache_dir, f"{key}.pkl"))
+
+        # put different data into the cache to check that the
+        # distances are loaded rather than recalculated
+        links_distance = network.links.distance[0:network.nlinks + 1]
+        play_distance = network.play.distance[0:network.nplay + 1]
+        links_distance[1] += 1.0
+
+        save_to_network_cache(key, (links_distance, play_distance,
+                                    (1.0, 2.0)))
+
+        calc_network_distance(network)
+        assert network.links.distance[1] == links_distance[1]
+        assert network.get_min_max_distances() == (1.0, 2.0)
+
+        # moving a ward changes the key, so this is recalculated
+        network.nodes.y[3] += 0.5
+        assert _get_distances_cache_key(network) != key
+        calc_network_distance(network)
+        _assert_distances_correct(network)
+    finally:
+        set_network_cache_dir(None)
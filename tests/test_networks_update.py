@@ -0,0 +1,75 @@
+from metawards import Demographics, OutputFiles, Population
+from metawards.utils import NullProfiler
+
+import os
+
+script_dir = os.path.dirname(__file__)
+redgreenblue_json = os.path.join(script_dir, "data", "redgreenblue.json")
+
+
+def _build_networks(build_test_network):
+    network = build_test_network(nplayers=150, positions=False,
+                                 seeds="1 5 1")
+
+    return Demographics.load(redgreenblue_json).specialise(network)
+
+
+def _get_state(network):
+    return (list(network.nodes.play_suscept),
+            list(network.nodes.denominator_p),
+            list(network.nodes.denominator_pd),
+            list(network.links.suscept),
+            list(network.play.weight))
+
+
+def test_networks_update(build_test_network):
+    networks = _build_networks(build_test_network)
+
+    for subnet in networks.subnets:
+        assert subnet._prepared_key is not None
+
+    # nothing has changed, so nothing needs to be prepared again
+    params = networks.params
+    networks.update(params)
+
+    for subnet in networks.subnets:
+        assert subnet._prepared_key is not None
+
+    # only change the parameters of the "green" demographic
+    params = networks.params
+    params["green"].static_play_at_home = 0.5
+    params["green"].user_params["ignored"] = 1.0
+
+    before = [_get_state(subnet) for subnet in networks.subnets]
+    networks.update(params)
+    after = [_get_state(subnet) for subnet in networks.subnets]
+
+    assert before[0] == after[0]
+    assert before[1] != after[1]
+    assert before[2] == after[2]
+    assert networks.subnets[1].params.static_play_at_home == 0.5
+    assert networks.subnets[1].params.user_params["ignored"] == 1.0
+
+    # the result must be the same as fully updating a new network
+    expect = _build_networks(build_test_network)
+    expect.reset_everything(profiler=NullProfiler())
+    expect.update(params)
+
+    assert [_get_state(x) for x in expect.subnets] == after
+
+    # running the model changes the network, so everything must
+    # be reset by the next update
+    outdir = os.path.join(script_dir, "test_networks_update_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None) as output_dir:
+        networks.run(population=Population(), output_dir=output_dir,
+                     nsteps=5, nthreads=1)
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    for subnet in networks.subnets:
+        assert subnet._prepared_key is None
+
+    networks.update(params)
+
+    assert [_get_state(x) for x in networks.subnets] == after
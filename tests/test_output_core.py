@@ -0,0 +1,273 @@
+from metawards import Network, Ward, Wards, Parameters, Disease, \
+    Population, Infections, Workspace
+from metawards.extractors import output_core_serial, output_core_omp
+
+import random
+import pytest
+
+
+def _build_network():
+    rng = random.Random(7)
+
+    wards = []
+
+    for i in range(1, 41):
+        ward = Ward(id=i, name=f"ward_{i}")
+        ward.set_position(x=rng.uniform(0.0, 100.0),
+                          y=rng.uniform(0.0, 100.0), units="km")
+        ward.set_num_players(200 + i)
+
+        for j in rng.sample(range(1, 41), 4):
+            ward.add_workers(10 + j, destination=j)
+            ward.add_player_weight(0.25, destination=j)
+
+        wards.append(ward)
+
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5, is_infected=True)
+    disease.add(name="I1", beta=0.8, progress=0.25, is_infected=True,
+                is_start_symptom=True)
+    disease.add(name="I2", beta=0.8, progress=0.25, is_infected=True)
+    disease.add(name="H", beta=0.1, progress=0.1, is_infected=True)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+
+    network = Network.from_wards(Wards(wards), params=params)
+
+    infections = Infections.build(network=network)
+
+    for values in infections.work + infections.play:
+        for j in range(1, len(values)):
+            if rng.random() < 0.4:
+                values[j] = rng.randint(1, 5)
+
+    return (network, infections)
+
+
+def _expected(network, infections):
+    """Calculate the per-ward statistics directly from the infections"""
+    disease = network.params.disease_params
+    n = network.nnodes + 1
+    nstages = disease.N_INF_CLASSES()
+
+    ward_inf_tot = [[0] * n for _ in range(0, nstages)]
+    S = [0] * n
+
+    for j in range(1, network.nlinks + 1):
+        ifrom = network.links.ifrom[j]
+        S[ifrom] += int(network.links.suscept[j])
+
+        for i in range(0, nstages):
+            ward_inf_tot[i][ifrom] += infections.work[i][j]
+
+    for j in range(1, n):
+        S[j] += int(network.nodes.play_suscept[j])
+
+        for i in range(0, nstages):
+            ward_inf_tot[i][j] += max(0, infections.play[i][j])
+
+    infected = [i for i in range(0, nstages) if disease.is_infected[i]]
+
+    prevalence = [sum([ward_inf_tot[i][j] for i in infected])
+                  for j in range(0, n)]
+    incidence = [sum([ward_inf_tot[i][j] for i in infected
+                      if i <= disease.start_symptom])
+                 for j in range(0, n)]
+
+    return {"ward_inf_tot": ward_inf_tot, "S_in_wards": S,
+            "total_inf_ward": prevalence, "incidence": incidence,
+            "total_new_inf_ward": ward_inf_tot[infected[0]],
+            "n_inf_wards": [sum([1 for x in ward_inf_tot[i][1:] if x > 0])
+                            for i in range(0, nstages)]}
+
+
+@pytest.mark.parametrize("nthreads", [1, 3, 8])
+def test_output_core(nthreads):
+    (network, infections) = _build_network()
+    expected = _expected(network, infections)
+
+    workspace = Workspace.build(network)
+    population = Population()
+
+    if nthreads == 1:
+        output_core_serial(network=network, population=population,
+                           workspace=workspace, infections=infections)
+    else:
+        output_core_omp(network=network, population=population,
+                        workspace=workspace, infections=infections,
+                        nthreads=nthreads)
+
+    for key in ["S_in_wards", "total_inf_ward", "incidence",
+                "total_new_inf_ward", "n_inf_wards"]:
+        assert list(getattr(workspace, key)) == expected[key]
+
+    for i, values in enumerate(workspace.ward_inf_tot):
+        assert list(values) == expected["ward_inf_tot"][i]
+
+    assert list(workspace.inf_tot) == [sum(x[1:]) for x in infections.work]
+    assert list(workspace.pinf_tot) == [sum(x[1:]) for x in infections.play]
+
+    # I1 and I2 are both summarised into I, while H is an X stage
+    ward_inf_tot = expected["ward_inf_tot"]
+    assert list(workspace.I_in_wards) == [x + y for x, y in
+                                          zip(ward_inf_tot[1],
+                                              ward_inf_tot[2])]
+    assert list(workspace.X_in_wards["H"]) == ward_inf_tot[3]
+
+    assert population.susceptibles == sum(expected["S_in_wards"])
+    assert population.n_inf_wards == expected["n_inf_wards"][0]
+
+    new = expected["total_new_inf_ward"]
+    x = network.nodes.x
+    y = network.nodes.y
+
+    assert list(workspace.new_inf_moments) == pytest.approx(
+        [sum(new), sum([n * x[j] for j, n in enumerate(new)]),
+         sum([n * y[j] for j, n in enumerate(new)]),
+         sum([n * x[j]**2 for j, n in enumerate(new)]),
+         sum([n * y[j]**2 for j, n in enumerate(new)])])
+
+    # per-ward arrays that are not in the workspace are skipped
+    workspace.X_in_wards = None
+    workspace.E_in_wards = None
+    output_core_omp(network=network, population=population,
+                    workspace=workspace, infections=infections,
+                    nthreads=nthreads)
+    assert list(workspace.incidence) == expected["incidence"]
+
+
+def _output_incidence_only(network, workspace, **kwargs):
+    assert workspace.incidence is not None
+    assert workspace.S_in_wards is None
+    _output_incidence_only.total += sum(workspace.incidence)
+
+
+def extract_incidence_only(**kwargs):
+    return [_output_incidence_only]
+
+
+extract_incidence_only.workspace_needs = ["incidence"]
+
+
+@pytest.mark.parametrize("extractor, present, missing",
+                         [("extract_none", [],
+                           ["incidence", "S_in_wards", "ward_inf_tot"]),
+                          ("extract_small", ["inf_tot", "new_inf_moments"],
+                           ["incidence", "total_inf_ward", "I_in_wards"]),
+                          ("extract_default", ["incidence", "total_inf_ward"],
+                           ["S_in_wards", "X_in_wards", "ward_inf_tot"]),
+                          ("extract_large", ["S_in_wards", "X_in_wards"],
+                           ["ward_inf_tot", "total_new_inf_ward"])])
+def test_workspace_needs(extractor, present, missing):
+    import metawards.extractors
+    from metawards.extractors import build_custom_extractor
+
+    (network, infections) = _build_network()
+
+    extractor = getattr(metawards.extractors, extractor)
+    needs = Workspace.get_needs(extractor)
+
+    # the needs are passed through custom extractors
+    assert Workspace.get_needs(build_custom_extractor(extractor)) == needs
+
+    workspace = Workspace.build(network, needs=needs)
+
+    for key in present + ["inf_tot", "pinf_tot", "n_inf_wards"]:
+        assert getattr(workspace, key) is not None
+
+    for key in missing:
+        assert getattr(workspace, key) is None
+
+    # the per-stage totals are still calculated
+    population = Population()
+    output_core_omp(network=network, population=population,
+                    workspace=workspace, infections=infections, nthreads=2)
+
+    expected = _expected(network, infections)
+    assert list(workspace.n_inf_wards) == expected["n_inf_wards"]
+    assert population.susceptibles == sum(expected["S_in_wards"])
+
+
+def test_workspace_needs_run():
+    import os
+    from metawards import OutputFiles
+
+    (network, _) = _build_network()
+    network.params.add_seeds("1 20 5")
+
+    # extractors that don't declare their needs get everything
+    assert Workspace.get_needs(lambda **kwargs: []) is None
+
+    workspace = Workspace.build(network, needs=None)
+    assert workspace.S_in_wards is not None
+    assert workspace.ward_inf_tot is not None
+
+    def extract_unknown(**kwargs):
+        return []
+
+    extract_unknown.workspace_needs = ["unknown"]
+
+    with pytest.raises(ValueError):
+        Workspace.get_needs(extract_unknown)
+
+    _output_incidence_only.total = 0
+
+    outdir = os.path.join(os.path.dirname(__file__),
+                          "test_workspace_needs_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None) as output_dir:
+        network.run(population=Population(), output_dir=output_dir,
+                    extractor=extract_incidence_only, nsteps=10)
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    assert _output_incidence_only.total > 0
+
+
+def _advance_read_I(workspace, **kwargs):
+    # this is how the lockdown and vaccination tutorials read
+    # the per-ward infections from the workspace
+    _advance_read_I.values.append(workspace.I_in_wards[1])
+
+
+def iterate_read_I(**kwargs):
+    from metawards.iterators import iterate_default
+    return [_advance_read_I] + iterate_default(**kwargs)
+
+
+def test_workspace_needs_iterator():
+    import os
+    from metawards import OutputFiles
+    from metawards.extractors import extract_default
+    from metawards.iterators import iterate_default, build_custom_iterator
+    from metawards.mixers import mix_default
+    from metawards.movers import move_default
+
+    (network, _) = _build_network()
+    network.params.add_seeds("1 20 5")
+
+    # the built-in stage functions declare that they don't need
+    # anything beyond what extract_default needs
+    assert Workspace.get_needs(iterate_default, extract_default,
+                               mix_default, move_default) == \
+        Workspace.get_needs(extract_default)
+
+    # but iterators that don't declare their needs get everything
+    iterator = build_custom_iterator(iterate_read_I)
+    assert Workspace.get_needs(iterator, extract_default,
+                               mix_default, move_default) is None
+
+    _advance_read_I.values = []
+
+    outdir = os.path.join(os.path.dirname(__file__),
+                          "test_workspace_needs_iterator_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None) as output_dir:
+        network.run(population=Population(), output_dir=output_dir,
+                    iterator=iterate_read_I, nsteps=3)
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    assert len(_advance_read_I.values) == 3
@@ -0,0 +1,113 @@
+from metawards import Population, Populations, VariableSet, OutputFiles, \
+    Networks, Demographic
+from metawards.extractors._output_final_report import output_final_report
+from metawards.extractors._output_trajectory import output_trajectory
+
+from datetime import date, timedelta
+import os
+
+script_dir = os.path.dirname(__file__)
+
+
+def _build_trajectory(n: int, seed: int, with_date: bool = True):
+    trajectory = Populations()
+    start = date(2020, 3, 1)
+
+    for day in range(0, n):
+        pop = Population(susceptibles=1000 - seed - day, latent=day,
+                         total=2 * day + seed, recovereds=3 * day,
+                         n_inf_wards=day % 7, day=day,
+                         scale_uv=1.0 - 0.1 * (day % 3),
+                         totals={"H": day}, other_totals={"D": seed})
+
+        if with_date:
+            pop.date = start + timedelta(days=day)
+
+        if day == 2:
+            # missing values are written as zero
+            pop.latent = None
+            pop.other_totals = None
+
+        pop.subpops = [Population(susceptibles=day, latent=seed,
+                                  total=1, recovereds=2, n_inf_wards=3,
+                                  day=day, totals={"H": 4},
+                                  other_totals={"D": 5}),
+                       Population(susceptibles=seed, day=day)]
+
+        trajectory.append(pop)
+
+    return trajectory
+
+
+def _line(pop, extra=True):
+    values = [pop.susceptibles, pop.latent, pop.total]
+
+    if extra:
+        values += [(pop.totals or {}).get("H", 0),
+                   (pop.other_totals or {}).get("D", 0)]
+
+    values += [pop.recovereds, pop.n_inf_wards]
+
+    return ",".join([str(0 if x is None else x) for x in values])
+
+
+def test_output_final_report():
+    outdir = os.path.join(script_dir, "test_output_csv_output")
+
+    results = [(VariableSet(variables={"beta[1]": 0.1 * i},
+                            repeat_index=i + 1), _build_trajectory(5, i))
+               for i in range(0, 3)]
+
+    # failed runs have an empty trajectory
+    results.append((VariableSet(variables={"beta[1]": 0.5}), []))
+
+    with OutputFiles(outdir, force_empty=True, prompt=None,
+                     auto_bzip=False) as output_dir:
+        output_final_report(output_dir=output_dir, results=results)
+
+    with open(os.path.join(outdir, "results.csv")) as FILE:
+        lines = FILE.read().split("\n")
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    expect = ["fingerprint,repeat,beta[1],day,date,S,E,I,H,D,R,IW,SCALE_UV"]
+
+    for varset, trajectory in results:
+        for pop in trajectory:
+            expect.append(f"{varset.fingerprint()},{varset.repeat_index()},"
+                          f"{varset.variable_values()[0]},{pop.day},"
+                          f"{pop.date.isoformat()},{_line(pop)},"
+                          f"{pop.scale_uv}")
+
+    assert lines == expect + [""]
+
+
+def test_output_trajectory():
+    outdir = os.path.join(script_dir, "test_output_csv_output")
+
+    trajectory = _build_trajectory(6, 3, with_date=False)
+
+    networks = Networks(demographics=[Demographic(name="red"),
+                                      Demographic(name="")])
+
+    for network in [None, networks]:
+        with OutputFiles(outdir, force_empty=True, prompt=None,
+                         auto_bzip=False) as output_dir:
+            output_trajectory(network=network, output_dir=output_dir,
+                              trajectory=trajectory)
+
+        with open(os.path.join(outdir, "trajectory.csv")) as FILE:
+            lines = FILE.read().split("\n")
+
+        OutputFiles.remove(outdir, prompt=None)
+
+        expect = ["day,demographic,S,E,I,H,D,R,IW"]
+
+        for pop in trajectory:
+            expect.append(f"{pop.day},overall,{_line(pop)}")
+
+            if network is not None:
+                expect.append(f"{pop.day},red,{_line(pop.subpops[0])}")
+                expect.append(f"{pop.day},1,{_line(pop.subpops[1])}")
+
+        assert lines == expect + [""]
@@ -0,0 +1,126 @@
+from metawards import OutputFiles, Population
+from metawards.extractors import extract_wards_db, extract_large, \
+    output_wards_db, output_wards_trajectory, extract_default
+
+import os
+import sqlite3
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _read_dat(filename):
+    values = {}
+
+    with open(filename) as FILE:
+        for line in FILE:
+            line = [int(x) for x in line.split()]
+            values[line[0]] = line[1:]
+
+    return values
+
+
+def test_output_wards_db(build_test_network):
+    outdir = os.path.join(script_dir, "test_output_wards_db_output")
+
+    results = {}
+
+    for extractor in [extract_large, extract_wards_db]:
+        with OutputFiles(outdir, force_empty=True, prompt=None,
+                         auto_bzip=False) as output_dir:
+            network = build_test_network(extra_stages=["H"])
+            network.run(population=Population(), output_dir=output_dir,
+                        seed=42, extractor=extractor, nsteps=20)
+
+        if extractor is extract_large:
+            for stage in ["S", "E", "I", "R", "H"]:
+                results[stage] = _read_dat(os.path.join(
+                    outdir, f"wards_trajectory_{stage}.dat"))
+        else:
+            conn = sqlite3.connect(os.path.join(outdir,
+                                                "wards_trajectory.db"))
+
+            journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index'")]
+            rows = conn.execute(
+                "SELECT day, ward, S, E, I, R, H FROM wards_trajectory "
+                "ORDER BY day, ward").fetchall()
+            conn.close()
+
+        OutputFiles.remove(outdir, prompt=None)
+
+    assert journal == "delete"
+    assert indexes == ["wards_trajectory_ward_day"]
+
+    days = sorted(results["S"].keys())
+    assert len(rows) == 10 * len(days)
+
+    for (day, ward, *values) in rows:
+        for stage, value in zip(["S", "E", "I", "R", "H"], values):
+            assert results[stage][day][ward - 1] == value
+
+
+_timings = {}
+
+
+def _timed(func):
+    import time
+
+    def timed_func(**kwargs):
+        start = time.time()
+        func(**kwargs)
+        _timings[func.__name__] = _timings.get(func.__name__, 0.0) + \
+            time.time() - start
+
+    return timed_func
+
+
+def extract_db_bench(**kwargs):
+    funcs = extract_default(**kwargs)
+
+    if kwargs["stage"] == "analyse":
+        funcs.append(_timed(output_wards_db))
+
+    return funcs
+
+
+def extract_dat_bench(**kwargs):
+    funcs = extract_default(**kwargs)
+
+    if kwargs["stage"] == "analyse":
+        funcs.append(_timed(output_wards_trajectory))
+
+    return funcs
+
+
+@pytest.mark.slow
+def test_output_wards_db_benchmark(build_test_network):
+    outdir = os.path.join(script_dir, "test_output_wards_db_bench")
+
+    sizes = {}
+
+    for (extractor, filenames) in \
+            [(extract_dat_bench, ["wards_trajectory_S.dat",
+                                  "wards_trajectory_E.dat",
+                                  "wards_trajectory_I.dat",
+                                  "wards_trajectory_R.dat",
+                                  "wards_trajectory_H.dat"]),
+             (extract_db_bench, ["wards_trajectory.db"])]:
+        network = build_test_network(nwards=5000, extra_stages=["H"])
+
+        with OutputFiles(outdir, force_empty=True, prompt=None,
+                         auto_bzip=False) as output_dir:
+            network.run(population=Population(), output_dir=output_dir,
+                        seed=42, extractor=extractor, nsteps=40)
+
+        sizes[extractor.__name__] = sum([os.path.getsize(
+            os.path.join(outdir, filename)) for filename in filenames])
+
+        OutputFiles.remove(outdir, prompt=None)
+
+    for name, runtime in _timings.items():
+        print(f"{name}: {runtime:.3f} s")
+
+    for name, size in sizes.items():
+        print(f"{name}: {size / 1024 / 1024:.1f} MB")
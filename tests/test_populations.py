@@ -63,5 +63,78 @@ def test_populations():
     assert traj == traj2
 
 
+def test_populations_columns():
+    from datetime import date
+    import pytest
+
+    traj = Populations()
+
+    pops = []
+
+    for day in range(0, 10):
+        pop = Population(susceptibles=100 - day, latent=day, total=2 * day,
+                         recovereds=day // 2, n_inf_wards=day % 3, day=day,
+                         date=date(2020, 1, 1 + day),
+                         totals={"H": day}, other_totals={"V": 1})
+
+        if day == 3:
+            # None values, missing dictionaries and new keys
+            pop.latent = None
+            pop.other_totals = None
+            pop.totals["ICU"] = 7
+        elif day == 5:
+            # values that are not integers are still held
+            pop.scale_uv = 2
+            pop.initial = "unknown"
+            pop.totals = {}
+
+        if day >= 2:
+            pop.subpops = [Population(susceptibles=day, day=day),
+                           Population(total=day, day=day, totals={"H": 1})]
+
+        traj.append(pop)
+        pops.append(pop)
+
+    assert len(traj) == 10
+    assert list(traj) == pops
+    assert traj[-1] == pops[-1]
+    assert traj[2:5] == pops[2:5]
+
+    with pytest.raises(IndexError):
+        traj[10]
+
+    assert traj[3].latent is None
+    assert traj[3].other_totals is None
+    assert traj[3].totals == {"H": 3, "ICU": 7}
+    assert traj[4].totals == {"H": 4}
+    assert traj[5].totals == {}
+    assert traj[5].scale_uv == 2
+    assert traj[5].initial == "unknown"
+    assert traj[6].scale_uv == 1.0
+    assert traj[9].date == date(2020, 1, 10)
+
+    assert traj[1].subpops is None
+
+    for i in range(2, 10):
+        assert traj[i].subpops == pops[i].subpops
+
+    assert traj.get_column("susceptibles") == [100 - i for i in range(0, 10)]
+    assert traj.get_column("totals", "ICU", missing=0) == \
+        [0, 0, 0, 7, 0, 0, 0, 0, 0, 0]
+    assert traj.subpops[1].get_column("total") == \
+        [None, None] + list(range(2, 10))
+
+    s = pickle.dumps(traj)
+    assert pickle.loads(s) == traj
+
+    # merging is done a column at a time
+    merged = Populations()
+    merged.append(pops[0])
+    merged.extend(traj)
+    assert list(merged) == [pops[0]] + pops
+    assert merged[4].subpops == pops[3].subpops
+
+
 if __name__ == "__main__":
     test_populations()
+    test_populations_columns()
@@ -272,6 +272,99 @@ def test_read_edgecase2():
     assert v[".myvar"][2] == 3.141
 
 
+def _describe(variables):
+    return [(v.variables(), v._idx, v._nrepeats, v._output)
+            for v in variables]
+
+
+@pytest.mark.parametrize("filename", ["ncovparams.csv", "testparams.csv",
+                                      "testparams2.csv", "testparams3.csv",
+                                      "testparams4.csv", "horizontal.dat",
+                                      "params_with_repeats.csv",
+                                      "vertical.dat", "compliance.dat",
+                                      "demographic_scan.csv"])
+@pytest.mark.parametrize("lines", [None, 0, [1, 0]])
+@pytest.mark.parametrize("repeats", [1, 3, "each"])
+def test_read_variables_lazy(filename, lines, repeats):
+    filename = os.path.join(script_dir, "data", filename)
+
+    try:
+        eager = VariableSets.read(filename, lines)
+    except ValueError:
+        with pytest.raises(ValueError):
+            VariableSets.read(filename, lines, lazy=True)
+        return
+
+    lazy = VariableSets.read(filename, lines, lazy=True)
+
+    if repeats == "each":
+        repeats = list(range(1, len(eager) + 1))
+
+    eager = eager.repeat(repeats)
+    lazy = lazy.repeat(repeats)
+
+    assert len(lazy) == len(eager)
+    assert lazy == eager
+    assert _describe(lazy) == _describe(eager)
+    assert _describe([lazy[i] for i in range(0, len(lazy))]) == \
+        _describe(eager)
+
+    eager.set_outdir_from_number()
+    lazy.set_outdir_from_number()
+    assert _describe(lazy) == _describe(eager)
+
+    # repeats applied after naming keep the same output directories
+    assert _describe(lazy.repeat(2)) == _describe(eager.repeat(2))
+
+    lazy.set_outdir_from_uid()
+    uids = [v._output for v in lazy]
+    assert len(set(uids)) == len(lazy)
+    assert [v._output for v in lazy] == uids
+
+
+def test_read_variables_lazy_large(tmpdir):
+    filename = os.path.join(tmpdir, "design.csv")
+
+    with open(filename, "w") as FILE:
+        FILE.write("# a large design\nbeta[2], beta[3], repeats\n")
+
+        for i in range(0, 2000):
+            FILE.write(f"{0.1 + i/10000.0}, {0.2 + i/10000.0}, "
+                       f"{1 + (i % 3)}\n")
+
+    lazy = VariableSets.read(filename, lazy=True)
+    assert lazy._vars is None
+    assert len(lazy) == sum([1 + (i % 3) for i in range(0, 2000)])
+
+    assert lazy[1999]["beta[2]"] == 0.1 + 1999/10000.0
+    assert lazy[-1]["beta[2]"] == 0.1 + 1997/10000.0
+    assert lazy[-1].repeat_index() == 3
+
+    lazy = VariableSets.read(filename, line_numbers=[5, 1500], lazy=True)
+    assert [v["beta[3]"] for v in lazy] == \
+        [0.2 + 5/10000.0, 0.2 + 1500/10000.0, 0.2 + 5/10000.0,
+         0.2 + 5/10000.0]
+
+    with pytest.raises(ValueError):
+        VariableSets.read(filename, line_numbers=[2000], lazy=True)
+
+
+def test_read_variables_lazy_repeats(tmpdir):
+    filename = os.path.join(tmpdir, "design.csv")
+
+    # the repeats are interpreted in the same way as other values
+    with open(filename, "w") as FILE:
+        FILE.write("beta[2], repeats\n0.1, 2.0\n0.2, 1\n0.3, 3.0\n")
+
+    eager = VariableSets.read(filename)
+    lazy = VariableSets.read(filename, lazy=True)
+
+    assert len(eager) == 6
+    assert len(lazy) == len(eager)
+    assert lazy == eager
+    assert _describe(lazy) == _describe(eager)
+
+
 if __name__ == "__main__":
     test_variableset()
     test_parameterset()
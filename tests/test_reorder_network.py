@@ -0,0 +1,215 @@
+from metawards import Network, Ward, Wards, Parameters, Disease, \
+    OutputFiles, Population
+
+import os
+import random
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _build_wards(n: int = 8, seed_ward: int = None):
+    # a n x n grid of wards, numbered in a random order so that
+    # neighbouring wards have very different indexes
+    rng = random.Random(42)
+    positions = [(i, j) for i in range(0, n) for j in range(0, n)]
+    rng.shuffle(positions)
+
+    index = {pos: i + 1 for i, pos in enumerate(positions)}
+
+    wards = []
+
+    for i, (x, y) in enumerate(positions):
+        ward = Ward(id=i + 1, name=f"ward_{x}_{y}")
+        ward.set_position(x=10.0 * (x + 1), y=10.0 * (y + 1), units="km")
+        ward.set_num_players(100 + 3 * i)
+
+        for (dx, dy) in [(0, 0), (1, 0), (0, 1), (-1, 0), (0, -1)]:
+            dest = index.get((x + dx, y + dy), None)
+
+            if dest is not None:
+                ward.add_workers(5 + (i + dest) % 7, destination=dest)
+                ward.add_player_weight(0.2, destination=dest)
+
+        if seed_ward is not None and i + 1 == seed_ward:
+            # stop this ward infecting, or being infected by, others
+            ward.set_cutoff(0.0)
+
+        wards.append(ward)
+
+    return Wards(wards)
+
+
+def _build_network(seed_ward: int = None, ward_order=None):
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5, is_infected=True)
+    disease.add(name="I", beta=0.8, progress=0.25, is_infected=True,
+                is_start_symptom=True)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+
+    if seed_ward is not None:
+        params.add_seeds(f"1 5 {seed_ward}")
+
+    return Network.from_wards(_build_wards(seed_ward=seed_ward),
+                              params=params, ward_order=ward_order)
+
+
+def _wards_data(network):
+    # the play weights are accumulated in a different order, so
+    # can differ by rounding errors
+    data = network.to_wards().to_data()
+
+    for ward in data:
+        if ward is not None and "players" in ward:
+            ward["players"]["weights"] = [round(x, 10) for x in
+                                          ward["players"]["weights"]]
+
+    return data
+
+
+def _link_span(network):
+    links = network.links
+    return sum([abs(links.ifrom[j] - links.ito[j])
+                for j in range(1, network.nlinks + 1)]) / network.nlinks
+
+
+def test_reorder_network():
+    network = _build_network()
+    reordered = network.copy().reorder_wards("hilbert")
+
+    assert reordered.population == network.population
+    assert reordered.work_population == network.work_population
+    assert reordered.play_population == network.play_population
+
+    # reordering must not change the copied-from network
+    assert network._original_index is None
+    assert _wards_data(network) == _wards_data(_build_network())
+
+    # the wards are unchanged, other than their order in memory
+    assert _wards_data(reordered) == _wards_data(network)
+
+    # linked wards are now much closer together in memory
+    assert _link_span(reordered) < 0.5 * _link_span(network)
+
+    for (links, begin, end, self_link) in \
+            [(reordered.links, "begin_to", "end_to", "self_w"),
+             (reordered.play, "begin_p", "end_p", "self_p")]:
+        keys = [(links.ifrom[j], links.ito[j]) for j in range(1, len(links))]
+        assert keys == sorted(keys)
+
+        nodes = reordered.nodes
+
+        for i in range(1, reordered.nnodes + 1):
+            for j in range(getattr(nodes, begin)[i], getattr(nodes, end)[i]):
+                assert links.ifrom[j] == i
+
+            j = getattr(nodes, self_link)[i]
+            assert links.ifrom[j] == i and links.ito[j] == i
+
+    # integer lookups use the original ward index, and names still work
+    for i in range(1, network.nnodes + 1):
+        j = reordered.get_node_index(i)
+        assert reordered.nodes.label[j] == i
+        assert reordered.info[j] == network.info[i]
+        assert reordered.get_node_index(network.info[i].name) == j
+
+    values = list(range(0, reordered.nnodes + 1))
+    assert reordered.in_original_order(reordered.nodes.label) == values[1:]
+
+    # a second reordering composes with the first
+    order = list(range(0, reordered.nnodes + 1))
+    order[1:] = reversed(order[1:])
+    reordered.reorder_wards(order)
+    assert _wards_data(reordered) == _wards_data(network)
+    assert reordered.in_original_order(reordered.nodes.label) == values[1:]
+
+    with pytest.raises(ValueError):
+        network.copy().reorder_wards([0, 1, 1])
+
+    with pytest.raises(ValueError):
+        network.copy().reorder_wards("unknown")
+
+    # sub-networks with their own work matrix must be reordered via
+    # the overall network, before they are specialised
+    subnet = network.copy()
+    subnet._work_index = list(range(0, subnet.nnodes + 1))
+
+    with pytest.raises(ValueError, match="Reorder the network before"):
+        subnet.reorder_wards()
+
+
+def _read_incidence(outdir):
+    filename = os.path.join(outdir, "incidence.dat")
+
+    if not os.path.exists(filename):
+        import bz2
+        with bz2.open(filename + ".bz2", "rt") as FILE:
+            lines = FILE.readlines()
+    else:
+        with open(filename) as FILE:
+            lines = FILE.readlines()
+
+    return [[int(x) for x in line.split()[1:]] for line in lines]
+
+
+@pytest.mark.parametrize("nthreads", [1, 2])
+def test_reorder_network_output(nthreads):
+    seed_ward = 17
+
+    network = _build_network(seed_ward=seed_ward, ward_order="hilbert")
+    assert network.get_node_index(seed_ward) != seed_ward
+
+    outdir = os.path.join(script_dir, "test_reorder_network_output")
+
+    with OutputFiles(outdir, force_empty=True, prompt=None,
+                     auto_bzip=False) as output_dir:
+        network.run(population=Population(), output_dir=output_dir,
+                    nthreads=nthreads, nsteps=20)
+
+    incidence = _read_incidence(outdir)
+
+    OutputFiles.remove(outdir, prompt=None)
+
+    # the infection is confined to the seeded ward, which must be
+    # output in its original position
+    assert sum([row[seed_ward - 1] for row in incidence]) > 0
+
+    for row in incidence:
+        for i, value in enumerate(row):
+            if i != seed_ward - 1:
+                assert value == 0
+
+
+@pytest.mark.slow
+def test_reorder_network_benchmark():
+    import time
+
+    networks = {"shuffled": None, "hilbert": None}
+
+    params = _build_network().params
+
+    for order in networks.keys():
+        # make the network big enough to not fit in cache
+        wards = _build_wards(n=200)
+        network = Network.from_wards(wards, params=params.copy(),
+                                     ward_order=None if order == "shuffled"
+                                     else order)
+        network.params.add_seeds("1 100 1")
+
+        outdir = os.path.join(script_dir, "test_reorder_network_bench")
+
+        start = time.time()
+        with OutputFiles(outdir, force_empty=True, prompt=None) as output_dir:
+            network.run(population=Population(), output_dir=output_dir,
+                        nthreads=1, nsteps=30)
+        networks[order] = (time.time() - start, _link_span(network))
+
+        OutputFiles.remove(outdir, prompt=None)
+
+    for order, (runtime, span) in networks.items():
+        print(f"{order}: run time {runtime:.3f} s, mean link span {span:.1f}")
+
+    assert networks["hilbert"][1] < networks["shuffled"][1]
@@ -0,0 +1,223 @@
+from metawards import OutputFiles, Population, ResultsStore, \
+    VariableSet, VariableSets
+from metawards.utils import run_models
+
+import os
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _build_variables(betas=[0.6, 0.9]):
+    variables = VariableSets()
+
+    for beta in betas:
+        variables.append(VariableSet(variables={"beta[1]": beta}))
+
+    return variables.repeat(2)
+
+
+def _run(network, outdir, results_store, betas=[0.6, 0.9], nprocs=1):
+    with OutputFiles(outdir, force_empty=True, prompt=None,
+                     auto_bzip=True) as output_dir:
+        results = run_models(network=network,
+                             variables=_build_variables(betas),
+                             population=Population(), nprocs=nprocs,
+                             nthreads=1, seed=0, nsteps=20,
+                             output_dir=output_dir,
+                             results_store=results_store,
+                             results_shards=2)
+
+    return results
+
+
+def test_results_store(build_test_network):
+    outdir = os.path.join(script_dir, "test_results_store_output")
+
+    _run(build_test_network(), outdir, results_store=False)
+
+    expect = {}
+
+    for name in sorted(os.listdir(outdir)):
+        path = os.path.join(outdir, name)
+
+        if os.path.isdir(path):
+            expect[name] = sorted(os.listdir(path))
+
+            with open(os.path.join(path, "trajectory.csv.bz2"), "rb") as FILE:
+                expect[(name, "trajectory")] = FILE.read()
+
+    assert len([key for key in expect if isinstance(key, str)]) == 4
+
+    results = _run(build_test_network(), outdir, results_store=True)
+
+    assert len(results) == 4
+
+    # no per-run directories - just the shards and index
+    assert sorted([name for name in os.listdir(outdir)
+                   if os.path.isdir(os.path.join(outdir, name))]) == []
+    assert "runs_index.csv" in os.listdir(outdir)
+    assert len([x for x in os.listdir(outdir) if x.endswith(".tar")]) <= 2
+
+    store = ResultsStore(outdir)
+
+    runs = store.runs()
+    assert runs == [(v.fingerprint(), v.repeat_index())
+                    for (v, _) in results]
+
+    for (fingerprint, repeat) in runs:
+        name = store.get_name(fingerprint, repeat)
+        assert sorted(store.files(fingerprint, repeat)) == expect[name]
+
+        # the random seed is fixed, so the output is the same
+        assert store.read(fingerprint, repeat, "trajectory.csv.bz2") == \
+            expect[(name, "trajectory")]
+
+        import bz2
+        assert store.open(fingerprint, repeat, "trajectory.csv").read() == \
+            bz2.decompress(expect[(name, "trajectory")]).decode("utf-8")
+
+    (fingerprint, repeat) = runs[-1]
+    extracted = store.extract(fingerprint, repeat,
+                              os.path.join(outdir, "extracted"))
+    assert sorted(os.listdir(extracted)) == \
+        expect[store.get_name(fingerprint, repeat)]
+
+    with pytest.raises(KeyError):
+        store.get_name("unknown", 1)
+
+    with pytest.raises(FileNotFoundError):
+        store.read(fingerprint, repeat, "unknown.csv")
+
+    store.close()
+
+    OutputFiles.remove(outdir, prompt=None)
+
+
+def test_results_store_add():
+    outdir = os.path.join(script_dir, "test_results_store_add")
+
+    rundir = os.path.join(outdir, "run")
+    os.makedirs(os.path.join(rundir, "sub"))
+
+    with open(os.path.join(rundir, "a.txt"), "w") as FILE:
+        FILE.write("hello\n")
+
+    with open(os.path.join(rundir, "sub", "b.txt"), "w") as FILE:
+        FILE.write("world\n")
+
+    archive = ResultsStore.pack(rundir)
+
+    with ResultsStore(outdir, nshards=3) as store:
+        for i in range(0, 6):
+            store.add(fingerprint=f"f{i // 2}", repeat=(i % 2) + 1,
+                      name=f"run{i}", archive=archive)
+
+        # the same fingerprint and repeat can be added under a new name
+        store.add(fingerprint="f0", repeat=1, name="again",
+                  archive=archive)
+
+        # but names must be unique
+        with pytest.raises(KeyError):
+            store.add(fingerprint="f9", repeat=1, name="run0",
+                      archive=archive)
+
+        # can read while writing
+        assert store.read("f2", 2, "sub/b.txt") == b"world\n"
+
+    store = ResultsStore(outdir)
+    assert len(store.runs()) == 7
+    assert store.names()[-1] == "again"
+    assert store.get_name("f0", 1) == "run0"
+    assert store.read(filename="a.txt", name="again") == b"hello\n"
+    assert sorted(store.files("f1", 1)) == ["a.txt", "sub/b.txt"]
+
+    # all repeats of a fingerprint are in the same shard
+    with open(os.path.join(outdir, "runs_index.csv")) as FILE:
+        shards = {}
+        for line in FILE.readlines()[1:]:
+            (fingerprint, _, _, shard) = line.strip().split(",")
+            shards.setdefault(fingerprint, set()).add(shard)
+
+    assert all([len(x) == 1 for x in shards.values()])
+
+    store.close()
+
+    OutputFiles.remove(outdir, prompt=None)
+
+
+def test_results_store_duplicate_rows(build_test_network):
+    outdir = os.path.join(script_dir, "test_results_store_dups")
+
+    # the design has two identical rows, each repeated twice, so
+    # there are two runs for every (fingerprint, repeat)
+    results = _run(build_test_network(), outdir, results_store=True,
+                   betas=[0.6, 0.6])
+
+    assert len(results) == 4
+
+    # none of the runs failed
+    assert all([len(output) > 0 for (_, output) in results])
+
+    store = ResultsStore(outdir)
+
+    names = store.names()
+    assert len(names) == 4
+    assert len(set(names)) == 4
+    assert len(set(store.runs())) == 2
+
+    for name in names:
+        assert "trajectory.csv.bz2" in store.files(name=name)
+        assert len(store.read(filename="trajectory.csv", name=name)) > 0
+
+    store.close()
+
+    OutputFiles.remove(outdir, prompt=None)
+
+
+def test_results_store_collect_duplicate_rows():
+    from metawards.utils._run_models import _generate_jobs, _collect_outputs
+
+    outdir = os.path.join(script_dir, "test_results_store_collect")
+    rundir = os.path.join(script_dir, "test_results_store_collect_run")
+    os.makedirs(rundir, exist_ok=True)
+
+    # this is how the parallel workers return their output
+    outputs = {}
+
+    def get_result(i):
+        with open(os.path.join(rundir, "a.txt"), "w") as FILE:
+            FILE.write(f"run {i}\n")
+
+        outputs[i] = [Population(day=i)]
+        archive = ResultsStore.pack(rundir)
+        return lambda: (outputs[i], archive)
+
+    with OutputFiles(outdir, force_empty=True,
+                     prompt=None) as output_dir:
+        seeds = iter(range(1, 100))
+        jobs = list(_generate_jobs(_build_variables([0.6, 0.6]),
+                                   lambda: next(seeds), output_dir))
+
+        results = []
+
+        with ResultsStore(outdir) as store:
+            _collect_outputs([(job, get_result(job[0])) for job in jobs],
+                             outputs=results, njobs=len(jobs),
+                             results_store=store)
+
+    # every run succeeded and can be read back
+    assert [output for (_, output) in results] == \
+        [outputs[i] for i in range(0, 4)]
+
+    store = ResultsStore(outdir)
+    assert store.names() == [os.path.basename(job[3]) for job in jobs]
+
+    for i, name in enumerate(store.names()):
+        assert store.read(filename="a.txt", name=name) == \
+            f"run {i}\n".encode("utf-8")
+
+    store.close()
+
+    OutputFiles.remove(outdir, prompt=None)
+    OutputFiles.remove(rundir, prompt=None)
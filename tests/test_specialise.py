@@ -0,0 +1,91 @@
+from metawards import Network, Ward, Wards, Parameters, Disease, \
+    Demographics
+
+import os
+import pytest
+
+script_dir = os.path.dirname(__file__)
+redgreenblue_json = os.path.join(script_dir, "data", "redgreenblue.json")
+
+
+def _build_network():
+    wards = [Ward(id=i, name=f"ward_{i}") for i in range(1, 21)]
+
+    for i, ward in enumerate(wards):
+        ward.set_num_players(101 + 7 * i)
+
+        for j in range(1, 21):
+            if (i + j) % 3 == 0:
+                ward.add_workers(14 + i + j, destination=j)
+
+    wards = Wards(wards)
+
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5)
+    disease.add(name="I", beta=0.8, progress=0.25)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+
+    return Network.from_wards(wards, params=params)
+
+
+def _get_populations(networks):
+    return [(list(subnet.nodes.save_play_suscept),
+             list(subnet.links.weight)) for subnet in networks.subnets]
+
+
+@pytest.mark.parametrize("nthreads", [1, 4])
+def test_specialise(nthreads):
+    network = _build_network()
+    demographics = Demographics.load(redgreenblue_json)
+
+    networks = demographics.specialise(network, nthreads=nthreads)
+
+    assert networks.overall.population == \
+        sum([x.population for x in networks.subnets])
+
+    # every ward and link must be fully split between the demographics
+    for i in range(1, network.nnodes + 1):
+        assert sum([x.nodes.save_play_suscept[i]
+                    for x in networks.subnets]) == \
+            network.nodes.save_play_suscept[i]
+
+    for i in range(1, network.nlinks + 1):
+        assert sum([x.links.weight[i] for x in networks.subnets]) == \
+            network.links.weight[i]
+
+    # no workers should be allocated to "red", as work_ratio is 0
+    assert network.work_population > 0
+    assert networks.subnets[0].work_population == 0
+
+    # the split must not depend on the number of threads
+    serial = demographics.specialise(_build_network(), nthreads=1)
+    assert _get_populations(serial) == _get_populations(networks)
+
+
+def test_specialise_cache(tmpdir):
+    from metawards.utils._network_cache import set_network_cache_dir
+
+    demographics = Demographics.load(redgreenblue_json)
+    expect = _get_populations(demographics.specialise(_build_network()))
+
+    set_network_cache_dir(str(tmpdir))
+
+    try:
+        # first run populates the cache, the second reads from it
+        first = demographics.specialise(_build_network(), nthreads=2)
+        assert len(os.listdir(str(tmpdir))) == 1
+
+        second = demographics.specialise(_build_network(), nthreads=2)
+        assert len(os.listdir(str(tmpdir))) == 1
+    finally:
+        set_network_cache_dir(None)
+
+    assert _get_populations(first) == expect
+    assert _get_populations(second) == expect
+
+    for subnet in second.subnets:
+        assert list(subnet.nodes.play_suscept) == \
+            list(subnet.nodes.save_play_suscept)
@@ -0,0 +1,116 @@
+import os
+import pytest
+
+script_dir = os.path.dirname(__file__)
+
+
+def _write_results(filename, nfingerprints=3, nrepeats=3, ndays=20):
+    import bz2
+    import random
+    from datetime import date, timedelta
+
+    rng = random.Random(42)
+    start = date(2020, 3, 1)
+
+    with bz2.open(filename, "wt") as FILE:
+        FILE.write("fingerprint,repeat,beta[1],day,date,S,E,I,IW,R\n")
+
+        for i in range(0, nfingerprints):
+            fingerprint = f"0i{i}"
+
+            for repeat in range(1, nrepeats + 1):
+                for day in range(0, ndays):
+                    d = (start + timedelta(days=day)).isoformat()
+                    values = [rng.randint(0, 1000) for _ in range(0, 5)]
+                    FILE.write(f"{fingerprint},{repeat},0.{i},{day},{d},"
+                               f"{','.join([str(v) for v in values])}\n")
+
+
+def test_summary_plot_streaming(tmpdir):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from metawards.analysis._summary_plot import _stream_results
+
+    results = os.path.join(tmpdir, "results.csv.bz2")
+    _write_results(results)
+
+    df = pd.read_csv(results)
+    columns = ["E", "I", "IW", "R"]
+
+    for nbuckets in [1, 4]:
+        scratch = os.path.join(tmpdir, f"scratch_{nbuckets}")
+        os.makedirs(scratch)
+
+        (fingerprints, nrepeats, (min_vals, max_vals),
+         (n, mean, m2), buckets) = _stream_results(pd, results, x="date",
+                                                   columns=columns,
+                                                   scratch_dir=scratch,
+                                                   nbuckets=nbuckets,
+                                                   chunksize=7)
+
+        assert fingerprints == ["0i0", "0i1", "0i2"]
+        assert nrepeats == {"0i0": 3, "0i1": 3, "0i2": 3}
+
+        for column in ["day"] + columns:
+            assert min_vals[column] == df[column].min()
+            assert max_vals[column] == df[column].max()
+
+        grouped = df.groupby(["fingerprint", "date"])[columns]
+        expect_mean = grouped.mean()
+        expect_std = grouped.std()
+
+        pd.testing.assert_frame_equal(mean.loc[expect_mean.index],
+                                      expect_mean)
+        pd.testing.assert_frame_equal((m2 / (n - 1)) ** 0.5,
+                                      expect_std.loc[m2.index])
+
+        # all of the data is in the buckets, with each fingerprint
+        # in only one bucket
+        seen = {}
+        nrows = 0
+
+        for i, bucket in enumerate(buckets):
+            with open(bucket, "rb") as FILE:
+                import pickle
+
+                while True:
+                    try:
+                        part = pickle.load(FILE)
+                    except EOFError:
+                        break
+
+                    nrows += len(part)
+
+                    for fingerprint in part["fingerprint"].unique():
+                        assert seen.setdefault(fingerprint, i) == i
+
+        assert nrows == len(df)
+
+
+@pytest.mark.parametrize("nprocs", [1, 2])
+def test_save_summary_plots(tmpdir, nprocs):
+    pytest.importorskip("pandas")
+    pytest.importorskip("matplotlib")
+
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from metawards.analysis import save_summary_plots
+
+    results = os.path.join(tmpdir, "results.csv.bz2")
+    _write_results(results, nfingerprints=2, nrepeats=2, ndays=10)
+
+    filenames = save_summary_plots(results, format="png", dpi=20,
+                                   nprocs=nprocs, chunksize=5)
+
+    expect = [os.path.join(tmpdir, f"{name}_{f}.png")
+              for name in ["overview", "average"] for f in ["0i0", "0i1"]]
+
+    assert filenames == expect
+
+    for filename in filenames:
+        assert os.path.exists(filename)
@@ -107,7 +107,55 @@ def test_variables_compliance():
         assert variable[".compliance"] == f
 
 
+def test_set_variables_plan():
+    from metawards import Disease, Parameters, VariableSet
+    from metawards._variableset import _get_plan
+
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.0, progress=1.0)
+    disease.add(name="I", beta=0.8, progress=0.25)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+    params.user_params = {"scale": [1.0, 2.0]}
+    params["red"].length_day = 0.5
+
+    names = ["overall:beta[1]", "beta[1]", "red:beta['I']",
+             "user.scale[1]", "length_day", "blue:progress[2]"]
+
+    v0 = VariableSet(names=names, values=[0.1, 0.2, 0.3, 0.4, 0.6, 0.7])
+    v1 = VariableSet(names=names, values=[0.9, 0.8, 0.7, 0.6, 0.5, 0.4])
+
+    # every VariableSet with the same variables shares the same plan
+    assert _get_plan(v0._varnames, v0._varidxs) is \
+        _get_plan(v1._varnames, v1._varidxs)
+
+    p0 = params.set_variables(v0)
+    p1 = params.set_variables(v1)
+
+    # 'overall' is applied last, and global values go to all demographics
+    assert p0.disease_params.beta[1] == 0.1
+    assert p0["red"].disease_params.beta[1] == 0.3
+    assert p0["red"].length_day == 0.6
+    assert p0["blue"].disease_params.progress[2] == 0.7
+    assert p0.user_params["scale"] == [1.0, 0.4]
+    assert p1.disease_params.beta[1] == 0.9
+    assert p1["red"].user_params["scale"] == [1.0, 0.6]
+
+    # the original parameters are not changed
+    assert params.disease_params == disease
+    assert params.user_params == {"scale": [1.0, 2.0]}
+    assert params["red"].length_day == 0.5
+    assert params["red"].disease_params == disease
+    assert params.specialised_demographics() == ["red"]
+    assert params.adjustments is None
+    assert p0.adjustments == [v0]
+    assert p1.adjustments == [v1]
+
+
 if __name__ == "__main__":
     test_variableset()
     test_variables_with_repeats()
     test_variables_compliance()
+    test_set_variables_plan()
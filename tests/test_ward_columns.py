@@ -0,0 +1,153 @@
+from metawards import Ward, Wards, Network, Parameters, Disease
+
+import os
+import pytest
+
+
+def _build_wards():
+    wards = []
+
+    for i in range(1, 31):
+        ward = Ward(id=i, name=f"ward_{i}", code=f"W{i:03d}",
+                    auto_assign_players=(i % 4 != 0))
+        ward.set_num_players(100 + 3 * i)
+
+        for j in range(1, 31):
+            if (i * j) % 7 == 1:
+                ward.add_workers(5 + i + j, destination=j)
+
+        if i % 3 == 0:
+            ward.add_player_weight(0.25, destination=(i % 30) + 1)
+            ward.add_player_weight(0.25, destination=i)
+        elif i % 3 == 1:
+            ward.add_player_weight(0.5, destination=max(1, i - 1))
+
+        if i % 2 == 0:
+            ward.set_position(x=100.0 * i, y=50.0 * i, units="km")
+
+        if i % 5 == 0:
+            ward.set_custom("fraction", 0.1 * i)
+
+        ward.set_scale_uv(1.0 + 0.01 * i)
+        ward.set_bg_foi(0.001 * i)
+
+        wards.append(ward)
+
+    return Wards(wards)
+
+
+def _expected_links(wards):
+    """Return the work and play links expected for the passed wards,
+       constructed from the Ward objects
+    """
+    work = []
+    play = []
+
+    for ward in wards._wards:
+        if ward is None:
+            continue
+
+        (dest, pop) = ward.get_worker_lists()
+        work += [(ward.id(), d, float(p)) for d, p in zip(dest, pop)]
+
+        (dest, weights) = ward.get_player_lists()
+        play += [(ward.id(), d, w) for d, w in zip(dest, weights)]
+
+    return (work, play)
+
+
+def _get_links(links, n):
+    return [(links.ifrom[i], links.ito[i], links.weight[i])
+            for i in range(1, n + 1)]
+
+
+def _network(wards):
+    disease = Disease(name="lurgy")
+    disease.add(name="E", beta=0.5, progress=0.5)
+    disease.add(name="R")
+
+    params = Parameters()
+    params.set_disease(disease)
+
+    return Network.from_wards(wards, params=params)
+
+
+def test_ward_columns_network():
+    wards = _build_wards()
+    (work, play) = _expected_links(wards)
+
+    network = _network(wards)
+
+    assert _get_links(network.links, network.nlinks) == work
+    assert _get_links(network.play, network.nplay) == play
+
+    for i in range(1, network.nnodes + 1):
+        ward = wards[i]
+        assert network.nodes.save_play_suscept[i] == ward.num_players()
+        assert network.nodes.scale_uv[i] == ward.scale_uv()
+        assert network.nodes.bg_foi[i] == ward.bg_foi()
+        assert network.nodes.get_custom("fraction")[i] == \
+            ward.custom("fraction")
+        assert network.info[i] == ward.info()
+
+        if i % 2 == 0:
+            assert network.nodes.x[i] == 100.0 * i
+
+        # self links are correctly recorded
+        s = network.nodes.self_p[i]
+
+        if s > 0:
+            assert network.play.ifrom[s] == i
+            assert network.play.ito[s] == i
+
+        for j in range(network.nodes.begin_p[i], network.nodes.end_p[i]):
+            assert network.play.ifrom[j] == i
+
+
+def test_ward_columns_binary(tmpdir):
+    wards = _build_wards()
+
+    for auto_bzip in [False, True]:
+        filename = wards.to_binary(os.path.join(tmpdir, "wards.bin"),
+                                   auto_bzip=auto_bzip)
+
+        loaded = Wards.from_binary(filename)
+
+        # nothing has been converted to Ward objects yet
+        assert loaded._ward_list is None
+        assert loaded.to_columns() == wards.to_columns()
+
+        assert len(loaded) == len(wards)
+        assert loaded.num_workers() == wards.num_workers()
+        assert loaded.num_players() == wards.num_players()
+        info = wards[7].info()
+        assert info in loaded
+        assert loaded.index(info) == 7
+        assert loaded[7] == wards[7]
+        assert loaded._ward_list is None
+
+        (n1, n2) = (_network(loaded), _network(wards))
+        assert _get_links(n1.play, n1.nplay) == _get_links(n2.play, n2.nplay)
+
+        # everything is converted when the wards are compared or edited
+        assert loaded == wards
+
+        ward = loaded[3]
+        ward.set_num_players(5)
+        loaded.insert(ward)
+        assert loaded._columns is None
+        assert loaded.num_players() == wards.num_players() - 109 + 5
+
+    with open(os.path.join(tmpdir, "bad.bin"), "wb") as FILE:
+        FILE.write(b"this is not a wards file")
+
+    with pytest.raises(IOError):
+        Wards.from_binary(os.path.join(tmpdir, "bad.bin"))
+
+
+def test_ward_columns_scale():
+    wards = _build_wards()
+    loaded = Wards.from_columns(wards.to_columns())
+
+    assert loaded.scale(work_ratio=0.3, play_ratio=0.7) == \
+        wards.scale(work_ratio=0.3, play_ratio=0.7)